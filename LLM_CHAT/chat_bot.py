@@ -1,12 +1,17 @@
 import streamlit as st
-from langchain_community.vectorstores import FAISS
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_groq import ChatGroq
 from langchain.chains import ConversationalRetrievalChain
 from langchain.memory import ConversationBufferMemory
 from langchain.prompts import PromptTemplate
 from dotenv import load_dotenv
+from pathlib import Path
 import os
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fatwa_db import FatwaDB  # in-process keyword search, no server
+import vector_backend  # FAISS folder or pgvector, by VECTOR_BACKEND
 
 load_dotenv()
 
@@ -30,13 +35,9 @@ if "chat_history" not in st.session_state:
 # Load vectorstore (cached for performance)
 @st.cache_resource
 def load_vectorstore():
-    """Load the FAISS vectorstore - runs only once"""
+    """Load the vectorstore (FAISS or pgvector, see vector_backend.py) - runs only once"""
     embedding_model = HuggingFaceEmbeddings(model_name="intfloat/multilingual-e5-large")
-    vectorstore = FAISS.load_local(
-        "../fatwa_index", 
-        embedding_model,
-        allow_dangerous_deserialization=True
-    )
+    vectorstore = vector_backend.load_vectorstore("../fatwa_index", embedding_model)
     return vectorstore
 
 @st.cache_resource
@@ -49,6 +50,16 @@ def load_llm():
     )
     return llm
 
+@st.cache_resource
+def open_fatwa_db(db_path):
+    """Open the SQLite keyword index (fatwa_db.py) - runs only once"""
+    return FatwaDB(db_path)
+
+def load_fatwa_db():
+    """The keyword index, or None until `python fatwa_db.py load` has run (checked on every rerun)"""
+    db_path = Path(__file__).resolve().parent.parent / "fatwa_data" / "fatwas.db"
+    return open_fatwa_db(str(db_path)) if db_path.exists() else None
+
 def create_qa_chain(vectorstore, llm, k=3):
     """Create conversational retrieval chain with memory"""
     
@@ -104,8 +115,9 @@ Standalone سوال (صرف سوال لکھیں، کوئی اضافی بات ن
         input_variables=["context", "question", "chat_history"]
     )
     
-    # Create retriever
-    retriever = vectorstore.as_retriever(
+    # Create retriever (searches with the query normalized like the corpus)
+    retriever = vector_backend.query_retriever(
+        vectorstore,
         search_type="similarity",
         search_kwargs={"k": k}
     )
@@ -170,6 +182,19 @@ with st.sidebar:
     
     st.divider()
     
+    st.header("🔎 Keyword Search")
+    fatwa_db = load_fatwa_db()
+    if fatwa_db is None:
+        st.caption("Run `python fatwa_db.py load` to enable keyword search.")
+    else:
+        keywords = st.text_input("Exact words (no AI):", key="keyword_query")
+        if keywords:
+            for hit in fatwa_db.search(keywords, k=5):
+                st.markdown(f"**[{hit['category']}]** [{hit['question'][:80]}]({hit['url']})")
+                st.caption(hit['snippet'])
+
+    st.divider()
+
     st.header("ℹ️ About AI")
     st.markdown("""
     This AI chatbot uses:
@@ -1,11 +1,16 @@
 import streamlit as st
-from langchain_community.vectorstores import FAISS
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_groq import ChatGroq
 from langchain.chains import RetrievalQA
 from langchain.prompts import PromptTemplate
 from dotenv import load_dotenv
+from pathlib import Path
 import os
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fatwa_db import FatwaDB  # in-process keyword search, no server
+import vector_backend  # FAISS folder or pgvector, by VECTOR_BACKEND
 
 load_dotenv()
 
@@ -21,13 +26,9 @@ st.set_page_config(
 # Load vectorstore (cached for performance)
 @st.cache_resource
 def load_vectorstore():
-    """Load the FAISS vectorstore - runs only once"""
+    """Load the vectorstore (FAISS or pgvector, see vector_backend.py) - runs only once"""
     embedding_model = HuggingFaceEmbeddings(model_name="intfloat/multilingual-e5-large")
-    vectorstore = FAISS.load_local(
-        "../fatwa_index", 
-        embedding_model,
-        allow_dangerous_deserialization=True
-    )
+    vectorstore = vector_backend.load_vectorstore("../fatwa_index", embedding_model)
     return vectorstore
 
 @st.cache_resource
@@ -41,6 +42,16 @@ def load_llm():
     )
     return llm
 
+@st.cache_resource
+def open_fatwa_db(db_path):
+    """Open the SQLite keyword index (fatwa_db.py) - runs only once"""
+    return FatwaDB(db_path)
+
+def load_fatwa_db():
+    """The keyword index, or None until `python fatwa_db.py load` has run (checked on every rerun)"""
+    db_path = Path(__file__).resolve().parent.parent / "fatwa_data" / "fatwas.db"
+    return open_fatwa_db(str(db_path)) if db_path.exists() else None
+
 # =====================================================
 # Main UI
 st.title("🕌 AI  - Islamic Fatwa Assistant")
@@ -129,8 +140,9 @@ if search_button:
     if not query.strip():
         st.warning("⚠️ براہ کرم اپنا سوال درج کریں (Please enter your question)")
     else:
-        # Create retriever
-        retriever = vectorstore.as_retriever(
+        # Create retriever (searches with the query normalized like the corpus)
+        retriever = vector_backend.query_retriever(
+            vectorstore,
             search_type="similarity",
             search_kwargs={"k": k}
         )
@@ -195,6 +207,19 @@ if search_button:
 # =====================================================
 # Sidebar - Info and Examples
 with st.sidebar:
+    st.header("🔎 Keyword Search")
+    fatwa_db = load_fatwa_db()
+    if fatwa_db is None:
+        st.caption("Run `python fatwa_db.py load` to enable keyword search.")
+    else:
+        keywords = st.text_input("Exact words (no AI):", key="keyword_query")
+        if keywords:
+            for hit in fatwa_db.search(keywords, k=5):
+                st.markdown(f"**[{hit['category']}]** [{hit['question'][:80]}]({hit['url']})")
+                st.caption(hit['snippet'])
+
+    st.divider()
+
     st.header("ℹ️ About AI ")
     st.markdown("""
     This AI assistant uses:
@@ -0,0 +1,142 @@
+"""
+Size and per-document read cost of zstd dictionary compression
+(doc_compression.py) for the docstore and the compacted corpus store.
+
+    python benchmarks/bench_compression.py --records 5000
+    python benchmarks/bench_compression.py --store fatwa_data/raw_fatwas.jsonl
+
+Records are parsed from synthetic fatwa pages (same boilerplate as the real
+site, much smaller vocabulary, so real ratios come out lower), or taken from
+a copy of a real corpus store. Compares per-document gzip, per-document zstd
+without and with a trained dictionary, and whole-file zstd as the ratio
+ceiling. Then compacts the store into its pack (corpus_pack.py) and times
+random single-document reads from mmap_docstore and the pack against the
+uncompressed docstore, and a full `iter_latest` scan before and after.
+"""
+
+from pathlib import Path
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import zstandard
+
+from corpus_pack import CorpusPack
+from corpus_store import CorpusStore
+from doc_compression import LEVEL, DocCodec
+from fatwa_fixtures import synthetic_fatwa_page
+from fatwa_scraper import parse_fatwa_page
+import mmap_docstore
+
+CATEGORIES = ['namaz', 'roza', 'zakat-aur-ushr', 'hajj-aur-umrah', 'nikah', 'talaq', 'wirasat-aur-tarka']
+
+def synthetic_records(count):
+    with contextlib.redirect_stdout(io.StringIO()):   # parse_fatwa_page prints a line per page
+        for i in range(count):
+            url = f"https://www.fatwaqa.com/ur/fatawa/{CATEGORIES[i % len(CATEGORIES)]}/fatwa-{i}"
+            yield parse_fatwa_page(url, synthetic_fatwa_page(i))
+
+def latencies(read, positions):
+    out = []
+    for position in positions:
+        start = time.perf_counter()
+        read(position)
+        out.append(time.perf_counter() - start)
+    out.sort()
+    return out[len(out) // 2] * 1e6, out[int(len(out) * 0.99)] * 1e6
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=5000)
+    parser.add_argument('--store', help="use this corpus store instead of synthetic records")
+    parser.add_argument('--reads', type=int, default=20000)
+    args = parser.parse_args()
+
+    from langchain_core.documents import Document
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        store = CorpusStore(tmp / 'raw_fatwas.jsonl')
+        if args.store:
+            shutil.copyfile(args.store, store.path)   # compacted below; never the real store
+        else:
+            store.rewrite(synthetic_records(args.records))
+        records = list(store.iter_latest())
+        entries = [json.dumps(r, ensure_ascii=False, separators=(',', ':')).encode('utf-8') for r in records]
+        raw = sum(len(e) for e in entries)
+        print(f"📄 {len(entries)} records, {raw / 1e6:.1f} MB of JSON ({raw // len(entries)} bytes avg)")
+
+        start = time.perf_counter()
+        codec = DocCodec.trained(entries)
+        trained = time.perf_counter() - start
+        plain = DocCodec()
+        sizes = {
+            'gzip per doc': sum(len(gzip.compress(e, 6)) for e in entries),
+            'zstd per doc': sum(len(plain.compress(e)) for e in entries),
+            'zstd + dict': sum(len(codec.compress(e)) for e in entries) + len(codec.dictionary),
+            'zstd whole file': len(zstandard.ZstdCompressor(level=LEVEL).compress(b'\n'.join(entries))),
+        }
+        print(f"   dictionary: {len(codec.dictionary) / 1024:.0f} KB, trained in {trained:.2f}s")
+        for name, size in sizes.items():
+            print(f"   {name:<16} {size / 1e6:8.2f} MB  {raw / size:5.1f}x")
+
+        docs = [Document(page_content=f"{r['question']}\n\n{r['answer']}",
+                         metadata={'url': r['url'], 'category': r['category']}) for r in records]
+        ids = [str(i) for i in range(len(docs))]
+        mmap_docstore.write_docstore(tmp / 'plain', docs, ids, compress=False)
+        mmap_docstore.write_docstore(tmp / 'packed', docs, ids, compress=True)
+        jsonl_size = store.path.stat().st_size
+        start = time.perf_counter()
+        jsonl_scan = list(store.iter_latest())
+        jsonl_seconds = time.perf_counter() - start
+        store.compact(compress=True)
+
+        plain_store = mmap_docstore.MmapDocstore(tmp / 'plain')
+        packed_store = mmap_docstore.MmapDocstore(tmp / 'packed')
+        pack = CorpusPack(store.pack_path)
+        sizes = {
+            'docstore': (tmp / 'plain' / 'docs.bin').stat().st_size,
+            'docstore zstd': (tmp / 'packed' / 'docs.bin').stat().st_size
+                             + (tmp / 'packed' / 'docs.zdict').stat().st_size,
+            'corpus jsonl': jsonl_size,
+            'corpus compacted': pack.size() + store.path.stat().st_size,
+        }
+        print("\n   on disk")
+        for name, size in sizes.items():
+            print(f"   {name:<16} {size / 1e6:8.2f} MB")
+
+        rng = random.Random(0)
+        positions = [rng.randrange(len(docs)) for _ in range(args.reads)]
+        urls = [records[p]['url'] for p in positions]
+        print(f"\n   random single-document reads ({args.reads})   p50 / p99")
+        reads = {
+            'docstore': (plain_store.raw, positions),
+            'docstore zstd': (packed_store.raw, positions),
+            'corpus pack': (pack.get, urls),
+        }
+        for name, (read, keys) in reads.items():
+            p50, p99 = latencies(read, keys)
+            print(f"   {name:<16} {p50:7.1f} / {p99:7.1f} µs")
+
+        start = time.perf_counter()
+        packed_scan = list(store.iter_latest())
+        packed_seconds = time.perf_counter() - start
+        print(f"\n   store.iter_latest()   jsonl {jsonl_seconds * 1000:7.0f} ms   compacted {packed_seconds * 1000:7.0f} ms")
+
+        same = all(plain_store.raw(p) == packed_store.raw(p) for p in range(len(docs)))
+        same = same and jsonl_scan == records and packed_scan == records
+        print(f"   round trip: {'✅' if same else '❌ mismatch'}  "
+              f"(median doc {statistics.median(len(e) for e in entries)} bytes)")
+
+if __name__ == '__main__':
+    main()
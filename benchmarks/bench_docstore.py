@@ -0,0 +1,98 @@
+"""
+Open time and resident memory of the pickled docstore vs mmap_docstore.
+
+    python benchmarks/bench_docstore.py --docs 10000
+
+Builds one synthetic FAISS index, saves it with `FAISS.save_local` (index.pkl)
+and with `mmap_docstore.save_vectorstore` (docs.bin / docs.offsets), then opens
+each in a fresh process and reports open time, RSS growth, and the time of a
+top-k search, so the numbers are what a newly started Streamlit app would see.
+"""
+
+from pathlib import Path
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from fatwa_fixtures import WORDS
+
+DIMENSION = 256
+
+PROBE = '''
+import json, sys, time
+sys.path.insert(0, {root!r})
+import numpy as np
+import faiss, mmap_docstore
+from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+def rss_kb():
+    with open('/proc/self/status') as f:
+        return next(int(line.split()[1]) for line in f if line.startswith('VmRSS'))
+
+embeddings = DeterministicFakeEmbedding(size={dimension})
+before = rss_kb()
+start = time.perf_counter()
+if {kind!r} == 'pickle':
+    vs = FAISS.load_local({path!r}, embeddings, allow_dangerous_deserialization=True)
+else:
+    vs = mmap_docstore.load_vectorstore({path!r}, embeddings)
+opened = time.perf_counter() - start
+grown = rss_kb() - before
+query = np.random.default_rng(0).random({dimension}, dtype=np.float32).tolist()
+start = time.perf_counter()
+for _ in range(100):
+    hits = vs.similarity_search_by_vector(query, k=10)
+search = (time.perf_counter() - start) / 100
+print(json.dumps({{'open': opened, 'rss_mb': grown / 1024, 'search': search,
+                  'first': hits[0].metadata['url']}}))
+'''
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--docs', type=int, default=10000)
+    args = parser.parse_args()
+
+    import numpy as np
+    import faiss
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.documents import Document
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    import mmap_docstore
+
+    rng = random.Random(0)
+    docs = [Document(page_content=' '.join(rng.choices(WORDS, k=rng.randint(200, 1500))),
+                     metadata={'category': 'namaz', 'url': f"https://www.fatwaqa.com/ur/fatawa/namaz/fatwa-{i}"})
+            for i in range(args.docs)]
+    index = faiss.IndexFlatL2(DIMENSION)
+    index.add(np.random.default_rng(1).random((args.docs, DIMENSION), dtype=np.float32))
+    vs = FAISS(DeterministicFakeEmbedding(size=DIMENSION), index, InMemoryDocstore({str(i): d for i, d in enumerate(docs)}),
+               {i: str(i) for i in range(args.docs)})
+    text_mb = sum(len(d.page_content.encode('utf-8')) for d in docs) / 1e6
+    print(f"📄 {args.docs} documents, {text_mb:.0f} MB of text, {DIMENSION}-d vectors")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {'pickle': Path(tmp) / 'pickled', 'mmap': Path(tmp) / 'mapped'}
+        vs.save_local(str(paths['pickle']))
+        mmap_docstore.save_vectorstore(vs, paths['mmap'])
+
+        results = {}
+        for kind, path in paths.items():
+            code = PROBE.format(root=str(ROOT), dimension=DIMENSION, kind=kind, path=str(path))
+            out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+            results[kind] = json.loads(out.stdout.strip().splitlines()[-1])
+            r = results[kind]
+            print(f"   {kind:<7} open {r['open'] * 1000:8.1f} ms | RSS +{r['rss_mb']:7.1f} MB "
+                  f"| top-10 search {r['search'] * 1000:6.2f} ms")
+        same = results['pickle']['first'] == results['mmap']['first']
+        print(f"   same top hit: {'✅' if same else '❌'}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Pages/sec of the old two-parse extraction vs the single-parse fast path.
+
+    python benchmarks/bench_extract.py                    # synthetic pages
+    python benchmarks/bench_extract.py --fixtures DIR     # saved *.html pages
+
+Every backend's text is checked against the old path before timing.
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fatwa_scraper
+from fatwa_fixtures import load_fixture_pages
+
+def old_path(page):
+    html = fatwa_scraper.extract_capture_div(page)
+    return fatwa_scraper.extract_fatwa_data(html) if html else None
+
+def pages_per_sec(fn, pages, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for page in pages:
+            fn(page)
+    return len(pages) * rounds / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--fixtures', help="directory of saved fatwa pages (*.html)")
+    parser.add_argument('--count', type=int, default=200, help="synthetic pages when no --fixtures")
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    pages = load_fixture_pages(args.fixtures, args.count)
+    print(f"📄 {len(pages)} pages, {sum(map(len, pages))/len(pages)/1024:.1f} KB avg")
+
+    expected = [old_path(p) for p in pages]
+    backends = fatwa_scraper.AVAILABLE_BACKENDS
+    for backend in backends:
+        got = [fatwa_scraper.extract_fatwa_text(p, backend) for p in pages]
+        mismatches = sum(1 for a, b in zip(expected, got) if a != b)
+        print(f"   parity {backend:<12} {'✅ identical' if not mismatches else f'❌ {mismatches} mismatches'}")
+
+    baseline = pages_per_sec(old_path, pages, args.rounds)
+    print(f"\n   {'two-parse (old)':<24} {baseline:8.1f} pages/s")
+    for backend in backends:
+        rate = pages_per_sec(lambda p: fatwa_scraper.extract_fatwa_text(p, backend), pages, args.rounds)
+        print(f"   {'single-parse ' + backend:<24} {rate:8.1f} pages/s  ({rate/baseline:.1f}x)")
+
+if __name__ == '__main__':
+    main()
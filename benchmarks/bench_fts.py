@@ -0,0 +1,87 @@
+"""
+Keyword lookup latency of the SQLite / FTS5 corpus (fatwa_db.py).
+
+    python benchmarks/bench_fts.py --records 10000 --queries 500
+    python benchmarks/bench_fts.py --db fatwa_data/fatwas.db        # an existing database
+
+Without --db, builds a synthetic corpus whose word frequencies follow a Zipf
+curve (a few words like ہے / کیا in every fatwa, a long tail of rare ones),
+then times question-like queries sampled from the fatwas themselves.
+"""
+
+from pathlib import Path
+import argparse
+import bisect
+import itertools
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fatwa_db import FatwaDB
+from fatwa_fixtures import WORDS
+from url_registry import BASE_URL
+
+LETTERS = 'ابپتٹثجچحخدڈذرڑزژسشصضطظعغفقکگلمنوہھءیے'
+CATEGORIES = ['namaz', 'roza', 'zakat-aur-ushr', 'hajj-aur-umrah', 'nikah', 'talaq', 'wirasat-aur-tarka']
+
+def zipf_sampler(rng, vocab, s=1.1):
+    cumulative = list(itertools.accumulate(1 / (rank + 1) ** s for rank in range(len(vocab))))
+    return lambda k: [vocab[bisect.bisect(cumulative, rng.random() * cumulative[-1])] for _ in range(k)]
+
+def synthetic_records(count, vocab_size=30000):
+    rng = random.Random(0)
+    vocab = list(WORDS) + list(dict.fromkeys(
+        ''.join(rng.choices(LETTERS, k=rng.randint(3, 8))) for _ in range(vocab_size)))
+    words = zipf_sampler(rng, vocab)
+    for i in range(count):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        yield {'url': f"{BASE_URL}{category}/fatwa-{i}", 'category': category,
+               'question': ' '.join(words(rng.randint(20, 80))),
+               'answer': ' '.join(words(rng.randint(150, 1200)))}
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--db', help="existing fatwas.db (default: build a synthetic one)")
+    parser.add_argument('--records', type=int, default=10000)
+    parser.add_argument('--queries', type=int, default=500)
+    parser.add_argument('-k', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = FatwaDB(args.db or Path(tmp) / 'fatwas.db')
+        if not args.db:
+            start = time.perf_counter()
+            added, _, _ = db.load(synthetic_records(args.records))
+            print(f"📥 Loaded {added} synthetic fatwas in {time.perf_counter() - start:.1f}s")
+
+        db.doc_freq()  # one-time vocabulary read, not part of a lookup
+        rng = random.Random(1)
+        questions = [r[0] for r in db.conn.execute('SELECT question FROM fatwas')]
+        queries = [' '.join(rng.sample(q.split(), min(len(q.split()), rng.randint(2, 5))))
+                   for q in rng.choices(questions, k=args.queries)]
+
+        for label, kwargs in [('any word', {}), ('all words', {'mode': 'all'}),
+                              ('category', {'category': CATEGORIES[0]}), ('+snippets', {'snippets': True})]:
+            latencies, hits = [], 0
+            for query in queries:
+                start = time.perf_counter()
+                results = db.search(query, args.k, **{'snippets': False, **kwargs})
+                latencies.append(time.perf_counter() - start)
+                hits += bool(results)
+            latencies.sort()
+            p = lambda q: latencies[int(q * (len(latencies) - 1))] * 1000
+            print(f"   {label:<10} p50 {p(0.5):7.3f} ms | p95 {p(0.95):7.3f} ms | max {p(1):7.3f} ms "
+                  f"| {hits}/{len(queries)} with results")
+
+        start = time.perf_counter()
+        urls = rng.choices([r[0] for r in db.conn.execute('SELECT url FROM fatwas')], k=args.queries)
+        for url in urls:
+            db.get(url)
+        print(f"   get(url)   mean {(time.perf_counter() - start) / len(urls) * 1000:7.3f} ms")
+        db.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Pages/sec of listing-page link extraction: BeautifulSoup vs the regex fast path.
+
+    python benchmarks/bench_listing.py                    # synthetic listings
+    python benchmarks/bench_listing.py --fixtures DIR     # saved <category>__<page>.html listings
+
+Links from the fast path are checked against the soup path before timing.
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import cdn_extracter
+from fatwa_fixtures import synthetic_listing_page
+
+def edge_cases():
+    category = 'namaz'
+    link = f'https:\\/\\/www.fatwaqa.com\\/ur\\/fatawa\\/{category}'
+    return [(category, page) for page in [
+        '',
+        '{"html": "<div class=\\"list\\"><\\/div>"}',
+        f'<a HREF="{link}/upper">x</a><a\nclass="c" href={link}/unquoted>y</a>',
+        f'<a title="a > b" href="{link}/gt-in-attr">x</a><a data-href="{link}/data">z</a>',
+        f'<a href="{link}/first" href="{link}/second">dup</a>',
+        f'<a href="{link}/amp?x=1&amp;amp;y=2">amp</a><abbr href="{link}/abbr">no</abbr>',
+        f'<!-- <a href="{link}/commented"> --><style>a[href="{link}/css"]{{}}</style><a href=\'{link}/ok\'>ok</a>',
+        f'<script>"<a href=\'{link}/in-script\'>"</script>',
+        f'<a href="/ur/fatawa/{category}/relative">rel</a><a href="/ur/fatawa/roza/other">other</a>',
+    ]]
+
+def load_listings(directory, categories, pages_per_category):
+    if directory:
+        return [(p.stem.split('__')[0], p.read_text(encoding='utf-8'))
+                for p in sorted(Path(directory).glob('*.html'))]
+    total = pages_per_category * 12 - 5
+    return [(c, synthetic_listing_page(c, page, total=total))
+            for c in categories for page in range(1, pages_per_category + 2)]
+
+def pages_per_sec(fn, listings, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for category, page in listings:
+            fn(page, category)
+    return len(listings) * rounds / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--fixtures', help="directory of saved listing pages named <category>__<page>.html")
+    parser.add_argument('--pages', type=int, default=25, help="synthetic pages per category when no --fixtures")
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    listings = load_listings(args.fixtures, cdn_extracter.categories, args.pages)
+    print(f"📄 {len(listings)} listing pages, {sum(len(p) for _, p in listings)/len(listings)/1024:.1f} KB avg")
+
+    cases = listings + edge_cases()
+    mismatches = sum(1 for c, p in cases
+                     if cdn_extracter.extract_links(p, c) != cdn_extracter.extract_links_soup(p, c))
+    print(f"   parity on {len(cases)} pages {'✅ identical' if not mismatches else f'❌ {mismatches} mismatches'}")
+
+    baseline = pages_per_sec(cdn_extracter.extract_links_soup, listings, args.rounds)
+    fast = pages_per_sec(cdn_extracter.extract_links, listings, args.rounds)
+    print(f"\n   {'BeautifulSoup':<16} {baseline:8.1f} pages/s")
+    print(f"   {'regex fast path':<16} {fast:8.1f} pages/s  ({fast/baseline:.1f}x)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Throughput of the single-pass text_normalizer profiles vs the old multi-pass chains.
+
+    python benchmarks/bench_normalize.py                  # synthetic pages
+    python benchmarks/bench_normalize.py --fixtures DIR   # saved *.html pages
+
+Outputs are checked against the old chains first. The only expected
+difference is whitespace around a standalone diacritic (see text_normalizer).
+"""
+
+from pathlib import Path
+import argparse
+import re
+import sys
+import time
+import unicodedata
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fatwa_scraper
+from fatwa_fixtures import load_fixture_pages
+from text_normalizer import ANSWER_END, ANSWER_START, PROFILES, normalize
+
+def normalize_fatwa_text_passes(text):
+    """fatwa_scraper.normalize_fatwa_text before text_normalizer, kept as the reference."""
+    text = text.replace('\xa0', ' ').replace('‌', '').replace('‏', '')
+    text = re.sub(r'[\r\n\t]+', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = unicodedata.normalize("NFD", text)
+    text = re.sub(r'[ً-ْ]', '', text, flags=re.UNICODE)
+    return unicodedata.normalize("NFC", text)
+
+def clean_text_passes(text):
+    """embeddings_store.clean_text before text_normalizer."""
+    text = unicodedata.normalize("NFC", text)
+    text = text.replace(ANSWER_START, '')
+    text = text.replace(ANSWER_END, '')
+    text = re.sub(r'[ً-ٰٟۖ-ۭ]', '', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+def raw_texts(pages):
+    out = []
+    for page in pages:
+        fragment = fatwa_scraper.extract_capture_div_fragment(page)
+        if fragment:
+            out.append(' ' + fatwa_scraper.capture_div_text(fragment) + ' ')
+    return out
+
+def edge_cases():
+    return [
+        '', ' ', '\xa0‌‏', 'نماز\r\n\tروزہ', ' بِسْمِ اللہِ ', 'aَ b', 'é ê', 'إ أ آ ۂ',
+        ANSWER_START + ' متن ' + ANSWER_END,
+        'word َ word',  # standalone diacritic between spaces: the known difference
+    ]
+
+def texts_per_sec(fn, texts, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            fn(text)
+    return len(texts) * rounds / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--fixtures', help="directory of saved fatwa pages (*.html)")
+    parser.add_argument('--count', type=int, default=200, help="synthetic pages when no --fixtures")
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    texts = raw_texts(load_fixture_pages(args.fixtures, args.count))
+    print(f"📄 {len(texts)} texts, {sum(map(len, texts))/len(texts)/1024:.1f} KB avg")
+
+    cases = texts + edge_cases()
+    pairs = [('scrape', normalize_fatwa_text_passes, lambda t: normalize(t, 'scrape'), cases),
+             ('embed', clean_text_passes, lambda t: normalize(t, 'embed'), cases)]
+    for name, old, new, inputs in pairs:
+        diffs = [t for t in inputs if old(t) != new(t)]
+        whitespace_only = all(old(t).split() == new(t).split() for t in diffs)
+        status = ('✅ identical' if not diffs else
+                  f"⚠️  {len(diffs)} differ in whitespace only" if whitespace_only else f"❌ {len(diffs)} mismatches")
+        print(f"   parity {name:<7} {status}")
+
+    print()
+    for name, old, new, _ in pairs:
+        before = texts_per_sec(old, texts, args.rounds)
+        after = texts_per_sec(new, texts, args.rounds)
+        print(f"   {name:<7} passes {before:8.1f} texts/s | single-pass {after:8.1f} texts/s  ({after/before:.1f}x)")
+    query = texts_per_sec(lambda t: normalize(t, 'query'), texts, args.rounds)
+    print(f"   {'query':<7} {'':>24} single-pass {query:8.1f} texts/s")
+
+    # the deletion step alone: compiled class vs an equivalent str.translate mapping
+    profile = PROFILES['scrape']
+    table = {ord(c): None for c in profile.delete_re.pattern[1:-2]}
+    as_class = texts_per_sec(lambda t: profile.delete_re.sub('', t), texts, args.rounds)
+    as_translate = texts_per_sec(lambda t: t.translate(table), texts, args.rounds)
+    print(f"   delete  translate {as_translate:8.1f} texts/s | class {as_class:8.1f} texts/s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Throughput of database_saver's COPY + staging merge vs row-batched
+`execute_values` upserts, against a throwaway Postgres.
+
+    docker run --rm -d -e POSTGRES_PASSWORD=pg -p 5433:5432 postgres:16
+    python benchmarks/bench_pg_load.py --dsn postgresql://postgres:pg@127.0.0.1:5433/postgres --records 50000
+
+Everything happens in a scratch schema that is dropped afterwards. Each
+loader runs three times: into an empty table, again with nothing changed,
+and with every tenth record edited, and the resulting tables are compared.
+"""
+
+from pathlib import Path
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+import database_saver
+from fatwa_fixtures import WORDS
+from state_store import record_hash
+from url_registry import BASE_URL
+
+SCHEMA = 'fatwa_load_bench'
+CATEGORIES = ['namaz', 'roza', 'zakat-aur-ushr', 'hajj-aur-umrah', 'nikah', 'talaq', 'wirasat-aur-tarka']
+
+# the upsert database_saver used before the COPY loader
+EXECUTE_VALUES_SQL = '''
+INSERT INTO fatwas (url, question, answer, category, content_hash)
+VALUES %s
+ON CONFLICT (url) DO UPDATE SET
+    question = EXCLUDED.question,
+    answer = EXCLUDED.answer,
+    category = EXCLUDED.category,
+    content_hash = EXCLUDED.content_hash
+WHERE fatwas.content_hash IS DISTINCT FROM EXCLUDED.content_hash;
+'''
+
+def synthetic_records(count, edited_every=0):
+    rng = random.Random(0)
+    for i in range(count):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        record = {'url': f"{BASE_URL}{category}/fatwa-{i}", 'category': category,
+                  'question': ' '.join(rng.choices(WORDS, k=rng.randint(20, 80))),
+                  'answer': ' '.join(rng.choices(WORDS, k=rng.randint(150, 1500)))}
+        if edited_every and i % edited_every == 0:
+            record['answer'] += ' ترمیم'
+        record['content_hash'] = record_hash(record)
+        yield record
+
+def load_execute_values(conn, records, page_size=500):
+    start = time.time()
+    with conn.cursor() as cur:
+        cur.execute(database_saver.create_table_script)
+        rows = ((f['url'], f['question'], f['answer'], f['category'], f['content_hash']) for f in records)
+        execute_values(cur, EXECUTE_VALUES_SQL, rows, page_size=page_size)
+    conn.commit()
+    return time.time() - start
+
+def table_digest(conn):
+    with conn.cursor() as cur:
+        cur.execute("SELECT count(*), md5(string_agg(url || content_hash, ',' ORDER BY url)) FROM fatwas")
+        return cur.fetchone()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dsn', default=os.getenv('DATABASE_URL'), required=not os.getenv('DATABASE_URL'))
+    parser.add_argument('--records', type=int, default=50000)
+    parser.add_argument('--chunk-size', type=int, default=database_saver.CHUNK_SIZE)
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(args.dsn, options=f"-c search_path={SCHEMA}")
+    mb = sum(len(r['question'].encode()) + len(r['answer'].encode()) for r in synthetic_records(args.records)) / 1e6
+    print(f"📄 {args.records} records, {mb:.0f} MB of text")
+
+    runs = [('empty table', 0), ('unchanged', 0), ('10% edited', 10)]
+    digests = {}
+    try:
+        for loader in ('execute_values', 'copy + merge'):
+            with conn.cursor() as cur:
+                cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA};")
+            conn.commit()
+            print(f"\n   {loader}")
+            for name, edited_every in runs:
+                records = list(synthetic_records(args.records, edited_every))
+                if loader == 'execute_values':
+                    seconds, detail = load_execute_values(conn, records), ''
+                else:
+                    stats = database_saver.load(conn, records, args.chunk_size, progress=False)
+                    seconds = stats['seconds']
+                    detail = f"  {stats['added']} added, {stats['changed']} changed, {stats['unchanged']} unchanged"
+                print(f"   {name:<12} {seconds:7.2f}s  {args.records / seconds:8.0f} rows/s{detail}")
+            digests[loader] = table_digest(conn)
+        same = len(set(digests.values())) == 1
+        print(f"\n   same table contents: {'✅' if same else '❌ ' + str(digests)}")
+    finally:
+        with conn.cursor() as cur:
+            cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;")
+        conn.commit()
+        conn.close()
+
+if __name__ == '__main__':
+    main()
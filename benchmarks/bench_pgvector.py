@@ -0,0 +1,171 @@
+"""
+Latency and recall of pgvector HNSW (pgvector_store.PgVectorStore) against
+the exact FAISS flat index, unfiltered and filtered by category.
+
+    docker run --rm -d -e POSTGRES_PASSWORD=pg -p 5433:5432 pgvector/pgvector:pg16
+    python benchmarks/bench_pgvector.py --dsn postgresql://postgres:pg@127.0.0.1:5433/postgres --docs 20000
+
+Vectors are synthetic but clustered like topic embeddings (1024-d, unit
+length), with categories of Zipf-like sizes that follow the clusters.
+Fatwa rows go in with database_saver.load and vectors with
+pgvector_store.load_embeddings, into a scratch schema that is dropped
+afterwards. Recall@k is measured against exact L2 neighbours (restricted to
+the category when filtered). pgvector latencies include the round trip to
+the server; FAISS ones are in-process.
+
+Filtered rows compare the store's planning (ef_search widened by the
+category's share, exact scan for small categories) with plain HNSW at the
+same ef_search, and with the FAISS app path, which filters its top fetch_k
+hits.
+"""
+
+from pathlib import Path
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import faiss
+import numpy as np
+import psycopg2
+
+import database_saver
+import pgvector_store
+from pgvector_store import PgVectorStore
+
+SCHEMA = 'fatwa_vector_bench'
+CATEGORIES = 40
+CLUSTERS = 200
+
+def synthetic_corpus(docs, dim, spread, seed=0):
+    rng = np.random.default_rng(seed)
+    share = 1 / np.arange(1, CATEGORIES + 1)
+    share /= share.sum()
+    centers = rng.standard_normal((CLUSTERS, dim)).astype(np.float32)
+    cluster_category = rng.choice(CATEGORIES, CLUSTERS, p=share)
+    cluster = rng.integers(0, CLUSTERS, docs)
+    vectors = centers[cluster] + spread * rng.standard_normal((docs, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    category = np.where(rng.random(docs) < 0.8, cluster_category[cluster], rng.choice(CATEGORIES, docs, p=share))
+    return vectors, category, centers
+
+def queries(centers, count, spread, seed=1):
+    rng = np.random.default_rng(seed)
+    q = centers[rng.integers(0, len(centers), count)] + spread * rng.standard_normal((count, centers.shape[1])).astype(np.float32)
+    return q / np.linalg.norm(q, axis=1, keepdims=True)
+
+def exact_neighbours(vectors, query, k, mask=None):
+    distances = ((vectors - query) ** 2).sum(axis=1)
+    if mask is not None:
+        distances = np.where(mask, distances, np.inf)
+    top = np.argpartition(distances, k)[:k]
+    return [int(i) for i in top[np.argsort(distances[top])] if np.isfinite(distances[i])]
+
+def recall(found, truth):
+    return len(set(found) & set(truth)) / max(len(truth), 1)
+
+def measure(search, qs, truths):
+    times, recalls = [], []
+    for q, truth in zip(qs, truths):
+        start = time.perf_counter()
+        found = search(q)
+        times.append(time.perf_counter() - start)
+        recalls.append(recall(found, truth))
+    times.sort()
+    return times[len(times) // 2] * 1000, times[int(len(times) * 0.95)] * 1000, float(np.mean(recalls))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dsn', default=os.getenv('DATABASE_URL'), required=not os.getenv('DATABASE_URL'))
+    parser.add_argument('--docs', type=int, default=20000)
+    parser.add_argument('--dim', type=int, default=pgvector_store.DIMENSION)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('-k', type=int, default=10)
+    parser.add_argument('--ef-search', default='40,100,200', help="comma-separated, unfiltered runs")
+    parser.add_argument('--spread', type=float, default=3.5,
+                        help="noise around cluster centres; below ~2.5 HNSW is always exact, above ~5 there are no clusters")
+    args = parser.parse_args()
+    k = args.k
+
+    vectors, category, centers = synthetic_corpus(args.docs, args.dim, args.spread)
+    qs = queries(centers, args.queries, args.spread)
+    urls = [f"https://www.fatwaqa.com/ur/fatawa/c{category[i]}/fatwa-{i}" for i in range(args.docs)]
+    position = {url: i for i, url in enumerate(urls)}
+    sizes = np.bincount(category, minlength=CATEGORIES)
+    common = int(np.argmax(sizes))
+    rare = int(np.argmin(np.abs(sizes - args.docs * 0.01)))
+    print(f"📄 {args.docs} vectors x {args.dim}, {CATEGORIES} categories "
+          f"(common c{common}: {sizes[common]} rows, rare c{rare}: {sizes[rare]} rows), {args.queries} queries, k={k}")
+
+    index = faiss.IndexFlatL2(args.dim)
+    index.add(vectors)
+
+    load_conn = psycopg2.connect(args.dsn, options=f"-c search_path={SCHEMA},public")
+    with load_conn.cursor() as cur:
+        cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA};")
+    load_conn.commit()
+    try:
+        records = ({'url': url, 'category': f"c{category[i]}", 'question': f"q{i}", 'answer': f"a{i}",
+                    'content_hash': f"{i:064x}"} for i, url in enumerate(urls))
+        database_saver.load(load_conn, records, progress=False)
+        stats = pgvector_store.load_embeddings(
+            load_conn, ((url, f"{i:064x}", vectors[i].tolist()) for i, url in enumerate(urls)),
+            dimension=args.dim, progress=False)
+        print(f"   load vectors   {stats['seconds']:6.1f}s")
+        start = time.time()
+        pgvector_store.build_index(load_conn)
+        print(f"   build HNSW     {time.time() - start:6.1f}s  (m={pgvector_store.HNSW_M}, "
+              f"ef_construction={pgvector_store.HNSW_EF_CONSTRUCTION})")
+
+        store = PgVectorStore(None, psycopg2.connect(args.dsn, options=f"-c search_path={SCHEMA},public"))
+
+        def pg_search(filter=None):
+            return lambda q: [position[d.metadata['url']] for d, _ in
+                              store.similarity_search_with_score_by_vector(q.tolist(), k, filter)]
+
+        def faiss_search(q, fetch_k=k, mask=None):
+            _, ids = index.search(q[None, :], fetch_k)
+            ids = [int(i) for i in ids[0] if i >= 0]
+            return [i for i in ids if mask is None or mask[i]][:k]
+
+        print(f"\n   {'':<34} {'p50 ms':>8} {'p95 ms':>8} {'recall':>7}")
+
+        def report(name, search, truths):
+            p50, p95, r = measure(search, qs, truths)
+            print(f"   {name:<34} {p50:8.2f} {p95:8.2f} {r:7.3f}")
+
+        truths = [exact_neighbours(vectors, q, k) for q in qs]
+        print("   no filter")
+        report('faiss flat (exact)', faiss_search, truths)
+        for ef in map(int, args.ef_search.split(',')):
+            store.ef_search = ef
+            report(f'pgvector hnsw ef_search={ef}', pg_search(), truths)
+        store.ef_search = pgvector_store.EF_SEARCH
+
+        for label, c in (('common', common), ('rare', rare)):
+            mask = category == c
+            truths = [exact_neighbours(vectors, q, k, mask) for q in qs]
+            filter = {'category': f"c{c}"}
+            print(f"   category = c{c} ({label}, {mask.mean():.1%} of rows)")
+            report('faiss flat, top 20 then filter', lambda q: faiss_search(q, 20, mask), truths)
+            selector = faiss.IDSelectorBatch(np.flatnonzero(mask).astype('int64'))
+            params = faiss.SearchParameters(sel=selector)
+            report('faiss flat, id selector (exact)',
+                   lambda q: [int(i) for i in index.search(q[None, :], k, params=params)[1][0] if i >= 0], truths)
+            report('pgvector store (planned)', pg_search(filter), truths)
+            saved = pgvector_store.EXACT_SCAN_ROWS, pgvector_store.FILTER_MARGIN
+            pgvector_store.EXACT_SCAN_ROWS, pgvector_store.FILTER_MARGIN = 0, 0
+            report(f'pgvector plain hnsw ef={pgvector_store.EF_SEARCH}', pg_search(filter), truths)
+            pgvector_store.EXACT_SCAN_ROWS, pgvector_store.FILTER_MARGIN = saved
+        store.conn.close()
+    finally:
+        load_conn.rollback()
+        with load_conn.cursor() as cur:
+            cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;")
+        load_conn.commit()
+        load_conn.close()
+
+if __name__ == '__main__':
+    main()
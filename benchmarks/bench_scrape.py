@@ -0,0 +1,64 @@
+"""
+Scraper throughput per runner mode against the local fixture server.
+
+    python benchmarks/bench_scrape.py --pages 500 --latency 50 --rate-429 0.02
+
+Each mode scrapes the same synthetic corpus into a fresh data dir through
+`runner.py --origin ...` with the fixed limiter and no rps cap, so the numbers
+measure the scraper, not the politeness budget (sync mode still sleeps
+runner.DELAY between requests).
+"""
+
+from pathlib import Path
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from corpus_store import CorpusStore
+from fixture_server import FixtureSite, start_server
+from url_registry import UrlRegistry
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pages', type=int, default=500)
+    parser.add_argument('--modes', nargs='+', default=['async', 'pipeline'])
+    parser.add_argument('--latency', type=float, default=50, help="ms per response")
+    parser.add_argument('--jitter', type=float, default=20, help="ms")
+    parser.add_argument('--rate-429', type=float, default=0)
+    parser.add_argument('--rate-5xx', type=float, default=0)
+    args = parser.parse_args()
+
+    site = FixtureSite(pages=args.pages, latency=args.latency / 1000, jitter=args.jitter / 1000,
+                       rate_429=args.rate_429, rate_5xx=args.rate_5xx, retry_after=0)
+    server = start_server(site)
+    origin = f"http://127.0.0.1:{server.server_port}"
+    print(f"🧪 {args.pages} pages, {args.latency:g}+{args.jitter:g} ms latency, "
+          f"429 {args.rate_429:.0%}, 5xx {args.rate_5xx:.0%} on {origin}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        UrlRegistry(tmp / 'urls.txt').rewrite(site.iter_urls())
+        for mode in args.modes:
+            site.reset()  # same fault pattern for every mode
+            data_dir = tmp / mode
+            start = time.perf_counter()
+            subprocess.run([sys.executable, str(ROOT / 'runner.py'), '--mode', mode, '--origin', origin,
+                            '--registry', str(tmp / 'urls.txt'), '--data-dir', str(data_dir),
+                            '--rate-limit', 'fixed', '--rps', '0'],
+                           cwd=tmp, check=True, stdout=subprocess.DEVNULL)
+            elapsed = time.perf_counter() - start
+            saved = CorpusStore(data_dir / 'raw_fatwas.jsonl').count()
+            served = json.loads(urllib.request.urlopen(origin + '/_stats').read())
+            print(f"   {mode:<9} {saved:6d} saved in {elapsed:6.1f}s  {saved / elapsed:7.1f} pages/s  served {served}")
+
+    server.shutdown()
+
+if __name__ == '__main__':
+    main()
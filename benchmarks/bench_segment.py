@@ -0,0 +1,107 @@
+"""
+Throughput of the span-based `extract_ques_ans` vs the old three-split version.
+
+    python benchmarks/bench_segment.py
+    python benchmarks/bench_segment.py --fixtures DIR --paragraphs 400
+
+Outputs (and error messages) are compared byte for byte before timing,
+including on texts with missing or repeated markers.
+"""
+
+from pathlib import Path
+import argparse
+import re
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fatwa_scraper
+from fatwa_scraper import (ANSWER_END, ANSWER_START, answer_title, end_pattern,
+                           question_title, start_pattern, tasmiya_pattern)
+from fatwa_fixtures import load_fixture_pages, synthetic_fatwa_page
+
+def extract_ques_ans_split(text):
+    """The original implementation, kept here as the reference."""
+    try:
+        first_split = re.split(question_title, text)
+        if len(first_split) < 2:
+            raise ValueError("Question title pattern not found")
+
+        second_split = re.split(start_pattern, first_split[1])
+        if len(second_split) < 2:
+            raise ValueError("Answer start pattern not found")
+
+        question = second_split[0]
+        question = question.replace(answer_title, '')
+        question = re.sub(tasmiya_pattern, '', question)
+        question = question[question.find('سوال')+len('سوال'):]
+
+        third_split = re.split(end_pattern, second_split[1])
+        if len(third_split) < 2:
+            raise ValueError("Answer end pattern not found")
+
+        answer = third_split[0]
+        answer = ANSWER_START + answer + ANSWER_END
+
+        return {'question': question.strip(), 'answer': answer.strip()}
+
+    except Exception as e:
+        raise ValueError(f"Failed to parse fatwa structure: {str(e)}")
+
+def outcome(fn, text):
+    try:
+        return fn(text)
+    except ValueError as e:
+        return str(e)
+
+def edge_cases(text):
+    title = re.search(question_title, text)
+    start = re.search(start_pattern, text)
+    end = re.search(end_pattern, text)
+    return [
+        '',
+        text[:title.start()],                                   # no title
+        text[:start.start()],                                   # no answer opener
+        text[:end.start()],                                     # no closing formula
+        text + text,                                            # whole fatwa twice
+        text[:end.start()] + text,                              # second title before closing formula
+        text[:start.end()] + text[start.start():],              # opener twice
+        text[title.start():title.end()] + ' ' + text,           # title twice up front
+        text.replace('سوال', ''),                               # no 'سوال' label
+    ]
+
+def per_sec(fn, texts, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            outcome(fn, text)
+    return len(texts) * rounds / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--fixtures', help="directory of saved fatwa pages (*.html)")
+    parser.add_argument('--count', type=int, default=100)
+    parser.add_argument('--paragraphs', type=int, default=200, help="answer length of synthetic long fatwas")
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.fixtures:
+        pages = load_fixture_pages(args.fixtures)
+    else:
+        pages = [synthetic_fatwa_page(i, answer_paragraphs=args.paragraphs) for i in range(args.count)]
+    texts = [t for t in (fatwa_scraper.extract_fatwa_text(p) for p in pages) if t]
+    print(f"📄 {len(texts)} texts, {sum(map(len, texts))/len(texts)/1024:.1f} K chars avg")
+
+    cases = texts + [case for t in texts[:10] for case in edge_cases(t)]
+    mismatches = sum(1 for t in cases
+                     if outcome(extract_ques_ans_split, t) != outcome(fatwa_scraper.extract_ques_ans, t))
+    print(f"   parity on {len(cases)} inputs: {'✅ identical' if not mismatches else f'❌ {mismatches} mismatches'}")
+
+    old = per_sec(extract_ques_ans_split, texts, args.rounds)
+    new = per_sec(fatwa_scraper.extract_ques_ans, texts, args.rounds)
+    print(f"\n   {'three re.split (old)':<22} {old:9.1f} fatwas/s")
+    print(f"   {'span segmenter':<22} {new:9.1f} fatwas/s  ({new/old:.1f}x)")
+
+if __name__ == '__main__':
+    main()
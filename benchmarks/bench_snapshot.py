@@ -0,0 +1,74 @@
+"""
+Read cost of the JSONL store vs the columnar snapshots (corpus_snapshot.py).
+
+    python benchmarks/bench_snapshot.py --records 20000
+
+Builds a synthetic store, exports .parquet and .arrow snapshots, then times a
+metadata-only job (url + category) and a full-text job (url + question +
+answer) against each, and checks they see the same records.
+"""
+
+from pathlib import Path
+import argparse
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from corpus_snapshot import export_snapshot, iter_snapshot, read_snapshot
+from corpus_store import CorpusStore
+from fatwa_fixtures import WORDS
+from url_registry import BASE_URL
+
+CATEGORIES = ['namaz', 'roza', 'zakat-aur-ushr', 'hajj-aur-umrah', 'nikah', 'talaq', 'wirasat-aur-tarka']
+
+def synthetic_records(count):
+    rng = random.Random(0)
+    for i in range(count):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        yield {'url': f"{BASE_URL}{category}/fatwa-{i}", 'category': category, 'slug': f"fatwa-{i}",
+               'question': ' '.join(rng.choices(WORDS, k=rng.randint(20, 80))),
+               'answer': ' '.join(rng.choices(WORDS, k=rng.randint(150, 1500))),
+               'content_hash': f"{i:064x}", 'scraped_at': '2026-01-01 00:00:00'}
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        store = CorpusStore(tmp / 'raw_fatwas.jsonl')
+        store.rewrite(synthetic_records(args.records))
+        print(f"📄 {args.records} records, JSONL {store.path.stat().st_size / 1e6:.1f} MB")
+
+        for suffix in ('.parquet', '.arrow'):
+            path = tmp / f"fatwas{suffix}"
+            seconds, _ = timed(lambda: export_snapshot(path, store))
+            print(f"   export {suffix:<8} {seconds:6.2f}s  {path.stat().st_size / 1e6:6.1f} MB")
+
+        jobs = {
+            'url+category': ['url', 'category'],
+            'full text': ['url', 'question', 'answer'],
+        }
+        for job, columns in jobs.items():
+            print(f"\n   {job}")
+            seconds, expected = timed(lambda: [tuple(r.get(c) for c in columns) for r in store.iter_latest()])
+            print(f"   {'jsonl':<16} {seconds * 1000:8.1f} ms")
+            for suffix in ('.parquet', '.arrow'):
+                path = tmp / f"fatwas{suffix}"
+                seconds, table = timed(lambda: read_snapshot(path, columns))
+                print(f"   {suffix[1:] + ' table':<16} {seconds * 1000:8.1f} ms")
+                seconds, rows = timed(lambda: [tuple(r[c] for c in columns) for r in iter_snapshot(path, columns)])
+                status = '✅' if rows == expected and table.num_rows == len(expected) else '❌ mismatch'
+                print(f"   {suffix[1:] + ' dicts':<16} {seconds * 1000:8.1f} ms  {status}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Run a sharded scrape end to end on one machine against a local stand-in server.
+
+    python benchmarks/shard_local.py --shards 4 --urls 400
+
+Serves synthetic fatwa pages on 127.0.0.1 (fixture_server.py), builds a
+throwaway registry and data dir, starts one `runner.py --shard i/N --origin ...` process per shard,
+merges the shards, and checks every URL ended up in the merged store once.
+"""
+
+from pathlib import Path
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from corpus_store import CorpusStore
+from fixture_server import FixtureSite, start_server
+from url_registry import BASE_URL, UrlRegistry
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--shards', type=int, default=4)
+    parser.add_argument('--urls', type=int, default=400)
+    parser.add_argument('--mode', default='async')
+    args = parser.parse_args()
+
+    server = start_server(FixtureSite(pages=0))
+    origin = f"http://127.0.0.1:{server.server_port}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        urls = [f"{BASE_URL}{['namaz', 'roza', 'zakat-aur-ushr'][i % 3]}/fatwa-{i}" for i in range(args.urls)]
+        UrlRegistry(tmp / 'urls.txt').rewrite(urls)
+        data_dir = tmp / 'fatwa_data'
+
+        print(f"🧩 {args.shards} shards x {args.mode} against {origin}, {len(urls)} URLs")
+        start = time.time()
+        workers = [subprocess.Popen(
+            [sys.executable, str(ROOT / 'runner.py'), '--mode', args.mode, '--shard', f"{i}/{args.shards}",
+             '--origin', origin, '--registry', str(tmp / 'urls.txt'), '--data-dir', str(data_dir),
+             '--rate-limit', 'fixed', '--rps', '0'],
+            cwd=tmp, stdout=open(tmp / f"shard-{i}.log", 'w'), stderr=subprocess.STDOUT)
+            for i in range(args.shards)]
+        codes = [w.wait() for w in workers]
+        print(f"   shards finished in {time.time() - start:.1f}s (exit codes {codes})")
+
+        sizes = [CorpusStore(d / 'raw_fatwas.jsonl').count()
+                 for d in sorted((data_dir / 'shards').iterdir())]
+        print(f"   records per shard: {sizes}")
+
+        subprocess.run([sys.executable, str(ROOT / 'runner.py'), '--mode', 'merge-shards',
+                        '--data-dir', str(data_dir)], cwd=tmp, check=True, stdout=subprocess.DEVNULL)
+
+        merged = [r['url'] for r in CorpusStore(data_dir / 'raw_fatwas.jsonl').iter_records()]
+        ok = sorted(merged) == sorted(urls) and sum(sizes) == len(urls)
+        print(f"   merged {len(merged)} records {'✅ every URL exactly once' if ok else '❌ mismatch'}")
+        server.shutdown()
+        return 0 if ok else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
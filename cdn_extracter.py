@@ -1,51 +1,205 @@
-import requests, html, json
+"""
+Discovers fatwa URLs by paging through every category listing.
+
+Categories are crawled in parallel (`--concurrency` at a time) through the
+shared rate-limited client. Within a category, page N+1 is requested as soon
+as page N arrives, so its download overlaps page N's parsing; a shorter or
+empty page is the last one, and costs one spare request for the page after
+it. A listing page that keeps failing (errors,
+5xx, throttling) after LISTING_RETRIES retries stops its category and is
+reported, without affecting the other categories, and the run exits 1.
+
+    python cdn_extracter.py                  # full crawl, rewrites the URL registry
+                                             # (merges into it if a category failed)
+    python cdn_extracter.py --incremental    # only pick up new fatwas, appended to it
+
+Results go to the URL registry (fatwa_urls.txt, see url_registry.py). In
+incremental mode a category stops paging at the first listing page that
+contains a URL the registry already knows, so a daily run costs roughly one or two
+requests per category instead of walking every page.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urldefrag, urljoin
+import argparse
+import html
+import re
+import sys
+import time
 from bs4 import BeautifulSoup
+import requests
+
+from fatwa_categories import CATEGORIES as categories
+from http_client import get_client, install_origin_override
+from rate_limiter import THROTTLE_STATUSES, AdaptiveRateLimiter
+from url_registry import get_registry
 
 base_url = f"https://www.fatwaqa.com/ur/fatawa"
 
 headers = {
     "X-Requested-With": "XMLHttpRequest",
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
 }
 
-categories = ['quran-aur-hadees', 'aqaid', 'mamoolat-e-ahlesunnat', 'taharat-ke-masail', 'namaz', 'mayyat', 'roza', 'zakat-aur-ushr', 'hajj-aur-umrah', 'qurbani-aur-aqeeqah', 'mukhtasar-jawabat', 'bachon-ke-naam', 'mahnama-ahkam-e-tijarat', 'masnoon-duayein', 'zibah-aur-shikar', 'qasam-aur-mannat', 'nikah', 'talaq', 'razaat', 'iddat', 'khareed-o-farokht', 'shirkat', 'muzaribat', 'ijarah', 'qarz-hiba-rahan', 'waqf', 'wirasat-aur-tarka', 'luqatah', 'saza-o-qaza', 'halal-haram', 'sunnatain-aur-adab', 'gunah', 'huqooq-ul-ibad', 'fazail-o-seerat', 'auraton-ke-masail', 'kafir-aur-murtad', 'majlis-e-tehqiqat-e-shariah', 'iqtisad', 'sadqa', 'mutafariqat']
-
-all_urls = []
-
-for category in categories:
-    page = 1
-    while True:
-        url = f"{base_url}/{category}?page={page}"
-        print(f"Scraping {url}")
-
-        res = requests.get(url, headers=headers)
-        res.encoding = 'utf-8'
-
-        if res.status_code != 200:
-            print("Failed:", res.status_code)
-            break
-
-        cleaned_html = html.unescape(res.text)
-        cleaned_html = cleaned_html.replace('\\"', '"').replace("\\/", "/")
-
-        soup = BeautifulSoup(cleaned_html, "html.parser")
-
-        links = [
-            a["href"]
-            for a in soup.select(f"a[href*='/ur/fatawa/{category}/']")
-        ]
-
-        if not links:
-            print("Done with category", category)
-            break
-
-        all_urls.extend(links)
-
-        print("Found:", len(links))
-        page += 1
-
-
-output_path = "fatwa_urls.json"
-
-with open(output_path, "w", encoding="utf-8") as f:
-    json.dump(all_urls, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+# =================== listing pages ==========================================================
+
+LISTING_RETRIES = 3
+LISTING_BACKOFF = 2.0   # seconds, doubled per retry
+
+class ListingError(Exception):
+    pass
+
+def fetch_listing(client, category, page, retries=LISTING_RETRIES, backoff=LISTING_BACKOFF):
+    """Listing page HTML; raises ListingError when it cannot be fetched.
+
+    Connection errors, 5xx and throttling are retried; other statuses are not.
+    """
+    url = f"{base_url}/{category}?page={page}"
+    for attempt in range(retries + 1):
+        try:
+            res = client.get(url, headers=headers)
+        except requests.RequestException as e:
+            problem = f"{type(e).__name__}: {e}"
+        else:
+            if res.status_code == 200:
+                res.encoding = 'utf-8'
+                return res.text
+            problem = f"HTTP {res.status_code}"
+            if res.status_code < 500 and res.status_code not in THROTTLE_STATUSES:
+                break
+        if attempt < retries:
+            print(f"Retrying {url} ({problem})")
+            time.sleep(backoff * 2 ** attempt)
+    raise ListingError(f"{url}: {problem}")
+
+# Listing responses are JSON-wrapped HTML; pulling the links out needs no tree.
+# html.parser treats comments and <script>/<style> bodies as text, so those
+# are cut first to keep the fast path's output identical to the soup path.
+HIDDEN_RE = re.compile(r'<!--.*?-->|<(script|style)\b.*?</\1\s*>', re.S | re.I)
+A_TAG_RE = re.compile(r'<a\s(?:[^>"\']|"[^"]*"|\'[^\']*\')*>', re.I)
+HREF_RE = re.compile(r'(?:^|\s)href\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))', re.I)
+
+def clean_listing(page_html):
+    cleaned_html = html.unescape(page_html)
+    return cleaned_html.replace('\\"', '"').replace("\\/", "/")
+
+def fatwa_link(href):
+    """Absolute fatwa URL without its #fragment (share/anchor links point at the same fatwa)."""
+    return urldefrag(urljoin(base_url, href)).url
+
+def extract_links_soup(page_html, category):
+    soup = BeautifulSoup(clean_listing(page_html), "html.parser")
+    links = (fatwa_link(a["href"]) for a in soup.select(f"a[href*='/ur/fatawa/{category}/']"))
+    return list(dict.fromkeys(links))
+
+def extract_links_fast(page_html, category):
+    marker = f'/ur/fatawa/{category}/'
+    cleaned_html = clean_listing(page_html)
+    if marker not in cleaned_html:
+        return []  # cannot contain a matching link
+    cleaned_html = HIDDEN_RE.sub('', cleaned_html)
+
+    links = []
+    for tag in A_TAG_RE.findall(cleaned_html):
+        hrefs = HREF_RE.findall(tag)
+        if not hrefs:
+            continue
+        href = ''.join(hrefs[-1])  # duplicate attributes: the soup keeps the last
+        if '&' in href:
+            href = html.unescape(href)
+        if marker in href:
+            links.append(fatwa_link(href))
+    return list(dict.fromkeys(links)) or None  # marker present but nothing matched: let the soup decide
+
+def extract_links(page_html, category):
+    """Unique fatwa links on a listing page, in page order; BeautifulSoup only when the fast path is unsure."""
+    links = extract_links_fast(page_html, category)
+    return extract_links_soup(page_html, category) if links is None else links
+
+# =================== crawler ================================================================
+
+def crawl_category(client, category, prefetcher, known_urls=None):
+    """(URLs, error) of one category, page by page; error is None or why a page failed.
+
+    Page N+1 is submitted to `prefetcher` before page N is parsed. A page
+    shorter than the first, or empty, is the last: the prefetch behind it is
+    cancelled, or if already running its response is dropped, so a category
+    costs one spare request. With `known_urls`, stops after the first page that
+    reaches an already known URL and returns only the new ones; a failed page
+    then returns none, so the next run still walks down to the known URLs.
+    """
+    found = []
+    page, page_size = 1, None
+    next_page = prefetcher.submit(fetch_listing, client, category, page)
+
+    while next_page is not None:
+        try:
+            page_html = next_page.result()
+        except ListingError as e:
+            print(f"❌ Category {category} stopped at page {page}: {e}")
+            return ([] if known_urls is not None else found), str(e)
+        next_page = prefetcher.submit(fetch_listing, client, category, page + 1)
+
+        links = extract_links(page_html, category)
+        page_size = page_size or len(links)
+        if known_urls is not None:
+            new_links = [u for u in links if u not in known_urls]
+            last = len(new_links) < len(links)
+            links = new_links
+        else:
+            last = False
+        last = last or not links or len(links) < page_size
+
+        found.extend(links)
+        if last:
+            next_page.cancel()  # no-op once running; the result is never read
+            next_page = None
+        else:
+            page += 1
+
+    print(f"Done with category {category}: {len(found)} {'new ' if known_urls is not None else ''}URLs, {page} pages")
+    return found, None
+
+def crawl(categories, concurrency=8, known_urls=None, client=None):
+    """(URLs, {category: error}) over all `categories`."""
+    client = client or get_client(rate_limiter=AdaptiveRateLimiter(name='cdn_extracter'))
+    # every category in flight has at most one page prefetching
+    with ThreadPoolExecutor(max_workers=concurrency) as category_pool, \
+         ThreadPoolExecutor(max_workers=concurrency) as prefetcher:
+        per_category = list(category_pool.map(
+            lambda c: crawl_category(client, c, prefetcher, known_urls), categories))
+    all_urls = [u for urls, _ in per_category for u in urls]
+    failed = {c: error for c, (_, error) in zip(categories, per_category) if error}
+
+    client.print_timing_report()
+    return all_urls, failed
+
+def main():
+    parser = argparse.ArgumentParser(description="Discover fatwa URLs from the category listings")
+    parser.add_argument('--incremental', action='store_true',
+                        help="stop paging a category at the first already-known URL")
+    parser.add_argument('--concurrency', type=int, default=8, help="categories crawled in parallel")
+    parser.add_argument('--registry', help="registry file (default: fatwa_urls.txt)")
+    parser.add_argument('--origin', help="send requests to this origin instead, e.g. fixture_server.py")
+    args = parser.parse_args()
+    install_origin_override(args.origin)
+
+    registry = get_registry(args.registry)
+    if args.incremental:
+        new_urls, failed = crawl(categories, args.concurrency, known_urls=registry)
+        added = registry.add(new_urls)
+        print(f"Found {len(added)} new URLs ({len(registry)} total)")
+    else:
+        all_urls, failed = crawl(categories, args.concurrency)
+        if failed:
+            # an incomplete crawl must not drop the URLs it did not reach
+            added = registry.add(all_urls)
+            print(f"Found {len(all_urls)} URLs, merged {len(added)} new ones ({len(registry)} total)")
+        else:
+            registry.rewrite(all_urls)
+            print(f"Found {len(all_urls)} URLs ({len(registry)} unique)")
+    if failed:
+        print(f"⚠️  {len(failed)} categories failed: {', '.join(failed)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Compressed base of the corpus store, written when it compacts.
+
+The JSONL store (corpus_store.py) stays append-only plain text, which is what
+the scraper needs, but almost all of it is records that will not change
+again. `CorpusStore.compact()` moves the latest record of every URL into a
+pack beside it (raw_fatwas.zpack/ next to raw_fatwas.jsonl), each record a
+zstd frame compressed against a dictionary trained on the corpus
+(doc_compression.py), and cuts the JSONL down to what is appended later:
+
+    records.bin       the frames, back to back
+    records.offsets   native uint64 array of count + 1 byte offsets into records.bin
+    records.zdict     the dictionary (empty: plain frames)
+    records.urls      URL of each record, one per line
+    folded.json       device, inode and size of the JSONL file whose lines the pack holds
+
+The store reads the pack first and the JSONL after it, so its reading API
+(`iter_latest`, `iter_records`, `urls`, `count`) and every reader built on it
+see one corpus. A pack is written to a fresh version directory and switched
+to in one step (versioned_dir.py) before the JSONL is cut; until the cut, the
+JSONL is still the file named in folded.json and its first `size` bytes are
+skipped, so a crash in between loses or repeats nothing.
+
+Both data files are memory-mapped: `get(url)` reads and decompresses one
+record, and iterating costs one decompression per record.
+
+Usage:
+    python corpus_store.py compact          # writes / replaces the pack
+    python corpus_pack.py info [store]      # default fatwa_data/raw_fatwas.jsonl
+    python corpus_pack.py get URL [store]
+
+Needs the zstandard package, to compact and to read a compacted store.
+"""
+
+from array import array
+from itertools import chain
+from pathlib import Path
+import json
+import os
+import sys
+
+import doc_compression
+import versioned_dir
+from versioned_dir import map_file, write_file
+
+PACK_SUFFIX = '.zpack'
+
+RECORDS_FILE = 'records.bin'
+OFFSETS_FILE = 'records.offsets'
+DICT_FILE = 'records.zdict'
+URLS_FILE = 'records.urls'
+FOLDED_FILE = 'folded.json'
+
+def pack_path(store_path):
+    """Where the pack of the store at `store_path` lives."""
+    return Path(store_path).with_suffix(PACK_SUFFIX)
+
+def exists(path):
+    return (Path(path) / versioned_dir.CURRENT_FILE).exists()
+
+# =================== writing ================================================================
+
+def write_pack(path, lines, folded=None):
+    """Pack JSON `lines` (one record each, str or bytes) into a new version of `path`.
+
+    `folded` ({'dev', 'ino', 'size'}) names the JSONL bytes the pack replaces.
+    The dictionary is trained on the first SAMPLE_BYTES of records, so the
+    rest is streamed. Returns (records, packed bytes).
+    """
+    entries = (line.encode('utf-8') if isinstance(line, str) else line for line in lines)
+    entries = (entry.rstrip(b'\r\n') for entry in entries)
+    head, sampled = [], 0
+    for entry in entries:
+        head.append(entry)
+        sampled += len(entry)
+        if sampled >= doc_compression.SAMPLE_BYTES:
+            break
+    codec = doc_compression.DocCodec.trained(head)
+    offsets, urls = array('Q', [0]), []
+
+    def write_records(f):
+        for entry in chain(head, entries):
+            frame = codec.compress(entry)
+            f.write(frame)
+            offsets.append(offsets[-1] + len(frame))
+            urls.append(json.loads(entry)['url'])
+
+    with versioned_dir.new_version(path) as version:
+        write_file(version / DICT_FILE, lambda f: f.write(codec.dictionary))
+        write_file(version / RECORDS_FILE, write_records)
+        write_file(version / OFFSETS_FILE, offsets.tofile)
+        write_file(version / URLS_FILE, lambda f: f.write(''.join(f"{u}\n" for u in urls).encode('utf-8')))
+        write_file(version / FOLDED_FILE, lambda f: f.write(json.dumps(folded).encode('utf-8')))
+    return len(urls), offsets[-1] + len(codec.dictionary)
+
+# =================== reading ================================================================
+
+class CorpusPack:
+    def __init__(self, path):
+        self.path = Path(path)
+        # every file of one version, opened now: a later compaction may replace it
+        self.directory = versioned_dir.current(self.path)
+        self._blob = map_file(self.directory / RECORDS_FILE)
+        self._offsets = memoryview(map_file(self.directory / OFFSETS_FILE)).cast('Q')
+        self._codec = doc_compression.DocCodec((self.directory / DICT_FILE).read_bytes())
+        self._urls = map_file(self.directory / URLS_FILE)
+        self.folded = json.loads((self.directory / FOLDED_FILE).read_text(encoding='utf-8'))
+        self._positions = None
+
+    def __len__(self):
+        return max(len(self._offsets) - 1, 0)
+
+    def raw(self, position):
+        """JSON bytes of record `position`."""
+        return self._codec.decompress(self._blob[self._offsets[position]:self._offsets[position + 1]])
+
+    def __getitem__(self, position):
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        return json.loads(self.raw(position))
+
+    def urls(self):
+        """URL of each record, by position."""
+        return bytes(self._urls).decode('utf-8').splitlines()
+
+    def positions(self):
+        """{url: position of its last record}, built on first use."""
+        if self._positions is None:
+            self._positions = {url: i for i, url in enumerate(self.urls())}
+        return self._positions
+
+    def get(self, url):
+        position = self.positions().get(url)
+        return None if position is None else json.loads(self.raw(position))
+
+    def tail_start(self, f):
+        """Offset of the first line of the open JSONL file `f` that is not in the pack."""
+        if not self.folded:
+            return 0
+        stat = os.fstat(f.fileno())
+        if (stat.st_dev, stat.st_ino) != (self.folded['dev'], self.folded['ino']):
+            return 0  # the JSONL was cut after this pack was written
+        return self.folded['size']
+
+    def size(self):
+        """Bytes on disk: records plus dictionary."""
+        return len(self._blob) + len(self._codec.dictionary)
+
+def main(argv):
+    from corpus_store import CorpusStore, DEFAULT_PATH
+
+    if len(argv) < 2 or argv[1] not in ('info', 'get') or (argv[1] == 'get' and len(argv) < 3):
+        print(__doc__)
+        return 1
+
+    store = CorpusStore(argv[-1] if len(argv) > (3 if argv[1] == 'get' else 2) else DEFAULT_PATH)
+    path = pack_path(store.path)
+    if not exists(path):
+        print(f"❌ {store.path} has no pack; run `python corpus_store.py compact {store.path}`")
+        return 1
+    pack = CorpusPack(path)
+
+    if argv[1] == 'get':
+        record = pack.get(argv[2])
+        if record is None:
+            print(f"❌ {argv[2]} is not in {path}")
+            return 1
+        print(json.dumps(record, ensure_ascii=False, indent=2))
+        return 0
+
+    tail = store.path.stat().st_size if store.path.exists() else 0
+    print(f"📦 {path}: {len(pack)} fatwas, {pack.size() / 1e6:.1f} MB "
+          f"(dictionary {len(pack._codec.dictionary) / 1024:.0f} KB); "
+          f"{store.path}: {tail / 1e6:.1f} MB appended since")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,184 @@
+"""
+Columnar snapshots of the corpus store, for jobs that read rather than scrape.
+
+The JSONL store is the source of truth; a snapshot is a read-only copy of its
+latest record per URL, with one column per field:
+
+    url, slug, content_hash, scraped_at    string
+    category                              dictionary<int16, string> (~40 values)
+    question, answer                      string
+
+Two formats, chosen by suffix:
+
+    fatwas.parquet   zstd-compressed columns; a read decodes only the columns
+                     asked for, so `columns=['url', 'category']` never touches
+                     the answer text. The compact format to copy around.
+    fatwas.arrow     Arrow IPC file, uncompressed; read through a memory map,
+                     so columns are zero-copy views over the page cache and
+                     the ones not asked for are never paged in.
+
+Each snapshot records the store's size and mtime it was built from, and
+`is_current()` tells whether the store has changed since.
+
+Usage:
+    python corpus_snapshot.py export [path]     # default fatwa_data/fatwas.parquet
+    python corpus_snapshot.py info [path]
+
+    from corpus_snapshot import read_snapshot, iter_snapshot
+    table = read_snapshot('fatwa_data/fatwas.arrow', columns=['url', 'category'])
+    for record in iter_snapshot(columns=['url', 'question', 'answer']): ...
+
+Needs pyarrow, imported only when a snapshot is written or read.
+"""
+
+from pathlib import Path
+import os
+import sys
+
+from corpus_store import CorpusStore, DEFAULT_PATH
+
+DEFAULT_SNAPSHOT = Path('fatwa_data') / 'fatwas.parquet'
+COLUMNS = ['url', 'category', 'slug', 'question', 'answer', 'content_hash', 'scraped_at']
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("corpus snapshots need the pyarrow package") from None
+    return pyarrow
+
+def snapshot_schema(pa, source=None):
+    fields = [pa.field(name, pa.dictionary(pa.int16(), pa.string()) if name == 'category' else pa.string())
+              for name in COLUMNS]
+    return pa.schema(fields, metadata=source)
+
+def _source_metadata(store):
+    # schema metadata values are strings
+    return {k: str(v) for k, v in store.source_metadata().items()}
+
+# =================== export =================================================================
+
+def _batches(pa, store, schema, batch_size):
+    """Record batches of the store's latest records, category codes stable across batches."""
+    codes, categories = {}, []
+    rows = []
+
+    def to_batch(rows):
+        columns = []
+        for name in COLUMNS:
+            if name == 'category':
+                indices = []
+                for row in rows:
+                    value = row.get('category')
+                    if value is not None and value not in codes:
+                        codes[value] = len(categories)
+                        categories.append(value)
+                    indices.append(codes.get(value))
+                columns.append(pa.DictionaryArray.from_arrays(
+                    pa.array(indices, pa.int16()), pa.array(categories, pa.string())))
+            else:
+                columns.append(pa.array([row.get(name) for row in rows], pa.string()))
+        return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+    for record in store.iter_latest():
+        rows.append(record)
+        if len(rows) >= batch_size:
+            yield to_batch(rows)
+            rows = []
+    if rows:
+        yield to_batch(rows)
+
+def export_snapshot(path=DEFAULT_SNAPSHOT, store=None, batch_size=5000, compression='zstd'):
+    """Write the store's latest records to `path` (.parquet or .arrow), atomically. Returns rows."""
+    pa = _pyarrow()
+    store = store or CorpusStore(DEFAULT_PATH)
+    path = Path(path)
+    schema = snapshot_schema(pa, _source_metadata(store))
+    tmp = path.with_name(path.name + '.tmp')
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    rows = 0
+    if path.suffix == '.arrow':
+        # the category dictionary only grows, so later batches carry deltas
+        options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+        with pa.OSFile(str(tmp), 'wb') as sink, pa.ipc.new_file(sink, schema, options=options) as writer:
+            for batch in _batches(pa, store, schema, batch_size):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    else:
+        import pyarrow.parquet as pq
+        with pq.ParquetWriter(tmp, schema, compression=compression,
+                              use_dictionary=['category']) as writer:
+            for batch in _batches(pa, store, schema, batch_size):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    os.replace(tmp, path)
+    return rows
+
+# =================== reading ================================================================
+
+def read_snapshot(path=DEFAULT_SNAPSHOT, columns=None):
+    """The snapshot as a pyarrow Table holding only `columns` (default: all)."""
+    pa = _pyarrow()
+    path = Path(path)
+    if path.suffix == '.arrow':
+        table = pa.ipc.open_file(pa.memory_map(str(path), 'r')).read_all()
+        return table.select(columns) if columns else table
+    import pyarrow.parquet as pq
+    return pq.read_table(path, columns=columns, memory_map=True)
+
+def iter_snapshot(path=DEFAULT_SNAPSHOT, columns=None, batch_size=5000):
+    """Yield records as dicts of `columns`, one batch in memory at a time."""
+    pa = _pyarrow()
+    path = Path(path)
+    if path.suffix == '.arrow':
+        reader = pa.ipc.open_file(pa.memory_map(str(path), 'r'))
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+        if columns:
+            batches = (batch.select(columns) for batch in batches)
+    else:
+        import pyarrow.parquet as pq
+        batches = pq.ParquetFile(path, memory_map=True).iter_batches(batch_size, columns=columns)
+    for batch in batches:
+        yield from batch.to_pylist()
+
+def snapshot_metadata(path=DEFAULT_SNAPSHOT):
+    pa = _pyarrow()
+    path = Path(path)
+    if path.suffix == '.arrow':
+        schema = pa.ipc.open_file(pa.memory_map(str(path), 'r')).schema
+    else:
+        import pyarrow.parquet as pq
+        schema = pq.read_schema(path)
+    return {k.decode(): v.decode() for k, v in (schema.metadata or {}).items()}
+
+def is_current(path=DEFAULT_SNAPSHOT, store=None):
+    """True when `path` exists and its store (default: the one it was built from) is unchanged."""
+    if not Path(path).exists():
+        return False
+    meta = snapshot_metadata(path)
+    store = store or CorpusStore(meta.get('source', DEFAULT_PATH))
+    if not store.path.exists():
+        return False
+    current = _source_metadata(store)
+    return all(meta.get(k) == current[k] for k in ('source_size', 'source_mtime_ns'))
+
+def main(argv):
+    if len(argv) < 2 or argv[1] not in ('export', 'info'):
+        print(__doc__)
+        return 1
+
+    path = Path(argv[2]) if len(argv) > 2 else DEFAULT_SNAPSHOT
+    if argv[1] == 'export':
+        rows = export_snapshot(path)
+        print(f"📦 Exported {rows} fatwas to {path} ({path.stat().st_size / 1e6:.1f} MB)")
+    else:
+        meta = snapshot_metadata(path)
+        table = read_snapshot(path, columns=['category'])
+        print(f"📦 {path}: {table.num_rows} fatwas, {len(table.column('category').drop_null().unique())} categories, "
+              f"{path.stat().st_size / 1e6:.1f} MB, built from {meta.get('source')} "
+              f"({'current' if is_current(path) else 'stale'})")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
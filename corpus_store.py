@@ -0,0 +1,282 @@
+"""
+Append-only corpus store for scraped fatwas.
+
+Records are written one JSON object per line to `raw_fatwas.jsonl`. Saving a
+batch only appends the new lines (fsync'd every `fsync_every` records), so
+write volume stays linear in corpus size and a crash can at worst leave one
+half-written trailing line, which the reader skips and the next writer trims.
+
+A URL can appear more than once (e.g. after a re-scrape); the last line wins.
+`compact()` keeps only the latest record per URL. With zstandard installed it
+moves them into a compressed pack beside the file (raw_fatwas.zpack/, see
+corpus_pack.py) and leaves the JSONL to the records appended afterwards;
+without it, it rewrites the JSONL and swaps it in atomically. The readers
+below go through the pack first and the JSONL after it, so a compacted store
+reads the same, and a store with a pack keeps writing full rewrites there.
+
+Usage:
+    python corpus_store.py compact [path]     # drop superseded records (and compress them)
+    python corpus_store.py migrate [path]     # convert legacy raw_fatwas.json
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+import json
+import os
+import shutil
+import sys
+
+import corpus_pack
+import doc_compression
+
+DEFAULT_PATH = Path('fatwa_data') / 'raw_fatwas.jsonl'
+
+class CorpusStore:
+    def __init__(self, path=DEFAULT_PATH, fsync_every=50):
+        self.path = Path(path)
+        self.pack_path = corpus_pack.pack_path(self.path)
+        self.fsync_every = fsync_every
+        self._fh = None
+        self._unsynced = 0
+
+    # =================== writing ===============================================
+
+    def _open_for_append(self):
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._trim_partial_line()
+            self._fh = open(self.path, 'a', encoding='utf-8')
+        return self._fh
+
+    def _trim_partial_line(self):
+        """Cut a half-written last line left by a crash so appends start clean."""
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return
+        with open(self.path, 'rb+') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) == b'\n':
+                return
+            size = f.seek(0, os.SEEK_END)
+            pos = size
+            while pos > 0:
+                step = min(65536, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                idx = chunk.rfind(b'\n')
+                if idx != -1:
+                    f.truncate(pos + idx + 1)
+                    return
+            f.truncate(0)
+
+    def append(self, record):
+        fh = self._open_for_append()
+        fh.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self.flush()
+
+    def append_many(self, records):
+        for record in records:
+            self.append(record)
+
+    def flush(self, fsync=True):
+        if self._fh is None:
+            return
+        self._fh.flush()
+        if fsync:
+            os.fsync(self._fh.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        if self._fh is not None:
+            self.flush()
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # =================== reading ===============================================
+
+    def _pack(self):
+        """The compressed base written by `compact`, or None."""
+        return corpus_pack.CorpusPack(self.pack_path) if corpus_pack.exists(self.pack_path) else None
+
+    def _iter_tail(self, pack=None):
+        """(byte offset, line) of the JSONL lines that `pack` does not hold."""
+        if not self.path.exists():
+            return
+        if self._fh is not None:
+            self._fh.flush()
+        with open(self.path, 'rb') as f:
+            offset = pack.tail_start(f) if pack is not None else 0
+            f.seek(offset)
+            for line in f:
+                start = offset
+                offset += len(line)
+                if not line.endswith(b'\n'):
+                    break  # half-written tail from a crash
+                yield start, line
+
+    def _iter_lines(self):
+        """(key, line) of every record, the pack's then the JSONL's; see `_line_reader`.
+
+        A key is the position in the pack, or len(pack) + the byte offset in the JSONL.
+        """
+        pack = self._pack()
+        base = 0
+        if pack is not None:
+            for position in range(len(pack)):
+                yield position, pack.raw(position) + b'\n'
+            base = len(pack)
+        for offset, line in self._iter_tail(pack):
+            yield base + offset, line
+
+    @contextmanager
+    def _line_reader(self):
+        """read(key) -> line, for keys from `_iter_lines` (same pack, so no compaction in between)."""
+        pack = self._pack()
+        base = len(pack) if pack is not None else 0
+        f = open(self.path, 'rb') if self.path.exists() else None
+
+        def read(key):
+            if key < base:
+                return pack.raw(key) + b'\n'
+            f.seek(key - base)
+            return f.readline()
+
+        try:
+            yield read
+        finally:
+            if f is not None:
+                f.close()
+
+    def iter_records(self):
+        """Yield every record in file order, including superseded ones."""
+        for _, line in self._iter_lines():
+            yield json.loads(line)
+
+    def iter_latest(self):
+        """Yield the latest record for each URL, in file order.
+
+        First pass keeps only url -> key (the pack's URLs come from its URL
+        list, undecompressed), so memory is O(URLs), not O(text).
+        """
+        pack = self._pack()
+        latest, base = {}, 0
+        if pack is not None:
+            latest.update((url, position) for position, url in enumerate(pack.urls()))
+            base = len(pack)
+        for offset, line in self._iter_tail(pack):
+            latest[json.loads(line)['url']] = base + offset
+        keep = set(latest.values())
+        for position in range(base):
+            if position in keep:
+                yield json.loads(pack.raw(position))
+        for offset, line in self._iter_tail(pack):
+            if base + offset in keep:
+                yield json.loads(line)
+
+    def iter_field(self, field):
+        for record in self.iter_records():
+            yield record.get(field)
+
+    def urls(self):
+        pack = self._pack()
+        urls = set(pack.urls()) if pack is not None else set()
+        urls.update(json.loads(line)['url'] for _, line in self._iter_tail(pack))
+        return urls
+
+    def count(self):
+        pack = self._pack()
+        return (len(pack) if pack is not None else 0) + sum(1 for _ in self._iter_tail(pack))
+
+    def source_metadata(self):
+        """Path, size and mtime of the file, for copies built from it to tell if they are current."""
+        stat = self.path.stat()
+        return {'source': str(self.path), 'source_size': stat.st_size,
+                'source_mtime_ns': stat.st_mtime_ns}
+
+    # =================== maintenance ===========================================
+
+    def rewrite(self, records, compress=False):
+        """Replace the store's contents with `records` (an iterable) via an atomic swap."""
+        return self.rewrite_lines((json.dumps(record, ensure_ascii=False) + '\n' for record in records), compress)
+
+    def rewrite_lines(self, lines, compress=False):
+        """Like `rewrite`, for records already encoded as JSON lines.
+
+        `compress` writes them as a pack. A store that already has one always
+        does: a plain JSONL swap cannot drop the pack in the same step.
+        """
+        self.close()
+        if compress or corpus_pack.exists(self.pack_path):
+            return self._rewrite_packed(lines)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        written = 0
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for line in lines:
+                f.write(line)
+                written += 1
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        return written
+
+    def _rewrite_packed(self, lines):
+        """Write `lines` as the pack, then cut the JSONL down to what was appended meanwhile."""
+        folded = None
+        if self.path.exists():
+            stat = self.path.stat()
+            folded = {'dev': stat.st_dev, 'ino': stat.st_ino, 'size': stat.st_size}
+        written, _ = corpus_pack.write_pack(self.pack_path, lines, folded)
+
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            if folded is not None:
+                with open(self.path, 'rb') as src:
+                    src.seek(folded['size'])
+                    shutil.copyfileobj(src, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        return written
+
+    def compact(self, compress=None):
+        """Keep the latest record per URL; `compress` (default: when zstandard is installed) packs them."""
+        if compress is None:
+            compress = doc_compression.available()
+        before = self.count()
+        after = self.rewrite(self.iter_latest(), compress)
+        return before, after
+
+    def migrate_legacy_json(self, legacy_path):
+        """Convert an old pretty-printed raw_fatwas.json array into this store."""
+        import ijson
+        with open(legacy_path, 'rb') as f:
+            return self.rewrite(ijson.items(f, 'item', use_float=True))
+
+def main(argv):
+    if len(argv) < 2 or argv[1] not in ('compact', 'migrate'):
+        print(__doc__)
+        return 1
+
+    store = CorpusStore(argv[2] if len(argv) > 2 else DEFAULT_PATH)
+    if argv[1] == 'compact':
+        before, after = store.compact()
+        print(f"🗜️  Compacted {store.path}: {before} -> {after} records")
+        pack = store._pack()
+        if pack is not None:
+            print(f"   compressed into {store.pack_path}: {pack.size() / 1e6:.1f} MB")
+    else:
+        legacy = store.path.with_suffix('.json')
+        written = store.migrate_legacy_json(legacy)
+        print(f"📦 Migrated {written} records from {legacy} to {store.path}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
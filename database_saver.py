@@ -1,18 +1,39 @@
-import json
+"""
+Bulk loader for the Postgres `fatwas` table.
+
+Streams the corpus store's latest records to the server in chunks: each chunk
+is sent with `COPY ... FROM STDIN` into a temporary staging table, then merged
+into `fatwas` with one `INSERT ... SELECT ... ON CONFLICT (url) DO UPDATE`
+that only rewrites rows whose content_hash changed. Every chunk is its own
+transaction, so memory stays at one chunk whatever the corpus size and an
+interrupted load keeps what it merged; running it again picks up the rest.
+Records whose hash the table already holds are not sent at all.
+
+Usage:
+    python database_saver.py load [--store PATH] [--chunk-size 5000]
+    python database_saver.py check          # row count and a few questions
+
+Connection settings come from .env (DB_NAME, DB_USER, DB_PASSWORD, DB_HOST,
+DB_PORT), or from --dsn / DATABASE_URL. Against a throwaway local server:
+
+    docker run --rm -d -e POSTGRES_PASSWORD=pg -p 5433:5432 postgres:16
+    python database_saver.py load --dsn postgresql://postgres:pg@127.0.0.1:5433/postgres
+"""
+
 from dotenv import load_dotenv
 import psycopg2
-from psycopg2.extras import execute_values
+import argparse
+import io
 import os
+import re
+import time
 
-load_dotenv()
+from corpus_store import CorpusStore, DEFAULT_PATH
+from state_store import content_hash_of
 
-db_params = {
-    'dbname': os.getenv('DB_NAME'),
-    'user': os.getenv('DB_USER'),
-    'password': os.getenv('DB_PASSWORD'),
-    'host': os.getenv('DB_HOST'),
-    'port': os.getenv('DB_PORT')
-}
+CHUNK_SIZE = 5000
+
+COLUMNS = ('url', 'question', 'answer', 'category', 'content_hash')
 
 create_table_script = '''
 CREATE TABLE IF NOT EXISTS fatwas (
@@ -21,56 +42,149 @@ CREATE TABLE IF NOT EXISTS fatwas (
     question TEXT,
     answer TEXT,
     category VARCHAR(255),
+    content_hash CHAR(64),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+ALTER TABLE fatwas ADD COLUMN IF NOT EXISTS content_hash CHAR(64);
+CREATE INDEX IF NOT EXISTS idx_fatwas_category ON fatwas(category);
 '''
 
-insert_entry_script = '''
-INSERT INTO fatwas (url, question, answer, category)
-VALUES %s
-ON CONFLICT (url) DO NOTHING;
+# session-private and never WAL-logged; emptied by every chunk's commit
+create_staging_script = '''
+CREATE TEMP TABLE IF NOT EXISTS fatwas_staging (
+    url TEXT,
+    question TEXT,
+    answer TEXT,
+    category VARCHAR(255),
+    content_hash CHAR(64)
+) ON COMMIT DELETE ROWS;
 '''
 
-create_index_script = '''
-CREATE INDEX IF NOT EXISTS idx_fatwas_category ON fatwas(category);
+copy_script = f"COPY fatwas_staging ({', '.join(COLUMNS)}) FROM STDIN"
+
+# DISTINCT ON: ON CONFLICT cannot touch one url twice in a statement.
+# xmax = 0 tells an inserted row from an updated one; rows the WHERE skips
+# are not returned at all.
+merge_script = '''
+WITH merged AS (
+    INSERT INTO fatwas (url, question, answer, category, content_hash)
+    SELECT DISTINCT ON (url) url, question, answer, category, content_hash
+    FROM fatwas_staging
+    ORDER BY url
+    ON CONFLICT (url) DO UPDATE SET
+        question = EXCLUDED.question,
+        answer = EXCLUDED.answer,
+        category = EXCLUDED.category,
+        content_hash = EXCLUDED.content_hash
+    WHERE fatwas.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+    RETURNING xmax = 0 AS inserted
+)
+SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM merged;
 '''
 
-with open('./fatwa_data/raw_fatwas.json', 'r', encoding='utf-8') as f:
-    fatwas = json.load(f)
+# COPY text format: backslash escapes, \N for NULL; Postgres text cannot hold NUL
+_COPY_ESCAPES = {'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\0': ''}
+_COPY_SPECIAL_RE = re.compile(r'[\\\t\n\r\0]')
 
-# try:
-#     with psycopg2.connect(**db_params) as conn:
-#         with conn.cursor() as cur:
+def _copy_field(value):
+    if value is None:
+        return '\\N'
+    return _COPY_SPECIAL_RE.sub(lambda m: _COPY_ESCAPES[m.group()], str(value))
 
-#             cur.execute(create_table_script)
-            
-#             # Indexing
-#             cur.execute(create_index_script)
+def connect(dsn=None):
+    """Connection from `dsn`, DATABASE_URL, or the DB_* settings in .env."""
+    load_dotenv()
+    dsn = dsn or os.getenv('DATABASE_URL')
+    if dsn:
+        return psycopg2.connect(dsn)
+    return psycopg2.connect(
+        dbname=os.getenv('DB_NAME'),
+        user=os.getenv('DB_USER'),
+        password=os.getenv('DB_PASSWORD'),
+        host=os.getenv('DB_HOST'),
+        port=os.getenv('DB_PORT')
+    )
 
-#             # Insertion
-#             execute_values(cur, insert_entry_script, [
-#                 (f.get('url'), f.get('question'), f.get('answer'), f.get('category'))
-#                 for f in fatwas
-#                 if f.get('url') and f.get('question') and f.get('answer')
-#             ])
+def copy_rows(rows):
+    """`rows` as a COPY text-format stream."""
+    buf = io.StringIO()
+    for row in rows:
+        buf.write('\t'.join(map(_copy_field, row)))
+        buf.write('\n')
+    buf.seek(0)
+    return buf
 
-#             conn.commit()
-#             print(f'Successfully loaded {len(fatwas)} fatwas into database')
- 
-# except Exception as e:
-#     print(f'Error: {e}')
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
+def load(conn, records, chunk_size=CHUNK_SIZE, progress=True):
+    """Merge `records` into `fatwas`; returns {'added', 'changed', 'unchanged', 'skipped', 'seconds'}."""
+    stats = dict.fromkeys(('added', 'changed', 'unchanged', 'skipped'), 0)
+    start = time.time()
+    with conn.cursor() as cur:
+        cur.execute(create_table_script)
+        cur.execute(create_staging_script)
+        cur.execute('SELECT url, content_hash FROM fatwas')
+        stored = dict(cur.fetchall())
+        conn.commit()
 
-# ====== check data is saved ==========
+        def rows():
+            for f in records:
+                if not (f.get('url') and f.get('question') and f.get('answer')):
+                    stats['skipped'] += 1   # failed scrape
+                    continue
+                content_hash = content_hash_of(f)
+                if stored.get(f['url']) == content_hash:
+                    stats['unchanged'] += 1
+                    continue
+                yield (f['url'], f['question'], f['answer'], f.get('category'), content_hash)
 
-conn = psycopg2.connect(
-    dbname=os.getenv('DB_NAME'),
-    user=os.getenv('DB_USER'),
-    password=os.getenv('DB_PASSWORD'),
-    host=os.getenv('DB_HOST'),
-    port=os.getenv('DB_PORT')
-)
-cur = conn.cursor()
-cur.execute("SELECT question FROM fatwas LIMIT 5;")
-for row in cur.fetchall():
-    print(row[0])
\ No newline at end of file
+        for chunk in _chunks(rows(), chunk_size):
+            cur.copy_expert(copy_script, copy_rows(chunk))
+            cur.execute(merge_script)
+            added, changed = cur.fetchone()
+            conn.commit()
+            stats['added'] += added
+            stats['changed'] += changed
+            stats['unchanged'] += len(chunk) - added - changed
+            if progress:
+                done = stats['added'] + stats['changed'] + stats['unchanged']
+                print(f"   📥 {done} rows processed, {done / (time.time() - start):.0f} rows/s")
+    stats['seconds'] = time.time() - start
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Load the fatwa corpus into Postgres")
+    parser.add_argument('command', choices=['load', 'check'])
+    parser.add_argument('--store', default=DEFAULT_PATH, help="load: corpus store to read")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="rows per COPY + merge transaction")
+    parser.add_argument('--dsn', help="connection URL (default: DATABASE_URL, then DB_* in .env)")
+    args = parser.parse_args()
+
+    conn = connect(args.dsn)
+    try:
+        if args.command == 'load':
+            stats = load(conn, CorpusStore(args.store).iter_latest(), args.chunk_size)
+            rows = stats['added'] + stats['changed'] + stats['unchanged']
+            print(f"✅ Loaded {args.store} in {stats['seconds']:.1f}s ({rows / max(stats['seconds'], 1e-9):.0f} rows/s): "
+                  f"{stats['added']} added, {stats['changed']} changed, {stats['unchanged']} unchanged, "
+                  f"{stats['skipped']} failed scrapes skipped")
+        else:
+            with conn.cursor() as cur:
+                cur.execute("SELECT count(*) FROM fatwas;")
+                print(f"📚 {cur.fetchone()[0]} fatwas in the database")
+                cur.execute("SELECT question FROM fatwas LIMIT 5;")
+                for row in cur.fetchall():
+                    print(f"   {row[0]}")
+    finally:
+        conn.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Per-document zstd compression with a dictionary trained on the corpus.
+
+Fatwas are short and full of the same long phrases (the tasmiya and answer
+opener, the closing formula, honorifics, recurring citations), so compressing
+each one on its own wastes most of what zstd could find, while compressing
+the whole corpus as one stream loses random access. A dictionary trained on a
+sample of the documents gives each frame that shared context up front: a
+fatwa still decompresses on its own, in microseconds, at close to whole-file
+ratios.
+
+The dictionary is stored next to the data it was trained for (mmap_docstore's
+docs.zdict, corpus_pack's records.zdict); an empty one means plain frames,
+which is what a corpus too small to train on gets.
+
+Usage:
+    from doc_compression import DocCodec
+    codec = DocCodec.trained(entries)        # entries: list of bytes
+    frames = [codec.compress(e) for e in entries]
+    path.write_bytes(codec.dictionary)
+    ...
+    DocCodec(path.read_bytes()).decompress(frames[i])
+
+Needs the zstandard package; writers fall back to storing documents
+uncompressed without it.
+"""
+
+import threading
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+LEVEL = 9
+DICT_SIZE = 112 * 1024
+SAMPLE_BYTES = 16 * 1024 * 1024     # zstd wants ~100x the dictionary size to train on
+MIN_SAMPLES = 64
+
+def available():
+    return zstandard is not None
+
+def _require():
+    if zstandard is None:
+        raise ImportError("zstd document compression needs the zstandard package")
+
+def sample(entries, limit=SAMPLE_BYTES):
+    """Entries spread evenly over `entries` (a list), up to `limit` bytes in all."""
+    total = sum(len(e) for e in entries)
+    step = max(1, -(-total // limit))
+    return entries[::step]
+
+def train_dictionary(samples, dict_size=DICT_SIZE, level=LEVEL):
+    """Dictionary bytes trained on `samples`, or b'' when there is too little to train on."""
+    _require()
+    samples = [s for s in samples if s]
+    if len(samples) < MIN_SAMPLES:
+        return b''
+    try:
+        return zstandard.train_dictionary(dict_size, samples, level=level).as_bytes()
+    except zstandard.ZstdError:
+        return b''
+
+class DocCodec:
+    """Compress / decompress single documents against one dictionary.
+
+    zstandard's (de)compressor contexts must not be shared between threads,
+    and Streamlit serves each session from its own, so each thread gets its own.
+    """
+
+    def __init__(self, dictionary=b'', level=LEVEL):
+        _require()
+        self.dictionary = bytes(dictionary)
+        self.level = level
+        self._dict = zstandard.ZstdCompressionDict(self.dictionary) if self.dictionary else None
+        self._local = threading.local()
+
+    @classmethod
+    def trained(cls, entries, dict_size=DICT_SIZE, level=LEVEL):
+        return cls(train_dictionary(sample(entries), dict_size, level), level)
+
+    def compress(self, data):
+        cctx = getattr(self._local, 'cctx', None)
+        if cctx is None:
+            cctx = self._local.cctx = zstandard.ZstdCompressor(level=self.level, dict_data=self._dict)
+        return cctx.compress(data)
+
+    def decompress(self, data):
+        dctx = getattr(self._local, 'dctx', None)
+        if dctx is None:
+            dctx = self._local.dctx = zstandard.ZstdDecompressor(dict_data=self._dict)
+        return dctx.decompress(data)
@@ -1,5 +1,7 @@
 """
-1. Load JSON → 9,659 fatwa objects (question, answer, category, url)
+1. Stream JSONL corpus → 9,659 fatwa objects (question, answer, category, url)
+   (re-running later only embeds fatwas whose content_hash is new or changed,
+    tracked in manifest.json, saved in the same index version as the vectors)
 
 2. Create Documents → Each fatwa becomes a Document object with:
    - page_content: cleaned question + answer text
@@ -28,7 +30,9 @@
 
 8. Package as LangChain Vectorstore →
    - Bundles: FAISS index + Docstore + Mapping + Embedding model
-   - Saves to disk as 'fatwa_index/'
+   - Saves to disk as 'fatwa_index/': index.faiss plus the docstore as one
+     UTF-8 blob + offsets (docs.bin, docs.offsets), which the apps memory-map
+     instead of unpickling (see mmap_docstore.py)
 
 🔍 HOW SEARCH WORKS:
 ------------------
@@ -52,7 +56,8 @@ Order is SACRED - never shuffle, always preserve array positions!
 
 OUTPUT FILES:
 --------------
-- fatwa_embeddings.npy (raw vectors, reusable for other experiments)
+- fatwa_embeddings.npy (raw vectors in FAISS position order, reusable for other
+  experiments; rewritten from the index after an incremental update)
 - fatwa_index/ (LangChain vectorstore for production use)
 - checkpoint files (for resuming if interrupted)
 
@@ -61,14 +66,94 @@ OUTPUT FILES:
 
 import os
 
+from corpus_store import CorpusStore
+from mmap_docstore import load_manifest  # {url: {"hash", "id"}} of indexed fatwas
+from state_store import content_hash_of
+from text_normalizer import document_text  # cleaned question + answer ('embed' profile)
+
+INDEX_DIR = "fatwa_index"
+EMBEDDINGS_PATH = "fatwa_embeddings.npy"
+SNAPSHOT_PATH = "./fatwa_data/fatwas.parquet"               # read instead of the JSONL store when current
+
+def load_corpus():
+    corpus = CorpusStore('./fatwa_data/raw_fatwas.jsonl')
+    records = corpus.iter_latest()
+    if os.path.exists(SNAPSHOT_PATH):
+        # columnar snapshot (corpus_snapshot.py), when it is up to date with the store
+        from corpus_snapshot import is_current, iter_snapshot
+        if is_current(SNAPSHOT_PATH, corpus):
+            records = iter_snapshot(SNAPSHOT_PATH, columns=['url', 'category', 'question', 'answer', 'content_hash'])
+    return [q for q in records
+            if q.get('question') and q.get('answer')]  # skip failed scrapes from older runs
+
+def save_embeddings(index):
+    """Rewrite fatwa_embeddings.npy from `index`, position for position."""
+    import numpy as np
+    tmp = EMBEDDINGS_PATH + '.tmp'
+    with open(tmp, 'wb') as f:
+        np.save(f, index.reconstruct_n(0, index.ntotal))
+    os.replace(tmp, EMBEDDINGS_PATH)
+
 print("="*80)
 print("VECTOR STORE BUILDER")
 print("="*80)
 
-if os.path.exists("fatwa_index"):
+manifest = load_manifest(INDEX_DIR) if os.path.exists(INDEX_DIR) else None
+
+if os.path.exists(INDEX_DIR) and manifest is None:
     print("\n✅ Vector index already exists. Skipping embedding generation.")
+    print("   It predates content hashes, so it cannot be updated incrementally.")
     print("   Delete 'fatwa_index' folder to rebuild from scratch.\n")
 
+elif os.path.exists(INDEX_DIR):
+    # =====================================================
+    # Incremental update: only new or changed fatwas
+    # =====================================================
+    records = load_corpus()
+    changed = [q for q in records if manifest.get(q['url'], {}).get('hash') != content_hash_of(q)]
+
+    if not changed:
+        print(f"\n✅ Vector index is up to date ({len(manifest)} fatwas). Nothing to embed.\n")
+    else:
+        print(f"\n🔄 Updating index: {len(changed)} new or changed fatwas "
+              f"({sum(1 for q in changed if q['url'] in manifest)} changed)\n")
+
+        from langchain_huggingface import HuggingFaceEmbeddings
+        from tqdm import tqdm
+        from mmap_docstore import load_for_update, save_vectorstore
+
+        embedding_model = HuggingFaceEmbeddings(model_name="intfloat/multilingual-e5-large")
+        vectorstore = load_for_update(INDEX_DIR, embedding_model)
+
+        # old vectors of the changed fatwas, found by URL among the ids actually in the
+        # index, so a manifest that is out of step with it cannot fail the delete
+        changed_urls = {q['url'] for q in changed}
+        stale = [doc_id for doc_id in vectorstore.index_to_docstore_id.values()
+                 if vectorstore.docstore.search(doc_id).metadata['url'] in changed_urls]
+        if stale:
+            vectorstore.delete(stale)
+
+        next_id = max((int(i) for i in vectorstore.index_to_docstore_id.values()), default=-1) + 1
+        ids = [str(next_id + n) for n in range(len(changed))]
+        texts = [document_text(q) for q in changed]
+
+        BATCH_SIZE = 12
+        embeddings = []
+        for i in tqdm(range(0, len(texts), BATCH_SIZE), desc='   Embedding batches', unit='batch'):
+            embeddings.extend(embedding_model.embed_documents(texts[i:i+BATCH_SIZE]))
+
+        vectorstore.add_embeddings(
+            text_embeddings=list(zip(texts, embeddings)),
+            metadatas=[{'category': q['category'], 'url': q['url']} for q in changed],
+            ids=ids,
+        )
+        for q, doc_id in zip(changed, ids):
+            manifest[q['url']] = {'hash': content_hash_of(q), 'id': doc_id}
+        # the .npy first: if the save below never happens, the next run redoes this update
+        save_embeddings(vectorstore.index)
+        save_vectorstore(vectorstore, INDEX_DIR, manifest=manifest)  # index and manifest in one version
+        print(f"   ✅ Index now holds {vectorstore.index.ntotal} vectors\n")
+
 else:
     print("\n🚀 Starting vector store creation process...\n")
     
@@ -76,25 +161,12 @@ else:
     from langchain_huggingface import HuggingFaceEmbeddings
     from langchain_community.vectorstores import FAISS as LC_FAISS
     from langchain_community.docstore.in_memory import InMemoryDocstore
-    import re
-    import unicodedata
-    import ijson
     from tqdm import tqdm
+    from mmap_docstore import save_vectorstore
     import numpy as np
     import faiss
     import time
 
-    ANSWER_START = 'بِسْمِ اللہِ الرَّحْمٰنِ الرَّحِیْمِ اَلْجَوَابُ بِعَوْنِ الْمَلِکِ الْوَھَّابِ'
-    ANSWER_END   = 'وَاللہُ اَعْلَمُ عَزَّوَجَلَّ وَرَسُوْلُہ اَعْلَم صَلَّی اللہُ تَعَالٰی عَلَیْہِ وَاٰلِہٖ وَسَلَّم'
-
-    def clean_text(text: str) -> str:
-        text = unicodedata.normalize("NFC", text)
-        text = text.replace(ANSWER_START, '')
-        text = text.replace(ANSWER_END, '')
-        text = re.sub(r'[\u064B-\u065F\u0670\u06D6-\u06ED]', '', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
-
     # =====================================================
     # STEP 1: Load Embedding Model
     # =====================================================
@@ -109,20 +181,17 @@ else:
     # =====================================================
     # STEP 2: Load and Process Documents
     # =====================================================
-    print("📂 STEP 2: Loading raw fatwa data...")
-    
-    with open('./fatwa_data/raw_fatwas.json', 'r', encoding='utf-8') as f:
-        data = list(ijson.items(f, 'item'))
+    print("📂 STEP 2: Streaming raw fatwa data...")
     
-    print(f"   ✅ Loaded {len(data)} raw fatwas")
+    records = load_corpus()
     
     print("   🔄 Creating document objects...")
     docs = [
         Document(
-            page_content=f"سوال:\n{clean_text(q['question'])}\n\nجواب:\n{clean_text(q['answer'])}", 
+            page_content=document_text(q), 
             metadata={'category': q['category'], 'url': q['url']}
         )
-        for q in data
+        for q in records
     ]
     
     print(f"   ✅ Created {len(docs)} document objects\n")
@@ -240,8 +309,9 @@ else:
     
     # Save vectorstore
     print("   💾 Saving vector store to disk...")
-    vectorstore.save_local("fatwa_index")
-    print("   ✅ Saved to: fatwa_index/\n")
+    save_vectorstore(vectorstore, INDEX_DIR,
+                     manifest={q['url']: {'hash': content_hash_of(q), 'id': str(i)} for i, q in enumerate(records)})
+    print("   ✅ Saved to: fatwa_index/ (with manifest.json for incremental updates)\n")
 
 
     # =====================================================
@@ -263,5 +333,6 @@ else:
     print("   • Dimension: 1,024")
     
     print("\n🚀 Ready to use! Load with:")
-    print("   vectorstore = FAISS.load_local('fatwa_index', embedding_model)")
+    print("   from vector_backend import load_vectorstore")
+    print("   vectorstore = load_vectorstore('fatwa_index', embedding_model)")
     print("="*80 + "\n")
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+Failure ledger: which fatwa URLs failed, why, and when to try them again.
+
+Failed scrapes are not written to the corpus. Instead each failing URL gets
+an entry in fatwa_data/failures.json:
+
+    {url: {error_class, error, status, attempts, first_failed_at,
+           last_failed_at, next_retry_at}}
+
+error_class is one of
+    network      connection errors, timeouts, TLS failures
+    http_status  the origin answered with a non-200 status
+    parse        the page came back but captureDiv / Q&A markers were missing
+
+Retries back off exponentially (base_delay * 2^(attempts-1), capped at
+max_delay, +-20% jitter). After max_attempts an entry stays in the ledger
+with next_retry_at = None so it can be inspected or forced, but is no longer
+scheduled. A later success removes the entry.
+"""
+
+from pathlib import Path
+import json
+import os
+import random
+import threading
+import time
+
+import requests
+
+class HttpStatusError(Exception):
+    def __init__(self, url, status):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+
+class ParseError(ValueError):
+    pass
+
+def classify_error(exc):
+    """(error_class, status) for an exception raised while scraping a fatwa."""
+    if isinstance(exc, HttpStatusError):
+        return 'http_status', exc.status
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError)):
+        return 'network', None
+    if isinstance(exc, requests.RequestException):
+        return 'network', getattr(exc.response, 'status_code', None)
+    if isinstance(exc, ValueError):
+        return 'parse', None
+    return 'unknown', None
+
+def failure_record(url, exc=None, message=None, error_class=None, status=None):
+    """The record shape `scrape_single_fatwa` has always returned on failure."""
+    if exc is not None:
+        error_class, status = classify_error(exc)
+        message = str(exc)
+    return {'url': url, 'error': message, 'error_class': error_class or 'unknown',
+            'status': status, 'question': None, 'answer': None}
+
+class FailureLedger:
+    def __init__(self, path, base_delay=60, max_delay=24 * 3600, max_attempts=8):
+        self.path = Path(path)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self.entries = {}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def _backoff(self, attempts):
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+        return delay * random.uniform(0.8, 1.2)
+
+    def record_failure(self, record, now=None):
+        now = now or time.time()
+        with self._lock:
+            entry = self.entries.get(record['url']) or {
+                'attempts': 0,
+                'first_failed_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)),
+            }
+            entry['attempts'] += 1
+            entry.update({
+                'error_class': record.get('error_class', 'unknown'),
+                'error': record.get('error'),
+                'status': record.get('status'),
+                'last_failed_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)),
+                'next_retry_at': (now + self._backoff(entry['attempts'])
+                                  if entry['attempts'] < self.max_attempts else None),
+            })
+            self.entries[record['url']] = entry
+
+    def record_success(self, url):
+        with self._lock:
+            self.entries.pop(url, None)
+
+    def record(self, record):
+        if record.get('error') or record.get('question') is None:
+            self.record_failure(record)
+        else:
+            self.record_success(record['url'])
+
+    def urls(self):
+        with self._lock:
+            return set(self.entries)
+
+    def due(self, now=None, force=False):
+        """URLs whose retry time has passed (all ledger URLs when `force`)."""
+        now = now or time.time()
+        with self._lock:
+            return [url for url, e in self.entries.items()
+                    if force or (e['next_retry_at'] is not None and e['next_retry_at'] <= now)]
+
+    def stats(self):
+        with self._lock:
+            by_class = {}
+            for e in self.entries.values():
+                by_class[e['error_class']] = by_class.get(e['error_class'], 0) + 1
+            return {
+                'failed': len(self.entries),
+                'abandoned': sum(1 for e in self.entries.values() if e['next_retry_at'] is None),
+                'by_class': by_class,
+            }
+
+    def save(self):
+        with self._lock:
+            data = json.dumps(self.entries, ensure_ascii=False, indent=2)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp, self.path)
@@ -0,0 +1,49 @@
+"""
+Category slugs of the fatwa site (the /ur/fatawa/<slug> listings), in site order.
+
+Shared by the crawler (cdn_extracter.py), the stand-in site (fixture_server.py)
+and the search UI, so the apps do not import the crawler for them.
+"""
+
+CATEGORIES = [
+    'quran-aur-hadees',
+    'aqaid',
+    'mamoolat-e-ahlesunnat',
+    'taharat-ke-masail',
+    'namaz',
+    'mayyat',
+    'roza',
+    'zakat-aur-ushr',
+    'hajj-aur-umrah',
+    'qurbani-aur-aqeeqah',
+    'mukhtasar-jawabat',
+    'bachon-ke-naam',
+    'mahnama-ahkam-e-tijarat',
+    'masnoon-duayein',
+    'zibah-aur-shikar',
+    'qasam-aur-mannat',
+    'nikah',
+    'talaq',
+    'razaat',
+    'iddat',
+    'khareed-o-farokht',
+    'shirkat',
+    'muzaribat',
+    'ijarah',
+    'qarz-hiba-rahan',
+    'waqf',
+    'wirasat-aur-tarka',
+    'luqatah',
+    'saza-o-qaza',
+    'halal-haram',
+    'sunnatain-aur-adab',
+    'gunah',
+    'huqooq-ul-ibad',
+    'fazail-o-seerat',
+    'auraton-ke-masail',
+    'kafir-aur-murtad',
+    'majlis-e-tehqiqat-e-shariah',
+    'iqtisad',
+    'sadqa',
+    'mutafariqat',
+]
@@ -0,0 +1,235 @@
+"""
+Embedded SQLite copy of the fatwa corpus with an FTS5 keyword index
+(fatwa_data/fatwas.db), for lookups without a Postgres server.
+
+    fatwas       one row per URL: url, category, slug, question, answer,
+                 content_hash, scraped_at
+    fatwas_fts   FTS5 over question / answer after text_normalizer's 'query'
+                 profile (no diacritics or boilerplate), rowid = fatwas.id
+
+The database is in WAL mode, so the Streamlit apps can read while a load is
+running. `load()` bulk-loads the scraper's corpus store in one transaction
+and only rewrites rows whose content_hash changed.
+
+Usage:
+    python fatwa_db.py load                      # from fatwa_data/raw_fatwas.jsonl
+    python fatwa_db.py search "نماز جنازہ" [-k 5] [--category namaz]
+    python fatwa_db.py stats
+
+    from fatwa_db import FatwaDB
+    db = FatwaDB()
+    db.search('روزہ نیت', k=5)          # [{'url', 'category', 'question', 'snippet', 'score'}, ..]
+    db.get(url)
+"""
+
+from pathlib import Path
+import argparse
+import re
+import sqlite3
+import threading
+import time
+
+from corpus_store import CorpusStore, DEFAULT_PATH
+from state_store import content_hash_of
+from text_normalizer import normalize
+
+DEFAULT_DB = Path('fatwa_data') / 'fatwas.db'
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS fatwas (
+    id           INTEGER PRIMARY KEY,
+    url          TEXT NOT NULL UNIQUE,
+    category     TEXT,
+    slug         TEXT,
+    question     TEXT,
+    answer       TEXT,
+    content_hash TEXT,
+    scraped_at   TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_fatwas_category ON fatwas(category);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS fatwas_fts USING fts5(
+    question, answer, tokenize = 'unicode61'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS fatwas_vocab USING fts5vocab(fatwas_fts, 'row');
+'''
+
+FIELDS = ('url', 'category', 'slug', 'question', 'answer', 'content_hash', 'scraped_at')
+TOKEN_RE = re.compile(r'\w+')
+
+# Ranking costs a few microseconds per matching fatwa, and words like ہے / کیا
+# match nearly all of them for almost no signal. Words in more than this share
+# of fatwas are left out of the MATCH; a query made only of such words is
+# matched on its rarest word, in the (short) questions only. Words missing from
+# the vocabulary count as rare: they may have been loaded since it was read.
+COMMON_TERM_SHARE = 0.02
+
+# question matches count double
+SEARCH_SQL = '''
+SELECT f.url, f.category, f.question,
+       {snippet} AS snippet,
+       rank AS score
+FROM fatwas_fts JOIN fatwas f ON f.id = fatwas_fts.rowid
+WHERE fatwas_fts MATCH ? AND rank MATCH 'bm25(2.0, 1.0)' {category}
+ORDER BY rank LIMIT ?
+'''
+
+def fts_query(tokens, mode='any', column=None):
+    """FTS5 MATCH expression for tokens, quoted, OR'd ('any') or AND'd ('all')."""
+    if not tokens:
+        return ''
+    expr = (' OR ' if mode == 'any' else ' ').join(f'"{t}"' for t in tokens)
+    return f'{column} : ({expr})' if column else expr
+
+class FatwaDB:
+    def __init__(self, path=DEFAULT_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self._doc_freq = None
+        self._data_version = None
+
+    # =================== loading ===============================================
+
+    def load(self, records):
+        """Upsert `records` (latest per URL); returns (added, changed, unchanged)."""
+        insert_sql = f'INSERT INTO fatwas ({", ".join(FIELDS)}) VALUES ({", ".join("?" * len(FIELDS))})'
+        update_sql = f'UPDATE fatwas SET {", ".join(f"{n} = ?" for n in FIELDS[1:])} WHERE id = ?'
+        fts_sql = 'INSERT INTO fatwas_fts (rowid, question, answer) VALUES (?, ?, ?)'
+
+        added = changed = unchanged = 0
+        with self._lock, self.conn:
+            known = {url: (id_, h) for id_, url, h in
+                     self.conn.execute('SELECT id, url, content_hash FROM fatwas')}
+            for record in records:
+                if not record.get('url') or record.get('question') is None:
+                    continue  # failed scrape
+                content_hash = content_hash_of(record)
+                row = [record.get(name) for name in FIELDS]
+                row[FIELDS.index('content_hash')] = content_hash
+
+                id_, stored_hash = known.get(record['url'], (None, None))
+                if id_ is not None and stored_hash == content_hash:
+                    unchanged += 1
+                    continue
+                if id_ is None:
+                    id_ = self.conn.execute(insert_sql, row).lastrowid
+                    added += 1
+                else:
+                    self.conn.execute(update_sql, (*row[1:], id_))
+                    self.conn.execute('DELETE FROM fatwas_fts WHERE rowid = ?', (id_,))
+                    changed += 1
+                self.conn.execute(fts_sql, (id_, normalize(record.get('question') or '', 'query'),
+                                            normalize(record.get('answer') or '', 'query')))
+                known[record['url']] = (id_, content_hash)
+            if added or changed:
+                self.conn.execute("INSERT INTO fatwas_fts (fatwas_fts) VALUES ('optimize')")
+                self._doc_freq = None
+        return added, changed, unchanged
+
+    def load_store(self, store=None):
+        return self.load((store or CorpusStore(DEFAULT_PATH)).iter_latest())
+
+    # =================== lookups ===============================================
+
+    def get(self, url):
+        with self._lock:
+            row = self.conn.execute('SELECT * FROM fatwas WHERE url = ?', (url,)).fetchone()
+        return dict(row) if row else None
+
+    def by_category(self, category, limit=50):
+        with self._lock:
+            rows = self.conn.execute('SELECT url, question FROM fatwas WHERE category = ? LIMIT ?',
+                                     (category, limit)).fetchall()
+        return [dict(r) for r in rows]
+
+    def doc_freq(self):
+        """{word: number of fatwas containing it}, from the FTS vocabulary.
+
+        Re-read when another connection has committed since (PRAGMA
+        data_version), e.g. a `python fatwa_db.py load` while an app keeps
+        this handle open; `load()` on this handle resets it itself.
+        """
+        with self._lock:
+            data_version = self.conn.execute('PRAGMA data_version').fetchone()[0]
+            if self._doc_freq is None or data_version != self._data_version:
+                self._indexed = self.conn.execute('SELECT COUNT(*) FROM fatwas').fetchone()[0]
+                self._doc_freq = dict(self.conn.execute('SELECT term, doc FROM fatwas_vocab').fetchall())
+                self._data_version = data_version
+            return self._doc_freq
+
+    def match_expression(self, text, mode='any'):
+        """FTS5 MATCH for free text: its indexed words, minus common ones (see COMMON_TERM_SHARE)."""
+        doc_freq = self.doc_freq()
+        tokens = list(dict.fromkeys(t.lower() for t in TOKEN_RE.findall(normalize(text, 'query'))))
+        limit = max(1, self._indexed * COMMON_TERM_SHARE)
+        rare = [t for t in tokens if doc_freq.get(t, 0) <= limit]
+        if rare or not tokens:
+            return fts_query(rare, mode)
+        return fts_query([min(tokens, key=doc_freq.get)], column='question')
+
+    def search(self, text, k=10, category=None, mode='any', snippets=True):
+        """Best `k` keyword matches for `text` by BM25, optionally within one category.
+
+        `snippets` adds a highlighted excerpt of the answer, which costs more
+        than the lookup itself on long fatwas.
+        """
+        match = self.match_expression(text, mode)
+        if not match:
+            return []
+        sql = SEARCH_SQL.format(
+            snippet="snippet(fatwas_fts, 1, '[', ']', '…', 16)" if snippets else 'NULL',
+            category='AND f.category = ?' if category else '')
+        params = (match, category, k) if category else (match, k)
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [dict(r) for r in rows]
+
+    def categories(self):
+        with self._lock:
+            rows = self.conn.execute(
+                'SELECT category, COUNT(*) FROM fatwas GROUP BY category ORDER BY 2 DESC').fetchall()
+        return {category: n for category, n in rows}
+
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute('SELECT COUNT(*) FROM fatwas').fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite fatwa corpus with FTS5 keyword search")
+    parser.add_argument('command', choices=['load', 'search', 'stats'])
+    parser.add_argument('query', nargs='?')
+    parser.add_argument('-k', type=int, default=5)
+    parser.add_argument('--category')
+    parser.add_argument('--all', action='store_true', help="search: require every word")
+    parser.add_argument('--db', default=DEFAULT_DB)
+    parser.add_argument('--store', default=DEFAULT_PATH, help="load: corpus store to read")
+    args = parser.parse_args()
+
+    db = FatwaDB(args.db)
+    if args.command == 'load':
+        start = time.time()
+        added, changed, unchanged = db.load_store(CorpusStore(args.store))
+        print(f"✅ Loaded {args.store} into {db.path} in {time.time() - start:.1f}s: "
+              f"{added} added, {changed} changed, {unchanged} unchanged")
+    elif args.command == 'search':
+        start = time.perf_counter()
+        results = db.search(args.query or '', args.k, args.category, 'all' if args.all else 'any')
+        print(f"🔎 {len(results)} results in {(time.perf_counter() - start) * 1000:.2f} ms")
+        for r in results:
+            print(f"   {r['score']:7.2f}  [{r['category']}] {r['url']}\n            {r['snippet']}")
+    else:
+        print(f"📚 {len(db)} fatwas in {db.path}")
+        for category, n in db.categories().items():
+            print(f"   {n:6d}  {category}")
+
+if __name__ == '__main__':
+    main()
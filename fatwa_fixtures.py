@@ -0,0 +1,80 @@
+"""
+Synthetic fatwa pages for benchmarks and offline runs.
+
+Pages mimic the fatwaqa.com layout: a heavy <head>, navigation, and the
+`captureDiv` holding the title, question, tasmiya + answer opener, answer
+body and closing formula. Content is deterministic in the page index.
+
+`load_fixture_pages(dir)` reads real saved pages (*.html) instead, when you
+have some on disk.
+
+`synthetic_listing_page(category, page)` mimics a category listing as the
+XHR endpoint returns it: JSON-wrapped HTML with `\"` and `\/` escapes.
+"""
+
+from pathlib import Path
+import json
+import random
+
+QUESTION_TITLE = 'دَارُالْاِفْتَاء اَہْلسُنَّت'
+ANSWER_OPENER = 'بِسْمِ اللہِ الرَّحْمٰنِ الرَّحِیْمِ اَلْجَوَابُ بِعَوْنِ الْمَلِکِ الْوَھَّابِ'
+ANSWER_CLOSER = 'وَاللہُ اَعْلَمُ عَزَّوَجَلَّ وَرَسُوْلُہ اَعْلَم صَلَّی اللہُ تَعَالٰی عَلَیْہِ وَاٰلِہٖ وَسَلَّم'
+
+WORDS = ['نماز', 'روزہ', 'زکوٰۃ', 'حج', 'وضو', 'غسل', 'مسجد', 'امام', 'سنت', 'فرض', 'واجب',
+         'مستحب', 'حدیث', 'قرآن', 'اللہ', 'رسول', 'صَلَّی', 'علیہ', 'کے', 'میں', 'ہے', 'کہ', 'اور',
+         'یہ', 'وہ', 'کیا', 'نہیں', 'جائز', 'ناجائز', 'مکروہ', 'شریعت', 'مسئلہ', 'فرماتے']
+
+HEAD = ('<head><meta charset="utf-8"><title>Fatwa</title>'
+        + ''.join(f'<link rel="stylesheet" href="/css/{i}.css">' for i in range(20))
+        + '<script>' + 'var x = 1;' * 800 + '</script></head>')
+NAV = '<nav><div class="menu">' + ''.join(f'<div><a href="/ur/fatawa/c{i}">زمرہ {i}</a></div>' for i in range(40)) + '</div></nav>'
+FOOTER = '<footer><div>' + 'حقوق محفوظ ہیں ' * 50 + '</div></footer><script>' + 'track();' * 400 + '</script>'
+
+def _sentences(rng, count):
+    out = []
+    for _ in range(count):
+        out.append(' '.join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))) + '۔')
+    return out
+
+def synthetic_fatwa_page(index, answer_paragraphs=None):
+    rng = random.Random(index)
+    paragraphs = answer_paragraphs or rng.randint(4, 30)
+    question = ' '.join(_sentences(rng, rng.randint(1, 4)))
+    answer = ''.join(f'<p>{p}&nbsp;<b>{rng.choice(WORDS)}</b></p>' for p in _sentences(rng, paragraphs))
+    capture = (
+        '<div id="captureDiv" class="fatwa">'
+        f'<div class="title"><h2>{QUESTION_TITLE}</h2></div>'
+        f'<div class="question"><h3>سوال</h3><p>کیا فرماتے ہیں علمائے دین اس مسئلے میں کہ {question}</p></div>'
+        '<!-- answer -->'
+        f'<div class="answer"><h3>جواب</h3><p>{ANSWER_OPENER}</p>{answer}'
+        f'<p>{ANSWER_CLOSER}</p></div>'
+        '</div>'
+    )
+    return f'<!DOCTYPE html><html lang="ur">{HEAD}<body>{NAV}<main>{capture}</main>{FOOTER}</body></html>'
+
+LISTING_PAGE_SIZE = 12
+
+def synthetic_listing_page(category, page, total=100, per_page=LISTING_PAGE_SIZE,
+                           base='https://www.fatwaqa.com/ur/fatawa'):
+    """Listing page `page` (1-based) of a category with `total` fatwas, newest first."""
+    rng = random.Random(f'{category}/{page}')
+    first = (page - 1) * per_page
+    items = ''.join(
+        f'<div class="card"><a href="{base}/{category}/fatwa-{total - i}" class="card-link">'
+        f'<h4>{" ".join(rng.choice(WORDS) for _ in range(6))} &amp; {i}</h4></a>'
+        f'<a href="{base}/{category}/fatwa-{total - i}#share" data-href="/ur/share">شیئر</a></div>'
+        for i in range(first, min(first + per_page, total)))
+    fragment = (
+        '<div class="list">'
+        f'<!-- <a href="{base}/{category}/draft">draft</a> -->'
+        f'{items}'
+        f'<div class="pager"><a href="{base}/{category}?page={page + 1}">اگلا</a></div>'
+        f'<script>var next = "<a href=\'{base}/{category}/in-script\'>";</script>'
+        '</div>'
+    )
+    return json.dumps({'html': fragment, 'page': page}, ensure_ascii=False).replace('/', '\\/')
+
+def load_fixture_pages(directory=None, count=200):
+    if directory:
+        return [p.read_text(encoding='utf-8') for p in sorted(Path(directory).glob('*.html'))]
+    return [synthetic_fatwa_page(i) for i in range(count)]
@@ -1,62 +1,126 @@
 from pathlib import Path
-import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import urlparse
+import asyncio
 import re
-import requests
-import unicodedata
 import time
 from bs4 import BeautifulSoup
 import traceback
 
+from corpus_store import CorpusStore
+from failure_ledger import FailureLedger, HttpStatusError, ParseError, failure_record
+from html_cache import HtmlCache
+from http_client import HttpClient, get_client
+from metrics import MetricsRecorder, get_metrics
+from state_store import StateStore, content_hash_of, record_hash
+from text_normalizer import normalize
+from url_registry import url_fields
+
 class FatwaDataManager:
-    def __init__(self, data_dir='fatwa_data'):
+    def __init__(self, data_dir='fatwa_data', fsync_every=50):
 
         self.data_dir = Path(data_dir)
-        self.data_dir.mkdir(exist_ok=True)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+
+        self.raw_data_file = self.data_dir / "raw_fatwas.jsonl"
+        self.legacy_raw_data_file = self.data_dir / "raw_fatwas.json"
+
+        self.failures = FailureLedger(self.data_dir / "failures.json")
+        self.html_cache = HtmlCache(self.data_dir / "html_cache")
+        self.store = CorpusStore(self.raw_data_file, fsync_every=fsync_every)
+        if self.legacy_raw_data_file.exists() and not self.raw_data_file.exists():
+            count = self.store.migrate_legacy_json(self.legacy_raw_data_file)
+            print(f"📦 Migrated {count} records from {self.legacy_raw_data_file.name}")
+
+        self.state = StateStore(self.data_dir / "state.db")
+        if self.state.is_empty() and self.raw_data_file.exists():
+            count = self.state.import_existing(self.store.iter_records(), self.failures.urls())
+            print(f"📦 Imported {count} URLs into {self.state.path.name}")
+
+    def save_raw_data(self, new_records):
+        """Append the new or changed records of a batch and fsync the store.
+
+        Failed records go to the failure ledger instead of the corpus, so
+        downstream consumers only ever see fatwas with a question and answer.
+        A re-scraped record whose content hash matches the stored one is not
+        appended again. Returns the records that were appended.
+        """
+        metrics = get_metrics()
+        with metrics.timer('fatwa_stage_seconds', stage='save'):
+            for record in new_records:
+                self.failures.record(record)
+            ok = [r for r in new_records if not r.get('error')]
+            known = self.state.content_hashes(r['url'] for r in ok)
+            changed = [r for r in ok if known.get(r['url']) != content_hash_of(r)]
+            self.store.append_many(changed)
+            self.store.flush()
+            self.failures.save()
+            self.state.mark_results(new_records)
+
+        metrics.inc('fatwa_pages_total', len(changed), result='ok')
+        metrics.inc('fatwa_pages_total', len(ok) - len(changed), result='unchanged')
+        for record in new_records:
+            if record.get('error'):
+                metrics.inc('fatwa_pages_total', result='failed')
+                metrics.inc('fatwa_errors_total', error_class=record.get('error_class', 'unknown'))
+        return changed
+
+    def iter_raw_data(self):
+        """Stream the latest record per URL without loading the corpus."""
+        return self.store.iter_latest()
 
-        self.raw_data_file = self.data_dir / "raw_fatwas.json"
-        self.progress_file = self.data_dir / "progress.json"
+    def load_raw_data(self):
+        return list(self.iter_raw_data())
 
-    def save_raw_data(self, data):
-        with open(self.raw_data_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def scraped_urls(self):
+        """URLs with a successful record in the corpus."""
+        return set(self.state.urls_with_status('done'))
 
-    def load_raw_data(self):
-        if self.raw_data_file.exists():
-            with open(self.raw_data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return []
-    
-    def save_progress(self, processed_count, total_count):
-        progress = {
-            'processed': processed_count,
-            'total': total_count,
-            'percentage': (processed_count / total_count * 100) if total_count > 0 else 0
-        }
-        with open(self.progress_file, 'w', encoding='utf-8') as f:
-            json.dump(progress, f, indent=2)
+    def pending_urls(self, urls):
+        """Registers `urls` and returns, in order, the ones still to scrape (not done, not
+        owned by the failure ledger). Pending URLs registered by other runs are left out."""
+        self.state.register(urls)
+        pending = set(self.state.pending())
+        return [u for u in urls if u in pending]
 
     def load_progress(self):
-        if self.progress_file.exists():
-            with open(self.progress_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {'processed': 0, 'total': 0}
+        return self.state.progress()
+
+    def print_progress(self):
+        p = self.state.progress()
+        print(f"💾 Progress saved ({p['done']}/{p['total']} done, {p['pending']} pending, {p['failed']} failed)")
     
 # =================== Scraper ================================================================
 
-def scrape_single_fatwa(url):
+def scrape_single_fatwa(url, client=None, cache=None):
+
+    try:
+        page_html = fetch_fatwa_page(url, client=client, cache=cache)
+    except Exception as e:
+        print(f"❌ Failed: {url} ({e})")
+        return failure_record(url, e)
+
+    return parse_fatwa_page(url, page_html)
 
+def parse_fatwa_page(url, page_html, metrics=None):
+    """CPU-only half of `scrape_single_fatwa`; safe to run in a process pool."""
+
+    metrics = metrics or get_metrics()
     try:
-        html = extract_fatwa_HTML(url)
-        if not html:
-            return {'url': url, 'error': 'No HTML found', 'question': None, 'answer': None}
+        with metrics.timer('fatwa_stage_seconds', stage='extract'):
+            text = extract_fatwa_text(page_html)
+        if text is None:
+            return failure_record(url, ParseError('No HTML found'))
 
-        text = extract_fatwa_data(html)
-        qa = extract_ques_ans(text)
+        with metrics.timer('fatwa_stage_seconds', stage='segment'):
+            qa = extract_ques_ans(text)
 
         fatwa_data = {
             'url': url,
+            **url_fields(url),
             'question': qa.get('question'),
             'answer': qa.get('answer'),
+            'content_hash': record_hash(qa),
             'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S')
         }
         print(f"✅ Scraped: {url}")
@@ -64,37 +128,246 @@ def scrape_single_fatwa(url):
 
     except Exception as e:
         print(f"❌ Failed: {url} ({e})")
-        traceback.print_exc()
-        return {'url': url, 'error': str(e), 'question': None, 'answer': None}
+        if not isinstance(e, ValueError):
+            traceback.print_exc()
+        return failure_record(url, e)
  
-def scrape_fatwas_batch(urls, start_idx=0, save_every=10, delay=1):
-
-    data_manager = FatwaDataManager()
-    all_fatwas = data_manager.load_raw_data()
-    existing_urls = {f['url'] for f in all_fatwas}
-    urls_to_scrape = [u for u in urls[start_idx:] if u not in existing_urls]
+def parse_fatwa_page_timed(url, page_html):
+    """`parse_fatwa_page` for a process pool: (record, observations) for the parent's `metrics.merge`."""
+    recorder = MetricsRecorder()
+    with recorder.timer('fatwa_stage_seconds', stage='parse'):
+        record = parse_fatwa_page(url, page_html, recorder)
+    return record, recorder.observations
+
+def scrape_fatwas_batch(urls, start_idx=0, save_every=10, delay=1, data_dir='fatwa_data', filter_pending=True):
+    """Scrape the pending ones of `urls`; with filter_pending=False, `urls` already come
+    from `FatwaDataManager.pending_urls` and are scraped as given."""
+    data_manager = FatwaDataManager(data_dir)
+    urls_to_scrape = data_manager.pending_urls(urls[start_idx:]) if filter_pending else list(urls[start_idx:])
 
     print(f"🚀 Starting: {len(urls_to_scrape)} new URLs to scrape.\n")
 
+    scraped, pending = [], []
     for i, url in enumerate(urls_to_scrape, start=1):
         print(f"Scraping {i}/{len(urls_to_scrape)}: {url}")
         
         # Scrape the fatwa
-        result = scrape_single_fatwa(url)
-        all_fatwas.append(result)
+        result = scrape_single_fatwa(url, cache=data_manager.html_cache)
+        scraped.append(result)
+        pending.append(result)
         
         # Periodically save data and progress
         if i % save_every == 0 or i == len(urls_to_scrape):
-            data_manager.save_raw_data(all_fatwas)
-            data_manager.save_progress(start_idx + i, len(urls))
-            print(f"💾 Progress saved ({i}/{len(urls_to_scrape)})")
+            data_manager.save_raw_data(pending)
+            pending = []
+            data_manager.print_progress()
         
         # Rate limiting - sleep between requests (except after last one)
-        if i < len(urls_to_scrape):
+        if delay and i < len(urls_to_scrape):
             time.sleep(delay)
 
-    print(f"\n🎉 Done! Scraped {len(all_fatwas)} total fatwas.")
-    return all_fatwas
+    get_client().print_timing_report()
+    print(f"\n🎉 Done! Scraped {len(scraped)} fatwas this run.")
+    return scraped
+
+# =================== Async scraper ==========================================================
+
+class RequestPacer:
+    """Spaces request starts so the crawl never exceeds `requests_per_second`."""
+
+    def __init__(self, requests_per_second):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.next_slot = 0.0
+        self.lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+async def _scrape_concurrently(urls, on_result, per_host_limit, requests_per_second,
+                               cache=None, rate_limiter=None):
+    client = HttpClient(pool_maxsize=per_host_limit, rate_limiter=rate_limiter)
+    executor = ThreadPoolExecutor(max_workers=per_host_limit)
+    pacer = RequestPacer(requests_per_second)
+    host_limits = {}
+    loop = asyncio.get_running_loop()
+
+    async def fetch(url):
+        host = urlparse(url).netloc
+        limit = host_limits.setdefault(host, asyncio.Semaphore(per_host_limit))
+        async with limit:
+            await pacer.wait()
+            return await loop.run_in_executor(executor, scrape_single_fatwa, url, client, cache)
+
+    try:
+        tasks = [asyncio.create_task(fetch(url)) for url in urls]
+        for i, task in enumerate(asyncio.as_completed(tasks), start=1):
+            on_result(i, await task)
+    finally:
+        executor.shutdown(wait=True)
+        client.print_timing_report()
+        client.close()
+
+def scrape_fatwas_async(urls, start_idx=0, save_every=10, per_host_limit=8, requests_per_second=10,
+                        rate_limiter=None, data_dir='fatwa_data', filter_pending=True):
+    """Concurrent counterpart of `scrape_fatwas_batch`.
+
+    Produces the same records and persists them through `FatwaDataManager`;
+    results are appended in completion order rather than URL order. With an
+    `AdaptiveRateLimiter`, pass requests_per_second=None and let it set the pace.
+    """
+    data_manager = FatwaDataManager(data_dir)
+    urls_to_scrape = data_manager.pending_urls(urls[start_idx:]) if filter_pending else list(urls[start_idx:])
+
+    print(f"🚀 Starting async: {len(urls_to_scrape)} new URLs "
+          f"({per_host_limit} per host, {requests_per_second or 'adaptive'} req/s).\n")
+
+    scraped, pending = [], []
+
+    def on_result(i, result):
+        nonlocal pending
+        scraped.append(result)
+        pending.append(result)
+        if i % save_every == 0 or i == len(urls_to_scrape):
+            data_manager.save_raw_data(pending)
+            pending = []
+            data_manager.print_progress()
+
+    if urls_to_scrape:
+        asyncio.run(_scrape_concurrently(urls_to_scrape, on_result, per_host_limit,
+                                         requests_per_second, data_manager.html_cache,
+                                         rate_limiter))
+
+    print(f"\n🎉 Done! Scraped {len(scraped)} fatwas this run.")
+    return scraped
+
+# =================== Offline re-parse =======================================================
+
+def _reparse_cached(job):
+    url, cache_root = job
+    cache = HtmlCache(cache_root)
+    record = parse_fatwa_page(url, cache.get(url))
+    record['scraped_at'] = cache.meta(url)['fetched_at']
+    return record
+
+def reparse_from_cache(workers=None, chunksize=16, data_dir='fatwa_data'):
+    """Rebuild raw_fatwas from the HTML cache across all cores, with no network.
+
+    Records whose page is cached are re-parsed in place; records without a
+    cached page are kept as they are, and cached pages missing from the store
+    are appended. A page that no longer parses keeps its previous record and
+    goes to the failure ledger.
+    """
+    data_manager = FatwaDataManager(data_dir)
+    cache = data_manager.html_cache
+    cached = set(cache.urls())
+    stored = [r['url'] for r in data_manager.iter_raw_data()]
+    stored_set = set(stored)
+    jobs = [u for u in stored if u in cached] + sorted(cached - stored_set)
+
+    print(f"♻️  Re-parsing {len(jobs)} cached pages ({len(stored_set - cached)} records without a cached page kept)")
+
+    results = []
+
+    def track(fresh):
+        data_manager.failures.record(fresh)
+        results.append(fresh)
+        if len(results) >= 500:
+            data_manager.state.mark_results(results)
+            results.clear()
+
+    def records(pool):
+        reparsed = pool.map(_reparse_cached, [(u, cache.root) for u in jobs], chunksize=chunksize)
+        for record in data_manager.iter_raw_data():
+            if record['url'] in cached:
+                fresh = next(reparsed)
+                track(fresh)
+                yield record if fresh.get('error') and not record.get('error') else fresh
+            else:
+                yield record
+        for fresh in reparsed:
+            track(fresh)
+            if not fresh.get('error'):
+                yield fresh
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        written = data_manager.store.rewrite(r for r in records(pool) if not r.get('error'))
+    data_manager.state.mark_results(results)
+    data_manager.failures.save()
+
+    print(f"\n🎉 Done! Rebuilt {written} records from cache.")
+    return written
+
+# =================== Retry failed =============================================================
+
+def retry_failed_fatwas(save_every=10, per_host_limit=8, requests_per_second=None,
+                        rate_limiter=None, force=False, data_dir='fatwa_data'):
+    """Concurrently re-scrape the failure ledger's URLs that are due for a retry."""
+    data_manager = FatwaDataManager(data_dir)
+    urls = data_manager.failures.due(force=force)
+    print(f"🔁 Retrying {len(urls)} failed URLs due now "
+          f"(ledger: {data_manager.failures.stats()}).\n")
+
+    scraped, pending = [], []
+
+    def on_result(i, result):
+        nonlocal pending
+        scraped.append(result)
+        pending.append(result)
+        if i % save_every == 0 or i == len(urls):
+            data_manager.save_raw_data(pending)
+            pending = []
+            print(f"💾 Retries saved ({i}/{len(urls)})")
+
+    if urls:
+        asyncio.run(_scrape_concurrently(urls, on_result, per_host_limit, requests_per_second,
+                                         data_manager.html_cache, rate_limiter))
+
+    recovered = sum(1 for r in scraped if not r.get('error'))
+    print(f"\n🎉 Done! Recovered {recovered}/{len(scraped)}; ledger now {data_manager.failures.stats()}")
+    return scraped
+
+# =================== Refresh =================================================================
+
+def refresh_fatwas(urls=None, save_every=10, per_host_limit=8, requests_per_second=None,
+                   rate_limiter=None, data_dir='fatwa_data'):
+    """Re-scrape already scraped URLs (all done ones by default) to pick up edits.
+
+    Pages in the HTML cache are revalidated with If-None-Match /
+    If-Modified-Since, and only records whose content hash changed are
+    appended to the store.
+    """
+    data_manager = FatwaDataManager(data_dir)
+    done = data_manager.state.urls_with_status('done')
+    if urls is not None:
+        wanted = set(urls)
+        done = [u for u in done if u in wanted]
+    print(f"🔄 Refreshing {len(done)} scraped URLs.\n")
+
+    scraped, pending, changed = [], [], []
+
+    def on_result(i, result):
+        nonlocal pending
+        scraped.append(result)
+        pending.append(result)
+        if i % save_every == 0 or i == len(done):
+            changed.extend(data_manager.save_raw_data(pending))
+            pending = []
+            print(f"💾 Refresh saved ({i}/{len(done)}, {len(changed)} changed)")
+
+    if done:
+        asyncio.run(_scrape_concurrently(done, on_result, per_host_limit, requests_per_second,
+                                         data_manager.html_cache, rate_limiter))
+
+    failed = sum(1 for r in scraped if r.get('error'))
+    print(f"\n🎉 Done! {len(changed)} changed, {len(scraped) - len(changed) - failed} unchanged, {failed} failed.")
+    return changed
 
 #  =============================== constants ============================================================
 
@@ -109,17 +382,58 @@ answer_title = 'جواب'
 ANSWER_START = 'بِسْمِ اللہِ الرَّحْمٰنِ الرَّحِیْمِ اَلْجَوَابُ بِعَوْنِ الْمَلِکِ الْوَھَّابِ'
 ANSWER_END = 'وَاللہُ اَعْلَمُ عَزَّوَجَلَّ وَرَسُوْلُہ اَعْلَم صَلَّی اللہُ تَعَالٰی عَلَیْہِ وَاٰلِہٖ وَسَلَّم'
 
+# Compiled once. segment_fatwa walks the text forward, searching each region
+# only for the marker that can end it; a merged alternation of all three was
+# measured ~2x slower than the old splits because 'ا' and 'و' start almost
+# every other word, so it attempts a match nearly everywhere.
+TASMIYA_RE = re.compile(tasmiya_pattern)
+QUESTION_TITLE_RE = re.compile(question_title)
+ANSWER_START_RE = re.compile(start_pattern)
+ANSWER_END_RE = re.compile(end_pattern)
+ANSWER_START_LITERAL = 'الجواب'  # every start_pattern match begins with this
+SEGMENT_ERRORS = {
+    'title': "Question title pattern not found",
+    'start': "Answer start pattern not found",
+    'end': "Answer end pattern not found",
+}
+
 # ===================================== utility functions ======================================
 
-def extract_fatwa_HTML(url):
+def fetch_fatwa_page(url, client=None, cache=None):
     headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
         "Accept-Language": "ur,en;q=0.9"
     }
 
-    res = requests.get(url, headers=headers, timeout=30)
+    # revalidate a cached copy instead of downloading it again
+    cached = cache.meta(url) if cache is not None else None
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    metrics = get_metrics()
+    res = (client or get_client()).get(url, headers=headers, timeout=30)
+    # network time only; waiting on the rate limiter is not counted
+    metrics.observe('fatwa_stage_seconds', res.timing.total, stage='fetch')
+    metrics.inc('fatwa_fetched_bytes_total', res.timing.bytes)
+    metrics.inc('fatwa_http_responses_total', status=res.status_code)
+
+    if res.status_code == 304 and cached:
+        return cache.get(url)
     res.encoding = "utf-8"
-    soup = BeautifulSoup(res.text, "html.parser")
+    if res.status_code != 200:
+        raise HttpStatusError(url, res.status_code)
+    if cache is not None:
+        with metrics.timer('fatwa_stage_seconds', stage='cache'):
+            cache.put_response(url, res)
+    return res.text
+
+def extract_fatwa_HTML(url, client=None):
+    return extract_capture_div(fetch_fatwa_page(url, client=client))
+
+def extract_capture_div(page_html):
+    soup = BeautifulSoup(page_html, "html.parser")
 
     capture_div = soup.find("div", id="captureDiv")
 
@@ -133,41 +447,126 @@ def extract_fatwa_data(html_content):
    
    soup = BeautifulSoup(html_content , 'html.parser')
 
-   text = soup.get_text()
-   # Replace non-breaking spaces and weird unicode spaces
-   text = text.replace('\xa0', ' ').replace('\u200c', '').replace('\u200f', '')
-   # Replace multiple newlines and tabs with a single space
-   text = re.sub(r'[\r\n\t]+', ' ', text)
-   # Replace multiple spaces with one
-   text = re.sub(r'\s+', ' ', text)
-   
-   text = unicodedata.normalize("NFD", text)
-   # Remove all combining marks (Arabic harakat)
-   text = re.sub(r'[\u064B-\u0652]', '', text, flags=re.UNICODE)
-   
-   return unicodedata.normalize("NFC", text)
+   return normalize_fatwa_text(soup.get_text())
+
+def normalize_fatwa_text(text):
+   # NBSP / ZWNJ / RLM, harakat and whitespace runs in one pass (see text_normalizer)
+   return normalize(text, 'scrape')
+
+# =================== single-parse fast path ===================================================
+#
+# extract_capture_div + extract_fatwa_data parse the page, prettify captureDiv
+# back to a string and parse it again. extract_fatwa_text slices captureDiv out
+# of the raw page with a cheap div-depth scan (stopping as soon as it closes),
+# parses only that fragment once with the fastest available backend and joins
+# its text nodes with spaces, which is what the prettify round-trip produced
+# (prettify also always leaves a newline just inside and just after the div).
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+AVAILABLE_BACKENDS = ['html.parser'] + (['lxml'] if lxml else []) + (['selectolax'] if SelectolaxParser else [])
+PARSER_BACKEND = AVAILABLE_BACKENDS[-1]
+
+capture_div_open = re.compile(r'<div\b[^>]*\bid\s*=\s*["\']?captureDiv\b[^>]*>', re.IGNORECASE)
+div_tag = re.compile(r'<(/?)div\b[^>]*>', re.IGNORECASE)
+
+def extract_capture_div_fragment(page_html):
+    start = capture_div_open.search(page_html)
+    if not start:
+        return None
+
+    depth = 1
+    for tag in div_tag.finditer(page_html, start.end()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            return page_html[start.start():tag.end()]
+    return page_html[start.start():]  # unclosed div: let the parser recover
+
+def _lxml_strings(root):
+    for el in root.iter():
+        if isinstance(el.tag, str) and el.tag not in ('script', 'style') and el.text:
+            yield el.text
+        if el is not root and el.tail:
+            yield el.tail
+
+def capture_div_text(fragment, backend=None):
+    backend = backend or PARSER_BACKEND
+
+    if backend == 'selectolax':
+        tree = SelectolaxParser(fragment)
+        tree.strip_tags(['script', 'style'])
+        node = tree.css_first('div#captureDiv')
+        return node.text(deep=True, separator=' ', strip=False) if node else None
+
+    if backend == 'lxml':
+        matches = lxml.html.fromstring(fragment).xpath('//div[@id="captureDiv"] | self::div[@id="captureDiv"]')
+        return ' '.join(_lxml_strings(matches[0])) if matches else None
+
+    node = BeautifulSoup(fragment, 'html.parser').find('div', id='captureDiv')
+    return node.get_text(' ') if node else None
+
+def extract_fatwa_text(page_html, backend=None):
+    """Single-parse equivalent of extract_fatwa_data(extract_capture_div(page_html))."""
+    fragment = extract_capture_div_fragment(page_html)
+    text = capture_div_text(fragment, backend) if fragment else None
+    if text is None:
+        print("❌ No div with id='captureDiv' found.")
+        return None
+    return normalize_fatwa_text(' ' + text + ' ')
+
+def _next_answer_start(text, pos, endpos):
+    idx = text.find(ANSWER_START_LITERAL, pos, endpos)
+    while idx != -1:
+        match = ANSWER_START_RE.match(text, idx, endpos)
+        if match:
+            return match
+        idx = text.find(ANSWER_START_LITERAL, idx + 1, endpos)
+    return None
+
+def segment_fatwa(text):
+    """Locate the question and answer without splitting or copying the text.
+
+    Returns ((q_start, q_end), (a_start, a_end)) spans into `text`, matching
+    what the old three `re.split` calls selected: the question runs from the
+    first title to the first answer opener, the answer from there to the first
+    closing formula, and a second title or opener ends its region exactly like
+    a split would. The closing-formula search stops at the first hit.
+    """
+    title = QUESTION_TITLE_RE.search(text)
+    if not title:
+        raise ValueError(SEGMENT_ERRORS['title'])
+    next_title = QUESTION_TITLE_RE.search(text, title.end())
+    region_end = next_title.start() if next_title else len(text)
+
+    start = _next_answer_start(text, title.end(), region_end)
+    if not start:
+        raise ValueError(SEGMENT_ERRORS['start'])
+    next_start = _next_answer_start(text, start.end(), region_end)
+    answer_region_end = next_start.start() if next_start else region_end
+
+    end = ANSWER_END_RE.search(text, start.end(), answer_region_end)
+    if not end:
+        raise ValueError(SEGMENT_ERRORS['end'])
+
+    return (title.end(), start.start()), (start.end(), end.start())
 
 def extract_ques_ans(text):
     try:
-        first_split = re.split(question_title, text)
-        if len(first_split) < 2:
-            raise ValueError("Question title pattern not found")
-            
-        second_split = re.split(start_pattern, first_split[1])
-        if len(second_split) < 2:
-            raise ValueError("Answer start pattern not found")
-
-        question = second_split[0]
+        (q_start, q_end), (a_start, a_end) = segment_fatwa(text)
+
+        question = text[q_start:q_end]
         question = question.replace(answer_title, '')
-        question = re.sub(tasmiya_pattern, '', question)
+        question = TASMIYA_RE.sub('', question)
         question = question[question.find('سوال')+len('سوال'):]
 
-        third_split = re.split(end_pattern, second_split[1])
-        if len(third_split) < 2:
-            raise ValueError("Answer end pattern not found")
-
-        answer = third_split[0]
-        answer = ANSWER_START + answer + ANSWER_END
+        answer = ANSWER_START + text[a_start:a_end] + ANSWER_END
 
         return {'question': question.strip(), 'answer': answer.strip()}
     
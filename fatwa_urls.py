@@ -1,9663 +0,0 @@
-ALL_FATWA_URLS = [
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/fajr-ki-sunnat-reh-jana",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-par-airab",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-tarjuma-record-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/meher-kam-se-kam-miqdar-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-mushriqain-maghribain-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jora-sadaqah-karna-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/chalte-phirte-tilawat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-ko-makhlooq-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/musalman-ko-gali-dena-hadees-sharah",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/imam-ka-gardanen-phalangna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/fajir-ke-peeche-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/toba-karne-wale",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-se-unchi-jaga-bethna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/panch-waqt-ki-namaz-quran-mein-zikr",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-parhna-afzal-hai-ya-sunna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/nasab-badalne-wale-par-jannat-haram-hone-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/yusha-kon-hain",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ek-qurani-ayat-ki-tafseer",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/surah-mulk-maghrib-se-pehle-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/allah-ki-bande-se-mohabbat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/bewazu-page-par-ayat-e-qurani-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/baal-rangne-mein-yahood-nasara-ki-mukhalfat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tilawat-mein-naam-e-muhammad-aane-par-anguthe-chumna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/dua-hizbul-bahr-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-rozana-kangi-karna-mana-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tumhen-na-banata-tu-kainat-ko-na-banata-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/andaze-se-hadees-ki-sharah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-hazrat-asiya-ka-nikah-firon-se-qurani-ayat-ke-mutabiq-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kisi-ki-wajah-se-koi-cheez-haram-hone-ke-mutaliq-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hurmat-wale-mahino-ki-hurmat-ki-waja",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/lanat-dena-qatal-ke-barabar",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/qabar-ke-sawalat-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/maghrib-se-pehle-khana-khana-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-mein-qif-ke-upar-lam-alif-ho-to-waqf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/namaz-ke-ilawa-suraton-ko-tarteeb-se-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/azan-ke-doran-dua-qabool-hoti-hai-ya-azan-ke-baad",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/witr-ko-maghrib-ki-tarah-na-parho-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/mayyat-par-rone-se-azab",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hazrat-hawwa-ka-quran-mein-zikr",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tilawat-sunna-tilawat-karne-se-afzal",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/mimbar-ki-seerhiyon-ki-tadad",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kaun-se-ulama-ambia-ke-waris-hain",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hadees-qudsi-aur-sahi-hadees-ki-tareef",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/huzoor-se-mashwara-karne-se-pehle-sadaqah-dena",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/qaida-parhne-wale-se-upar-bethna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/har-bidat-gumrahi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jumerat-ke-roze-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/70-hazar-kalima-isale-sawab-karna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hathon-par-tasbeeh-fatima-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/nazar-se-bachne-ke-tarike-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/abraha-kon-tha",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tilawat-se-pehle-tawwuz",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/3-4-hafte-ka-hamal-zaya-ho-to-kya-ye-kacha-bacha-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/piyaz-istemal-karne-wali-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/be-wuzu-shakhs-ka-quran-pak-band-karna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/allah-ko-tabeeb-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jis-qom-ko-bandar-banaya-gaya-kya-wo-isi-halat-mein-mari",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hifazati-iqdamat-aur-tawakkul",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/cheel-kawwon-ko-dana-dena",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-majeed-sunne-ka-sawab",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sunnat-chorhne-par-shafaat-se-mehroomi",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-ko-be-wazu-ghilaf-ya-dabbe-se-pakarna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/khauf-e-khuda-se-aansu-nikalne-se-maghfirat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kisi-ke-ghar-jhankne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-mein-madd-aur-ghunna-na-karna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/allah-ke-liye-mohabbat-aur-bughz-rakhne-ki-tashreeh",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hamilan-e-arsh-kon-hain",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jisne-asar-ki-namaz-chori-uske-amal-barbad-hogaye-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/27-rajab-ke-roze-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/qurani-ayat-wala-frame-bagair-wazu-chuna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jis-ghar-mein-khajooren-na-hon-us-ghar-ke-log-bhooke-hain-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/dewar-maut-hai-hadees-ki-sharah",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jadu-par-yaqeen-karne-wala-jannat-mein-na-jaye-ga-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-jannat-mein-sharab-halal-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/rooh-ka-jisam-se-nikal-kar-sair-karna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/40-hadeesen-hifz-karne-ki-fazilat-ka-misdaq",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/madina-mein-neki-aur-gunah-ka-izafa-hona",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hadees-tehband-takhno-se-neeche-aag-mein-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/dusron-ke-liye-dua-karna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-subah-ka-waqt-barkat-wala-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/na-balaigh-bache-ki-tilawat-e-quran-sunne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jumma-ki-pehli-saat-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tasveer-ke-mutaliq-fatawa-rizvia-ka-fatwa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hadees-tu-aur-tera-maal-tere-baap-ka-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-bepardah-aurat-ko-jahannam-mein-balon-se-latkaya-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-ilm-e-deen-seekhne-mein-mashghool-logon-ko-salam-karna-gunah-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/neki-aur-gunah-se-mutaliq-ek-mashoor-hadees-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/yahood-o-nasara-ko-jazeera-arab-se-nikalne-se-mutaliq-hadees-ki-sharah",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-quran-pak-ko-tajweed-se-parhna-zaruri-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/surah-baqarah-ki-tilawat-ki-fazilat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-taweez-pehan-kar-washroom-jasakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/na-ahl-ko-ilm-sikhane-ki-riwayat-na-ahl-se-kon-murad-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-hadees-pak-mein-ameer-logon-ko-murgian-palne-ka-hukum-diya-gaya",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/nabi-pak-ko-ladla-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-shaitan-ne-zameen-ki-har-jagah-sajda-kiya",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/dua-ki-barkat-se-umar-barhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/surah-tauba-k-shuru-mein-tasmiya-na-likhne-ki-waja",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/mukhtalif-ahadith-mein-is-mazmoon-wo-hum-mein-se-nahi-se-kya-murad-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-lafz-allah-ke-sath-taala-quran-aur-hadees-se-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/meraj-ki-raat-jin-ko-azab-diya-ja-raha-tha-woh-kon-log-thay",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ilm-hasil-karna-har-musalman-par-farz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hafte-ke-din-roza-rakhna-kis-hadees-mein-mana-kya-gaya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hadees-bitaqa-mein-bayan-ki-gai-kalma-ki-fazilat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tilawat-ke-waqt-naam-e-muhammad-par-anguthe-chumna-aur-durood-shareef-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/dino-ka-sardar-kaun-sa-din-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/duniya-mein-bhalai-ka-sawal-karne-se-mutaliq-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-maut-ke-waqt-hone-wali-takleef-se-bhi-gunah-mitte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/shab-e-qadr-hadees-se-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-ke-page-ko-tape-se-jorne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-quran-ko-be-wazu-chuna-sirf-hanafion-ke-nazdeek-najaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/logon-se-apne-liye-dua-ka-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ghar-mein-jhankne-par-aankh-phodne-wali-hadees-par-amal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tilawat-e-quran-aur-dua-karte-huwe-rona-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sadaqah-umar-ko-barhata-hai-is-ka-matlab-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/school-islamiat-kitab-be-wazu-hath-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tafseer-sirat-ul-jinan-taleem-ul-quran-aur-ifham-ul-quran-ko-be-wazu-chhuna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-doran-e-tilawat-madd-ul-munfasil-ko-chorna-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-tamam-insan-qabeel-ki-aulad-se-hain",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/chalte-phirte-quran-pak-ki-tilawat-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/wh-8305-quran-pak-aur-alamat-e-waqf",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jahannam-ka-kehna-kuch-aur-bhi-hai-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/surah-mulk-qayamat-ke-din-shafaat-karegi",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jannat-maa-ke-qadmon-ke-neeche-hai-iss-se-kya-murad-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jannat-mein-sab-jawan-honge-is-ka-hawala",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hazrat-musa-ne-apni-ahliya-ko-jama-ke-seeghe-se-kyun-khitab-kiya",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hadees-mutawatir-ki-tareef-sharait-aur-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/napaki-ki-halat-mein-ayat-par-sheesha-tape-laga-kar-chhona-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/haya-aur-iman-se-mutaliq-hadees-pak-aur-uski-sharah",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/aab-e-hayat-ki-haqeeqat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/umar-mujh-se-hai-aur-mein-umar-se-hon-hadees-ka-hawala",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/muawiya-mujh-se-hai-aur-mein-muawiya-se-is-hadees-ka-hawala",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ghair-alim-ka-quran-pak-ke-tarjuma-ya-tafseer-se-khud-masla-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hadees-hafiz-quran-10-afrad-ki-shafaat-karega-is-ka-hawala",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kuffar-ke-maal-se-taajjub-na-karo",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/goonge-shakhs-ne-ayat-e-sajda-dekhi-to-sajda-tilawat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/3-masjidon-ke-ilawa-kisi-ki-taraf-safar-na-kiya-jaye-hadees-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-majeed-mein-mazkoor-waqf-un-nabi-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ek-hadees-mein-khizab-lagane-ka-zikr-hai-aur-ek-mein-mana-is-ki-wajah",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hadees-mubarak-meri-ummat-shirk-nahi-karegi-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jis-ne-khwab-mein-siddiq-e-akbar-ko-dekha-kya-haqeeqat-mein-aap-hi-ko-dekha",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-mein-tabdeeli-nahi-to-baqiya-asmani-kitabon-mein-tabdeeli-kaise-hui",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sajda-tilawat-ka-sunnat-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-ki-baaz-ayat-ne-baaz-ko-mansookh-kardiya-is-se-kya-murad-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/takiya-doodh-khushboo-tohfa-mein-milen-tu-wapas-na-karne-se-mutalliq-hadees-pak",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hajr-e-aswad-zameen-par-allah-ka-dast-e-qudrat-hai-hadees-ka-hawala",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/baghair-awaz-ke-ayat-sajda-parhne-se-sajda-tilawat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-qayamat-se-40-saal-pehle-bachon-ki-wiladat-hona-band-ho-jayegi",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jumma-ghareebo-aur-miskeeno-ka-hajj-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/zalim-ko-mohlat-de-kar-pakar-karne-wali-hadees-ka-hawala",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/mere-baad-koi-nabi-hote-to-wo-umar-hote-hadees-ka-hawala",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/neend-maut-ki-behan-hai-hadees-ka-hawala",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-majeed-table-par-rakh-kar-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sakhi-ka-khana-dawa-aur-bakhil-ka-khana-bimari-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-baithe-baithe-bhi-sajda-tilawat-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/surah-nisa-ki-ayat-119-mein-janwar-ke-kaan-cheerne-se-kya-murad-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/dosre-ki-taraf-se-sajda-tilawat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/istikhara-ka-saboot-hadees-se",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-7-zameen-machli-ki-pusht-par-hain",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sajda-e-tilawat-se-mutaliq-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-parhna-na-aata-ho-to-koi-wird-karte-hue-quran-par-ungli-pherna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/3-din-se-ziyada-qata-taluq-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/murdar-machli-ka-halal-hona-kahan-se-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/taiz-raftaar-mein-quran-pak-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/33-aayat-wali-manzil-parhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/falasteen-ki-sarzameen-mubarak-sarzameen-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jannat-mein-borhe-nahi-tu-hazrat-abu-bakr-aur-hazat-umar-borhon-ke-sardar-kaise-honge",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/digital-quran-pen-se-ayat-sajda-suni-to-sajda-tilawat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jo-hajj-kare-aur-meri-ziyarat-ko-na-aaye-usne-mujh-se-jafa-ki-is-ka-hawala",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tarteeb-e-quran-nuzool-e-quran-ke-mutabiq-kyun-nahi-rakhi-gai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/lahn-jali-ki-ghalatiyon-par-mushtamil-qirat-sunne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/mohabbat-ka-izhar-karne-ke-hawale-se-hadees-pak-ki-sharah",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tafsir-ibn-e-abbas-ke-mutalliq-ala-hazrat-ka-farman",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-kutte-ki-paidaish-shaitan-ke-thook-se-hui-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/chalte-hue-tilawat-e-quran-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/bila-wazu-quran-pak-ki-ayat-ya-tarjuma-likhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/yatim-kise-kehte-hain-aur-yatim-se-mutaliq-ahadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sidratul-muntaha-kya-hai-tafseel-ke-sath-irshad-farmadein",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-kaan-mein-ungliyan-dalne-se-hauz-e-kausar-ki-awaz-aati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jannatul-firdaus-ki-dua-mangni-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/doran-e-bayan-khilaf-e-tarteeb-ayaat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sabak-ke-tor-par-qurani-ayat-be-wazu-likhna-ya-chona",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-wo-momin-nahin-jo-khud-pait-bhar-kar-khaye-aur-uska-padosi-bhooka-ho",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/shayri-ki-sharai-haisiyat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/momin-ki-qabar-jannat-ke-baghat-mein-se-ek-bagh-kya-ye-hadees-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/3-martaba-surah-ikhlas-padhne-se-ek-quran-majeed-ka-sawab-milta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/raste-mein-chalte-chalte-quran-pak-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-nabi-pak-ki-miras-wali-hadees-ke-rawi-sirf-hazrat-abu-bakr-hain",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jis-ne-mujhe-dekha-usne-haq-dekha-is-hadees-ki-tashreeh",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/nw-6769-sajda-tilawat-wajib-hone-ki-kya-hikmat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/maghrib-ke-baad-surah-mulk-ya-surah-waqia-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/har-bimari-ka-ilaj-paida-kiya-gaya-tu-baaz-bimariyan-lailaj-kyun",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/islamiyat-ke-subject-mein-quran-ki-surat-yaad-kar-ke-bhool-jana",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/fatima-agar-allah-ke-yahan-pakar-hogai-to-mein-tumhare-kisi-kaam-nahi-aaunga",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-baitul-muqaddas-ki-fatah-qayamat-ki-nishaniyon-mein-se-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/maa-ki-good-se-qabar-tak-ilm-hasil-karo-kya-ye-hadees-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tafseer-e-jalalain-ko-haiz-ki-halat-mein-chona",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/qurani-ayat-se-jandar-ki-tasweer-banana",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/allah-ki-khatir-aapas-mein-mohabbat-rakhna-kise-kehte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tilawat-mein-ek-harf-ko-dosre-harf-se-badalna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/be-wazu-ya-be-ghusl-shakhs-ka-qurani-ayat-likhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-allah-pak-ke-70-maaon-se-ziada-mohabbat-karne-ki-koi-hadees-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-ayat-sajda-ka-tarjuma-sunne-wale-par-sajda-tilawat-wajib-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/bator-e-wazifa-quran-pak-ki-soorton-ko-khilaf-e-tarteeb-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sajda-tilawat-ke-liye-wazu-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/madd-e-ariz-aur-leen-aariz-ko-kitna-kheenche-gai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/waqf-e-ghufran-se-kya-murad-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hadees-mein-allah-pak-ko-zamana-kehne-ka-kya-matlab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sajde-mein-jane-ke-tarike-se-mutalliq-ek-hadees-tehqeeq",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/maa-ki-god-mein-baat-karne-wale-bache",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hazrat-adam-par-sahifah-nazil-hua",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/nabi-pak-par-sab-se-pehli-wahi-konsi-nazil-hui",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/wali-se-dushmani-rakhne-wale-ke-mutalliq-hadees-qudsi",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-ko-chomne-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/asal-muflis-garib-nadar-kon",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/mangal-wale-din-kon-si-makruh-cheezon-ko-paida-kiya-gaya",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ayat-sajdah-ki-kitni-miqdar-parhne-par-sajda-tilawat-lazim-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/dekh-kar-quran-parhna-zubani-se-afzal-aur-ghusl-farz-hone-ki-halat-mein-quran-ko-dekhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hadees-mein-hazrat-ibrahim-ko-baap-kehne-ki-wajah",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tawwuz-quran-pak-ki-ayat-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/shabina-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tilawat-ke-doran-agar-koi-salam-kare-to-is-ka-jawab-kis-waqt-dena-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ek-jagah-bethe-aayat-e-sajdah-ki-takrar-ki-to-kitne-sajda-e-tilawat-wajib-honge",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/qirat-mein-ghalti-karne-se-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ojhri-ke-mutaliq-ek-riwayat-ki-tehqeeq",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-hazrat-ali-ke-liye-suraj-ka-palatna-sahi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-mein-kisi-ayat-par-sajda-likha-hota-hai-is-ka-kya-matlab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jis-ne-jan-bujh-kar-namaz-tark-ki-isne-kufar-kya-hadees-pak-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/moseeqi-aur-aalat-e-moseeqi-ke-mutalliq-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/bache-ko-quran-sikhane-ki-umar-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/allah-pak-yakta-hai-tu-phir-quran-mein-hum-kyun-kaha-gaya",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/dua-karte-waqt-hatheliyon-ka-rukh-aasman-ki-janib-kardia-karo-kya-ye-hadees-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/aayat-e-sifat-kise-kehte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tilawat-ke-doran-azan-ho-jaye-tu-kya-karien",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/agar-tum-na-hote-tu-mein-apna-rab-hona-zahir-na-karta-kya-hadees-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/40-hadees-ummat-tak-pahunchne-ki-kya-fazilat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hazrat-siddiq-e-akbar-ke-iman-ke-mawazne-ke-mutaliq-riwayat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/auliya-ko-dekh-kar-khuda-yaad-aata-hai-is-jumle-ka-hawala",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-o-hadees-se-taqlid-aur-qiyas-ka-suboot",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ek-quran-pak-ke-upar-doosra-quran-pak-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tilawat-ke-doran-baat-karli-tu-kya-phir-tawuz-o-tasmiyah-parhe-gai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/anar-pomegranate-ke-mutalliq-aik-tehqeeq",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tafsir-surah-taha-ayat-131",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/farishtay-quran-pak-ki-tilawat-karsakte-hain-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-ke-kisi-harf-ka-inkar-karne-wale-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tashahhud-mein-ungli-uthane-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-yaad-kar-ke-bhula-dene-ki-waeed",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ayat-e-istirja-ko-rasm-e-usmani-mein-na-likhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/raan-thigh-ke-sitr-e-aurat-hone-se-mutaliq-hadees-pak-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sahabi-ko-huzoor-ne-kulhara-bana-kar-diya",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/qawaid-e-moseeqi-par-quran-pak-ki-tilawat-seekhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/masjid-e-aqsa-ki-qiyamat-tak-hifazat-karne-wali-jamat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/15-shaban-ke-baad-roze-rakhne-ka-hukam-aik-hadees-e-pak-se-wazhat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/fajr-ki-namaz-parh-kar-sone-ke-hawale-se-tafseel-o-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/fazail-mein-hadees-e-shaz-hadees-e-muallal-ya-matrook-ko-bayan-karna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jannat-ki-khusboo-na-pane-ka-kya-matlab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hadees-e-mutawatir-ka-inkar-karne-wale-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/allah-pak-ko-qarz-dene-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-parhane-ki-ujrat-lena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/baghair-hisab-kitab-ke-jahannam-mein-dakhil-hone-wale-log",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-quran-pak-ke-choda-sajde-na-karna-gunah-ka-kaam-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-majeed-ke-ruku-aur-paron-ki-taqseem-kisne-ki-aur-waqf-kisne-lagaye",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/qata-taluq-se-mutaliq-chand-ahadees-bayan-farmadien",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/40-musalman-kisi-ke-haq-mein-dua-kare-to-kya-wo-qabool-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ziyarat-e-mustafa-wali-hadees-e-pak-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/durood-pak-likhne-ki-fazilat-par-aik-hadees-e-pak-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-hazrat-ameer-muawiya-ki-shan-me-koi-hadees-nahi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/bistar-par-lait-kar-quran-pak-ya-wazaif-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hazrat-ameer-muawiya-par-aitraz-ka-jawab",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/reham-karne-walo-par-rehman-reham-farmata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-o-hadees-ki-roshni-mein-bait-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/qabristan-mein-quran-majeed-ki-tilawat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/fajar-ke-baad-makrooh-waqt-mien-quran-pak-ki-tilawat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hifz-ke-liye-bachon-ko-khilaaf-e-tarteeb-suraten-yaad-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/posters-par-qurani-ayaat-mukhtalif-design-mein-likhna-kiasa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jote-pehen-kar-zubani-quran-pak-ki-tilawat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-ki-ayat-ka-tarjuma-yaad-kar-ke-bhool-gaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-ye-bat-durust-hai-jaisi-awam-hogi-waisa-hukmaran-musallat-kiya-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-hifz-karte-hue-darmiyan-mein-chorne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-ko-asani-se-kaise-hifz-karen-koi-amal-bta-dain",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-surah-taubah-se-pehle-bismillah-padh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-murgh-jinnat-ko-dekh-kar-awaz-nikalta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tasveer-banane-ke-hawale-se-hadees-pak",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-ki-tilawat-shuru-karne-se-pehle-tawuz-parhne-ka-kia-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ghar-me-pare-taqseem-kar-ke-quran-khuani-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-aurat-ko-us-ke-shohar-ki-pasli-se-paida-kiya-gaya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/panch-namaz-ke-nawafil-ka-hadees-se-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-quran-ki-ayat-aik-sans-me-parhna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-me-mor-peacock-ka-par-rakhna-sahi-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sirf-dil-me-quran-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/huzoor-ke-liye-maqam-mehmood-ki-dua-karne-ki-hikmat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hazrat-ali-ko-dekhna-ibadat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tilawat-e-quran-sy-pehly-tawuz-o-tasmiya-parhne-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/jannat-mein-mard-ke-liye-gold-aur-silver-ke-zewrat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/huzoor-ne-kis-se-farmaya-tum-per-mere-maa-baap-qurban",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/6-dino-main-zameen-o-aasman-ki-pedaish-ki-hikmat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hadees-mein-ilm-ka-sehar-aur-abu-baker-is-ki-bunyad-hai-ki-tehqeeq",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kalma-tayyaba-ziada-tadad-me-parhne-ki-fazilat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sajda-e-tilawat-me-takheer-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sidra-se-aage-hazrat-jibrail-ka-na-jana",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hazrat-ali-ka-chehra-dekhna-ibadat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/dunya-ki-umar-ke-mutalliq-alaa-hazrat-ka-farman",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-afzal-hai-ya-nabi-pak",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/musalman-ke-jhoote-mein-shifa-hai-kya-ye-hadees-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-me-qif-ki-alamat-kis-liye-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/beti-ko-quran-e-kareem-hifz-karana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-nabaligh-bache-par-sajda-e-tilawat-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ayat-e-sajda-maloom-na-ho-tu-sajda-e-tilawat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/lakri-ke-bartan-istimal-karne-se-mutalliq-hadees-pak-ki-shara",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/galti-se-quran-e-pak-gir-jaye-to-kya-kaffara-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/namaz-qaza-karne-par-80-saal-jahannam-ki-saza",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/bagair-wazu-tafseer-ki-kitab-ko-hath-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/momin-masjid-me-aese-hai-jese-machli-pani-me-kya-ye-hadees-sahi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-tajweed-quran-sikhna-farz-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/asar-ki-namaz-ke-bad-sajda-e-tilawat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sabaq-yaad-karte-hue-ayat-e-sajda-ko-baar-baar-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/sidra-tul-muntaha-se-aage-jane-par-hazrat-jibrail-wali-riwayat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/samri-jadugar-kon-tha",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/hadees-e-pak-yad-karne-agey-punchane-ki-fazilat-aur-iski-wazahat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/rishtedaron-se-husn-e-sulook-ka-rizq-par-asar",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/v-4725-rajab-ke-mahine-me-roza-rakhne-ki-mumaniat-se-mutalliq-aik-hadees-e-pak-ki-sharah",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/qurani-ayat-ko-roman-me-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-bimari-ur-kar-dosre-ko-lag-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/deen-mein-sakhti-nahi-se-murad",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-ye-hadees-hai-rizq-e-halal-kamana-ibadat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/talib-e-ilm-ke-quran-majeed-per-nishan-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kaam-karne-wale-ke-paas-unchi-awaz-se-tilawat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/ayat-e-kareema-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-application-mobile-se-delete-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/surat-ul-kausar-mein-kausar-se-kya-murad-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kaam-karte-waqt-aur-bistar-par-late-kar-tilawat-quran-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kam-ke-doran-recorded-tilawat-sunna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/mobile-me-quran-paak-ki-application-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/aik-majlis-mein-ayat-e-sajda-5-logon-ne-parhe-to-sajda-e-tilawat-ka-kiya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kis-ki-tafseer-suni-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/aik-majlis-me-ek-hi-aayat-sajda-baar-baar-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/qurani-ayat-wale-frame-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/makrooh-waqat-me-quran-ki-tilawat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/kya-rabiul-awal-ki-mubarak-baad-dene-se-jannat-wajib-ho-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-ki-tilawat-sunna-zyada-sawab-ya-karna",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/husool-e-rizq-e-halal-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/tilawat-mein-nabi-ka-naam-aur-durood",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-pak-ko-tasveer-wale-akhbar-ke-sath-dafan-karna-8923",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-khawani-ke-baad-khana-4960",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/layt-kar-quran-parhna-5870",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/asr-kay-bad-quran-ki-tilawat",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-karim-ki-rasam-usmani-6351",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/doran-e-tilawat-talba-ka-taziman-khara-hona-1830",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-mein-mashriq-aur-maghrib-6418",
-  "https://www.fatwaqa.com/ur/fatawa/quran-aur-hadees/quran-khawani-mein-awaz-se-tilawat-karna-6160",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/new-muslim-islam-par-amal",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/huzoor-ka-ilm-e-ghaib",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/isai-aur-yahudi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jannat-ki-naimaten",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-dete-nahi-thakta-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/makhlooq-se-hisab-kitab",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/nabi-pak-malik-o-mukhtar-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/islam-mein-dadhi-dadhi-mein-islam-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jannat-aur-uski-nematon-ke-mutaliq-aqeedah",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/musalman-hone-ke-liye-zaroori-baten",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-khudkushi-taqdeer-mein-likhi-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ya-allah-hamen-bhool-na-jana-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/na-baligh-ka-kufr-aur-gunah",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/nabi-pak-ka-madad-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ne-meri-mot-ka-waqt-fix-nahi-kiya-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/but-parasti-wali-jagah-jana",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jannat-mein-soorat-badalna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/neend-mein-kalma-kufr-nikal-jana",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jannati-hoor-aur-dunyawi-naik-aurat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/naik-aur-bad-amaal-kis-ke-hukum-se-hote-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/yahudi-hone-ki-qasam-khana",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hathon-ki-lakeer-se-mustaqbil-janna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ke-liye-lafz-nigehbaan-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/muslim-ho-ya-pathan-puchne-par-pathan-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/nabi-pak-ummatiyon-ke-dil-ka-haal-jante-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/shirk-ke-baad-toba-se-mafi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ke-liye-jama-ke-alfaz",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ka-didar-kaise-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/muawiyah-ko-minbar-par-dekho-to-qatl-kar-do-riwayat-ka-jaiza",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/taqdeer-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/mazaq-mein-khud-ko-kafir-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ko-khinzeer-ka-khaliq-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-loh-o-qalam-bhi-fana-hojyenge",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/farishton-ko-ghaib-ka-ilm-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/namaz-ka-inkar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/khudkushi-karne-wale-ki-bakhshish-ke-mutaliq-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ke-durood-bhejne-ka-matlab-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/maut-ke-waqt-kalma-na-parha-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ham-kisi-ko-nahi-poojte-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/masjid-aur-paighambar-ka-darja",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/shooting-ke-liye-hindaun-ki-tarah-mathe-par-laal-color-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-esai-hazrat-isa-aur-hazrat-uzair-ko-khuda-mante-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/tadfeen-ke-baad-surah-al-baqarah-ki-ayaat-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kafir-ke-liye-isal-e-sawab-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/musalman-ko-kafir-kehna-kaisa-kya-kehne-wala-kafir-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-adam-ki-aulaad-hone-ki-bina-par-hindu-muslim-bhai-bhai-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/is-niyat-se-kalima-parhna-ke-kufriya-jumla-na-nikla-ho",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ek-mashhoor-sher-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-islam-mein-churail-ki-haqiqat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/pehle-ke-ulama-scientist-the-aaj-ke-kyun-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ghair-e-nabi-ko-nabi-se-afzal-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-aisha-siddiqah-ki-pakdamni-ka-inkar-karne-wale-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/big-bang-theory-kya-hai-iski-shari-hesiyat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/mein-kafir-ho-jaunga-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/qaza-e-ilahi-ya-riza-e-ilahi-konsi-baat-durust-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/cheenk-aana-kis-baat-ki-alamat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-jannati-miya-biwi-ek-hee-darje-mein-honge",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-dua-se-qaza-mubram-tal-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kisi-najaiz-kaam-ke-mutaliq-kehna-ke-kash-ye-kaam-jaiz-hota",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-khwab-mein-buzurgon-ka-deedar-mumkin-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/napaki-ki-halat-mein-tajdeed-e-iman-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/akhri-zamana-mein-deen-ka-kaam-darham-o-dinar-ke-baghair-na-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kufriya-khayalat-se-nijat-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ki-sifaat-bhi-wajib-ul-wujood-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/qayamat-ka-inkar-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-pariyan-fairies-haqeeqat-mein-hoti-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/dua-qabool-na-hone-par-gussa-aana-aur-naik-shakhs-se-dua-ka-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-isa-aur-imam-mehdi-ke-mutaliq-kya-aqeeda-hona-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kufriya-baat-sun-kar-tauba-na-karwane-wale-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ijtihadi-khata-kise-kehte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ko-uski-sifat-ka-wasta-de-kar-dua-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/halal-haram-ke-liye-islami-usool-kyun-zaroori-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/deeni-tabqa-secular-aur-liberal-logon-ki-mukhalifat-kyun-karta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/islami-ahkam-ki-tashreeh-mein-ikhtilaf-hai-tu-phir-islam-par-amal-kyun-karen",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/muashra-aur-riyasat-ki-buniyad-mazhab-par-ho-ya-aqal-par",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ulama-maghribi-cheezain-istemal-bhi-karte-hain-aur-tanqeed-bhi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ko-gunah-ka-khaliq-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-jin-ko-bhi-maut-aati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/be-jan-cheezon-ko-nazre-bad-lagna-aur-is-ka-ilaj",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/sitaron-se-shayateen-ko-marne-ki-kya-haqeeqat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-jadu-karne-ya-karwane-wala-kafir-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jannati-rishtedar-ki-jahannami-rishtedaar-ko-jannat-mein-dekhne-ki-khwahish",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jo-murda-qabar-mein-dafan-na-ho-usay-azab-kaise-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-pakistan-secularism-ki-bunyad-par-bana-tha",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/pakistan-banane-mein-ulama-ka-kya-kirdar-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kisi-ke-zati-fail-ki-wajah-se-ulama-ke-kirdar-par-ungli-uthana",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/sabqa-ambia-ke-mubarak-jismon-par-mohr-e-nabuwat-hoti-thi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/huzoor-ki-aamad-ke-baad-paida-hone-wale-log-bhi-aap-ke-ummati-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-logon-ko-pani-pilane-se-koi-wali-ban-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-azab-qabar-aur-aamal-ka-wazan-zaruriyat-deen-se-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jannat-mein-maa-baap-rishtedaron-se-mulaqat-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-allah-ko-sakhi-keh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ki-taraf-zulm-ki-nisbat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/zina-aur-fahashi-ka-zimmedar-kaun-kya-liberalism-zina-ke-khilaf-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kalamullah-allah-ki-sifat-awaz-pak",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-yousuf-ke-bhai-nabi-they-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ghous-e-pak-ki-bayan-ki-jane-wali-karamaat-sachi-hain-ya-jhooti-kaise-maloom-ho",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-shaitan-insan-ke-dil-ke-irade-ko-janta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/nabi-pak-ko-yateem-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jism-ka-sab-se-pehle-paida-kiya-jane-wala-hissa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/gunah-karna-qismat-mein-hai-to-dozakh-mein-kyun-daakhil-kya-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jadu-karna-kufr-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ghair-aalim-shakhs-dusre-par-hukm-e-kufr-laga-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-qayamat-ke-din-tamam-log-be-libas-honge-tafseeli-fatwa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/mujhe-khuda-se-ishq-hai-is-jumle-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jagte-hue-nabi-pak-ka-deedar-sahabi-hone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/mazhab-ki-zaroorat-kyun-mazhab-ki-zaroorat-o-ahmiyat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/huzoor-aur-auliya-ki-shafaat-mein-kya-farq-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-insan-ke-marne-ke-baad-qabar-mein-rooh-lotai-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-hazrat-khizar-zinda-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/maidan-e-hashr-mein-jism-par-kapre-honge-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-kafir-hamesha-hamesha-ke-liye-jahannam-mein-rahe-ga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-dekh-raha-hai-ye-jumla-bolna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/maidan-e-hashr-kahan-qaim-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/sawad-e-azam-ki-tareef-aur-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/rooh-jism-se-nikal-kar-kahan-jati-hai-aur-alam-e-barzakh-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/farishton-aur-jinnat-se-mutaliq-aqeedah",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-jab-bhi-deta-hai-chappar-phaar-kar-deta-hai-aisa-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ambiya-e-kiram-se-wisal-e-zahiri-ke-baad-mojzat-zahir-hona",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ek-se-zyada-janam-ka-aqeedah-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/guru-nanak-ke-hawale-se-kya-nuqta-nazar-hona-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/mazhabi-azaadi-ka-nazriya-shariat-aur-aqal-ki-roshni-mein",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-hazrat-adam-se-pehle-bhi-koi-dunya-thi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kalma-e-kufr-yaad-na-ho-to-tauba-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/qabar-mein-nabi-kareem-khud-tashreef-layenge-ya-unki-tasveer-dikhai-jayegi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-madina-ki-riyasat-secular-riyasat-thi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/iman-se-kya-murad-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ko-rabbul-arbab-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ke-liye-confuse-hone-ka-lafz-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/sunni-sahi-ul-aqeedah-alim-e-deen-ki-tehqeer-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/musalman-hone-ke-baad-apni-marzi-se-kisi-islami-hukum-ko-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/is-tarah-bolne-ka-hukum-ke-allah-ne-bhool-kar-is-ghar-mein-paida-kar-diya",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/darse-nizami-ka-nisab-kai-sadiyon-purana-hone-ki-wajah-se-ulama-par-aitraz",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-allah-pak-mushrik-ki-maghfirat-karne-par-qadir-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ke-liye-farmate-hain-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/wilayat-kaise-milti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-raam-aur-krishn-nabi-the",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/sahaba-karam-meyar-e-haq-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/shadi-ka-taqdeer-mein-likha-ja-chuka-hai-to-kisi-aurat-ka-rishta-mangna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/lawatat-ko-jaiz-samjhne-wale-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ghairat-ke-naam-par-hone-wale-qatal-ko-islam-aur-ulama-ki-taraf-mansoob-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/janwaron-ki-rooh-kaun-qabz-karta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/be-namazi-walidain-ki-khidmat-kare-to-jannat-mein-jaye-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/dil-mein-ye-khayal-karna-ke-namaz-zulm-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/halaku-khan-ne-jab-baghdad-par-hamla-kya-tha-to-ulama-aapas-me-munazre-kar-rahe-thy",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/huzoor-ke-ilm-e-ghaib-aur-noor-hone-ka-quran-o-hadees-se-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kafir-ke-samne-hath-jod-kar-namaste-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ke-liye-planning-ka-lafz-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jannat-mein-allah-ka-deedar-kab-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/acha-hota-agar-namaz-farz-na-hoti-is-jumle-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/in-sha-allah-badla-loonga-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kufriya-kalimat-se-toba-ka-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-khudkushi-karne-wale-ki-rooh-duniya-mein-bhatakti-rehti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-insan-ke-amaal-makhlooq-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/sab-se-pehle-noor-e-muhammadi-ko-paida-kiya-gaya",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-isa-afzal-hain-ya-imam-mehdi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/tamam-anbiya-ko-huzoor-ka-ummati-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/khana-kaba-allah-ka-ghar",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kalma-e-shahadat-ke-andar-mein-gawahi-deta-hoon-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-hazrat-isa-aur-hazrat-imam-mahdi-ek-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/sunnat-ka-mafhoom-kya-hai-aur-sunnat-ko-arab-culture-keh-kar-chor-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/is-shair-ka-hukum-ke-pooja-teri-karni-hai-har-din-raat-mein-ne",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/mushkil-asan-karne-wala-upar-betha-hai-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jinnat-mein-nabi-aur-rasool-hue-hain-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-par-lafz-e-cheez-ka-itlaq-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hafiz-ko-chalta-phirta-quran-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/mojzat-aur-karamat-ka-inkar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-adam-ke-baad-kon-nabi-hue",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-islam-taraqqi-ki-rah-mein-rukawat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ilzam-lagane-ko-gheebat-samajhne-wale-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-khudkushi-karne-wala-jannat-mein-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/shikwa-shikayat-aur-dua-mein-farq",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jab-soor-phoonka-jayega-tu-us-waqt-anbiya-aur-auliya-kis-kefiyat-mein-honge",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ki-taraf-galti-ki-nisbat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/halat-e-naza-mein-iman-qabool-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/anbiya-e-kiram-gunahon-se-masoom-hote-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/qayamat-ke-din-maa-ke-naam-se-pukara-jayega-ya-baap-ke-naam-se",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/bakshish-o-maghfirat-allah-ki-rehmat-se-hogi-tu-naik-amal-kuyn-karte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/nabi-kareem-jamadat-ke-bhi-rasool-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/nationality-ke-liye-paper-marriage-karna-ya-khud-ko-yahoodi-ya-christian-likhwana",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hidayat-ki-nisbat-allah-ki-taraf-aur-ghairullah-ki-taraf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/qadiani-hone-ka-irada-karne-se-kafir-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/gair-muslim-se-taweez-lena-ya-dam-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/mohabbat-e-rasool-ki-nishaniyan",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/mohabbat-allah-pak-se-ziyada-honi-chahiye-ya-nabi-pak-se",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ke-liye-maut-aane-ka-aqeeda-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/iman-ki-hifazat-ka-wazifa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/lafz-khuda-ke-mayne-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/galti-se-kufriya-kalma-muh-se-nikal-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/musalman-ke-duniya-se-jane-ke-baad-musalman-arwah-ki-aapas-mein-mulaqat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ghair-muslim-ki-tazeem-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/anbiya-aur-rasool-ke-baad-fazilat-ki-tarteeb",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ilm-e-zati-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ye-kehna-kaisa-ke-allah-par-bhi-bharosa-karke-dekh-liya-kuch-nahin-hosaka",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazoor-ke-liye-lafz-aalim-ul-ghaib-bolna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/na-umeedi-kufr-hai-ye-jumla-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ke-jhoot-bolne-ka-aqeedah-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/qayamat-kis-tarikh-ko-aayegi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/aalam-e-khalq-aur-aalam-e-amr-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-ali-ko-mola-kehne-ka-kya-matlab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kon-se-gunah-bure-khatme-ka-sabab-ban-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/dance-ko-ibadat-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/tum-bhi-zaleel-aur-tumhare-farishte-bhi-zaleel-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jab-allah-ke-ilawa-dunya-mein-koi-nahi-tha-to-cheezon-ko-allah-ne-kaise-paida-farmaya",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-jinnat-jannat-mein-jayenge-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/naik-logon-ki-allah-ko-zaroorat-parti-hai-yeh-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/bar-bar-toba-aur-tajdeed-e-iman-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-qiyamat-ke-din-bete-ka-hisab-waldain-ko-dena-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/samajhdar-nabaligh-bacha-kufr-bol-de-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kuffar-ki-ibadat-gah-mein-jana-aur-un-se-relations-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-musalman-is-waqt-bible-ko-follow-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ke-liye-apni-taraf-se-alfaz-bol-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jannat-mein-mard-ko-hoor-milen-gi-tu-aurat-ko-kya-mile-ga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/tamam-ambiya-e-kiram-insan-aur-mard-he-hue-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-qayamat-ke-din-musalman-aur-kafir-ko-allah-ka-deedar-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/gautam-budh-aur-raam-krishn-ko-nabi-manne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ko-aashiq-kehna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-jagah-o-makan-arsh-waghaira-mein-hone-se-pak-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/zaroriyat-e-deen-aur-zaroriyat-e-ahlesunnat-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/zina-waghaira-haram-kaamo-ke-halal-hone-ki-khwahish-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/marne-ke-baad-insan-ki-rooh-kahan-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ke-noor-hone-ke-hawale-se-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jannat-mein-aulad-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/anbiya-e-kiram-ke-ilqa-aur-khwab-ki-sharai-haisiyat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/qayamat-se-pehle-barah-qureshi-khalifa-kaun-honge",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ahl-e-bait-ko-tamam-anbiya-e-karam-se-afzal-janne-wale-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-isa-aur-imam-mahdi-dono-alag-alag-shakhsiyat-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/chand-jin-ki-balaien-leta-hai-is-misra-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/shaitan-aag-ka-bana-hua-hai-tu-kya-use-aag-ka-azab-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kufria-baat-par-hansne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-tala-ki-taraf-satane-ki-nisbat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/walidain-e-mustafa-ke-mutaliq-aqeedah",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jannt-ke-char-darya-ka-naam-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kainat-kitne-dino-mein-banai-gai-aur-is-hawale-se-kya-tafseel-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/musalman-ka-apne-aap-ko-kafir-kehne-ka-sharai-hukum-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ko-ram-bhagwan-ishwar-aur-god-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hindu-mazhab-ki-tarah-apne-mathe-par-teeka-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-qayamat-ke-din-jawaron-aur-parindon-ka-bhi-hisab-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/v-4428-allah-ke-liye-peer-ka-lafz-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-ayub-ki-bimari-ke-hawalay-se-ghalat-fehmiyan",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-lohe-mehfooz-makhlooq-hai-ya-sift-e-ilahi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-farishton-ko-allah-pak-ka-deedar-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-hazrat-adam-sirf-nabi-the-ya-rasool-bhi-the",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jis-waswase-ka-pata-na-ho-ke-kufria-hai-ya-nahi-tu-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-hazrat-khizr-aab-e-hayat-peene-ki-wajah-se-zinda-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ke-liye-sochne-ka-lafz-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/darogha-e-jannat-aur-darogha-e-jahannum-farishte-hain-ya-nabi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-imam-mehdi-ka-zahoor-kab-hoga-aur-kis-tarah-ummat-ki-rehnumai-karege",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/musalman-aurat-ka-sindoor-lagana-ya-mangal-sutar-pehenna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/w-4406-pait-pooja-karlon-kehna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-musalman-aurtain-shadi-ke-baad-sir-mein-sindoor-laga-sakti-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-kisi-nabi-ko-allah-ka-ghulam-keh-sakte-hain-allah-ka-ghulam-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/nabi-pak-bhi-allah-pak-ke-mohtaj-hain-is-tarah-kehne-ka-sharai-hukum-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ko-kis-ne-paida-kya-shaitan-ka-waswasa-waswase-ka-ilaj",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ye-shair-pharna-kaisa-hum-tujhe-bhool-gaye-to-hamein-na-bhoolna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/huzoor-ke-ilm-e-gaib-ka-inkaar-karne-wale-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/azab-e-qabar-ka-inkar-karne-wale-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-jannat-mein-aurton-ko-bhi-allah-ka-deedar-ho-ga",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/maali-faide-ke-liye-apne-ap-ko-qadiani-zahir-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ke-liye-pachtane-ka-lafz-istemaal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-qayamat-ke-din-ungliyon-ke-naam-puche-jayenge",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ke-liye-hawas-ka-lafz-istemaal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ke-liye-shaida-ka-lafz-istemaal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/haroot-o-maroot-kon-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ke-yahan-der-hai-andher-nahi-kehna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/dam-aur-taweez-ki-sharai-haisiyat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jumme-raat-ko-diya-jalana-ke-buzurg-aayenge-kya-sahi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ke-liye-upar-wala-bolna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/post-viral-na-karne-par-waeid-sunana",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ke-liye-muzakkar-aur-zameer-ka-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-qayamat-ke-din-sab-be-libas-honge",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-ayub-ki-kor-ki-bimari-ki-haqeeqat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/gane-ke-kufriya-shair-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/iman-ki-shakhain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-farishtay-allah-ke-wali-se-kalam-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jinnat-ki-haqeeqat-aur-jinnat-par-iman-lana",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/nabi-ka-saya-nahi-tha",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ahle-bait-ko-masoom-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ke-liye-khaliqon-ka-khaliq-lafz-bolna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/afzaliyat-e-siddiq-e-akbar-hasab-nasab-khilafat-ya-wilayat-kis-aitbar-se-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/mayusi-kufar-hai-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hamzad-kise-kehte-hain-aur-kya-ya-jannumi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ko-tabib-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/duniya-mein-allah-ke-deedar-ke-mutaliq-nazriya",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/injeel-parhne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-pak-ko-god-upar-wala-aur-miyan-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/musalman-ke-marne-ke-bad-kiraman-katibin-kahan-jate-hain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/7-sala-bache-ka-kufar-o-imaan",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kafir-ko-marne-ke-bad-rest-in-peace-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/dawateislami-walo-ka-ahlebait-se-mutalliq-aqeeda",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/wahi-ki-7-soratain",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kisi-insan-ko-insani-roop-me-farishta-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kehna-mere-to-farishton-ko-bhi-is-ka-ilm-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-quran-pak-ke-umom-o-atlaq-se-sahaba-e-kiram-ka-istidlal-karna-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ummat-ko-ghaib-ki-kharbon-ki-itila",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kafir-bache-ka-hukum-aur-hazrat-ayesha-ke-nikah-par-atiraz-ka-jawab",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-khizar-nabi-hain-ya-wali",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/sari-kainat-nabi-ke-liye-banai-gai-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/ghir-nabi-ke-naam-ke-sath-alaihis-salam-parhna-ya-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/taqdeer-ke-likha-hua-se-khud-ko-majboor-samjhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazir-o-nazir-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/har-zoja-e-nabi-janati-janati-nara-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-abu-bakr-khalifa-awal",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-abu-bakr-ki-afzaliyat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/farishta-aur-shaitan-ko-maut-aana",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hamzad-ki-haqiqat",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-farmata-hai-khena-chahiye-ya-allah-tala-farmate-hain-kehna-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/hazrat-amir-muawiyah-par-aetaraz-ka-jawab",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/is-baat-ki-to-mere-farishton-ko-bhi-khabar-nahi-8962",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-har-insaan-ki-mout-ka-waqt-muqarar-hai",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/bachon-ko-masoom-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/jannat-mein-bila-hisab-dakhil-hona-10046",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/shaitan-ko-maut-kab-aye-gi-9208",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kaba-aur-masajid-allah-ka-ghar",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kisi-ko-be-iman-kehna-5839",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/azab-e-qabar-ke-munkir-ka-hukum-6314",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ko-ram-kehna-9419",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ko-hazir-nazir-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/deedar-e-elahi-6090",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/allah-ke-han-der-hai-andher-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/insan-kay-kandho-per-farishtay",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/har-kam-allah-ki-marzi-say",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/chaudhary-ka-lafz-istemal-karna-6350-b",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/peer-kafir-ho-to-mureed-bhi-kafir-kehna-kaisa-6350-a",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/dua-say-taqdeer-badal-jati",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/shohar-ko-majazi-khuda-kehna-4998",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/kya-allah-ko-khuda-keh-sakte-hain-4904",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/duniya-mein-jaagti-ankhon-se-deedar-e-elahi-4885",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/noor-naam-ka-matlab-1032",
-  "https://www.fatwaqa.com/ur/fatawa/aqaid/yazid-aur-abu-talib-1913",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/nabaligh-ka-baiat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/nemat-ko-auliya-ya-sahaba-se-mansoob-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/peer-ka-bad-aqeeda-khalifa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/40-din-poore-hone-se-pehle-chaliswa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/peer-ke-inteqal-ke-baad-bait",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/bhar-do-jholi-naat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/rabi-ul-awwal-mein-khana-taqseem-karne-ki-niyat",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ghairullah-ke-naam-ki-nazar-o-niaz",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/bad-mazhabon-se-talluq",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/milad-ki-sajawat-mein-christmas-lights",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kasrat-se-durood-parhne-ki-fazilat-kaise-mile",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/milad-manane-ki-waja",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/tasbeehat-o-azkar-ka-esal-e-sawab",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/masjid-ki-chhat-par-milad-ka-jhanda-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/moe-mubarak-ki-sanad",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/khare-hokar-durood-o-salam-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/auliya-ke-liye-nawafil-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/qabar-par-talqeen-aur-tilawat",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/dua-e-hizb-ul-bahr",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/waldain-ke-isale-sawab-ke-liye-nafil",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/shaban-mein-arfa-ki-fatiha-ki-shari-haisiyat",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/baiat-ke-liye-peer-ke-hath-mein-hath-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/nabaligh-bache-ko-isale-sawab-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/khatm-e-qadria-parhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/fatiha-khawani-mein-hukka-peete-hue-zikr-aur-dua-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/barish-ke-waqt-parhe-jane-wale-durood-pak-ka-hawala",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/nabaligh-bachon-ko-isale-sawab-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ambiya-aur-aulia-wisal-ke-baad-madad-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kya-aulad-ke-amal-ki-khabar-faut-shuda-waldain-ko-pahunchti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/sajawat-aur-juloos-e-milad-ki-wajah-se-namaz-ba-jamaat-chorna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/khatam-ke-waqt-khana-samne-rakhna-aur-khud-khana",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/namaz-e-janaza-ka-sawab-allah-ke-wali-ko-isal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/barsi-kis-din-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/auliya-allah-ke-liye-dua-e-maghfirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/soyam-wale-din-chano-par-fatiha-parhne-ki-haqeeqat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/sahib-e-mazar-se-allah-ki-bargah-mein-sifarish-ki-arz-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/9-10-muharram-ul-haram-ko-pani-ki-sabeel-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/isal-e-sawab-ke-liye-quran-mangne-par-3-baar-surah-ikhlas-parh-kar-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/chaliswa-ka-khatam-kab-karna-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/bare-ke-inteqal-par-khana-aur-bache-ke-inteqal-par-chalis-din-tak-doodh-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/islam-mein-wajd-ki-haisiyat",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/fatiha-aur-niyaz-ka-khana-kon-kha-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kya-ulama-o-mashaikh-qayamat-ke-din-apne-mureedo-ki-shafaat-kareinge",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/jin-ko-durust-quran-parhna-nahi-aata-un-ka-parha-hua-isal-e-sawab-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/chalte-phirte-wazifa-parh-kar-isal-e-sawab-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/mah-e-rajab-mein-tabarak-ki-niyaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/jo-wazifa-hadees-se-sabit-na-ho-wo-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ek-din-ke-bache-ko-bait-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/isal-e-sawab-aur-dua-e-maghfirat-mein-farq",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/mazar-par-jana-kaisakya-mazar-par-jane-se-koi-faida-hasil-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/machli-par-fatiha-dilana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/marhoom-walidain-ki-taraf-se-1-umrah-hoga-ya-2",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/chiraghan-ke-liye-chandi-ke-charagh-jalane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/namaz-e-ghousia-ki-haqeeqat-tartika-aur-aitraz-jawab",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ilaj-ke-liye-dam-ki-hui-dori-hath-paon-mein-bandhna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ghaus-e-pak-ke-qol-mera-yeh-qadam-har-wali-ki-gardan-par-hai-se-mutalliq-sawal",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ghaus-pak-raful-yadain-karte-the-tu-hanafi-kyun-nahi-karte",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ambiya-aur-farishton-ke-ilawa-koi-masoom-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ya-ghous-al-madad-kehna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/peer-sahib-ka-mukhtalif-silsilon-mein-bait-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/farishton-se-madad-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/12-rabi-ul-awwal-ko-khushi-manani-chahiye-ya-gham",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/hazrat-ali-aur-imam-hussain-ke-naam-ke-sath-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/tazeem-ki-niyat-se-mazar-par-chadar-charhana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ya-rasoolallah-kehna-kahan-se-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/naam-e-aqdas-sun-kar-anguthe-chumna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/allah-pak-se-dua-mangte-waqt-nabi-pak-se-istighasa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/esal-e-sawab-ki-qurbani-mein-janwar-ki-umar-kitni-honi-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/jis-wazifa-mein-ya-muhammad-ke-alfaz-hon-unko-kaise-parhein",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/mehfil-e-milad-karwane-ki-barkat",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/uthte-bethte-chalte-phirte-marhomeen-ko-isal-e-sawab-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/mazar-par-daig-charhane-ki-mannat-mani-to-kya-hukam-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/huzoor-ka-drood-sharif-sunna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/imam-shafi-ka-mazarat-par-jana",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/esal-e-sawab-karne-se-nekiyan-kam-nahi-hoti",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/peer-sharif-ka-roza-rakhne-se-mutaliq-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/miraj-shareef-kis-mahine-ki-kis-tareekh-ko-hui",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/niyaz-wale-mitti-ke-koondon-ko-dobara-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/imam-abu-hanifa-ko-imam-e-azam-kehne-ki-wajah",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/allah-ke-bandon-se-madad-mangne-se-mutaliq-hadees-pak",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ahlebait-ke-12-imamo-ke-mutaliq-ahlesunnat-ka-aqeedah",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/huzoor-ki-rooh-mubarak-ka-musalmano-ke-gharo-mein-maujood-hona",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/bachpan-mein-ki-gai-bait-torna-jaiz-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kya-aulia-e-kiram-ke-mazar-banana-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kya-huzoor-nafa-pahuncha-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/gunah-e-kabira-se-bait-toote-gi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/quran-me-hai-insan-ke-liye-wahi-hoga-jiski-usne-koshish-ki-to-kya-esal-e-sawab",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/recording-live-aur-messages-waghaira-ke-zariye-bait-hona",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/jo-khana-apne-liye-tayyar-kiya-ho-us-par-niyaz-fatiha-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/aik-din-ke-bachon-ko-mureed-banane-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/nabi-pak-ke-moh-e-mubarak-ko-ghusl-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/bayat-ki-shari-haisiyat-peer-ki-sharait-kia-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kya-ghair-muslim-ke-maal-par-fatiha-sharif-padh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/darhi-munde-shaks-ki-bait-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/allah-pak-ko-koi-naik-amal-esal-e-sawab-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kya-nabi-kareem-ko-mukammal-ilm-ghaib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/mazar-par-hazri-dete-hue-kitne-fasle-par-khara-hona-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kya-huzoor-noor-hain-aik-atiraz-ka-jawab",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/rabi-ul-awal-ke-moqe-par-juloos-nikalne-aur-pahariyan-banane-ki-sharai-hesiyat",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/jinnat-ko-esal-e-sawab-kiya-ja-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ramzan-ul-mubarak-me-din-ke-waqt-khane-par-fatiha-dilwana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/fout-shuda-ke-liye-umrah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/roz-e-hashr-kon-kon-shafaat-karega",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/qurbani-ke-ghost-par-gyarvi-shareef-ki-niyaz-dilwana",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/giyarwee-shareef-ki-niyaz-ki-barkatain",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kya-wasile-ka-saboot-quran-o-hadees-se-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/naqshe-nalain-pak-ki-fazilat",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/hayat-un-nabi-ka-aqeeda",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/rabi-ul-awal-ki-aamad-ki-khushi-me-nikalne-wale-juloos-mein-aatish-baazi-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kya-murdon-ko-aik-baar-esal-e-sawab-karne-se-baar-baar-un-ko-sawab-pahunchta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/nafil-namaz-ka-sawab-marhomeen-ko-isal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/sadat-e-kiram-esal-e-sawab-ka-khana-kha-sakte-hain-kya",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/bagair-wazu-fatiha-parh-kar-isal-e-sawab-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ek-waqt-me-do-jagah-baith-hona",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/bait-ka-matlab-aur-iske-fawaid",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/dua-e-ashura-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/bedari-me-deedar-mustafa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/allah-ke-wali-ke-liye-alim-hona-shart-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/mazar-ke-samne-sajde-karke-dua-mangna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/mazar-par-hazri-dene-ka-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/huzoor-ko-meraj-ka-dulha-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/syeda-fatima-ki-niyaz-kon-kha-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/zinda-shakhs-ke-wasila-se-dua-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ghair-allah-se-madad-mangna-shirk-nahi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/milad-ke-mahine-mein-atish-bazi-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/wh-2013-nabi-aur-farishte-ke-ilawa-kisi-aur-ke-naam-ke-sath-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kya-aulia-e-kiram-ghaib-ka-ilm-jantay-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kya-allah-ke-naik-bando-ko-wasila-banana-shirk-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kya-aik-peer-se-bait-hone-ke-baad-dosre-peer-sahib-se-bait-ho-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/mobile-ke-zariye-bait-hona",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/waseela-dena-kaha-se-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ghar-ya-masjid-ki-deewar-par-ya-muhammad-likhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/hazrat-fatima-ki-fatiha-ka-langar-mard-hazrat-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/fout-shuda-ka-wasila-pesh-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/naam-e-risalat-ya-gumbad-e-khazra-wala-cake-katna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/jis-mehfil-mein-huzoor-ka-zikar-ho-to-kya-ap-isme-tashreef-late-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/milad-ke-moqe-par-sajawat-ki-jagah-ghareeb-ki-madad-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/peer-sahib-se-bait-ki-sharai-haisiyat",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kisi-wali-ke-naam-ki-nazar-manna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kia-14-shaban-marhomeen-ki-eid-hoti-hai-aur-is-din-roohein-gharon-main-aati-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/rajab-mein-roza-na-rakhna-ki-hadees-sharah",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/har-sahabi-e-nabi-jannati-jannati-ka-nara-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/isha-ke-wazu-se-fajr-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/karamat-e-wali-ke-munkir-3217",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/aulia-se-direct-madad-mangna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/nabi-ke-naam-ke-sath-pbuh-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kapre-joote-jaye-namaz-isale-sawab-mein-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/wiladat-e-mustafa-ki-barkat-se-us-saal-aurton-ko-bete-ata-howe",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/fatawa-razawiya-tareekh-e-wiladat-8-rabi-ul-awwal",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/roza-e-rasool-ya-nalain-pak-ki-tasveer-aur-naqsh-banana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/eid-e-milad-un-nabi-sajawat-fuzool-kharchi",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/sahab-e-kiram-se-milad-manana-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/kondon-ki-niaz-3879",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/meraj-shareef-kahan-se-sabit-hai-aur-iske-munkir-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/nabaligh-ka-isaal-e-sawab-karna-6200",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ghous-pak-ke-name-ka-bakra-zibah-karna-7405-1",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/imdad-kun-imdad-kun-wale-ashar-5873",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/mehfil-e-milad-mein-dhol-baje-ka-hukum-6303-b",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/naad-e-ali-ka-suboot",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/azan-o-iqamat-se-pehle-durood-shareef-parhna-5731",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/12-rabi-ul-awal-youm-e-wiladat-ya-wafat-4964",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/giyarwee-ki-haqeeqat-4568",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/meraj-jismani-thi-ya-rohani",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/mazar-per-chadar-charanay-ki-mannat",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/gairullah-say-madad-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/dua-mein-nabi-ko-wasila-banana-6310",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/mayyat-chehlum-aur-niaz-ka-khana-4874",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/buzurgon-ke-name-par-janwar-khula-chorna-6136",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/allah-tala-ko-salam-bhijwana-kaisa-7470",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/ghair-nabi-ke-sath-alaihi-salam-likhna-5185",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/peer-ke-inteqal-ke-baad-kisi-aur-peer-se-mureed-hona-1016",
-  "https://www.fatwaqa.com/ur/fatawa/mamoolat-e-ahlesunnat/mazarat-e-auliya-par-chadar-4839",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gardan-ka-masah",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kapron-par-chipkali-charhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bagher-niyat-hath-dhona",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mustamal-hone-ka-shak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napaki-mein-janaza-gah-jana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-khane-ki-dua",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/polish-wali-lakri-pak-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/muqeem-moze-masah-karna-musafir-hona",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/musalman-hone-ke-baad-ghusal",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/farsh-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mian-biwi-ke-choone-se-wazu-ya-ghusal",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-ka-sunnat-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/barish-ke-pani-se-wazu",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/lohe-ki-tar-pak-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/30-din-baad-ruk-kar-11-din-baad-dubara-aana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kapron-par-khoon-ke-dhabbe",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mobile-screen-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/barish-aur-nali-ka-mix-pani",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/neend-ki-wajah-se-aankhon-se-nikalne-wala-pani",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-baad-kalma-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/jin-ka-aurat-se-humbistari-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/tanki-ka-pani-pipe-se-lagna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/line-ka-badbudar-pani",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bazar-se-liye-gaye-bartan-pak-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/be-wuzu-shakhs-ka-qurani-ayat-wale-taweez-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-kapron-ko-sabun-ya-sarf-se-dhona",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ihtilam-mein-mani-ke-2-qatre-nikle-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/dettol-mile-pani-se-wazu-ghusal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aala-laga-ho-tu-kaan-ke-masah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sookhne-se-pak-zameen-par-namaz-durust-tayammum-kyun-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/dukhti-aankh-ki-waja-se-aankh-ka-androoni-hissa-dhona",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kharay-pani-se-wazu-karna-kaisa-hai-jis-se-zang-ki-boo-arahi-ho",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kapre-ki-paki-napaki-maloom-na-ho-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/zinda-chuha-tanki-se-nikalne-par-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/neel-powder-mile-pani-se-wazu-ya-ghusal",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sirf-aage-istinja-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-aur-ghusal-mein-ungliyon-ka-khilal",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gaye-bhains-ki-jugali-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ka-pani-sukhne-ke-baad-tahiyyat-ul-wazu-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/shohar-ki-sharamgah-chhune-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusal-ke-baad-daant-mein-kuch-reh-jana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bache-ka-leak-diaper-ke-sath-carpet-par-chalna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sofa-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-qatre-mag-mein-girna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kapron-par-mani-lag-jaye-to-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-oil-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/peshab-ki-boo-rehne-par-kapre-ki-paki",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bathroom-mein-peshab-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-baad-aaza-ko-kapre-se-saaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-kapre-geele-hathon-se-pakarna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aankh-mein-mitti-jane-se-nikalne-wala-pani",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sabun-wale-pani-se-kapre-pak-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bache-ko-istinja-karwane-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/istinja-mein-ungliyon-ki-tadad",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/phorhe-phunsi-se-niklne-wala-pani",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gardan-aur-kanon-ke-masah-mein-hath-geele-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/neel-mile-pani-se-wazu-aur-ghusal",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/zukam-mein-farz-ghusl-ka-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bache-ke-peshab-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-ke-spray-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/haiz-ke-baad-ghusal-se-pehle-quran-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-mein-uzw-dhone-mein-shak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-mustamal-kab-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusal-mein-naak-mein-3-martaba-se-zyada-pani-dalna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/saaf-pani-mein-badbudar-pani-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/reeh-nikalne-ka-ehsas-hoto-wuzu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/machine-mein-napak-kapre-pak-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-se-allergy-hoto-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-kambal-orhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/junbi-shakhs-ka-naat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ghusl-mein-nakhun-ke-neeche-pani-bahana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/thande-pani-se-saans-ki-takleef-ho-to-tayammum-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/machli-wala-pani-kapron-par-lagna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/peshab-ke-baad-mani-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/shahwat-ke-baad-mani-peshab-ke-sath-nikle-to-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/baday-bartan-se-chullu-ke-zariye-pani-nikal-kar-wazu-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/dhelon-se-istinja-ke-baad-zikr-o-azkar",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/phore-phunsi-phorne-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-doran-wazu-torne-wali-cheez-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/dhoop-ke-garam-pani-se-wuzu-ghusal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/khushk-napak-seat-par-baithna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-qatre-chullu-mein-giren-to-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ihtilam-ka-nishan-sharamgah-par-ho-to-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chhote-bache-se-najasat-dhona-muzir-ho",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/nifas-ki-cheezen-dobara-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pichle-maqam-mein-jima-karne-se-ghusal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-kab-mustamal-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chappal-par-kutte-ki-raal-lagne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/second-floor-ka-napak-farsh-sookhne-se-pak-ho-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ungli-par-chhala-ho-to-wazu-ghusal-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kharab-khana-kapre-ya-jism-par-lagne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chehre-ke-dano-se-niklne-wale-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/haiz-mein-qurani-ayat-dum-karna-aur-dum-wala-pani-pina",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-mein-kan-ki-lo-aur-qalam-ka-darmiyani-hissa-dhona",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/fajr-ke-waqt-wazu-ki-jagah-tayammum-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/dry-eyes-se-behne-wale-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/zakhm-dhone-ke-baad-chipak-baqi-ho-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-deewar-paint-ke-baad-sookh-jaye-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/naqli-chamre-ke-mozon-par-masah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/khushk-napak-bistar-par-sone-se-pasina-aaye-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/doodh-se-kapre-pak-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/dhula-hath-balti-mein-daal-kar-wazu-ke-liye-pani-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/junbi-ke-kapdon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/hath-se-pani-thanda-garam-check-karne-se-mustamal-hone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bimar-shakhs-ko-wazu-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-mein-thori-dhona",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/2-mein-se-1-bacha-nikala-aane-wala-khoon-nifas-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/dirham-se-kam-najasat-par-napaki-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bewazu-shaks-ka-hath-dah-dar-dah-se-kam-pani-mein",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/haiz-ki-halat-mein-milad-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-hath-se-balon-mein-tail-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/suraj-ya-bulb-ki-roshni-se-niklne-wale-aansu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kanon-ka-masah-sunnat-muakkadah-hai-ya-ghair-muakkadah",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kutta-billi-kapre-se-lagne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/istinja-ke-doran-qibla-rukh-hone-ka-hukum-aur-zawiye-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/commode-tissue-ya-pani-se-pak-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/farz-ghusal-ke-baad-namaz-ke-liye-wazu-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-teen-baar-aaza-dhona-sunnat-muakkadah",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/podon-mein-gobar-ki-khad-dalna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aankh-ka-operation-hua-ho-to-wazu-o-ghusl-kaise-kiya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gol-hoz-dah-dar-dah-kab-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/asar-ya-magrib-ke-waqt-ghusl-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aag-par-garam-kiye-hue-pani-se-wazu-aur-ghusl-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/haiz-mein-shohar-ka-pichle-maqam-ko-choona",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ehtelam-ke-chand-qatre-kapdon-par-dikhe-to-kya-ghusal-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/palken-band-kiye-bagair-dekhne-ke-sabab-nikalnae-wale-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/hawa-khoon-nikalne-par-baghair-istinja-ke-wazu-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kapde-napak-hone-ki-sooratain",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-song-sunne-ke-baad-wazu-mustahab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusal-ke-baad-dant-se-boti-nikli-to-ghusal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/doran-ghusl-wazu-tootne-ke-baad-bagair-wazu-kiye-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-baad-lotay-mein-bach-jane-wala-pani-kharay-ho-kar-pina",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/zakham-musalsal-behta-hoto-namaz-kis-tarah-parhen",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-torne-wali-cheezen",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/naak-se-khoon-beh-raha-ho-aur-namaz-ka-waqt-kam-ho-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aankh-ke-operation-ke-baad-aankh-ka-masah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sugar-test-ke-liye-blood-nikalne-se-kia-wuzu-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gobar-najasat-ghaliza-hai-ya-khafifa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/nahane-ke-baad-bina-wuzu-namaz-aur-quran-prhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-machli-ki-beet-se-pani-napak-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wash-basin-par-hath-dhote-hue-kapron-par-cheentein-lag-gaye-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mozon-par-masah-jaiz-hone-ke-liye-wazu-ke-foran-baad-moze-pehnne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/waqt-ki-kami-ki-waja-se-tayammum-se-parhi-namaz-dubara-parhna-zaruri-kyun",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-mein-kiye-hue-wazu-se-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sharab-kapdon-par-lagi-to-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-kufriya-kalma-muh-se-nikalne-se-wazu-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mazoor-e-shari-namaz-ka-waqt-nikalne-se-mazoor-na-raha-to-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-hukka-ka-pani-napak-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kapre-par-lagi-kaunsi-najasat-dhoye-bagair-pak-hogi-aur-kaunsi-dhone-se",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/halat-e-janabat-mein-kapre-dhone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sharab-ka-nasha-utarne-ke-baad-ghusl-karna-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mobile-ya-kharish-ki-wajah-se-aankh-se-nikalne-wale-pani-se-wazu-tootta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ba-wazu-sone-ki-fazilat-kis-tarah-mile-gi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/treamer-machine-se-baal-saaf-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-baad-sir-ke-baal-kaate-to-wazu-aur-masah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-ke-doran-baat-karna-ya-koi-cheez-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gadhe-aur-khachar-ka-jootha-pani-mashkook-kyun",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/hath-paon-kate-hon-aur-chehra-zakhmi-ho-to-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/cheel-ka-anda-balti-mein-gir-jaye-to-pani-pak-hoga-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-tayammum-mein-darhi-ke-ghane-balon-ka-masah-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-hijama-karwane-se-ghusal-farz-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kapre-par-najasat-1-dirham-se-kam-ho-to-pak-kiye-baghair-machine-me-dalna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chhat-se-tapakne-wale-pani-ko-bathroom-mein-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gosht-dhone-ke-baad-pani-mein-dalne-se-jo-khoon-nikle-iska-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/cement-ki-deewar-se-tayammum-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sone-ke-liye-tayammum-karna-kaisa-jabke-pani-maujud-ho",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-mein-matti-aur-rait-ho-to-wazu-o-ghusal-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/junbi-shakhs-ke-pasine-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/hath-par-elfi-lagi-ho-to-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chehre-par-nikalne-wale-dane-phat-jaye-to-nikalne-wali-peep-aur-khoon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/junbi-shakhs-ke-dhule-hue-bazu-se-pani-lag-kar-balti-mein-gir-gaya-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/deh-dar-deh-hauz-ki-gehrai-ke-mutaliq-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-jism-par-cut-lagne-se-wazu-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sharmgah-mein-dukhool-kiye-bagair-inzal-ho-gaya-to-biwi-par-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-mein-seedhe-hath-se-paon-dhone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-ki-tanki-mein-kabootar-ki-beet-gir-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/jari-pani-kya-hota-hai-jari-pani-ki-tareef-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/na-baligh-se-pani-le-kar-wazu-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/najasat-par-baithne-wali-makhiyan-kapron-par-baithen-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-ki-tanki-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-washing-machine-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/geela-hath-kutte-ke-badan-par-lag-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sharbat-mein-ungli-dakhil-ho-gai-to-kya-is-ka-peena-makrooh-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/choti-tanki-mein-goh-gir-kar-mar-gai-to-pani-aur-is-se-kiye-gaye-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sharmgah-ko-hath-lagane-se-hath-napak-hota-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/saaf-shaffaf-pathar-se-tayammum-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-par-qadir-na-ho-to-aaza-e-wazu-par-masah-karne-se-wazu-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/peep-bahe-to-is-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kire-makore-pani-ki-tanki-mein-gir-jayen-tu-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gosht-dhote-waqt-gosht-kapro-par-lag-jaye-to-kya-kapre-napak-ho-jayen-gai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pant-par-mazi-ke-qatre-lag-jayen-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/geele-hathon-se-napak-kapra-pakar-liya-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sirf-mustamal-pani-maujood-ho-to-tayammum-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/hath-ya-paon-murne-ki-wajah-se-patti-bandhi-ho-tu-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bar-bar-ehtelam-ho-tu-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chappal-jorne-wala-chemical-hath-par-laga-reh-jaye-tu-wazu-aur-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/thori-najasat-wale-kapre-ko-pak-kapron-ke-sath-dhone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ink-wale-pen-ki-ink-hath-par-lag-jaye-to-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sabun-aur-shampoo-mein-napak-cheez-milne-ka-guman-ho-to-un-ke-istemal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/dirham-ki-miqdar-se-kam-peshab-ke-qatre-kapron-par-lage-hon-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/istinja-karte-waqt-paon-par-cheentein-lag-jayen-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/khare-ho-kar-peshab-karne-ki-surat-mein-ghusl-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kursi-par-bethe-bethe-ongh-aa-jaye-to-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chiknahat-lage-hath-napak-ho-jayen-tu-kaise-pak-karen",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kisi-ki-satar-dekhne-se-uzw-mein-sakhti-aa-jaye-tu-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aankh-ke-dane-se-nikalne-wala-mawad-wazu-tore-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sona-chandi-se-tayammum-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/badan-par-lagi-najasat-ko-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-mazi-nikalne-se-bhi-ghusal-farz-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aurat-se-baat-karte-hue-ehtelam-ho-jaye-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-ghusl-karne-se-wazu-bhi-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wash-basin-par-khare-ho-kar-wazu-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/jis-bartan-mein-kutte-ka-thook-gir-jaye-usay-dusre-bartanon-ke-sath-dhona",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/muh-napak-ho-jaye-tu-kaise-pak-karein",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pichle-maqam-mein-dawai-dakhil-karne-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/elfy-lage-hone-ki-soorat-mein-wazu-aur-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/taharat-ke-liye-najasat-ki-badbu-bhi-zail-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-e-janabat-aur-ghusl-e-juma-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gobar-wale-gamle-se-pani-nikal-kar-bahe-to-pak-hoga-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/khoon-agar-kapre-par-laga-ho-to-kapra-kitni-bar-dhona-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/be-wazu-shakhs-sirf-paon-dho-kar-moze-pehan-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/istinja-karne-ke-baad-qatre-aate-hon-to-namaz-kaise-padhe",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/istinja-karne-ke-kuch-dair-baad-wazu-kiya-to-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-ke-tayammum-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-nasha-karne-se-wazu-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-wazu-mein-bhawon-ke-ghane-balon-ki-khal-dhona-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-doran-kisi-kaam-ki-wajah-se-dhoya-hua-uzw-khushk-hojaye-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bure-khayalat-ya-bimari-ki-wajah-se-mani-nikle-tu-ghusl-aur-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/dane-se-peep-nikle-to-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-karne-ke-baad-dobara-mani-nikle-tu-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-carpet-par-gila-kapra-ya-paon-lagne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/zip-wale-moze-par-masah-ka-hukum-galti-ki-durustgi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bure-manazir-dekhne-se-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/hath-ke-zakham-mein-khoon-chalta-hua-dikhe-lekin-bahar-na-nikle-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kamzori-ki-wajah-se-mani-kharij-hogai-to-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/masjid-ya-ghar-ke-tank-ka-pani-mustamal-ho-jaye-tu-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pak-aur-napak-kapre-ek-sath-bhigodiye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-mein-kaan-ke-androni-hisse-par-pani-bahane-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/na-pak-gadde-ko-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aag-par-paki-hui-cheez-khane-ke-baad-wazu-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/peshab-karte-waqt-uthne-wala-dhuan-pak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-napak-zameen-pankhe-ki-hawa-se-khushk-ho-kar-pak-ho-jaye-gi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/tayammum-mein-niyat-kyun-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-ghubar-kapron-par-lag-jaye-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gari-ya-jahaz-ki-seat-par-beth-kar-sone-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/keeray-makoray-aur-makri-ke-khoon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bike-chalate-hue-aankh-se-nikalne-wala-pani-wazu-tore-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-ke-doran-jism-ka-koi-hissa-dhona-bhool-jana-aur-baad-mein-yaad-aana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/2-bar-hambistri-ki-tu-ghusl-kitni-bar-karna-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/zameen-aur-kapra-khushk-hone-se-pak-ho-jayenge-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/billi-ke-jhotay-pani-se-wazu-ho-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bache-ko-istinja-karwa-kar-hath-dhone-par-boo-khatam-na-ho-tu",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/phitkari-ya-namak-mile-pani-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mazi-ka-ek-qatra-ya-chand-qatre-kapde-par-gir-jayen-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/eent-par-napak-pani-gira-tu-khushk-hone-se-pak-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/hathon-par-shopper-chupak-jaye-tu-kya-wazu-ghusl-ho-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kamzor-ne-taqatwar-ke-kapre-pak-kiye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sar-ka-masah-karna-bhool-gaye-tu-kya-dobara-wazu-karna-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/nazla-zukam-ki-wajah-se-naak-se-pani-bahe-tu-kya-wazu-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/danton-par-khol-charha-ho-tu-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ac-ke-pani-se-wazu-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/cheel-kawwa-haram-parinde-hain-tu-in-ka-jhoota-makruh-kyun-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-karne-se-pehle-tasmiya-padhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-mein-sar-ka-masah-karne-se-pehle-ungliyan-chomna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-na-baligh-bache-ke-wazu-karne-se-pani-mustamal-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-farz-hone-ki-halat-mein-pak-kapra-ya-sweater-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/balon-aur-hathon-par-tail-lage-hone-ki-halat-mein-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/saib-khate-hue-us-par-khoon-ka-asar-zahir-ho-tu-is-se-wazu-tootega-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/istri-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/cheel-ki-beet-pak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-farz-hone-ki-halat-mein-arabic-dua-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/surkh-thook-hath-par-lag-jaye-to-kya-hath-napak-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/janwar-zibah-karne-ke-baad-gosht-mein-baqi-reh-jane-wala-khoon-paak-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kapro-par-nishan-dekhe-aur-ihtilam-hone-ka-waqt-maloom-na-ho-tu",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-baad-paon-ka-chamra-nochnay-se-wazu-toot-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-chuhe-ki-mengnia-girne-se-tail-napak-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/masjid-mein-ghusl-farz-ho-jane-par-chadar-bicha-kar-masjid-se-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/badan-ke-kuch-hisse-par-najasat-lage-to-kaise-pak-karein",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mazi-aur-wadi-khurachne-se-pak-hongi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-qatre-mug-mein-gir-jayen-tu-pani-mustaml-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/miyan-biwi-ki-sharmgah-milne-se-ghusl-wajib-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/janabat-ki-halat-mein-ayatul-kursi-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-kapra-nal-ke-neeche-rakh-kar-pani-bahane-se-pak-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/doodh-pite-bache-ka-peshab-pak-hai-ya-napak-hadees-pak-ki-wazhat",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/waterproof-jurabon-par-masah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/janabat-ki-halat-mein-khana-peena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/barish-ke-douran-nale-se-behnay-wale-badbudar-pani-se-wazu-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-cheez-ka-dhuan-kapron-par-lag-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kutta-kapra-chat-le-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chehre-ke-mahase-wazu-karte-hue-bahein-tu-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gas-ki-wajah-se-pait-mein-awazen-aayen-to-wazu-tootega-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kaan-ki-lo-wazu-mein-dhona-farz-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-ki-sunnatain",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-se-pehle-miswak-sunnat-muakkadah-hai-ya-ghair-muakkadah",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-kab-farz-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/tote-ki-qay-ulti-pak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/darya-ke-pani-se-wazu-aur-ghusl-karna-aur-darya-ka-pani-peena",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/danton-par-cap-laga-ho-tu-ghusl-ho-jaye-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/carpet-naapak-hojaye-tu-vacuum-karne-se-pak-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-farz-hua-magar-yaad-nahi-ke-kiya-hai-ya-nahi-tu-parhi-gai-namazon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/zere-naaf-baal-katne-se-ghusl-lazim-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/jhoot-bolne-se-wazu-toote-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chhale-se-nikalne-wala-pani-napak-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/hawa-kharij-hone-ke-baad-istinja-kiye-bagair-wazu-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kutta-kapron-se-touch-ho-jaye-tu-kya-kapre-napak-ho-jayenge",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/nabina-shakhs-namaz-mein-qahqaha-lagade-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-ki-tanki-se-chipkali-zinda-nikli-tu-is-pani-se-kapre-dhona-aur-wazu-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/farz-ghusl-mein-chehra-dho-kar-romal-se-saf-kiya-tu-kya-romal-pak-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/istinja-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghair-muslim-ke-istri-kiye-hue-kapre-pehen-kar-namaz-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gana-gane-ya-sunne-se-wazu-tute-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-ke-doran-reeh-kharij-ho-jaye-tu-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/hauz-ke-pani-mein-chirya-margai-tu-pani-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/balti-mein-napak-kapre-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/nazla-zukam-ka-pani-pak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mustaml-pani-se-badan-par-lagi-napaki-dhona-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/tank-ka-pani-mustaml-hone-ke-baad-us-pani-se-wazu-aur-ghusl-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bakri-ka-jhoota-pak-hai-ya-napak-aur-bakri-ki-jugali-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/qaleen-par-bacha-peshab-kar-de-to-us-ko-saaf-kar-ke-us-par-namaz-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/jism-par-najasat-ho-aur-us-par-6-qatre-baha-diye-tu-kya-jism-pak-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-mein-ungliyan-choom-kar-sar-ka-masah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-billi-ka-thook-pak-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-nazla-kapron-par-girne-se-kapre-napak-honge",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/khilaf-e-tarteeb-wazu-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-kapre-par-lage-sukhe-pakhane-ko-khurach-dene-se-kapra-pak-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/insan-ka-thook-pak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kapre-ya-badan-par-najasat-lag-jaye-to-kya-wazu-bhi-dobara-karna-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/dant-mein-gutka-wagaira-phans-jaye-to-ghusl-kaise-karein",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gele-hathon-se-nal-ya-imama-ko-chona-phir-in-hathon-se-masah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/tayammum-kya-hai-aur-kab-kiya-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-e-janabat-se-pehle-wazu-karte-hue-sar-ka-masah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-karte-hue-kaan-aur-naaf-ke-andar-pani-daal-kar-dhona-zaroori-hai-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gari-ki-seat-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/istinja-karne-se-hath-pak-ho-jayenge-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aankhon-mein-kajal-laga-ho-tu-kya-wazu-aur-ghusl-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ba-wuzu-shakhs-thandak-hasil-karne-ke-liye-ghusl-kare-tu-pani-mustaml-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/farz-ghusl-mein-bandhe-hue-baal-kholne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/farz-ghusl-mein-kulli-aur-naak-mein-pani-charhane-ke-baad-wazu-toot-jaye-tu",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/insan-ke-muh-ki-raal-pak-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-mein-patti-utar-kar-pani-baha-sakte-hon-lekin-utarna-bhool-jayein-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-farz-hone-ki-halat-mein-kaun-se-kaam-kar-sakte-hain-aur-kaun-se-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wh-5846-mattress-ya-gadda-napak-ho-jaye-tu-kaise-pak-karein",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mattress-ya-gadda-napak-ho-jaye-tu-kaise-pak-karein",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghair-muslim-ke-istemal-shuda-gadde-foam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-baad-yaad-aaye-ke-koi-hissa-dhulne-se-reh-gaya-hai-to-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/miswak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ashob-e-chashm-ke-sabab-aankh-se-musalsal-pani-nikal-raha-ho-to-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/jis-shakhs-ko-drain-pipe-laga-ho-us-ke-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/joota-napak-ho-jaye-tu-pak-karne-ka-kya-tarika-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chune-se-tayammum-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/balon-mein-girah-lagi-ho-tu-wazu-aur-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-farz-hone-ki-halat-mein-jism-ka-koi-hissa-pani-mein-parne-par-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/w-5709-ek-bartan-mein-kapde-dhone-ke-mutaliq-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-napak-bed-sheet-istri-karne-se-paak-ho-jayegi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kaan-se-nikalne-wale-pani-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/khare-ho-kar-wazu-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-baad-pani-pochna-chahiye-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kis-janwar-ka-jhoota-pak-hai-aur-kis-ka-ka-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/nakhun-mein-mail-ho-tu-farz-ghusl-ho-jaye-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chote-tank-mein-najasat-e-khafifa-gir-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/najis-jagah-ka-yaqini-ilm-na-ho-tu-ghalib-guman-karke-kapre-pak-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-karke-namaz-parhne-ke-baad-muh-mein-koi-cheez-maloom-hui",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sitr-e-aurat-dekhne-se-wazu-tootta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/halat-zukam-mein-baghair-kisi-marz-ke-surkhi-mael-ratoobat-nikalne-se-kya-wazu-tut-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-mein-miswak-kis-waqt-karna-sunnat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/shower-se-nahate-hue-cheentain-ur-kar-kapron-par-lag-jayen-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wh-5498-ghusl-kab-farz-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/agar-wazu-mein-koi-farz-reh-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aurat-mozon-par-masah-kar-sakti-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sar-par-teil-laga-ho-to-ghusl-ho-jaye-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/tarteeb-ke-sath-wazu-na-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-dukhti-aankh-se-nikalne-wala-aik-ansoo-bhi-wazu-ko-tor-dega",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-mein-khulli-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/tiles-se-tayammum-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/cockroach-ya-khatmal-kapron-par-mar-jayen-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/moza-kitni-miqdar-mein-phata-ho-tu-us-par-masah-nahi-ho-sakta",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aurat-ko-pehli-wiladat-ke-40-din-baad-pelahat-nazar-aaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-kutte-ka-pasina-na-pak-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/reeh-hawa-kharij-hone-na-hone-mein-shak-ho-to-kya-hukm-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/qibla-ki-taraf-munh-ya-peeth-karke-nahane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/peshab-ya-khoon-chamkne-ke-baad-pani-mein-hath-dalne-se-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/jis-bartan-mein-kutta-muh-dale-usay-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napaki-ki-halat-mein-dil-mein-quran-ki-tilawat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghori-ka-luab-agar-kapron-par-lag-jaye-to-kya-woh-kapre-napak-ho-jayenge",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/attach-bath-room-ya-ghusl-khana-banane-ka-islam-mein-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gadhe-aur-khachar-ke-joothe-pani-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/na-baligh-bacha-agar-pani-mein-hath-dal-de-to-pani-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bimari-ke-baghair-aankh-se-nikalne-wale-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/baghair-wazu-meelad-ki-mehfil-ya-mazar-par-hazri-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/qibla-ki-taraf-muh-kar-ke-ghusl-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/garmi-ki-wajah-se-mozay-utaar-diye-to-unhen-dobarah-pehan-kar-un-mozoon-par-masah-kya-ja-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/agar-mazi-kharij-ho-jaye-to-usse-dhoye-bagair-namaz-parh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/so-kar-uthne-ke-baad-kapre-par-tari-dekhi-to-ghusl-farz-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-naswar-se-wazu-toot-jata-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-rexine-ke-mozon-par-masah-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aaza-wazu-mein-paint-ka-nishan-ho-to-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/vote-wali-siyahi-lagi-hone-ki-halat-mein-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/tang-waqt-mein-wazu-karne-ka-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-baqi-rehne-mein-shak-ho-isi-halat-mein-namaz-e-janaza-parhadi-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-peshab-badan-par-sukhne-se-pak-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/peshab-se-nikalne-wali-bhap-kapron-ye-jism-par-lag-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sajda-e-shukar-ke-liye-tayammum-kya-to-kya-isse-namaz-parh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/tape-ke-zariye-chupki-hui-wig-par-masah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/water-proof-mascara-lagaya-ho-tu-wazu-aur-ghusal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ghusl-ke-baad-nail-polish-lagi-reh-gai-ho-tu-jo-namaz-parhi-us-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/breathable-nail-polish-lagai-ho-tu-wazu-aur-ghusal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aankhon-mein-lens-lage-hon-tu-wazu-aur-ghusal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/biwi-ko-chone-ya-bosa-lene-se-wazu-toot-jata-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/rait-se-tayammum-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/jis-bartan-mein-khinzir-ka-gosht-pakaya-use-dho-kar-istrmal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/na-maloom-pani-ki-cheente-kapro-par-lag-jayen-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-be-wazu-darood-pak-parh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aankh-se-nikalne-wale-pani-ke-mutaliq-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/danton-par-lage-tasme-ko-wazu-aur-ghusl-mein-utarne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gili-billi-ke-pak-ya-napak-hone-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/farz-ghusl-mein-bhole-se-koi-uzw-dhulne-se-reh-jaye-tu-ghusl-aur-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/machli-ka-khoon-pak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-baghair-niyat-ke-wazu-ho-jayega-aur-is-wazu-se-namaz-parhne-ka-kiya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-se-pehle-washroom-ja-kar-istinja-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-baad-kalma-padhte-hue-shahadat-ki-ungli-se-ishara-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-karte-waqt-tapakte-hue-qatron-se-kapron-ko-bachana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/zakham-se-peep-nikli-lekin-bahi-nahi-tu-wazu-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-aurat-ko-ghusl-ke-doran-chutiya-kholna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/agar-wazu-karne-mein-shak-ho-ke-kiya-tha-ya-nahi-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/murahiq-ka-be-wazu-quran-pak-chona",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wuzu-karne-ke-baad-nail-polish-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ahtilam-wale-kapre-pehen-kar-ghusl-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/khusk-napak-carpet-par-geele-paon-ke-sath-chalna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/peshab-ki-bareek-chinton-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/line-se-aane-wale-pani-mein-halki-si-bo-ho-tu-pani-pak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/nakhun-mien-mail-hone-ki-surat-mein-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/zukam-mein-aankh-se-pani-nikalne-se-wazu-toote-ga-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bandar-ke-juthay-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/khoon-ya-peep-aik-dirham-se-kam-nikla-to-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kapron-par-khoon-lag-jaye-to-kapre-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-so-kar-uthne-ke-baad-istinja-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-napak-sofe-ya-bed-par-baithne-se-kapre-napak-ho-jayen-ge",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/jis-skakhs-par-ghusal-farz-ho-kya-wo-finaye-masjid-mein-ja-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/namaz-e-janaza-ke-tayammum-se-doosri-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-garam-pani-se-wazu-karne-se-sardi-me-wazu-karne-ki-fazilat-mile-gi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chote-bache-ke-muh-se-nikalne-wali-raal-pak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-ghusal-se-pehle-wazu-karna-zaroori-hai-ghusal-ke-faraiz",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/beet-ko-dhone-ke-baad-us-ka-asar-reh-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/farz-ghusal-kar-ke-namaz-parh-li-ab-naak-mein-pani-dalne-me-shak-hua",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/doodh-peene-wale-bache-ka-doodh-bahar-nikalna-baby-milk-vomiting",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/billi-agar-khane-peene-ki-cheezon-me-mou-daal-dain-to-billi-ke-jhoote-ka-kya-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/humbistari-k-bad-haiz-a-jaye-to-humbistari-ki-waja-se-gunahgar-ho-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aik-paon-ke-mozon-jurabon-socks-par-masah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-ke-tank-me-chooha-gir-kar-mar-jaye-to-pani-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ande-ko-hath-lagane-se-wazu-kya-hukuum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-sirf-laitna-se-wazu-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/dirhum-se-kam-najasat-e-ghaliza-ko-dhone-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/cheenk-ki-wajah-se-ya-dua-me-rone-se-aansu-aa-jayen-tu-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/be-wazu-shaks-apna-be-dhula-hath-pani-me-dal-de-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chipkali-ki-beet-ka-sharai-hukum-ahkam-e-nijasat",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/najasat-par-paon-lag-jane-se-wazu-aur-ghusal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mazi-jism-ya-kapde-par-lagi-ho-to-namaz-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sharai-mazoor-namaz-ka-waqt-shuru-hone-se-pehle-wazu-karle-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sharmgah-ko-hath-lagane-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kursi-par-namaz-parhte-hue-neend-aa-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pyaz-katte-waqt-aankhon-se-niklne-wala-pani-wazu-tore-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ek-hi-mitti-par-bar-bar-tayammum-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bacha-bed-sheet-par-ulti-kar-de-to-us-ko-kis-tarah-paak-kiya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kharish-aane-par-khoon-ubhar-aaye-tu-kya-wazu-toot-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-gaali-dene-se-wazu-toot-jata-hai-wazu-ke-ahkam-wazu-ke-masail",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/machar-makhi-ke-kapre-ya-jisam-par-mar-kr-lag-jane-se-kapre-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-be-wazu-shakhs-dastane-gloves-pehen-kar-quran-pak-cho-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aurat-ke-sir-se-dupatta-utar-jaye-to-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/deewar-mein-lagi-tile-napak-ho-gai-tu-kya-khushk-hone-se-pak-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/blood-test-ke-liye-nikale-jane-wale-khoon-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-khushk-mazi-ko-khurach-kar-paak-kiya-ja-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aastin-ke-upar-se-pani-baha-lene-ki-soorat-mein-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-barf-se-wazu-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/so-kar-uthne-ke-baad-istinja-kiye-baghair-wazu-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chamre-ke-moze-socks-me-pani-dakhil-ho-jaye-tu-masah-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusal-ke-baad-jisam-par-mail-baqi-reh-jae-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/safar-ki-dua-ko-baghair-wazu-chona-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-o-ghusal-me-jisam-malne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mustamil-pani-se-istinja-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/homeopathic-liquid-dawa-kapre-wagaira-par-lag-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/leather-ke-moze-mein-pani-ki-tari-dakhil-hone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/oont-camel-ka-gosht-khane-ke-baad-wazu-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sharai-uzar-ki-halat-me-kya-aurat-quran-sun-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/makhi-machar-ke-khoon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mani-ki-sirf-aik-bond-he-shehwat-se-nikli-ho-to-ghusal-farz-hojaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-tail-se-napak-hone-wala-kapda-dhoya-lekin-chiknahat-reh-gai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-mustamal-hone-ke-baad-usay-qabil-e-istemal-banane-ka-tareeqa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ke-baad-jism-khushk-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/jism-ke-ghair-zaroori-baal-saaf-karne-ke-baad-ghusal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/joo-ka-khoon-pak-hota-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/makeup-ki-halat-me-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/petrol-pak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-se-bhari-tanki-me-lal-beg-mar-jaye-to-is-pani-ka-kya-hukum-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-kapde-pak-kiye-lekin-napak-pani-ki-khushboo-zail-nahi-hui-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/khwab-yaad-ho-lekin-kapron-par-nishan-na-ho-to-ghusal-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-zameen-khushk-hogayi-phir-isse-lagne-wala-pani-pak-hoga-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/namaz-ke-ilawa-napak-kapde-pehenne",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/najasat-wale-kapdon-ko-dhone-ke-baad-najasat-ka-nishan-reh-jana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/nifas-ki-waja-se-reh-jane-wale-roze-ka-fidya-kitna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-me-pore-sar-ka-masah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/jis-aurat-par-ghusl-farz-ho-aur-usay-haiz-aa-jaye-to-ghusl-kab-kare",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/roze-ki-halat-mein-aurat-ko-haiz-aana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/chhipkali-lizard-agar-body-ya-kapde-pe-gir-jaye-to-kiya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/hawai-jahaz-me-multani-mitti-ya-pathar-se-tayammum-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusal-se-pehle-wazu-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/jis-namaz-ke-waqt-mein-haiz-aaya-is-namaz-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/halat-e-haiz-mein-menstrual-cup-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-kapre-pak-karne-ke-baad-machine-mein-dalna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aurat-ke-ghusal-karne-ke-baad-aurat-ki-sharmgah-se-mard-ki-mani-nikli-tu-kya-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-karte-waqt-gas-kharij-ho-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/haiz-ki-halat-me-biwi-ka-bosa-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusal-ki-cheenten-balti-me-gir-jae-tu-kiya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/haiz-ki-halat-me-wazifa-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kiya-istihaze-ka-khoon-ruk-jane-se-ghusl-farz-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/beemari-me-kiya-gaya-ghusal-ka-tayammum-kab-tak-chale-ga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusal-ka-pani-tub-me-gir-jae-tu-us-pani-se-ghusal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ankhon-me-lens-lagane-se-wazu-or-ghusal-ka-hukum-aur-colour-wale-lens-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/balgham-ki-qay-se-wuzu-kiyn-nahi-toot-ta",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-mazi-se-ghusal-farz-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-shak-ki-wajah-se-wuzu-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/zakham-se-nikalne-wali-ratobat-pak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-aur-ghusl-me-aankh-ke-kone-dhone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mustamal-pani-se-wuzu-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-kapron-me-peshab-lag-jane-se-ghusal-lazim-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-foam-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-kapray-badalne-se-wazu-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-me-kulli-ya-naak-me-pani-dalna-bhool-gaye-to",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/lens-lage-ho-to-wazu-aur-ghusal-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-napak-tiles-bhi-khushk-hone-se-pak-ho-jati-hain",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-haiz-wali-aurat-azan-ka-jawab-de-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/halat-e-roza-me-biwi-ki-tasweer-dekh-kar-inzal-ho-jaye-to",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/plastic-ke-dastane-pehan-kar-be-wazu-quran-chuna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-ghusl-karne-ke-bad-wazu-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/nazuk-kapra-nichorne-se-phat-sakta-hai-to-pak-kaise-karen",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-pani-se-bana-gara-siment-istimal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-juan-ka-khoon-pak-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-late-kar-neend-ke-jhonke-aane-se-wazu-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kutta-jism-se-chu-jaye-to",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sharmgah-se-peshab-ke-qatre-zahir-ho-to-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kutta-kuan-me-gira-aur-zinda-nikal-liya-gaya",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/waqt-khatam-hone-ke-khoof-se-tayammum-ki-ijazat",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bache-ko-napak-kapra-dry-karke-wapas-pehnana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-bagair-shawat-ke-mani-nikalne-se-bhi-ghusal-faraz-hojata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-mitti-se-bana-hua-bartan-pakne-ke-bad-gila-ho-jaye-to-kya-phir-napak-ho",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/char-zano-baith-kar-sone-se-wazu-ka-masla",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bartan-pak-karne-ka-tarika-aur-haram-gosht-serve-karne-ki-job-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mazi-mani-aur-wadi-me-farq",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mustamal-pani-ko-paak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-leather-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/doodh-peete-bache-ki-ulti-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bathroom-mein-dua-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ihtilam-hona-yaad-ho-lekin-kapron-par-koi-asar-na-ho-tu-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/toote-ki-beet-pak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-ke-baad-mani-ka-qatra-nikal-aaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kapra-dhone-ke-baad-najasat-ka-nishan-khatam-na-ho-tu",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/moo-bhar-ulti-ke-zarrat-nigal-lene-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/makhsoos-ayyam-mein-tafseer-ko-chhuna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/qibla-ki-taraf-munh-ya-peeth-kar-ke-istinja-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-wet-wipes-se-bache-ka-badan-pak-ho-jae-ga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kya-sakht-sardi-ki-wajah-se-wazu-ghusal-ki-jagah-tayammum-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mozon-par-masah-karne-ki-muddat-kitni-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napaki-ki-halat-mein-pehne-hue-kapray-kya-napak-honge",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/miya-aur-biwi-ek-saath-ghusal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-ki-tanki-mein-khud-paida-hone-wale-pani-ke-keeron-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/pani-istemal-karne-se-dora-pare-to-tayammum-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/zakham-se-nikalne-wale-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/halat-e-haiz-o-nifas-me-tafseer-ki-kitab-pakarna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kapre-ke-mukhtalif-hisson-mein-dirham-se-ziyada-najasat-lagi-ho-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/jumbi-jis-cheez-ko-hath-lagaye-uska-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/halat-e-haiz-mein-ayat-e-durood-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bache-ko-doodh-pilane-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/machar-ka-khoo-paak-hai-ya-napaak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/duran-e-hamal-khoon-aye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/haiz-ka-ghusal-jumeraat-ya-jumma-ko-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/dirham-ya-is-se-zayed-insani-peshab-jism-ya-kapre-par-lage-to-namaz-aur-pak-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gela-hath-napak-towel-ko-halka-sa-touch-ho-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aurat-ka-makhsoos-ayam-me-moey-mubarak-ki-ziyarat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusal-me-aik-dafa-kulli-karna-aur-naak-me-pani-charana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusal-me-tanke-wali-jagah-dhoye-baghir-namaza-o-waghera-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gusal-farz-hone-ki-halat-me-mobile-dekh-kar-quran-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/haiz-ke-dino-me-aurat-ka-shohar-ke-qareeb-aana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/zakhm-par-patti-ho-to-ghusl-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/tattoo-bana-hua-ho-to-wazu-aur-toba-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/haiz-me-niyaz-ka-khana-banana-aur-khana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-ki-niyat-aur-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bagair-wazu-quran-ki-tilawat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/fakhta-aur-parindon-ki-beet-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/artificial-palak-lagana-aur-is-me-wazu-o-ghusal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/automatic-machine-se-kapre-pak-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mareez-istinja-na-kar-sakta-ho-to-taharat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ladka-ladki-kis-umar-me-balig-hote-hain",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mobile-me-quran-e-pak-ki-screen-ko-be-wazu-touch-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/wazu-ka-bacha-huwa-pani",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/zehni-mazoor-ki-paki-aur-napaki",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/patti-bandhi-ho-to-wazu-karen-ya-tayammum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-kapde-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/beth-kar-oonghne-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/cgm-sensor-laga-ho-to-ghusl-dena",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mustamal-pani-se-kapra-pak-karna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kapre-badalne-se-wazu-tutega-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/farz-ghusl-me-bache-ko-doodh-pilana",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/dhobi-muslim-nonmuslim-ke-kapre-ek-sath-dhona",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/honton-ki-papri-pani-me-girne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kutta-ka-luab-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/cold-cream-lagi-ho-to-kya-wazu-ho-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sharai-mazoor-kise-kehte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mani-pak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/haiz-me-wazu-karne-se-taharat",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/na-baligh-bache-ka-bewazu-quran-chhona",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/behta-khoon-gosht-ko-lagna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gusal-mein-nakhunon-ke-niche-wale-hisse-ko-dhona-8926",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ariyan-phat-jayein-to-wuzu-ka-hukum-6048",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/napak-bartanon-ko-torna-ya-pak-karne-ka-tariqa-6271",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/raste-ki-keechar-pak-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mazoor-e-shari-ki-tareef",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ghusl-ka-ek-aham-masla-9669",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/mozon-per-masah",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/janaza-kay-wuzu-say-deegar-namazen",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/darh-bharwany-me-wuzu-o-gusl",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/haiz-me-quran-sun-na",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/tayyamum-aur-namaz-ka-eada",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/attach-bath-me-dua-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/gair-zaroori-baal-saf-krna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/w-c-ka-rukh",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/namaz-ke-ilawa-qahqaha-lagane-se-wuzu-toot-jata-hai-1026",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/bagair-wuzu-touchscreen-quran-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kache-chawal-main-najas-pani-mix-1822",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/darhi-dhoney-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aurton-ko-mehndi-lagana-jaiz-hai5015",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/ek-mozay-par-masah-or-dosre-ko-dhona-durust-hai-6192",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/hont-se-pani-mustamal-hona-0254",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/kin-azah-se-pani-mustamil-nahi-hota-0251",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/laal-baig-pani-me-mar-jaye-0119",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/sharmgah-par-najasat-ki-tari-zahir-hona-12113",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/khoon-ki-nami-kapron-par-lagna-12085",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/hamal-me-nikalne-wala-pani-pak-hai-ya-napak-7464",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/khas-ayyam-mein-kalme-parhna-0104",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/makhsoos-ayam-me-quran-ki-taleem",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/toilet-ka-rukh-shumal-ki-taraf-4829",
-  "https://www.fatwaqa.com/ur/fatawa/taharat-ke-masail/aurat-ka-sar-ka-masa-4844",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/akele-parhne-wale-ki-iqtida",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-ki-azan",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-2-imam",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-samne-se-billi-guzarna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ki-sunnat-e-qabliya-chhootna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-asli-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nabaligh-par-sajda-e-tilawat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tashahhud-mein-ungli-uthana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ayat-e-sajdah-namaz-sajda-tilawat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namaz-makruh-waqt",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-mein-dua",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mukhtalif-kamron-mein-ek-hee-ayat-sajda",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-painche-sametna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-bhoolne-par-sajda-sahw",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-ki-tasbeeh-ghalat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/laahiq-rakaat-qiraat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-mein-tasbeehat-kam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-kitni-rakaat-karke-parhen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-muakkadah-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zohar-ki-sunnat-qabliya-do-do-kar-ke-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/napak-tissue-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamaat-dusri-rakat-ka-ruku-aur-sajda-sahw",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/takbeer-kehte-hue-ruku-mein-jana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-asli-se-guzarna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azaan-allahu-akbar-ki-raa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-ki-iqtida",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/duty-ke-sabab-sunnaten-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/host-toffee-ke-sath-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-mashhoor-dua-e-qunoot-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/baghair-qiyam-imam-ke-sath-ruku",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shari-mazoor-ki-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-bhool-kar-ada-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/huroof-mein-faraq-na-karne-wala-imam",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ayat-se-pehle-sajda-tilawat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safen-durust-karne-ka-elan",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-peeche-qiraat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sura-ikhlas-mein-wau-durust-na-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/banyan-fold-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salam-pherte-waqt-takbir-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gonga-insan-namaz-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-jamai-lena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/waldain-ki-qaza-namaz-aur-roze-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-thook-nigalna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnatein-torne-par-qaza",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chothi-rakat-ke-baad-khare-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-khilaf-e-tarteeb-qiraat-muqtadi-luqma-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnaton-ke-baad-yaad-aana-ke-farz-wajib-ul-iada-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/surah-fatiha-ya-surat-milaye-bagair-ruku-mein-jana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-bhool-kar-ada-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/soorat-se-pehle-qunoot-parh-lena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-mein-dunyawi-message-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-surah-fatiha-ki-ayat-2-martaba-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/eid-ki-zaid-takbeeren",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-mein-naak-zameen-par",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nafil-ki-jaga-salat-ut-tauba",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-namaz-ke-baad-buland-awaz-se-zikr",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fina-e-masjid-mein-masjid-ka-store-room-banana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sheeshe-ke-samne-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-ayat-sajda-ke-baad-sajde-mein-takhir",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-mein-shak-ho-to-dua-e-qunoot",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nabaligh-ki-imamat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-sahw-ke-baad-tashahhud-parhe-baghair-salam",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-sahw-ek-salam-ke-baad-kyun",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/baith-kar-azan-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imama-ke-baghair-topi-mein-namaz-parhana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ayat-sajda-se-pehle-sajda-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/pani-ki-tanki-mein-kauwa-mila-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ayat-e-sajda-ka-tarjuma-sunna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sahib-e-tarteeb-ka-fajr-ke-baghair-eid-ki-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/eid-ki-takbeerat-mein-rafa-yadain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dusri-rakat-ki-fatiha-se-pehle-sana-ya-tashahhud",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-ki-purani-chatai-aur-qaleen-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/choti-basti-mien-jumma",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/attahiyat-ka-lafz-reh-jana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-imam-ke-peeche-muqeem-muqtadi-ki-qirat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-erhiyan-kharhi-kar-ke-bethna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-oula-mein-darood-parhna-ya-pehli-teesri-rakat-mein-qada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajar-aur-asar-ke-baad-qaza-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/hateem-mein-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namazon-mein-takhir-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kamar-dard-bagair-ruku-sajda-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-aerab-ki-galti",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kon-se-wajib-chorne-pr-sajda-sahw-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-qirat-bhool-kar-aage-ya-peeche-se-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-imam-ke-peeche-muqeem-ki-qirat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamat-mein-2-rakat-milna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/wajib-ul-iadah-namaz-me-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-imam-ke-peeche-muqeem-muqtadi-ki-akhri-do-rakat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-khilaf-e-tarteeb-quran-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/madrase-ya-masjid-mein-cheez-rakh-kar-wapas-lena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-surah-fatiha-mein-galti",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asar-ke-waqt-zohar-ki-qaza",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shohar-namaz-na-parhe-to-wabal-kis-par",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ka-salam-pherte-hue-chehra-pherne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nafl-namaz-beth-kar-parhne-se-adha-sawab",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghalat-talaffuz-ke-sath-azan-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sirri-namaz-mein-buland-awaz-se-qirat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-namaz-mein-muqtadi-ki-kisi-ghalti-ka-bojh-imam-par-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-aakhri-rakat-mein-khare-ho-kar-wapas-ana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aasteen-ke-button-khule-hone-ki-surat-mein-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-mein-paon-ki-kitni-ungliyan-zameen-par-lagana-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ne-sajde-se-uthte-hue-bhool-kar-tasmee-kahi-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-asli-se-guzarne-aur-safar-karne-par-qasar-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-namaz-mein-surat-bhulna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/awwabin-ki-niyat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghar-mein-biwi-ke-sath-jamaat-se-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-surat-ki-tarteeb-bhool-jana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mazoor-e-shari-ka-namaz-se-pehle-kapre-pak-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-e-sahw-ke-baad-jamat-mein-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-e-tilawat-mein-kitne-sajde-hote-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-ke-bad-zohar-ki-sunnat-qablia-ki-niyat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asar-ki-namaz-ke-doran-waqt-khatam-hojana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mal-o-dolat-aur-karobar-ki-dua-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-tashahhud-ke-baad-salam-pherna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/saf-ke-darmiyan-fasla",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ki-namaz-ke-baad-takbeer-e-tashreeq-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/second-floor-par-saf-khali-ho-to-third-floor-par-namaz-prhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gunahgar-ghair-fasiq-mulin-ke-peeche-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/rakat-bhoolne-par-sath-wale-ko-dekh-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ke-liye-takbeerat-e-intiqal-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-mein-baithne-se-takleef-ho-tu-namaz-kaise-parhen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-sana-ke-baad-durood-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-intizar-mein-zikr-aur-tilawat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tashahhud-mein-paun-bichana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namazon-ko-ada-karne-ka-asan-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/train-mein-namaz-shuru-ki-aur-train-chal-gai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-ki-rakat-bhool-jayen-to-4-rakat-ek-sath-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bawuzu-shakhs-ka-masjid-aakar-kulli-karna-aur-paun-dhona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khinzeer-ka-baal-kapron-par-ho-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/arzi-rihaish-mein-watan-asli-ki-niyat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/saf-mein-nabaligh-samajhdar-bacha",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-namaz-mein-ek-surat-ki-takrar-makruh-kyun",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/napaki-mein-dikhawe-ki-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dusre-se-istikhara-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamaat-se-2-rakat-reh-jayen-to-kis-tarah-puri-karen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-ki-teesri-rakat-mein-qunoot-ya-attahiyyat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/be-jan-cheez-ki-tasveer-ke-samne-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ko-qada-akhira-ke-baad-uthne-par-luqma-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mard-ka-pait-aur-peeth-khol-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/banyan-pehan-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mohalle-ki-masjid-mein-jamaat-ho-jaye-to-namaz-kahan-parhen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/saf-ka-kinara-khali-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-dauran-torch-jalana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/thakawat-ke-sabab-ek-sath-5-namazon-ki-qaza",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dusri-jamat-ke-liye-iqamat-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tashahhud-mein-hath-ki-ungliyan-ghutno-se-neeche-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/iqamat-ki-niyat-dair-se-ki-to-qasar-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imamat-ke-liye-umar-aur-darhi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/92-km-ka-safar-ruk-ruk-kar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-ke-farz-bhoolne-par-qaza",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salam-ke-foran-baad-takbeer-e-tashreeq",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ke-din-safar-karne-wale-ki-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/maghrib-mein-awwabin-shamil-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-darood-e-ibrahimi-mein-sayyiduna-ka-izafa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/majnoon-ki-qaza-namazon-ka-fidya",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-e-sahw-ke-doran-jamat-mein-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ek-salam-ke-baad-jamat-mein-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-dono-hathon-se-kharish-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/eidgah-ki-taraf-jate-waqt-takbeerat-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dusri-rakat-mein-kuch-suraten-chhor-kar-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/saf-ke-beech-deewar-ya-sutoon-ke-darmiyan-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/wajib-ul-eada-namaz-ka-waqt-guzarne-par-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-shalwar-fold-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/eid-se-pehle-nawafil-makrooh-tahreemi-ya-tanzeehi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namaz-ke-baad-takbeer-e-tashreeq-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-ki-bijli-se-mobile-charge-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-mein-shamil-hone-ke-qiyam-ki-miqdar",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghalat-simt-mein-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-ke-baad-tahajjud",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-ka-baghair-takbeer-uthna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/baith-kar-iqamat-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gatar-ke-upar-bane-kamre-mein-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-ula-mein-bhool-kar-khare-hona-aur-lotna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/takbir-tahrima-mein-haa-ko-kheenchna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-quba-mein-do-rakat-ka-sawab",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/eid-ki-namaz-parhne-ke-baad-eid-ki-imamat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dua-se-qaza-e-umri-muaf",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salat-ul-tasbeeh-ki-aakhri-2-rakat-me-surat-milana-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-asr-me-buland-awaz-se-qirat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shari-musafat-mein-job-karne-wale-ki-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/munfarid-ka-witr-mein-buland-awaz-se-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ki-taraf-munh-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safar-mein-aayat-sajda-dohrane-par-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aakhri-qada-ke-baad-bhool-kar-khara-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/baghair-wazu-jamat-mein-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/apne-gaon-mein-15-din-se-kam-rehne-par-qasar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/iqamat-ke-baad-guftugu-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/do-afrad-ki-jamat-mein-do-aur-afrad-ka-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ki-seedhi-janib-iqamat-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mien-bina-karne-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghusl-farz-hone-ka-ilm-na-ho-aur-namazen-parhte-rahe-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/pichhli-saf-chor-kar-agli-pur-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-ki-aadat-bana-kar-us-ko-chorne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-salam-ka-jawab-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bhool-kar-najis-kapron-mein-namaz-parhana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/recorded-azan-ka-jawab",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nafil-ka-farz-qada-wajib-hojana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ramzan-qaza-namaz-70-ke-barabar",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-sajda-sahw-ke-baad-shamil-muqtadi-ki-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/takbeer-e-qunoot-mein-hath-uthane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-aur-jalsa-mein-paon-khare-karke-baithna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-namaz-ke-sath-qaza-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ka-imam-ke-peeche-kuch-na-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dua-e-qunoot-mein-alfaz-bhool-jana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-se-pehle-itar-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-ghunnah-ya-qalqala-na-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-bhool-ki-waja-muqtadi-ka-wazu",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-foam-wali-saf-par-aur-imam-musalle-par",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-ki-rakaton-mein-fatiha-ke-baad-tashahhud",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-ula-mein-shamil-muqtadi-imam-ke-uthne-par-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-qaumah-tasbeeh-bhoolna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/20-rakat-tarawih-se-zyada-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-jane-ya-rokne-ka-ishara-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqeem-ka-teesri-aur-chothi-rakat-mein-khamosh-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/baghair-shalwar-jubbe-mein-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-tilawat-ke-baad-usi-ayat-ko-dubara-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bache-ka-pehli-saf-mein-khare-hokar-luqma-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-se-pehle-durood-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ruku-mein-chala-jaye-aur-dua-e-qunoot-baqi-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-mein-all-out-liquid-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ke-sirf-farz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ki-namaz-qada-akhira-ke-baad-ek-rakat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/panch-waqt-ki-namaz-mein-zaid-takbeerain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-panjay-ke-bal-khara-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/maghrib-ke-waqt-ki-miqdar",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-farz-qayam-ki-miqdar",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-kitni-rakat-mein-qayam-farz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tarawih-mein-khatme-quran",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/uzr-ki-wajah-se-sajde-mein-peshani-na-jamna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-mein-imam-ka-ghalat-luqma-lena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shari-safar-mein-rukne-par-qasar-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-takbeer-inteqalat-der-se-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-aage-guzarne-wale-ka-sutra-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-jumma-mein-niyat-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dukan-ki-waja-se-jamat-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bagle-ki-beet-kapre-par-lagi-ho-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mard-ka-auraton-ki-imamat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-muakkadah-ki-char-rakaton-mein-tilawat-ki-tarteeb",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/attahiyyat-mein-se-kuch-bhool-jana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tarawih-aur-tahajjud-mein-farq",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zohar-misle-sani-mein-ada-karne",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-mein-jate-hue-kapra-upar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-reeh-rokna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/har-namaz-mein-sajda-e-sahw-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamaat-se-reh-jane-wali-tarawih-ki-adaigi-ka-waqt",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-tarawih-ke-aghaz-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-tasbeeh-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-ke-liye-namaz-taraweeh-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghusl-farz-hone-ki-halat-mein-sajda-e-shukr-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/hath-par-tattoo-bane-hone-ki-halat-mein-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqeem-musafir-imam-iqtida-qirat-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamat-mein-kuch-waqt-baqi-ho-to-sunnatain-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/seedha-hath-na-ho-tu-tashahhud-me-ungli-se-ishare-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/akele-namaz-padhne-wale-ke-liye-salam-pherne-ki-niyat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/12-rakat-nafil-parhne-ki-niyat-aur-10-par-salam-pherna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-durood-parhne-se-qaza-namaz-maaf-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safon-mein-mil-kar-kharay-hone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-sana-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qunoot-e-nazila-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-o-iqamat-mein-shahadat-par-ungli-uthana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-khutba-ya-taqreer-ke-doran-pehli-saf-mein-jakar-baithna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-mein-dua-e-qunoot-mukammal-na-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-durood-na-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-parhne-ke-baad-farz-parhne-wale-ki-iqtida-mein-nafil",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-nazla-saaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sone-walon-ke-peeche-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ande-aur-piyaz-ka-tail-laga-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sana-ke-sath-mazeed-aurad-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gheebat-karne-wale-ke-peeche-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ke-qada-mein-shamil-hone-se-jumma-hojata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/awwabin-ki-sana-aur-durood-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shari-safar-se-pehle-wapsi-ka-irada-hoto-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kursi-par-namaz-parhne-wale-ka-ruku",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-sajda-tilawat-ke-baad-wahi-ayat-parhi-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/wajib-ul-iada-namazen-aur-sahib-e-tarteeb",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumme-mein-ek-hee-shakhs-ka-khateeb-o-imam-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghar-ke-2-kamron-mein-ayat-e-sajda-parhne-par-kitne-sajde",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-ka-mehrab-ain-e-masjid-ya-fina-e-masjid",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/topi-mein-imamat-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kamzor-nazar-wale-ki-imamt",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-aur-sajde-ki-tasbeeh-teen-se-kam-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jis-charpai-ki-aar-mein-namaz-horahi-ho-to-uspar-baithna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/school-ki-wajah-se-namaz-qaza-ya-waqt-se-pehle",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-tahajjud-ki-namaz-sunnat-e-muakkadah-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ulta-kapra-pehan-kar-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-sujood-ki-tasbeeh-ek-dafa-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qadah-akhirah-mein-tashahhud-ke-baad-bhool-kar-khada-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-aur-wajib-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-tasbihat-unchi-aawaz-se-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ki-qirat-ki-awaz-dusre-tak-jana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salat-ul-tasbih-mein-teesra-kalma-kitna-padhen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-se-aankh-ko-nuqsan-ho-to-ishare-se-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zawal-ke-waqt-sajda-na-karne-ki-hikmat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-witr-ki-adaigi-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ke-baad-ke-aurad",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-baad-ayatul-kursi-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-mein-duya-ki-baten",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/waqt-shuru-hone-se-pehle-hee-namaz-parh-lena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/luqma-lene-se-imam-par-sajda-sahw-lazim-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-samne-table-ya-bed-par-bethna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witar-mein-qada-bhool-kar-kharha-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghair-muslim-se-masjid-ki-chhat-waghera-ka-kaam-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahiyatul-wazu-aur-tahajjud-ki-ek-sath-niyat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-aur-asar-ke-waqt-salat-ul-hajat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/village-mein-rehne-wala-musafir-kab-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-imama-topi-sahi-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/quran-khawani-mein-sajda-tilawat-kis-par",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-qada-mein-der-kare-to-muqtadi-ka-luqma-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/lait-kar-azan-ka-jawab-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-qabliyah-o-farzon-ke-mabain-nafil-namaz-ada-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jo-shakhs-darhi-mundwata-ho-iss-ki-azan-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bhule-se-teesri-rakat-mein-salam-phera-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jahri-namaz-ki-teesri-ya-chothi-rakat-mein-awaz-se-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khutbe-ki-azan-konsi-hoti-hai-neez-khutbe-se-pehle-sunnaton-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-ya-nafil-namaz-ke-liye-suraten-khas-karlena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/soft-foam-ya-carpet-par-namaz-parhne-se-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kano-mein-ungliyan-rakhe-baghair-azan-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-mien-machis-jalane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-aur-asar-ke-waqt-mein-sajda-tilawat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/5-rakat-farz-parhne-par-sajda-sahw-se-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-parhte-hue-fajr-ka-waqt-shuru-ho-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/char-rakat-wali-namaz-mein-do-par-salam-pher-diya-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ko-ghalat-luqma-dene-wale-muqtadi-ki-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-ki-dusri-manzil-mein-saf-banane-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaida-akheera-ke-baad-bhule-se-khara-hone-par-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-takbeerat-e-inteqalat-kehne-ka-sunnat-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kamzori-ki-wajah-se-qaza-namazain-baith-kar-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-namaz-aur-faraiz-ki-adaigi-na-karne-wala-jannat-mein-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/light-na-hone-ki-waja-se-azan-late-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sahib-e-tarteeb-ka-sari-zindagi-ki-namazain-dobara-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-mein-t-shirt-upar-uth-jaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ke-liye-iqtida-ki-niyat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-tilawat-mein-sajde-ke-bajaye-koi-ayat-parh-lena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-qirat-ke-doran-ya-sajde-mein-sar-hila-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safar-mein-jane-aur-lotne-par-qaza-hone-wali-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/alim-ka-ghair-alim-ke-peeche-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zakat-lene-wale-imam-ke-peeche-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/badin-se-karachi-rehne-aye-to-namazon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ayat-sajda-hijje-karke-parhne-se-sajda-tilawat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ayat-e-sajda-aur-uska-tarjuma-parhne-par-kitne-sajde-karne-honge",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-parhne-ke-baad-isha-ke-farz-fasid-hona-maloom-ho-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-sajda-sahw-bhoole-se-reh-jaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mian-biwi-mein-se-ek-namaz-mein-ho-to-dusre-ka-usay-bosa-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bachon-ko-pichli-saf-mein-bhejne-ka-ailan-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/marhhom-baap-ka-fidya-uski-beti-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-sahw-se-pehle-2-baar-tashahhud-parh-liya-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mobile-ring-kare-to-off-karne-keliye-namaz-torna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fairness-cream-ya-body-lotion-laga-kar-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/infradi-namaz-parhne-ke-baad-maghrib-ki-jamaat-mein-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-aurat-ke-zihar-karne-se-zihar-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bhool-kar-2-martaba-sajda-sahw-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ka-qada-ula-mein-tashahhud-ki-takrar",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/pehli-aur-teesri-rakat-mein-sajde-ke-baad-foran-khara-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-karte-hue-waswasa-aye-1-kya-hai-2-nahi-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-witr-dohrane-par-1-rakat-aur-milana-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-zarurat-se-zyada-unchi-awaz-mein-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shohar-ki-15-din-se-zyada-ki-niyat-ho-aur-biwi-ki-kam-to-kya-biwi-qasr-karegi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-paon-ki-ungliyan-chatkhane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mabsooq-pehle-salam-ke-baad-baqiya-namaz-ke-liye-khara-ho-ya-dusre",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-namaz-mein-sana-kab-parhe-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-mein-naak-par-nazar-rakhne-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namaz-mein-sajda-sahw-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kitni-namazain-chhot-jane-se-insan-sahib-tarteeb-nahi-rehta",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/doran-namaz-qatra-nikalne-ka-shak-huwa-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-aur-eid-ka-khutba-taweel-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ki-ijazat-ke-bagair-mukabbir-banne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/beth-kar-khutba-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ba-jamat-namaz-wajib-hai-ya-sunnat-muakkada",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ki-ek-rakat-mili-to-baqi-kaise-parhen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ac-wali-masjid-mein-sehan-ya-baramde-se-jamat-mein-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ne-panchwin-rakat-mein-qada-akhira-kar-ke-salam-pher-diya-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gaon-ki-abadi-shehar-se-mil-jaye-to-musafir-ke-liye-shehar-mein-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/akhbar-ya-risale-mein-ayat-sajda-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-mein-dua-e-qunoot-ki-jaga-surah-fatiha-ya-surah-ikhlas-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ke-liye-salam-pherne-ka-afzal-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/alag-namaz-parh-ke-dosri-bar-jamat-ke-sath-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-baad-ke-wazaif",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namazon-ko-parhne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-qirat-mein-jama-mutakallim-ki-zameer-ka-alif-na-parha-tu",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/larka-aur-larki-par-namaz-kab-farz-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bache-ke-kan-mein-kis-waqt-azan-den",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/na-baligh-ki-namaz-fasid-ho-jaye-to-kya-wo-dobara-parhe-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tashahhud-mein-baithne-ka-tarika-aur-chaukri-mar-kar-baithna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-waqt-koi-kaam-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/doran-e-namaz-chehre-ke-aage-rumal-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sayyiduna-ameer-muawaiya-ke-naam-par-masjid-ka-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ka-kalam-ke-zariye-luqma-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shari-mazoor-namaz-parh-raha-ho-aur-namaz-ka-waqt-khatam-ho-jaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-mein-naak-par-nazar-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-samne-se-bacha-guzar-jaye-tu-namaz-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-ke-waqt-salam-karna-aur-salam-ka-jawab-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jis-par-peshab-ke-baad-istibra-lazim-ho-us-ka-imam-banna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/behoshi-ki-halat-mein-kitni-namazain-reh-jayen-to-qaza-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-mein-sajda-sahw-nahi-kiya-tu-kya-namaz-dobara-parhni-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shari-mazoor-imamat-karwa-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-ek-rukun-mein-dono-hath-do-bar-uthane-se-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-namazi-ki-taraf-munh-karke-dars-o-bayan-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asbab-chor-kar-srif-dua-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-mein-agarbatti-jalana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-ki-namaz-shuru-karne-ke-baad-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-surah-fatiha-aur-surat-ke-darmiyan-kalma-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ka-qadah-ula-mein-bhoole-se-durood-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ki-jamaat-ke-doran-sunnatain-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ke-din-zawal-se-pehle-jumma-parhe-baghair-safar-mein-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-imam-apne-musafir-hone-ka-ailan-kab-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-teesri-rakat-mein-bhoolay-se-na-qirat-ki-na-dua-e-qanoot-parhi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-jumma-parha-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bus-ke-safar-mein-namaz-ka-waqt-aajaye-to-kya-kren",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safar-mein-sunnaton-ka-hukum-aur-ibne-umar-ki-riwayaat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-ko-jamaat-mil-jaye-to-qasr-behtar-hai-ya-jamaat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-ka-namaz-taraweeh-aur-sunnatain-chorne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-ke-liye-namaz-jumma-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-ka-maghrib-mein-qasr-karna-neez-sunnaton-aur-witr-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shari-musafir-jamaat-mein-shamil-ho-jaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-par-gumbad-banane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chikungunya-ka-mareez-namaz-kaise-parhe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/balon-mein-jel-lagi-ho-tu-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tankhwa-lene-wale-imam-ke-piche-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-aik-rakat-mein-2-suratein-milana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mareez-ka-baith-kar-qaza-e-umri-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zohar-maghrib-aur-isha-ke-farz-ke-baad-wali-sunnat-aur-nafl-ek-salam-ke-sath-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sahib-e-tarteeb-ki-namaz-fasid-hui-aur-baad-mein-maloom-hua-tu",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-mein-naak-ki-haddi-lagana-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghair-hafiz-ke-liye-tarawih-ki-namaz-parhne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-aur-iqamat-mein-kalma-shahadat-par-ungli-uthana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ayat-e-sajda-sunne-aur-imam-ke-sajda-karne-ke-baad-namaz-me-shamil-hone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-khud-iqamat-kahe-to-kis-waqt-musalle-par-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farzon-ke-baad-aur-sunnaton-se-pehle-kisi-ko-salam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-imam-ke-sath-kab-shamil-ho-to-rakat-pane-wala-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khud-istikhara-karna-ho-tu-kaise-kya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-o-iqamat-mein-daen-baen-dekhne-ki-wajah-o-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-surah-fatiha-ke-baad-ayat-ul-kursi-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mareez-kis-tarah-baith-kar-namaz-ada-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nabi-kareem-sajde-mein-kaun-si-duain-parhte-the",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-nakseer-phoot-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-doran-pasina-saaf-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-e-iqamat-se-dusre-shehar-gaya-to-muqeem-rahe-ga-ya-musafir",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-kisi-city-mein-1-mah-ka-qiyam-kare-tu-namaz-qasr-kare-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-teesri-rakat-me-muqeem-imam-ki-iqtida-kere-to-kitni-rakat-ada-kere-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-cheenk-aane-se-namaz-toot-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-pagal-par-jamaat-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ayyam-e-tashreeq-mein-qaza-namaz-ke-baad-takbeer-tashreeq-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-eid-ka-waqt-khatam-kab-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-muakkadah-mein-qiyam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-mein-hafiz-sahib-ka-madat-ka-khayal-na-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/waldain-7-saal-ke-bache-ko-namaz-ka-hukum-na-dein-tu",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/riyakari-se-bachne-ke-liye-ghar-mein-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khushu-ka-kya-matlab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-surah-fatiha-ke-baad-surat-milana-bhool-gaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-baith-kar-nafil-namaz-parhne-se-aadha-sawab-milta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-momin-ki-meraj-hai-kya-ye-hadees-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/garmiyon-mein-masjid-ke-sehan-mein-jamaat-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-andar-dua-mein-ghalti-karne-se-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-tashahhud-mein-shamil-imam-khade-hogaye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jaye-namaz-ya-topi-ko-ghair-muslim-ne-choo-liya-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-muqeem-imam-ke-peeche-aakhri-2-rakat-mein-shamil-ho-to-baqiya-kitni-rakat-parhe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-imam-ke-peeche-muqeem-muqtadi-sajda-sahw-kare-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-4-namazain-parhne-wale-ko-bhi-namazi-kaha-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bator-wazifa-ayat-e-sajda-20-bar-parhi-to-kitny-sajde-wajib-hon-gey",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ne-bhool-kar-imam-se-pehle-salam-pher-diya-to",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-aur-sajde-ki-tasbihat-ki-jagah-tasmiya-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/har-rakat-mein-alag-alag-ayat-milana-farz-hai-ya-aik-hi-ayat-parh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nabina-ko-masjid-le-jane-wala-mojood-ho-to-kya-jamaat-wajib-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-imam-ke-peeche-muqeem-muqtadi-ki-namaz-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dusri-rakat-mein-pehli-rakat-se-zyada-lambi-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/2-mukhtalif-shehron-mein-2-biwiyan-hon-to-shohar-ke-liye-qasar-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/paseene-wale-kapre-pehen-kar-masjid-jana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jaye-namaz-bichaye-baghair-zameen-par-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-ke-liye-darhi-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jin-namazon-mein-qiyam-zaroori-hai-kya-unki-qaza-mein-bhi-qiyam-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/2-sajdon-ke-darmiyan-kitni-dair-bethna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-sahw-ke-baad-imam-ki-iqtida-karne-wale-par-sajda-sahw-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/halat-e-namaz-mein-walida-ke-bulane-par-jawab-dene-se-mutaliq-hadees-ki-sharah",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aadhi-kalai-tak-charhi-hui-aasteen-namaz-ke-doran-neeche-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-imam-ne-4-rakat-namaz-parhai-muqeem-musafir",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-ki-muqeem-imam-ke-peeche-namaz-fasid-hogai-to-ab-kitni-rakat-parhe-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dua-e-qunoot-ke-liye-ruku-se-qayam-ki-taraf-palatna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-muqeem-ne-musafir-imam-ki-iqtida-ki-to-namaz-kaise-mukammal-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-se-pehle-imam-apne-musafir-hone-ka-elaan-karna-bhool-gaya-to",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-dusri-ya-teesri-rakat-mein-muqeem-imam-se-mila-to-baqi-namaz-kaise-ada-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gunah-ke-irade-se-sharai-safar-karne-wale-par-bhi-safar-ke-ahkam-honge",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-mein-naam-e-mubarak-sun-kar-durood-pak-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-mein-ruku-ki-tasbeeh-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-panchvi-rakat-ke-liye-imam-ke-sath-khara-ho-gaya-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqeem-ne-bhoole-se-isha-ki-namaz-qasr-parh-li-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ek-saal-ki-namazon-ka-fidya-dene-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-kehte-hue-wazu-toot-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-aage-se-koi-guzar-jaye-to-namaz-tordein-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zindagi-mein-namaz-ka-fidya-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-92-kilometer-par-pohanchne-se-pehle-safar-ka-irada-tark-kar-de-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/12-mah-ka-madani-qafila-karne-walon-ke-safar-se-mutaliq-mukhtalif-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sharai-musafir-ne-namaz-mein-qasr-na-ki-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-92-kilometer-se-pehle-hi-wapsi-ka-irada-kar-le-to-musafir-nahi-rehta",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-jaan-bujh-kar-qasr-na-kare-to-gunahgar-hoga-aur-namaz-wajib-ul-iada-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/lakri-ki-jaye-namaz-par-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mubaligh-ka-namazi-ki-taraf-muh-kar-ke-dars-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safar-mein-qaza-hone-wali-namaz-kaise-ada-karen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-asli-jate-hue-raste-mein-poori-namaz-parhenge-ya-qasr",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qasr-aur-poori-namaz-parhne-mein-kaun-se-waqt-ka-aitibar-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sharai-safar-mein-kitni-dair-theherna-safar-ko-munqata-kar-dega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safar-ke-doran-mulaqat-karne-ruka-tu-musafir-rahe-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kisi-jagah-jane-ke-2-raste-hain-to-kis-raste-se-jane-se-sharai-musafir-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/admi-apne-watan-asli-mein-dakhil-hote-hi-muqeem-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-iqamat-mein-saman-rakha-ho-to-phir-bhi-shari-safar-se-batil-ho-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/matboo-ki-niyat-ka-aitibar-hai-neez-tankhwa-dar-aur-dehari-dar-mulazim-ke-hukum-mein-farq",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/waldain-dusre-shehar-aur-biwi-bache-alag-rehte-hon-na-wo-jagah-jaye-wiladat-ho-to-kya-wo-watan-asli-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dusre-mulk-ki-nationality-hasil-karne-se-wo-mulk-watan-asli-bane-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jis-shehar-mein-mulazmat-ki-wajah-se-rehta-ho-wo-watan-asli-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ek-shehar-ke-mukhtalif-mohalle-ek-jagah-ke-hukum-mein-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-ki-iqsam-aur-un-ke-ahkam-watan-sukna-ka-aitibar-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-e-iqamat-kin-cheezon-se-batil-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ba-jamaat-namaz-mein-mobile-ki-ringtone-band-karne-ke-liye-namaz-torna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-parhne-ka-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-ka-jawab-dene-par-kitni-nekiyan-milti-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jo-mareez-bistar-par-ho-aur-harkat-na-kar-sake-uske-liye-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafat-e-shari-tak-pahunchne-se-pehle-laut-aaya-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-iqamat-sirf-safar-ki-niyat-se-nahi-balke-bil-fail-safar-karne-se-batil-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-asli-se-dusri-jagah-mustaqil-shift-ho-gaya-tu-watan-asli-batil-ho-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurat-shohar-ke-sath-dusre-mulk-chali-gai-to-mayke-aur-sasural-mein-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-ke-liye-waqf-kiya-hua-plot-bech-kar-dusri-jagah-masjid-banana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-mard-ke-liye-sasural-aur-biwi-ke-liye-maika-watan-asli-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ke-khutba-ke-doran-khateeb-ki-taraf-dekhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-iqamat-watan-asli-watan-iqamat-aur-safar-shari-se-batil-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mustamal-pani-se-wazu-karke-namaz-parhli-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-asr-se-pehle-shukrane-ke-nawafil-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/5-din-ke-liye-abai-ghar-aane-wala-namaz-mein-qasr-kare-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-agar-faut-ho-jaye-to-uski-qaza-kaise-ki-jaye-gi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jis-masjid-mein-3-waqt-ki-jamaat-hoti-ho-wahan-jumma-qaim-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-ne-15-din-theharne-ki-niyat-ki-aur-achanak-kaam-par-gaya-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ka-bhoole-se-allahu-akbar-ki-jagah-kisi-aur-kalme-se-namaz-shuru-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-kamar-par-hath-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-takbeer-e-inteqal-ke-andar-akhri-kalme-ko-khenchna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/niyat-e-iqamat-ke-liye-shart-hai-ke-wo-jagah-iqamat-ki-salahiyat-rakhti-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqeem-hone-ke-liye-din-ki-bajaye-raat-guzarne-ki-niyat-ka-aitbaar-kyun",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ke-khutba-ke-doran-baat-cheet-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namaz-parhne-wale-ke-liye-takbeerat-e-tashreeq-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-ka-ek-hi-shehar-ke-kai-maqamat-par-qayam-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/subah-ke-waqt-masjid-ke-speaker-par-zikar-o-naat-khwani-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-hasan-ko-sikhai-gai-dua-e-qunoot-witr-mein-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-eid-ki-namaz-akele-ada-ki-ja-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/takbeer-e-ruku-buland-awaz-se-na-kahi-to-imam-par-sajda-sahw-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jaan-boojh-kar-namaz-qaza-karne-ka-gunah-aur-azab",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imama-bandh-kar-aur-miswak-kar-ke-namaz-parhne-ka-sawab",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/uzr-ke-sabab-paon-ki-ungliyan-zameen-par-na-lagne-wale-shakhs-ke-piche-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/iqamat-ki-niyat-mein-15-din-ki-tayeen-ki-wajah",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ki-dusri-azan-ka-jawab-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ki-namaz-khutba-dene-wala-parhae-ya-koi-aur-bhi-parha-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-ki-sunnat-e-qabliya-mein-bhool-kar-2-rakat-par-salam-pherna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-sirf-bismillah-parhi-to-kya-farz-ada-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-ki-namaz-mein-tahiyatul-wazu-ki-bhi-niyat-karli-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/15-din-rehne-ki-niyat-hatmi-na-ho-shak-ho-to-kya-musafir-muqeem-ban-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/doran-e-namaz-parinda-beet-karde-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/23-zilqad-ko-makkah-pahunchne-wala-haji-namaz-mein-qasr-karega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jis-basti-ki-abadi-shehar-ke-sath-muttasil-ho-kya-wo-shehar-ke-hukum-mein-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-musafir-sharai-banne-ke-liye-shehar-ka-bypass-cross-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-jis-simt-ja-raha-hai-usi-simt-shehar-ki-had-khatam-hone-ka-aitibar-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shehar-ki-jis-taraf-se-ja-raha-hai-us-simt-ki-abadi-se-nikal-jana-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safar-ki-musafat-92-kilometer-hone-par-dalail-aur-3-meel-wali-hadees-ka-jawab",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/wazu-karne-wale-ki-masah-karne-wale-imam-ke-peeche-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jis-ka-khatna-nahi-hua-uski-namaz-aur-rozo-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnaton-ki-qaza-hai-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/attahiyat-mein-mashhoor-dua-ke-ilawa-koi-aur-dua-e-masura-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-ala-hazrat-ne-masjid-mein-loudspeaker-ke-istemal-se-mana-farmaya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-2-rakat-wali-namaz-mein-qada-kiye-bagair-khara-ho-jaye-to-luqma-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/pehli-rakat-mein-surah-asr-aur-dusri-rakat-mein-surah-humazah-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-qada-ula-na-karna-phir-luqma-milne-par-bethna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-jumma-mein-log-zyada-hon-to-sajda-sahw-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ka-waqt-tang-ho-to-ghusl-kiye-baghair-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-fina-e-masjid-mein-bhi-azan-dena-makrooh-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-sunnat-chootne-par-namaz-dobara-parhna-mustahab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-teesri-rakat-mein-surat-na-milana-aur-takbeer-ke-liye-hath-na-uthana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ruku-se-khare-hone-ke-baad-konsi-tasbeeh-parhe-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ko-hath-wale-pankhe-se-hawa-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaida-akhira-mein-1-se-zyada-duain-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jehri-namaz-mein-bhole-se-ahista-surah-fatiha-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/92-kilometer-ka-fasla-kahan-se-shumar-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-ka-sharai-safar-kab-shuru-hota-hai-aur-kab-khatam-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sharai-safar-kitne-kilometer-ka-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-ghair-muakkadah-ko-sunnat-e-muakkadah-ke-tarike-par-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/maghrib-ki-jamaat-ki-2-rakat-reh-jayen-to-in-mein-attahiyat-parhein-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-se-pehle-bhool-kar-witr-ki-niyat-karli-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-ki-kuch-rakatein-sehri-ke-waqt-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zuhr-ya-isha-ki-sunnat-e-qabliya-waqt-shuru-hone-se-pehle-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ki-dua-e-qunoot-poori-hone-se-pehle-imam-ruku-mein-chala-jaye-to",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/siyah-khizab-lagane-wale-ki-imamat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-janaza-mein-sana-durood-aur-dua-buland-awaz-se-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-dunyawi-khayalat-aane-se-kya-namaz-toot-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-ki-jagah-qaza-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/band-chulhe-ke-samne-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-sahib-ka-wazu-tootne-par-dusre-namaziyon-ko-namaz-torne-ka-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ek-shehar-mein-2-jagah-rukne-ki-niyat-ho-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-mein-ayat-ka-ek-lafz-chootne-par-faqat-usi-ayat-ka-iada-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safar-kar-ke-3-mukhtalif-shehron-mein-jana-hai-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-muakkadah-aur-ghair-muakadah-ki-adaigi-mein-kya-farq-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-dohrane-ke-liye-iqamat-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-doran-sar-se-topi-gir-jaye-tu-usay-utha-sakte-hain-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghar-mein-ek-se-zyada-masjid-bait-banana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shafi-imam-ke-peeche-hanafi-ki-namaz-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-qiyam-ki-halat-mein-hath-bandhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sahib-e-tarteeb-ne-qaza-na-parhi-aur-agli-namaz-shuru-kardi-to-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ki-baen-janib-khare-ho-kar-iqamat-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ramzan-ke-ilawa-witr-jamaat-se-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/hostel-se-2-ya-3-din-ke-liye-ghar-jayen-tu-namaz-poori-parhen-ya-qasr",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ke-baad-ki-4-sunnatain-muakkadah-hain-ya-ghair-muakkadah",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ishraq-aur-chasht-ki-fazilat-kya-hai-aur-kis-ko-hasil-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamaat-ke-liye-iqamat-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/waqti-namaz-ada-karne-wale-ke-peeche-qaza-namaz-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ayat-sajda-ke-baad-sajda-na-kiya-akhir-mein-3-sajde-kar-liye-tu",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-janaza-mein-bhole-se-sana-ki-jagah-surah-kausar-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/eid-ki-namaz-ki-imamat-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/eid-ki-namaz-masjid-mein-ada-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namazon-ki-tadad-yaad-na-ho-to-kaise-ada-karen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-samay-ke-ilawa-koi-aur-shakhs-luqma-nahi-de-sakta",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gair-arabi-mein-khutba-parha-to-jumma-ki-namaz-ho-jayegi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jaib-mein-tasveer-ho-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nafil-namaz-ki-pehli-rakat-beth-kar-aur-doosri-khare-hokar-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-ki-4-rakat-reh-jayen-to-kya-qaza-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-se-pehle-salam-pher-kar-dobara-imam-ke-sath-salam-pherne-par-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ek-imam-ka-2-jagah-farz-namaz-ki-imamat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/unchi-jagah-namaz-parhne-wale-ke-samne-se-guzarna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-ki-namaz-parhe-bagair-sone-ke-baad-uth-kar-tahajjud-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/akele-namaz-parhne-wala-surah-fatiha-ke-baad-ameen-kahe-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nange-sar-aur-painchay-takhne-se-neeche-latka-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-se-pehle-witr-ki-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghalat-luqma-dene-wale-ki-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-agar-bhule-se-4-rakat-ki-niyat-se-qasr-namaz-ada-kare-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-ki-namaz-ke-darmiyan-waqfa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-taraweeh-mein-sajda-sahw-kab-wajib-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-ki-azan-ke-baad-sona-phir-uth-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/3-rakat-taraweeh-parhane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-ghair-muakkadah-ki-teesri-rakat-ke-shuru-mein-ek-baar-tasbih-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namazein-zyada-hon-tu-parhne-ka-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ishraq-aur-chasht-ki-namaz-ka-time-aur-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-piche-janwar-ki-tasveer-wala-school-bag-ho-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tarawih-mein-ek-sath-20-rakat-ki-niyat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/20-rakat-se-kam-tarawih-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/lahore-se-attock-ja-kar-wapas-lahore-ek-hafte-ka-qiyam-ho-to-namazon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/logon-ke-samne-qaza-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajar-ki-qaza-namaz-mein-niyat-kis-tarah-karen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/akele-namaz-parhne-wale-ne-tarawih-ke-imam-se-ayat-e-sajdah-suni-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jis-musalle-par-simt-e-qibla-dikhane-wala-compass-laga-ho-us-par-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-mein-dekh-kar-quran-pak-se-tilawat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sana-parhne-mein-takheer-kardi-aur-imam-ne-buland-awaz-se-qirat-shuru-kardi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-jamaat-se-na-parhi-to-witr-jamaat-se-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khare-hokar-namaz-parhne-mein-dil-nahi-lagta-to-beth-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mutafarriq-tor-par-92km-se-ziada-safar-karne-wala-musafir-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nafil-ya-sunnat-namaz-ke-sath-qaza-namaz-ki-niyat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tisri-rakat-mein-qada-ola-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sana-se-pehle-tauz-o-tasmiyah-parh-li-to-ab-sana-parhe-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-liye-imamat-ki-niyat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/iqamat-kehne-wala-kahan-khara-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-khauf-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aulad-ko-masjid-intizamia-mein-rakhne-ki-shart-par-zameen-waqf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ayat-sajda-baar-baar-parhne-per-har-bar-sajda-e-tilawat-wajib-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ek-rukun-mein-3-martaba-paon-utha-kar-khujane-se-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/maghrib-ki-namaz-mein-bhoole-se-4-rakatein-parh-lena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-2-aadmi-mil-kar-tarawih-parha-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunan-o-nawafil-ghar-mein-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-ki-pehli-rakat-mein-qirat-na-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/hafiz-imam-ka-din-ke-nawafil-mein-buland-awaaz-se-quran-sunana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/lakdi-aur-gare-se-bani-hui-masjid-nai-banai-tu-purani-lakdi-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-salam-mein-kon-se-alfaz-kehna-sunnat-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-jaan-bujh-kar-2-raku-karke-sajdah-sahw-karle-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/4-nafil-ki-pehli-2-rakat-mein-wajib-choot-jaye-tu-sajdah-sahw-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/moazzin-ki-mojoodgi-mein-imam-ka-kisi-doosre-ko-iqamat-ka-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-sanp-bichu-marne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-watan-e-iqamat-mutlaq-safar-se-batil-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/doran-e-namaz-bache-se-glass-le-kar-side-mein-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namaz-mein-takhfeef-ka-hukum-aur-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-doran-peshab-ke-qatray-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bimari-ki-wajah-se-sajde-mein-ghutno-se-pehle-hath-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-surah-fatiha-ke-baad-dobara-surah-fatiha-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-kiye-baghair-bhool-kar-panchwi-rakat-ke-liye-khara-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-mein-dua-e-qunoot-ki-jagah-ayatul-kursi-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/akele-farz-parhne-ke-baad-jamaat-qaim-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/surat-milana-bhool-gaye-aur-sajde-mein-yaad-aaya-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-namaz-ki-niyat-kaise-karein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/junbi-ayat-e-sajda-sun-le-to-sajda-e-tilawat-lazim-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-sath-ruku-mein-shamil-hote-waqt-takbeer-ke-liye-hath-na-uthana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ki-azan-ke-baad-tahajjud-ada-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-ke-doran-namaz-shuru-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-ayat-e-sajda-parhi-lekin-sajda-karna-bhool-gaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-mein-stall-laga-kar-cheezein-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/operation-ke-baad-bila-wazu-ya-baith-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-quba-mein-nafil-parhne-ka-sawab",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/haram-sharif-mein-namaz-parhte-hue-kaba-ko-dekhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-tahiyatul-wazu-sunnat-e-qabliyah-ada-karne-se-ada-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-parhte-hue-naat-sunna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/joota-pehan-kar-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aise-imam-ke-piche-namaz-padhna-jis-ka-talaffuz-drust-na-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-ki-ek-rakat-baqi-thi-magar-bhool-kar-imam-ke-sath-salam-pher-diya-tu",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namaz-ki-aakhri-2-rakat-mein-qiraat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-mukhtalif-rakaton-mein-kharish-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-qirat-mein-ghalti-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jaye-namaz-ko-khula-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sana-bhool-kar-taawwuz-o-tasmiyah-parh-li-tu-ab-sana-parh-sakte-hain-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-sahw-sunnat-o-nafl-mein-bhi-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bila-zaroorat-mukabbir-banna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-jumma-ki-sunnaton-mein-kya-niyat-ki-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-qada-ola-mein-bhool-kar-salam-pher-de-tu-muqtadi-ka-luqmah-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-surah-fatiha-ki-jagah-bhool-kar-koi-aur-surat-shuru-kar-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/takbeer-e-tahreema-mein-hath-na-uthane-par-sajdah-sahw-lazim-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-doran-bhool-kar-kisi-ko-salam-karne-se-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ki-sunnatain-azan-se-pehle-ada-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbuq-agar-dono-taraf-salam-pherde-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/pant-shirt-mein-namaz-aur-tasweer-wali-shirt-mein-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-muakkadah-namaz-beth-kar-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jaye-namaz-ke-neeche-najasat-lagi-ho-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-idhar-udhar-dekhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gloves-pehan-kar-namaz-padhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/akele-namaz-padhne-wale-ki-iqtida-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbuq-apni-baqya-namaz-poori-karne-ke-liye-kab-khada-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sutra-ke-baghair-namazi-ke-aage-se-guzarne-ki-surat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fard-ul-iadah-aur-wajib-ul-iadah-namaz-mein-kya-fark-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-ki-namaz-parhe-baghair-tarawih-ki-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/alcohol-wali-cream-chehre-par-lagi-hone-ki-halat-mein-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/4-se-5-saal-ke-bacho-ko-masjid-mein-lana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/pehle-salam-ke-baad-masbooq-ke-khare-hone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salam-pher-kar-urdu-mein-dua-aur-amal-e-kaseer-karna-phir-sajda-sahw-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamaat-nikal-gai-ho-tu-apni-jamaat-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/maghrib-ki-tisri-rakat-bila-uzr-beth-kar-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-ke-10-din-baad-mazeed-10-din-ki-niyat-karne-par-qasr-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ke-din-ghusl-nahi-kiya-tu-kya-jumma-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/factory-mein-bohat-ziyada-shor-wali-jagah-par-namaz-padhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-namaz-ki-pehli-rakat-mein-surah-fatiha-2-bar-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-qoma-aur-jalsa-chorne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/doran-e-namaz-agar-imam-ka-inteqal-ho-jaye-to-us-namaz-ko-kaise-mukammal-kiya-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dirham-se-kam-mioqdar-mein-mazi-lagi-ho-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kaba-ke-samne-namaz-ada-karte-hue-nazar-kahan-rakhein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-takbeer-e-qunoot-mein-hath-uthana-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asar-ke-baad-qaza-umri-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-aur-asr-ki-namaz-ke-baad-wajib-ul-iada-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asar-ki-sunnaton-ki-jagah-qaza-umri-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-sajda-tilawat-karne-ke-baad-dosri-rakat-mein-wahi-ayat-padh-li-tu",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-e-sahw-mein-2-ke-bajaye-3-sajde-kar-liye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-karne-se-wazu-toot-jata-ho-tu-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/maghrib-ki-namaz-mein-bhool-kar-dua-e-qunoot-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-sajde-me-ho-to-baad-me-aane-wala-namazi-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khane-ki-wajah-se-jamaat-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sialkot-se-lahore-sharai-safar-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nafil-namaz-mein-qiyam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/doori-wali-hudi-pehen-ka-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/saf-ke-kinare-par-grill-laga-kar-rasta-banana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sahib-e-tarteeb-ka-juma-ka-waqt-nikal-raha-ho-tu-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqeem-shakhs-15-din-se-kam-qiyam-ki-niyat-karle-tu-kya-musafir-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/doran-e-namaz-zakham-se-khoon-chamak-jaye-tu-kya-wazu-toot-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-akhirah-mein-reeh-ki-shiddat-ho-jaye-tu-kya-namaz-torna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurat-ka-mard-ke-barabar-mein-khare-ho-kar-namaz-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jiski-dadhi-choti-ho-kya-wo-taraweeh-parha-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dua-karte-hue-aankhain-band-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-surah-fatiha-ke-baad-surat-sochne-mein-dair-ho-jaye-tu",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ke-pore-waqt-mein-sajda-tilawat-ho-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gonge-ki-imamat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/speaker-par-namaz-padhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-akhri-salam-pherte-waqt-shiddat-se-gas-aa-jaye-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shirt-ke-piche-jandar-ki-tasweer-ho-tu-usay-pehen-kar-ya-ulta-karke-namaz-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-baad-padhe-jane-wale-wazaif-farz-ke-baad-parhein-ya-sunnaton-ke-baad",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-umri-ki-wajah-se-sunnat-e-muakkadah-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-doran-qirat-bhoolay-se-pichli-ayaat-parh-le-to-namaz-hojaye-gi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ke-pehle-qada-mein-bhool-kar-durood-sharif-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamaat-ke-doran-koi-namazi-gir-jaye-tu-us-ke-liye-namaz-torna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jahaz-mein-staff-khare-ho-kar-namaz-na-parhne-de-tu-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ke-waqt-mein-witr-ki-qaza-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-namaz-padhte-hue-fajar-ka-waqt-shuru-ho-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-allergy-ki-wajah-se-bar-bar-romal-istemal-karna-ya-kharish-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-mein-rakhi-plastic-ki-topi-pahen-kar-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mani-ya-mazi-kapron-par-lagi-ho-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ne-ahista-awaz-mein-surah-fatiha-padhi-tu-muqtadi-ameen-kahe-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/2-sajdon-ke-darmiyan-dua-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namaz-jamaat-se-padhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-mein-school-tuition-padhane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-apni-teesri-aur-chothi-rakat-mein-surat-milayega-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ke-baad-ke-nawafil-baith-kar-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-ki-2-rakatain-rehti-hoon-tu-kya-wo-in-mein-qirat-kare-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bhari-libas-ki-wajah-se-dulhan-ka-kursi-par-beth-kar-namaz-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/riyakari-ke-sath-ki-gai-ibadat-par-baad-mein-ikhlas-ki-niyat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/akhri-qada-mein-shamil-hone-se-jamaat-ka-sawab-mile-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-witr-namaz-ke-baad-nawafil-parh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-muakkadah-ki-jagah-qaza-namaz-parh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/juma-ke-khutba-mein-khulafa-e-rashideen-ke-naam-aane-ki-wajah",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-jamai-rokne-ke-liye-3-bar-hath-uthana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salatul-hajat-ka-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/washroom-ke-upar-bane-hue-flat-mein-namaz-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-sirf-na-baligh-bachon-ke-sath-bhi-jamat-ada-ho-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dua-e-qunoot-bhoolne-ki-soorat-main-adhuri-chor-kar-namaz-mukammal-ki-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/pehli-rakat-beth-kar-baqi-khare-hokar-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-imam-ke-peeche-muqeem-masbooq-apni-namaz-kaise-poori-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jis-kapre-se-wazu-ka-pani-saaf-kiya-us-par-namaz-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-namaz-mein-qada-akhira-kar-ke-khara-hona-aur-luqma-milne-par-bethna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ki-namaz-ke-baad-sajde-mein-jakar-dua-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tandrusti-ki-halat-mein-qaza-ki-gai-namazein-mareez-kis-tarah-ada-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-surah-fatiha-ke-bajaye-dusri-surat-shuru-kardi-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-salam-pherte-waqt-dayen-bayen-chehra-karna-wajib-hai-ya-sunnat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dirham-se-zaid-mazi-kapron-par-lagi-hone-ki-surat-mein-namaz-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jandar-ki-tasweer-wale-libas-mein-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-har-rakat-mein-2-sajde-hone-ki-hikmat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bimari-ki-halat-mein-namaz-mein-dono-taraf-salam-pherne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bimari-mein-ishare-se-padhi-gai-namazon-ko-dobara-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajar-ki-sunnatain-kis-waqt-parhna-afzal-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-masbooq-ki-iqtida-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-attahiyat-ko-2-bar-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jis-masjid-mein-qabar-ho-us-mein-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/piyaz-kha-kar-namaz-parhna-mana-hai-ya-masjid-jana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-namaz-ka-waqt-kab-shuru-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/2-shehron-mein-ghar-ho-tu-ek-ghar-se-dosre-ghar-jane-par-namaz-mein-qasr-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-ungliyan-chatkhane-se-namaz-ko-dobara-parhna-wajib-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-qirat-karte-hue-aage-parhna-bhool-jana-aur-ruku-mein-chale-jana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ke-farz-ke-baad-fajr-ki-sunnatain-na-parhne-ka-hadees-se-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-ruku-aur-sajda-se-sajda-tilawat-ada-hone-ki-soorat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamaat-ke-doran-saf-mein-seedhi-janib-khare-hona-afzal-hai-ya-ulti-janib",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salatul-layl-kab-parhi-jati-hai-aur-salatul-layl-ki-kitni-rakatein-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-ki-nai-tameer-karte-waqt-purane-malbe-ka-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-umri-ya-nafil-namaz-masjid-e-nabwi-mein-padhne-se-40-namazon-ki-fazilat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/takhno-se-neeche-shalwar-hone-ki-surat-mein-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/apna-jism-aur-sar-ek-kapre-mein-chupa-kar-namaz-parhne-ka-masla",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/wajib-ul-iada-namaz-ki-niyat-kaise-karenge",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-kuch-waqt-ke-liye-qaza-e-hajat-mehsoos-hone-ke-baad-khatam-ho-jana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sari-raat-zikr-o-azkar-karna-aur-fajr-ki-namaz-na-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-ke-doran-namaz-ka-waqt-shuru-ho-tu-kya-azan-dobara-di-jaye-gi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kitab-se-dekh-kar-dua-e-qunoot-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chori-kiye-hue-libas-mein-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/takbeer-e-tahreema-ke-waqt-hath-na-uthane-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tayammum-karne-wala-ya-masah-karne-wala-imam-ban-sakta-hai-kya",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/beth-kar-namaz-parhne-wala-ruku-kis-tarah-karega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/surah-fatiha-ke-baad-surat-milane-se-pehle-tasmiya-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-salam-pherte-waqt-muqtadi-ne-takbeer-e-tahreema-kahi-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-fajr-ya-asar-ki-sunnatein-tordein-to-phir-kab-parhi-jayen-gi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chalti-kashti-mein-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khulafa-e-rashideen-aur-raful-yadain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tayammum-karke-parhi-gai-namaz-dubara-parhi-jayegi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/maghrib-ki-namaz-waqt-khatam-hone-se-5-minute-pehle-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/train-chalne-ki-wajah-se-namaz-torna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ka-waqt-kam-hone-ki-wajah-se-tayammum-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zuhr-ki-namaz-ka-afzal-waqt-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-piche-namaz-parhte-hue-ameen-kehna-bhool-jana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-ya-sajda-mein-imam-ke-sath-shamil-hone-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-doran-danton-mein-phansi-hui-cheez-nigalna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-namaz-mein-takbeer-kehne-ki-galti-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-andar-surah-fatiha-parhte-hue-galti-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-takbeerat-e-inteqal-kehne-mein-galti-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-ka-afzal-waqt-konsa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-parhne-wale-ke-piche-maghrib-ki-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-pehle-ulti-taraf-salam-pherne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/w-6257-zuhr-asar-ya-maghrib-ki-kuch-rakatien-reh-jayein-tu-kis-tarah-ada-karein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qasr-namazein-mukammal-padhta-raha-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-doran-qirat-mein-galti-hone-par-ghair-namazi-ka-luqmah-lena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-muakkadah-mein-qada-ola-bhool-gaye-tu-sunnat-e-muakkadah-ka-hukum-",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-bimar-par-jumma-farz-hai-aur-kya-bimar-jumma-ghar-par-ada-kar-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-khud-ko-masbooq-samajh-kar-namaz-ada-karle-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bache-ke-kaan-mein-azan-dene-ka-saboot-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-doran-kisi-ke-satar-par-nazar-par-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamaat-mein-na-hote-hue-imam-se-ayat-sajdah-suni-tu-sajda-e-tilawat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khutba-ke-doran-khateeb-ka-logon-ki-gardanien-phalngne-se-mana-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-urdu-mein-dua-mangne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-ka-waqt-baqi-samajhte-hue-fajr-ke-waqt-mein-isha-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-kuch-muqtadiyon-ke-sath-buland-jagah-par-jamaat-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-namaz-parhne-ka-afzal-waqt-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-karne-ka-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/banyan-par-machar-ya-juon-ka-khoon-laga-ho-tu-is-halat-mein-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ki-sunnatain-fasid-kar-dein-tu-un-ki-qaza-farz-ke-baad-ho-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-cheenk-aur-jamahi-ki-wajah-se-takheer-hui-to-sajda-sahw-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-sahib-ne-bhole-se-surah-falaq-ki-teesri-ayat-chordi-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chain-wali-ghadi-pehen-kar-namaz-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-na-parhna-aur-kehna-ke-hum-allah-ke-wali-ke-mureed-hain-woh-bakhshwaien-gai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-fajr-ki-iqamat-ke-doran-aane-wala-shakhs-sunnat-e-fajr-ada-kare-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namaz-mein-ahista-ya-buland-awaz-se-qirat-karne-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ka-waqt-shuru-hone-mein-ek-minute-baqi-reh-gaya-ho-to-tahajjud-shuru-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-pehli-ya-dusri-rakat-mein-bhoole-se-dua-e-qunoot-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-dono-hath-ke-istemal-se-namaz-fasid-ho-jati-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-aur-asar-ke-waqt-sajda-e-shukr-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ruku-se-uthte-waqt-sirf-tasmee-kahe-ya-tehmeed-bhi-kahe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/miyan-biwi-ka-nafil-namaz-jamat-se-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-duran-wazu-toot-jaye-to-dobara-namaz-kahan-se-shuru-karein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/juma-ke-khutba-ke-doran-pahunchne-wala-juma-ki-sunnatain-kab-ada-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-khane-ke-zarrat-muh-mein-aa-jayen-to-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-karne-ka-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/2-logon-ke-jamaat-se-namaz-ada-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/2-sajdon-ke-darmiyan-bethne-ka-sunnat-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-mein-urdu-ya-apni-madri-zaban-mein-dua-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ke-milne-se-pehle-imam-ko-sahw-hua-to-muqtadi-par-sajda-sahw-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qirat-mein-ghalti-se-namaz-fasid-hone-se-mutalliq-ek-ahem-usool-aur-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/92-kilometer-ki-musafat-par-15-din-se-ziyada-teherna-ho-to-raste-ki-namazon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/niyaz-ke-paise-masjid-mein-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-aur-sujood-ki-tasbeehat-kitni-awaz-se-parhni-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/charpai-ki-ek-janib-koi-shakhs-betha-ho-is-charpai-ko-satra-banana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sharai-safar-ke-irade-se-nikla-lekin-aadhe-raste-se-wapas-aagaya",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shishe-ke-samne-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mushaddad-harf-par-tashdeed-na-parhi-to-namaz-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-ki-taraf-ghar-ka-parnala-nikalna-aur-masjid-mein-pani-girana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/raat-mein-imam-salat-al-tawbah-ki-namaz-mein-jahri-qirat-na-kare-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-bhoole-se-2-wajib-choot-jayen-tu-kitne-sajda-sahw-wajib-honge",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-pehli-rakat-mein-sana-ka-takrar-karne-se-sajda-sahw-wajib-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-ne-imam-ke-piche-sana-parh-li-tu-kya-imam-ke-salam-ke-baad-dobara-parhe-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-aur-iqamat-kehte-hue-idhar-udhar-dekhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-ne-maghrib-ki-dosri-rakat-par-qada-na-kiya-tu",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/agar-azan-mein-haroof-ki-adaigi-durust-na-ho-to-aisi-azan-ka-hukum-aur-is-ka-jawab-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/halat-e-namaz-main-hath-ya-paon-ki-ungliyan-chatkane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ne-ghair-namazi-se-ayat-e-sajda-suni-to-sajda-e-tilawat-wajib-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-ki-namaz-mein-sirf-farz-aur-witr-parhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zuhr-ki-jamaat-khadi-hone-ke-baad-sunnatein-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurat-ka-chehra-dhanp-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-mard-ka-satar-khul-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-behosh-hone-ki-soorat-mein-muqtadi-ka-namaz-parhana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qibla-rukh-azan-dene-ke-hawale-se-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chori-ke-dar-se-ghar-mein-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-aayat-ya-surat-ki-takrar-se-kya-murad-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-namaz-mein-qiyam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-ki-halat-mein-nazar-kahan-rakhe-gai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ki-jehri-qirat-ke-waqt-muqtadi-ka-sana-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-doran-hansna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jis-kapre-ko-billi-chat-le-us-mein-namaz-ho-gi-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asar-ki-namaz-ka-mustahab-waqt-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bhool-kar-namazi-ke-aage-se-guzar-gaye-to-gunahgar-honge-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-pori-karne-ke-baad-rakat-ki-tadaad-mein-shak-ho-to-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/wh-5824-juma-ke-liye-shehar-hone-ki-shart-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-surah-fatiha-se-pehle-aur-baad-tasmiya-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kon-kon-se-kamon-ka-istikhara-karwaya-ja-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-baad-waqt-khatam-hone-ka-ilm-hua-to-namaz-ka-kiya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kisi-kaam-ke-jaldi-hone-ke-liye-dua-karna-kya-dua-mein-jaldi-machana-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/makrooh-waqt-mein-wazifa-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-makrooh-tahrimi-hone-ke-liye-makrooh-tahrimi-ka-poori-namaz-mein-paya-jana-zaroori-hai-ya-kuch-waqt-mein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/attahiyat-ke-baad-sajda-sahw-karna-bhool-gaye-to-salam-se-pehle-sajda-sahw-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/buland-awaz-se-takbeer-kehne-ke-liye-luqma-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/makrooh-waqt-khatam-hote-hi-chasht-ki-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-ghusl-karne-ki-surat-mein-namaz-ka-waqt-nikal-jaye-to-tayammum-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/cotton-ke-bareek-kapre-pehn-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-ki-namaz-qaza-ho-jaye-tu-kya-farz-ke-sath-witr-ki-qaza-bhi-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/makkah-mukarramah-mein-20-din-qiyam-ka-irada-ho-magar-das-din-par-jaranah-se-umrah-karne-ka-bhi-irada-ho-tu-haji-musafir-hoga-ya-muqeem",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/makkah-mein-iqamat-ki-niyat-kar-ke-mina-gaye-phir-makkah-wapas-aaye-to-muqeem-honge-ya-musafir",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ruku-se-uthne-ke-baad-ki-dua-kehna-bhool-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/awabeen-ki-namaz-ki-kya-fazilat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-baghair-wazu-azan-de-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ruku-mein-ho-to-muqtadi-jamat-mein-kaise-shamil-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-takheer-se-shamil-hone-wala-muqtadi-sana-parhega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shab-bedari-wali-raaton-mein-ijtima-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/punjab-se-karachi-jate-hue-hyderabad-mein-qasr-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/2-afrad-jamat-kaise-karwaien",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jahan-suraj-ghroob-nahi-hota-wahan-namaz-kaise-parhein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bajamat-namaz-mein-wazu-toot-jaye-tu-saf-se-kaise-nikle",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ka-waqt-khatam-hone-ke-baad-salam-pherne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sahib-e-tarteeb-ne-qaza-namaz-parhne-ke-bajaye-waqti-namaz-parh-li-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-ne-bhule-se-imam-ke-sath-sajda-sahw-mein-salam-pher-diya-to-kiya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-asar-ki-namaz-ke-baad-nafil-ki-qaza-parh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namazon-mein-juma-ki-namaz-ka-hisab-kaise-lagaya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-doran-nafli-roze-ki-niyat-ki-to-kya-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asar-ki-namaz-ko-qasdan-lamba-karke-makrooh-waqt-mein-le-jane-se-kya-namaz-makrooh-e-tahrimi-hojati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-maghrib-ki-teesri-rakat-mein-surah-fatiha-ki-ek-ayat-buland-awaz-se-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bradford-se-pakistan-ke-liye-nikla-tu-namaz-mein-qasr-kab-se-shuru-karega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-sajda-sahw-se-pehle-masbooq-khara-ho-gaya-to-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/eid-ki-namaz-ke-liye-azan-o-iqamat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/2-rakat-nafil-mein-mukhtalif-nawafil-ki-niyat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamat-ke-sath-namaz-parhne-ki-fazilat-aur-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-ishare-se-kisi-baat-ka-jawab-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-agar-jumuah-ki-namaz-ada-karle-tu-kya-hukam-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-muakkadah-aur-sunnat-e-ghair-muakkadah-ki-jagah-qaza-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-qiyam-mein-jhuk-kar-khara-hona-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-akhira-mein-dua-e-masurah-ki-jagah-surah-fatiha-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-baad-buland-awaaz-se-zikr-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-ilawa-dua-ke-liye-sajda-karne-ka-tareeqa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-mein-sajde-ki-tasbeeh-padhna-aur-tasmia-aur-tahmeed-na-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-shkhs-namaz-mein-sana-kab-parhega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/juma-ke-din-bhool-kar-zuhr-padh-li-to-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salatul-tasbeeh-mein-kisi-rukn-mein-tasbeeh-parhna-bhool-jayen-to-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-hilna-jhulna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jis-farsh-par-najasat-gir-kar-khushk-ho-jaye-us-par-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sirf-sitr-e-aurat-chupa-kar-namaz-parhi-to-kya-hukam-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sari-zindagi-ghalat-namaz-parhi-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/waqt-ki-tangi-ke-bais-peshab-waghera-ki-shiddat-ke-saath-parhi-gayi-namaz-wajib-ul-adha-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-mein-agar-dono-paon-zameen-se-uth-jaen-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-sahib-sana-parh-kar-ruku-mein-chale-gaye-aur-muqtadi-ne-luqma-diya-to-kya-hukam-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/logon-ko-namaz-e-fajar-ke-liye-jagana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-namaz-ki-pehli-ya-teesri-rakat-ke-qiyam-mein-attahiyyat-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-khilaf-e-tarteeb-qirat-shuru-karne-ke-baad-yaad-aane-par-doosri-surat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salatul-taubah-kon-si-namaz-hai-aur-kyun-parhi-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sana-parhte-howe-khamosh-rehne-se-sajda-sahw-wajib-hone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/raat-ko-dair-tak-parhai-karne-ki-wajah-se-fajar-ki-jamat-chorne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/halat-e-safar-mein-namaz-qaza-hui-ghar-mein-adaigi-ke-waqt-is-qaza-namaz-ko-qasr-parhenge-ya-poori",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-halat-mein-khane-ki-koi-cheez-nigalne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/driver-ko-malik-ki-niyat-maloom-na-ho-to-namaz-puri-parhega-ya-qasar",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-ki-pehli-rakat-mein-surah-naas-parh-li-tu-doosri-rakat-mein-kya-parhein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ka-azaye-satar-mein-se-kisi-aik-uzoo-ko-qasdan-chothai-se-kam-khole-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zohar-ki-namaz-mein-tasmiyah-buland-awaz-se-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-teesri-rakat-mein-sana-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tashahhud-mein-ungli-uthana-bhool-jayen-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tadeel-e-arkan-puri-tarah-adaa-nahi-karne-wale-ki-namaz-ka-kya-hukam-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-taraweeh-ki-namaz-chorna-gunah-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/university-sharai-musafat-par-ho-tu-namaz-mein-qasar-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-ke-liye-juma-ki-namaz-mein-qasar-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-samne-jote-rakhe-hon-to-namaz-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ek-masjid-mein-aik-se-zaid-jamat-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-se-uthte-waqt-takbeer-keh-di-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/akele-witr-parhte-huae-buland-awaz-se-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-sutra-aik-ungli-mota-hona-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kisi-ki-darhi-na-ho-tu-jamat-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-aur-asar-ki-sunnat-e-qabliyah-kafi-time-se-ada-nahi-ki-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-parhne-ke-baad-taraweeh-parhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-namaz-e-taraweeh-mein-bhi-muqtadi-ke-liye-iqtida-ki-niyat-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-bhool-kar-ungliyan-chatkhane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-ke-liye-azan-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/surah-fatiha-se-pehle-bhoole-se-surah-ikhlas-ki-2-ayaat-parh-lene-se-namaz-ka-kya-hukum-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-ki-qaza-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-se-pehle-ruku-aur-sajde-mein-jana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-jamat-ki-teesri-rakat-mein-buland-awaz-se-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qayamat-ke-din-sunnaton-aur-nawafil-se-farz-ki-kami-poori-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-roze-ke-fidye-mein-kapre-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-tashahhud-ya-dua-e-qunoot-na-parhe-tu-uski-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qareeb-ki-masjid-chor-kar-door-wali-masjid-mein-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-eid-ki-zaid-takbeerein-bhool-kar-ruku-mein-chale-gaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qurani-ayat-mein-kalme-ka-izafa-karne-se-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/2-sajdon-ke-darmiyan-kitni-dair-baithna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khilaf-e-tarteeb-qirat-karne-par-imam-ko-luqma-dena-aur-imam-ka-luqma-qabool-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/moo-se-cigarette-ki-smell-khatam-kiye-baghair-masjid-mein-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/wh-5261-sunnaton-ki-kisi-rakat-mein-surah-fatiha-na-parhi-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-teesri-rakat-mein-teen-tasbeeh-ki-miqdaar-khamosh-rehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-e-tilawat-ka-mustahab-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/agli-rakat-mein-chand-aayaat-aage-se-tilawat-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asar-ka-waqt-shuru-hone-ke-baad-nafil-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-tanha-buland-jagah-khara-hona-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salat-ul-tasbih-ki-namaz-parhne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-tul-wida-ko-qaza-umri-ka-ahem-masla",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kisi-ghareeb-ke-liye-masjid-mein-ilan-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sheeshe-ke-samne-namaz-ada-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-sheher-ki-hudood-tool-plaza-par-khatam-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/durood-sharif-parh-kar-sajda-sahw-karna-durust-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-mein-3-baar-surah-ikhlas-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/roze-ki-halat-mein-dhooni-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ko-ruku-mein-jane-ke-baad-dua-e-qunoot-ke-liye-luqma-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-ki-20-rakat-5-salam-ke-saath-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ramzan-mein-witr-ki-jamat-kon-karwa-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/eid-wale-din-namaz-e-eid-se-pehle-aur-baad-mein-nafil-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-jamat-mein-teesri-rakat-mein-shamil-hai-to-dua-e-qunoot-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-isha-aur-taraweeh-ki-jamat-masjid-ke-qareeb-ghar-mein-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ek-waqt-mein-2-ya-is-se-zaid-namazein-jama-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-taraweeh-parhna-farz-wajib-ya-sunnat-hai-aur-taraweeh-ki-qaza-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imama-sharif-par-sajda-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-parhane-ki-ujrat-aur-heelay-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-ayat-e-sajda-parhne-ya-sunne-ke-foran-baad-sajda-karna-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-ki-chauthi-rakat-mein-bhule-se-jahri-qirat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-tilawat-kafi-miqdar-mein-reh-gaye-ho-to-un-ki-adaigi-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-teesri-rakat-mein-sana-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-namaz-ada-karne-ka-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sham-ke-waqt-ke-wazaif-parhne-ka-waqt-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zohar-ki-sunnat-e-badiya-farzon-se-pehle-parh-lane-se-ada-ho-jaien-gi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-qirat-karte-hue-tashdeed-chor-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-sahib-e-tarteeb-makrooh-waqt-mein-bhi-tarteeb-ka-liahaz-kare-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mukhtalif-rakat-mein-mukhtalif-suraton-ki-kuch-aayat-tilawat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/garam-topi-uni-topi-pehen-kar-namaz-parhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/doran-e-namaz-khare-ho-kar-parhne-par-qadir-ho-gaya",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salat-ul-tasbeeh-mein-teesra-kalma-mukammal-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/juma-ki-jamaat-khari-ho-jaye-tu-sunnatain-kab-parhain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/juma-ki-namaz-makruh-tahrimi-ho-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/maghrib-ki-namaz-parhne-ka-waqt-kab-tak-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurat-ka-namaz-mein-bache-ko-doodh-pilana-aur-khud-doodh-utar-aane-se-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-chand-sunnat-e-muakkadah-bata-dein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-parhne-ke-baad-dobara-shuru-kar-diye-aur-yaad-aane-par-namaz-tordi-to-is-sorat-mein-gunah-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sone-wale-ko-namaz-ke-liye-jagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dosri-rakat-sana-se-shuru-ki-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/maghrib-ki-teesri-rakat-mein-dua-e-qunoot-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namaz-ki-niyat-kaise-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ibadaat-aur-mamlaat-me-fasid-o-batil-ka-farq",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-wajib-hain-ya-sunnat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mard-ka-chandi-ka-bracelet-pehen-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zuhr-aur-asar-ki-jamat-mein-takheer-se-shamil-hone-wale-ka-sana-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zohar-ki-sunnat-e-qabliya-ke-doran-jamat-qaim-ho-jaye-tu-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ke-tashahhud-mukammal-karne-se-pehle-imam-khara-ho-jaye-ya-salam-pher-de-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-aayat-e-sajda-parhne-sunne-par-foran-sajdah-karna-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jalsa-e-istirahat-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-namaz-mein-dua-e-qunoot-parhne-ke-baad-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-iaday-mein-char-rakat-parhay-ga-ya-do-rakat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jahri-qirat-aur-sirri-qirat-ka-kya-matlab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-teesri-rakat-mein-kya-kya-parhna-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mitti-ka-tail-masjid-mein-jalana-aur-mitti-ke-tail-wala-roghan-masjid-me-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-aur-nafil-namaz-mein-buland-awaz-se-tilawat-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khutbe-ke-doran-muazzin-ka-chal-kar-agli-saf-mein-aana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-sath-ruku-mein-milne-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aik-tang-se-mazoor-shakhs-ki-imamat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-ki-namaz-parhne-se-pehle-witr-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-aur-nafil-namaz-ki-dosri-rakat-mein-lambi-qirat-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-niyat-zuban-se-karne-ka-kya-hukum-hai-kya-yeh-bidat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kursi-par-namaz-parhne-wala-saf-mein-kis-jagah-namaz-ada-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-oola-mein-bhool-kar-salam-pher-diya-aur-tasbeeh-parhna-shuru-kardi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/moze-pehen-kar-takhne-chup-jate-hain-is-surat-mein-namaz-kya-hukum-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-badiya-ko-farz-namaz-se-pehle-padhne-ka-kya-hukum-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jo-namaz-e-tahajjud-ka-aadi-ho-kya-us-ke-tahajjud-chor-dene-se-qaza-lazim-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qirat-mein-aerabi-ghalati-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zaroorat-se-zaid-quran-pak-ke-nuskhe-doosri-masjid-mein-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurat-ka-farz-namaz-ki-dono-rakaton-mein-ek-hi-surat-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kaam-kaaj-ki-wajah-se-muakkadah-or-ghair-muakkadah-sunnatain-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-shakhs-ka-qada-akhira-mein-muqeem-imam-ke-sath-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zohar-ki-sunnat-e-qabliya-parhne-ke-liye-waqt-tang-ho-tu",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musalla-mota-ho-lekin-sajda-mein-zameen-ki-sakhti-mehsoos-ho-tu-sajda-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tanha-namaz-parhne-wala-kin-namazon-mein-buland-awaz-se-qirat-kar-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-wajah-hai-ke-hum-namaz-mein-bhi-aur-namaz-ke-baad-bhi-dua-mangte-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ka-imam-ki-takbeer-e-tehreema-se-pehle-apni-takbeer-khatam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-ka-jawab-dena-wajib-hai-ya-mustahab",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahiyatul-masjid-ke-nafil-parhna-sunnat-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/rakat-pane-ke-liye-ruku-ki-kitni-miqdar-imam-ke-sath-milna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-sana-aur-durood-pak-parhna-konsi-sunnat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bhool-kar-fatiha-se-pehle-tauz-buland-awaz-loudly-padhne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/surah-fatiha-ke-baad-surat-milana-bhool-gaye-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/akhri-qada-kar-ke-khare-ho-gaye-aur-qiyam-mein-he-salam-pherdiya-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajar-ke-waqt-mein-witar-ya-koi-wajib-ada-karsakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/raat-so-kar-uthne-ke-baad-isha-aur-nawafil-parhay-tu-kya-nawafil-tahajjud-mein-shumaar-honge",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-mein-dua-e-qunoot-ke-bajae-bhole-se-ruku-ki-tasbeeh-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kisi-rakat-mein-teen-sajde-kar-liye-aur-aakhir-mein-sajda-sahw-kar-liya-to-kya-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/murgi-ka-kam-karne-wale-ke-liye-namaz-ki-adaigi-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/har-rakat-mein-do-sajde-karne-ki-hikmat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-surah-fatiha-aur-surat-milane-se-pehle-tasmiya-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-maghrib-mein-farz-ki-kitni-rakat-ada-kare-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bhool-kar-baghair-wazu-namaz-parh-li-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/high-neck-sweater-dupatta-waghaira-fold-kar-ke-namaz-padhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ke-khutba-ke-darmiyan-waqfa-ka-saboot-aur-hikmat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/juma-ke-din-arabi-khutba-sunna-farz-hai-ya-wajib",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-sahu-ke-baad-attahiyat-na-parhi-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/4-rakat-farz-namaz-parhte-hue-6-rakat-parh-lein-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-ruku-aur-sajde-me-kitni-baar-tasbeeh-parhni-chahye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-imam-ka-pori-namaz-parhana-kaisa-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dhaat-ki-chaabi-taweez-ki-tarah-galay-mein-latka-kar-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-ke-waqt-pehle-witr-ki-namaz-ada-karen-ya-tahajjud-ki",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-baad-imam-aur-muqtadi-ka-musfa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-sahib-ne-aik-surat-bhulne-par-dusri-surat-shuru-kardi-to-namaz-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ki-sunnat-qabliyah-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-jumma-ka-time-kab-shuru-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/undergarments-banyan-ke-bagair-aurat-ka-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-asli-se-100-kilometer-door-jane-par-namaz-qasar-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/maghrib-ke-baad-so-gaye-tu-kya-raat-mein-uth-kar-tahajjud-parh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chandi-ya-kisi-aur-dhaat-ka-taweez-pehan-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tanha-namaz-parhne-wala-azan-o-iqamat-kahe-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-aik-do-ayat-chor-kar-agli-ayat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mina-jane-se-14-din-pehle-makkah-sharif-mein-qiyam-ho-to-namaz-kaise-parhe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ishraq-ki-namaz-ka-waqt-kab-shuru-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurat-maikay-mein-namaz-puri-padhe-gi-ya-qasr-kare-gi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-kapron-ko-oopar-khenchnay-ke-makrooh-hone-ki-wajah",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-se-khare-hote-hue-paon-aage-peeche-ho-jayen-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-samne-zameen-par-tasveer-pari-ho-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gobar-se-lepi-hui-zameen-par-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghas-par-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-rakaton-ki-tadad-mein-shak-ho-jaye-tu-kya-karien",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-hone-se-pehle-namaz-parhne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ki-namaz-ke-waqt-khareed-o-farokht-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/maghrib-ki-namaz-ke-baad-shukrane-ke-nawafil-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-mard-poni-bandh-kar-namaz-parh-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/baghair-wuzu-namaz-parh-li-bad-me-ilm-hwa-ke-wuzu-nahi-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-namaz-mein-jaan-bujh-kar-mufsid-aur-makrooh-tehreemi-kaam-karna-gunah-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-asar-makruh-waqt-me-shoro-karna-makrooh-timing-of-salat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asar-aur-isha-ki-sunnat-ki-jagah-qaza-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/agar-namaz-ke-doran-dikar-aye-aur-gale-me-zaiqah-mehsoos-ho-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-nabawi-ya-masjid-haram-me-sutra-ke-baghair-namazi-ke-aage-se-guzarna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bachon-par-namaz-aur-roza-kis-umar-mein-farz-hote-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bus-ke-safar-ke-doran-namaz-ka-waqt-hojaye-to-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajar-ka-waqt-shuru-hone-se-pehle-isha-ki-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-maghrib-ki-sunnat-mein-takheer-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mard-ke-liye-namaz-mein-naaf-ke-neechay-haath-bandhnay-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kursi-par-namaz-parhne-wala-saf-mein-kursi-kis-maqam-par-rakhe-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ki-namaz-ki-rakaton-ki-tadad-kitni-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chaar-rakat-namaz-ki-teesri-rakat-par-baith-gaya-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chote-bache-saf-me-khare-hon-tu-kya-kiya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ishraq-ki-namaz-ke-sath-hi-chasht-ki-namaz-ada-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/surah-fatiha-ke-baad-bhool-kar-sana-parhne-se-sajda-sahw-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-me-dua-e-qunoot-ki-jagah-syed-ul-istighfar-parh-lia-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-shukr-me-dua-mangne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/andhere-me-namaz-padhne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/doran-e-namaz-namaz-ka-waqt-khatam-ho-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-chutti-par-ho-tu-darhi-munde-log-namaz-kaise-ada-karen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/char-rakat-nafil-ki-niyat-kar-ke-do-par-salam-pher-diya-to-nafil-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/uzr-ke-ki-waja-se-imam-ka-chokri-mar-kar-bethna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-muqtadi-ka-takbeere-tehreema-aur-deegar-takbeerat-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ahtiatan-sajda-sahw-kare-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-ki-namaz-ke-liye-raat-ka-chhata-hissa-kaise-nikala-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-me-photo-shooting-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-zawal-ke-waqt-quran-e-pak-parhna-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-azan-lait-kar-sun-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sotay-shakhs-ke-peechay-namaz-parhnay-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-dupatta-aur-aasteen-kitni-honi-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-asar-se-maghrib-tak-ka-pora-waqt-qabooliyat-ka-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salam-phertey-waqt-nigah-kahan-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masrufiyat-ki-wajah-se-namaz-ke-baad-dua-na-mangna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-mein-meeting-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sahib-e-tarteeb-witr-ki-qaza-yaad-hote-hue-fajar-ke-farz-parh-le-to-kya-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajar-ki-namaz-ke-baad-nawafil-parh-sakte-hain-kya",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-zohar-mein-salam-pherne-se-pehle-waqt-khatam-ho-jaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajdah-ya-ruku-mein-jatay-waqt-pajama-charhana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/daku-ki-namaz-e-janaza-na-parhne-ki-kya-waja-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-hadees-mein-aane-wala-wazifa-namaz-mein-sana-ke-baad-parh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/agar-muqtadi-imam-se-pehle-salam-pher-de-to-namaz-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/baith-kar-sajdah-e-tilawat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-namaz-ki-aik-rakat-mein-do-suraton-ko-jama-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-ke-liye-namaz-e-juma-parhne-ka-kya-hukum-hai-salatul-musafir",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aakhri-qaiday-mein-namazi-ka-durood-shareef-nah-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-pant-fold-kar-ke-namaz-parhne-ka-hukum-namaz-me-asteen-fold-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/napak-carpet-par-jaye-namaz-bicha-kar-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-ahista-ameen-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/wazu-par-wazu-karne-se-kya-wazu-toot-jata-hai-wazu-kin-cheezon-se-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-me-shak-ho-jaye-ke-tasbih-do-parhi-hai-ya-teen-parhi-hai-to-kya-hukme-sharia-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-e-sahw-me-imam-ke-sath-salam-pherne-ka-hukum-sajda-e-sahw-ka-bayan",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/hawa-lene-ke-liye-pehli-saf-mukammal-na-karna-sahi-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-muakkadah-ki-kitni-rakat-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-halat-me-ungliya-chatkana-kaisa-aur-islam-me-is-ka-hukum-kia-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/doran-e-namaz-machar-kate-to-kiya-ise-maar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-awabeen-ki-adaigi-ka-tareeqa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-asar-ke-baad-sajda-shukar-ada-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mard-ramzan-mein-namaz-witr-kab-ada-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-na-kar-sakta-ho-tu-kya-khara-ho-kar-qiyam-aur-ruku-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-qabliya-parhne-ke-baad-wazu-toot-jaye-tu-kya-sunnat-dobara-parhni-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zohar-ki-sunnat-qabliya-farz-ke-baad-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-namaz-mein-surah-fatiha-ke-ilawa-doosri-surat-poori-parhna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-parhne-ke-baad-yaad-aya-ke-wazu-nahi-the-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-ghair-muakkadah-ke-pehle-qaida-me-durood-e-ibraheemi-aur-dua-masura-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-main-dua-e-qunoot-ke-kuch-alfaz-bhoole-se-reh-gaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamat-ke-doran-agli-saf-ki-jagha-pur-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/pehla-ya-akhri-qada-bhool-kar-khara-ho-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ka-waqt-shuru-hone-ke-bad-namaz-parhe-baghir-safar-par-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-teesri-rakat-mein-surah-fatiha-parh-ke-bhoole-se-ruku-kar-liya-to-kya-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-ghair-muakkadah-chorne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-ki-pehli-do-rakat-ke-bajaye-aakhri-do-rakat-me-surah-e-fatiha-padhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-ke-chande-se-committee-dalne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ka-waqt-kam-ho-tu-kya-sahib-e-tarteeb-pichli-qaza-parhe-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ka-qaida-oola-me-tashahhud-ke-baad-jaan-kar-durood-shareef-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jo-shakhs-imam-ko-pehli-rakat-ke-dosre-sajde-mein-paye-to-namaz-mein-kaise-shaamil-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ka-waqt-shuru-hone-se-pehle-azan",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mard-ke-liye-tashahhud-me-bethne-ka-sunnat-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-e-sahw-ke-baad-namaz-me-phir-sahw-hojye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qabristan-me-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-awabeen-ki-har-rakat-me-teen-baar-surah-e-ikhlas",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-agar-choot-jaye-to-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamat-ki-takbeer-e-oola-ka-sawab-kis-surat-me-milta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-waqt-ke-andar-shuru-ki-aur-waqt-khatam-hone-ke-baad-salam-phera",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-me-tanha-farz-parhte-howe-jamat-qaim-hojaye-to-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-padhne-wala-witr-kab-ada-kare-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ulta-dupatta-odh-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-ko-rasta-banane-ki-wazhat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-juma-ki-imamat-kar-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-ka-imam-ke-sath-akhri-qade-me-durood-o-dua-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunat-e-qabliyah-aur-farz-ya-farz-aur-sunnat-e-badiyah-ke-darmiyan-me-baat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurat-ka-dupatta-fold-kar-ke-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tanha-nafil-namaz-parhne-wale-ke-liye-sirri-aur-jehri-qirat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dua-e-qunoot-bhool-kar-ruku-me-gaya-phir-wapis-aa-kar-parhi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-baith-kar-parhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-ibtedai-waqt-me-muqeem-aur-intehai-me-musafir-ho-to-namaz-kaise-parhe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/char-char-rakat-ke-sath-taraweeh-ki-namaz-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-ki-namaz-bagair-jamat-ke-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bhool-kar-pehli-rakat-par-qaida-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-namaz-ke-nawafil-me-mazeed-nafil-namazon-ki-niyat-karsakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/napak-shaksh-ka-masjid-me-jana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-qaza-kab-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zohar-aur-asar-ki-namaz-me-buland-awaz-se-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sheeshe-ko-namaz-ke-liye-sutrah-banana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/suraj-grahan-ki-namaz-jamat-se-parhen-tu-qirat-sirri-hogi-ya-jehri",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/suraj-grahan-ki-namaz-ke-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qirat-ke-doran-imam-sahib-ko-luqma-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/takleef-ki-wajah-se-sajde-mein-naak-ki-haddi-na-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salam-phere-bagair-sajda-e-sahw-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/attahiyat-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-imam-ke-piche-sana-ke-sath-tauz-o-tasmia-parhay-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/check-ke-zariye-namazon-ka-fidya-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/satoon-wali-jagah-chor-kar-saf-bnana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-akhira-bhoolny-ki-soorat-mein-kya-sajda-sahw-kifayat-karta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bhole-se-aik-ayat-ko-do-teen-martaba-padh-lene-se-sajda-sahw-wajib-ho-ga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-attahtiyat-mukammal-parhne-ke-baad-imam-ki-iteba-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ibadat-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asar-ki-namaz-me-buland-awaz-se-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mote-foam-par-sajda-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-quran-kareem-ke-waqf-ki-riayat-na-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kursi-per-baith-kar-namaz-parhne-wala-kya-imamat-karwa-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-qahqaha-lagane-se-wazu-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-mein-fajar-ki-jamat-ka-waqt-kis-tarah-muqarar-kiya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/takbeer-e-tehreema-kehne-ke-baad-bethne-se-pehle-imam-ne-salam-pher-diya",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sahib-e-tarteeb-jamat-main-shamil-hone-se-pehle-qaza-padhe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-jaan-boojh-kar-khilaf-e-tarteeb-suraten-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-ongh-aa-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/takbeer-e-tehreema-qirat-aur-talbiyah-ghair-arabi-mein-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurtain-namaz-kis-waqt-ada-karen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-panjgana-ummat-e-muhammadia-ki-khasosiyat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurat-namaz-mein-hath-kaise-bandhe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nawafil-beth-kar-aur-khary-ho-kar-parhne-ki-sorat-mein-sawab-mein-farq",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/peda-hone-wale-bache-ke-kaan-me-azan-o-iqamat-kitni-bar-kahi-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tawajah-batane-wali-cheez-ke-sath-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-doran-agar-maa-bulae-tu-jawab-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-sahw-mein-shak-hua-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-mein-aakhri-do-sunnatain-muakkadah-hain-ya-ghair-muakkadah",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dua-e-qunoot-parhna-bhool-jaye-to-kya-namaz-dobara-parhni-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ne-bhoole-se-baghair-wazu-namaz-parha-di",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/halat-e-qiyam-mein-ulte-hath-se-kharish-waghaira-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/eid-ki-namaz-se-pehle-ishraq-chasht-aur-deegar-nawafil-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-teesri-rakat-me-fatiha-parh-ke-ruku-kiya-to-kia-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-me-jate-waqt-kapra-sametna-aur-uthte-waqt-kapra-durust-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-me-imam-ke-sath-shamil-hote-waqt-hath-bandhe-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asar-o-fajar-ke-waqt-mein-qaza-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-namaz-tanha-padhne-wale-ke-sath-namaz-mein-shamil-hone-ka-tareeqa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/takbeer-e-tahreema-ke-waqt-hatheli-ko-qibla-roh-na-krne-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-raat-ko-salat-ul-tasbih-me-aahista-qiraat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-qablia-gahir-muakkadah-faraiz-ke-baad-ada-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/agar-namaz-ke-doran-aansu-muh-me-chala-jaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/garmi-ki-wajah-se-kameez-utar-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-ghair-muakkadah-padhte-hue-jamat-khadi-ho-jae-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-ki-tasbeeh-nahi-parhi-aur-khamosh-raha-tu-sajda-e-sahw-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-e-iqamat-se-sharie-musafat-se-kam-par-jane-mein-puri-namaz-parhe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/buchi-ke-hont-ke-nechay-wale-baal-mundane-wale-ko-imam-banana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ki-teesri-rakat-mein-fatiha-ke-baad-ruku-kar-liya-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tasveer-wale-farsh-par-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-kisi-tehreer-ko-samajhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-namaz-ki-tisri-chauthi-rakat-me-qirat-na-karna-kesa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-maghrib-ke-baad-sunnatain-aur-nawafil-salatul-awabeen-me-shamil-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aabai-shahar-se-dusre-shahar-shift-hone-par-aabai-shahar-me-namaz-ka",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-ne-imam-ke-sath-salam-pher-diya-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ke-liye-kab-salam-pherna-sunnat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/suraj-grahan-ki-namaz-akele-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/juda-bandh-kar-aur-saree-pehen-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-kab-se-kab-tak-qasar-karega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-imam-ke-peechay-jaan-bujh-kar-wajib-chor-de-to",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ki-burai-karne-wale-ka-usi-imam-ke-peeche-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/makrooh-waqt-mein-qaza-namaz-padhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aik-waqt-ki-qaza-namaz-ko-doosre-waqt-me-ada-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ruku-se-uthne-ki-tasbeeh-kab-kahe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zohar-ke-4-farz-ke-baad-bhhole-se-4-rakat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-muqaddas-maqam-ka-khayal-aana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-surah-fatiha-ya-koi-surat-dil-mein-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-ki-tasbeeh-mein",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-aurat-par-eid-ki-namaz-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aik-rakat-me-aik-sorat-ko-3-bar-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kiya-istihaze-ka-khoon-ruk-jane-se-ghusal-farz-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-qirat-kitne-awaz-se-karni-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-aur-sujood-me-attahiyat-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-taraweeh-ki-jagah-qaza-umri-ada-karsakte",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-koi-ayat-bhool-jain-tu-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-taharri-kar-kar-padhi-gai-namaz-dobara-parhi-jaye-gi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-ke-waqt-kam-kaj-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-kharish-karne-se-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ruku-ya-sajde-me-ho-tu-namaz-me-kis-tarah-shamil-hon",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-dayen-baen-ya-peechay-tasweer-ho-to-namaz-ka-kya-hukum-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-ki-4-rakat-ke-bad-agar-waqfa-nahi-kiya-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mard-aur-aurat-ki-namaz-me-farq",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-janaza-me-hasne-se-kya-namaz-toot-jae-gi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aik-rakat-me-2-ruku-ya-3-sajde-kar-liye-to-kya-hukm-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-ki-safai-ke-liye-finail-ya-chemical-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-chheenk-aane-par-tehmeed-kahe-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/oxygen-me-rakhe-huwe-bache-ke-kaan-me-azan-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/be-namazi-kon-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-agey-se-guzar-gaya-to-kya-is-ghalati-ke-izale-ke-liye-wapis-ana-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-jumma-ka-khutba-dene-wale-shakhs-ke-ilawa-aur-koi-jumma-ki-jamat-karwa-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/behoshi-ki-halat-me-qaza-hone-wali-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-naaf-ke-neeche-haath-bandhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-sahw-ka-ek-sajda-reh-gaya-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-qirat-bhool-jaye-to-luqma-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chashma-laga-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nawafil-ki-dusri-teesri-rakat-me-khilaf-e-tarteeb-quran-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/peshab-ke-baad-qatre-aane-wale-ka-imamat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/baghair-wazu-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-kon-ban-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-se-apni-namaz-me-koi-wajib-chhute-to-kya-hukm-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ki-goade-me-bacha-aajaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-eid-ki-pehli-rakat-faut-hojaye-to-masbooq-apni-baqiya-rakat-main-namaz-eid-ki-pehli-rakat-faut-hojaye-to-masbooq-apni-baqiya-rakat-main-takbirain-kab-kahe-kab-kahe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-chaar-rakat-nafil-namaz-mein-pehla-qaida-farz-hai-bhool-gaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ne-farz-ki-tesri-rakat-me-buland-awaz-se-tauz-o-tasmia-parh-liya",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sirri-namaz-me-imam-ke-piche-qirat-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-ke-bad-witr-bagair-jamat-parh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-musallah-khan-par-hona-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zuhr-maghrib-aur-isha-ke-nawafil-ka-hadees-se-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-piche-se-dono-hathon-se-kapra-chorana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-aurat-ka-chadar-ke-andar-hath-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-aurat-astin-fold-kar-ke-chadar-orh-le-to",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-pant-ko-andar-ki-taraf-fold-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-piche-attahiyat-khan-tak-parhe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-taraweeh-ki-jamat-me-isha-ki-niyat-se-mil-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-nabaligh-bacha-taraweeh-me-imamat-karwa-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ko-dusre-sajde-me-paya-to-shamil-ho-jaye-ya-intezar-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zohar-ki-namaz-padhte-hue-asar-ka-waqt-ho-jaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajar-ke-waqt-tahiyatul-masjid-ke-nawafil-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaida-me-surah-fatiha-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajar-ki-azan-me-alfaz-bhool-gaye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-bait-me-khana-peena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-ki-pehle-ki-sunnatain-qaza-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gair-mukhda-ko-mukhda-ki-tarah-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/wajib-ul-iaada-namaz-ka-waqt-guzar-jaye-to",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/teen-juma-chorne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/larke-aur-larki-ke-balig-hone-ki-umar",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sardi-ke-zarar-se-bachne-ke-liye-tayammum-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-piche-wajib-chorne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-ki-tesri-choti-rakat-me-fatiha-ke-bad-surat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/peep-nikalne-ki-halat-me-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-ke-liye-nawafil-o-sunnat-me-qasar-ka-masala",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/juma-o-eid-ke-kutbe-me-kitni-der-baithe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/pehli-rakat-ke-bad-qaide-me-baith-gaya-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamat-ke-liye-imam-iqamat-kahe-to-muqtadi-kb-khare-hon",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qirat-karte-howe-hafiz-sahab-bhool-gaey-aur-kuch-dair-socha-to-namaz-ka-kya-hukum-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ramzan-me-witar-jamat-ke-sath-parhna-afzal-hai-ya-ghr-me-tahajjud-ke-sath",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ramzan-me-azan-e-magrib-aur-namaz-ke-doran-10-mint-ka-break-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/15-days-qayam-karana-ho-phir-bhi-kya-safar-me-qasr-karen-ge",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-ki-dusri-rakat-me-fatiha-chor-kar-surah-padhne-par-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/do-shehron-ki-abadi-mil-jaye-to-namaz-me-qasar-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-e-juma-ki-rakatain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-me-takbeer-e-qunoot-ke-liye-hath-uthana-bhul-gaye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zakham-par-masah-karne-wale-imam-ke-piche-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-piche-surah-fatiha-parhne-ka-masla",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salatul-tasbeeh-me-tasbihat-ungliyon-par-ginna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khilaf-e-tarteeb-quran-parhne-se-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mareez-lait-kar-namaz-parhe-to-paon-kis-taraf-rakeh",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/wittar-ki-namaz-me-qaida-aula-farz-hai-ya-wajib",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-ko-jis-rakat-ke-bad-qaida-karna-tha-us-par-nahi-kya",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gobar-wale-kapron-me-namaz-parh-li-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ungliya-chatakne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dahwa-e-kubra-ke-waqt-me-sajda-shukr-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sahib-e-tarteeb-ne-qaza-namaz-se-pehle-bhole-se-waqti-namaz-parh-li-to",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farzon-ke-pehle-qade-me-dobara-kitna-tashahhud-parhnay-se-sajda-e-sahaw-lazim-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aik-shehar-me-15-raton-se-ziyada-ki-niyat-ki-hai-lakin-din-kahi-aur-guzarega-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/do-bando-ka-mil-kar-azan-ka-aik-aik-kalima-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/samad-ko-seen-ke-sath-as-samad-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-e-ola-par-bhool-kar-dono-taraf-salam-phair-diya-tu",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/wajib-ul-iadah-namaz-ada-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chote-bache-ko-saf-mein-khara-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aankhein-band-karke-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-ka-aakhri-waqt-kab-se-kab-tak-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ka-khutba-mimber-par-na-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajar-ki-jamat-ke-waqt-sunnat-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruko-me-rafa-yadain-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-shakhs-muqeem-imam-ke-piche-kitni-rakat-namaz-parhe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/half-t-shirt-pehan-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ke-khutba-mein-asa-pakarne-ka-kiya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-dekh-kar-tilawat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-sajde-me-tasbih-na-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ulta-dupatta-odh-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-namaz-mein-khilaf-e-tarteeb-qirat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-ki-teesri-rakat-mein-surat-milali-tu-chothi-mein-milana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-aage-sutra-lita-kar-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zohar-ki-namaz-akhri-waqt-me-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-surat-milane-se-pehle-tasmiya-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sahib-e-tarteeb-agar-qaza-namaz-ko-bhool-jaye-aur-waqti-namaz-parh-le-to-kiya-hukum-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-e-tilawat-karne-ke-baad-dobara-wahi-ayat-suni-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-azaan-dene-wale-ke-ilawa-koi-dosra-shakhs-takbeer-ya-iqamat-keh-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/baghair-ghalati-ke-sajda-sahw-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaidah-oula-mein-darood-parhne-par-namaz-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/samjhdar-na-baligh-bache-ki-azan-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-sath-ranjish-rakhna-aur-uske-piche-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ko-ruku-mein-dekh-kar-dorh-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghair-muakkadah-ke-qaidah-oula-mein-darood-aur-dua-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khutba-ke-doran-durood-shareef-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-aur-saf-ke-darmiyan-faasla",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/waqt-e-fajar-main-qaza-nama-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-na-baligh-azan-de-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/makrooh-tanzihi-amal-ki-aadat-banana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/pehli-saf-ka-eesaar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tasbih-fatima-kab-parhe",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-ki-reh-jane-wali-namaz-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-qasar-karne-ke-bajaye-puri-namaz-parhe-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnaton-ki-teesri-ya-chothi-rakat-mein-fatiha-ke-baad-surat-milana-bhool-jana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mareez-ke-liye-namaz-late-kar-namaz-parhne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-masjid-ya-finae-masjid-me-bheek-mangne-wale-ki-madad-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-rakaton-se-mutalliq-imam-aur-muqtadiyon-ka-ikhtilaf-ho-jaye-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kursi-par-baith-kar-ishare-se-sajda-tilawat-ada-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asar-ki-namaz-ke-bad-tilawat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-tilawat-baith-kar-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/danton-mein-khane-ke-zarraat-hone-ki-halat-mein-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-khayal-kisi-aur-jagah-chala-jaye-aur-rakat-ki-tadad-mein-shak-ho-to-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ulti-kameez-pahan-kar-namaz-shuru-kardi-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/karobar-ki-wajah-se-namaz-qaza-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/alcohol-wala-perfume-laga-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-aage-se-aurat-ka-guzar-jaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-kitni-qirat-karna-sunnat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-namaz-ke-baad-ijtamai-dua-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajar-ki-namaz-ke-doran-soraj-tulu-ho-jaye-to-iski-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-ka-imam-ke-sath-salam-pherne-ki-mukhtalif-soratain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sharai-musafir-ne-do-ki-bajaye-4-rakatain-parh-le-to-ab-namaz-ka-kya-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-sirf-dil-mein-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-qirat-karte-waqt-sakta-karna-bhool-gaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-se-uthte-waqt-tasmi-ki-jagah-takbeer-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurat-ke-liye-artificial-jewellery-pehan-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-me-auraton-ki-mehfil-ki-waja-se-azan-o-jamaat-na-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/4-rakat-wali-namaz-mein-bhool-kar-dosri-rakat-par-salam-pherna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/painchay-fold-kar-ke-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/barish-ke-doran-ghar-par-namaz-ada-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/juwa-khelne-wale-ke-piche-namaz-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-peshab-ka-qatra-nikalna-mehsoos-ho-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-ki-namaz-ka-waqt-aur-kitni-rakat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/miyan-biwi-ka-ghar-par-jamat-se-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-ayat-e-sajda-ki-recording-sunne-ya-likhne-se-sajda-e-tilawat-lazim-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-durood-shareef-parh-raha-ho-aur-imam-salam-pir-de-to-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghutno-ki-takleef-ki-wajah-se-kursi-par-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ki-azan-ke-bad-masjid-ke-liye-rikhshaw-ya-taxi-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-har-azan-ka-jawab-dena-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/isha-ki-17-rakaton-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tashahhud-mein-shahadat-ki-ungli-uthane-ka-durust-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/be-wazu-namaz-ke-safon-me-ruke-rehna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-samne-se-kisi-ke-guzarne-se-namaz-me-farq-parega",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jis-jaye-namaz-par-khana-kabah-ki-tasveer-ho-ispar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-masjid-ko-alodgi-se-bachane-ke-liye-parinday-ka-nest-hata-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-bhole-se-tauz-o-tasmiya-buland-awaz-se-parh-le",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witar-ki-tesri-rakat-me-qada-karke-khara-ho-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/zuhur-ki-waqt-esi-din-ki-asar-ki-namaz-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qasdan-qada-ola-chor-kar-sajda-e-sahaw-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namazain-ada-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/4-rakat-wali-namaz-me-tesri-par-bethne-ke-baad-uthna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safar-ki-halat-me-qaza-namaz-ada-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-baad-tasbeeh-tamheed-aur-takbir-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-ke-mike-per-falahi-kaamo-ka-elaan-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/duty-ke-doran-farz-namaz-ki-adaigi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-e-akhira-karne-ke-baad-bhole-se-khara-ho-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/siri-namaz-me-imam-ke-jehri-qirat-karne-par-luqma-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/magrib-ki-namaz-ka-waqt",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-sath-aik-rakat-mili-to-baqi-teen-rakatain-kese-parhen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-sana-ke-baad-taawuz-o-tasmiya-parhe-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-aurat-ke-sir-ke-latke-howe-balon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/surah-fatiha-ke-baad-surat-milana-bhool-gaye-aur-ruku-mein-yaad-aaya-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asar-aur-isha-ki-sunnatain-farz-ke-baad-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-teesri-rakat-par-baith-jaye-to-luqma-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurat-ke-liye-namaz-me-hath-ki-hatheli-chupane-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghair-muakkadah-sunnatain-parhte-hue-jamat-khari-ho-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sirf-do-logo-ki-jamat-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-raat-mein-zawal-ka-koi-waqt-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-aur-muqtadi-dono-qaide-me-hun-to-teesra-kaise-shamil-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-e-sahw-lazim-tha-bhool-kar-salam-phair-diya",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-me-dua-e-qunoot-ya-surat-parhna-bhool-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/langre-imam-ke-peeche-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/half-sleeves-t-shirt-me-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ke-sath-aik-muqtadi-ho-to-naya-aane-wala-shaqsh-jamat-mein-kaise-shamil-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-waswasay-se-bachne-ka-ilaj",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safar-mein-isha-ki-rakat-kitni-hai-aur-witr-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-jalsa-sunnat-hai-ya-wajib",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/record-shuda-tilawat-se-sajda-tilawat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-qaida-akhira-me-durood-o-dua-parhy-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaida-me-bhool-se-surah-fatiha-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ka-waqt-kam-ho-aur-jism-ya-kapre-napak-hun-to-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bhool-kar-qaida-aula-par-salam-phar-diya",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/motay-foam-par-sajda-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-sahw-wajib-na-ho-to-bhi-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaidah-aula-bhool-jaye-to",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/be-wuzu-sajda-shukar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/surah-fatiha-ki-ayat-reh-gai-to-namaz-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-ki-jamat-nikal-rahi-ho-to-tayammum-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-qibla-se-muh-pherna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qibla-se-kitna-phirne-par-namaz-fasid-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/susral-mein-namaz-qasar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ayat-e-sajda-likhne-se-sajda-tilawat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dhat-ka-karha-pehan-kar-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shari-safar-kahan-se-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-main-teen-baar-khujana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mard-ka-karha-pehan-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-ke-baad-2-nafil-aur-tahajjud",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-luqma-lena-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-sajde-mein-ayat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqeem-imam-ke-peeche-namaz-fasid-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jumma-aur-eid-aik-he-din-ajye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/haiz-mein-azan-ka-jawab-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tarawih-mein-bethe-rehna-aur-ruku-mein-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bila-uzar-beth-kar-tarawih-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-qirat-surat-se-shuru-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/maghrib-ki-sunnaten-aur-salat-ul-awabeen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kia-aurat-ka-meka-watan-e-asli-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-mein-apne-liye-sawal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/akela-shakhs-jamat-mein-kaise-shamil-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jahri-namaz-mein-kuch-qirat-aahista-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/iqamat-ke-baad-safain-sidhi-rakhne-ka-elan",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaida-akhira-me-surah-e-fatiha-parhne-se-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-akheera-mein-attahiyat-se-pehle-surah-fatiha-parh-li-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jurabain-pehn-kar-masjid-mein-aana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-ke-baad-hath-uthakar-dua-aur-muqadi-ka-ameen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-rakaton-mein-ek-hi-surat-ki-takrar",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-seedhe-paon-ka-angutha-hilna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-namaz-padhte-hue-jamaat-khari-ho-jaye-tu-is-mein-kab-shareek-hon",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-shuru-karne-ke-baad-jamaat-khari-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khutba-mein-jumma-ki-sunnatain-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ka-atahiyat-puri-kar-ke-imam-se-ruku-me-milna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-dauran-tehreer-dekh-kar-samajhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-ek-ayat-se-doosri-ayat-par-muntakil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/panch-namazain-witr-qaza-hon-kya-sahib-e-tarteeb-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-surah-mulk-ke-baad-ek-kalma-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/raat-ke-nafil-mein-buland-awaz-se-qirat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-ola-bhool-kar-khade-hone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-me-jane-se-muh-me-khoon-aana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-se-wajib-chut-jaye-to-sajda-sahw-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-ka-sana-ke-baad-taawwuz-tasmiya-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/heater-chule-ke-samne-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asr-ke-baad-sajda-e-shukar-aur-sajda-e-tilawat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/muqtadi-tasmee-kahe-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-aah-ooh-ke-huruf-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/samundar-me-iqamat-ki-niyat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tahajjud-ke-liye-isha-ke-baad-sona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-dil-mein-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ke-farz-ke-baad-sunnat-kab-padhen",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farz-ke-baad-jaga-badal-kar-sunnat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-namaz-ke-baad-seedhi-janib-phirna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-me-shamil-hone-par-rakat-milegi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/surah-fatiha-ke-baad-sirf-ek-ayat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kis-waqt-mein-namaz-jaiz-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mulazim-ko-namaz-ke-liye-kitna-time-dena-lazim",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-ruku-aur-sajda-ki-takbirat-ka-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asr-isha-ki-sunnat-ke-dauran-jamaat-khari-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/makrooh-waqt-mein-qaza-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-janaza-wali-sana-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/buchi-ke-baal-mondna-kesa-aur-jo-imam-mundwata-ho-uske-peche-namaz-parhna-kesa",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbuq-ki-baqiya-namaz-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ruku-mein-ho-to-aane-wala-shakhs-hath-kab-bande-1840",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ke-farz-parhte-hue-teesri-rakat-milali-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/char-zanu-beth-kar-namaz-parhna-9991",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kapde-par-najasat-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/eid-ki-namaz-mein-muqtadi-ki-kuch-takbeerain-reh-jayen-tu-namaz-kaise-ada-kare",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-e-bait-kya-hai-iski-fazilat-wagera-se-mutaliq-chand-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mareez-ka-baith-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imamat-ki-kitni-sharait-hain-9149",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sabaq-sunane-ke-liye-ayat-e-sajda-tilawat-karna-1796",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/doran-e-khutba-sunnat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ain-masjid-mein-azan-dena-aur-elanat-karna-6866",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chandi-ki-do-anguthiyan-pehanna-1788",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajde-main-dua-mangna-1453",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-ameen-ahista-awaaz-mein-ho-ya-buland-6744",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-nay-bhool-kar-namaz-poori-parha-di",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajday-ya-ruku-me-kapra-durust-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-chadar-odhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gaon-dehat-me-jummah",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farzon-ki-teesri-rakat-mein-fatiha-parhna-6711",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ruku-ke-baad-kya-kalimat-parhein-14548",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/suraj-grahan-ke-bare-mein-islami-nazariya-22947",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-jacket-wasket-ki-zip-khuli-hona-5880",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-e-shukr-kay-liye-wuzu",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/anay-wala-namazi-kahan-khara-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chashma-pehan-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/darul-harb-mein-jummah-parhne-ka-hukum-6368",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imama-mein-topi-ko-khula-chorna-6081",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnah-muakkadah-mein-durood-parhne-ka-hukum-1708",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-e-shukr-ke-liye-wuzu-zarori-hai-10101",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-aage-se-guzarne-ka-shari-hukum-6768",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qareebi-masjid-mein-jumma-reh-gaya-1542",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/baghair-soye-tahajjud-hosakti-hai-1515",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-mein-konsi-dua-parhen-1696",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/urine-bag-wale-mareez-ka-masjid-mein-ane-ka-hokum-1700",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azen-e-maghrib-ka-waqt",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/quran-namazi-kay-samnay-ya-peechay-ho-to",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-luqma-lena-dena",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-musalle-par-mujood-hona-5293",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-ek-surat-se-dusri-ki-taraf-muntaqil-hona-6247",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-kay-liye-jagha-badalna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/dua-e-qunoot-bhool-kar-ruku-mein-jana-6239",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tanki-mein-mara-hua-kawwa-1479",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-me-qirat-kitni-awaz-say",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/din-ke-nawafil-mein-qirat-1458",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/baligh-larke-ki-imamat-5304",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nawafil-ki-jamat-karwana-5166",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-mein-buland-awaz-se-tilawat-karna-6765",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khutbay-ke-waqt-chanda-5838",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mulazmat-ki-jagah-par-namaz-qasar-5813",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-ke-qareeb-jamat-karwana-6314",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurat-ka-jura-bandhna-kaisa-6671",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-ke-hote-hue-nawafil-parhna-2154",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jarsi-ke-niche-asteen-fold-reh-gai-to-namaz-hogi-4901",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jama-masjid-ke-ilawa-jumma-hosakta-hai-4977",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/heater-ke-samne-namaz-5946",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bacho-ka-baron-ki-saf-mein-khara-hona-1255",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fatiha-se-pehle-tashahud-parhna-5944",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-parhte-hue-suraj-ghuroob-1528",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taleem-ki-waja-se-jamat-chorna-8231",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/attahiyat-mein-tawajjo-khas-5944",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/taraweeh-ke-liye-darhi-rakhna-1570",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-e-akhria-me-ghalti",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/teesri-chothi-rakat-me-soorat-milana",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/rakat-ka-sajda-reh-gaya",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sutoon-kay-darmiyan-saff",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imaqamat-me-kab-kharay-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/darhi-mundwanay-walay-kay-peechay-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajar-ki-namaz-qaza-ho-jaye-to-farzo-ke-sath-sunnatain-bhi-parhni-hai",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nangay-sar-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ankhen-band-karkay-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ko-lambi-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/baligh-hone-kay-bad-namaz-ka-eada",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safar-me-namaz-qasar",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nabaligh-per-sajda-tilawat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bachay-masjid-ki-saff-me",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/pehlay-qada-me-attahiyyat",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bay-wuzu-sajda-e-shukr",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-muakkada-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajday-me-paon-ki-kitni-ungliyan",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nasamajh-bachay-saf-me",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-sahav",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-ayat-aur-surat-ka-taqrar-karna-6353-d",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/naqsh-e-nalain-pak-masjid-mein-laga-sakte-hain-6380",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mehrab-mein-imamat-karwana-6359",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-mein-reeh-kharij-karna-6353-c",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ghar-mein-biwi-ki-imamat-karwana-6366-a",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/doran-e-namaz-qamis-sahi-krna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/shalwar-aur-shirt-me-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/gair-e-muazin-ka-iqamat-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-e-akhira-me-baqi-rakaten",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/idtiba-ki-halat-me-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/saf-me-nabaligh-khara-ho",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qada-e-akhira-me-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-qada-akhira-ke-baad-khara-ho-gaya-12231",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/farzon-ki-rakat-mein-surat-milane-se-sajda-sahw-wajib-3935-a",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-men-khansna",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ka-chehra-qible-se-kitna-phira-hua-ho-6418",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/musafir-kis-maqam-se-qasr-kare-ga-6406",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ke-baad-musalle-ko-fold-karna-6418",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-jummah-ki-aam-ijazat-na-ho-wahn-jummah-parhna-5106",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ki-akhri-2-rakat-mein-surah-fatiha-parhna-5077",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fajr-ke-doran-suraj-tulu-ho-jaye-to-namaz-hojyegi-986",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/asar-ki-adaigi-ke-doran-waqt-e-magrib-984",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ulti-shalwar-pehan-kar-namaz-parhna-991",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ka-ruku-ki-tasbihat-ziyada-parhna-990",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salam-phere-bagair-namaz-hojyegi-987",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/nabina-shakhs-ki-imamat-5102",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-ishraq-ki-fazilat-5018",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-shalwar-ya-pant-fold-karna-5013",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/subah-sadiq-ke-baad-nawafil-parhna-5021",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/takbeer-ola-ki-fazilat-5019",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/awabeen-ki-namaz-6346",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-me-baitullah-aur-masjid-nabwi-ki-tasaveer-6275",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-e-maghrib-ke-12-minute-baad-jamaat-1811",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/azan-e-maghrib-ke-baad-jamat-5027",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/doran-e-jamaat-agli-saf-mein-jana-6302",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ne-farz-be-wuzu-parha-diye-4921",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namazain-parhna-4917",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mohallah-ki-masjid-mein-dusri-jamat-4919",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qaza-namazain-beth-kar-parhna-4916",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-agay-se-guzarna-4890",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamat-tark-karne-wale-ke-peeche-namaz-parhna-4886",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-me-aurton-ka-bajamat-namaz-parhna-4875",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/khansne-se-sajda-sahw-lazim-hota-hai-0308",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jura-band-kar-namaz-parhna-0259",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-kitni-awaz-mein-parhen-0286",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ko-kab-luqma-diya-jaye-4352",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurat-ko-sajde-mein-ungliyan-lagana-6183",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sutoono-ke-darmiyan-saf-bandi-ka-hukum-6139",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/pehli-saf-mein-wuzu-toot-jaye-to-kya-kare-6122",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-zabar-ko-paish-parh-diya-6134",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-khare-ko-para-parhna-6134",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/aurtain-ko-masjid-mein-deeni-taleem-dena-6058-b",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/salaam-se-pehle-baqia-namaz-ke-liye-khara-hona-5994",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/makrooh-waqt-mein-farz-ke-saath-sunnatein-parhna-7458",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/do-se-ziyada-muqtadi-imam-ke-sath-khare-hosakte-hain7275",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/witr-mein-dua-e-qunoot-bhool-gaye-5248",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-mein-awaaz-se-tauz-o-tasmia-parhna-5250",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namazi-ke-samne-munh-karna-5248",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/jamat-ke-doran-sunnat-parhna-5228",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sana-ki-jaga-attahiyat-parhna-5178-1",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safar-ke-doran-kya-mein-namaz-qasar-karonga-996",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/fatiha-se-pehle-surat-parhli-to-kya-hukum-hai-1015",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ulta-kapra-pehan-kar-namaz-parhna-0130",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/surah-fatiha-ke-baad-ayatein-parhna-0121",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/chatti-rakat-milane-ka-hukum-0087",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/watan-iqamat-ane-par-namaz-0069",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masbooq-rakat-parh-kar-jamat-me-shamil-hua-1033",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sahib-e-tarteeb-4826",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/tasbihat-awaz-se-parhna-4841",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ki-qirat-durust-na-ho-uske-piche-namaz-4842",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-kay-sath-tashahhud-na-parhi-4881",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sunnat-e-mokada-ki-niyat-na-ki-4883",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mard-aurat-ki-namaz-mein-farq-4858",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/sajda-tilawat-ke-bad-ayat-parhna-1929",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/safar-me-rehaishi-shehar-se-guzar-ho-to-namaz-qasar-hogi-1943",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kya-aurat-salatul-tasbeeh-ki-imamat-karwa-sakti-hai-11957-2",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/rakat-main-imam-ki-ittiba-karna-11957-1",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/ek-mutthi-se-kam-darhi-walay-ki-imamat-11957",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/qasar-namaz-ke-masail-11999",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/kiya-tangon-se-mazoor-par-jamat-wajib-hai-844",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/bache-ke-kan-main-azan-baith-kar-dena-851",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/imam-ki-pervi-852",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/namaz-main-ulta-quran-parhna-853",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/late-kar-namaz-parhne-ka-tariqa-854",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/hawai-jahaz-main-namaz-5923-e",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/mihrab-mein-azan-dena-6017-3",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/napaki-ki-halat-main-namaz-6069",
-  "https://www.fatwaqa.com/ur/fatawa/namaz/masjid-main-school-ki-class-lagana-6082",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/janaza-takbeer-hath-uthana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/shohar-inteqal-chehra",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ghusl-e-mayyat-ki-tadad-neez-dant-nikalna-aur-baal-kaatna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/sabz-rang-ke-kafan-ki-wasiyat",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/muslim-aur-ghair-muslim-mayyat-pehchan",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/masjid-se-janaza-guzarna-aur-chehra-dikhana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-mein-5-takbeerain-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayat-ke-satar-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-ki-niyat-aur-duain",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayat-dekhne-ke-baad-wazu-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayat-ko-bosa-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/bachon-se-qabar-mien-sawal-hona",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/waldain-ke-qatil-ki-namaz-e-janaza",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ghusl-mayyat-lazmi-kyun",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-mare-hue-insan-ki-bhi-gheebat-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/biwi-ke-ilawa-rishtedaron-ke-liye-sog",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/fasiq-ka-janazah-parhana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-pass-anaj-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ka-chehra-dikhane-ke-liye-masjid-mein-lana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-na-mehram-aurat-ke-janaze-ko-kandha-dena-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ki-haddiyan-milen-to-namaz-e-janaza-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ki-haddiyan-milen-to-namaz-janaza-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-janaza-sunnat-e-badiya-se-pehle-ya-baad-mein",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-kitni-gehri-honi-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-janaza-ki-kitni-takbeerain-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/post-mortem-ke-liye-qabar-kholna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-janaze-ki-dua-hadees-se-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/aurat-ka-chhote-bache-ki-mayyat-ko-ghusl-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/marhoom-ka-qarz-utarne-ke-mutalliq-tafseeli-fatwa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/zinda-paida-hone-wale-bache-ke-ghusl-o-janaza-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ghusal-mayyat-mein-hathon-par-kapda-lapetna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-janaza-ki-niyat-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-janaza-teesri-takbeer-bhool-salam-pherna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ka-khana-khane-se-dil-murda-hona",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/inteqal-ke-baad-40-din-tak-ghareebon-ko-khana-khilana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/inteqal-ke-baad-40-din-tak-qabar-par-agarbatti-jalana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-dafan-karne-ke-baad-nikal-kar-dusri-jagah-dafnana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/janaza-ki-pehli-takbeer-ke-ilawa-deegar-takbeerat-par-hath-uthana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/baligh-o-na-baligh-ki-ek-sath-namaz-e-janaza-mein-kaunsi-dua-parhen",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/na-baligh-mayyat-ko-talqeen-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ihram-ka-kapda-kafan-mein-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/janaza-sar-ki-jaga-paon-ki-taraf-se-parhana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/inteqal-ke-baad-jisam-se-rod-nikalna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/dam-kiya-hua-pani-qabar-par-dalna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-janaza-mein-kaunsa-durood-parhna-afzal-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ghar-mein-mayyat-ho-jane-par-ghar-ka-khana-phenkna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabristan-mein-ghas-khatam-karne-ke-liye-dawai-dalna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-namaz-janaza-ke-azkar-buland-awaz-se-parhna-sunnat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-ko-oont-ki-kohan-ki-tarah-banane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/safed-rang-ke-ilawa-kisi-aur-rang-ka-kafan-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-amanatan-dafan-karne-aur-wapas-nikalne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-bila-wajah-2-bar-ghusl-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/jo-marte-huwe-kalma-na-parh-sake-us-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kafan-se-bacha-hua-kapra-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/dedh-mahine-ke-bache-ka-janaza-parhna-aur-parhe-bagair-dafan-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-paon-aur-chehra-chomne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-mein-deewar-se-dekh-kar-dua-parh-li-to",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/insan-ke-marne-ke-baad-kiraman-katibeen-kahan-jate-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-fasiq-e-mulin-namaz-e-janaza-parha-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-aurat-ke-kafan-par-phool-daal-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-faqat-3-bando-ke-sath-bhi-namaz-e-janaza-ada-ki-ja-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-mein-sawalat-kis-zuban-mein-honge",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-qabristan-ke-liye-kandhon-par-kyun-le-jate-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/talqeen-karne-ka-tarika-aur-talqeen-madri-zuban-mein-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/aurat-ka-ghair-mehram-mayyat-ka-chehra-dekhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/jis-takht-ya-palang-par-mayyat-rakhi-usay-ghar-mein-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/sog-kitne-din-tak-kiya-ja-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/beta-apne-walid-ka-janaza-parha-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/accident-mein-marne-wale-ki-qabar-ki-takhti-par-shaheed-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/murde-ko-khushboo-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/chand-din-baad-qabar-par-mitti-dalna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-ghusl-aur-kafan-dene-ki-fazilat",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/chota-bacha-faut-ho-jaye-to-kya-walida-ghusl-de-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/gane-sunne-wale-ki-namaz-e-janaza-parhna-aur-dua-e-maghfirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-ghusl-diye-bagair-dafan-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/dadi-aur-pote-ko-ek-he-qabar-mein-dafnana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-mein-imam-5-takbirain-keh-de-to-muqtadi-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-janaza-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/shaheed-ke-liye-dua-e-maghfirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/aurat-ke-kafan-ki-zimmedari-kis-par-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-pehne-hue-kapro-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/walidain-ki-qabron-ki-ziyarat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-ghusl-dene-ke-baad-najasat-nikle-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mard-aur-aurat-ka-halat-e-janabat-mein-mayyat-ko-ghusl-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/raat-ke-waqt-taziyat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/imam-ka-namaz-e-janaza-mein-3-takbir-par-salam-pherna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/sarhe-5-mah-ka-hamal-saqit-ho-jaye-to-usay-kahan-dafnaya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/tadfeen-ke-baad-qabar-par-kitni-dair-therna-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/v-6945-naza-ke-waqt-talqeen-karne-ka-tariqa-aur-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/soyam-ke-chane-khana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-mustamal-pani-se-mayyat-ko-ghusal-diya-ja-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-charpai-se-utaar-kar-zameen-par-rakh-kar-janaza-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-mayyat-islal-e-sawab-karne-wale-ko-janti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-najashi-ka-janaza-ghaibana-tha",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-janaza-mein-kuch-takbeerat-reh-jayen-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/apni-faut-shuda-biwi-ki-peshani-chomna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-insan-ko-us-mitti-se-paida-kiya-gaya-hai-jahan-wo-dafan-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/janaza-gah-choti-hone-ki-wajah-se-2-bar-janaza-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ghusl-e-mayyat-ke-pani-ki-cheentain-pak-hain-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-par-murde-ke-naam-ki-takhti-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/wazu-karne-ka-waqt-to-na-ho-to-bila-wazu-namaz-e-janaza-parhnay-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/jism-par-tatto-banwane-wale-ki-namaz-janaza-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/jin-ko-qabar-mein-dafan-na-kiya-ja-saka-un-se-sawalat-e-qabar-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ki-tasweer-banana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kisi-ke-inteqal-ke-baad-40-din-tak-khana-khilane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ki-tajheez-o-takfeen-ke-baad-salam-parhna-aur-namaz-janaza-ke-baad-dua-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-tarke-se-guzishta-salon-ki-zakat-nikalne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-me-salam-pherne-aur-hath-chorne-ka-durust-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/aurat-ki-mayyat-ko-taboot-mein-rakh-kar-dafan-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-se-ghas-saaf-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/paida-hote-he-marne-wale-bache-ki-namaz-e-janaza-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/chhat-ke-neeche-namaz-janaza-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/chote-bache-ka-janaza-hathon-par-utha-kar-qabristan-le-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-ghusl-mein-istemal-hone-wale-sabun-aur-toliya-towel-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qadiani-mirzai-ka-namaz-janaza-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/hazrat-fatima-ko-kis-ne-ghusl-diya",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-mein-safon-ki-tadad-kitni-ho",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-aurat-ki-qabar-ziyada-gehri-honi-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-ghar-walon-ke-rone-se-mayyat-ko-azab-hona",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/shoes-pehen-kar-namaz-e-janaza-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ghair-shadi-shuda-mayyat-ko-dafan-karne-se-pehle-hath-ya-paon-mein-mehndi-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/wafat-ke-baad-walidain-par-aulad-ke-amal-ka-pesh-hona",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-mein-mayyat-ke-sath-tabarrukat-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/zehreelay-janwar-ke-kaatne-se-fout-hone-wala-shaheed-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/farz-namaz-ke-waqt-janaza-aaye-tu-kab-ada-karein",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/safar-mein-faut-hone-wala-shaheed-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/taziyat-ke-din-mukammal-hone-par-nahana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/pedaish-ke-baad-inteqal-karne-wale-bache-ke-liye-azan-aur-namaz-e-janaza-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/makrooh-time-mein-namaz-e-janaza-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ajnabi-mard-ka-aurat-ki-mayyat-qabar-mein-utarna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-ke-baad-dua-karne-ka-hadees-se-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ki-taraf-se-namazon-ka-fidya-masjid-mein-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/daketi-ke-doran-agar-daku-ko-qatal-kar-diya-tu-kya-is-ki-namaz-e-janaza-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/beri-ke-patton-se-mayyat-ko-ghusl-dene-ke-fawaid",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/janaza-dekh-kar-khara-hona-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ki-aankhon-mein-lens-lage-hon-tu-unhen-nikalne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-masnoi-dant-nikalne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-aabe-zamzam-se-mayyat-ko-ghusl-dena-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-mein-hath-kab-khole-jaen",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-junbi-shakhs-mayyat-ko-ghusl-de-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kis-musalman-ki-namaz-e-janaza-nahi-parhi-jaye-gi",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-ghusal-dene-ki-ujrat-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/dadi-saas-ki-wafat-ke-15-din-baad-naye-kapre-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-mein-teen-takbeerat-par-salam-pherna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-muh-se-sone-ka-dant-nikalna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-marne-ke-baad-rooh-ghar-me-wapas-aati-hai-rooh-ka-ghar-aana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kisi-qabristan-ka-pata-na-ho-ke-muslims-ka-hai-ya-nahi-tu-fatiha-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-liye-kafan-ka-kapra-kitne-meter-hona-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/bed-ya-charpai-par-mayyat-ko-uthana-aur-us-par-rooh-ka-aana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-ghusal-dene-ki-jagah-agarbatti-jalne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/murda-bacha-paida-ho-to-uske-dafan-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/na-mehram-mayyat-ka-chehra-dekhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-haiz-ki-halat-me-faut-hone-wali-aurat-shaheed-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-sandooq-me-rakh-kar-dafan-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-ki-dua-na-aati-ho-to-us-ki-jagah-kya-parhen",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/hamla-aurat-pait-me-mojood-bacha-dono-inteqal-kar-gaye-to-tadfeen-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-par-pani-dalna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mah-e-ramzan-me-fout-hone-wale-ke-liye-qabar-me",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/pehle-ki-qabar-khol-kar-is-me-dosra-shakhs-dafan-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/baligha-aur-nabaligha-ka-janaza-aik-sath-parhate-hue-pehle-kon-si-dua-parhi-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/aurat-ke-kafan-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ghusl-e-mayyat-me-istemal-hone-wale-tub-ko-kisi-dusre-kaam-me-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-darya-ya-neher-se-milne-wali-laash-ko-bhi-ghusal-dena-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/bacha-murda-paida-ho-to-us-ko-ghusal-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/rishtedaron-ka-mayyat-ke-ghar-walo-ke-liye-khana-lana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/zindagi-me-apne-liye-qabar-taiyar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-dafnane-ke-liye-purani-qabar-khodna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/inteqal-ke-baad-aane-wali-pension-ki-milkiyat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-par-takhti-lagwana-aur-is-per-likhwanay-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-ki-safoon-ke-darmiyan-fasle-rakhne-ki-miqdar",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/taziyat-coondolence-kaise-ki-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-baal-katna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabron-par-pani-dalna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/jumma-ke-din-faut-hone-wale-ke-liye-azab-se-nijat-ki-basharat",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ka-sog-kis-waqt-se-shuru-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/murda-bacha-paida-ho-to-ghusl-dena-kaisa-ghusl-ke-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/haiz-o-nifaas-ki-halat-mein-aurat-ki-mayyat-ko-ghusal-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-sailab-mein-faut-hone-wala-shaheed-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-par-awaz-se-rone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-ke-paas-agarbatti-jalane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/hamla-aurat-ka-inteqal-ho-jaye-to-pait-me-mojood-bache-ke-mutalliq-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-dafan-karne-ke-bad-40-qadam-par-dua-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-ghusal-me-istemal-hone-wali-balti-aur-mug-ko-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kia-murday-suntay-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-me-chatai-bichane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/zamin-par-char-diwari-khari-kar-ke-mayyat-ko-us-me-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-qabar-me-letane-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/hijra-ke-ghusal-o-kafan-ka-masla",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/finaye-masjid-me-namaz-e-janaza",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/paidaishi-majnoon-balig-hune-ke-bad-faut-huwa-to-janaze-ki-dua",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/dusre-ki-qabar-me-dafan-hone-ki-wasiyat",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/agar-maa-baap-narazgi-me-inteqal-kar-jayen-to",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/murda-bache-ki-tadfeen-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/zinda-paida-ho-kar-marne-wale-bache-ke-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/imam-e-masjid-ka-kisi-mayyat-ko-ghusal-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/taboot-mein-band-mayyat-ki-namaz-janaza-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-ghusl-dete-waqt-us-ke-paon-kis-taraf-honge",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/murda-khwab-mein-zinda-dekhnay-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-pet-per-kuch-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/aik-qabar-mein-dosra-murda-dafan-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kya-zindagi-mein-apne-liye-kafan-taiyar-karke-rakh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/jis-aurat-ki-shadi-nahi-hui-ose-ghusal-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/tadfeen-se-pehle-esale-sawab-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ka-chaliswa-aur-daswa-waghera-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ghaibana-namaz-e-janaza-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-ghusal-dene-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/murde-ko-talqeen-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabristan-par-chat-bana-kar-janaza-gah-banane-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ka-sar-na-ho-to-namaz-e-janaza-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kafan-dene-ke-baad-dobara-napak-hojaye",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/taziyat-mein-aane-walon-ka-dua-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/barish-ki-wajah-se-qabar-gir-gai-to-kaise-theek-karen",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/janaze-ke-sath-kalma-parhte-hue-kahan-chalen",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-qareeb-quran-ki-tilawat",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ek-ne-janaza-parha-to-baqi-beton-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-gair-zaroori-baal-katna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayat-aur-daswen-chaleeswain-ke-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/khud-kushi-karne-wale-ki-namaz-janaza",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/rishtedar-ki-purani-qabar-mein-dafan-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-me-aurat-ke-sar-ke-baalon-ka-parda",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qayamat-ke-din-70-murde-ek-qabar-se-niklalna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-ghusl-dene-ke-baad-chhuna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/zinda-peda-hokar-marne-wale-ka-janaza",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ambulance-mein-mayyat-ki-namaz-janaza",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ek-se-ziada-martaba-namaz-janaza",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-par-hara-poda-nikal-aaye-to-hatana",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-par-ugne-wale-pode-katna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ka-sir-na-ho-to-janaza-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-qabar-mein-rakhne-ka-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ka-maal-teeja-daswan-chaliswan-khana-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-mein-ahd-nama-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-pakki-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mard-aur-aurat-ka-janaza-ek-sath-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/muqtadi-ka-namaz-janaza-ki-takbir-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/muqtadi-namaz-janaza-ki-takbeer-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kafan-par-kalma-sharif-linkhna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/abe-zamzam-ko-qabr-ya-kafan-par-chirkna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/coronavirus-se-marne-wale-ki-namaz-e-janaza",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayat-ki-tadfeen-mein-takheer-karna-6439",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-se-pehle-mayat-ke-liye-fatiha-parhna-8628",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/janaza-kay-bad-mayyat-ka-chehra-dekhna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/baligh-larkay-aur-na-baligh-larki-ka-sath-janaza",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/purani-qabad-me-kisi-ko-dafan-krna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/aurat-fatiha-parhne-ke-liye-qabristan-ja-sakti-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ek-sath-janaza-parhna-9793",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/janaza-me-dekh-kar-dua-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/murda-bachy-ki-tajheez-o-takfeen",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-par-matti-dalna-pani-chirakna-aur-laip-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/fout-shuda-biwi-ka-chehra-dekhna-14154",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabristan-ki-khushk-ghaas-ko-jalana-6188",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/janaza-le-kar-jane-ka-tariqa-1447",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-par-azan-dena-5791",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/purani-qabar-mein-tadfeen-1412",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-mein-salam-pherna4797",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-pakki-karana-4992",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-walay-ghar-rukna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-sard-khana-me-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/aik-qabr-me-ziada-murday",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/rooh-nikalne-ki-jagha-dhona",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ko-do-bar-gusl-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/khud-kushi-walay-ki-namaz-e-janaza",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/aurat-kay-janaza-ko-kandha-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/kafan-mein-sili-hui-shalwar-ka-istemal-1029",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ek-sath-do-barsian-fatiha-khawani",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/taziyat-kay-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/janaza-mein-takbeerain-reh-jaen-5107",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayat-ki-charpai-ulti-rakhne-se-namaz-e-janaza-hojyegi-4993",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/tajheez-o-takfeen-mein-takhir-ka-hukum-4877",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/janaza-me-hath-chorne-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-jism-ko-sabun-se-dhona-0245",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-par-pani-chirakna--5252",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/murde-ko-ghalat-janib-dafna-diya-5252",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-parh-li-ab-dobara-parhna-kaisa-5245",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ki-barsi-ka-khana-858",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/na-maloom-ki-namaz-janaza-kaise-parhain-5184",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-pass-tilawat-krna-5201",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/namaz-e-janaza-ki-takrar-0049",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-dobara-banana-0032",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-dafnane-ke-baad-rukna-1030",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/qabar-mein-shajra-rakhna-1029",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/ghaibana-namaz-e-janaza-4825",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/mayyat-ke-bal-katna-4830",
-  "https://www.fatwaqa.com/ur/fatawa/mayyat/tije-kay-chano-ka-maldar-ko-khana-859",
-  "https://www.fatwaqa.com/ur/fatawa/roza/dawai-peesna-roza",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-na-rakhne-wala",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-iftar-karne-ka-sahi-waqt",
-  "https://www.fatwaqa.com/ur/fatawa/roza/musafir-par-sadaqah-fitr",
-  "https://www.fatwaqa.com/ur/fatawa/roza/aankh-mein-drop-roza",
-  "https://www.fatwaqa.com/ur/fatawa/roza/rozon-ka-fidiya",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-be-sabri-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ramzan-ke-ilawa-kisi-aur-mahine-ke-30-roze-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nafli-roze-mein-haiz-aaye-to-qaza-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/youm-e-arafa-ke-roze-ki-fazilat",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-sanp-ya-bichu-ka-katna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sehri-mein-ankh-na-khulne-par-roza-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/qaza-rozon-mein-saal-muayyan-na-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-cpap-machine-roza-tor-deti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-baligh-hona",
-  "https://www.fatwaqa.com/ur/fatawa/roza/jumma-ya-hafte-ko-qaza-roza-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ayyam-e-tashreeq-aur-qurbani-ke-din-roza",
-  "https://www.fatwaqa.com/ur/fatawa/roza/rozedar-ka-asar-ke-baad-farz-ghusl-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mutakif-ki-mawajeh-shareef-par-hazri",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mutakif-dusri-masjid-jana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-namaz-qaza-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/farz-ghusl-kiye-bagair-roza",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-milap-aur-chhune-se-inzal",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-danton-ka-ilaj",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nabaligh-bacha-roza-torde-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-mushtzani-se-inzal-na-hua-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-bos-o-kinar-se-mazi-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/din-mein-haiz-ya-nifas-se-pak-hon-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-muh-ke-chhalon-par-tube-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ramzan-ul-mubarak-mein-3-din-ka-itikaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/bure-khayalat-se-inzal-ho-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-facial-mask-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-kaan-khujlana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-pakhana-ke-maqam-par-dawai-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/pait-meein-maujood-bache-ka-fitra-kis-par-lazim-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/safar-mein-roza-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/chand-afrad-ka-fitra-ek-miskeen-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/bawarchi-ka-roze-ki-halat-mein-chawal-chaba-kar-check-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mard-ki-agli-sharamgah-mein-pani-jane-se-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/qaza-roze-ki-niyat-ka-waqt",
-  "https://www.fatwaqa.com/ur/fatawa/roza/alsar-ke-sabab-roza-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ek-mulk-mein-sadqa-fitr-dene-ke-baad-dusre-mulk-mein-eid",
-  "https://www.fatwaqa.com/ur/fatawa/roza/baligh-aulad-ka-sadqa-fitr-bagair-ijazat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/gurde-mein-infection-ki-waja-se-roze-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/dawai-ki-waja-se-roza-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-dar-ka-nawala-nigalna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-me-kulli-ke-baad-muh-ki-tari-nigalna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-danton-mein-phansi-cheez-nigalna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/na-baligh-aulad-dusre-mulk-ho-to-fitrana-kis-hisab-se-den",
-  "https://www.fatwaqa.com/ur/fatawa/roza/itikaf-me-bethne-sharait",
-  "https://www.fatwaqa.com/ur/fatawa/roza/bhap-lene-se-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/rishtedar-ke-janaze-ke-liye-itikaf-torna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/naswar-rakh-kar-sone-se-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/jo-na-roza-rakh-sake-aur-na-fidya-de-sake-uske-liye-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-mustahiq-ko-khana-khilane-se-sadaqa-fitr-ada-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/neend-mein-khane-peene-se-roza-kyun-tootta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kaan-ka-parda-phata-ho-tu-roze-mein-ghusl-kaise-karen",
-  "https://www.fatwaqa.com/ur/fatawa/roza/fidye-mein-kis-saal-ki-qimat-ka-aitbaar-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-danton-ki-safai-aur-root-canal",
-  "https://www.fatwaqa.com/ur/fatawa/roza/zahwa-e-kubra-se-pehle-pehle-qaza-roze-ki-niyat",
-  "https://www.fatwaqa.com/ur/fatawa/roza/iftar-mein-azan-ke-doran-khana-peena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nafil-roza-toot-jaye-to-baqi-din-kha-pi-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/roza/musafir-mareez-ramzan-ke-ilawa-roza",
-  "https://www.fatwaqa.com/ur/fatawa/roza/raat-ka-khana-sehri-ki-niyat-se-khana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/majbooran-nafil-roza-todne-ki-soorat-mein-qaza-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nafil-roze-ki-niyat-karke-so-jaye-aur-sehri-na-kar-sake-to",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sirf-dukhool-se-roza-toot-jayega-ya-inzal-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/piyas-ki-waja-se-roze-chorna-aur-uske-badle-fidya-dena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mannat-ke-roze-aur-nafli-roze-mein-zada-sawab-kis-ka-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ramzan-mein-ghair-rozadar-musafir-din-mein-muqeem-ho-jaye-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-wajib-ya-nafil-roza-torne-par-bhi-kaffara-lazim-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/jahaz-mein-safar-ke-doran-roza-kab-iftar-kiya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/roza/maa-ke-pait-mein-mojood-bache-ka-sadqa-fitr-dena-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-itikaf-ki-qaza-agle-saal-ramzan-mein-he-karni-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/uk-mein-rehne-wale-ka-pakistan-mein-fitra-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sehri-ke-bagair-nafil-roza-rakha-to-roza-ho-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-rakhne-ke-baad-bemar-hogaya-to-roza-torne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/flight-mein-sehri-ka-waqt-ho-jaye-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/fitra-ki-raqam-heela-kiye-bagair-qari-sahab-ki-tankhwa-mein-dena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mobile-ki-battery-zuban-se-check-karne-ki-soorat-mein-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/gandum-ke-ilawa-kishmish-jau-ya-khajoor-se-fitra-kitna-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mutakif-jumma-parhne-dusri-masjid-jaye-tu-kya-sar-par-kapra-rakhna-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-biwi-ke-qareeb-jana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sote-mein-danto-se-khoon-nikalta-ho-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-bukhar-ke-andar-matli-door-karne-ke-liye-namak-khana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-masjid-mein-iftari-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/roza/na-baligh-bache-ka-itikaf-mein-bethna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/drip-lagwane-se-roza-toote-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sehri-khatam-hone-ke-baad-khata-peeta-raha-to-baqi-din-khane-peene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/khane-ki-khushboo-soongh-li-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-sehr-o-iftar-ke-khane-ka-hisab-nahi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sans-ki-problem-ki-wajah-se-kulli-mein-pani-halaq-se-utar-jaye-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/australia-mein-rehne-wale-students-ka-fitra-pakistan-mein-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/pipe-se-pani-khinchte-hue-pani-halaq-se-utar-gaya-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/jis-ko-fitra-diya-jaye-kya-usay-batana-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/iftari-ke-time-se-pehle-ghalti-se-iftar-karliya-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-thook-nigalne-se-roza-toot-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/roza/rozadar-ne-behoshi-mein-pani-pi-liya-to-roza-toot-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/musafir-zawal-se-pehle-ghar-pahunch-jaye-to-us-din-ke-roze-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-namaz-qaza-ho-jaye-tu-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/dant-se-khoon-nikal-kar-halaq-mein-chala-gaya-tu-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-masooron-se-khoon-nikal-kar-halaq-mein-utra-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/biwi-ne-shohar-ka-fitra-uski-ijazat-ke-bagair-ada-kiya-to",
-  "https://www.fatwaqa.com/ur/fatawa/roza/shawwal-ke-6-rozon-aur-ayyam-e-beez-ke-rozon-ki-ek-sath-niyat",
-  "https://www.fatwaqa.com/ur/fatawa/roza/face-par-steam-dene-se-roza-toote-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/shohar-ki-gair-maujudgi-mein-biwi-ka-nafli-roza-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/qaza-roze-ki-niyat-kis-waqt-mutabar-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-shawwal-ke-6-roze-rakhna-makrooh-hai-ek-aitraz-ka-jawab",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-shawwal-ke-6-rozon-mein-qaza-rozon-ki-niyat-bhi-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sadqa-e-fitr-mein-kapre-waghera-khareed-kar-dena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-itikaf-karne-se-kabira-gunah-bhi-maaf-ho-jate-hain",
-  "https://www.fatwaqa.com/ur/fatawa/roza/lab-ke-dhuein-se-roza-tootega-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ke-kaffare-ki-raqam-madrase-mein-dena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-mazi-nikalne-se-roza-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/galat-masla-maloom-hone-par-ehtelam-ke-baad-roza-tor-diya-tu-kaffare-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mutakif-ka-masjid-ke-hujre-mein-sona",
-  "https://www.fatwaqa.com/ur/fatawa/roza/bosa-lene-se-mani-nikal-jaye-tu-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/masjid-mein-ghusl-khana-na-ho-to-kya-mutakif-ghusl-ke-liye-bahar-ja-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/din-mein-roze-ki-niyat-karne-se-mutalliq-aham-masla",
-  "https://www.fatwaqa.com/ur/fatawa/roza/marhoom-ki-mannat-mane-hue-itikaf-ka-fidya-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/maldar-aurat-par-aulad-aur-shohar-ka-fitra-dena-zaroori-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-roze-mein-khud-bakhud-ulti-aane-se-roza-toot-ga-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-mouthwash-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/eid-se-pehle-fitrah-diya-aur-eid-wale-din-gandum-ka-rate-barh-gaya-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-galti-se-naak-mein-dawai-dali-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/eid-ke-moqe-par-mehman-ka-sadqa-e-fitr-kis-par-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/shaban-al-moazzam-ki-29-aur-30-tarikh-ka-roza-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/aeroplane-mein-iftar-kis-waqt-kiya-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-kaan-chidwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/danto-mein-surakh-ho-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sehri-ka-waqt-khatam-hone-par-bacha-hua-khana-khana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-dentist-se-danto-ki-safai-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/taraweeh-ke-baghair-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/itikaf-mein-baithne-ka-sahi-waqt-kon-sa-hai-hadees-e-pak-ki-sharah",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mannat-ke-itikaf-ke-ihkam",
-  "https://www.fatwaqa.com/ur/fatawa/roza/piyas-ki-wajah-se-roze-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/masjid-ke-imam-ko-fitra-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/agar-batti-ka-dhuwan-halq-mein-jaye-to-roza-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/bache-ko-kis-umar-mein-roza-rakhwana-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-aloe-vera-gel-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/dhuan-ya-gard-o-ghubar-halaq-mein-chala-jaye-to-roza-toot-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ke-kaffare-ka-khana-madrase-mein-dena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/bhool-kar-khane-peene-se-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ramadan-se-pehle-sadqa-fitr-ada-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-hijama-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-miyan-biwi-ka-ek-dosre-ko-chona",
-  "https://www.fatwaqa.com/ur/fatawa/roza/qaza-roza-toot-jaye-to-dobara-kitne-roze-rakhne-honge",
-  "https://www.fatwaqa.com/ur/fatawa/roza/pichle-ramzan-ke-roze-baqi-hon-tu-agle-ramzan-ke-rozon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/qaza-roze-ki-niyat-azan-e-fajr-ke-doran-ya-baad-mein-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ayyam-e-beez-ke-roze-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/phool-ki-khusboo-se-roza-totega-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-cigarette-ka-dhuan-halaq-mein-jaane-se-roza-toot-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/roza/qaza-o-nafil-roze-ki-niyat-ek-sath-ki-tu-kon-sa-ada-hoga-",
-  "https://www.fatwaqa.com/ur/fatawa/roza/haiz-ki-wajah-se-pichle-saal-roze-na-rakhe-tu-is-saal-ramadan-ka-iitikaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-biwi-ka-bosa-lena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-na-mehram-larki-ko-bosa-dena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/jima-karne-se-roza-kab-tute-ga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mehman-ka-mezban-ki-khatir-nafil-roza-torna-kaisa-aur-is-nafil-roze-ki-qaza-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/12-rabi-ul-awwal-ka-roza-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-mohalle-ki-masjid-mein-itikaf-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/60-miskeeno-ka-kaffara-ek-he-miskeen-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/maa-ke-rozon-ka-fidya-un-ki-bahu-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/jaan-bujh-kar-farz-roza-chorne-ki-talafi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/hafte-ke-din-ka-roza-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-khare-pani-se-kulli-karna-aur-us-ka-zaiqa-halq-mein-jana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/zil-hajj-ke-mahine-mein-ayyam-e-beez-ke-roze-kaise-rakhe-jayen",
-  "https://www.fatwaqa.com/ur/fatawa/roza/1-se-9-zil-hajj-ke-rozon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/itikaf-ke-doran-haiz-aane-par-aurat-ka-masjid-e-bait-se-nikalne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/jo-shakhs-ramzan-ka-roza-na-rakhe-usay-khana-bana-kar-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/guzishta-salon-ka-sadqa-fitr-ada-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-miyan-biwi-ka-ek-dosre-ki-zuban-choosna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/itikaf-ki-qaza-mein-roza-kis-niyat-se-rakhe",
-  "https://www.fatwaqa.com/ur/fatawa/roza/iftari-ke-chande-ki-raqam-bach-jaye-to-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/roza/apni-beti-ko-rozon-ka-fidya-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-naaf-mein-tail-dalna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sadqa-fitr-ki-raqam-masjid-ki-tameer-mein-dena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/rukhsati-se-pehle-mankooha-ka-fitra-kis-par-wajib-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/aurat-ka-bhool-kar-masjid-e-bait-se-nikal-jana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/pait-mein-mojood-bache-ke-sadqa-fitr-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/aik-qadam-masjid-se-bahir-nikalne-se-itikaf-toote-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/itikaf-ki-halat-mein-musht-zani-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/pilastar-lagane-ke-liye-itikaf-ki-jagah-se-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/itikaf-ki-halat-mein-aurat-attach-bath-mein-naha-sakti-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/jis-jagah-masjid-e-bait-ki-niyat-nahi-wahan-aurat-ka-iikaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/khana-banate-waqt-dhuan-naak-mein-chala-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-iftar-karte-waq-ki-dua",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ramzan-ka-roza-na-rakhne-ka-kaffara-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/khane-ka-wazu-karne-ke-liye-mutakif-ka-wazu-khane-jana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-namak-waghaira-chakhna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-naswar-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-maqrooz-ko-sadqa-fitr-diya-ja-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nafil-roze-ki-halat-mein-aurat-ko-haiz-aa-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/halat-e-itikaf-garmi-aur-safai-sutrai-ke-liye-ghusal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-aik-fitra-do-afrad-ko-de-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/roza/itikaf-ki-mannat-manne-se-mannat-kyun-wajib-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/taraddud-ke-sath-roze-ki-niyat-karne-par-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/masjid-e-bait-mein-miyan-biwi-ka-ek-sath-rehna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/jumatul-wida-ke-din-qaza-e-umri-ke-liye-parhi-jane-wali-namaz-ki-haqeeqat",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-dar-ke-halaq-mein-machar-chala-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ramzan-mein-gunah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-balgham-nigalne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/aurat-ka-itikaf-mein-beth-kar-dars-e-nizami-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-mazi-nikal-jaye-to-kya-hukm-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sehri-khana-bhi-roze-ki-niyat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-sadqa-e-fitar-eid-se-pehle-ada-kiya-ja-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/taraweeh-parhane-ki-wajah-se-roza-chorna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/itikaf-mein-kon-kon-si-ibadat-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ramzan-mein-dusre-mulk-jane-par-28-roze-bane-tu-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ramzan-mein-konsa-wazifa-kiya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-koi-wajib-ya-farz-chotne-se-kya-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ek-mulk-mein-roze-shuru-karne-ke-baad-dusre-mulk-mein-zaid-roza-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/namaz-e-maghrib-se-pehle-roza-iftar-karna-chahiye-ya-namaz-ke-baad",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kin-soorton-mein-roza-torne-par-kaffarah-lazim-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/janabat-ki-halat-mein-sehri-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/qaza-roza-tootne-par-qaza-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/farz-roze-baqi-hon-tu-nafil-roza-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/50-saal-se-ziyada-umar-ho-tu-pichle-saalon-ke-qaza-rozon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sehri-ke-khatam-hone-ka-waqt-maloom-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/roza/lip-stick-pak-hai-ya-napak-aur-roze-mein-lip-stick-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/raat-mein-qaza-roze-ki-niyat-ki-magar-sehri-mutlaq-roze-ki-niyat-se-ki-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-musalsal-nafli-roza-rakhna-mana-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-roze-ki-halat-mein-sonography-karwane-se-roza-toot-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-machis-ki-teeli-boo-naak-mein-chali-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-baghal-ke-baal-saaf-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nafil-roza-12-baje-se-pehle-torne-par-qaza-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-muh-mein-jama-thook-ya-honton-par-laga-thook-nigalna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-dar-ke-mou-se-koi-zarra-halaq-mein-jaye-to-rozay-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-sadqa-fitr-subha-sadiq-ke-baad-sahib-e-nisab-hone-se-wajib-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ghalti-se-time-se-pehle-iftar-kar-liya",
-  "https://www.fatwaqa.com/ur/fatawa/roza/rozedar-ke-samne-khane-se-is-ki-haddiyon-ka-tasbih-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/masjid-bait-se-bahar-jakar-hath-muh-dhona-ya-nafil-kaam-ke-liye-wazu-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-me-namkeen-pani-se-kulli-karne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-haalat-mein-gul-manjan-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-haalat-mein-vicks-baam-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mohalle-ki-masjid-ke-alawa-masjid-me-itikaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/5-din-ke-liye-itikaf-kar-sakte-hain-kya",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sadqa-e-fitar-gareeb-ke-account-me-bhejna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kisi-doosre-ki-khajoor-se-iftar-karne-mein-roza-dar-ka-sawab-kam-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-dar-ka-honton-per-vaseline-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/tabiyat-kharab-hone-ki-waja-se-itekaf-chorna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/gande-manazir-se-roza-daar-ko-ihtilam-hojaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/istri-karte-hue-dhuan-naak-me-chala-jaye-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/hukka-hookah-ya-sheesha-peene-se-roze-par-asar",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nabaligh-agar-roza-rakh-kar-tor-de-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/cigarette-ka-dhuan-roze-dar-ke-naak-nose-me-chla-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-me-inhaler-ka-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-me-muh-se-khoon-nikalne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-me-dialysis-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mard-ka-hotel-me-itikaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ke-doran-haiz-aane-ke-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-shave-banana-kasia",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nafil-roze-ki-raat-se-niyyat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/beroon-e-mulk-roza-rakhte-howe-apne-mulk-aaye-to-eid-kis-aitbaar-se-kare",
-  "https://www.fatwaqa.com/ur/fatawa/roza/haiz-se-farigh-ho-kar-ghusal-se-pehle-roza-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-biwi-shohar-ke-kehne-par-qaza-roza-tor-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-baligh-hone-ke-baad-pichle-saalon-ka-fitra-dena-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-me-musht-zani-ki-aur-inzal-hogaya",
-  "https://www.fatwaqa.com/ur/fatawa/roza/din-12-baje-safar-karna-ho-tu-kya-us-din-ka-roza-chor-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-mard-par-tamam-afrad-ka-fitra-dena-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/aurat-shohar-ki-ijazat-ke-bagair-nafli-roza-rakh-sakti-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-niyat-me-shak-ho-tu-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ajnabi-aurat-ki-sharmgah-ko-chune-se-inzal-ho-jaye-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/itikaf-ki-mannat-mani-magar-ab-taqat-nahi-rahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-ramzan-me-biwi-ke-sath-humbistari-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/roza/bache-ko-ramzan-ka-roza-rakhwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kaffare-ke-rozon-me-60-dino-ka-atibar-hai-ya-chand-ke-2-mahino-ka",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-main-hont-lip-se-utrne-wali-khaal-nigal-lainay-se-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-10-baje-se-pehle-medicine-khane-se-roza-nahi-tutta",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mariz-roze-ka-fidya-dene-ke-bad-tandrust-ho-kar-inteqal-kar-jaye-to",
-  "https://www.fatwaqa.com/ur/fatawa/roza/galti-se-time-hone-se-pehle-hi-roza-iftar-kar-liya",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nabeena-ko-sadqa-e-fitr-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-me-zere-naaf-saaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ihtilam-ke-bad-roza-tor-diya-tu-kya-kaffara-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-bahu-ko-sadqa-de-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-me-injection-lagwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mutakif-ka-wazu-khane-istinja-khane-finaye-masjid-me-jana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-me-dakar-ke-sath-aane-wale-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/bimar-ki-taraf-se-roze-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/rozedaar-ki-dua-qabool-hone-ka-konsa-waqt-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/itikaf-ki-halat-me-janaza-parhne-ke-liye-jane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/dhage-ka-ruwan-halaq-se-utar-jaye-to-rozay-ka-kya-hukum-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/qaza-roze-musalsal-rakhna-zaroori-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/apne-bhai-ko-apna-sadqa-e-fitr-dena",
-  "https://www.fatwaqa.com/ur/fatawa/roza/rozadar-aurat-ka-bache-ko-doodh-pilana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nafil-itikaf-ka-waqt-konsa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nabalig-malik-nisab-ho-to-sadqa-fitr-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-nafli-roza-torne-per-qaza-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/bewa-par-apne-naa-baligh-bacho-ka-sadqa-e-fitar-lazim-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nafli-roza-tor-diya-to-kya-kaffara-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nafli-roza-baghair-sehri-kiye-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-ki-mannat-mani-aur-bimar-hogaye",
-  "https://www.fatwaqa.com/ur/fatawa/roza/aurat-ka-kaffare-ke-roze-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ramzan-mein-haiz-ka-masla",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-aurat-masjid-e-bait-mein-nafli-itikaf-kar-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/haiz-mein-chhoote-hue-rozon-ki-qaza",
-  "https://www.fatwaqa.com/ur/fatawa/roza/qaza-roze-kese-rakhen",
-  "https://www.fatwaqa.com/ur/fatawa/roza/fitra-kis-par-lazim-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/shawwal-ke-6-roze-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/mayyat-ke-rozon-ka-fidya",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sehri-ka-waqt-khatam-honay-kay-bad-ghalati-say-khana-kha-liya-to-rozay-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/auraton-ke-roze-ka-ehem-masla",
-  "https://www.fatwaqa.com/ur/fatawa/roza/jo-uzar-ki-wajah-se-roza-na-rakh-sake-kya-wo-bhi-sadqa-e-fitar-dega",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-behosh-hone-se-roza-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/pandrah-shaban-ka-roza-aur-ibadat",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-surma-tail-aur-mehndi-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/rozi-kamane-ki-waja-se-ramzan-ka-roza-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-wuzu-aur-ghusl-ke-doran-naak-mein-pani-chadhane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-o-eid-chand-ke-hisab-se-ya-calendar-ke-hisab-se",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-ramazan-ki-mubarakbad-dene-par-jannat-wajib-ho-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/azan-kay-waqt-sehri-khana",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-iftar-karne-ki-dua-kab-parhni-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/roza/rozon-ka-fidia-dene-mein-kis-saal-ki-qeemat-ka-aitbaar-1841",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-ek-do-qatre-aansu-muh-mein-chale-gaye-tu-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/eid-chand-ke-hisaab-se",
-  "https://www.fatwaqa.com/ur/fatawa/roza/aurat-ka-halat-e-itikaf-mein-garmi-ki-wajah-se-ghusl-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-senitizer-gate-se-guzarnay-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-roze-ki-halat-mein-surma-lagana-makrooh-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sadqa-fitr-ki-adaigi-mein-dene-wale-ki-jagah-ka-itibar-hai-ya-wakeel-ki-jagah-ka",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-mard-hazrat-gharon-mein-itikaf-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-hamla-aurat-ko-roza-maaf-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-torne-ka-kaffara-aur-uski-sharait-6539",
-  "https://www.fatwaqa.com/ur/fatawa/roza/azan-ke-doran-sehri-karne-se-mutaliq-ek-hadees-6628",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nafli-rozay-ki-niyyat-kab-tak",
-  "https://www.fatwaqa.com/ur/fatawa/roza/nafli-roze-ki-niyat-kab-tak-kar-sakte-hain-6112",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-nafli-itikaf-tootne-paa-qaza-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/shawwal-ke-6-rozay-ikhatay-rakha-jaye-ya-alag-alag",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sehri-ka-waqt-khatam-hone-ke-baad-ghalati-say-khana-kha-liya-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/bachon-ko-roza-rakh-wane-ki-umar",
-  "https://www.fatwaqa.com/ur/fatawa/roza/fidya-denay-ki-ijazat",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-pani-halaq-me-utar-gaya-1089",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-khatti-dakar-aane-se-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-mein-ulti-aane-ke-baad-khana-peena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roze-ki-halat-mein-thook-nigalna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-tootne-ki-2-soorton-mein-hukum-mein-farq-ki-wajah",
-  "https://www.fatwaqa.com/ur/fatawa/roza/qaza-kay-bajaye-fidya",
-  "https://www.fatwaqa.com/ur/fatawa/roza/halat-e-roza-mein-jhaag-wali-miswak-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/halat-e-roza-mein-toothpaste-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sugar-ke-marz-ki-wajah-se-roza-chorna-aur-kaffara-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ramazan-mein-shaitan-ka-qaid-hona-5236",
-  "https://www.fatwaqa.com/ur/fatawa/roza/safar-mein-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/shawwal-kay-rozay-kaisay-rakhen",
-  "https://www.fatwaqa.com/ur/fatawa/roza/lagatar-shawwal-kay-rozay-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/roza/jaye-namaz-mein-itikaf-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-injection-lagwanay-se-roza-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/sehri-aur-roza",
-  "https://www.fatwaqa.com/ur/fatawa/roza/m-468-safar-mein-roze-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/roza/kya-imtihan-ki-wajah-se-students-ka-ramzan-ke-roze-qaza-karna-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/roza/roza-torne-par-kaffara-lazim-5022",
-  "https://www.fatwaqa.com/ur/fatawa/roza/30-rozon-ka-fidya-ek-sath-de-sakte-hain-6323",
-  "https://www.fatwaqa.com/ur/fatawa/roza/qaza-e-ramzan-ke-roze-0287",
-  "https://www.fatwaqa.com/ur/fatawa/roza/ramadan-kay-rozay-chhoot-jayen",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/darakht-phal-bechna-ushr",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-wakeel-banana",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/gyarah-tola-sone-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/syeda-ki-ghair-syed-aulad-ko-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sahib-nisab-ka-zakat-se-ilaj",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/selab-zadgan-ki-madad-ke-liye-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/na-baligh-zakat-ka-heela",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qiston-wale-karobar-ki-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ke-wakeel-se-zakat-ki-raqam-gum-hona",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/plot-kharidne-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kiraye-ke-saman-ki-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/dukan-kiraya-lena-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-zyada-ada-ho-jaye-to-agle-saal-shumar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-bhejne-ke-charges-zakat-ki-raqam-se-katna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/maan-beti-ko-sona-gift-kare-to-zakat-kon-dega",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ushar-nisf-ushar-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-aur-ushar-se-madarse-ki-tameer",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/walid-ka-ghar-walon-ki-zakat-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/malik-e-nisab-ka-maal-darmiyan-e-saal-khatam-hona",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/jahez-mein-mile-zewar-ki-zakat-kis-par-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/beti-ki-shadi-ke-liye-rakhe-zewar-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/naye-makan-ki-payment-zimme-ho-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/shohar-ko-biwi-ke-ilaj-ke-liye-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kiraye-par-dene-ke-liye-kharidi-gai-shop-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/advance-zakat-ki-mad-mien-di-hui-raqam-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/committee-ki-qisten-nisab-se-minus-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-beti-ka-jahez-rakhne-wala-shakhs-ghani-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/hashmi-ko-zakat-na-dene-ki-waja",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sabziyon-aur-phalon-ka-ushar",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ke-paison-se-jahez-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zarurat-ki-fasal-par-ushr-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/thori-fasal-par-bhi-ushr-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/dewar-ki-biwi-syeda-ho-to-kya-dewar-ko-zakat-di-ja-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/tax-ko-zakat-mein-shumar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-raqam-alag-kardena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/dukan-ke-purane-suit-zakat-mein-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/2-bar-ugne-wali-fasl-par-ushar",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-de-kar-bechi-hui-cheez-ki-qeemat-lena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qeemti-pathar-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-se-madrase-ki-zameen-kharidna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/water-supply-par-zakat-ki-raqam-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sadat-ko-zakat-na-dene-ki-waja-aur-unka-aapas-mein-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qarz-maaf-karne-aur-ghar-ke-bartano-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/7-tole-se-kam-sone-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/tankhwa-mein-zakat-mila-kar-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bhatiji-ko-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/syed-shohar-ki-ghair-syeda-biwi-ko-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kai-afrad-ka-ek-admi-ko-zakat-ka-wakeel-banana",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/pakistani-gold-ki-zakat-uk-mein-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sharai-faqeer-ke-rent-zakat-ki-niyat-se-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-mein-medicine-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/machine-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kiraye-par-chalne-wali-gari-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/aalim-ko-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/tijarati-plot-gift-karne-ki-niyat-ho-tu-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-adaigi-mien-kis-jagah-ki-qeemat-ka-aitibar-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/wirasat-mein-milne-wale-plot-par-zakat-aur-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sharai-faqeer-ne-zakat-ki-cheez-bech-di-tu-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/soodi-qarz-mein-doobe-hue-shakhs-ko-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kiraye-ke-advance-mein-zakat-kon-dega",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/heere-jawahrat-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-zakat-dete-waqt-batana-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kaam-aane-ki-niyat-se-rakhe-hue-saman-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/dadi-ko-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/school-ki-tameer-ke-liye-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/phophi-ko-zakat-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/beauty-parlor-mein-makeup-ke-saman-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sona-chandi-paise-nisab-se-kam-hon-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qarz-wapas-na-milne-par-zakat-lena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zameen-ki-waja-se-zakat-aur-fitrane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ke-paison-se-umrah-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-se-nalka-khudwana",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-raqam-madrase-ke-akhrajat-mein-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ramzan-mein-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-mad-mein-ghareeb-larki-ko-washing-machine-ya-koi-cheez-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qarz-dene-ke-baad-aglay-din-is-mein-zakat-ki-niyat-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/mulazim-ko-zakat-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ushar-akhrajat-nikalne-ke-baad-den-ya-pehle",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/beti-ki-shadi-ke-paison-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/naik-kaam-ke-liye-jama-ki-gai-raqam-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/na-baligh-sahib-nisab-par-baligh-hone-ke-baad-zakat-kab-farz-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/mental-patient-ko-zakat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-4-mah-mein-taiyar-hone-wali-fasal-per-usher-lazim-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kabhi-kabhar-istemal-hone-wali-cheez-hajat-e-asliya-mein-aayegi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/wirasat-mein-milne-wale-maal-e-tijarat-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ada-na-karne-ki-wajah-se-barish-rok-di-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/shohar-maqrooz-ho-to-biwi-par-zakat-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/mustahiq-e-zakat-ko-zakat-ki-niyat-se-mobile-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/mulazim-ko-zakat-dena-taakay-woh-isi-ke-paas-kaam-karta-rahay-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/biwi-ka-shohar-ki-ijazat-ke-baghair-uski-zakat-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/awan-ke-paas-shajra-nasab-na-ho-to-wo-zakat-le-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-raqam-se-school-mein-pani-ka-cooler-ya-poday-lagwana",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/nasha-karne-wale-ki-maa-ko-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/shohar-ka-zakat-le-kar-apni-biwi-ki-zakat-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-se-bachne-ke-liye-apna-maal-kisi-aur-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/jootay-bechne-wale-ka-zakat-ki-mad-mein-jootay-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/behan-ka-kiraye-ka-ghar-hai-aur-shohar-rickshaw-chalate-hain-to-un-ko-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ushr-ki-raqam-se-qabristan-ke-liye-jagah-kharidne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/apne-mansoob-ke-chacha-ko-ushar-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/thekay-par-li-hui-zameen-ka-ushar-thaika-nikal-kar-diya-jayega-ya-pehle",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/nisab-par-saal-guzra-par-tijarat-wale-plot-par-saal-nahi-guzra-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bhai-ko-ilaj-ke-liye-advance-mein-ushr-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/driver-ya-kaam-wali-ko-zakat-dena-jabke-unki-zarai-zameen-bhi-ho",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/committee-nikal-aai-lekin-kai-qisten-ada-karna-baqi-hain-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/jin-ko-zakat-dena-jaiz-nahi-unhen-heela-kar-ke-zakat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-raqam-janazah-gah-ki-tameer-mein-kharch-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/la-ilmi-mein-awan-khandan-ko-zakat-dedi-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/mehr-muajjal-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/fasal-katne-se-pehle-he-bech-di-to-usher-khareedar-par-hoga-ya-bechne-wale-par",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/jis-par-zakat-lazim-na-ho-tu-kya-wo-zakat-le-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/dairy-farm-mein-pale-hue-janvaron-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/beti-ko-jahez-mein-dene-ki-niyat-se-kharide-gaye-makan-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-raqam-se-walid-ka-qarz-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/advance-zakat-lene-wala-ghani-ho-gaya-tu-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/nisab-par-saal-pura-hone-se-pehle-4-tola-sona-kharida-to-iski-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/apni-zakat-ki-raqam-se-hajj-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/maal-e-tijarat-hai-lekin-zakat-dene-ke-liye-paise-nahi-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-niyat-se-sharai-faqeer-ko-rehne-ke-liye-makan-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ramzan-mein-zakat-nikalne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kiraye-par-diya-hua-makan-dedh-tola-sona-aur-kuch-cash-raqam-ho-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/2-tola-sona-aur-mahana-amdani-hazar-rupe-ho-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/nisab-se-ziada-qarz-ho-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/talaba-ke-liye-di-gai-zakat-muhtamim-ka-khud-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/8-mahine-ki-bachi-ki-milkiyat-mein-sona-ho-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bank-ke-zakat-katne-se-zakat-ada-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ek-tola-sona-aur-sirf-ek-rupya-ho-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/1-feesad-amdani-kar-e-khair-mein-dene-ki-niyat-ho-to-is-raqam-ko-zakat-mein-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/apahij-aurat-ko-zakat-dena-jabke-un-ke-paas-kuch-sona-bhi-mojood-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/2-auraton-ko-zakat-mein-saman-aur-raqam-di-jin-mein-se-ek-syeda-hai-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sona-chandi-aur-prize-bond-ke-sath-qarz-bhi-ho-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/maal-e-tijarat-ke-badle-gharelu-istemal-ki-cheez-kharidne-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-beti-apni-maa-ko-zakat-de-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/jin-ki-kafalat-hamare-zimme-hai-unhen-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/behnoi-ko-zakat-de-sakte-hain-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/baqi-reh-jane-wali-installments-nisab-se-minus-hongi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/2-tola-sona-ho-aur-1-lakh-kisi-ko-qarz-diya-ho-tu-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/mustahiq-samajh-kar-zakat-di-baad-mein-pata-chala-ke-wo-syed-hai-to",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-zakat-ki-raqam-se-shadi-karwa-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ke-wakeel-ka-apni-biwi-ko-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/nabaligh-ya-pagal-ko-zakat-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sona-nisab-se-kam-ho-lekin-sath-tv-aur-extra-bartan-hon-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kiraye-par-chalne-wali-gariyon-par-zakat-lazim-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zameen-60-lakh-ki-khareed-kar-70-lakh-mein-bechi-to-zakat-kitne-lakh-par-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sharai-faqeer-ko-nisab-ki-had-tak-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/syed-ko-heela-karke-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/7-lakh-raqam-qarz-di-hui-hai-kya-is-par-zakat-lazim-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-raqam-jama-karke-us-se-groceries-kharid-kar-taqseem-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/faqeer-ko-paise-dene-ke-baad-zakat-ki-niyat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/maqrooz-ko-qarz-maaf-karne-se-zakat-ada-ho-jaye-gi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bc-committee-ramzan-ke-baad-nikalni-hai-to-us-par-zakat-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-karobar-mein-invest-kiye-hue-paise-par-zakat-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bechne-ki-niyat-se-plot-liya-phir-niyat-badal-gai-to-kya-maal-e-tijarat-rahega",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ushar-ki-raqam-masjid-ki-tameer-mein-istemal-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/baligh-talib-ilm-ko-zakat-dena-jis-ke-walidain-maldar-hon",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sahib-e-nisab-ke-3-committee-jama-karwane-ke-baad-bc-nikal-aai-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/shohar-biwi-ko-raqam-ka-malik-banade-tu-is-raqam-ki-zakat-kis-par-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/maal-kisi-aur-jagah-aur-banda-kisi-aur-jagah-ho-tu-zakat-kis-hisab-se-deni-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/heavy-deposit-ki-raqam-nisab-se-minus-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/shaadi-par-milne-wale-zewrat-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/machli-zakat-mein-di-tu-zakat-kis-hisab-se-ada-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/partnership-ke-karobar-mein-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ghar-kharidne-ke-liye-rakhi-hui-raqam-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/23-gram-sona-aur-1-lakh-ka-maal-e-tijarat-ho-tu-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bhanje-ko-zakat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/gaye-ke-paye-zakat-mein-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/phoolon-par-ushr-lazim-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/shaadi-par-bechne-ke-liye-kharide-gaye-plot-bhi-maal-e-tijarat-hain",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/smart-led-ya-tv-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/purane-dor-ke-yadgari-sikkon-par-zakat-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/na-baligh-ke-maal-par-zakat-lazim-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/2010-mein-sone-par-zakat-lazim-hui-lekin-ada-na-ki-tu-ab-kis-rate-se-ada-kare",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/29-onton-par-kitni-zakat-farz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-sahib-e-nisab-biwi-ke-shohar-ko-zakat-de-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ke-wakeel-ka-zakat-ki-raqam-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-ghareeb-kafir-ko-zakat-de-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-sirf-bechne-ke-liye-lagai-jane-wali-fasal-par-ushr-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-raqam-se-mulazmeen-ko-hajj-karwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bete-ka-apni-maa-ki-taraf-se-zakat-ada-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-dene-ke-liye-poori-raqam-jama-na-hui-tu-baqya-zakat-mein-takheer-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sari-fasal-bech-kar-raqam-masjid-mein-de-di-to-usher-adaa-hwa-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-se-bachne-ke-liye-heela-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/fasal-tayyar-hone-ke-baad-bech-di-to-kya-ushr-lazim-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-maqrooz-par-bhi-ushr-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/jis-shakhs-ki-biwi-sayyidah-ho-usay-zakat-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/10-tola-zewar-jis-mein-5-tola-walida-ka-aur-5-tola-beti-ka-ho-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/advance-zakat-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sharabi-ko-zakat-dene-se-zakat-ada-ho-jayegi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sone-par-guzishta-salon-ki-zakat-nikalne-ka-tarika-jabke-sona-baqi-na-ho",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-nani-apne-nawase-ko-zakat-de-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bewa-agar-nisab-ki-malika-ho-to-is-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kapas-ki-fasal-mein-lakdiyon-par-ushar-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/fasal-ke-akhrajat-paidawar-se-zaid-hogaye-to-usher-wajib-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/15-hazar-rupay-aur-2-masha-sona-ho-to-zakat-aur-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ke-paiso-se-umrah-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/pocket-money-jama-hokar-1-lakh-tak-pahunch-jaye-to-is-par-zakat-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ushr-nikalne-ke-liye-qarz-minus-kiya-jayega-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/government-ki-taraf-se-tohfe-mein-mile-plot-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/nisab-ke-kam-sona-aur-kuch-raqam-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sona-aur-emergency-ke-liye-rakhi-hui-naqad-raqam-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ghar-ke-kiraye-ke-liye-advance-di-gai-raqam-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/nisab-se-kam-sona-bech-kar-chandi-li-tu-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/shadi-ke-liye-jo-raqam-jama-ki-jaye-us-par-zakat-aur-qurbani-ka-hukam",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-syed-par-bhi-zakat-farz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/malik-e-nisab-kafir-musalman-hua-tu-zakat-ke-liye-saal-ka-itibar-kab-se-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-adaigi-mein-raqam-ke-bajaye-anaaj-khareed-kar-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ghareeb-bachi-ki-shadi-ke-liye-apni-zakat-ki-raqam-apne-pas-jama-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ek-tola-se-kuch-ziada-sone-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/salary-logon-par-udhar-ho-tu-zakat-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-behnon-aur-betiyon-ko-usher-de-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/nisab-par-saal-mukammal-hone-se-pehle-maqrooz-ho-gaye-to-zakat-kab-lazmi-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/phanse-hue-paise-ki-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ghani-hone-ke-liye-nisab-par-saal-guzarna-shart-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/saal-ke-darmiyan-hasil-hone-wali-raqam-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bank-me-jama-raqam-par-kitni-bar-zakat-lazim-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/na-baligh-ke-account-mein-mojood-maal-ki-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kisi-ki-zakat-ki-raqam-apne-istemal-mein-la-kar-baad-mein-apne-pas-se-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/girvi-rake-hue-sone-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/mard-ke-istemal-ki-ghari-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/dukan-par-bechne-ke-liye-rakhe-hue-saman-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-se-bachne-ke-liye-jewellery-dosre-ki-milk-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ke-paison-se-pul-aur-pani-ka-kuan-banawana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-zakat-ki-raqam-madrase-ke-akhrajat-aur-tameerat-mein-istemal-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/mustahiq-zakat-kaise-pehchana-jaye-neez-baad-mein-ghair-e-mustahiq-nikla-to-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qarz-maaf-kar-diya-to-kya-iski-zakat-ada-karni-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/jahez-ke-saman-par-zakat-ka-masla",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/razai-maa-baap-ko-zakat-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zewrat-par-guzishta-salon-ki-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sone-chandi-ke-istemali-zewar-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/beauty-parlor-mein-mojood-make-up-par-zakat-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/artificial-zewrat-ki-zakat-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-yateem-bache-ko-zakat-de-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sirf-7-tola-gold-ho-to-zakat-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-sauteli-maa-ko-zakat-de-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qarz-mein-di-hui-raqam-par-zakat-kaun-ada-kare-ga",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/agar-sirf-5-tola-sona-tijarat-ki-niyat-se-kharida-ho-tu-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/jis-ke-pas-hajat-se-zaid-sirf-ek-tola-sona-ho-us-ko-zakat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kitne-paison-par-zakat-farz-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ghusal-farz-hone-ki-halat-mein-zakat-ada-kane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/mal-e-tijarat-ki-zakat-mein-konsi-qeemat-ka-aitebar-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/parindon-ki-breeding-ke-kaam-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bare-ki-bhainson-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-ek-syed-dosre-syed-ko-zakat-de-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-raqam-heela-kiye-baghair-masjid-ya-madrasa-ki-tameer-mein-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/khout-milay-sone-ki-zakat-ada-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bhai-ya-bhabhi-ko-zakat-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qureshi-ko-zakat-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/wirasat-mein-milne-wali-zameen-par-zakat-ka-masla",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/jis-sone-par-zakat-farz-thi-usey-bech-diya-tu-zakat-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/chandi-ki-chori-par-sone-ka-pani-charha-ho-to-zakat-kis-tarah-ada-ki-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/apni-zina-ki-aulad-ko-zakat-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/aulaad-ka-apni-zakat-apne-waldain-ko-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/matti-ki-nami-se-ugnay-wali-fasal-par-usher-ka-masla",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/jis-shaks-ke-pas-kasht-ki-jane-wali-zameen-ho-aise-shaks-ko-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sahib-e-nisab-bewa-aurat-ke-bachon-ko-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ghair-sayeda-ka-apne-syed-bachon-ko-zakat-se-khilana",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/masjid-mein-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/masjid-aur-madarse-ke-chande-ka-sharia-huum-kia-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/apni-saas-ya-susar-ko-zakat-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/tees-mann-gandum-par-kitna-usher-dena-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ke-paise-se-iftari-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sahib-e-nisab-shaks-ke-bete-ko-zakat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ko-2-ya-is-se-zayed-hisson-mein-taqseem-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ushar-aur-khriaj-kay-ahkam-ushar-ki-sharai-miqdar-kia-hai-ushar-ka-nisab",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/apne-damad-ko-zakat-dena-sahi-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/nawasi-ki-aulaad-ko-zakat-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sadqa-o-khairat-nisab-ke-barabar-jama-ho-jaye-to-kya-hukum-hai-zakat-farz-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/soutelay-walid-ko-zakat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sahib-e-nisab-shakhs-ki-aulad-ko-zakat-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sahib-e-nisab-ki-biwi-ko-zakat-dena-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/chote-bachon-ko-zakat-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/syed-ki-ghair-hashmi-biwi-ko-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/maa-syeda-aur-baap-ghair-syed-ho-to-aulad-ko-zakat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/girvi-rakhe-maal-ki-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-raqam-parcel-kar-ke-dene-me-parcel-ka-kharcha-kon-ada-kare",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/gold-ki-zakat-me-khot-shamil-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ghar-me-ugai-jane-wali-sabziyan-vegetable-me-ushar-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ke-maal-me-kis-jagah-ke-rate-ka-aitibaar-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bachon-ke-naam-rakhe-sone-gold-par-zakat-ka-masla",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qiston-par-liye-hue-flat-par-zakat-ada-karne-ka-tareeqa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/jawahirat-par-zakat-lazim-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-zakat-mein-milne-wali-raqam-par-bhi-zakat-farz-hosakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/gandum-wheat-ki-katai-aur-thresher-ke-akhrajat-ushar-se-pehle-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kapron-ke-zariye-zakat-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/gharelo-kapron-aur-jahez-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kiraye-par-diye-hue-truck-ki-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-kabootar-rakhne-par-zakat-farz-hogi-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/maal-e-zakat-per-saal-guzarne-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sona-aur-chandi-dono-nisab-barabar-na-ho-to-zakat-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/gold-ki-zakat-nikalne-me-kis-rate-ka-aitbaar-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sirf-sath-tola-sona-hoto-zakat-lazim-hone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/wajib-hone-wali-zakat-se-ziyada-zakat-ada-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bemar-mustahiq-e-zakat-shakhs-ke-qarz-mangne-per-zakat-ki-niyyat-se-raqam-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/apni-bahu-ko-zakat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/committee-mein-jama-karwai-jane-wali-raqam-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/nabina-agar-malik-e-nisab-ho-to-is-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/dukan-ke-liye-diye-gaye-advance-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-raqam-mustahiq-ko-udhar-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/malik-e-nisab-bewah-ko-zakat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/abbasi-khandan-ko-zakat-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/currency-aur-sone-ki-zakat-kaise-nikalen",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-tohfa-keh-kar-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-me-rashan-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-7-tola-sone-par-zakat-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-jinnat-par-bhi-zakat-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-na-baligh-par-ushar-lazim-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sharai-faqeer-zakat-syed-ko-de-to-kya-syed-is-ko-istemal-kar-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qarz-lekar-zakat-ada-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/shopping-bag-mithai-ke-dibbe-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sahib-nisab-ki-baligh-aulad-ko-zakat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/makan-banane-ke-liye-jama-shuda-raqam-par-zakat-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kis-janwar-par-zakat-hai-aur-kitni-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/parchun-ki-dukan-wala-zakat-kaise-nikale",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/fasal-pakne-se-pahle-sale-kardi-to-ushar-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/biwi-ke-zewar-ki-zakat-kis-par-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/abbasi-ko-zakat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/beti-ki-shadi-ke-liye-kharide-huye-plot-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/rishwat-me-di-howi-raqam-ki-zakat-rishwat-dene-wale-shakhs-par-hogi-ya-rishwat-lene-wale",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/saal-ke-akhri-din-nisab-ke-barabar-raqam-naa-ho-to-zakat-lazim-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/sare-sat-tola-se-kam-gold-ke-sath-kuch-cash-bhi-mojood-ho-to-zakat-ka-kya-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/shohar-ka-biwi-ki-zakat-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kisi-ki-zakat-rakh-kar-apni-raqam-us-ki-zakat-me-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/masjid-me-zakat-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ushar-konsi-zameen-par-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/thekay-par-li-gai-zameen-ka-ushar-kis-par-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qiston-me-zakat-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-niyat-se-qarz-maaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/waldain-ko-zakat-sadqat-khairat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/account-mein-zakat-ki-raqam-bhejne-se-zakat-ada-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-aur-nafli-chande-ko-mix-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/shohar-ghareeb-aur-biwi-ameer-ho-tu-shohar-ko-zakat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qarz-ki-zakat-kis-per-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ghar-zameen-plot-aur-property-par-zakat-kay-masail",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-khala-ko-zakat-de-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/bhatije-ko-apni-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/copper-aur-iron-waghera-ki-mardana-ring-zakat-me-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/apni-aulad-ko-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ujrat-par-kasht-ki-ho-to-bhi-ushar-wajib-hai-isse-kya-murad-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/advance-mein-di-gai-zakat-ki-raqam-ko-total-maal-mein-shamil-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kya-zakat-ki-raqam-zakat-keh-kar-ada-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-nikalne-ka-asan-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/jis-shakhs-ka-maal-company-lekar-bhag-jaye-to-kya-wo-shakhs-zakat-le-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/barseen-jantar-ghas-ka-ushar",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/rehaishi-flat-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ushar-katai-se-pehle-ya-baad-mein",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qarzdar-ko-zakat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/hajj-ke-paison-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ka-ehem-masla",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-chori-hojaye-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ushar-ke-baad-fasal-bechne-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/fasal-wali-zameen-ke-shehad-par-ushar",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/poultry-farm-ki-murgiyon-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/gift-mein-mile-hue-plot-ki-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/istimali-zevar-par-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-se-faqeer-ka-qarz-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ghar-mein-ugne-wali-sabzi-par-ushr",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ushr-nikaalne-ka-tareeqa",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-farz-hone-ke-liye-kis-waqt-ka-aitbaar-hoga-8739",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/maqrooz-par-zakat-ka-hukum-14461",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qiston-par-kharide-gaye-plot-par-zakat-6468",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/saal-pura-hone-se-pehle-he-advance-zakat-dena-5076",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-nikalte-howe-kis-saal-ki-qeemat-ka-atibaar-1783",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ushr-ke-mutaliq-masail-67090",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/solar-par-chalne-wali-tube-well-par-ushar-5364",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-kab-wajib-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/advance-zakat-nikalna-5076",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kaam-wali-khawateen-ko-zakat-dena-1560",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ko-mulazim-ki-tankha-mein-dena-1482",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zoja-ki-zakat-shohar-de-to-kya-hukum-hai-1446",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/tijarat-ki-niyat-se-kharida-gaya-makan-par-zakat-8149",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/dam-wali-raqam-par-zakat-wajib-hogi-6353-b",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/qarz-ki-raqam-par-zakat-6356",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/kitabon-ki-maliyat-nisab",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/maqrooz-faqeer-ko-zakat-dena-6291-a",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/makrooz-shakhs-ka-zakat-lena-12157",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/maal-e-tijarat-par-zakat-wajid-hoti-hai-5180",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-madrasa-mein-sarf-krna-0118",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ki-raqam-se-tax-4840",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-ka-saal-kab-mukamal-hoga-4882",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/zakat-de-sakte-hain-1892",
-  "https://www.fatwaqa.com/ur/fatawa/zakat-aur-ushr/ushr-kis-par-wajib-hoga-11965",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-namaz-qasr",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/nabaligh-ki-niyat",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/mard-o-aurat-ka-hajj",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-sar-dhanp-kar-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/lucky-draw-umrah",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/istemal-shuda-ihram-mein-umra",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-baal-na-hon-halq-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ke-baad-qaza-namazen",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jeddah-jana-meeqat-se-ahram-bandhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ehram-mein-zakham-par-patti",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-niyat-se-pehle-body-spray-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/shohar-ka-biwi-ko-farz-hajj-se-rokna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/nafli-tawaf-adhura-chor-kar-watan-lotna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-kis-par-farz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ghar-ke-liye-rakhi-raqam-plot-hajj-farz",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/visit-ke-liye-saudia-jane-walo-k-liye-ihram-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-haiz-aana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haji-ki-dua-qabool-hona",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jahaaz-mein-ihram-ki-niyat-karein-to-nafil-kaise-parhein",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/28-din-ke-umrah-par-qasar-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kaaba-ko-pehli-nazar-dekhne-ke-waqt-kaunsi-dua-mangni-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/afaqi-ka-bagher-ihram-haram-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-arafat-se-wapsi-par-ihram",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-mein-nariyal-ka-tail-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-mein-aurat-ka-chehra-chupana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-mein-faut-hone-wale-ka-sar-aur-chehra-chupana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-mein-abru-ya-palkon-ke-baal-tootne-par-kaffara",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jeddah-se-baghair-ihram-makkah-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haram-mein-kaam-karne-walon-ka-paise-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hukoomati-muawin-ke-tor-par-hajj-par-jane-wala-ka-hajj",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-umrah-karna-sunnat-e-muakkada-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ka-ihram-mein-khushbudar-naya-libas-pehanna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/sawari-par-tawaf-e-wida",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-e-ziyarah-ke-3-phere-ayyam-e-nahar-ke-baad-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-ke-baad-2-rakat-ki-adaigi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/makan-ki-waja-se-hajj-farz-hona",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/50-tawaf-karne-ki-fazilat-hadees-ki-sharah",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/baghair-wazu-tawaf-ke-baad-watan-wapas-aajana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ka-ihram-mein-naqab-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/baghair-ihram-miqat-se-guzarne-par-dam",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haji-ka-yome-arfa-ka-roza-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-tamattu-mein-hajj-se-pehle-umre-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-tamattu-mein-umrah-ke-baad-biwi-se-talluq",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-mein-sar-ya-chehra-chhupana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/muhrim-ka-dusre-muhrim-ka-halq-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/qarin-ka-umrah-ke-baad-halq-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/bete-ke-paison-se-hajj",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haiz-mein-talbiyah-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ayyam-e-hajj-ki-raatein-kin-dino-ke-tabi-hain",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/pakistan-walon-ki-meeqat",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/bar-bar-umrah-se-farz-hajj-ada-hona",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ke-nawafil-ki-niyat-ka-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haram-ke-bahir-miqat-ke-andar-rehne-wale-ka-tamattu-ya-qiran",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/maa-ka-bhatija-aur-beti-umrah",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-kar-ke-hudood-e-haram-se-bahar-halq-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haji-par-eid-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/baap-se-pehle-hajj-aur-biwi-ke-paison-se-hajj",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/electric-wheelchair-par-tawaf",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/dam-kaunsa-janwar-kahan-zibah-karen",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-e-tamattu-ka-ihram-8-zul-hijjah-se",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/nafli-tawaf-mein-mask-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/na-baligh-bache-ko-hajj-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haiz-mein-qiran-ya-tamattu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ke-baghair-ihram-kholna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-ke-nawafil-mein-takheer",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ki-qurbani-apne-mulk-mein-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-qiran-mein-tawaf-qudoom",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-mein-baghair-khushbu-wale-sabun-ka-istemal",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-mein-mard-o-aurat-kis-tarah-ki-chappal-pehne",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/qarz-le-kar-hajj-karne-se-hajj-ka-farz-ada-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/behnoi-ke-sath-umrah-par-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halat-e-ihram-mien-satar-khulne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-e-badal-qurbani-ka-kharcha-kis-par",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-e-badal-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/sai-ke-saat-phere-lagatar-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-ke-pheron-mein-shak-hona",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/fajr-se-pehle-muzdalifah-se-nikal-kar-rami-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-ke-nawafil-baith-kar-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-mein-chehre-par-kapra-lagna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-par-ihram-bandhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ghusal-ke-kitni-der-baad-ihram-pehne",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-mein-bache-ko-tawaf-ke-chakkar-lagwana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-e-qiran-aur-hajj-e-ifrad-wala-tawaf-e-qudoom-kab-kare",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haiza-aurat-umrah-ka-ihram-kahan-se-bandhe",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/mazoor-ka-ihram-mein-elastic-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-mein-tawaf-e-rukhsat-na-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-mein-chashma-aur-dua-ke-baad-muh-par-hath-pherna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-o-umrah-ke-liye-jate-waqt-tijarti-saman-sath-le-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-bandhte-waqt-umrah-ki-niyat-nahi-ki-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/nafli-tawaf-ke-liye-miqat-par-jana-aur-ihram-bandhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-umrah-karne-ke-liye-madina-mein-40-namazain-parhna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ki-chadar-bandh-kar-fold-ki-jati-hai-is-mein-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/mareez-ko-tawaf-o-sae-karwate-hue-khud-ki-tawaf-o-sae-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/sai-ke-liye-ihram",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/rush-ki-wajah-se-hajr-e-aswad-nazar-na-aye-tu-istilam-kaise-karen",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hudaibiya-ziyarat-se-wapsi-par-ihram-bandhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/rami-se-pehle-hajj-tamattu-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-nabaligh-bache-par-ihram-ka-dam-lazim-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/mina-pohanch-kar-hajj-ke-ihram-ki-niyat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-mein-parda-chehre-par-lagne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-mein-bhool-kar-8-chakkar-lagane-se-umrah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-sajde-mein-chehre-par-kapda-lagna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/nafli-tawaf-ke-baad-bhi-namaz-e-tawaf-parhna-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-madina-se-makkah-wapsi-par-ihram-bandhna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umre-ke-tawaf-ke-baad-sai-se-pehle-multazam-ka-bosa-lena",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-karte-hue-istilam-chhut-jana-ya-kaba-ki-taraf-dekhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/neom-city-meeqat-se-bahar-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-ke-waqt-mehram-ka-sath-hona-zaroori-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-mein-kamar-belt-aur-knee-grip-bandhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ko-tawaf-ke-dauran-periods-aa-jayen-to-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-mein-khushboo-wali-chadar-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-bandhne-ke-baad-haiz-aa-jaye-tu-umrah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/madina-se-makka-jane-se-1-din-pehle-haiz-ajaye-to-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/makhsoos-ayyam-mein-hudood-e-haram-mein-dakhil-hona-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-aurat-ko-umre-ke-baad-ghusal-karna-aur-ehram-dhona-zaruri-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-se-pehle-2-chakkar-izteba-nahi-kia-to-kia-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/wasiyat-ke-bina-marhoom-ki-taraf-se-hajj-badal-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ki-niyat-kiye-baghair-so-gaye-aur-miqat-ke-baad-aankh-khuli-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-mard-ka-apni-chadar-ko-safety-pin-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-par-naam-aur-topi-par-muqaddas-kalmat-likhwana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-se-nikalne-ke-liye-biwi-ke-baal-katna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halat-e-ihram-mein-jhagra-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ayyam-umrah-mein-hotel-ke-andar-miya-biwi-ka-hambistari-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ka-makhsoos-ayyam-mein-mataf-ki-upar-wali-manzil-aur-masaa-mein-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kisi-na-mehram-ke-naam-ka-umrah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-mein-bhool-kar-aath-chakkar-laga-liye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halat-e-ihram-mein-thandak-hasil-karne-ke-liye-ya-nafil-ghusl-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-e-badal-mein-hajj-ki-qurbani-kis-par-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/makrooh-waqt-mein-tawaf-karna-aur-tawaf-ke-nafil-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ka-mehram-na-ho-to-bagair-mehram-umrah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ek-umrah-ka-dam-ada-nahi-kiya-aur-dusra-umrah-karliya-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/masjid-jirana-se-wapsi-par-ihram-bandhna-lazim-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-kiraye-par-diye-hue-ghar-ki-wajah-se-hajj-farz-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-ihtilam-ho-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kamar-dard-ki-wajah-se-sai-karne-se-pehle-kuch-dair-laytna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ke-nafil-ada-karne-ke-baad-nakhun-kate-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-aur-sai-karte-waqt-joote-sath-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ki-halat-mein-biwi-ka-hath-pakarne-aur-biwi-ko-chhune-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-niyat-mein-labbaik-ki-jagah-kuch-aur-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/bank-se-qarz-lekar-umrah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-ke-nafil-ada-kiye-bagair-watan-wapas-aa-gaya-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ki-saee-tawaf-e-wida-ke-baad-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ki-halat-mein-khushboo-dar-hajr-e-aswad-ko-bosa-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-mein-satar-khul-jaye-tu-kya-kaffara-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jeddah-mein-rehne-walon-ke-liye-tawaf-e-wida-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/rami-ke-liye-wazu-zaroori-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-e-tamattu-karne-wala-haram-ya-hil-se-bahar-ja-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/saie-karte-waqt-marwa-pahar-ki-unchai-par-na-charhain-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ka-apne-mamu-ke-sath-umrah-ke-liye-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kaaba-se-lapat-kar-bosa-lena-gaal-lagana-aankhon-se-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kisi-ka-istemal-shuda-ihram-pehen-kar-umrah-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haiza-aurat-ka-roza-e-rasool-par-hazri-dena",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kai-tawaf-ke-baad-akhir-mein-sab-ki-namaz-e-tawaf-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halat-e-haiz-mein-hajj-ka-ihram-bandhna-aur-hajj-ke-afaal-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ka-mehram-ke-bagair-auraton-ke-sath-farz-hajj-ke-liye-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halat-e-ihram-mein-sar-par-tel-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haram-e-madina-mein-shikar-karne-aur-ghas-katne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-par-jane-wala-madina-shareef-mein-kitne-din-qayam-kare",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-ke-2-nafil-parhe-bagair-dusra-tawaf-shuru-kar-diya-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hath-ke-bajaye-ghulail-se-rami-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ya-umrah-ki-sai-be-wazu-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ki-qurbani-mina-ke-bajaye-makkah-mein-ki-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/croron-ki-zari-zameen-hai-lekin-hajj-ke-liye-cash-nahi-to-hajj-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-e-ziarat-se-pehle-oral-sex-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/11-zil-hajj-ki-rami-12-zil-hajj-ko-ki-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/zil-hajj-ki-10-se-15-tarikh-tak-haiz-ke-ayam-hon-to-tawaf-e-ziarat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/nafli-tawaf-ke-aksar-phere-chorne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ayyam-e-tashreeq-ki-raatein-mina-mein-guzarna-haji-ke-liye-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/12-tarikh-ki-rami-se-pehle-tawaf-e-wida-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ke-tawaf-mein-idtiba-nahi-kiya-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-rami-jamarat-ke-liye-taharat-wazu-ghusl-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-e-ifrad-wale-ne-qurbani-na-ki-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/9-zil-hajj-ki-subah-ko-ghusl-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/muzdalifah-ke-waqoof-mein-tent-ya-sleeping-bed-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-biwi-ka-hath-pakarne-se-shehwat-aai-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ke-doran-baghair-sharai-uzar-ke-auraton-ki-taraf-se-rami-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/sai-safa-ke-bajaye-marwa-se-shuru-ki-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-e-ziyarat-ke-baad-hajj-ki-sai-mein-takheer-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-gale-mein-chashma-latkane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ke-ihram-ki-niyat-karne-se-pehle-waise-hi-chadar-odhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-esal-e-sawab-ke-liye-nafli-tawaf-kar-sakte-hain-aur-is-mein-1-chakkar-kafi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-niyat-karli-magar-talbiyah-kehna-bhool-gaya-to",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-e-qudoom-ka-hukum-aur-haiz-ki-wajah-se-ye-tawaf-na-kiya-to",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-par-jane-se-pehle-aqiqah-karna-zaroori-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ki-adaigi-ke-doran-wazu-toot-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/qiran-wala-tawaf-e-qudoom-ke-baad-sai-karle-to-tawaf-e-ziyarat-ke-baad-sai-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/nikah-mein-umrah-ko-haq-mehar-muqarrar-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-ghadi-aur-sunglasses-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/bus-driver-masjid-e-ayesha-se-wapas-makkah-aaye-tu-ihram-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/plot-bechne-ki-wajah-se-hajj-farz-ho-gaya-magar-kiya-nahi-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-gale-hath-ya-bazu-mein-taweez-pehenna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jeddah-mein-rehne-wala-shakhs-hajj-e-qiran-ya-hajj-e-tamattu-kar-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/paidal-hajj-par-jana-zyada-sawab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ki-dawat-aur-aqiqah-ek-sath-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-aurat-apne-bhatije-ya-bhanje-ke-sath-umrah-par-ja-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ke-tawaf-ke-2-phere-chorne-ka-kaffara",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-e-qiran-mein-qurbani-ki-taqat-na-thi-aur-arfa-se-pehle-3-roze-bhi-na-rakhe-to",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-aurat-kisi-mard-ki-taraf-se-hajj-e-badal-kar-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-underwear-pehenna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/makkah-mein-rehne-wala-arafat-se-umrah-ka-ihram-bandh-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/arafat-ka-rehaishi-umrah-ka-ihram-kahan-se-bandhe",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kaam-ke-silsile-mein-bagair-ihram-makkah-mein-dakhil-hone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ke-liye-jama-ki-gai-raqam-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/walid-ne-zameen-bech-kar-raqam-bete-ko-de-di-to-hajj-kis-par-farz-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/apne-tawaf-ke-baad-kisi-mazoor-ko-tawaf-ke-4-chakkar-lagwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/doran-e-tawaf-khamosh-rehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/passport-na-ban-raha-ho-to-hajj-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halaq-karwane-ke-liye-ihram-ki-upar-wali-chadar-utarna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/mayyat-ki-taraf-se-nafli-hajj-karne-ki-niyat-kya-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-farz-hone-se-pehle-hajj-kar-liya-phir-maldar-hogaya-tu-hajj-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-aurat-ka-dastane-aur-moze-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/multiple-visa-par-hajj-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-kiye-baghair-ihram-kholne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-umrah-ke-safar-mein-qasr-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-bandhne-ki-niyat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/wazu-aur-sone-ke-liye-ihram-kholna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-karna-sunnat-hai-ya-mustahab-ya-wajib",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/taif-se-ihram-ke-baghair-makkah-aana-phir-umrah-kiye-baghair-pakistan-aana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/sar-ke-baal-ek-pore-se-kam-hon-tu-zero-machine-pher-kar-ihram-se-bahar-hona",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halat-e-ihram-mein-sar-dhanp-kar-namaz-parh-li-tu-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-chadar-par-dhage-se-naam-likhwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/thakan-ki-wajah-se-rami-ke-liye-naib-banana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/dusre-aur-teesre-din-ki-rami-chorne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/zati-makan-ke-liye-raqam-rakhi-ho-tu-kya-hajj-farz-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-kar-ke-mina-muzdalifa-aur-arafat-jana-aur-baghair-ihram-makkah-wapas-aana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/dupatta-odhte-waqt-muhrima-aurat-ka-adha-chehra-chup-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-diaper-pehnne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ke-baad-haram-se-bahar-taqsir-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/na-samajh-bache-ko-masjid-e-haram-aur-masjid-e-nabawi-le-kar-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/madina-se-makkah-aane-ke-liye-ihram-kahan-se-bandhe",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-chehre-par-hath-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/maqrooz-ka-umrah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hotel-se-baghair-mahram-ke-ja-kar-umrah-ke-afaal-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ka-apni-behen-aur-us-ki-beti-ko-apne-shohar-ke-sath-umah-par-lekar-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hil-mein-rehne-wala-makkah-jaye-tu-ihram-bandhna-zaroori-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/baligha-aurat-ka-apni-behen-aur-behnoi-ke-sath-umrah-par-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jeddah-aane-wala-direct-madinah-jaye-ga-tu-ihram-bandhe-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/1-safar-mein-ek-se-ziada-umre-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/bewazu-sai-karne-se-dam-lazim-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ke-nafil-parhna-bhool-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ko-maqam-e-taneem-mein-haiz-aa-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/apne-dewar-uske-bete-aur-apne-nabaligh-bache-ke-sath-hajj-par-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ke-baad-miqat-ke-andar-he-haram-se-bahar-gaye-tu-makkah-wapsi-par-ihram-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-mein-halq-se-pehle-topi-pehen-li-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ke-ihram-mein-tawaf-se-pehle-hambistari-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/walid-ne-aulad-ko-hajj-karwaya-tu-aulad-ka-farz-hajj-ada-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-haram-ki-boundary-se-bahar-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ki-adayegi-ke-baad-dobara-haiz-ka-asar-zahir-ho-jaye-tu",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jeddah-ka-rehaishi-umrah-ka-ihram-kahan-se-bandhega",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/makkah-ke-hotel-se-ihram-bandh-kar-2-umre-ada-kiye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/rehaishi-ghar-ke-ilawah-makan-aur-plot-ho-tu-hajj-farz-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-farz-hone-ke-baad-paise-na-rahe-tu-hajj-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-se-bahar-hone-ke-liye-aurat-ka-dosri-muhrimah-aurat-se-taqseer-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-ihram-se-bahar-hone-ke-liye-aurat-bhi-halq-karegi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ke-tawaf-ke-baad-saie-mein-takheer-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ki-niyat-se-bandhi-gai-ihram-ki-chadrein-umrah-se-pehle-tabdeel-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-ihtilam-hone-ya-biwi-ka-bosa-lene-par-dam-lazim-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-ghadi-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-bandhne-ke-baad-ghusl-karna-aur-ihram-tabdeel-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ki-niyat-na-ho-tu-india-se-bagair-ihram-makkah-mukarramah-hazir-hona",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/zinda-rishtedar-ki-taraf-se-umrah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ka-haiz-ki-halat-mein-umrah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ka-cousin-ke-bete-ke-sath-umrah-par-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-mein-mamnoo-kaam-ke-irtikab-se-na-baligh-bache-par-kaffara-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/12-saal-ke-mehram-ke-sath-umrah-par-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-injection-lagana-aur-lagwana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ke-baad-aurat-ka-apne-baal-khud-katna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-e-wida-kiye-baghair-taif-chale-gaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/dam-ki-adaigi-mein-takhir-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/chand-saal-pehle-umrah-mein-khushbu-lagai-thi-ab-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ka-nafli-tawaf-mein-chehra-khula-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/istihaza-ki-halat-mein-umrah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ke-baal-chote-bare-hon-tu-taqseer-kaise-karein",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajr-e-aswad-ka-istilam-karne-ka-tareeqa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-aur-umrah-mein-lazim-hone-wale-dam-ka-gosht-kon-kha-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ke-baad-umrah-kiya-tu-kya-wo-tawaf-e-rukhsat-ke-qaim-maqam-hojaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/12-zilhajj-ki-rami-zohar-ka-waqt-shuru-hone-se-pehle-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ke-doran-hajjam-ki-ujrat-ada-karne-se-reh-gai-tu-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/miqat-se-bahar-rehne-wale-ka-baghair-ihram-azizia-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/driver-ki-halat-mein-hajj-kiya-ho-tu-maldar-hone-ke-baad-hajj-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ki-qurbani-makkah-mein-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/1-ihram-se-2-umrah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ifrad-karne-wala-hajj-ki-sai-karega-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/mina-ke-qiyam-ke-baghair-direct-arafat-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-dobara-umrah-karne-se-pichle-ahram-ka-kaffarah-ada-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-mein-rami-qurbani-aur-halq-ki-tarteeb-se-mutaliq-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/yom-e-arafah-ka-roza-kis-mulk-ke-hisab-se-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/dam-ke-janwar-ki-umar-kitni-hona-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ke-afaal-se-farigh-ho-kar-apne-room-mein-ja-kar-halq-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/nafli-tawaf-beth-kar-karne-se-dam-ya-sadqa-lazim-aye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-ke-doran-wazu-karne-aur-koi-cheez-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-ke-doran-farz-namaz-parhne-chala-gaya-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halat-e-ihram-mein-sar-ya-darhi-ke-balon-mein-kanga-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/peshab-ke-qatron-ka-mareez-ihram-mein-najasat-se-kaise-bachaye",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jis-taraf-rukh-karke-kankariyan-marni-chahiyen-us-taraf-rukh-na-kiya-tu",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-tamattu-wala-8-zul-hijjah-ko-hajj-ka-ihram-kahan-se-bandhe-ga",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-e-qiran-karne-wale-ka-hajj-se-pehle-hajj-ki-sai-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ke-akhrajat-ki-raqam-qarz-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-e-qiran-karne-wala-hajj-se-pehle-nafli-tawaf-kar-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-niyat-karte-waqt-talbiya-nahi-kaha-mohrim-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haiz-ki-wajah-se-baghair-ahram-miqat-se-guzarna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ki-halat-mein-chatri-umbrella-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/chappal-pehen-kar-tawaf-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-hajj-ki-qurbani-mina-mein-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/wh-5528-hajj-e-ifrad-karne-wale-par-rami-qurbani-aur-halq-mein-tarteeb-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ya-umrah-karne-wale-ka-apna-halq-khud-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/8-zul-hijjah-ko-mina-jane-ka-sunnat-waqt-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/13-zul-hijjah-ki-rami-karne-ka-kya-hukam-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jaddah-mein-rehne-wala-hajj-ke-mahine-mein-umrah-kare-tu-uske-hajj-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-e-qudoom-ka-waqt-aur-tawaf-e-qudoom-aur-tawaf-e-ziyarah-me-idtiba-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/wheelchair-par-hajj-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-ke-doran-aurat-ko-haiz-aa-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/mard-ke-liye-ahram-ki-halat-mein-boot-joote-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/makkah-mein-rehne-wala-hajj-ka-ahram-kahan-se-bandhe",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jeddah-mein-kaam-kar-ke-hajj-ke-liye-jayen-tu-hajj-ka-ahram-kahan-se-bandhen",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/bache-ko-god-mein-le-kar-tawaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ki-halat-mein-chehre-par-kapra-chupakne-ke-mutaliq-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-khilaf-warzi-par-lazim-aane-wala-sadqah-kahan-dein",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-karne-wale-ka-tawaf-ke-doran-talbiyah-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ki-halat-mein-cockroach-marne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/wheelchair-par-safa-o-marwa-ki-saie-karne-ka-kya-hukam-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-hajj-sirf-naqad-raqam-hone-ki-surat-mein-farz-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halat-e-ahram-mein-khushboo-wale-lotion-ya-cream-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/makrooh-waqt-mein-umrah-ada-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ka-makhsoos-ayam-mein-riyaz-ul-jannah-hazir-hona",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ki-halat-mein-neend-ke-andar-muh-chup-gaya-tu",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/dam-lazim-hone-ke-baad-mazeed-umrah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-mein-saiee-ke-doran-haiz-aa-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jawan-aurat-ka-jawan-damad-ke-sath-hajj-ya-umrah-par-jana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ka-ahram-ki-halat-mein-kaan-ki-lo-chupana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/bhole-se-topi-pehne-hue-ahram-ki-niyat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-ahram-bandhe-baghair-meeqat-se-guzar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-karne-ke-baad-halq-se-pehle-nafli-tawaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ahram-mein-kis-color-ke-kapre-pehne-gi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/khana-kaba-ke-ghilaf-ki-tareekh-aur-qeemti-ghilaf-charhane-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-mein-jism-ki-khal-ukharna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-mein-sai-karne-se-pehle-halaq-kar-liya-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ki-adaigi-me-takheer-karne-ka-hukum-aur-hajj-e-badal-karwane-ki-ijazat-kis-ko-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/meeqat-se-guzarna-ho-lekin-makkah-sharif-na-jana-ho-tu-ihram-ka-masla",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haiza-aurat-ka-masjid-e-ayesha-se-baghair-ihram-ke-haram-mein-dakhil-hona-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/behen-ke-damad-ke-sath-umrah-par-jana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/shadi-ki-wajah-se-hajj-mein-takheer-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/mulazim-ko-company-hajj-karwa-de-to-mulazim-ka-farz-hajj-ada-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ehram-ki-halat-mein-baal-jhar-jaen-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/bhagte-hue-tawaf-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-karne-wale-ke-liye-tawaf-e-wida-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kisi-ki-taraf-se-umrah-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ki-halat-mein-ghilaf-e-kaba-ko-chona",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-ke-doran-quran-majeed-ki-tilawat-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/pehle-beti-ki-shadi-kare-ya-farz-hajj-ada-karen",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/makkah-mukarramah-se-masjid-e-aisha-ja-kar-wapas-bila-ehram-makka-me-ajana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-nani-ki-behan-mehram-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-karte-hue-seena-phere-baghair-kaaba-ki-taraf-dekhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-mein-lazim-hone-wala-dam-ada-na-kiya-aur-watan-wapas-aa-gaye-tu-kya-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ki-halat-mein-hath-ke-thode-se-hisse-par-khushboo-lagi-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-qiran-wala-nafli-tawaf-kare-to-iztiba-kere-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halat-e-ahram-mein-chadar-se-paon-chhupana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-umrah-ke-baad-sar-se-chand-baal-aik-pore-ke-barabar-katle-tu-taqseer-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kisi-ki-taraf-se-umrah-kiya-tu-kya-us-shakhs-par-umrah-karna-lazim-ho-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-e-ziyarat-ke-baad-makhsoos-ayyam-shuru-ho-jayen-tu",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-badal-kaun-karwa-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-hajj-par-jane-se-pehle-rozon-ki-qaza-zarori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/nani-ki-sagi-behen-ke-sath-umrah-par-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-istinja-ke-liye-ahram-utarne-se-dam-wajib-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haji-par-eid-ki-qurbani-lazim-hai-ya-nahi-aur-kya-haji-eid-ki-qurbani-ghar-par",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aab-e-zamzam-peene-se-dua-ki-qabooliat-ka-waqt-pehle-hai-ya-bad-me",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/mehram-ka-hudood-haram-se-bahar-halaq-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-clothing-ko-kafan-ke-liye-rakhna-kaisa-mayyat-ka-kafan",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ke-liye-qurandazi-me-jua-ki-sorat",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-karne-walo-ka-fitra-un-ke-watan-me-ada-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halaq-ke-bad-ahram-ki-chadar-me-nafli-tawaf",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-karne-ke-bad-aurat-ka-haram-se-bahar-taqsir-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halat-e-ahram-mein-aurat-ka-shoes-pehnna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-se-pehle-ghusal-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-ihram-ki-halat-me-har-waqt-talbiah-ka-wird-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-me-balon-ki-taqseer-madina-jakar-ki-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-karne-wale-par-tawaf-e-wada-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ehram-ki-halat-mein-taweez-ya-sona-gold-pehenna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ke-dam-kab-tak-ada-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-farz-hone-ke-baad-mal-na-raha-to-farz-hajj-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/najasat-lagi-hone-ki-halat-me-tawaf-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-se-bahir-hone-ke-liye-halq-o-taqsir-kis-maqam-per-ki-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-farz-hajj-ke-liye-bhi-walidain-se-ijazat-zarori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-farz-hajj-ke-liye-maa-baap-ki-ijazat-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haiz-ki-halat-me-saee-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/khak-e-madina-apne-watan-lana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/rasoolullah-ki-qabar-ki-ziyarat-karne-wale-ki-shafaat",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurton-ke-liye-takbeer-e-tashreeq-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ki-qurbani-islami-bank-ke-zariye-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ke-tawaf-ke-chakkar-mein-shak-ho-jaye-to",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jo-hajj-jumma-ko-ho-use-hajj-e-akbar-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-ki-adaigi-ke-liye-pedal-jane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-e-kaaba-ke-baaz-chakkar-baghair-wazu-laga-liye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/nafli-tawaf-ke-baad-2-rakat-parhne-aur-saee-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ki-niyat-ke-baghair-talbiya-parhna-ahram-ke-masail",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/makkah-me-rehne-wala-shakhs-umrah-ka-ahram-kahan-se-bandhe",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-afaqi-meeqat-se-bahir-rehne-wala-shakhs-hajj-e-afrad-kar-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-e-tamattu-me-hajj-ka-ihram-bandhne-se-pehle-ki-gayi-saee-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-me-wet-tissue-istimal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/2825arfat-me-jumma-qaim-kiya-jaa-sakta-hain-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-ghusal-karne-ke-liye-ihram-ki-chaddarain-utar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-ki-halat-me-mard-ke-liye-patti-wali-chappal-pehnnay-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jis-ne-pehle-hajj-na-kiya-ho-usko-hajj-e-badal-ke-liye-bejha-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ghar-khareedne-ke-liye-rakhi-howi-raqam-ki-wajah-se-hajj-lazim-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/insurance-se-milne-wali-raqam-se-hajj-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/pakistan-se-jedda-jane-wale-ke-liye-ahram-bandhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ko-umrah-ke-baad-kitne-baal-katne-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-ki-sae-se-pehle-tawaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ek-umrah-ke-baad-dosra-umrah-karne-par-halq-ya-taqseer-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halq-or-taqsir-dono-hi-mumkin-na-ho-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-ki-halat-mein-aurat-ke-liye-sar-ka-masah-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/zinda-insaan-ki-taraf-se-umrah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-mard-par-ihram-se-bahar-aane-ke-liye-halaq-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/riyaz-ul-jannah-me-nawafil-ada-karne-ke-liye-dhakkam-peel-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/nafli-hajj-afzal-ya-nafli-sadqa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/makkah-me-rehne-wala-umrah-ihram-kahan-se-bandhe",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kya-aurat-baghair-mehram-safar-e-hajj-kar-sakti-hai-6878",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-e-badal-karne-wale-ka-farz-hajj",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/shawwal-mein-umrah-karna-7482",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-karne-wale-ko-makkah-mein-rok-diya-jaye-3953",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/larki-ka-apni-walida-ke-sath-umrah-par-jana-1585",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/pehla-umrah-karne-ke-baad-mazeed-umre-karna-6183",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/jadda-kay-rihaishi-ka-umrah-ka-halaq-kahan",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/dam-lazim-ho-aur-dam-dene-par-qadir-na-ho-9968",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ahram-mein-belt-wali-chatri-pehana-10",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/haram-se-bahar-halq-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-farz-hone-ke-ba-wajood-takhir-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-farz-na-tha-phir-bhi-kar-liya",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/bargah-e-risalat-mein-salam",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/gp-fund-se-hajj-1305",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/nafli-tawaf-adhoora",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/bay-wuzu-tawaf-ka-eada",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/ihram-me-kapray-tissue-se-nak-saf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/mulazmeen-ka-malik-se-qarz-lay-kar-hajj-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/hajj-e-badal-ke-liye-kis-ko-bhejen-682",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/government-hajj-scheme-me-naam-naa-ane-ki-wajah-se-hajj-late-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/mina-me-wuqoof-aur-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/maqam-e-ibrahim-per-nawafil-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-o-sai-kay-waqt-baat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/nabaligh-bachay-ka-umrah",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/doran-e-tawaf-challa-pehenna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/masjid-e-nabawi-me-namaz-ki-fazilat",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/halaq-say-pehlay-ehram-ki-niyyat",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-sai-kay-doran-aram-karna",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/tawaf-rukn-e-yamani-se-shuru-kya-to-kya-hukum-hai1836",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/dam-wala-zinda-janwar-faqeer-ko-dena-994",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/mazoori-ki-waja-se-hajj-badal-karwana-992",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/masjid-e-nabwi-mein-40-namazain-4911",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/umrah-per-namazain-qasar-ya-mukamal-0290",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/aurat-ka-baghair-mehram-ke-umrah-par-jana-12154",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/committee-ki-raqam-se-hajj-o-umrah-karna-12119",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/gharib-mohtaj-ki-madad-krna-5217",
-  "https://www.fatwaqa.com/ur/fatawa/hajj-aur-umrah/kiya-aurat-bina-mahram-ke-umrah-ke-liye-jasakti-hai-11954",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/gift-gaye-hissa-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bache-ka-naam-tabdeel-dobara-aqiqah",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqah-chandi-kise-den",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqe-ki-qurbani-ki-jaga-cheez-baatna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aik-bail-mein-teen-bachon-ka-aqeeqa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/imam-e-azam-ke-nazdeek-aqiqah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-gosht-mein-keere",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/apna-aqiqah-khud-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-mein-7-se-kam-hisse",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/sarhe-7-tole-se-kam-sone-par-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/1-qurbani-khud-rakhna-aur-1-sadqa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aamdani-biwi-ko-dene-wale-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-paye-ek-mahine-baad-khane-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/ek-bakre-mein-qurbani-aur-aqiqah",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ka-gosht-khana-zaroori",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-waqt-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/motiya-wale-janwar-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ki-khal-masjid-mein-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ka-janwar-chori-hojana",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-bajaye-garib-ki-madad-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-waqt-se-pehle-janwar-zibah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/faqeer-ki-qurbani-ka-janwar-aib-dar-hojaye-to",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ki-kaleji-par-fatiha",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/doodh-dene-wale-janwar-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/gaye-mein-pichle-saal-ki-qurbani-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/nisab-se-kam-sone-aur-eidi-par-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-wajib-hai-ya-sunnat-ek-aitraaz-ka-jawab",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/namaz-e-eid-ke-baad-khutbe-se-pehle-qurbani-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-liye-50-lakh-ka-ek-janwar-afzal-ya-5-lakh-ke-10",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-3-din-tak-ya-chaar-din-tak",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/janwar-mein-marhoom-ki-wasiyat-wali-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bare-janwar-se-7-bachon-ka-aqiqa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/maqrooz-shakhs-par-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-na-karne-par-bakri-sadaqah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqah-mein-bimar-janwar-zibah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqah-ka-gosht-taqseem-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aik-bakray-mai-do-bachon-ka-aqeeqa-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/baal-kate-hue-janwar-ki-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kya-bakri-jannat-mein-jayegi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqe-ki-bakri-ke-pait-se-bacha-nikla-to-kya-aqiqa-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ki-khaal-masjid-ki-tameer-mein-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/goli-se-mara-hua-janwar-halal-hai-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-wajib-hone-ka-nisab-qurbani-ke-dino-me-paya-jaye-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-waqt-behne-wale-khoon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/mayyat-ki-taraf-se-ki-gai-qurbani-ke-gosht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kafir-ko-qurbani-ka-gosht-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ki-khal-madarsa-banana-aur-bachon-par-kharch-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/salary-lene-wale-imam-ko-qurbani-ki-khal-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/sahib-e-nisab-imam-ko-qurbani-ki-khal-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/pedaishi-baghair-seeng-ke-bakre-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/gaye-ka-ek-than-khushk-ho-to-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/khassi-janwar-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/baghair-khusiya-wale-janwar-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/uzoo-kate-khassi-janwar-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/seeng-jar-se-nikale-gaye-janwar-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/seeng-kate-janwar-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kaan-chire-janwar-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-ke-kan-mein-surakh",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/zibah-karte-waqt-sar-alag-ho-jana",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/hiran-ki-qurbani-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qubani-zyada-qeemat-ka-1-bakra-afzal-ya-utni-qeemat-ke-3-bakre",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/mukhtalif-afrad-ki-qurbani-ki-bakrian-muayyan-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/prize-bond-ki-inami-raqam-se-qurbani-ya-naik-kam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/walid-ki-baligh-aulad-ki-taraf-se-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/sahib-e-nisab-walid-par-nabaligh-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/sahib-e-nisab-nabaligh-bache-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/sona-chandi-raqam-ka-nisab-ho-to-zakat-aur-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/janwar-ka-qurbani-se-pehle-ya-bad-mein-bacha-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-gosht-se-aqiqah-ya-walima-ki-dawat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bade-janwar-mein-aqiqah-ka-hissa-aur-baki-gosht-bechne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/maqrooz-qarz-ada-na-kare-to-uska-umrah-aur-qurbani-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/musafir-qurbani-ke-dino-me-dosri-jagah-ho-to-qurbani-wajib-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/apni-taraf-se-qurbani-karne-ke-bajaye-apne-bete-ki-taraf-se-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/zina-se-paida-hone-wale-bache-ka-aqiqah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kya-ghar-mein-rehne-wale-har-fard-par-alag-qurbani-karna-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-din-ka-roza-rakhne-ki-mannat-mangne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ka-janwar-zibah-karte-hue-pait-se-bacha-nikla-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/jahez-ka-saman-jo-sara-saal-istemal-nahi-hota-to-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/gosht-bechne-wale-se-aqiqah-ke-liye-ek-hissa-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/sonay-par-saal-nahi-guzra-to-qurbani-wajib-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kya-har-kamanay-walay-fard-par-qurbani-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/allahu-akbar-keh-kar-janwar-zibah-kya-tu-janwar-halal-hojaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-gosht-se-khana-bana-kar-paise-kamana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/beti-ki-shadi-ke-liye-50-hazar-mojood-ho-to-qurbani-wajib-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-ke-pait-se-zibah-ke-baad-bacha-nikle-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kya-oont-mein-qurbani-ke-10-hisse-ho-sakte-hain-hadees-ki-sharah",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/jahez-ki-niyat-se-kharide-gaye-saman-par-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/ijtimai-qurbani-mein-zibah-ke-waqt-hissa-daron-ke-naam-lene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-ke-halaq-se-zibah-ke-baad-anguthi-nikli-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-ki-2-tange-toot-jayen-to-qurbani-ho-jaye-gi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/sahib-e-nisab-ka-qurbani-ki-niyat-se-dumba-kharid-kar-bakre-se-badalna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/janwar-ka-ek-seeng-aadha-toota-ho-to-us-ki-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/beron-e-mulk-wale-ki-qurbani-pakistan-ki-jaye-to-kaha-ke-waqt-ka-atibar-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/saudia-wale-pakistan-mein-qurbani-karen-to-nakhun-aur-baal-kab-tak-na-katen",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/nabi-kareem-ne-kon-kon-se-janvaron-ki-qurbani-ki-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kiraye-par-diye-hue-ghar-ki-wajah-se-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-mein-aqiqah-ka-hissa-rakhna-kyun-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-dino-mein-nakhun-toot-jaye-to-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/maa-bache-ka-aqeeqah-kar-sakti-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bhair-ke-6-mah-ke-bache-ki-qurbani-ho-sakti-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/ghair-shadi-shuda-ke-liye-qurbani-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/raqam-udhar-mein-phansi-ho-to-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bachon-ki-shadi-ke-liye-rakhe-hue-plot-par-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/janwar-kharidne-ke-baad-bimar-ho-gaya-to-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/maal-e-tijarat-mein-30-bhains-hon-to-kitni-zakat-lazim-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/janwar-ke-kaan-mein-surakh-ho-to-us-ki-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ki-jagah-aqeeqah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/jahez-ka-saman-qurbani-ke-nisab-mein-shamil-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/5-saal-qurbani-nahi-ki-to-ab-ada-karne-ka-kya-tarika-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bhains-ki-qurbani-se-mutaliq-quran-o-hadees-ki-roshni-mein-tafsili-fatwa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/ghar-ka-pala-hua-bakra-bech-kar-bara-janwar-lena-aur-us-mein-aqiqah-ka-hissa-shamil-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/haji-par-eid-ki-qurbani-wajib-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bache-ka-aqiqah-waldain-ke-ilawa-kon-kon-kar-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/2-afraad-ka-mil-kar-ek-bakra-nabi-pak-ki-taraf-se-qurban-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ka-janwar-kharidne-mein-mali-taawun-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ki-gaye-bacha-de-to-bache-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/biwi-kamati-nahi-to-kya-us-ki-taraf-se-shohar-par-qurbani-lazim-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/gosht-bechne-wale-ke-sath-bare-janwar-mein-hissa-le-kar-aqiqah-karne-ka-hukum-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/halal-janwar-ke-phephray-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/judwa-bachiyon-ke-aqiqah-mein-ek-bakri-zibah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bare-janwar-mein-aqiqah-aur-gosht-bechne-ki-niyat-ho-to-aqiqah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bache-ki-wafat-ke-baad-aqiqah-ho-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/pichle-saal-naqad-raqam-na-hone-ki-wajah-se-qurbani-na-karsake-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/walidain-ka-aqiqah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kya-chaliswe-mein-aqiqah-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqah-ka-hukum-aur-maqsad-aur-baligh-hone-ke-baad-aqiqah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-na-ki-tu-bakri-ki-qeemat-kis-waqt-ke-aitbar-se-deni-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-na-karne-wale-ka-bakri-sadqa-karne-se-mutalliq-sawal",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-se-pehle-janwar-ka-doodh-peene-ka-kaffara",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/ghair-muslim-ko-qurbani-ka-gosht-de-diya-to-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ki-qaza-mein-di-jane-wali-raqam-kis-ko-di-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/ghani-shakhs-ne-apne-bakre-par-qurbani-ki-niyat-ki-phir-wo-aib-dar-ho-gaya-tu",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/gaye-ke-7-hisson-ka-hadees-pak-se-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/apni-wajib-qurbani-karne-ke-bajaye-apni-walida-ki-taraf-se-qurbani-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/umrah-mein-qurbani-hai-ya-nahi-aur-huzoor-ne-kyun-ki",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-par-sawari-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/karachi-mein-rehne-wale-ka-pakistan-ke-kisi-dusre-shehar-mein-qurbani-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/miya-biwi-dono-ke-sahib-e-nisab-hone-ke-bawajood-ek-qurbani-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kya-dadhi-katwane-wala-qurbani-ka-janwar-zibah-kar-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-ki-khal-zati-nafa-ke-liye-bech-di-to-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/2-3-afrad-mil-kar-janwar-zibah-karen-to-takbeer-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/janwar-ki-zuban-na-ho-ya-kati-hui-ho-to-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-bajaye-gareebon-ki-madad-kyun-nahi-ki-jati",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/2-than-wali-bhains-ki-qurbani-ka-kya-hukam-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/hijra-agar-qurbani-ka-janwar-zibah-kare-tu-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/nabi-aur-poori-ummat-ki-taraf-se-qurbani-aur-umrah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ka-gosht-kab-tak-kha-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/dosre-mulk-mein-qurbani-karwai-tu-baal-waghera-kab-kate-ga",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-gosht-ko-nikah-ki-dawat-mein-khilana",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kya-qurbani-karne-wale-par-eid-ka-roza-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-karne-ki-dua-aur-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/neel-gaye-ki-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-ko-behtar-janwar-ke-sath-tabdeel-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ka-waqt-kab-se-kab-tak-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/faut-shuda-ki-taraf-se-qurbani-karne-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/mukhannas-janwar-ki-qurbani-ka-hukum-aur-zibah-se-woh-halal-ho-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qarz-di-hui-raqam-qurbani-ke-dino-ke-baad-milni-hai-to-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/zibah-ke-waqt-uchal-kood-ki-wajah-se-janwar-aib-daar-ho-gaya-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/raat-ke-waqt-qurbani-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/eid-ki-namaz-jaldi-parhne-walon-ka-dusron-ki-qurbani-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/janwar-zibah-karte-hue-takbeer-ke-baad-baat-karna-aur-phir-takbeer-na-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqa-aur-sadqay-ka-janwar-kitni-umar-ka-hona-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/dusre-mulk-qurbani-karni-ho-tu-qurbani-ki-raqam-mein-kis-jagah-ka-lihaz-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/paise-cash-na-ho-tu-qarz-le-kar-qurbani-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-mein-shareek-6-log-satwa-hissa-marhomeen-ke-liye-karen-to-kya-hukam-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/agar-maldar-shakhs-12-zul-hijjah-ko-safar-par-ho-tu-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kisi-dusre-mulk-mein-aqeeqah-karwana-aur-aqeeqah-ke-gosht-ki-taqseem-kari",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/jis-bakre-ko-kutte-ne-kat-liya-ho-us-ki-qurbani-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-ki-khal-tohfe-mein-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-karne-ke-baad-gosht-gharibon-mein-taqseem-na-kiya-tu",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ka-ek-hissa-ghareebon-mein-na-banta-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ka-gosht-zameen-mein-dabana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqah-ka-janwar-zibah-karte-waqt-ki-dua",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-dino-mein-qurbani-afzal-hai-ya-raqam-ka-sadqa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/mahine-baad-aqiqa-karne-ki-surat-mein-bhi-kya-bache-ke-baal-mondna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqa-ke-waqt-bachi-ka-pass-hona-ya-janwar-ko-choona-zaroori-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kya-insan-ko-zindagi-mein-7-qurbaniyan-karne-ka-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqah-ki-dawat-mein-se-nana-nani-aur-dada-dadi-ka-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kya-larke-ke-aqeeqah-mein-aik-bakra-qurban-kiya-ja-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqah-ke-janwar-me-bachi-ke-liye-bakra-ho-ya-bakri-in-islam",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-karne-tak-khane-peene-se-ruke-rehna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/1-ya-2-saal-ka-bacha-sahib-nisab-ho-to-kya-is-per-qurbani-lazim-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/raat-me-aqeeqah-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-par-aik-shakhs-churee-chalaye-aur-dosra-shakhs-tasmia-kahe-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bary-janwer-ki-qurbani-me-kafir-ka-hissa-shamil-hoga-to-kiya-hukum-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/camel-ki-qurbani-me-kitne-hisse-hote-hain",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kaan-kate-huwe-ya-cut-lage-huwe-janwar-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/musafir-qurbani-karne-ke-baad-ayam-e-qurbani-me-hi-muqeem-ho-gaya-to-kiya-dobara-karega",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/apni-wajib-qurbani-karne-ke-bajaye-walid-ya-kisi-aur-ki-taraf-se-nafli-qurbani-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/sahib-e-nisab-shakhs-ka-marhoom-ki-taraf-se-qurbani-karne-mutalliq-aik-aham-masla",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqeeqe-ke-janwar-me-pichle-saal-ki-qaza-qurbani-ka-hissa-shamil-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bakri-ki-umar-ziyada-hone-ki-wjah-se-doodh-khushk-ho-gaya-to-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-se-pehle-aik-hissay-dar-inteqal-kar-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/pichle-saal-ki-qurbani-me-janwar-sadqa-kare-ya-is-ka-gosht",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-ka-doodh-istimal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/shadi-ki-dawat-me-aqiqa-aur-wakil-ke-zarye-nikah-ki-ijazat-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqa-ka-gosht-madarse-me-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-wajib-thi-magar-na-ki-to-ab-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/marne-wale-ka-aqiqa-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqa-kis-din-kiya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/satven-din-se-pehle-aqiqah-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/doodh-dene-wale-janwar-ki-qurbani-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bare-janwar-mein-aqeeqah-ka-hissa-shamil-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/syed-ke-liye-chaliswan-aur-aqeeqah-ka-khana-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kya-bare-janwar-cow-camel-mein-bache-ka-aqeeqah-ho-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/zibah-ki-iqsam-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/agar-kisi-mulk-me-aqeeqe-ka-janwar-zibah-naa-kiya-jata-ho-to-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqiqa-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-ka-khoon-hath-par-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/ghani-shakhs-ka-qurbani-ke-liye-kharida-hua-janwar-mar-gaya-tu",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bhainsay-aur-bhains-ki-qurbani-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/rasoli-wale-janwar-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-mein-aqiqa-aur-gosht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kya-ek-qurbani-sab-ghar-walo-ki-taraf-se-kafi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ka-janwar-khareed-kar-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/hamila-janwar-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bhains-qurban-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kis-janwar-ki-qurbani-afzal-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kis-janwar-ki-qurbani-ho-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ki-niyat-ke-baad-janwar-tabdeel-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kya-barhe-janwar-mein-7-hisse-zaroori-hain",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/janwar-ke-senng-nikalna-qurbani-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/musafir-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/khassi-karne-se-kapura-zaya-hona",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-se-faida-uthana",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ka-bakra-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-wajib-ho-aur-raqam-cash-na-ho-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/nisab-ke-barabar-meher-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/janwar-ka-aik-dant-toot-jaye-to-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bakra-ek-saal-ka-lage-tu-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/wirasat-ki-zameen-aur-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/zil-hajj-ke-10-dino-mein-baal-aur-nakhun-katne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bail-ki-umar-puri-ho-to-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/janwar-ki-hifazat-ki-ujrat-mein-janwar-se-hissa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/janwar-ki-dum-katne-mein-baal-shamil-honge-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/janwar-ka-seeng-toot-kar-zakham-bhar-jaye-to-qurbani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/dedh-tola-soona-aur-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurandazi-aur-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/pichle-saal-ki-qurbani-ise-saal-ho-sakti-hai-1366",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-janwar-seeng-tootna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/janwar-kharid-kar-phir-bechna-1647",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/masjid-mein-gosht-banana-2078",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-kay-dino-me-aqiqa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-ki-dum-6784",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/kitni-maliyat-ho-to-qurbani-wajib-hai-0502",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-mein-aqeeqah-karna-1374",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qarz-di-howi-raqam-par-qurbani-1513",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/muharram-me-qurbani-gosht-khana",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/sahib-e-nisab-ne-qurbani-na-ki-ho-6353-a",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/char-afrad-ka-qurbani-janwar-kharidna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-kay-badlay-heela-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bagair-dant-walay-bail-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/seeng-niklay-janwar-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-kay-janwar-me-aqiqa",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/seeng-jar-se-toot-gaye-kya-qurbani-jaiz-hai-12138",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/aqeeqay-ke-gosht-se-niaz-karna-12132",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/bachay-kay-aqiqa-ki-umar",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/ijtamai-qurbani-ki-raqam-ujrat-mein-dena-0059",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/qurbani-ke-janwar-ka-khusiya-1926",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/apne-bachon-ka-aqiqah-875",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/seeng-katay-janwar-ki-qurbani-6028-3",
-  "https://www.fatwaqa.com/ur/fatawa/qurbani-aur-aqeeqah/muawin-bachon-par-qurabani-60921",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/dana-khujane-se-khoon-nikalne-par-wazu-tootna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/baghair-jue-ke-taash",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/namaz-mein-makhi-ko-phoonk-marna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/fajr-ki-qaza-ki-niyat",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/attahiyat-ki-jaga-durood-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mangne-walon-ko-ration-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/gur-mein-tolne-ki-mannat",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/chappal-ya-joote-ki-najasat",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/tirmizi-aur-syed-zaat",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/asr-aur-fajr-ki-sunnaton-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/heere-jawahirat-ki-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/makkah-wale-ka-madinah-se-wapsi-par-ihram",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/baghal-khujane-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ghair-mehram-se-sar-par-hath-phirwana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/sone-walon-ke-neeche-baith-kar-quran-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/dulhan-ka-status-par-tasveer-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mehndi-se-jandar-ki-tasveer-banana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/dusre-umre-se-pehle-ghusal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kaam-karne-wali-biwi-ka-nafqa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/allah-ko-pyara-ho-gaya-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mard-o-aurat-ki-sharam-gah-touch-hone-se-ghusl",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kacha-bacha-girane-wale-janwar-ki-qurbani",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/hamal-ke-doran-doodh-pilana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/shohar-ya-walid-ka-aurat-ko-haj-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/baligha-larki-ka-chote-larkon-se-parda",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/sasur-ka-bahu-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ghar-aane-wali-billi-ko-khilana-sawab",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/quran-sun-kar-isale-sawab-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ammar-naam-meem-ki-tashdeed-ke-baghair",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mayyat-ko-ghar-mein-dafan-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/namaz-mein-ya-baad-mein-rakat-chhootne-ka-shak",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ghair-shadi-shuda-larki-ko-zakat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ghar-mein-aane-wali-patang-kisi-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/qudrat-ne-fursat-se-banaya-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/biwi-se-musht-zani-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/hijama-ke-khoon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/qaza-namaz-mein-durood-bhulna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/quran-mein-sahabiyat-ka-zikr",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/jima-ke-baad-bina-ghusal-ke-doodh-pilana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/music-ki-jagah-par-kaam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/udhar-lekar-niaz-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/beedi-ki-khareed-o-farokht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/pakhane-ke-maqam-se-khoon-ya-madah-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/dekhe-baghair-nazar-bad-lagna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/baghair-wazu-ihram-bandhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/scalp-pigmentation-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/namaz-mein-seena-nazar-aana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/jaali-bank-statement-banwana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/chalte-phirte-durood-ya-tilawat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/cement-ka-farsh-kaise-pak-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/be-wuzu-qurani-ayat-wale-bartan-ko-choona-ya-pani-peena",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/asar-ke-baad-shukrane-ya-hajat-ki-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/quran-pak-chhoona-ibadat-maqsoda-ya-ghair-maqsoda",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/hamla-aurat-ki-namaz-e-janaza-kitni-martaba-parhenge",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/musalman-ko-kufar-par-marne-ki-bad-dua-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/namaz-ke-baad-ayatul-kursi-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/shohar-ko-sajda-karne-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/nabi-pak-ko-mere-mehboob-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/yajuj-majuj-musalman-hain-ya-kafir",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/janwar-marjaye-to-usay-dafan-karna-zaroori-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/jadu-se-hifazat-ke-liye-oont-ki-haddi-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/peepal-ka-darakht-manhoos-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/nad-e-ali-me-ya-muhammad-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/pani-ki-tanki-napak-ho-jaye-tu-usko-kaise-pak-karen",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kya-watan-se-mohabbat-iman-ka-hissa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/sharai-mazoor-shakhs-sunnatain-aur-nawafil-ada-kare-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/jism-se-nikalne-wala-khoon-choos-lena-kesa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kya-hajj-ka-dam-koi-aur-ada-kar-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/roze-ki-halat-me-kisi-ko-khoon-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/sunar-ka-mard-k-liye-sone-ki-anguthi-aur-chain-banana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kya-balgham-ki-ulti-vomiting-se-wazu-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/nafil-ki-jagha-qaza-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/gunah-kitni-der-me-likha-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kya-bhap-steam-lene-se-roza-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mard-ko-sona-pehenna-haram-hai-ahadees-se-suboot",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kya-namaz-me-durood-e-ibrahimi-aur-dua-e-qunoot-parhna-he-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/imam-ke-barabar-2-muqtadi-qade-mein-hon-tu-teesra-shaks-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/hazrat-ameer-muawiya-ke-mutaliq-pait-na-bharne-wali-riwayat-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/masbooq-apni-baqya-namaz-kaise-pori-kare",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/biwi-ka-apne-shohar-ka-naam-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mard-ka-chain-aur-anguthi-pehen-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/jamat-me-shamil-hoye-to-imam-ne-salam-pher-diya",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kya-nabi-pak-ko-allah-tala-ka-deedar-hua",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/nikah-me-larki-se-ijazat-lene-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/wuzu-me-darhi-ke-baal-dhone-ka-sahi-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kya-takbeer-e-tehreema-me-allahu-akbar-kehna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kya-1-se-zayed-azan-ka-jawab-dena-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/sajda-e-tilawat-me-takheer-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/peer-ki-bait-torna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/bachay-ko-ring-kangan-pehnana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kya-dil-me-quran-pak-parh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/noor-nama-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kapra-pehantay-waqt-niyat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/na-baligh-bachay-ka-esal-e-sawab-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/sawari-waghera-par-saee-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/aye-ibn-e-adam-aik-teri-chahat-hai-aik-meri-chahat-hai-hadees-e-qudsi",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kisi-peer-ka-lambay-baal-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kan-chidwane-ka-riwaj-kab-para",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/insan-aur-farishton-me-kon-afzal-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/shadi-ka-mehar-kab-dien",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/imam-e-azam-ko-abu-hanifa-kyun-kehte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/witr-me-pehle-tashahhud-ka-suboot",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/garam-pani-se-wazu-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/roze-me-kulli-karte-howe-pani-andar-chala-jaye-to-kya-hukm-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/tahajjud-ki-namaz-ki-fazilat",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/roza-dar-agar-bhool-kar-jima-kar-le-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/nokri-ki-wajah-se-hajj-na-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kya-haiz-ki-halat-me-sajda-e-shukr-kar-sakte-hain-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/umar-bhar-ki-nekian-esal-e-sawab-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kya-2-satonon-ke-darmiyan-saf-banana-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mayyat-ko-ghusal-dene-ke-baad-mayyat-se-najasat-ka-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mayyat-ko-kulli-karana-aur-naak-me-pani-dalna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/nakhun-katne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kya-bachpan-me-hajj-karne-se-farz-hajj-ada-ho-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/konday-ki-niaz-me-gosht-ka-ihtimam-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/farz-ibadat-ka-esal-e-sawab-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kya-kisi-aik-imam-ki-taqleed-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/jo-sahib-e-tarteeb-nahi-raha-wo-dobarah-sahib-e-tarteeb-kaisay-bane-ga",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/wo-log-jin-ki-dua-qabool-nahi-hoti",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/bache-ka-naam-fahad-raza-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/sahib-e-tarteeb-jamaat-me-shamil-hone-se-pehle-qaza-parhe",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/qarz-se-nijat-ka-wazifa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/raat-me-aqeeqah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/madarsa-ya-school-se-chutti-karne-par-mali-jurmane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/iddat-me-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/namaz-me-sidhe-pair-ka-angutha-hil-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/intiqal-karne-wale-ki-taraf-se-zakat-o-fitra-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/aurat-ki-jamat-makrooh-hone-ki-waja",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/akhri-qaide-me-kitna-baithna-farz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/sajde-me-paon-ki-kitni-ungliya-lagana-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/hazrat-ibrahim-ke-walid-sahib-ka-naam",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/namazi-ke-aage-se-guzarna-ka-masla",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/bache-ko-music-wale-khilone-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kafir-ka-paida-hone-wala-bacha-kon-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mard-ka-sone-ke-nalain-pak-wala-naqsh-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/murge-ki-qurbani-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/iftar-ki-dua-kab-mangi-jaye-iftar-se-pehle-ya-bad",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/black-friday-kehna-aur-manana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/qaida-aula-aur-pehli-rakat-par-baitne-me-kitni-takhir-se-sajda-e-sahw-lazim-ho-ga",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/roze-ki-halat-me-pait-par-injection-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/15-din-ki-niyat-karne-wala-musafir-pehle-ghar-chala-jaye-to",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/juma-ka-khutba-nahi-suna-to-namaz-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mustamal-pani-ko-taharat-ke-qabil-banana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/naik-shakhs-ke-naam-ke-sath-rahmatullah-alaih-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mangetar-se-baat-cheet-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/band-bajon-ke-sath-naat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/roze-mein-haiz-aaye-to-khana-peena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mairaj-mein-deedar-e-ilahi-par-aitraz-ka-jawab",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/message-par-salam-ki-jaga-aoa-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/sooti-mozon-par-masah",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/aurat-ke-hathon-par-aata-laga-reh-gaya-aur-namaz-parh-li",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/sahib-tarteeb-pehle-qaza-namaz-parhe-ya-jamat-mein-shamil-ho",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/janabat-ki-halat-mein-haiz-aaya-to-ghusal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/namaz-mein-khilaf-tarteeb-tilawat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/zohar-mein-bhoole-se-ek-ayat-buland-awaz-se-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/pehli-biwi-se-doosri-shadi-ki-ijazat-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/test-tube-baby-ke-zariye-aulad-hasil-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/namaz-mein-surah-fatiha-ki-ayat-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/umrah-ka-isal-sawab-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/hindi-mein-quran-majeed-chhapna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ek-namaz-ki-niyat-karte-hue-galti-se-doosri-ki-niyat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/aurat-ka-chalti-train-mein-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/tawaifa-maan-se-husn-e-sulook",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ghar-mein-kutta-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/namaz-fajr-suraj-nikalne-se-kitni-der-pehle-ho-jayegi",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/nageena-lage-chandi-button-pehanna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/baghair-irada-ayat-e-sajda-sunne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ruku-o-sajde-mein-teen-se-zayada-tasbihaat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ghoray-ka-gosht-khana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/paon-takhnon-samet-kate-hon-to-wuzu-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/qaidah-oula-mein-bhool-kar-darood-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/baad-ghusal-mard-ki-mani-aurat-ke-jism-se-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/nabi-aur-rasool-ki-tareef-aur-tadaad",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/fatiha-se-pehle-surat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/meraj-kitni-umar-mein-hui",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/tangi-waqt-ke-sabab-ghusla-ki-jaga-wuzu-karen-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/pehli-rakat-mein-surat-milana-bhoola-aur-teesri-mein-yaad-aaya",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/muqtadi-ke-attahiyat-parhne-se-pehle-imam-salam-pher-de",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/sutre-ki-lambai-mein-hath-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/tabai-ke-hathon-islam-lane-wale-sahabi",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/galti-se-quran-pak-girna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/jism-par-lagi-khushk-mani-pak-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/apni-bakriyon-ke-sath-kisi-ki-bakri-agayi",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/haiz-o-nifas-mein-nakhun-katna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/chaar-nafil-mein-qirat-ki-tarteeb-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mayyat-ko-mehendi-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kafir-ka-jutha-aur-kafir-ke-sath-khana-peena",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/rozon-ki-qaza-mein-din-muayyan-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/2-betiyon-ya-do-behnon-ki-ek-sath-shadi-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kekra-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mustamal-pani-se-istinja-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/haiz-mein-tilawat-na-karne-par-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/napaki-mein-baal-katwana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/qaidah-mein-bhool-kar-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/qaza-namaz-pehle-parhen-ya-ada",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/bache-ko-ghusal-se-pehle-kan-mein-azan-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/nabi-pak-ke-wisal-ke-baad-ziyarat-se-sahabi-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ghair-muakkadah-sunnatein-na-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/farz-namaz-ke-baad-dua-na-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/zina-ke-baad-nikah-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/chalte-phirte-ayat-e-sajda-sunne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/shabe-barat-mein-shadi",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/haiz-mein-quran-sunna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/iddat-mein-doctor-ke-pas-jana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/makeup-ke-sath-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/bajamaat-tahajjud-mein-qirat-kaise-karen",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/nifas-wali-aur-uski-cheezon-se-parhaiz-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ghair-muakkadah-sunnaton-ki-chaar-rakat-ada-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/qabar-ko-choomna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/haiz-mein-guthliyon-par-aurad-o-wazaif-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/namaz-ke-liye-jaga-khas-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/bathroom-mein-wazu-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/qabar-baith-jaye-to-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/larke-ke-aqiqe-mein-kitne-janwar-hon",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/nafil-roze-ki-walden-se-ijazat",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/motor-se-hone-wali-paidawar-par-ushar-ke-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/aurat-ka-miswak-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/aurton-ka-baiat-hona",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/aurat-ka-sar-ke-baal-katna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/masjid-aur-kaaba-ko-allah-ka-ghar-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/oral-sex-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/kauwa-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/musafir-qasr-kis-jaga-se-shuru-kare",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/zindagi-mein-hee-kafan-banwa-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/bache-aur-bachi-ko-doodh-pilane-ki-muddat",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/makhsoos-dino-mein-ayatul-kursi-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/galti-se-quran-girne-ka-kaffara",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/muqtadi-peechay-ho-ya-imam",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/hath-me-quran-pak-liye-zameen-par-bethne-walo-ke-pas-bed-par-bethna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/biwi-ke-bhai-ki-beti-mehram-ya-ghair-mehram",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ahram-ki-niyat-se-pehle-ahram-me-khushbu-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/sunnatain-tor-kar-jamaat-mein-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/imam-ko-wajib-qirat-kar-lene-ke-baad-luqma-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/muslim-larki-ka-ghair-muslim-se-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ghair-moqada-sunnaton-mein-attahiyat-ke-baad-durood-shareef-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/larke-ke-aqeeqah-mein-aik-bakra-zibah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ghusal-ka-farz-bhoolay-se-reh-gaya-namaz-parh-li-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/nakseer-photnay-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/zibah-karte-takbeer-na-kahi-to-gosht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/namaz-me-seene-ki-haddi-nazar-aaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/siri-namaz-me-imam-buland-awaz-se-qirat-karen-to-kab-luqma-de",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/13-muharram-ki-niyaz-me-se-sirf-aurton-ko-khilana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/murga-zibah-karne-ke-baad-takbeer-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/haiz-ki-halat-me-nakhun-katna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/murgi-ke-ande-ki-beat-lagi-ho-to-is-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/pishaab-ke-sath-mani-ke-qatray-bhi-nikaltay-hain-to-kya-ghusal-farz-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/nafal-ki-qaza-me-qayam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/muharram-main-aurat-ka-chorian-pehana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/shadi-ky-bad-maiky-main-muharram-ka-chand-dekhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/hathi-ka-gosht-haram-ya-halal",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/duty-ki-wajah-se-namaz-qaza-hona",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/junbi-der-se-jaga-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/walid-ki-jaga-god-lene-wale-ka-nam",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/makro-tehrimi-ka-kia-matlub-hy",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/hindu-ko-jai-ram-ji-ki-bolne-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/itikaf-wali-aurat-ka-pardah",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/khargosh-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/sweets-mein-haram-ajza-ki-afwah",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/qeemat-kam-karwane-ke-liye-jhoot-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/ghair-qanooni-gas-se-tayar-khana",
-  "https://www.fatwaqa.com/ur/fatawa/mukhtasar-jawabat/mahwari-mein-wazaif-aur-qurani-ayat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hamd-naam",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hadeesa-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aroof-naam",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/meerah-naam-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/iqrar-naam",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aish-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/azeem-naam-rakhna-aur-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sarim-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sibtain-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/isha-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/jiyad-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ashhar-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-zulkifl-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rubab-fatima-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/laila-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/basil-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/binyamin-ya-luqman-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/arhan-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-tathir-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mehr-un-nisa-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/meeram-naam-ka-meaning-aur-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/tair-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/kaneez-fatima-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shahzaib-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/arafat-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ashra-naam-rkhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rahimullah-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/wahab-ali-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mashaim-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hala-aur-bilqees-naam-ek-sath-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/safiya-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/arifah-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ukasha-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-minsa-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shaban-ali-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-zaurain-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abdul-mubeen-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mubeen-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rataba-fatima-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-nafi-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/haiqa-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hiba-hayat-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sirf-qadeer-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/atiqah-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ghulam-salahuddin-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larki-ka-naam-zumar-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abdul-muttalib-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sani-naam-rakhna-kesa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zunain-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/tehniyat-fatima-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/filza-naam-rakhna-kesa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/gul-e-zahra-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/kisi-ka-naam-allah-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-dayyan-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abdul-moiz-ko-moiz-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/asma-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/arshiyan-naam-rakhna-kesa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hoor-e-adan-fatima-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abdul-mannan-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/naymat-naam-rakhna-kesa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zahira-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachay-ka-naam-orhan-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/salar-aur-aarish-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zoraiz-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-shees-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-ayesha-fatima-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hanzala-ya-azhan-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-habib-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mehrish-raza-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-yousuf-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/marwah-aur-farwah-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shaiza-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mursaleen-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/maheen-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/umme-ammara-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rahimeen-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/atika-batool-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-ammar-naam-rkhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/khizar-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zaira-noor-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hiba-fatima-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hanzala-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-zaid-sultan-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/naeem-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/raina-naam-ka-matlab-aur-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aaira-naam-ka-matlab-aur-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muharib-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/anzish-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/usaid-naam-ka-matlab-aur-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zarina-fatima-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-hazim-ali-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shah-noor-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/armash-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rahim-ali-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muniba-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/varisha-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/arsalan-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-karim-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shaqaf-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shawwal-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/afrahim-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mirkha-fatima-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachon-ke-naam-arabi-mein-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mustafiz-ul-mustafa-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachay-ka-naam-nooh-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ek-se-zayed-kuniyatain-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-ubaid-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ushan-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bete-ka-naam-shaffan-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-shehroz-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-aarish-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-aariz-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ghulam-rasool-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zarwa-batool-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/afnan-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mushk-e-haram-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-ameera-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/farwa-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-yasmeen-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mubasit-ya-basit-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hina-fatima-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zukhruf-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/azwa-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sijjil-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abu-dujana-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-qaqa-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/siyan-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aina-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/nukhba-naam-rakhne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/areej-fatima-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/musaykah-maryam-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ishmal-naam-ka-matlab-aur-ishmal-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ahtisham-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/pehle-shohar-ki-olad-ke-sath-bator-walid-kis-ka-naam-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-musfirah-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/khansa-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/miqdad-naam-ka-matlab-aur-ye-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-daneen-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/kya-ali-naam-rakhne-se-mazeed-bache-nahi-hote",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/adan-fatima-naam-rakhna-aur-iska-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larke-ka-naam-shams-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zulaikha-zahra-zarish-zahra-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/maliha-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-uyaina-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-zaidan-hussain-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-tabrez-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abdul-ghous-aur-mohiuddin-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/pari-shah-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhtasham-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zayan-raza-ka-matlab-aur-ye-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/naam-rakhne-ke-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-alaya-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-ghous-ahmed-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-shafi-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-zaira-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/nawal-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bete-ka-naam-abu-turab-rakhna-aur-iska-matlab-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-zoha-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aurat-ka-naam-rasool-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-azwa-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-marwa-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-muhibba-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larki-ka-naam-hamd-fatima-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-mahrukh-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-virsa-fatima-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ibtihal-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sumaira-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-ghulam-mustafa-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bariya-naam-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-abeel-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-ayla-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-lina-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/qitmeer-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-ibtihaj-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-madani-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-raima-rakhna-aur-iska-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-abraj-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-nowruz-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-zeenia-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-gulrez-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-taimoor-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-saiba-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muawwaz-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-latif-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-komal-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-harib-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-nawal-noor-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-shafaq-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-sara-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-mehak-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-yasrab-fatima-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-abdus-saboor-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-momin-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-minhal-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mir-hadi-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-raiba-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-umme-roman-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-ais-rakhna-ais-name-meaning",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/wameez-ul-mustafa-naam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-hamna-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mashal-name-meaning-mashal-naam-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-zurain-rakhna-kaisa-zurain-name-meaning",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-azeen-rakhna-kaisa-azeen-name-meaning-urdu",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-amal-rakhna-amal-name-meaning-urdu",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aroush-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-ramz-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-kausar-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-adam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/amshal-fatima-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/jannat-ul-firdaus-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/tooba-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-mahpara-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ameer-ali-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-yahya-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-yamna-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/laaibah-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-zulqarnain-rakhna-aur-hazrat-zulqarnain-kaun-hain",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beenish-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-afaf-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-ummat-ul-maryam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-mirha-fatima-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-umar-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-nazeer-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-zeenat-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-abdan-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-musanna-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-ghulam-taha-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-irfan-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-usman-abu-quhafa-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-nalain-fatima-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-zunnurain-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-jarir-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/fabiha-naam-ka-matlab-aur-fabiha-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-ali-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shaila-naam-ka-matlab-aur-shaila-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/gul-fatimi-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-umme-habiba-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-raza-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ummat-ul-hafeez-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/safwan-naam-ka-matlab-aur-safwan-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/talha-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/waleed-naam-ka-matlab-aur-waleed-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sawera-naam-ka-matlab-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-zulkaif-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-hamdah-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-batha-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-tayyab-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ghair-muslimo-wala-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/nabi-bakhsh-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-haseeb-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-ghani-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-mahira-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-muammal-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-sahl-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/anaiza-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-abdul-ghani-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bete-ka-naam-muhammad-mustafa-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aqib-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/wali-ullah-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/kya-haris-shaitan-ka-naam-hai-aur-ye-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/saba-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ghulam-murtaza-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-allah-diya-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-abu-bakr-naam-rakhna-aur-abu-bakr-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-muheen-ya-rehnuma-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/noorain-name-meaning-aur-noorain-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/samiullah-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-saqib-ali-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/behram-naam-rakhna-aur-is-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-naila-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/murtaza-ka-matlab-aur-muhammad-murtaza-farooqi-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-uqban-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bete-ka-naam-hadid-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/isra-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-gaza-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-zumar-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hasan-muhammad-abrar-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/khawar-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-waliya-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/saif-ur-rehman-asif-ur-rehman-aur-shafiq-ur-rehman-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larke-ka-naam-karimain-rakh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-umme-abiha-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-rajab-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/nail-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/batool-zahra-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/suraiya-jannat-ya-suraiya-abrar-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/kya-alif-se-naam-rakhne-mein-asrat-achhe-nahi-hote",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/jawad-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ayesha-batool-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bete-ka-naam-ijaz-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aneesa-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larki-ka-naam-shamail-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zihan-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mezaab-e-rehmat-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/alia-naam-rakhne-ke-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shammas-aur-dayan-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/haika-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hadeer-naam-ka-matlab-aur-hadeer-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-zakwan-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zammad-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-musab-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-ali-ul-murtaza-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rozina-ko-rozin-keh-kar-bulana",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zahra-fatima-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rahim-naam-rakhna-aur-pukarna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/arsha-ya-arsa-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sohan-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/azmat-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-sakinah-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-falak-fatima-ya-shifa-fatima-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-qurratulain-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/jafar-ilahi-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/yashfeen-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larki-ka-naam-falak-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bete-ka-naam-muhammad-nabi-ya-muhammad-rasool-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-aslihan-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-raiqah-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/jawairiya-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/safa-noor-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/yazdan-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/lubaba-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/noor-e-adan-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/maliha-fatima-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/nashila-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/barzah-fatima-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/arish-haroon-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/kaneez-ur-rasool-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-qaiswa-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/amal-fatima-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ladki-ka-naam-madina-noor-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ashhab-naam-rakhna-aur-ashhab-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-rahmat-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/amina-naam-ka-matlab-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-hamdan-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ladki-ka-naam-yusra-fatima-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-usman-raza-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larke-ka-naam-hunain-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larke-ka-naam-saif-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larke-ka-naam-asad-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-mirha-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-jeelani-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ladki-ka-naam-anfal-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/afrah-noor-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-khaliq-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zain-ul-abideen-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/riza-fatima-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ahad-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/wasib-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/buraq-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aqsa-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/umaima-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larki-ka-naam-mubashirah-darain-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zujaja-noor-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sunaina-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hifza-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abeera-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/afrah-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-malik-shareef-khan-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shamsheer-ali-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sher-ali-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/meherban-ali-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shaheen-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/suairah-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-naam-rakhna-aur-aise-bache-ke-mutalliq-adaab",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-zian-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/maisha-naam-ka-matlab-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ishrat-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sonia-naam-ka-matlab-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/tahleel-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ania-fatima-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larki-ka-naam-safa-ahmed-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/umama-zainab-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/fajar-fatima-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/jannat-fatima-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mahnoor-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/arshe-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/inaya-fatima-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-zeeshan-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ismail-aur-ibrahim-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/inaya-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/qismatullah-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zul-yadain-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hammad-ullah-mushtaq-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-bilal-misbah-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ladki-ka-naam-anabia-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-samad-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sabeeka-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abdul-nafi-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/kya-bachon-ki-kuniyat-rakh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mustajab-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hafeeza-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/manhal-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-urooj-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-aniya-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hareem-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aroob-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/nofil-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/wajiha-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sanam-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/kabir-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/maira-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ahmed-yasin-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sayyida-munifa-fatima-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/tehseen-fatima-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/fahham-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rahila-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/owais-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/umm-e-noor-fatima-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-yaman-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-aahil-khan-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/anbiya-naam-rakhna-aur-anbiya-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/tahreem-fatima-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/raheeda-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/nadia-naam-aur-isko-badalne-ke-mutalliq-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ufairah-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aaiza-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/minhah-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-rabia-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abrash-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shaheer-aur-natasha-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-ishal-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aljaish-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/azka-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/harees-naam-ka-matlab-aur-harees-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aulad-hone-se-pehle-kunyat-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/fehm-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-areesha-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-sabiqa-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/internet-se-naam-ka-matlab-dekh-kar-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-hamzah-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-muntasha-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/fatimah-lafz-ka-matlab-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rahib-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abul-qasim-kuniat-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-aizal-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mishal-fatima-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larke-ka-naam-siddique-aur-larki-ka-naam-siddiqa-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aaliyan-aur-alian-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abu-muhammad-kuniat-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-sultan-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-hiba-noor-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/farhan-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-saleh-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mishkat-fatima-naam-ka-matlab-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-mujtaba-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/azbah-hamail-aur-baiza-naam-ke-mutaliq-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larki-ka-naam-nayab-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ramla-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mufliha-aur-ayesha-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/alina-aur-aira-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-arif-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-mutahir-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/murtasim-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-musa-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/areeba-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-ammarah-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/fareeha-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-aliza-fatima-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/umme-aimen-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/iram-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hamzah-naam-ka-matlab-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/dua-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/wh-5661-bache-ka-naam-ahmar-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/dur-e-adan-hala-aur-umamah-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/haya-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/barirah-aur-iman-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-mahdi-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-sanaya-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bete-ka-naam-muhammad-hamid-raza-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/wh-5568-bete-ka-naam-muhammad-izhan-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/arshman-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/tihami-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-sabiyyah-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larki-ka-naam-rumaisa-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/wh-5522-insha-rani-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abeer-fatima-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-mehwish-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aiza-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aniqa-aur-manahil-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aasiya-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/unza-naam-ka-matlab-aur-unza-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rida-fatima-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/dawood-aur-saad-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/umme-kulsoom-naam-hai-ya-kunyat",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sobiya-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sarfaraz-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/qais-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/kuniyat-rakhne-ki-sharai-hesiyat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-arman-raza-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abrar-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-zainab-fatima-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-huraira-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-nabeela-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/huzaifa-naam-ka-matlab-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hashir-ebad-khan-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shamweel-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-fatir-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-bishr-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-daniyal-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-dawood-muhammad-binyameen-muhammad-muaz-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sania-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-meerab-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/khadija-naam-rakhna-aur-is-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ghiasuddin-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hareem-attariya-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/lafz-e-isa-ka-matlab-aur-yeh-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/safoora-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/adam-lafz-ka-kya-matlab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/nuh-ya-muhammad-nuh-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/wh-5047-larki-ka-naam-arwa-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/neelam-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-binyamin-ali-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/azlan-naam-ka-matlab-aur-azlan-ahmed-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-manahil-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/azza-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hannan-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/noor-e-taiba-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/wania-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-saltanat-parveen-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/salif-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-haris-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-umme-hani-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/tabish-alam-ya-tafeef-alam-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/affan-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-raana-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zahra-naam-ka-matlab-aur-ye-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-yahya-hussain-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-zaina-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-arbia-hasan-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/kaleemullah-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachiyon-ke-islami-naam-batadein",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/asra-yusra-and-sidra-name-meaning-in-urdu",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/wali-muhammad-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-ghulam-muhuddin-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ghazali-naam-rakhna-kaisa-hai-ghazali-name-meaning-in-urdu",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ikmalullah-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-muhaimin-ali-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shayan-hussain-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rahat-banu-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-rahman-naam-rakhna-aur-pukarna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rawhan-naam-ka-kya-matlab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/laiba-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-abdullah-aasim-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mantasha-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-shahzain-aur-isbah-noor-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ayesha-kanwal-aur-afsha-kamal-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rayyan-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-hakeem-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/larki-ka-naam-insha-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/konain-ka-matlab-aur-yeh-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ansa-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-mughees-arshad-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abiha-fatima-naam-rakhna-kaisa-aur-abiha-fatima-naam-ka-meaning-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-shehla-rakhna-kaisa-aur-shehla-naam-ke-meaning-kiya-hain",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/kya-armiya-kisi-nabi-ka-naam-hai-aur-larke-ka-armiya-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/maryam-naam-ka-meaning-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/haniya-inara-aur-nabiha-naam-rakhna-kaisa-aur-in-naamo-ke-meaning-kya-hain",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ayan-naam-rakhna-kaisa-aur-is-naam-ka-meaning-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zarwa-aur-ansharah-naam-ke-meaning-aur-ye-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/kya-sidra-naam-rakh-sakte-hain-aur-is-naam-ke-meaning-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/harmain-fatima-aur-harmain-zehra-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-musfah-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/saqlain-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hiba-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/eman-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hisaab-laga-kar-bachay-ka-tareekhi-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-ahmed-name-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/tanzila-naam-ka-matlab-aur-yeh-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/taifoor-naam-rakhna-aur-is-se-pehle-muhammad-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-hateem-fatima-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/musfirah-naam-ka-matlab-aur-ye-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-malaika-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-ayat-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/affan-name-ka-meaning-aur-yeh-name-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shah-zain-naam-rakhna-kaisa-is-naam-ke-meaning-kiya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/wh-4407-razzaq-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/baghdad-raza-muawiya-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hamna-ashir-aur-azlan-naam-ka-matlab-aur-aise-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ahmed-raza-aur-ahmed-mubasher-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/afzan-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-haiqa-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hania-fatima-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/unaiza-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-khattab-name-rakhna-kaisa-khattab-name-meaning-urdu",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shariq-naam-kay-meaning",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mustufa-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/usaila-name-rakhna-kaisa-usaila-name-rakhne-ka-hukum-islamic-names-arabic-names",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-aas-naam-rakhna-sahi-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-rabab-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/kya-hazaima-naam-rakh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-shafina-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muntaha-naam-ka-matlab-aur-yeh-naam-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-namal-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/chalis-din-ka-hamal-zaya-ho-jaye-to-kya-uska-naam-rakhna-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zinnirah-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sahil-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/anamta-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hareem-fatima-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/zohan-naam-rakhna-kaisa-zohan-name-meaning-in-urdu",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/shah-mir-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/haleema-fatima-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/arha-naam-rakhna-kaisa-aur-iske-meaning-kya-hain",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-hanan-ali-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/nabi-ahmad-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-haadi-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-haider-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-ayyan-naam-ka-matlab-aur-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/fatima-zahra-ka-matlab-aur-ye-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/azyan-farzan-arzhan-zehan-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-ilma-hussain-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muntaha-ki-meaning-aur-ye-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-rohan-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ali-azhar-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/madina-fatima-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/arbad-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-muhammad-zain-raza-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-umais-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bache-ka-naam-malahim-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hasnain-aur-rumaisa-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-azan-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/ikram-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachi-ka-naam-kiswah-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bachay-ke-naam-ke-aakhir-mein-lafz-mohammad-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/soban-naam-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/allah-ke-naam-par-bandon-ke-naam-rakhte-waqt-abd-lagane-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-haadi-hussain-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/beti-ka-naam-hoor-ul-ain-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sabireen-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/azib-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/qudsia-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-abdul-qadir-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/akash-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sultan-sabir-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/haram-fatima-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-hadi-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-abdul-qadir-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hawa-fatima-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/haider-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/farishton-ke-naam-par-bache-ke-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/abu-zar-abaan-aur-ahaan-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/bacha-rota-ho-tu-naam-badal-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/minha-fatima-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mirha-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/saiyaan-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/arshiya-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/aneeb-murtaza-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/khizar-ahmad-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-samiuddin-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/taha-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/mahi-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/albaksh-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/gulzar-meaning-in-urdu",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/fatima-zahra-fatima-ya-noor-fatima-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-abdul-ahad-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/dua-fatima-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/hasnain-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/sadia-aur-maryam-me-se-konsa-naam-behtar-hai",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/roshan-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-basit-naam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-musayyib-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/arham-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/farishto-ke-naam-par-bachon-ke-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/rehman-name-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/name-se-pehle-lafz-abd-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-rafay-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/nabi-ya-nabiya-naam-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/bachon-ke-naam/muhammad-name-rakhne-ka-hadees-se-saboot-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/bachon-ki-lotriyan-kharidna-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/sunar-ka-mardana-anguthi-banana",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/lunde-ki-pant-mein-dollar-milna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/customers-ko-mukhtalif-qeemat-par-cheez-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/wakeel-ka-apne-liye-kharidna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/ghair-muslim-marday-ko-dafan-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/waqt-par-payment-na-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/furniture-par-cartoon-banana",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/pasand-na-aaye-to-wapsi-ki-shart",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/company-se-tohfa-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/labour-ka-doodh-tay-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/cheez-kharidne-ke-baad-rate",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/thekedaar-ka-kaam-mein-takhir-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/gandum-ki-bori-par-paise-katna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/naukri-chorne-par-tankha-katna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/school-van-wale-se-commission-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/hajj-umrah-ke-agents-ka-commission",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/aqd-e-mudarbat-khatam-karne-ka-tareeqa",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/cheez-ko-check-karne-ke-paise-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/clearing-agent-se-mutaaliq-ek-sawal",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/driver-ka-khana-bhi-rishwat",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/wapsi-ki-shart-kay-sath-cheez-kharidna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/ajeer-ka-kisi-aur-say-kam-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/mulazim-ka-zaid-raqam-khud-rakh-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/kirayadar-ka-dokan-agay-kiraya-per-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/gair-muslim-ki-dokan-say-gosht",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/gair-muslim-ki-dokan-say-machli",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/sarmaya-baraber-ho-to-nafa-baraber",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/ujrat-advance-me-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/maqrooz-ka-inteqal-ho-jaye-to",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/muqaddas-kaghzat-raddi-me-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/credit-card-ka-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/parinda-pakra-malik-ka-maloom-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/kya-bacha-hwa-maal-wapis-lena-shopkeeper-per-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/gandum-ki-piswai-ki-ujrat",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/medical-store-me-investment",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/maweshion-me-investment",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/purchaser-ko-rishwat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/promotion-per-treat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/ikhrajat-ka-jaali-bill",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/hukumat-ki-taraf-se-muqarrar-rate",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/raqam-ya-wazan-round-figure-na-ho",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/thekedar-ka-ujrat-na-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/umrah-package-aur-udhar",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/pani-ki-kharid-o-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/wakalat-ka-pesha",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/ye-to-qeemat-e-kharid-bhi-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/sunnar-kay-sath-investment",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/taqreer-ki-ujrat-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/ijara-me-koi-aur-kaam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/1-rupay-ki-cheez-10-rupay-me",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/nafa-per-kharid-o-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/cheez-bechnay-per-ijara",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/baiana-zabt-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/naya-mobile-dabba-kholne-ke-baad-sasta-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/khoon-ki-kharid-o-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/smuggling-bare-mein-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/neelami-kay-zariye-saman-kharidna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/haram-maal-say-khari-cheez",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/commission-agent-ziada-qeemat-per-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/ziada-advance-de-kar-kirya-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/murda-janwar-ki-khal",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/tv-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/kuffar-kay--meloon-me-dokan",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/film-o-gano-ki-cd-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/deen-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/juma-ki-azan-per-karobar-band",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/masail-seekhay-bagair-tijarat",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/jali-product-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/zakhira-andozi-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/kafir-ke-kapray-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/bechnay-kay-liye-qasam-khana",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/neelami-kay-zariye-maal-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/zameen-thekay-per-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/plot-kharidne-par-aib-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/pack-cheez-kharab-nikli",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/kami-beshi-key-sath-tabadla",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/doosri-shadi-per-jurmana",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/kam-bill-banana",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/thekay-per-zameen-ki-ujrat",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/warenty-ki-shari-hesiyyat",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/shirakat-me-fard-ka-kaam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/chution-ki-tankhah-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/aurat-ka-naukari-krna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/mortgage-per-makan-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/tijarat-me-munafa-ki-had",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/prize-bond-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/jitne-me-chaho-bech-do",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/broker-ka-kharid-kar-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/market-value-say-zaid-batana",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/broker-ka-tap-marna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/dono-say-barokari-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/broker-ko-hata-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/bar-bar-comission-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/gahak-lanay-per-munafa",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/gahak-bhejnay-per-munafa",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/advance-per-kharidari-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/naqad-aur-udhar-qeemat-me-farq",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/zulm-door-karne-ke-kiye-rishwat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/goodwill-ka-ewaz-talab-krna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/khanay-kay-paisay-wusool-krna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/ujrat-kay-bajaye-gift",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/ujrat-tay-kiye-gagair-bal-katwana",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/zameen-bechtay-waqt-shart",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/prize-bond-ki-kharid-o-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/purani-adviyat-new-qeemat-per",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/soday-me-galat-shart",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/market-rate-say-mehngi-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/sonay-kay-badlay-sona-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/online-kharid-o-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/qurbani-ki-khal-ujrat-me-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/insani-baal-ki-kharid-o-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/saving-account-ka-nafa",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/currency-ki-kharid-o-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/kaghzat-ki-kharid-o-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/rate-tay-kiye-bagair-saman-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/wada-kar-kay-na-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/qeemat-e-kharid-galat-batana",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/naqad-kharid-kar-udhar-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/premium-prize-bond",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/gosht-ka-karobar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/nabalig-bacho-ko-chezen-kharidna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/kiraya-ki-cheez-kiraya-per-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/shirkat-e-mal-me-barabar-waqt",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/darzi-kay-pas-bachay-kapray",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/tasaweer-wali-ashya-ki-kharid-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/janwaro-ki-shakal-walay-khilonay",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/sode-ki-qeemat-tay-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/advance-balance-lena",
-  "https://www.fatwaqa.com/ur/fatawa/mahnama-ahkam-e-tijarat/gahak-suits-lenay-na-aye",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/zibah-karte-waqt-janbujh-kar-takbeer-chhorna",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/fasiq-o-fajir-ke-zabeeha-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/zibah-ke-waqt-takbir-aur-wuzu",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/zabah-mein-teen-bar-takbeer-kehne-aur-ba-wazu-hone-ki-shari-haisiyat",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/jhoote-khuda-par-charhane-ke-liye-janwar-zibah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/gonga-shakhs-zibah-karna-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/janwar-halal-karne-ke-liye-kitni-rago-ka-katna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/zibah-ke-waqt-zibah-ki-dua-na-parhi-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/banduk-ki-goli-se-halal-janwar-ka-shikar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/janwar-ko-zibah-karte-waqt-qibla-rukh-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/zibah-ke-waqt-janwar-thanda-hone-se-pehle-uski-gardan-torna",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/musalman-ke-zibah-ke-karne-ke-baad-kafir-churi-chalaye-to-zibah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/murgi-zibah-karne-ke-baad-pait-katne-se-pehle-gardan-alag-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/bangash-machli-aur-marlin-machli-halal-hai-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/janwar-ya-parinde-ke-doodh-pite-bache-ko-zibah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/shikar-kiya-gaya-parinda-zibah-se-pehle-mar-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/kya-goongay-ka-zabiha-halal-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/mar-kar-pakri-jane-wali-machli-halal-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/kya-hindu-ki-zibah-ki-hui-murgi-musalman-kha-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/qareeb-ul-marg-bachre-ko-zibah-karte-waqt-sirf-khoon-nikla-tu-kya-wo-halal-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/ghusal-farz-hone-ki-halat-mein-janwar-zibah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/zibah-karte-waqt-janwar-ki-gardan-kat-jaye-to-us-janwar-ka-ghost-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/napaki-ki-halat-mein-janwar-zibah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/zibah-ke-waqt-allah-ka-naam-lena-bhool-jaye-to-kiya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/aurat-ka-janwar-zibah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/janwar-zibah-karte-waqt-gardan-alag-karna-zibah-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/electric-knife-se-zibah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/stingray-fish-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/machli-ko-zibah-karte-waqt-tasmiya-na-padhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/zibah-ke-waqt-cow-ke-pait-se-nikalne-wale-bache-ko-zibah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/zinda-machhli-ke-tukre-karke-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/bandook-se-shikar-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/kekre-ka-soap-peena-1194",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/haram-cheez-se-bani-dawa-khana-ya-lagana-",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/panje-wala-parind-halal-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/machli-kay-liye-zinda-keray-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/janwaron-ke-halal-hone-ke-bare-mein-fatwa-6245",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/kya-batakh-ka-gosht-khana-halal-hai",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/markhor-halal-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/zibah-karte-waqt-takbir-bhool-gaya",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/musalman-ki-nazar-se-ojhal-gosht-6291-b",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/kya-jhenga-khana-halal-hai-4897",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/octopus-khana-jaiz-ya-nahi-4887",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/seah-aur-mor-halal-hai-ya-haram-5196",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/chamgadar-ke-mutaliq-ahkam-5206",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/zinda-keray-kante-main-charhana-4848",
-  "https://www.fatwaqa.com/ur/fatawa/zibah-aur-shikar/kiya-jungali-ghada-halal-hai-5951",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/salat-ul-tasbeeh-ki-mannat",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/1-lakh-durood-parhne-ki-mannat",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/ela-ke-alfaz-me-qasam",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mannat-ke-alfaz-dohrana",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/likh-kar-ya-allah-ka-naam-liye-baghair-qasam-khana",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kisi-kapre-mein-namaz-na-parhne-ki-qasam",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/bakre-ki-jaga-qeemat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/nafli-roze-mein-mannat-ki-niyat",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/na-baligh-ki-qasam",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/jhooti-qasam-ka-kaffara",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/durood-parhne-ki-mannat-torna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mazar-par-daig-dene-ki-mannat-manna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kisi-ke-ghar-na-jane-ki-qasam",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/shohar-ka-maal-haram-karlena",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/bache-ko-deen-ke-liye-waqf-karne-ki-mannat",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/baat-na-karne-ki-qasam-torna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/behen-bhaiyon-se-qata-taluq-ki-qasam",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/beti-ke-hajj-ki-mannat-aur-dusre-ko-bhejna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mannat-mani-hui-cheez-bhoolna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/ek-mutthi-darhi-rakhne-ki-mannat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mannat-ki-adaigi-se-pehle-inteqal-hone-par-fidiya",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/allah-se-wada-karke-torna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/na-baligh-ki-mannat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kisi-kaam-ke-hone-ki-mannat-mani-lekin-woh-kaam-nahi-hua-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mannat-ke-khane-ki-jaga-raqam-aur-mannat-ke-nafil-baith-kar",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mannat-ke-itikaf-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mannat-manna-ke-beta-paida-huwa-tu-buzurg-ke-mazaar-par-niaz-dun-ga",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/iman-ki-qasam-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/muayyan-din-se-pehle-ya-baad-mannat-ke-nawafil-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/foran-qasam-wapas-le-le-to-qasam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mushtzani-na-karne-ki-qasam-khai-to-humbistari-se-toote-gi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/bike-sell-hone-par-umre-ki-niyat-phr-maqrooz-hua-to-umre-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/bache-ki-bimari-par-gold-ring-sadqe-ki-niyat-se-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/chai-na-peene-ki-qasam-khai-aur-green-tea-pili",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/walid-se-baat-na-karne-ki-qasam-khakar-tod-di-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/beti-ki-qasam-kha-kar-tor-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/apna-maal-apne-upar-par-haram-qarar-dene-se-haram-nahi-hota",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/muqaddas-ashya-quran-kaba-sharif-ki-kasam-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/iman-ki-qasam-khane-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mein-kaam-karun-karun-to-madina-nahi-jaunga-kehne-se-qasam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/umrah-karne-ki-mannat-mani-to-kya-is-ko-poora-karna-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/quran-pak-parhne-ki-mannat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/qasam-kha-kar-wapis-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/allah-ne-chaha-tu-qasam-ke-alfaz",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kya-hifz-e-quran-ki-mannat-ko-pura-karna-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mazar-par-khatm-e-quran-ki-mannat-manna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/bail-qurban-karne-ki-mannat-mani-phir-bail-bech-kar-deeni-talaba-ko-kitaben-dila-di-to",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kya-qasam-ko-khatam-kiya-ja-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/dil-mein-qasam-ke-alfaz-sochne-se-qasam-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/10-hazar-bar-ya-rahman-parhne-ki-mannat-manna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/rah-e-khuda-mein-dene-ki-niyat-se-pala-hua-janwar-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mobile-mein-mojood-quran-pak-par-hath-rakh-kar-qasam-uthane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/doston-ko-khana-khilane-ki-mannat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/khatme-qadria-parhne-ki-mannat-manne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/qasam-ka-kaffara-kitne-miskeeno-ko-dena-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/qarz-wapas-na-karne-ki-qasam-khai-phir-wapas-kar-diya-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/musalsal-roze-rakhne-ki-mannat-man-kar-alag-alag-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/ghalti-se-qasam-ke-alfaz-zaban-se-nikal-gaye-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mannat-ke-nawafil-ke-pehle-qade-mein-durood-pak-aur-dua-parhna-bhool-gaye-tu",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/english-mein-qasam-ke-alfaz-kehne-se-qasam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/bachon-ko-zeher-dene-ki-kasam-khai-to-is-kasam-aur-us-ke-kaffare-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kya-masjid-ki-tameer-mein-hissa-milane-ki-mannat-poori-karna-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/shakarkandi-ki-taraf-ishara-kar-ke-usay-na-khane-ki-qasam-khai-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kya-sakht-majboori-mein-khai-jane-wali-qasam-par-bhi-kaffarah-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/aurat-ne-uzr-ke-sabab-mannat-ka-roza-na-rakha-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/deeni-kaam-karne-ki-mannat-mangne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/ye-kaam-nahi-karon-ga-agar-kiya-tu-10-rakat-namaz-parhonga-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/har-nauchandi-jumerat-ka-roza-rakhne-ki-mannat-mangi-aur-kisi-mahine-na-rakha",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/ek-qasam-kai-martaba-kha-kar-torne-se-kitne-kaffare-lazim-honge",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/maa-ka-beti-ko-qasam-dilane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kabhi-bhi-kalam-na-karne-ki-qasam-kha-kar-torne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/deeni-mehfil-aur-ijtima-mein-shirkat-karne-ki-mannat-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/musalsal-12-din-roze-rakhne-ki-mannat-mani-aur-darmiyan-mein-ek-roza-chordiya",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/qasam-ka-kaffarah-lazim-hone-par-sahib-e-nisab-na-hon-tu-roze-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/marte-waqt-kalma-naseeb-na-ho-kehne-se-qasam-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/bimari-ke-sabab-mannat-ke-roze-na-rakh-saken-to-fidya-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mannat-pori-hone-ke-baad-roze-rakhne-mein-takheer-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kya-nazar-aur-mannat-mangne-se-hadees-mein-mana-kiya-gaya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mannat-ko-2-sharton-par-muallaq-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kaha-ke-ye-dawai-mere-liye-haram-hai-aur-phir-wo-dawa-kha-li",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/advance-mein-mannat-puri-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/nabaligh-bacha-mannat-man-kar-bhool-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/tum-nazar-na-mano-wali-hadees-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/job-lagne-par-mehfil-e-milad-ki-mannat-mangi-tu-mannat-poori-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/qasam-khata-hoon-wale-alfaz-se-qasam-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kya-mannat-ke-bakre-ka-gosht-milad-ki-niyaz-mein-istemal-ho-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/bakra-sadqa-karna-behtar-hai-ya-cash-raqam",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/quran-pak-utha-kar-kisi-kaam-ka-wada-karne-se-qasam-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/phal-na-khane-ki-qasam-khane-wala-agar-phal-khale-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/rozon-se-qasam-ka-kaffara-ada-karne-ki-surat-aur-baad-mein-kabhi-maal-aa-gaya-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kya-ghareeb-shakhs-qasam-ke-kaffare-mein-roze-rakh-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/biwi-se-hambistri-na-karne-ki-qasam-khana",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/marz-se-shifa-yabi-milne-par-rozana-darood-pak-parhne-ki-mannat-manne-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kalma-parh-kar-kisi-kaam-se-rukna-phir-woh-kaam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/nazar-ka-roza-rakha-aur-roze-ke-doran-haiz-aa-gaya",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/raqam-sadqa-karne-ki-mannat-mani-tu-raqam-kahan-kharch-karien",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/karobar-mein-jhooti-ya-sachi-qasam-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mannat-mangne-ke-liye-niyat-kafi-hai-ya-zaban-se-kehna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/ghair-e-khuda-ki-qasam-dene-se-qasam-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/qasam-ke-kaffare-mein-rakhe-jane-wale-rozon-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/ghair-muslim-se-us-ke-batil-mabood-ki-qasam-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/aam-bol-chaal-mein-lafz-qasam-se-bola-jata-hai-is-surat-mein-qasam-ka-kiya-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/badkari-na-karne-par-madine-ki-qasam-khai-aur-badkari-hogye-to-qasam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mard-ke-baal-na-katwane-ki-mannat-manna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/quran-pak-masjid-mein-rakhne-ki-mannat-manna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kisi-halal-cheez-ko-apne-upar-haram-karna-kasam-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/bimari-se-shifa-ke-liye-mannat-manne-ke-baad-ilaj-karwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kiya-mazarat-ki-daig-me-gold-silver-aur-paise-dene-ki-mannat-puri-karna-zarori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/juma-ke-din-mithai-bantne-ki-mannat-manne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kya-kaam-hone-se-pehle-mannat-tabdeel-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/10-saal-baad-mannat-puri-ho-tu-kya-usey-pora-karna-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/khane-ke-qabil-halal-cheez-ko-apne-upar-haram-karne-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/purani-baat-par-jhooti-kasam-khane-ka-kaffara-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/buzurgan-e-deen-ke-liye-nazar-manna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/bheek-maang-kar-sadqa-karne-ki-mannat-manne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/bacha-paida-hone-par-mithai-taqseem-karne-ki-mannat-manna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/khuda-aur-rasool-ki-kasam-ye-kam-nahi-karunga-ye-qasam-kyon-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/nabaligh-bache-ki-qasam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/1-crore-darood-pak-parhne-ki-mannat-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/na-baligh-ki-qasam-khane-aur-torne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/qasam-utha-kar-bhool-gaya-to-kaffare-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kya-dil-me-niyat-karne-se-mannat-ho-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/pak-bibi-ke-mazar-par-jane-ki-mannat-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/quran-ki-qasam-khana-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/bheek-mang-kar-sadqa-karne-ki-mannat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/masjid-ki-tameer-me-raqam-lagane-ki-mannat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/ayat-e-karima-ki-mannat-manne-aur-is-ko-pora-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/quran-e-pak-parhne-ki-mannat-mangna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/quran-ki-qasam-todne-ka-kaffara-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/kasam-uthane-ke-baad-wapas-lene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/allah-ke-ilawa-kisi-aur-ki-qasam-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/nawafil-ki-tadad-muqarrar-kiye-bagair-mannat-mani-to-kitne-nawafil-parhne-honge",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/aik-shakhs-dosre-shakhs-ko-qasam-de-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/gane-na-sunne-ki-qasam-khai-phir-qasam-toot-gai",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/sharai-ahkam-ki-mannat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/rah-e-khuda-ki-mannat-wali-raqam-khandan-ki-kisi-larki-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/qasam-ke-kaffare-mein-kitabain-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/qasm-todne-ka-kaffara",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/likh-kar-qasam-uthana",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/na-baligh-bache-ka-qasam-torna",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mannat-ke-100-nawafil-1609",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/mannat-kay-nawafil-aik-hee-waqt",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/masjid-me-nawafil-parhne-ki-mannat-4892",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/qasam-khai-ghar-nahi-jaonga-4886",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/apni-kamai-masjid-mein-donga-6158",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/whatsapp-message-per-qasam-0102",
-  "https://www.fatwaqa.com/ur/fatawa/qasam-aur-mannat/quran-pak-ka-halaf-uthana-873",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/bhanji-ki-aulad-mehram-ghair-mehram",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-ke-baad-der-se-rukhsati",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/benamazi-hone-se-nikah-par-asar",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-ke-liye-ehem-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/sone-ki-chain-mahr-mein-likhwana",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/fotgi-ke-dinon-me-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/taya-zad-behan-ki-beti",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/hindu-ya-sikh-aurat-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/pehle-shohar-ki-beti-ka-dusre-shohar-ke-bhai-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/rabi-ul-awal-mien-shadi",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/beti-ki-saas-se-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/walida-ke-mamu-ki-beti-se-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/haq-mehar-ki-shari-aur-sunnat-miqdar",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/mehr-ke-baghair-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/isai-ya-yahudi-aurat-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shadi-ki-dawat-ka-behtareen-waqt",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-haq-mehr-ki-raqam-barkat-wali-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/dada-ke-chacha-ke-pote-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shahwat-se-aurat-ko-chhune-par-uski-behan-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/talaq-yafta-mami-se-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/souteli-bhanji-ki-beti-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/2-soteli-behno-ko-nikah-mein-jama-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/saalon-baad-mehar-ki-adaigi",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ke-badan-ko-choomna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/jahez-ki-shari-hesiyat",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-aur-us-ki-maa-shareek-behan-se-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/esai-aurat-musalman-ho-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/zimmi-aur-kitabiya-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-6-mah-baad-paida-hone-wala-bacha-jaiz-tasawwur-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/bete-ke-susar-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/baap-ke-chacha-zad-bhai-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/rishta-karne-ka-mayar",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/larki-walon-ka-paise-ki-demand-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/rukhsati-se-pehle-biwi-ka-nafqa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ki-bhanji-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/walid-ki-phuphi-zaad-behen-ki-nawasi-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/do-eidon-ke-darmiyan-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ki-wafat-ke-baad-uski-behen-se-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/sali-se-zina-karne-se-nikah-toote-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/khala-ke-bete-ki-beti-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/taya-ki-poti-ya-nawasi-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/iddat-mein-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/khatna-na-hua-ho-to-kya-kya-nikah-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ke-inteqal-ke-baad-biwi-ki-khala-phuphi-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikkah-register-nahi-karwaya-tu-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/saas-se-zina-karne-se-biwi-haram-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/bhai-ke-pote-ki-shadi-dusre-bhai-ki-beti-se-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/makhsoos-muddat-ke-liye-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/walima-humbistari-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-nama-hajj-karwane-ki-shart",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/hambistari-na-karne-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/meher-ki-kam-se-kam-miqdar-se-bhi-kam-muqarrar-kiya-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shadi-ke-liye-zaicha-horoscopr-banwana",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/napaki-ki-halat-mein-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-kisi-mahine-mein-shadi-mana-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/haq-mehar-kitna-ho-jisse-rishta-ache-andaz-mein-chal-saken",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/ek-waqt-mein-nikah-o-walima-karne-se-kya-walima-ada-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/ek-waqt-mein-4-se-zyada-shadian-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-ke-liye-aurat-kharidna-ya-waldain-ko-pese-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/apni-sauteli-khala-se-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/walima-ka-gosht-aur-walima-ka-maqam",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/bhanje-ka-beta-khala-ke-liye-mahram-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/mehar-ada-kiye-bagair-shohar-inteqal-karjaye-to-mehar-ada-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/hurmat-e-musaharat-sabit-hone-ki-kya-umar-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/musalman-aurat-ka-ghair-muslim-mard-se-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/haq-mehar-sadqa-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-nikah-tamam-ambiya-e-kiram-ki-sunnat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/hadees-nikah-ka-ailan-karo-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/islam-mein-love-marriage-jaiz-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/ghair-shadi-shuda-shakhs-nikah-parha-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/goonge-shakhs-ke-nikah-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-karwate-waqt-kalima-tayyiba-aur-dua-parhane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/halat-e-nifas-mein-biwi-ke-pichle-maqam-main-humbistari-karne-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/mehr-muajjal-ki-adaigi-se-pehle-shohar-aur-biwi-ke-milap-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/baap-ke-talak-dene-ke-baad-bete-ka-sauteli-maa-se-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/namaz-ki-pabandi-ko-haq-meher-muqarrar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ke-inteqal-ke-baad-saas-se-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nana-ke-bhai-ki-beti-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/sautele-behan-bhai-ki-aulad-ka-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-nikah-ki-pehli-raat-humbistari-karna-lazmi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/soteli-maa-ke-bhai-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-2-sagi-behno-ka-nikah-baap-bete-se-ho-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-ke-baad-rukhsati-se-pehle-nafqe-ka-taqaza-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/apne-bete-ki-razai-behan-se-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/lepalak-larki-se-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-biwi-ki-dadi-nani-bhi-shohar-ke-liye-mehrama-hoti-hain",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ke-faut-hone-se-nikah-toot-jata-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shadi-karte-hue-zaat-dekhne-ka-islam-mein-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/mangni-ki-shari-haisiyat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-ka-khutba-khamoshi-se-na-sunna-gunah-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/islam-mein-nikah-ki-ahmiyat",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/taya-ki-beti-ya-taya-ki-nawasi-se-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-biwi-ko-apne-ghar-walon-ke-sath-rakhna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/mah-e-zul-hijjah-ke-pehle-10-dino-mein-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-jahez-mein-larki-ko-tamba-aur-peetal-dena-sunnat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ka-galti-se-shohar-ko-bhai-ya-beta-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-shawwal-ya-zilqad-mein-shadi-karna-mana-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/apni-maa-ke-sage-mamo-ki-beti-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/maa-shareek-behan-ki-beti-se-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/apni-saas-ki-behan-se-shadi-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/barat-ke-2-din-baad-valima-karne-se-valima-ki-sunnat-ada-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/zani-aur-zania-ki-aulad-ka-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/chothi-biwi-ko-talak-dene-ke-baad-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/meher-ki-raqam-ki-sharai-haisiyat-aur-larki-ka-apni-marzi-se-raqam-likhwana",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/dulha-dulhan-ke-walid-aur-bhai-ka-nikah-ke-andar-gawah-banna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-shadi-ki-pehli-raat-humbistari-karna-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ka-shohar-se-alag-ghar-ka-mutalba-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/operation-karwa-kar-bacha-dani-nikalwana-ya-bacha-dani-ka-muh-band-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-hashmi-qureshi-khandan-mein-sayeda-ka-nikah-ho-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/fitnon-mein-mubtala-hone-ke-andeshe-se-aulad-na-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/talak-ya-khula-liye-baghair-aurat-ka-kisi-aur-se-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-sotele-bhai-behan-aapas-mein-mehram-hote-hain",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/wali-ke-baghair-nikah-nahi-is-hadees-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/razai-bhanje-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/razai-behen-ki-sagi-behen-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shohar-ki-wafat-ke-baad-dewar-se-shadi-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shadi-ke-baad-ek-baar-bhi-humbistari-na-ki-jaye-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shohar-ka-biwi-ke-mehr-se-kharidi-hui-cheez-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/soteli-khala-se-shadi-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-mein-mutlaq-mehr-zikr-kiya-tu-kya-nikah-durust-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-makhsoos-ayam-main-larki-ka-nikah-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/apni-samdhan-yani-bete-ya-beti-ki-saas-se-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-nikah-karna-barkat-ka-sabab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-jab-bhi-hambistri-ki-jaye-tu-haq-mehar-dena-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-ka-khutba-kab-padhna-chaiye",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/larki-ke-nikah-ke-waqt-waldiyat-mein-palne-wale-ka-naam-lena",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/razai-bhai-ki-bhatiji-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nilkah-fasid-ko-faskh-karne-aur-is-ki-iddat-ke-ahkamat",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ke-piche-se-jima-karne-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/sali-se-zina-kar-liya-tu-kya-biwi-haram-ho-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-aur-us-ki-bhanji-ki-beti-ko-nikah-mein-jama-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/mehar-mein-jo-cheez-muqarrar-hui-us-ke-badle-doosri-cheez-dena",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/rukhsati-se-pehle-judai-ho-jaye-tu-haq-mehar-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/tajdeed-nikah-mein-gawah-hona-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/qamar-dar-aqrab-ki-tareekhon-mein-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ki-mojudgi-mein-bewah-sali-se-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/gair-qaum-mein-shadi-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ki-beti-se-shadi-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/baap-bete-ka-2-sagi-behnon-se-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nani-ka-doodh-peene-wale-khala-zaad-larka-larki-ka-aapas-mein-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ki-sagi-bhanji-se-zina-karne-se-nikah-par-asar-padega-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/walidain-ki-marzi-ke-bagair-shadi-karne-par-walidain-ka-larki-se-taaluq-khatam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/ammi-ki-khala-ke-shohar-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shadi-se-pehle-aurat-ki-sifat-kaise-maloom-ki-jayen-hadees-ki-sharh",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/aurat-ka-apne-shohar-ko-baap-keh-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/sage-bhanje-ki-beti-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shohar-ka-mehr-maaf-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/jis-aurat-se-zina-kiya-uski-beti-se-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/syed-mard-ka-ghair-syeda-se-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shohar-ke-inteqaal-ke-baad-umar-mein-chote-devar-se-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-soteli-bhatiji-ki-beti-mehram-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/safar-ke-mahine-mein-mangni-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/hazrat-khadijah-ka-haq-mehr-kitna-tha",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/waldain-ka-beti-ki-shadi-uski-razamandi-ke-baghair-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-mein-gawah-zaroori-hain-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/razai-bhatiji-se-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/taya-ki-beti-ki-beti-se-shadi-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shadi-shuda-aurat-ka-zina-ke-baad-zani-se-shadi-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/aurat-bakhushi-haq-mehar-ki-raqam-maaf-karde-to-us-ke-baad-us-raqam-ka-dobara-mutalba-kar-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-durood-e-pak-haq-meher-ban-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-mamo-ki-poti-se-nikah-ho-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-razai-khala-se-nikah-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/jis-larki-ne-chote-bhai-ke-sath-walida-ka-doodh-piya-ho-us-se-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/aurat-ke-makhsoos-ayam-periods-mein-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/sautele-baap-ke-bhai-se-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/bewah-chachi-se-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-miyan-biwi-ka-ek-dosre-ki-sharmgah-dekhna-andha-hone-ka-sabab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/wh-5219-dadi-aur-nani-ki-behnain-maharim-hain-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/apni-khala-ki-beti-se-niikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/baap-ki-chacha-zaad-behen-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-khawan-ka-aalim-hona-zaroori-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/dada-ke-bhai-ki-beti-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/sagi-maa-ke-mamu-ki-beti-se-nikah-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-ke-gawah-phone-par-hon-tu-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-syeda-ka-nikah-ghair-syed-se-ho-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/bhanji-ki-beti-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/razai-bhai-ki-behen-se-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/aurat-ko-mahr-ke-mutalbe-ka-ikhtiyar-kab-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/12-saal-ka-larka-nikah-ka-gawah-ban-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/ammi-ke-mamu-ki-beti-se-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/2-biwiyon-ke-nafqe-ke-hawale-se-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/jis-aurat-se-zina-kiya-phir-usi-aurat-se-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-hamla-aurat-se-nikah-ho-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/mamu-ya-chacha-ki-bewa-se-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/maroof-naam-aur-aqiqa-walay-naam-mein-farq-ho-to-nikah-kis-naam-se-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-khutba-ya-dua-ke-baghair-nikah-ho-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-nikah-mein-sirf-aurton-ko-gawah-bana-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/aik-maa-se-paida-hone-wale-bete-aur-beti-ke-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-sasur-apni-bahu-se-nikah-kar-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/cousin-ki-larki-se-shadi-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/soteli-maa-ki-beti-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/larki-ke-baap-ka-meher-maaf-karna-ya-larki-ka-marte-waqt-meher-maaf-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/hazrat-fatima-ka-haq-meher-kitna-rakha-gaya-tha",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/aurat-par-shohar-aur-walid-me-se-ziada-haq-kis-ka-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shohar-ka-biwi-ko-cigarette-peene-se-mana-karne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/bilawaja-biwi-aur-bachon-ka-nan-o-nafqa-ada-na-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-alvi-shakhs-syeda-ka-kufw-ho-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-ke-ilawa-zina-se-bachney-ka-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-jinnat-se-insano-ka-nikah-ho-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/masjid-me-nikkah-parhane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ki-bhatiji-se-nikah-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-cousin-ki-beti-se-nikah-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/sauteli-maa-ki-behan-se-nikah-ka-hukam",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-zina-karne-se-nikah-toot-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/khala-ke-nawase-se-shadi",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/miya-biwi-ka-aik-dosre-ko-bhai-behan-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/par-dada-ke-bhai-ki-par-nawasi-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-nikah-ke-liye-wazu-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-bahu-ka-apne-sautele-susar-se-parda-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/alag-alag-mulk-me-rehne-walon-ke-nikah-ka-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/chachi-ke-bhai-se-larki-ka-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/pehle-shohar-aur-pehli-biwi-ki-aulad-ka-apas-me-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/saas-se-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/rukhsati-se-pehle-hone-wale-bache-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shohar-biwi-ka-ek-doosre-ko-behan-bhai-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/musalman-aurat-ka-kafir-mard-se-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/meher-dene-se-pehle-shohar-ka-inteqal-ho-jaye-tu-meher-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-mehar-me-muqarrar-shuda-plot-muaf-karne-se-muaf-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/maa-ki-cousin-ki-nawasi-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/chacha-aur-bhatiji-ke-nikah-ka-kukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/bhabhi-ke-bhai-se-beti-ka-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/sali-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/devar-aur-jeth-ke-larkon-se-parde-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/dulhe-ka-sehra-bandhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/dadi-ke-bhai-ki-beti-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/masjid-me-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/maa-baap-mein-aik-syed-ho-to-aulad-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-ki-aik-martaba-ijazat-lena",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-aurat-shohar-ki-ijazat-ke-baghir-apne-waldain-se-milne-jaa-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shohar-ki-ijazat-ke-bagair-waldain-se-milne-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/2-behno-ko-nikah-me-ikhatte-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/bivi-ko-jo-ghar-mehar-diya-shohar-ka-usme-rehaish-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/tajdeed-e-nikah-ki-tafseel-aur-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/bhanje-ka-apni-talaq-yafta-mumani-se-nikkah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/bachon-ki-pedaish-me-waqfa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biivi-ke-huqooq-ada-naa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/miya-biwi-ke-dor-rehne-se-talaq-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/mehar-ki-kamaz-kam-miqdar",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/jin-kapron-mein-jima-humbistari-ki-ghusl-ke-baad-wohi-pehnana",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/maa-baap-ki-marzi-ke-bagair-shadi-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kya-safar-ke-mahine-mein-shadi-karna-mana-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/musalman-ka-hindu-aurat-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/humbistari-ka-islami-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/walida-ki-cousin-se-shadi-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ke-inteqal-ke-baad-iske-mehar-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/haq-mahr-me-muqarrar-plot-ke-badle-raqam-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/walima-shadi-ke-baad-kab-tak-ho-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/fake-nikah-nama-fill-karne-se-nikah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/mahr-e-fatimi-muqarrar-karne-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/maan-ke-cousin-se-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/haq-mehar-kitna-ho",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/ijab-qabool-ke-baad-mehar-mein-izafa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ki-chhati-muh-me-lena-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/phophi-bhatiji-aik-nikah-mein",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/zina-ke-hamal-wali-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/valima-bare-pemane-par-na-ho",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ko-maa-behan-beti-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/bara-waleema-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/muslim-mard-ka-kitabiya-aurat-se-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/phuphi-bhatiji-say-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-mehr-muaf-karday-to",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/rukhsati-me-takheer",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/waqt-e-nikah-kalma-sunna",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/mehar-ki-kam-aur-ziyada-miqdar-1041",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/haqeeqi-behan-ki-razai-behan-se-nikah-12233",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/mehr-me-rupay-ki-qadr-ka-itibar",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/sauteli-behan-ke-bete-ki-beti-se-nikah-6396",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/sauteli-walida-ki-behan-se-nikah-jaiz-hai-6385",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/esai-aurat-islam-qabool-kar-le-to-kya-hukum-hai-6420",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-ke-inteqal-ke-baade-bhanji-se-nikah-5013",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/razai-behan-se-nikah-5088",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/razai-bhanji-se-nikah-karna-durust-hai-1813",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/musalman-aurat-ka-ahle-kitab-se-nikah-4996",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/musalman-mard-esai-aurat-se-nikah-karsakta-hai-4995",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/sauteli-maa-ki-behan-se-nikah-4918",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/nikah-kay-badlay-raqam-ka-mutalba",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/shadi-ka-nyota-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/court-marriage-karna-kaisa-6101",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/net-ya-phone-ke-zariye-nikah-5246",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/baligh-beti-ka-shafqat-se-bosa-lena-5205",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/zoja-ki-behan-se-nikah-0123",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/biwi-say-3-mah-door-rehna-0076",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/haqiqi-walid-ka-name-lena-1911",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/kiya-ek-sath-teen-shadiyon-ka-program-kar-sakte-hain-11953-1",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/chacha-zad-behan-se-nikah-863",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/zoja-ki-bhanji-se-dosri-shadi-871",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/sagi-behno-se-nikah-ka-hukum-6028-5",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/5-sal-ki-bachi-ko-doodh-pilaya-usay-nikah-6028-4",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/razai-behan-se-nikah-6069",
-  "https://www.fatwaqa.com/ur/fatawa/nikah/muharram-main-nikah-6079",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/alag-rehne-ke-baad-talak",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/halala-aur-iski-sharait-kya-hain",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/talaq-ke-baad-mehar-ka-mutalba",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/talaq-raji-ke-baad-ruju-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/mehar-ki-adaigi-se-pehle-talaq-hojaye-to-kitna-mehar-milega",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/talaq-e-raji-ke-baad-ruju-karne-ka-tareeqa",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/haiz-ki-halat-mein-talaq-dena-kyun-mana-hai",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/talaq-ke-baad-bache-kiske-paas-rahenge",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/jo-bad-akhlaq-biwi-ko-talaq-na-de-to-kya-uski-dua-qubool-nahi-hoti",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/khula-ke-baad-shohar-ka-baghair-nikah-ke-zubani-ruju-karna",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/kya-stamp-likhne-wale-ek-sath-3-talaq-ka-stamp-likh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/nifas-ki-halat-mein-talaq-dena-kaisa-iddat-ka-kya-hukum-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/shohar-talaq-ke-baad-ruju-kare-to-kya-aurat-ka-qubool-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/shohar-dusre-mulk-se-talaq-de-to-kya-talaq-ho-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/khud-talaq-lene-ki-soorat-mein-iddat-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/shohar-se-judai-ke-baad-bhi-rishta-musaharat-qaim-rehta-hai-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/kya-talaq-raji-iddat-ke-baad-3-talak-mein-badal-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/aurat-talaq-ka-mutalba-kare-to-mehar-dena-lazim-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/kya-mazak-mein-bhi-zihar-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/miyan-biwi-mein-judai-ke-baad-jahez-kis-ka-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/rukhsati-se-pehle-talak-ho-jaye-tu-haq-mehr-poora-dena-hoga-ya-adha",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/kya-miyan-biwi-ke-kuch-arsa-door-rehne-se-talak-ho-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/aurat-agar-ruju-ke-alfaz-keh-de-tu-kya-rujo-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/talaq-ka-jhoota-iqrar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/kya-talaq-dete-waqt-biwi-ka-samne-hona-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/islam-mein-khula-ka-haqeeqi-concept-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/biwi-ko-haiz-ki-halat-mein-3-talaq-dena",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/agar-kabhi-to-meri-ijazat-ke-baghir-maikay-gai-to-tuje-3-talaq-biwi-ko-ye-alfaz-boly-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/hamla-pragnant-aurat-ko-talaq-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/mian-biwi-ka-15-saal-ek-doosre-se-alag-rehne-ke-baad-ek-sath-safar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/jise-jima-humbistri-par-qudrat-na-ho-us-ke-liye-talaq-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/aurat-agar-shohar-ko-talaq-de-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/khula-kya-hota-hai-khula-ke-ahkam-o-masail-kya-hain",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/aik-talaq-ke-bad-dosri-talaq-ka-hona-talaq-and-related-issues",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/aurat-ko-talaq-ka-ilm-na-ho-to-talaq-hojaye-gi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/talaq-ki-kasam-khana-ya-khilana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/biwi-ke-kalma-e-kufr-bolne-ke-baad-biwi-ko-talaq-dena",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/mazaaq-mein-talaq-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/jis-aurat-ka-zehni-tawazun-durust-na-ho-us-is-ki-iddat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/jis-haiz-me-talaq-di-wo-iddat-me-shumar-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/biwi-ko-gusse-me-aazad-ke-alfaz-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/talaq-de-dunga-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/ek-sath-teen-talaqon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/haiz-ki-halat-me-talaq-dena",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/shoher-na-talq-de-na-sath-rakhe-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/talaq-ke-baad-jahez-wapis-lena-1390",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/talaq-ke-bare-mein-ghalat-fehmiyan-6750",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/ziyada-mehar-ka-mutalba-karna-5010",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/walid-ke-hote-howe-mamu-ko-parwarish-ka-haq-983",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/3-talaqon-ke-bawajood-sath-rehna-4879",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/jahez-ka-saman-kiska-hai",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/talaq-ke-baad-bachi-kis-ke-pas-rahe-gi-12150",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/sote-mein-talaq-dena-6090",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/dur-ho-jao-kehne-se-talaq-hojati-hai-5243",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/miya-biwi-mein-ek-saal-tak-judai-4823",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/talaq-ke-masail-11967",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/tumhain-chor-doon-ga-talaq-waqih-hojayegi-849",
-  "https://www.fatwaqa.com/ur/fatawa/talaq/2-talaq-kay-baad-ruju-6077",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/razat-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/bachi-ko-chammach-se-aurat-ka-doodh-pilane-se-razaat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/kaan-mein-doodh-dalne-se-hurmat-e-razaat-sabit-nahi-hoti",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/bache-ko-kab-tak-doodh-pilana-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/bacha-kitna-doodh-piye-to-hurmat-e-razaat-sabit-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/le-palak-ko-bhanje-ki-biwi-ne-doodh-pilaya-to-mamu-ke-liye-razaat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/agar-bacha-aurat-ka-dawa-se-utarne-wala-doodh-pee-le-to-razaat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/bache-ko-pistan-ka-pani-pilane-se-razaat-sabit-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/aurat-ka-lepalak-bache-ko-apni-behan-ka-doodh-pilakar-mehram-banana",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/kya-razai-baap-ki-doosri-biwi-ki-aulad-mehram-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/razai-khala-zaad-behan-se-parda-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/pehle-shohar-ke-bete-ko-dusre-shohar-ke-sabab-utarne-wala-doodh-pilana",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/behen-ki-beti-ko-doodh-pilane-ke-baad-us-se-apne-bete-ka-nikah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/3-saal-ke-god-liye-bache-ko-doodh-pilane-se-razaat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/bache-ko-doodh-pilane-mein-shamsi-mahine-ka-ittibar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/bachi-goud-lene-ke-shari-ahkam-5187",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/doodh-pilanay-ki-muddat",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/walid-kay-bajaye-kisi-aur-ka-name-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/razaat/bachay-gaod-denay-ka-masla",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-shohar-ke-ghar-guzarne-ki-waja",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-mein-khushbu-wala-sabun-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/nifas-mein-talaq-hone-par-iddat",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/haiz-ke-sath-talaq-ki-iddat",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-mein-ghar-ke-kam-bayan-aur-parhana",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/shohar-ki-wasiyat-karda-jaga-par-iddat",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/hajj-ya-umrah-mein-shohar-ka-inteqal",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-mein-mangni-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-mein-apni-marzi-se-kami-beshi-karna",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/khula-ke-baad-iddat",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/budhi-aurat-ke-liye-iddat-e-wafat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/jiski-mahwari-ki-muddat-kafi-lambi-ho-wo-iddat-kaise-guzare",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-mein-ilm-e-deen-seekhne-ke-liye-ghar-se-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/aurat-ka-iddat-ke-doran-kiraye-ka-ghar-tabdeel-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/biwi-ke-intiqal-ke-baad-mard-par-iddat-wajib-kyun-nahi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/shohar-ke-2-ghar-hon-to-biwi-iddat-kis-ghar-mein-guzare",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/teesre-haiz-mein-iddat-kab-mukammal-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-nikah-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/doran-e-iddat-waldain-ke-ghar-se-shohar-ke-ghar-jana",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-wali-aurat-ka-eid-milne-ke-liye-ghar-se-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/shohar-ne-marne-se-pehle-iddat-na-karne-ki-wasiyat-ki-ho-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/bewa-aurat-ke-liye-kanch-ki-chudi-pehenne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-ki-halat-mein-surma-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/mehar-ki-adaigi-se-pehle-khula-ho-jaye-to-iddat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-ke-mutaliq-sawal-jawab",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/aurat-ka-doran-e-iddat-qaribi-rishtedar-ke-janaze-mein-jana",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-e-wafat-ke-baad-aurat-ka-zewar-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/doran-e-iddat-itikaf-mein-baithna",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-e-wafat-wajib-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-ke-doran-vote-cast-karna",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/kya-namard-ki-aurat-par-bhi-talak-ki-iddat-lazim-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/wafat-ki-iddat-kab-se-shuru-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/kay-khula-ki-iddat-mein-bhi-shohar-par-nafqah-lazim-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-mein-phone-pe-baat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/wafat-ki-iddat-mein-aurat-ka-nokri-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-mein-40-din-ke-baad-naye-kapde-pehenna",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/shohar-ke-inteqal-ke-waqt-biwi-rishtedar-ke-ghar-ho-to-iddat-kahan-guzare",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/shohar-ke-2-makan-hon-tu-aurat-wafat-ki-iddat-kahan-guzare",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/aurat-iddat-ke-doran-apne-damad-se-phone-par-baat-kar-sakti-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-ke-doran-umrah-par-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/3-talak-ke-baad-kiye-jane-wale-nikah-ki-iddat-kahan-guzare",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/doran-e-iddat-janaze-ke-sath-thori-door-jane-par-kya-iddat-toot-jayegi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-ke-doran-sautele-bete-se-parde-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/bewah-ke-zewar-torne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/wafat-ki-iddart-mein-beti-ki-shadi-mein-shirkat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/rukhsati-se-pehle-hi-shohar-ka-inteqal-ho-jaye-to-kya-phir-bhi-iddat-e-wafat-lazim-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/shohar-ke-inteqal-ke-waqt-biwi-bete-ke-ghar-ho-tu-iddat-kahan-guzare-gi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/bewah-agar-hamila-ho-tu-us-ki-iddat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-ke-doran-ghar-ke-kaam-kaaj-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-ke-doran-surkh-libas-pehnna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-ke-doran-khushboodar-sabun-ya-shampoo-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-mein-paseene-ki-boo-khatam-karne-ke-liye-perfume-ya-body-spray-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-mein-dark-brown-khizab-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/aurat-ka-iddat-mein-naye-kapre-pehenna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/kya-aurat-iddat-ke-doran-hajj-karne-ja-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/shohar-ke-marne-par-biwi-ka-chooriyan-torne-ya-utarne-ki-shari-haisiyat",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/kya-90-saal-ki-budhi-aurat-par-bhi-wafat-ki-iddat-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-ke-doran-aurat-ko-sar-me-tail-lagane-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-me-doctor-ke-pas-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/do-mah-ka-hamal-saqit-hone-par-iddat-e-wafat-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/wafaat-ki-iddat-me-tail-lagana-thk-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/bewa-ka-saas-ke-jhagre-ki-wajah-se-baqiya-iddat-apne-ghar-me-guzarna",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-e-wafat-ka-hisab-lagane-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/wafat-ki-iddat-kis-waqt-se-shuru-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/aurat-iddat-me-madani-channel-dekh-sakti-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/doran-iddat-deeni-ijtima-mein-jana",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/talaq-se-pehle-taweel-arsa-doori-rahe-to-iddat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-kahan-guzarni-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/talaq-ki-iddat-kitni-hai",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-e-wafat-mein-beti-ke-ghar-paidaish-ki-rasam-mein-shirkat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/talaq-ki-iddat-wali-aurat-ke-liye-doran-e-iddat-nokri-ke-liye-ghar-se-nikalna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/aurat-ka-iddat-kin-kin-se-parda-hai-kya-aasman-se-bhi-parda-karen-gi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/dorane-iddat-nokri-par-jana",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/aurat-ka-iddat-me-walid-ke-teeje-ke-baad-shrikat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-mein-hamal-saqit-hona",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-e-wafat-mein-rangeen-kapre-aur-kangi",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/doran-e-eddat-khatam-me-shirkat",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-mein-long-ya-baliyan-pehana-1695",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/wafat-ki-iddat-ke-ahkam-14253",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-e-wafat-ki-muddat-5072",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/hamla-aurat-ki-iddat-ka-nafqa-12217",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/talaq-yafta-aur-bewa-aurat-ki-iddat-12236",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-ki-gair-shari-wasiyyat",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/hamla-aurat-ki-iddat-kab-tak-11964",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/iddat-ka-masla-847",
-  "https://www.fatwaqa.com/ur/fatawa/iddat/jis-ko-mahwari-na-ati-ho-uski-iddat-kya-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/gift-de-kar-sell-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/online-shopping-me-extra-saman",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/poultry-farm-ka-business",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/udhar-khareed-kar-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kekre-ki-khareed-o-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/dulha-ka-haar-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/birth-day-cards-karobar",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/siyah-khizab-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/soodi-agreement-par-kharidari",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/qist-mein-kami-karne-par-qeemat-barhana",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/mitti-ya-sona-check-kar-lein-keh-kar-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/prize-bond-ka-inam",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/electric-shaving-machine-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/qabza-kiye-baghair-delivery-karwa-dena",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/masjid-mein-khareed-o-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/tasveer-wali-anguthi-ya-joote-ki-khareed-o-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/poore-paise-dene-se-pehle-plot-aage-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/apni-product-par-dusri-company-ka-label-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/online-shoping-par-milne-wale-discount-coupan-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/murdar-janwar-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/half-payment-de-kar-order-par-cheez-tayar-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/zameen-bech-kar-karobar-karna-hadees-pak-ki-sharah",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/speaker-bechne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/qist-na-dene-par-dukan-wapas-ya-qist-ke-sath-kiraya",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/apna-maal-moakkil-ko-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/bechi-hui-cheez-qeemat-lene-se-pehle-kharidna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/khiyar-e-shart-ki-tareef-muddat-aur-asbab",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/khiyar-e-tayeen-ki-tareef-muddat-aur-asbab",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/khiyare-aib-aur-iski-muddat",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/khiyar-e-ruyat-aur-iski-muddat",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/commission-ki-najaiz-soorat",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/broker-ka-demand-se-zyada-mein-cheez-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/discount-card-kharidne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/wapsi-ki-shart-par-cheez-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/wakeel-ka-bagair-bataye-profit-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/soda-cancel-karne-par-bayana-ki-raqam-zabt-karna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/udhar-soda-khatam-karne-par-qeemat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kam-qeemat-cheez-kharid-kar-mehngi-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/plot-kharidne-par-token-money-ke-tor-par-advance-dena",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/farmi-makhi-ka-shehad-jungli-makhi-ka-bata-kar-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/supplier-ka-dukandar-ko-paise-dena-ke-kisi-aur-ka-maal-na-rakhe",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/ghair-muslim-dukandar-se-koi-cheez-kharidna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/mobile-aur-is-ki-accessories-ki-khareed-o-farokht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/new-vehicles-ki-booking-ke-time-rate-fix-na-hone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/bai-fasid-ke-zariye-hasil-hone-wali-raqam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/brokers-ka-demand-se-zyada-rate-lena-aur-khud-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/fina-e-masjid-mein-kharid-o-farokht-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kam-carat-sone-ko-zyada-carat-wale-sone-ke-badle-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/cosmetics-ka-karobar-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/gari-kharidne-ke-baad-defect-ka-pata-chala-tu-wapsi-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/udhar-saman-mein-dair-hone-par-zyada-paise-lene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/mobile-ka-karobar-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/cheez-bechne-ke-baad-seller-ka-keemat-me-kami-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/khare-pani-ko-filter-karke-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/sone-ka-karobar-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/ghair-muslim-se-qurbani-ka-janwar-kharidna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/online-order-lene-ke-baad-frozen-item-tayyar-karke-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/online-shopping-karte-waqt-card-payment-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/aage-bechne-ke-liye-qiston-par-cheez-kharidna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/dosre-city-mein-mojood-saman-par-qabza-kis-tarah-ho-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/cheez-ke-upar-likhi-hui-qeemat-se-zyada-qeemat-mein-cheez-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/builder-ka-mazeed-raqam-talab-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/la-ilmi-ki-wajah-se-bai-fasid-karne-par-profit-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/qiston-per-plot-kharidna-aur-qist-late-hone-par-fine-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/ganay-ke-zariye-advertising-karwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/raqam-advance-de-kar-thori-thori-kharidari-karte-rehna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/patang-urane-banane-aur-bechne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/esal-e-sawab-bechne-ka-karobar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/motorcycle-naqd-mein-sasti-kharid-kar-qiston-par-mehngi-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/deal-hone-ke-baad-khaam-maal-ki-qeemat-barhne-ki-wajah-se-ziyada-qeemat-ka-mutalba-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/hospital-se-bacha-le-kar-palna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/hundi-ke-zariye-raqam-bhejna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/qabza-se-pehle-cheez-agay-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/ghar-ki-bachi-hui-roti-bechne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/zewar-banwane-ke-liye-kuch-raqam-advance-aur-baqya-raqam-baad-mein-dena",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/mitti-ke-bartan-ki-kharid-o-farokht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/private-bank-ke-bonds-ka-nafa-soodi-hone-ki-soorat",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/installments-par-plot-ki-kharid-o-farokht-ke-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/darzi-ka-istisna-ke-tor-par-suit-banakar-dena",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/mareez-ka-ilaj-karwane-ke-liye-gurda-bechne-ki-sharai-haisiyat",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/cheez-kharidne-ka-wada-kiya-magar-baad-mein-kharidte-waqt-pasand-na-aai-tu",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kaghaz-par-likha-hua-formula-bechne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/website-par-najaiz-product-lagane-ka-gunah-developer-ko-bhi-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/qiston-par-gari-ya-motorcycle-lene-aur-insurance-karwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/mealworm-larva-keeron-ki-khareed-o-farokht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/achi-quality-aur-low-quality-ka-chawal-mix-karke-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/sirf-tasweerain-share-kar-ke-cheez-bechne-ka-jaiz-tareeqa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/manquli-moveable-cheez-ko-qabzay-se-pehle-bechna-gunah-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/steel-mills-aur-thekedaron-ke-sarya-khridne-ki-ek-najaiz-surat",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/udhar-bechi-hui-cheez-ko-kam-qeemat-mein-kharidna-kuyn-najaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/patakhe-aur-atishbazi-ka-saman-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/murde-ki-rakh-ke-liye-istemal-hone-wali-bottle-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/15-din-ke-udhar-par-cheez-bechi-tu-payment-late-hone-par-zaid-raqam-lena",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/pani-ki-bottle-kharid-kar-bechna-aur-pani-mein-limo-nichor-kar-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/zameen-builder-ki-milkiyat-mein-na-ho-tu-plot-ya-flat-ki-booking-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/qiston-par-mobile-kharid-kar-usi-dukandar-ko-naqd-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/digital-prize-bond-kharidna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/europe-mein-health-insurance-karana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kya-wakeel-ka-qabza-mokil-ka-qabza-shumar-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/online-cheez-dekh-kar-wapsi-na-hone-ki-shart-ke-sath-khareedna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/sood-ki-raqam-ka-kya-kiya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/purane-rate-ki-rakhi-hui-cheez-ko-new-rate-par-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/mardana-locket-ya-anguthi-online-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/daraz-app-par-review-barhane-ke-liye-product-ranking-karwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/electrician-ka-kam-paison-mein-cheez-kharid-kar-ziyada-bill-banwana",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/laboratory-mein-gold-ka-test-karne-ke-baad-kharidari-ki-mukhtalif-soraton-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/advance-security-ki-shart-aur-dairy-association-ke-muqarrar-karda-rates-par-doodh-ki-khareed-o-farokht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/billi-ki-kharid-o-farokht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/khareed-o-farokht-mein-ye-shart-lagana-qist-teen-months-tak-ada-naa-ki-to-soda-cancel-ho-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kharab-button-wala-laptop-bataye-baghair-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/saman-bechne-wale-ke-gari-load-karane-par-kharidar-ka-qabza-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/flat-ya-dukan-tameer-hone-se-pehle-kharidna-ya-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/buffet-system-ka-sharai-hukum-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/jandar-ki-tasveer-wali-products-bechne-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/jitne-paison-mein-cheez-bechne-ka-wakeel-banaya-us-se-zaid-mein-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/ida-waghera-companies-ke-zariye-online-karobar-aur-invest-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/second-hand-cheezain-khareed-kar-bechna-aur-har-aib-se-bari-hona",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/agreement-cancel-karwane-par-izafi-raqam-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/musalman-ka-hinduon-ke-tehwar-par-un-ko-bakre-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/video-ya-tasveer-bana-kar-website-ko-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/sample-wali-adviyat-ki-kharid-o-farokht-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/jhoote-kaghzat-bana-kar-society-launch-karna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/qiston-ke-karobar-ka-sharai-hukum-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/achi-quality-walay-chawal-normal-quality-walay-chawal-ke-badle-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/sone-ke-biscuit-ke-badle-sone-ka-zewar-kharidna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kya-plot-ki-file-bechna-sahi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kapre-ke-than-mein-kuch-kapra-ziada-hota-hai-us-ka-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/sona-sasta-kharid-kar-udhar-mein-mehnga-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/sakht-majboori-mein-apne-gurde-waghaira-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/mahana-qist-mein-kami-karne-par-qeemat-mein-izafa-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/aik-maroof-company-ki-tijarti-deal-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/2-chezain-aik-sath-bechne-par-qeemat-mein-discount-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kya-paan-gutka-bechna-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/sone-ka-zewar-udhar-bechna-kasia-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/jin-tiles-par-hindu-devta-ki-tasveer-bani-ho-aesi-tiles-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/udhar-mein-order-par-zewar-banana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/ghalla-roknay-ki-jaiz-o-najaiz-soorten",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/nafa-sadqa-karne-ki-niyat-se-soodi-bond-kharidne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/commission-par-kam-karna-aur-sasti-cheez-mehngi-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kapda-katne-ke-baad-than-me-se-aib-nikal-aaya-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/asal-qeemat-se-jitna-zayed-ho-usay-commission-banana",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/karobar-mein-jhoot-bolna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/agar-shop-ya-ghar-rent-par-de-aur-advance-istemal-kar-le-to-kia-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/dukan-bechte-hue-goodwill-ke-paise-alag-se-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/jumma-ki-pehli-azan-jari-hone-ki-soorat-me-kharido-farokht-karne-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kiraye-par-diya-hua-makan-bechna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/installments-par-liya-hua-plot-asal-malik-ko-wapas-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/mealworm-naami-keero-ki-khareed-o-farokht-ka-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/gold-khareed-kar-mehnga-hone-par-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/local-oil-par-branded-company-ka-sticker-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/dukandar-ka-apni-marzi-se-ziyada-saman-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/mobile-aur-charger-bechna-aur-mobile-ki-repairing-karna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/chori-ka-maal-bechne-wale-se-kharidari-karna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/network-marketing-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kuttay-ki-khareed-o-farokht-aur-kamai-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/gandum-udhar-bechte-waqt-rate-te-na-karna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/cash-par-kam-aur-qiston-par-ziyada-paise-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/raqam-advance-le-kar-order-par-gold-ki-jewellery-tayyar-kar-ke-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/bari-makri-aur-bichoo-ki-khareed-o-frokht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/dukandar-ka-customer-ko-saman-me-izafa-kar-ke-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/online-order-par-matke-aur-gamle-bechne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/janwar-ki-khareedo-farokht-me-aik-naa-jaiz-sorat",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/gair-muslim-se-machli-kareedna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/plot-ki-khareed-o-farokh-ki-sorat-aur-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/chiz-kareedne-se-pehle-sale-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/pattu-jari-ki-khareedo-farokht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/paak-pani-me-napak-pani-mil-jaye-to-isay-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/jandar-ki-tasveer-wale-kapre-ki-kharid-o-farokht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/raston-mein-ya-dukan-ke-samne-stall-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/advance-pese-de-kar-saman-saal-baad-lena",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/aurat-ke-sar-ke-baal-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kya-janwar-ki-intestine-bechna-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/paltu-kutte-ki-khareed-o-farokht-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/chiz-par-qabza-kiye-baghir-agey-bech-dena-online-khareedo-farokht-ki-aik-sorat",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/tasveer-wali-chair-banana-bechna-aur-istimal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/game-zone-ka-kaam-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/gobar-ki-lakriyan-bana-kar-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kya-ghareeb-se-mehenga-soda-kharidna-sawab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/cigarette-ki-khareedo-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/pls-account-ke-zariye-milne-wale-profit-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/jis-makaan-ko-log-manhoos-kahin-use-kharidna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kisi-bhi-cheez-par-kitna-nafa-rakh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/qist-late-hone-par-qeemat-me-izafa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/dropshipping-ka-aik-sharai-masla",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/wapis-khareedne-ki-shart-par-mobile-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/premium-prize-bond-ka-shari-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/maal-bechne-ke-liye-salesman-ko-commission",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/debit-card-ke-discount-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/choohe-kharidna-aur-paalna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/napak-doodh-ya-oil-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/udhar-khareed-farokht-mein-qeemat",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/shehad-ki-makhi-khareed-o-farokht-karna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/tasweer-wala-libas-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/saste-bazar-mein-mehengi-cheezen-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/expired-medicine-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/change-nahi-hain-bol-kar-saman-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/customer-order-na-lene-aaye-to-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/khareedari-ke-wakeel-ka-nafa-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/non-pta-mobail-bechna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/footpath-ya-road-par-pathare-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/smuggle-shuda-mobile-ki-khareed-o-farokht-karna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/purane-note-ke-badle-new-note-khareedna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/gobar-aur-pakhana-bechne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/chai-ki-patti-ko-chamray-ke-rang-se-rangna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/azan-e-jumma-ke-baad-cheez-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/product-ke-sath-ane-wala-inam-dukandar-ka-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kharidari-me-paise-kam-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kuffar-ke-istimali-kapre-4845",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/tol-kar-ya-gin-kar-bechne-ka-mayar",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/chori-ka-maal-kharidna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/smuggling-wala-saman-kharidna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kam-karat-wale-sone-par-zyada-karat-ki-mohr-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/soodi-qarz-ki-zamanat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kharid-o-farokht-mein-fasid-shart-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/janwaron-ki-shakal-wali-tray-ki-kharid-o-farokht-63",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/shart-par-cheez-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/mard-ka-ghair-shari-anguthi-banana",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/makhsoos-dukaandaron-ko-maal-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/shares-ke-karobar-ka-hukum-9061",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/naqad-aur-udhar-ki-qeemat-me-farq",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/school-ki-purani-kitabain-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/udhar-bechi-hui-cheez-wapas-kharidna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/boli-ke-zariye-khareed-o-farokht-ka-hukum-1497",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/purana-stock-naye-rate-par-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/karobari-sharakat-mein-najaiz-shart-6746",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/janwar-tol-kar-bechna-8480",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/prize-bond-ki-photocopy-ki-kharid-o-farokht-0388",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/najaiz-shart-par-ghar-bechna-6406",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/lottery-ke-zariye-kharid-o-farokht-1572",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/kiraya-per-rehne-ki-shart",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/insani-balon-ki-khareed-o-farokht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/murgi-farosh-ke-liye-ek-masla",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/ziyada-raqam-ka-mutalba-karna-0312",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/do-number-cheez-ko-farokht-karna-6418",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/parindon-ki-kharid-o-farokht-karna-4913",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/over-billing-karna-6730",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/gaari-udhar-beech-kar-wapis-kharidna-12145",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/jis-se-udhar-kharida-usay-adha-nafa-dena-kaisa-6135",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/jurmane-ki-shart-par-qiston-par-kharidari-karna-6150",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/us-dukandar-se-kharidari-jis-ne-jumma-nahi-parha-7341",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/janwar-ki-shakal-wale-khilone-4867",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/plot-walid-ke-name-kar-diya-1942-1",
-  "https://www.fatwaqa.com/ur/fatawa/khareed-o-farokht/abe-zam-zam-ki-kharid-o-farokht-jaiz-hai-ya-nahi-11940-1",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/shirkat-khatam-karne-par-paison-ki-taqseem",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/karobar-mein-raqam-invest-karke-profit-lene-ki-najaiz-surat",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/chalte-karobar-mein-shirkat-ka-jaiz-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/mudarbat-mein-nafa-aur-nuqsan-ki-taqseem",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/mushtarka-machine-mein-apna-hissa-shareek-ko-ijare-par-dena",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/partnership-wala-ghar-apne-partner-ko-rent-par-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/chalte-karobar-mein-shirkat-ka-ek-jaiz-tareeqa",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/chalte-karobar-mein-per-piece-ke-hisab-se-nafa-tay-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/ziyada-kaam-karne-wale-shariq-ki-ujrat-fix-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/nafa-tay-kiye-bagair-sharakat-dari-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/ek-shareek-doosre-shareek-ko-apna-hissa-bechne-par-majboor-nahi-karsakta",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/partnership-aur-is-ke-zaroori-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/shirkt-ke-karobar-mein-nuqsan-kis-hisab-se-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/shirkat-ul-amal-aur-shirkat-ul-aqd-mein-kya-farq-hai",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/mushtarka-dukan-apne-shareek-ko-kiraye-per-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/chalte-karobar-mein-shirkat",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/nafa-ki-sharah-fisad-nafa-par-tay-ki-jayegi-ya-sarmaya-par",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/nafa-ki-taqseem-saal-mein-ek-bar",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/muahida-shirkat-ki-muddat",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/nafa-aur-nuqsan-ki-taqseem",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/partnership-ke-liye-kitni-raqam-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/shirkat-par-kaam-ka-jaiz-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/karobar-ke-liye-raqam-dena-9702",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/naqad-qeemat-se-mehengi-1532",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/karobar-mein-personal-saman-bechna-1400",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/shirkat-me-shart-fasid-ka-hukum-6417",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/qarz-ke-badle-karobar-mein-shirkat-6138",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/dukan-kaam-ke-liye-de-kar-nafa-lena-6001",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/baghair-paison-ke-partner-0081",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/bhai-ka-karobar-main-bila-muahida-sharik-hona-1942-2",
-  "https://www.fatwaqa.com/ur/fatawa/shirkat/partners-ka-barabar-waqt-dena-5971",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/shirkat-ki-aamdani-doosre-karobar-mein",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/raqam-de-kar-munafa-lena",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/mudarabah-mein-nuqsan-kis-par",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/mudarabat-mein-paisa-lagane-aur-investor-ki-inteqal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/janwaron-mein-mudarbat-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/muzarbat-ka-profit-lena-kaisa-jabke-profit-ka-sahi-hona-maloom-na-ho",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/mudarabat-aur-is-ke-zaroori-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/mudarib-ka-mulazmeen-ki-tankha-me-izafa-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/muzarbat-mein-nuqsaan-kya-hai-aur-is-ke-usool-kya-hain",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/ngr-company-me-investment-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/janwaron-mein-mudarbat-ka-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/janwar-mein-investment-ka-sharai-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/muzarbat-ka-munafa-taqseem-karna",
-  "https://www.fatwaqa.com/ur/fatawa/muzaribat/mazarbat-khatam-karna-848",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kashkari-ki-najaiz-soorat-aur-ushar",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/sharab-ki-loading-unloading",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/zameen-dekar-kiraya-ya-fasal-lena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/tasweer-aur-movie-ki-kamai",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/tankhwa-na-dene-ki-shart",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/e-cigarette-delivery-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/school-chuttiyan-re-admission-fees",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/bank-ki-nokri-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/waqt-se-pehle-istefa-dene-par-ujrat",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kiraye-ka-ghar-aage-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/aarhti-ka-zyada-paise-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/game-players-dhoondne-ka-kam-sikhana",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kaam-karte-hue-mannat-ka-durood-pak-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/paid-leave-me-kaam-karna-aur-paise-lena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/jue-ki-machine-wala-restaurant-kiraye-par-lena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/bank-ka-naqsha-banane-ki-naokri-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/tiktok-par-video-upload-karke-earning-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/parlor-mein-customers-bhejne-ka-commission",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/soda-cancel-karne-par-broker-ka-commission",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/band-baja-bajane-ki-nokri",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/whatsapp-group-mein-profile-share-karke-paise-lena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/video-editor-aur-graphic-designer-ki-ujrat",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/rishwat-se-job-hasil-karna-aur-uski-tankhwah",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/barber-ko-shop-rent-par-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/sharab-bechne-wale-ko-dukan-kiraye-par-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/gandum-ke-badle-zameen-ka-theka",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/client-bhejne-par-commission-lena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/akhrajat-ki-shart-par-gari-kiraye-par-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/dukan-istemal-na-karne-par-bhi-kiraya-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/snooker-aur-patti-ki-income-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/duty-time-namaz-parhna-aur-time-ke-paise-katwana",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kiraye-dar-saman-chor-jayen-to-uska-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/ghair-shari-parties-ke-liye-jaga-rent-par-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/naat-khawan-ko-milne-wale-paise-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/ghair-muslim-se-ghar-kiraya-par-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/dam-kar-ke-is-ka-hadiya-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/teacher-ya-mulazim-ka-duty-time-kam-dena-aur-salary-mukammal-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/gari-kiraye-par-li-aur-kharab-ho-gayi-to-tawaan-kaun-de",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/parindon-ki-kharid-o-farokht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/new-bike-chand-din-chalne-ke-baad-kam-qeemat-mein-wapas-lena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/masjid-ki-dukan-salon-ke-kaam-ke-liye-kiraye-par-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/zameen-theke-par-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/qabar-khodne-ke-paise-lene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/sharabi-ko-kaam-par-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/hajj-o-umrah-travel-agency-agent-ki-job-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/sharab-store-cashier-job-accountant-job-jaiz-najaiz",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kuffar-ko-haram-food-delivery-ki-job-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/musalman-ghair-muslim-baal-katwana",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/naai-barber-salon-karobar-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/ek-shakhs-ki-zameen-aur-dusre-ka-kharcha-ho-to-muzariat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/night-duty-ke-darmiyan-so-jana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/call-center-ki-job-karna-jaiz-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/mulazim-par-chutti-ya-takhir-ka-mali-jurmana-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/advance-payment-dene-ki-shart-par-payment-me-discount-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/mobile-repairing-ke-paise-lene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/thora-kaam-karne-ke-mazdoor-ko-paise-milenge-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/broker-commission-ka-mustahiq-kab-hota-hai-tafseeli-fatwa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kiraye-per-liye-hue-apartment-ko-zyada-kiraye-per-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kisi-ka-kaam-kisi-aur-se-karwa-kar-paise-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/musalman-ka-kafir-ke-washroom-saaf-karne-ki-nokri-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/gunah-wali-website-banane-aur-iski-ujrat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/ujrat-tay-kiye-bagair-kapde-silwaye-to-pehenne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/mulazim-ka-duty-timing-mein-kisi-aur-ka-kaam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/online-freelancing-mein-projects-hasil-karne-ke-liye-dhoka-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/soodi-bank-mein-mto-ki-naukri-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/shopping-mall-kiraye-par-le-kar-murammat-karwa-kar-aage-ziada-kiraye-par-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/paise-de-kar-channel-subscribe-karwana-ya-watch-time-mein-izafa-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/bank-account-se-bill-jama-karne-aur-raqam-transfer-karne-ke-charges-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/haram-pizza-aur-sharab-ki-delivery-ki-job-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/bataye-bagair-job-chorne-par-salary-na-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/soodi-company-mein-accountant-ki-job-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/bank-ko-apni-jaga-kiraye-par-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/social-platforms-par-video-wagaira-like-karke-hone-wali-earning-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/taraweeh-parhane-ki-ujrat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/hijama-ki-ujrat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/soodi-qarz-wusool-karne-ki-job-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/rishwat-dene-wali-company-mein-job-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/sharab-uthane-ya-bechne-ki-nokri-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/car-rent-par-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/insurance-ya-bima-policy-ki-nokri-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/employee-rasta-band-hone-ki-wajah-se-chutti-kare-to",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kiraye-ki-cheez-aage-zyada-kiraye-par-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/graphic-designer-ka-digital-images-bana-kar-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/raat-mein-job-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/visit-visa-par-bahar-mulk-jane-wala-job-kar-sakta-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/aurat-ka-polio-ke-qatre-pilane-ki-job-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/masnoi-andaz-ki-digital-marketing-me-hissa-lene-walo-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/software-bana-kar-dene-ka-agreement-karne-ke-baad-kisi-aur-se-banwa-kar-dena-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/videos-dekh-kar-paise-kamana-na-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/application-mein-paise-invest-karke-ad-aur-like-ke-zariye-paise-kamana",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/air-hostess-ka-na-jaiz-kamon-se-bachte-hue-job-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/mulazmin-ki-tankha-bagair-tay-kiye-karkardgi-performance-ke-mutabiq-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/bandar-ka-tamasha-dekhna-dikhana-aur-is-par-paise-lena-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/muslim-ladki-ka-air-hostess-banna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/musalman-ka-esai-ke-ghar-mein-mulazmat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kaam-ki-training-dene-par-kamai-ka-commission-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/malik-ke-kehne-par-customer-se-jhoot-bolna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/urgent-kaam-ke-ziyada-paise-lena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/syed-sahib-ko-mulazmat-par-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/handwriting-wali-company-ke-zariye-earning-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/brokerage-aur-is-ke-zaroori-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/bila-zaroorat-nursing-ki-darkhwast-de-kar-paise-lena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/online-kam-le-kar-kisi-aur-se-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/karobar-karne-ke-liye-istikhara-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/malik-ka-mulazim-ko-gratuity-fund-na-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/fashion-wale-kapde-silai-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/surrogacy-kya-hai-aur-islam-mein-is-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/fake-followers-aur-likes-barhane-ke-liye-paise-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/cigarette-company-mein-nokri-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kya-bank-mein-nokri-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kafir-ke-liye-ujrat-par-angoor-torna-sharai-tor-par-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/jhoote-kaghzat-banane-ki-naukri-karna-kasia",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/affiliate-marketing-ke-zariye-amazon-wagaira-se-commission-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/beauty-parlour-ke-liye-dukan-kiraye-par-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/beauty-parlour-ki-kamai-halal-hai-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kya-duty-ke-doran-quran-pak-ki-tilawat-aur-durood-pak-parh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/company-ki-taraf-se-di-jane-wali-chhutiyon-ki-tankhwa-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/shadi-ke-kapde-rent-par-le-kar-pehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/sarkari-idaron-se-milne-wali-pension-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/rickshaw-or-taxi-me-karaya-fix-kiye-bagair-safar-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/rent-par-li-hui-dukan-aage-kiraye-par-dene-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/ujrat-tay-kiye-bagair-nikkah-parhana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/mulazim-ka-doran-e-duty-kaam-me-susti-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/paidal-safar-kar-ke-company-se-kiraye-ke-paise-lena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/sarkari-jagah-rent-par-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/jis-nokri-me-namaz-reh-jati-ho-wo-nokri-karne-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/idaray-mein-mulazmeen-ke-khane-ke-liye-rakhi-hui-ashya-ghar-lana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kaam-se-pehle-ujrat-dene-ki-shart-par-is-me-kami-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/larka-ya-larki-ke-liye-air-hostess-ki-job-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/customer-ko-lab-bhejne-par-commission-lena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/swimming-pool-bana-kar-paise-lena-aur-jhoola-laga-kar-kamana",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kasht-ke-liye-zameen-betai-ya-ijaray-per-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/soodi-lain-dain-karne-wali-company-me-accountant-ki-job-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/dusron-ke-gharon-mein-dish-antenna-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/mard-ka-ladies-kapray-silai-karna-aur-nap-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/duty-time-se-late-hone-ki-surat-mein-overtime-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/photographer-ko-dukan-kiraya-par-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/travel-agent-ka-corona-ka-test-par-commission-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/ghair-muslim-ko-makan-rent-par-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kisi-ko-sifarish-karke-nokri-dilwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/quran-pak-parhane-ki-ujrat-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/jhoota-certificate-banwa-kar-nokri-hasil-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/mardon-ke-liye-saloon-kholna-aur-iska-kaam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kya-broker-dono-taraf-ki-brokery-le-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/company-ki-car-ko-apne-zati-use-me-lana",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kafiroon-ki-company-me-accountant-ki-job-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/employee-ka-health-insurance-karna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/karigar-ka-purana-saman-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/freelance-kaam-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/tuition-advance-fee-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/commission-ka-kaam-jaiz-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/dukan-ke-samne-thela-lagane-ka-kraya",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/tankhwa-lene-wale-imam-aur-mudarris-ka-sawab",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/commission-aur-bayana-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/medical-ka-license-kiraye-par-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/mayyat-ko-ghusal-dene-ki-ujrat-lena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/mulazim-ke-late-aane-par-jurmana-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/mulazim-ke-late-hone-par-tankhwa-katna",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/video-game-khelna-aur-ujrat-lena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/products-ki-advertisement-per-ijara",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/dehari-par-kaam-karna-6395",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/haram-cheezain-khilane-ki-naukri-karna-6233",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/gandum-pisne-ki-ujrat-lena-1675",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/darhi-mondnay-per-ujrat",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/medicine-company-mein-marketing-ki-naukri-7102",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/video-game-ki-ujrat-7858",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/beauty-parlour-ka-kaam-karna-aur-is-ke-liye-masjid-ki-dukan-kiraye-par-dena",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/idaray-ka-petrol-zati-istemal",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/chutti-wale-din-ka-ijarah-lena-1037",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/naib-imam-aur-tankhwah",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/namaz-main-sarf-waqt-ka-ijarah-lena-0333",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/doran-e-duty-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/channel-per-nokri-karna-kaisa-6340",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/kisi-cheez-ke-farokht-karne-par-ijara-karna-6147",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/repairing-ka-saman-de-kar-bhool-jana-5223",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/darzi-ke-pas-bache-howe-kapre-ka-hukum-4849",
-  "https://www.fatwaqa.com/ur/fatawa/ijarah/janwar-se-jufti-ki-ujrat-4863",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/5-ya-8-feesad-wali-qarz-scheme",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-ki-wajah-se-khudkushi",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/nabaligh-ko-baghair-qabze-ke-tohfa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/shadi-ke-liye-soodi-qarz",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/advance-lekar-extra-payment",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/udhar-chawal-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/zakat-ki-raqam-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-ke-badle-namazen-deni-hongi",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-maaf-karne-ke-baad-wapas-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/gandum-udhar-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/fixed-deposit-par-profit-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-wapsi-per-zyada-lotana",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/aate-ke-badle-aata-udhar-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/sood-ki-tareef-aur-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/gratuity-ki-raqam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/lepalak-ko-gift-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/maqrooz-tak-raqam-pohchane-ki-ujrat",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/walid-ka-apna-qarz-apni-aulad-ke-hawale-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/na-baaligh-ke-gift-par-maa-ka-qabza",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/nabi-pak-ka-qarz-zyada-lotana",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-wapsi-ke-liye-sifarishi-daalna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/sona-qarz-liya-to-wapas-sona-de-ya-paise",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/zyada-wapas-karne-wale-ko-qarz-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/soodi-raqam-khane-peene-ki-ashiya-ke-ilawa-kaam-mein-kharch-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-khwah-ka-inteqal-ho-jaye-to-qarz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/amanat-rakhwane-wale-ke-intiqal-ke-baad-amanat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/soodi-qarz-utarne-ke-liye-qarz-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/ek-currency-qarz-mein-dekar-wapsi-mein-dusri-currency-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/kya-committee-admin-committee-ke-paise-use-karskta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarzdar-se-cheez-sasti-karwake-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/zarurat-mand-ko-qarz-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/soodi-idare-ke-liye-jaidad-ki-chan-been-investigation-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/karobar-ke-liye-qarz-de-kar-karobar-ka-munafa-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-par-zamanat-dene-ke-paise-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/mangni-tootne-ke-baad-gift-wapas-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/walid-ka-na-baligh-bete-ka-sona-qarz-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-ke-ewaz-ghar-kiraye-par-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/boli-wali-committee-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/kisi-ko-3-lakh-de-kar-har-mah-15-hazar-nafa-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/kya-qarz-lene-ki-wajah-se-kam-paison-mein-kaam-karna-sood-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/baap-ko-raqam-qarz-de-kar-wapsi-ka-mutalba-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-khwah-na-mile-to-qarz-ki-raqam-ka-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-dene-wala-faut-ho-jaye-to-qarz-ki-wapsi-kaise-karen",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/committee-jama-karne-wale-se-committee-ki-raqam-chori-ho-jaye-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/kya-qarz-mein-currency-ke-devalue-hone-ka-bhi-aitibar-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/khet-girvi-le-kar-us-ki-fasal-ko-istemal-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/rehen-par-li-hui-cheez-malik-ki-ijazat-se-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-de-kar-qarz-ki-wusooli-infaltion-add-karke-lene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/jazz-cash-se-ready-cash-loan-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-wapas-karte-waqt-apni-khushi-se-ziyada-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/tohfa-de-kar-wapas-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/paison-ko-kiraye-par-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/current-account-me-makhsoos-raqam-ki-bunyad-par-mashroot-fawaid-dena-soodi-nafa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/bank-mein-zewar-girvi-rakh-kar-qarz-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/bank-se-soodi-loan-lene-ke-liye-kisi-ko-tayyar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/gandum-lene-ki-shart-par-qarz-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/kafir-ka-maal-zime-par-baqi-ho-aur-wo-mar-jaye-to-kya-karein",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/visa-ke-husool-ke-liye-soodi-qarz-lekar-bank-account-mein-raqam-show-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/jis-se-qarz-liya-wo-na-mil-raha-ho-to-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/kya-behbood-certificate-ke-zariye-nafa-hasil-karna-sood-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/girvi-makan-kiraye-par-dena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/raqam-sadqa-karne-ki-niyat-se-soodi-bank-mein-saving-account-khulwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/kya-nabaligh-bacha-apni-zati-raqam-masjid-ya-madarsa-mein-de-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/sona-gift-karein-to-dusre-ki-milkiyat-ke-liye-us-ka-qabza-zaroori-hai-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/maqrooz-ki-ijazat-ke-bagair-qarz-ada-karne-se-qarz-ada-ho-jaye-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/kafir-ghair-muslim-bank-se-qarz-lena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-par-profit-lena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-mein-takheer-hone-par-late-fees-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/ghair-muslim-se-us-ka-ghar-heavy-deposit-par-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/table-par-rakhi-gai-tip-par-kis-ka-haq-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/jis-se-qarz-liya-us-se-rabta-na-ho-raha-tu-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/udhar-ki-muddat-barhane-par-izafi-raqam-lena-khula-sood-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/jazz-cash-ki-mukhtalif-suraton-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-li-gai-raqam-ko-shart-ke-baghair-ziyada-wapas-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/maqrooz-faut-ho-jaye-to-qarz-ka-mutalba-zamin-se-hoga-ya-wurasa-se",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/jo-raqam-sadqa-ki-niyat-se-rakhi-ho-iss-se-kisi-ko-qarz-e-hasna-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-wapas-dene-mein-taal-matol-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/na-jaiz-dosti-mein-diye-jane-wale-tahaif-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/bete-ya-bhai-se-qarz-liya-ho-tu-kya-wapas-karna-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-ki-adaigi-mein-takheer-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/amanat-rakhwane-wale-ka-intiqal-ho-jaye-tu-us-amanat-ka-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/tohfa-dekar-wapas-lena-kaisa-hai-qareebi-rishtedar-se-gift-lena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/bc-me-jama-hone-wali-raqam-ko-apne-zati-istemal-me-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/karobar-ke-liye-qarz-lene-ke-bajaye-tijarat-ka-saman-udhar-khareedna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-di-hui-raqam-ki-zakat-kese-ada-ki-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-me-konsi-currency-wapas-dena-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/apne-kirayedar-se-qarz-lene-ki-ehtiyat-aur-tareeqa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-se-nijat-ki-dua",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/kya-samandar-me-doob-kar-marne-wale-ka-qarz-maaf-ho-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-me-konsi-currency-wapas-karni-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/loan-apps-ke-zariye-qarz-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/karobar-karne-ke-liye-soodi-qarz-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/kya-sona-udhar-le-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/birthday-par-milne-wale-gift-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-konsi-currency-me-wapas-kiya-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/muashray-mein-payi-jane-wali-soodi-qarz-ki-ek-surat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/kya-makro-waqt-mein-namaz-e-janaza-parh-sakte-hain-aur-mayyat-ko-dafna-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/apni-committee-ki-rakam-dekar-is-per-profit-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/girvi-rakhi-hui-cheez-se-faida-uthana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-wapis-karne-par-is-ka-fisad-rate-muqarar-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-wapis-lene-tak-izafi-raqam-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-ki-wajah-se-ghar-ka-kiraya-kam-muqarar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/monthly-raqam-jama-kar-ke-qarz-dena-aur-wapsi-par-ziyada-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/dost-se-gift-mangna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/house-building-finance-company-se-ghar-banane-ke-liye-sodi-qarz-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/maan-ka-nabaligh-aulad-se-qarz-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-ka-mutalba-kisse-karen",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-ka-waris-se-mutalba-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/sona-qarz-lene-par-adaigi-mein-sone-ka-mutalba",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-ka-ehem-masla",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-khawa-ko-kam-rate-par-cheez-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/kiraye-par-di-hui-dukan-makan-gift-karne-ka-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/makan-girvi-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/committee-dalna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/birthday-par-ek-dusre-ko-tohfa-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-de-kar-mashroot-nafa-lena",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/bank-loan-dilwane-par-commission",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/na-baligh-bachi-ko-sona-gift-karna",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/bank-mein-committee-dalna-1335",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/sood-ka-ek-masla",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-mojooda-value-per-laotana",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-e-hasna-wapis-karna-6366-b",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/bank-se-qarz-lena-jaiz-hai-5014",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/qarz-khatam-hone-par-izafi-qist-lena-4896",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/khud-mayyat-ka-qarz-ada-kar-diya-6156-b",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/sona-udhar-lene-ke-baad-sona-he-wapis-karna-7474",
-  "https://www.fatwaqa.com/ur/fatawa/qarz-hiba-rahan/karz-par-izafi-raqam-60692",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/chanda-wapis-lena",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/milad-ka-bacha-hua-chanda",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ka-samman-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-chande-se-madrase-ke-ustad-ki-tankhwa",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-par-madrasa-aur-madrasa-ki-jagah-imam-ki-rehaish",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/imam-ka-bijli-aur-gas-ka-bill",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/qabristan-ki-khali-jagah-mein-khelna",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-sehen-par-chhat-dal-kar-madrasa-banana",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ki-bijli-se-water-filter-chalana",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ka-qaleen-madrase-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ka-mic-bahir-lejana",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-washroom-theke-ya-kiraye-par-dena",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ki-kharab-topiyan-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ka-pani-ghar-le-jana",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-o-madarse-ke-liye-ek-hee-box-mein-chanda-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/eidgah-mein-shadi-biyah-ki-taqreeb-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ki-waqf-jagah-se-kuch-hissa-jamia-ke-liye-waqf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/qabristan-mein-apne-liye-ya-apne-azizon-ke-liye-jagah-khas-karna",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-bor-se-shaadi-ke-liye-pani-ki-tanki-bharna",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/madrase-ki-waqf-jagah-tabdeel-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/apne-ghar-ki-battery-masjid-ki-bijli-se-charge-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/madrase-ke-umoomi-chande-se-chhat-par-ustad-ke-liye-rehaish-banana",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ki-waqf-dukan-urf-se-kam-kiraye-par-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-generator-se-mohalle-ke-gharon-ko-light-dena",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/agar-waqf-ki-koi-cheez-toot-jaye-to-us-ka-kaffara-kya-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/na-baligh-bachon-se-chanda-lene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ka-chanda-karobar-mein-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-chande-se-iftari-ka-ehtimam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/sadaqah-ki-raqam-se-machli-kharid-kar-madrasa-mein-dena",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/qadianiyon-se-liya-hua-chanda-masjid-madrasa-ya-janazah-gah-par-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-quran-pak-ko-le-kar-uski-jagah-dosra-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-chanday-se-imam-masjid-ko-salary-dena",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/kisi-ki-chande-ki-raqam-ke-bajaye-apni-zati-raqam-masjid-mein-dena",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-chande-se-taraweeh-parhne-ki-ujrat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/mutawalli-banne-ke-liye-kya-sharait-hain",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ka-pankha-waghaira-istemal-kar-ke-masjid-mein-raqam-de-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/imam-moazin-ki-salary-masjid-ke-chande-se-dena",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-chande-se-kisi-karobari-shakhs-ko-qarz-dena",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/ek-masjid-ka-chanda-dusri-masjid-me-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ko-nafli-sadqa-de-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/raah-e-khuda-ke-paise-istemaal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-mein-ro-plant-aur-us-ki-aamdani-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/qabristan-ke-darakhton-ki-milkiyat",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/mehfil-e-milad-se-bachay-chande-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-chande-se-charaghan-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-quran-pak-ghar-le-jana-8767",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/milad-se-bachne-wala-chanda-4168",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ki-chezain-zati-istemal-8310-e",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/quran-pak-per-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ki-darion-ki-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/mehfil-e-milad-ka-chanda-bach-jaye-tu-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ki-chat-par-imam-ke-liye-makaan-banana-6379",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/madrase-ki-zameen-rihaish-banana-6376",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/madrase-ke-chanda-ka-box-masjid-mein-lagana-6410",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/apni-jaidad-masjid-ko-waqf-karna-6273",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-chande-se-imam-ko-bike-dilana-6080",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ki-serhi-kiraye-par-dena-1804",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-plot-ke-nechay-istinja-khana-banana-4878",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/mehfil-ka-chanda-masjid-mein-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/khilaf-e-masraf-chanda-istemal-karna-6121",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/kisi-ki-jagah-par-masjid-banana-6088",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-wuzu-khane-mein-shamil-karna-6143",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/madrase-ki-jaga-wapis-lena-5239",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ki-jagah-bechna-5218",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/madrase-ka-chanda-zati-istemal-mein-lena-5210",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/ain-masjid-me-seerhi-banai-jasakti-hai-5194",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/imam-ko-kitni-chuttiyon-ki-ijazat-1940",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-liye-qarz-lena-6067",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/masjid-ke-fund-se-committee-6067-b",
-  "https://www.fatwaqa.com/ur/fatawa/waqf/qabristan-ke-liye-jaga-kharidna",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/wirasat-kitne-maal-me-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/waris-qarz-ada-kare-to-wirasat-ki-taqseem",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/razai-bete-ka-wirasat-mein-hissa",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/waldain-ki-zindagi-mein-fot-hone-wale-ki-wirasat",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/mayyat-ka-qarz-pehle-ada-karen-ya-wirasat-ki-taqseem",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/mayyat-ka-tarka-masjid-mein-ya-zaruratmand-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/dar-ul-harb-mein-inteqal-karne-wale-musalman-ki-wirasat",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/shadi-shuda-aulad-ko-kam-wirasat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/mayyat-ka-qarz-ek-waris-ka-maaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/talak-ki-iddat-biwi-fout-ho-jaye-to-kya-shohar-waris-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/walida-ke-inteqal-ke-baad-nana-ke-waris",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/waris-ke-pas-mayyat-ki-amanat",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/betiyon-ko-wirasat-ki-har-cheez-se-hissa",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/meher-dene-se-pehle-biwi-ka-inteqal-meher-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/wirasat-mein-razai-maa-ka-hissa",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/nana-ki-property-mein-nawason-ka-hissa",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/kya-faut-shuda-biwi-ka-uske-shohar-ki-wirasat-mein-hissa-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/inteqal-kar-jane-wale-rishtedar-ka-saman-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/namazon-aur-rozon-ke-fidye-ki-wasiyat",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/waldain-ki-zindagi-mein-hissa-muaf-karne-ke-bad-wirasat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/kya-soodi-raqam-mein-wirasat-jari-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/mayyat-ke-sath-dafan-mal-ko-nikalne-ke-liye-qabar-khodna",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/mayyat-ke-upar-ki-chadar-qabar-banane-wale-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/larki-ke-inteqal-par-is-ke-zewraat-o-cash-mein-kis-kis-ka-hissa-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/insurance-ki-raqam-ki-warasat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/bewa-aage-shadi-kar-le-to-pehle-shohar-ki-wirasat-se-hissa-milega",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/walid-ki-zindagi-mein-faut-hone-wali-beti-ka-wirasat-mein-hissa",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/marhoom-bhai-ki-beti-ko-walida-ki-wirasat-se-hissa-dena",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/behno-ke-hisse-ki-property-bechne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/jaidad-se-aaq-karne-par-aulad-ka-hissa-khatam-ho-jaye-ga",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/gurda-donate-karne-ki-wasiyat-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/mayyat-ka-saman-wariseen-ki-ijazat-se-kisi-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/nabaligha-bachi-ki-wirasat-mein-sirf-walidain-ka-haq-hai-ya-sage-bhai-behan-ka-bhi",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/faut-shuda-nabaligh-bache-ki-cheezon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/muslim-beta-kafir-baap-ki-wirasat-mein-hissedaar-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/sotele-bete-jo-haqeeqi-bhatije-bhi-hon-kya-un-ka-wirasat-mein-hissa-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/zuhr-asar-ya-maghrib-ki-kuch-rakatien-reh-jayein-tu-kis-tarah-ada-karein",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/aulad-na-ho-to-biwi-ko-wirasat-mein-hissa-mile-ga",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/biwi-ki-wafat-ke-baad-us-ke-jahez-ka-malik-shohar-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/jo-shakhs-la-pata-ho-jaye-uski-wirasat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/aulad-na-ho-to-biwi-ki-wirasat-mein-se-shohar-ka-kitna-hissa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/khwaja-sara-kise-kehte-hain-aur-wirasat-mein-iske-hisse-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/marhoom-ki-insurance-ki-raqam-ka-malik-kaun-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/maa-baap-ki-wirasat-mein-larki-ka-kitna-hissa-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/walid-ki-zindagi-mein-faut-hone-wale-bete-ka-walid-ki-wirasat-mein-hissa",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/marhoom-ka-qarz-ada-karne-wala-tarke-se-raqam-le-sakta-hai-kya",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/wirasat-mein-se-koi-waris-apna-hissa-chorna-chahe-to-kya-chor-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/gumshuda-shakhs-ki-wirasat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/wirasat-mein-kya-kya-cheezain-shamil-hoti-hain",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/bewah-aurat-nikah-karle-tu-kya-pehle-shohar-ki-wirasat-mile-gi",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/maa-baap-ka-aik-bete-ko-maal-ziyada-dena",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/god-liye-bache-ki-wirasat-ke-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/wirasat-me-hissa-kis-hisab-se-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/zindagi-mein-jaidad-ki-taqseem-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/behan-ko-wirasat-na-dena-wirasat-ke-hisse-se-umrah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/wasiyat-ki-sharai-haisiyat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/le-palak-bacha-kis-ki-wirasat-ka-haqdar-hai",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/gift-kya-hua-sona-inteqal-ke-baad-wapas-lena",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/waris-ke-liye-wasiyat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/dada-ki-warasat-mein-yateem-potay-ka-hissa",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/larki-ko-jaidad-se-aaq-karna",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/jaidad-mein-larkiyon-ko-aaq-karna",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/beti-ko-wirasat-ka-hissa-na-dena",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/aurat-ka-wirasat-mein-hissa-mard-se-kam-kiyon-9840",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/karobar-mein-wurasa-ki-ijazat-ke-baghair-nafa-kamana-6880",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/jaidad-say-aaq-karne-ki-haisiyat",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/mushtarka-dukano-mein-behno-ka-haq-1624",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/zindagi-mein-wirasat-taqseem-karna-0997",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/beti-ko-hissa-na-dena-6311",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/zindagi-me-jaidad-ki-taqseem",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/mal-e-wirasat-halal-o-haram-mix",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/walidain-se-jaidad-taqseem-ka-mutalba-karna-3917",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/makan-name-kar-dene-se-hiba-mukamal-hojata-hai-6387",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/musalman-ki-wirasat-se-haq-5256",
-  "https://www.fatwaqa.com/ur/fatawa/wirasat-aur-tarka/mayyat-kay-tarke-se-chaliswein-860",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/customer-ka-saman-bhool-jana",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/traveling-card-gira-hua-mile-to-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/ghar-kharidne-ke-baad-sone-ki-chain-mili-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/padhne-ke-liye-kitab-li-tu-gum-hone-par-tawan-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/rickshaw-me-musafir-apna-saman-bhool-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/rickshaw-se-biscuit-ka-packet-gira-aur-malik-nahi-mil-raha-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/masjid-nabavi-mein-koi-cheez-mile-aur-uske-malik-ka-pata-na-ho-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/6-saal-ki-bachi-ko-100-rupe-pare-hue-mile-to-is-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/na-baligh-bache-ne-zameen-par-pare-howe-paise-utha-liye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/gire-hue-paise-utha-kar-kharch-kardiye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/apni-dukan-ke-samne-se-raqam-mili-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/sailab-mein-beh-kar-aane-wali-ashya-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/giri-pari-milne-wali-raqam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/masjid-se-kisi-aur-ke-chappal-pehen-kar-ghar-aa-gaya-tu-ab-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/customer-dukan-par-saman-rakhwa-kar-bhool-jaye-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/bank-account-mein-galti-se-kisi-ke-paise-aa-jaye-to-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/luqta-giri-pari-cheez-ke-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/luqatah/musafir-samaam-bhool-jaye-to-driver-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/saza-o-qaza/kya-chori-ka-saman-wapas-karne-par-tawan-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/saza-o-qaza/uraina-walon-ko-peshab-peene-ki-ijazat-aur-sakht-saza-dene-ki-wajah",
-  "https://www.fatwaqa.com/ur/fatawa/saza-o-qaza/chori-ki-saza-ke-tor-par-chor-ki-tankhwa-zabt-kar-lena",
-  "https://www.fatwaqa.com/ur/fatawa/saza-o-qaza/dil-azari-mazaq-urana-thapar-marna-aur-in-ka-badla-lena-kaisa-qasas-tazir",
-  "https://www.fatwaqa.com/ur/fatawa/saza-o-qaza/mobile-chori-karne-par-tawan-6294",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nardshir-chausar-game",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ai-tools-tasveer-cartoon-banana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/social-media-suni-sunai-khabar",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mama-sitas-oyster-sauce",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kanwari-larki-ka-makeup-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/fakhta-aur-tateri",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chori-ke-maal-se-karobar",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-fashion-kala-dhaga-bandhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/carmine-color-wali-cheez-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/fot-shuda-ki-tasweer-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chandi-ki-talwar-diwar-par-latkana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/yateem-bachon-aur-bachiyon-ko-sath-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mazar-par-dhol-baje-bajana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/benzyl-alcohol-toothpaste-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/janwar-ko-murdar-khilana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/washroom-mein-khushbudar-spray-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/naat-khwani-muqabla-bachon-ko-inam",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jhooti-raseed-banana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kauwe-ka-chonch-doodh-mein",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dadhi-katna-aur-is-ke-paise-lena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nabi-ka-naam-durood-ki-jagah-saw-ya-suad-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jabre-se-neeche-surgery-ke-liye-dadhi-katna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hotel-ka-soap-aur-shampoo-ghar-lana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/eid-milad-un-nabi-par-cake-katna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/murghabi-ka-anda-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kaam-nikalwane-ke-liye-rishwat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/donkey-milk-cream-lagana-ya-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/allah-ko-cheenne-wala-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bache-ko-gadhi-ka-doodh-pilana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shohar-ke-liye-design-wale-suit-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-nyota-sood-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-diamond-nag-wali-chandi-ki-anguthi-pehanna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/family-planning-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/documents-mein-umar-kam-likhwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/urdu-mein-durood-sharif-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shari-masail-chatgpt-se-puchna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/safar-ke-mahine-mein-mehndi-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ye-jumla-bolna-kaisa-ke-allah-ki-lathi-be-awaz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/biwi-ke-liye-mard-ka-tanhai-mein-dance-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/laboratory-bhejne-par-commission-lena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tobacco-naswar-halal-alcohol-mashroob-haram-kyun",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/apna-ya-apni-family-ka-life-insurance-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sar-ya-darhi-ke-safed-balon-ko-ukherna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/beti-ke-ghar-ka-khana-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/angoothi-ya-bartan-se-aawaz-paida-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/namaz-chorne-par-jurmana-lene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jadu-ke-tor-ke-liye-jadu-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/cup-par-tasweer-chapna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/biwi-ko-kale-kapre-ya-kali-churiyan-dilana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/janwar-ki-hifazat-ke-liye-kutta-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mehfil-ke-panaflex-par-tasveer",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/business-ka-illegal-setup-kisi-doosre-mulk-mein-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mazoor-shakhs-ka-hair-removal-cream-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/non-alcoholic-beer-ya-0-0-beer-peena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/karwa-chauth-ka-vrat-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/saib-se-bana-sirka-apple-cider-vineger-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/seh-halal-hai-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/muharram-mein-kapre-seena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/qabristan-mein-khana-peena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/machli-ke-ande-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/novels-parhne-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/janwar-ka-khoon-jism-par-laga-kar-elaj-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hiran-ki-mushk-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/skin-ya-chehre-ke-moles-remove-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bila-ijazat-internet-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sone-ki-wall-clock-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mangal-ke-din-kapre-katna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/squid-ya-calamari-machli-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bakre-ke-doodh-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/birthday-manane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/halal-janwar-ki-aanten-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shirkiya-naam-wali-app-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-murgi-ki-dumchi-khana-halal-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/qurbani-ke-janwar-ki-kaleji-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bail-dor-ka-muqabla-karna-aur-dekhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/moti-wala-bracelet-bache-ko-pehnana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/na-mahram-se-message-par-baat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/halal-janwar-ki-zaban-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/makeup-mien-joon-ka-khoon-shamil-hona",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/paun-laga-pani-pina",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tasweer-wale-joote-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghusal-se-pehle-dubara-hambistari",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/plate-ka-bach-jane-wala-khana-phenkna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/na-mehram-ke-sath-khana-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/upper-lips-blade-se-banana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/biwi-ko-be-pardagi-ka-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bewa-aurat-ka-sona-pehenna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/makeup-artist-ka-kaam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gosht-kaleji-tilli-aur-dil-ke-khoon-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gardan-ke-2-pathon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/haram-maghaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tehband-latkane-ki-waeed",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sarkon-par-lage-darakhton-ke-phal-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bejan-ki-drawing-aur-painting-banana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/copper-ke-glass-mein-pani-pina",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mahram-aurat-ko-mehndi-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/lottery-khelne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghar-par-aane-wale-faqeeron-ko-khali-hath-lautana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jis-janwar-se-badfeli-ki-gai-uske-doodh-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chote-bache-ko-gold-ki-anguthi-pehnana-gunah-kyun-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/na-baligh-se-pani-bharwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kafir-ko-sehat-aur-hifazat-ki-dua-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shadi-ki-pictures-print-out-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/billi-ka-munh-laga-bartan",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/toote-bartan-mein-khana-peena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/rishta-dene-ke-liye-sona-ya-cash-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sarkari-mulazim-ko-dawat-ya-raqam-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mian-biwi-ka-hathon-ki-tasveer-print-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/rukhsar-ke-baal-hamesha-ke-liye-khatam-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/music-sunne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-gold-plated-watch-pehanna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tasveer-wale-cup-banana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nomolood-larke-ko-sona-chandi-pehnana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chand-dekhte-waqt-ishara-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/qurani-stickers-lage-kamre-mein-kapre-badalna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chandi-ki-tasbeeh-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tanhai-mein-satar-khula-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghair-ullah-ke-liye-lafz-hayy-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghair-shari-kaam-se-bachne-par-waldain-ka-dil-dukhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/purane-kapre-pehnne-ke-ilawa-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/asar-maghrib-ke-beech-podon-ko-pani-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-resham-mile-shining-wale-kapre-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/washroom-mein-qible-ki-taraf-peeth-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bazar-ki-mari-hui-machli-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nan-bai-ki-kamai-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/galaxy-ring-pehenna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/musibat-zada-wali-dua-kafir-ko-dekh-kar-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khwabon-ki-tabeer-ka-ilm-seekhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mardon-ka-heeray-ki-anguthi-pehenna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/najaiz-tarike-se-jaiz-kaam-par-pension-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/lam-app-se-earning-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/makri-marne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chandi-ka-chammach-aur-kanta-istemal-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dushman-ke-barbad-hone-ki-dua-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aulad-ke-husool-ke-liye-haiz-mein-humbistari-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kutta-haram-hone-ki-waja",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/walida-ka-darhi-rakhne-se-mana-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/namaz-ke-ilawa-durood-e-ibrahimi-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/female-student-ka-male-teacher-ko-gift-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/biwi-ko-haiz-mein-hath-se-farigh-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sar-mundwaye-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jahan-insurance-lazmi-ho-wahan-insurance-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/haram-parinde-ka-anda-pani-mein-toot-jaye-to-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chori-ke-connection-se-pani-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/parindon-aur-janwaron-ki-shakal-ke-guldan-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jaifal-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/haram-ke-paison-se-bani-dukan-se-kharidari-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/panda-halal-hai-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jandar-ki-tasveer-wala-calendar-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/baap-ka-baligha-beti-ko-gale-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khatna-mein-baal-na-kate-to-bari-umar-mein-katwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/besan-muh-par-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kafir-shakhs-se-dam-karwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/alcohol-wali-sanitizer-istemal-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-mard-par-chandi-haram-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/baghair-dawat-shadiyon-mein-khana-khaya-to-tu-is-ka-kya-kaffara-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chuha-marne-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/na-mahram-ke-liye-dua-aur-sadqa-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nalain-pak-mein-muqaddas-tehreer-likhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/lakdi-se-bane-parindon-ke-mujassame-ghar-mein-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mathe-par-tika-ya-tilak-lagane-aur-rakhi-bandhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/janwaron-ko-murdar-khilana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/huroof-tahaji-alphabet-wali-shawl-pehanna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bahu-ke-liye-susar-ka-jutha-khana-pina",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/na-mehram-mard-o-aurat-ka-galay-milna-kya-zina-mein-shumaar-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ko-red-color-ka-imama-pehanna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dalail-ul-khayrat-sharif-kon-kon-parh-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hijron-ko-paise-na-dene-se-unki-baddua-lagna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/band-sim-khulwane-par-free-mbs-istemaal-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ivf-ke-zariye-olad-hasil-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kali-mehendi-nakhun-par-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kisi-aadmi-ko-allah-ki-gaye-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/zeenat-ikhtiar-karne-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/peshab-karte-hue-janoob-ki-taraf-muh-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shayari-mein-allah-pak-ko-nabi-ka-aashiq-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aankhon-mein-lens-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/allah-rasool-ke-naam-aur-kaba-ki-tasveer-wale-bartan-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/moti-mein-aankh-bani-hoto-usko-pehanna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/parindon-ke-panje-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghar-ki-deewar-par-bachon-ki-tasveer-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ye-jumla-bolna-kaisa-ya-allah-hum-par-nazar-e-rehmat-farma",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/janwar-ko-hanoot-mummified-karwana-aur-ghar-mein-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/government-ki-mazooro-ko-milne-wali-imdad-ghair-mazoor-ke-liye-lena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nabi-pak-ko-ya-muhammad-pukarna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bacha-diye-baghair-bakri-doodh-dene-lage-to-doodh-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gandi-videos-ke-bajaye-family-shows-dekhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/behan-ko-raqam-ya-koi-cheez-dene-par-sadqa-ka-sawab-miley-ga",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/islamic-toys-se-khelne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-mor-halal-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/firework-ke-shows-dekhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/soodi-raqam-qabristan-ki-tameer-mein-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/paison-ki-shart-ke-bagair-shatranj-khelna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/balon-mein-naqli-balon-ki-chutiya-dalne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/na-mehram-ke-sath-shadi-shuda-wali-zindagi-guzarna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chori-ki-raqam-se-khane-ki-cheez-khareed-kar-bismillah-parh-kar-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghar-mein-teddy-bear-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/pillow-par-naam-print-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/security-guard-ka-baalon-mein-kala-ya-dark-brown-color-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kauwa-doodh-mein-chonch-dalde-to-kya-doodh-istemal-karen",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tasweer-wale-panaflex-lagwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/father-day-aur-mother-day-manane-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/madina-ya-murshid-ke-pas-jane-ke-pese-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dulha-dulhan-par-gulab-ke-phool-nichawar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chandi-ki-mardana-angoothi-ki-repair-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/cricket-teams-se-entry-fees-lekar-tournament-karwane-aur-inaam-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/azan-dene-wali-murgi-khana-halal-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghonghe-snail-mucin-ke-jism-se-nikalne-wali-gel-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khajoor-ki-guthli-par-tasbeeh-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghair-muslim-ke-hath-ka-bana-hua-khana-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/auraton-ka-nakhuno-par-kala-rang-lagana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ke-liye-diamond-ki-anguthi-pehnne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghair-muslim-restaurant-se-machli-wala-burger-aur-chips-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/talaba-ke-darmian-qiraat-ka-muqabla-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dragon-fruit-khane-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/zebra-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/napak-cheez-se-quran-pak-ki-ayat-likhna-jaiz-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/wh-8674-na-qabil-e-istemal-kapron-ko-jalane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/asr-ki-namaz-ke-baad-kapre-dhone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bimar-choza-zinda-halat-mein-billi-ko-khilana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mardana-kapre-se-choti-bachi-ke-kapre-banakar-pehnana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/quran-pak-ke-ghilaf-ya-musalla-dhony-ka-pani-nali-mein-phenkna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/cheating-karne-wale-ki-ustad-ko-shikayat-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/reshmi-kapde-ka-imama-pehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/fajr-aur-maghrib-ki-namaz-ke-baad-sone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/wazan-kam-karne-ke-liye-intermittent-fasting-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bina-license-ke-medical-store-kholna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/zalim-ke-liye-bad-dua-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/graphics-designing-ka-kaam-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bandar-palne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/makkah-mukarramah-aur-madinah-munawwarah-mein-mustaqil-rehaish-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghar-mein-fish-aquarium-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/school-ke-imtihan-ke-liye-advance-fees-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kabutar-ko-dana-dalna-sawab-ka-kaam-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aisa-libas-pehnna-jis-par-sirf-jandar-ke-face-ki-tasveer-ho",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hamster-kombat-game-khelna-aur-coins-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/musalman-aurat-ka-apne-ghair-muslim-bhai-ke-sath-sharai-safar-par-jana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/maggi-noodles-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/deeni-ustad-ko-tohfa-dena-aur-ustad-ka-tohfa-wasool-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/fiqh-ki-kitabon-mein-makrooh-se-makrooh-e-tehrimi-murad-hai-kya",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ilania-gunah-karne-wale-ki-tareef-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khane-mein-lal-baig-keeray-makoray-pak-jayen-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jis-jagah-music-chalta-ho-wahan-naukri-karna-ya-aisi-gari-mein-safar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sadqa-ki-raqam-shajar-kari-muhim-mein-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chhote-ya-purane-kapray-kisi-ko-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hath-ki-zaid-ungli-katwa-sakte-hain-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/apni-cousin-chachi-aur-mumani-se-hath-milana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jis-ki-kamai-ke-halal-ya-haram-hone-ka-yaqeen-nahi-uske-ghar-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/maut-ki-tamanna-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/faut-shuda-shakhs-ki-purani-tasveer-develop-karwa-kar-apne-paas-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jis-kitab-mein-jandar-ki-tasveer-ho-usay-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aloe-vera-khana-ya-aloe-vera-ka-ras-peena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ishtihar-mein-gumshuda-ki-tasveer-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jumma-ke-din-nekiyon-ka-sawab-barh-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ye-jumla-kehne-ka-hukum-ke-wahan-na-adam-tha-na-adam-zad",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/apni-biwi-se-us-ki-pichli-zindagi-ke-bare-mein-pochna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/muharram-ko-muharram-ul-haram-kehne-ki-wajah",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khatna-ke-mauqe-par-mithai-batne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bed-ya-charpai-par-khana-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bazu-ke-baal-saaf-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/pode-nikalne-ke-liye-gamle-torna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-nakhun-par-kali-mehndi-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-halal-janwar-ki-tilli-khana-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/caviar-yaani-machli-ke-ande-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bache-ki-paidaish-par-murawwaja-rasmo-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kapooray-khana-halal-hai-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/larki-ko-quran-kareem-ke-saye-mein-rukhsat-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/karobar-ke-liye-website-bana-kar-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/balon-ki-prp-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ilm-hasil-karne-ke-doran-maut-aane-ki-dua-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kapra-dhone-ke-baad-bareek-ho-jaye-to-pehen-sakte-hain-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/janwar-ki-ojhri-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tambaku-ki-kashtkari-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/farmi-murgi-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chirya-ko-huzoor-ka-ummati-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/makri-khane-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hotel-walon-ka-mukhtalif-logon-ka-gosht-mila-kar-pakana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/choti-bachi-ke-kaan-chidwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jis-ke-haan-beta-ho-beti-na-ho-kya-us-ke-ghar-ka-khana-haram-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghair-qanooni-tarike-se-bahir-jakar-kamai-ki-gai-raqam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/agar-maut-ka-khauf-aaye-to-kya-kiya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jhoot-bol-kar-government-se-imdad-lena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/is-niyat-se-raqam-jama-karna-ke-mushkil-waqt-mein-kaam-aayegi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/allah-ki-rah-mein-sadqa-dene-se-maal-barhta-hai-kya-ye-dunya-mein-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/snails-khana-halal-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghilaf-e-kaba-se-tukra-nikalna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-sirf-durood-e-ibrahimi-he-durood-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-rang-gora-karne-wali-cream-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sadqa-dete-waqt-ki-niyatain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/parinde-ka-naam-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghair-alim-ka-bayan-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/apne-nasab-ko-yaad-rakhna-aur-likhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khana-khane-ke-baad-khilaal-kiya-to-nikli-hui-cheez-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/qalmon-ke-neeche-ke-baal-ghungrale-hone-ki-wajah-se-katna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/strawberry-khana-halal-hai-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/snooker-club-kholne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/current-account-par-free-services-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/roti-par-sabzi-rakh-kar-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chinese-salt-istemal-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-fajar-ke-waqt-kutte-ka-bhonkna-manhoos-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bhai-behan-ka-aapas-mein-musafah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/subah-nihar-munh-pani-peena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/danton-ke-hilne-ki-wajah-se-un-mein-taar-lagwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/na-baligh-ki-nani-dadi-ne-koi-cheez-us-ki-niyat-se-kharidi-to-kya-hukum-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/na-baligh-bache-ka-apni-baligha-behan-ko-eidi-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khawateen-ke-liye-artificial-jewellery-pehnne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-shaitan-insan-ke-khwab-mein-aa-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nafli-sadqa-kis-kis-ko-de-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/barish-aur-aandhi-ke-waqt-tasbih-tahmeed-aur-takbeer-kehna-",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/na-baligh-bacha-ghar-walo-ko-bura-khwab-bataye-tu-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/eyebrows-ke-kuch-balon-par-skin-color-ka-bleach-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nazar-se-bachne-ke-liye-ghar-ke-bahar-naal-ya-seeng-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghar-mein-nabaligh-bache-se-pani-bharawa-kar-peena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ajnabi-mard-se-aurat-ka-apne-kaan-chidwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/eyebrow-ki-microblading-karwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aulad-ke-husool-ke-liye-gadhi-ka-doodh-bator-e-ilaj-peena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/billi-ka-jhoota-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shahadat-ki-ungli-ya-anguthe-mein-anguthi-pehenna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-ye-bad-dua-hai-ke-khuda-aap-ko-gham-se-bachaye",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/soyabean-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-sote-waqt-jism-se-rooh-nikal-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/murghay-ke-milap-ke-baghair-milne-wale-ande-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sood-ke-paise-masjid-mein-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/student-plucking-karwana-jaiz-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ke-liye-sone-ke-tar-se-bana-libas-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/haram-gosht-ka-shorba-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/customers-ke-bache-hue-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/barish-ka-pani-pi-sakte-hain-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/fox-nuts-phool-makhane-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/30-saal-ki-umar-mein-naam-tabdeel-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aamil-bataye-ke-falan-rishtedar-ne-jadu-kiya-hai-tu-yaqeen-karein-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hathi-daant-se-bane-zewar-pehanna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aasman-ki-tarah-zameen-bhi-7-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/musibat-ki-wajah-se-marne-ki-dua-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kisi-aadmi-ko-rabbani-keh-kar-bulana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hazrat-yusuf-ki-beti-ka-naam",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/makhsoos-tadad-mein-parhe-jane-wale-wazife-ko-ziyada-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ilaj-ke-tor-par-doodh-peete-bache-ko-makhi-ka-par-khilana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khushboo-laga-kar-qabristan-jana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khwab-mein-nabi-kareem-ki-ziyarat-ho-to-dosron-ko-batana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kafir-ya-badmazhab-ko-dekh-kar-musibat-zada-ko-dekh-kar-parhne-wali-dua-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/apne-student-ko-daad-dene-ke-liye-taali-bajana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/murawwajah-qawwali-karwane-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/lakwe-ki-bimari-mein-jism-par-kabootar-ka-khoon-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/musalman-aur-momin-mein-kya-farq-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chhabri-mein-khana-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-maldar-logon-par-maal-ka-panchwan-hissa-sadat-ko-dena-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kul-kitne-hazar-aalam-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghar-mein-mojood-bairi-ka-darakht-katna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghar-mein-khargosh-palna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/asr-ke-baad-sone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shariat-tarikat-haqiqat-aur-marifat-kise-kehte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-chipkali-ko-marna-sawab-ka-kaam-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-8-gram-ki-chandi-ki-anguthi-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/majlis-mein-nabi-pak-ke-zikr-ke-baad-durood-na-parha-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dua-mangne-ya-tauba-karne-ke-baad-aisa-lagna-ke-dua-ya-tauba-qubool-nahin-hui",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kawwe-ko-khana-khilana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-jinnat-insan-ko-nuksan-pahuncha-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/laila-majnu-ka-waqia-durust-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ilaj-ke-liye-apna-peshab-pina-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/white-wine-vinegar-istemal-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ilm-e-deen-hasil-karte-hue-faut-hone-ki-fazilat",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nazar-bad-se-bachne-ke-liye-ghar-ki-chhat-par-siyah-handya-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jim-mein-warzish-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jumma-mubarak-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/is-tarah-bethna-ke-kuch-hissa-dhoop-mein-ho-aur-kuch-saye-mein",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mardon-ke-liye-dam-kiya-hua-challa-pehnne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-har-hashmi-syed-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khwateen-ka-eyebrows-ko-bleach-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jale-hue-chehre-ki-surgey-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/school-walon-ka-baligh-ladkiyon-ko-picnic-par-le-kar-jana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/batakh-ka-anda-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dadhi-mondne-wale-nai-ke-ghar-khana-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jaye-namaz-par-apna-naam-likhwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/octopus-khana-halal-hai-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chiyontiyan-bohat-ziyada-hon-jin-se-kaafi-pareshani-ho-to-kya-kya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/oystar-seep-khana-aur-seep-ka-soup-peena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/taboot-e-sakina-mein-tasaweer-mojood-thi-tu-kya-islam-mein-tasaweer-jaiz-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-o-aurat-ka-hath-paon-aur-chehre-ke-baal-saaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghar-walo-ko-khana-khilane-mein-sadqa-ki-niyat-karsakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/pan-gutka-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/w-6632-washroom-mein-bartan-dhona-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/islami-mahino-ke-names-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-gunahgar-musalman-ke-liye-bad-dua-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-gadhi-ka-doodh-dawa-ke-tor-par-pina-halal-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/toote-hue-bartan-mein-khana-peena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/doodh-mein-pani-mila-kar-bechna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/laser-ke-zariye-jism-ke-gair-zaroori-baal-katna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hathi-ki-haddi-wale-dore-kharid-kar-bandhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bone-china-bartan-istemal-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/motapa-kam-karne-ke-liye-bariatric-surgery-karwane-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kangi-karte-waqt-toot-jane-wale-baal-jalana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/biwi-ka-apne-hath-se-shohar-ko-farigh-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/eye-liner-lagana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shadi-ke-moqe-par-hone-wali-ek-rasam-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/napak-kapron-mein-tilawat-aur-zikr-o-azkar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/murge-ke-khusye-khana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sadaqah-box-mein-ghair-mulim-raqam-dal-de-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jiski-income-halal-aur-haram-dono-tarah-ki-ho-uski-dawat-mein-jana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/janwar-ko-mota-karne-ke-liye-sharab-pilane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghar-mein-dakhil-hone-ki-jagah-kabutar-ne-ghosla-banaliya-tu-usay-hatana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sadqay-ka-gosht-kon-kon-kha-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bache-ki-shikayat-us-ke-walid-se-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/diwali-ki-mithai-khana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/janwar-ko-khassi-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mushrik-munafiq-aur-kafir-mein-farq",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-baap-shareek-behan-se-parda-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mareez-ko-gadhi-ka-doodh-pilana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghar-mein-kabootar-palna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gas-wala-compressor-istemal-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghair-muslim-doctor-se-ilaj-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/salam-ka-shortcut-aoa-ya-ws-likhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/maghrib-ke-baad-bachon-ka-ghar-se-bahar-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghair-zaroori-baal-hamesha-ke-liye-khatam-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/talak-ke-baad-susar-mehram-rahega-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bahu-ka-susar-ke-sath-safar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gumbad-e-khazra-aur-kaba-sharif-mein-se-afzal-kaun",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jannat-mein-kin-logon-ki-tadad-sab-se-ziada-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nakli-nakhun-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/miyan-biwi-ka-ek-dusre-ki-sharmgah-dekhna-chona-aur-chumna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/haram-maal-masjid-ke-liye-lena-aur-istemal-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kaba-sharif-roza-e-mubarak-aur-mazarat-ki-tasveer-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aloe-vera-kawar-gandal-ka-istemal-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/muslim-ko-gair-muslim-ka-khoon-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/drawna-khwab-nazar-aaye-to-us-par-kya-karna-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/naik-logon-par-azmaish-kyun-aati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/balam-bin-baura-aur-ashab-e-kahf-ka-kutta",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/10-muharram-ko-kapre-dhona-aur-nahana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/machli-ko-murdar-murgi-ka-gosht-khilana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-duniya-ke-miyan-biwi-jannat-mein-ek-sath-honge",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-shaitan-pehle-muallim-ul-malakoot-farishton-ka-ustad-tha",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mayoosi-ke-asbab-aur-unka-ilaj",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/raat-ko-salan-dhanp-kar-na-rakha-ho-tu-usay-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gair-sahabi-ke-sath-taraddi-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gusse-ka-ilaj",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/walidain-ki-bad-dua-ka-asar-hota-hai-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bahut-gunah-karne-wale-ka-roza-rasool-par-hazri-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/duniya-aur-akhirat-ke-gham-se-azad-hone-ki-dua-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/murgi-ki-khal-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shadi-mein-anar-jalana-bhi-aatishbazi-mein-shamil-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/naak-ke-baal-katne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jannat-mein-jannati-aurtain-ziyada-khubsurat-hogni-ya-phir-jannati-hoor",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ilm-e-jafar-kya-hai-aur-ilm-e-jafar-ki-sharai-haisiyat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-half-trouser-half-pant-or-nekar-pehenna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/2-behno-ki-rukhsati-ek-hi-din-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chehre-ke-bagair-janwar-ki-tasveer-banana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/koh-e-qaf-ki-haqeeqat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hazrat-adam-ki-umar-kitni-thi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kisi-ke-samne-apna-khwab-bayan-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tabieen-aur-auliya-e-kiram-ke-namo-ke-sath-taraddi-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kawe-ki-iqsam-aur-un-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/zibah-ke-waqt-murghi-se-nikalne-wale-ande-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghair-muslim-naukar-se-gosht-mangwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-bari-aur-choti-gardan-wali-dono-tarah-ki-batakh-halal-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/teachers-day-manana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/pangasius-basa-aur-catfish-machli-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/lagar-bagar-aur-chipkali-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bansuri-bajana-aur-sunna-sunana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-janwaron-ke-gurday-khana-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sadqa-ki-niyat-se-alag-ki-gai-raqam-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sadqa-karte-waqt-kya-niyat-honi-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-chand-par-jana-mumkin-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sood-khane-wale-ke-ghar-khana-peena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khwab-mein-milne-wali-khilafat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-asar-ke-baad-parhna-likhna-mana-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ilm-e-ladunni-ki-dua-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ilm-e-najoom-ki-tareef-iqsam-aur-hukum-neez-ilm-e-touqeet-ki-hesiyat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jannat-ul-baqi-mein-dafan-hone-ki-dua-kyun-ki-jati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/insan-ke-sir-ke-balon-ko-gandagi-mein-phenkna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ke-liye-gold-ki-ghadi-pehna-aur-us-mein-time-dekhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kisi-ki-wafat-ke-baad-us-ke-zinda-hone-ki-dua-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/godh-bharai-ki-rasam-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gunahgar-shakhs-par-aane-wali-bimari-aur-pareshani-se-gunah-maaf-hona",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/rozi-mein-barkat-ka-wazifa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/noha-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hiran-ka-gosht-khana-aur-us-se-kastoori-hasil-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dukan-mein-kapron-wali-dummy-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jis-kaam-ka-jaiz-ya-na-jaiz-hona-maloom-na-ho-tu-us-ke-mutaliq-foran-pochne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/cbd-oil-chars-ke-patton-ka-oil-istemal-karna-kasia",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hazrat-adam-ki-takhleeq-jis-mitti-se-hui-us-par-gham-aur-khushi-ki-barish",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mah-e-muharram-mein-ghar-ki-safai-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kachi-machli-fish-khana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mehndi-se-hath-par-shohar-ka-naam-likhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khinzir-ke-gosht-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/haram-maal-kisi-ghareeb-ko-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/cards-game-tash-khelna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dimpleplasty-surgery-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mardon-ka-mardana-hairband-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sachi-tauba-karne-ka-tarika-aur-tauba-sab-ke-samne-ki-jaye-ya-akele-mein",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-eye-brow-banana-gunah-e-kabeerah-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hazrat-ismail-ke-badle-aane-wala-mendha-jannati-tha-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/halal-janwar-ke-gurde-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghusl-e-mayyat-ki-jagah-par-mom-batti-jalana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/apne-liye-beemari-ki-dua-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/raat-mein-safar-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/maghrib-ke-baad-nakhun-katne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jinnat-ko-qabu-kar-ke-un-se-kaam-nikalwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-kutte-ko-khana-dene-se-naik-amal-zaya-hote-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kisi-dost-se-kaha-ke-kal-aap-ke-ghar-aaunga-tu-kya-yeh-wada-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/baghair-music-ke-gana-gane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dar-ul-harb-ki-tareef-aur-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ke-liye-lipstick-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-kisi-bache-ka-khatna-shuda-paida-hona-mumkin-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/fake-documents-de-kar-visa-banwana-aur-student-visa-par-full-time-kaam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/salgirah-birthday-ki-dawat-qubool-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nafs-aur-us-ki-iqsam-ke-mutaliq-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-platinum-ki-anguthi-pehnna-aur-aurat-ko-gift-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gunahgar-walid-ki-itaat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/visa-kisi-aur-kaam-ka-aur-kaam-koi-aur-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/motivation-wali-videos-banana-islam-mein-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shohar-ke-samne-kuch-dair-ke-liye-nail-polish-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kisi-ko-apna-gurda-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-tasme-laces-wale-joote-pehenna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-na-mehram-aurat-se-baal-katwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/pak-o-hind-mein-shumal-ki-taraf-paon-phelana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chand-fiqhi-istilahat-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ke-liye-ladies-chappal-pehnne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/allah-pak-ki-ibadat-ke-liye-sab-se-pehle-khana-kaba-tameer-kiya-gaya",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shadi-ke-moqe-par-doodh-pilai-ki-rasam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/juma-ke-din-safar-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/zarorat-ke-waqt-ghair-muslim-ka-khoon-musalman-ko-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/paltu-billi-ke-nakhun-katna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mashroom-khambi-khane-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-apni-mehram-ke-kin-aaza-ko-dekh-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jis-shampoo-mein-alcohol-shamil-ho-us-ka-istemal-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ganja-peene-ka-kya-sharai-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bimar-shakhs-ke-sar-par-kala-bakra-ya-siyah-murgha-war-kar-sadqa-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/janwar-ki-haddi-khana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khal-sameet-gosht-khana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sharab-ke-ilawa-dusri-nasha-awar-cheezon-ki-hurmat",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/munh-dikhai-ki-rasam-aur-us-ki-raqam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/number-aur-naqsh-wale-taweez-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dil-mein-zikrullah-karne-par-sawab-mile-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nafil-namaz-aur-deeni-masail-ke-mutalia-mein-se-kya-afzal-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sahib-e-haisiyat-shakhs-ka-masjid-mein-iftari-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kisi-kafir-se-dam-karwana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/moozi-janwaron-ko-jalana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/qurani-ayaat-wale-products-chabi-latkane-ke-liye-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/blood-donate-karne-aur-body-parts-donate-karne-mein-sharai-hukum-ka-farq",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/larkon-wali-hat-larkiyon-ko-pehnana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kisi-ke-status-par-lagi-riwayat-ko-apne-status-par-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ullu-ke-gosht-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-waiter-ko-tip-ki-raqam-tamam-staff-mein-taqseem-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khare-ho-kar-peshab-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-surkh-libas-pehnna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jawan-saas-aur-jawan-damad-ka-parda",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hotel-kaife-aur-restaurant-mein-waiter-ko-tip-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/islam-mein-pait-ke-bal-sona-ya-laitna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/farzi-tajriba-certificate-banawana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghair-muslim-ke-restaurant-se-veg-pizza-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/halal-rizq-mein-barkat-kaise-ho",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/magarmach-khane-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mardon-ka-shoqia-naak-aur-kaan-chidwana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/pani-na-hone-ki-wajah-se-marne-wali-machli-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-makeup-karane-ke-liye-beauty-parlour-jana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dawai-ke-tor-par-kisi-janwar-ka-peshab-peena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-hath-aur-paon-mein-wax-karwana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-aurat-ka-sar-par-imama-bandhna-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-musalman-aurat-ke-liye-saree-pehnna-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/raat-mein-nakhun-katna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/beemari-ka-ilaj-na-karwana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-tang-pajama-pehen-kar-bahir-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-full-body-wax-karwana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ke-pichle-maqam-mein-hambistri-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hafte-ke-din-machli-khana-aur-shikar-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/muharram-aur-masjid-ko-al-haram-kehne-ki-wajah",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ke-liye-nose-ear-me-aik-se-ziyada-hole-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/taweez-ke-badle-paise-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shohar-ke-inteqal-ke-baad-iddat-mein-zewrat-pehnne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/doran-e-iddat-sar-ke-balon-mein-tail-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/doran-e-iddat-zaib-o-zeenat-ke-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-sone-ya-chandi-ka-taaj-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/danto-se-nakhun-kutarne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sone-ki-ghadi-pehnna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-mardana-anguthi-pehnne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-aur-aurat-ka-platinum-ki-anguthi-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-chandi-ki-anguthi-mein-chandi-ka-nag-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-anguthi-mein-konsa-nagina-pehen-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/das-bibiyon-ki-kahani-parhna-sunna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/agar-muhr-lagane-ki-hajat-na-ho-tu-mard-ke-liye-angothi-pehnne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-pazeb-ya-ghungroo-pehnna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-aur-aurat-ke-liye-bracelet-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/abdul-qadir-ko-sirf-qadir-keh-kar-pukarna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tv-par-cricket-match-dekhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-mard-ke-liye-zakhm-par-mehndi-lagana-hadees-se-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-ilaj-ke-liye-paon-mein-mehndi-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-aur-na-baligh-larkon-ke-liye-mehndi-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-ghair-zaroori-baal-saaf-karne-ke-liye-ustra-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-hath-paon-bazu-aur-tango-ke-baal-saaf-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-terhi-pasli-se-bani-hai-ya-mitti-se",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-khubsurti-ke-liye-apne-kuch-baal-peshani-par-dalna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-balon-ko-barabar-karne-ke-liye-sirf-peshani-ke-baal-katna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-kandhe-se-upar-baal-katwane-aur-is-ki-ujrat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-sar-ke-baal-katna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/moche-kitni-bareek-honi-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/moochain-bilkul-saaf-karne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-sar-ki-sidon-se-baal-chote-aur-upar-se-baal-bare-rakhna-mana-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bakray-ya-gaay-ke-paye-jo-jala-ke-saaf-karte-hain-un-ka-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/masnoi-wig-lagane-aur-balon-ki-pewand-kari-karane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/injection-ke-zariye-baal-kale-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ke-liye-dandasa-istemal-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chehre-par-surme-se-til-banana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-cream-se-rang-gora-karna-ya-make-up-se-chehra-badal-dena-musla-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ke-liye-kajal-lagana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ke-liye-kala-surma-lagana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khubsurti-ke-liye-chehre-ki-surgery-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/fasiq-o-fajir-mein-kya-farq-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khawateen-ka-contouring-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/eyebrow-aur-palkon-ke-balo-ko-color-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/pant-shirt-pehnne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-o-aurat-ke-liye-churidar-pajama-pehnne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ke-liye-takhne-chupane-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bache-ko-walidain-ya-rishtedar-koi-cheez-dain-to-kiya-wo-cheez-kisi-aur-ko-de-sakte",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-aurton-ko-saree-pehnna-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ke-liye-half-aasteen-wala-libas-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-collar-wali-kameez-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-silk-aur-velvet-pehnna-aur-bachon-ko-reshmi-kafan-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-pant-shirt-pehnna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ke-liye-tang-aur-chust-libas-pehnne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/lehnga-pehnna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khas-kuffar-ya-fussaq-ki-tarz-ka-libas-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kala-libas-pehnne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/janwar-ke-cartoon-wale-kapre-bachon-ko-pehnana-kasia",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jandar-ki-tasweer-wale-kapre-bachon-ko-pehnana-aur-in-ki-khareed-o-farokht-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ke-liye-sone-ke-button-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/reshmi-kapre-ka-hukum-aur-mard-ka-stone-wash-silk-waghaira-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kalaf-wala-libas-aur-tang-libas-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/driving-test-pass-karne-ke-liye-rishwat-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jis-restaurant-mein-halal-aur-haram-khane-hon-us-ke-order-book-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tambe-aur-peetal-ke-bartan-mein-khana-khana-ya-pani-pena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-karhai-wala-coat-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/rakhi-bandhna-aur-bandhwana-kaisa-aur-sharai-hukum-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/din-ke-waqt-murga-azan-de-tu-is-ko-bura-samajhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ilaj-ke-liye-beer-bahuti-ke-tail-ki-malish-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gari-ki-chabiyon-wala-chhalla-pehenna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jannat-ki-ghiza-mein-kon-kon-si-ashya-shamil-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ande-ka-chilka-dawai-ke-liye-istemal-karna-kasia",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shohar-ka-halat-e-haiz-mein-biwi-ki-sharamgah-chhona-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/allah-nabi-par-durood-parhta-hai-ye-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sex-toys-se-jinsi-taskeen-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/asar-ki-namaz-ke-baad-khana-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/maa-baap-ka-kisi-rishtedar-se-qata-taluq-karne-ka-ka-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kapre-ki-dukan-par-kapron-wala-putla-statue-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kekra-jhinga-aur-tiddi-khane-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/vaseline-istemal-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-jali-hui-roti-khana-gunah-hai-jali-hui-roti-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/awara-kutta-nuqsan-pahunchata-ho-tu-usay-marne-ka-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/wh-4549-shohar-ka-apni-biwi-ko-khoon-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/darindon-jaise-sher-aur-cheete-ki-khal-par-baithna-gunah-hai-kya",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/regmahi-ghiza-ya-dawa-ke-liye-khane-ka-huukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khak-e-shifa-kya-hai-aur-ise-istemal-karne-ka-kia-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kisi-ke-darakht-se-miswak-ke-liye-tehni-ya-beri-ke-patte-torna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/boxing-khelna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/moe-mubarak-ghar-me-rakhna-kaisa-holy-hair-in-house",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/itikaf-ki-halat-me-dars-dena-mutala-karna-ya-ilm-sikhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/saib-se-bana-hua-sirka-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-insani-balon-ki-wig-laga-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jari-booti-laga-kar-safaid-balon-ko-kala-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kisi-ke-liye-bad-dua-karne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/washroom-me-khare-ho-kar-kapre-badalna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/salaib-wala-locket-banana-bechna-aur-tashheer-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-baal-katna-in-islam-mard-ke-liye-ko-konse-baal-katne-ka-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sanda-khane-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shehed-ke-chatte-se-hasil-hone-wala-mom-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-bund-ghadi-lagane-se-pareshani-aati-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/allah-pak-ko-ustad-kehne-ka-sharai-hukum-teacher-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ayatul-kursi-parh-kar-dam-karne-se-nazar-e-bad-utarne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dusre-ke-darakht-par-lagne-wale-shehed-ka-kaun-malik-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/safar-mein-apne-sath-quran-pak-rakhne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mayon-ka-jora-shadi-ke-baad-pehenna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mukhtasar-durood-sharif-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/toothbrush-karne-se-pehle-bismillah-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khawab-ki-tabeer-aur-in-ki-haqiqat-in-islam-khawabon-ki-haqiqat",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/laser-waghera-ke-zariye-bachon-ka-khatna-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ke-liye-shohar-ke-kapre-pehnne-ka-hukum-libas-ke-aadab",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hair-removel-cream-kya-mard-istemal-kar-sakta-hai-hair-removel-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/doctor-ke-suggest-par-ultrasound-se-larka-larki-maloom-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shark-machli-khana-kasia-hai-in-islam-fish-khana-jaiz-hai-ya-na-jaiz",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-apne-shohar-ke-hukum-par-sar-ke-baal-katna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mangetar-se-phone-par-baat-karne-ka-kya-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/saanp-ko-marne-ka-hukum-in-islam-saanp-ko-jalane-ka-hukum-saanp-ko-qatal-krne-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/school-walo-ka-bacho-se-zabardasti-paise-talab-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/qabar-par-phool-aur-sabza-ugane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-resham-ke-kapde-pahnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ajnabi-mard-aur-aurat-ka-musafa-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/musalman-ko-tohfa-dene-par-sawab",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghar-me-janwar-wale-khilone-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/biwi-ka-apne-naam-ke-sath-shohar-ka-naam-lagna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sim-nikalne-par-milne-wale-free-minutes-aur-messages-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/murgh-ke-khoon-se-taweez-likh-kar-dena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-sehen-me-bair-ka-darakht-laga-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shadi-me-nach-gana-karne-aur-isme-shirkat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bacho-ki-poem-gungunana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bura-khwab-dekhne-ki-soorat-mein-kia-kia-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/amanat-ke-paise-malik-ki-ijazat-ke-baghair-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ethical-hacker-ka-kisi-company-ka-system-hack-kar-ke-paise-kamana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/surgery-mein-cauterization-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-balon-ki-safai-ke-liye-waxing-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chote-bache-ya-bachi-ke-sitar-parde-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/imtihan-mein-naqal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/786-kya-hai-aur-isko-likhne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-biwi-bagair-ijazat-shohar-ke-mobile-me-whatsapp-messages-check-karsakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ke-sath-gale-milna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/pubg-game-khelna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/noor-nama-parhna-jaiz-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sharabi-ke-andaz-se-pani-peena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/billi-ke-rone-ko-manhoos-samajhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khane-mein-lal-beg-ya-machar-gir-jaye-to-is-khane-ka-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghar-me-billi-palne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chutti-karne-par-fine-lena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-mard-copper-ki-anguthi-phen-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/durood-e-pak-ko-short-kar-k-likhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/apni-behan-ko-sadqa-dena-aur-waldain-ka-is-se-se-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/zarafa-halal-hai-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ke-liye-bajne-wala-zewar-pahanne-mein-ehtiyat",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/train-me-bagair-ticket-safar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/asma-ul-husna-ki-wazhat-aur-fazeelat",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tamam-musalmano-ke-liye-maghfirat-ki-dua-ki-fazeelat",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jabri-insurance",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kachua-mili-hui-dawa-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/logon-ke-whatsapp-status-dekhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/doodh-bakhsne-maaf-karne-ki-rasam",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/likhi-hui-gaali-parh-lene-se-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aam-momineen-ke-liye-laghzish-ka-lafz-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/wazaif-me-kam-az-kam-kitni-awaz-hona-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/non-muslim-ko-us-ki-ibadat-gaah-ka-pata-batana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/na-baligh-larke-ko-sone-ki-anguthi-pehnana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kawa-crow-khane-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/musalman-ko-yajooj-majooj-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-gold-ya-silver-ki-kanghi-istemaal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hamal-ki-halat-me-biwi-se-humbistari-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bichhoo-khana-halal-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ajinomoto-khane-ki-ashya-main-istemaal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kisi-insan-ko-farishta-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/baghair-awaz-wali-paazeb-pehen-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/murgi-ke-panje-ka-salan-paka-kar-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mitti-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/haqqa-ke-khudawand-do-alam-hai-muhammad-ka-sharai-hukam",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/waqt-dekhne-ke-liye-aurat-ka-sone-ki-ghadi-pehenna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/digital-cartoon-banane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-aurat-ka-kanch-ki-chodiyan-pehenna-zaruri-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/paise-mila-kar-khana-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-biwi-apne-shohar-ka-naam-le-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/istarah-dua-dena-kaisa-allah-apko-umr-e-khizri-ata-farmaye",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/suar-ka-naam-lena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/maina-lali-khana-halal-hai-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/duran-e-ibadat-riyakari-ke-khayalat-aaye-to-kya-karna-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tax-lene-aur-dene-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/app-ke-zariye-face-bigarna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bin-bulaye-dawat-e-walima-me-jane-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/janwar-ke-siri-paye-khal-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-makrooh-e-tanzihi-gunah-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-har-be-jaan-cheez-allah-ka-zikr-karti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-janwar-ki-birth-control-ki-surgery-kar-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/konsi-baddua-qabool-hoti-hai-aur-konsi-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ke-liye-boski-kapra-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hath-par-cut-lag-jaye-to-mehndi-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-eyebrow-banawana-aur-therading-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ke-liye-reshmi-kapra-pehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tie-bandhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gair-muslim-se-bache-ka-khatna-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shadi-me-haldi-ki-rasam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dam-ya-bagir-dam-wala-kala-dhaga-bandhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/halal-janwar-ki-but-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/yasrab-ka-matlab-aur-madina-ko-yasrab-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/larkion-ka-youtube-par-naat-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/professional-bhikhari-ka-mangna-aur-baddua-ke-dar-se-ise-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/waldain-darhi-rakhne-ki-ijazat-na-den-to",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sab-musalmano-ke-liye-be-hisab-magfirat-ki-dua-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dant-nikalwane-ke-bad-khoon-halaq-se-niche-utar-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/musafir-mard-ka-business-ke-liye-sona-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ek-lakh-chobis-hazar-124000-ambiya-kam-o-paish-kehna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/eyebrow-banana-aur-hath-paon-ke-baal-saaf-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hashmi-syed-kon-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-paon-ke-talwe-par-mehndi-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shadi-ka-khana-ghar-le-kar-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nazar-lagne-ki-sharai-haisiyat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/afiyoon-wali-medicine-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mochain-itni-lambi-rakhna-ke-pani-peete-hue-bartan-me-jayen",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sab-musalmano-ke-liye-behisab-bakhshish-ki-dua-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sharaab-ke-sirke-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sahabi-ke-naam-ke-sath-taraddi-aur-wali-ke-naam-ke-sath-tarahhum-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sona-chandi-ke-bartan-mein-khana-peena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bhang-wali-dawai-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nafli-sadqa-khud-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/electric-bat-se-machar-marna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/carrom-board-khelna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/pani-ki-kami-ki-wajah-se-marne-wali-machli-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jhinga-khana-halal-hai-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/darhi-kitni-honi-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sharab-ko-dawai-ke-tor-par-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/muhajir-aur-ansar-sahaba-kaun-hain",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chandi-ka-nalain-pak-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/alcohol-mili-beauty-cream-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/haiz-mein-condom-ke-zariye-hambistri-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bachi-ko-payal-pehnana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/v-2200-ghair-mehram-mard-aur-aurat-ka-apas-me-hansi-mazak-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gair-haji-ko-haji-keh-kar-pukarna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ludo-game-khelna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/rukhsati-ke-waqt-dulhan-ke-sar-par-quran-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-aurat-ko-ya-aurat-ka-mard-ko-makeup-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dental-scaling-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dua-ka-sila-naslon-se-milna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/wh-2009-kalma-shareef-ke-sath-darood-pak-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-kali-mehandi-hathon-per-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khatme-quran-ke-moqe-par-mithai-waghera-bantna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ke-liye-kadai-kya-hua-libas-pehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/machli-ke-pait-se-nikalne-wali-machli-halal-hai-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/barf-se-insan-aur-janwar-ke-putle-banana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/halal-janwar-ke-paye-khal-ke-sath-pakana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-jism-ke-baal-saaf-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/imam-zamin-bandhne-ki-haqeeqat",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/surprise-dene-ke-liye-galat-taruf-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/cake-par-tasveer-banana-ya-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sadaat-aur-ulma-mein-afzal-kon",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/syed-ko-sadqa-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/qabar-mein-durood-pak-ya-ahad-nama-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/alim-ya-buzurg-ko-qibla-o-kaba-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khane-mein-khatmal-ghir-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/cigarette-pina-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghair-muslim-ko-qurani-taweez-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ladki-ke-chehre-par-daane-ho-us-ki-surgery-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/lal-baig-wagaira-ko-marna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/fasiq-e-muallin-ki-tareef",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mardana-chandi-ki-angothi-ke-wazan-me-khalis-chandi-motabar-hai-ya-milawat-bhi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/koi-rishtedar-qata-taluqi-par-majboor-kare-to-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/paltu-billi-ko-bache-na-hone-ka-injection-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dant-gir-jaye-to-dusra-dant-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/islami-behno-ka-gold-ya-silver-ka-naqsh-e-nalain-ka-batch-pehanna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/message-forward-karne-per-khushkhabri-milne-wale-message-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/larki-ka-zina-se-bachne-ke-liye-khudkushi-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gym-par-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/taweez-par-bache-ka-peshab-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-mardana-kapre-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nomolood-ke-baal-chalis-din-baad-utarna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mobile-par-ludo-khelna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-afshan-powder-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ashura-ke-din-surma-lagane-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/safar-ke-aakhri-budh-ko-khushiyan-manana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mobile-se-taqreer-delete-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chess-khelna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kala-jadu-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/paiso-ki-shart-ke-sath-ghore-ki-race-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jis-valime-me-music-ho-wahan-shirkat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/14-saal-ke-bache-ke-sath-mahrama-ka-safar",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghari-se-bad-shuguni-lena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/konsi-tasveer-banana-jaiz-or-konsi-naa-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hand-carry-me-quran-tafseer-aur-digar-islami-books-le-jana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/masnooi-alaat-se-jinsi-haq-pora-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/saman-ki-advertisement-ke-liye-be-parda-tasvir-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ke-liye-chandi-ki-anghuti-ke-wazan-me-stone-shamil-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/visa-lagwane-ke-paise-de-kar-age-bharwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/wedding-anniversary-manana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/behan-ko-sadqa-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghair-muslim-mardo-ki-darhi-mundna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bad-shuguni-lena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jawan-aurat-ka-chacha-se-musafa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/pichli-sharamgaah-ke-baal-saaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jis-water-park-mein-bepardagi-ho-wahan-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-darhi-moch-ke-baal-utarwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bacho-ko-picture-wale-kapre-pehnana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-metal-ki-choriyan-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/birthday-photo-cake-jandar-ki-tasweer-wala-banana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shoqia-parindey-palne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/alcohol-wali-dawai-ka-istemal",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/oral-sex-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/lambe-balon-wale-mard-ka-poni-dalna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/biwi-ka-shohar-ke-liye-makeup-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/pait-me-ladka-hai-ya-ladki-ultrasound-se-maloom-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/halal-janwar-ki-khal-khane-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mug-par-customer-k-photo-bana-kar-sale-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/murgi-ka-pota-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/choty-bachon-ko-gold-ka-zewar-phenana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chehray-per-moujood-masah-nikalwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kya-animation-cartoon-banana-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghori-ka-doodh-aur-gosht-halal-or-haram",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/goh-khane-ka-shari-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-o-aurat-ke-liye-angothi-pehanna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/imam-hussain-ka-faqeer-banana-aur-pese-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kaan-naak-hont-waghaira-mein-baliyan-pehnne-aur-wazu-ghusal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bay-parda-aurton-ko-training-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dance-sikhane-walay-school",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/qabar-par-qabar-banana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mitti-ke-ilawa-bartan-istemal-kiye",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/allah-ke-naam-par-mangna-aur-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/qabristan-mein-sadaqe-ka-gosht-phenkna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/gurda-aur-pitta-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bache-ki-jins-maloom-karne-ke-liye-ultrasound-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/medical-talaba-ka-insani-lash-par-tajurba-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/parindon-ya-janwaron-ke-liye-gosht-chhat-par-dalna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mangne-wale-faqiron-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mustamal-pani-peene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/qibla-ki-taraf-tange-phelana-aur-thookna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ilaj-ke-liye-taweez-jalana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/janwaron-ko-apas-mein-larwana-tamasha-dekhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bheriye-ki-khal-se-bani-jacket-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/balon-me-color-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mangetar-ke-sath-ghoomna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurad-wazaif-me-mashghool-ko-salam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/anguthi-par-taweez-nad-e-ali-kalmat-likhwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/khargosh-halal-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shadi-hall-ke-staff-ka-shadi-ka-khana-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/naye-saal-ki-khushi-manana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/anguthi-par-muqaddas-naam-likhwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-khatam-shareef-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/danthon-mein-clip-lagwana-ya-ghiswana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dukan-par-bhool-jane-wali-cheez-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mah-e-safar-akhri-budh-galat-nazariyat",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/sharai-wazan-se-ziyada-mardana-anguthi-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/biwi-ke-kehne-par-darhi-ek-muthi-se-choti-karna-ya-mundwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/saving-account-khulwana-aur-profit",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/v-1070-imam-zamin-bandhna-kasia-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/muharram-mein-fatiha-khawani",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/giri-hui-cheez-sadaqah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jashn-e-azadi-kaise-manayen",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chehre-par-colour-face-painting-karna-kasia-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurton-ka-bareek-lawn-ke-kapre-pehanna-6532",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chandi-ki-2-anguthiyan-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/pani-ki-kharid-o-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/anguthi-mein-nagina-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nabaligh-ladkon-ke-kan-mein-baliyan",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nomolod-bachon-ko-ghutti-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ke-liye-lohe-tanbe-aur-peetal-ki-anguthi-pehnna-aur-is-halat-mein-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/insurance-karwana-kaisa-6826",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/arabi-ke-kaghazaat-ko-becha-jaye-ya-jalaya-jaye-6205",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/taziyat-kitne-dinon-tak-kar-sakte-hain-6440",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/muqaddas-maqamat-ki-taraf-pith-kar-ke-tasveer-banana-8604",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/masjid-ki-diwaron-par-tasveer-wale-ishtehaar-lagana-6874",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mardo-ko-karhai-walay-kapray-pehen-na",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mirchoon-say-nazar-utarna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mulk-me-gair-qanooni-rehna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/lanat-karne-ka-hukum-9075",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ro-plant-ka-hukm",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jumarat-day-din-dua-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mardana-libas-swetar-pehen-na",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/electric-cigarette-kya-hai-6392",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/874",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/patang-urana-aur-bechna-8268",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/chiragan-dekhne-aurton-ka-ana-8085",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mah-e-safar-ka-aakhri-budh-12107",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kastori-wali-dawai-khana-9556",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ko-na-mehram-ka-khoon-charana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghutti-denay-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/safed-balon-par-color-1461",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/wc-ya-commode-ka-rukh-9459",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shaheed-quran-pak-6243",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kafir-company-se-insurance-karwana-02",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/peshani-per-teeka-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dhobi-ko-kapron-se-paise-milna-1295",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jummah-kay-din-kapray-dhona",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jumma-ke-din-kapre-dhona-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/cigarette-mein-nasha-mila-kar-peena-5229",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ultrasound-karwana-1264",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/biwi-ka-apne-naam-ke-sath-shohar-ka-name-lagana-4809",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/musalman-ka-libas-kaisa-ho-6331-c",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghar-mein-buzurg-ki-tasveer-lagana-1325",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/charaghan-dekhne-ke-liye-nikalna-5426",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/naye-saal-ki-khushi-manana-4286",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/insha-allah-likhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/2-peeron-ka-mureed-hona-5139",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bakra-sadqa-karna-8289",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/cake-par-tasveer-banana-6476",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dewar-aur-jeth-say-parda",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/muharram-mein-shadi-karna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/salgirah-manana-cake-katna",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/damad-kay-liye-mehram",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kaan-me-azan-kay-fawaid",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/safar-rabi-ul-awwal-tameerat-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-dhaage-ya-oon-ki-chutiya-lagana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kitabain-aur-kapre-sadqa-karna-1015",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-artificial-palkain-lagana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-aurat-ke-kapre-jote-aur-deegar-ashya-istemal-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/hijama-sunnat",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/daff-aur-zikrwali-naat-khwani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-kahan-tak-zeenat-ikhtiyar-kar-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/darhi-katwane-wale-ko-peer-banana-6352",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tohfa-ki-raqam-ka-mutalba-karna-6375",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ko-talwon-me-mehndi-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mobile-quran-app-quran-washroom-lejana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/juma-aur-eid-aik-he-din",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jism-par-tattoos-banane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/lipstick-lagana-aur-is-mein-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/aurat-ka-chehre-face-ke-balon-ko-saaf-karwana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bachon-ki-eidi-se-dosre-bachon-ko-eidi-dena",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dua-me-hath-jor-kar-phela-kar",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bator-e-saza-maali-jurmana-lena-6393",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bazaria-e-surgery-baal-lagwana-6433",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/zayed-gosht-ko-haath-se-juda-karwana-5076",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/be-namazi-or-daarhi-munday-shaks-ko-peer-banana-982",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/shohar-ki-ijazat-ke-bagair-bait-hona-5062",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/balon-me-chandi-ke-clip-lagana-4895",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/safar-ke-akhri-budh-ki-haqeeqat-12107-a",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/darhi-ke-safed-baal-ukharna-4894",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/moay-zair-e-naaf-kitne-dino-me-katen-4915",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ko-kandhon-se-neeche-baal-barhana-4889",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kiya-hamal-zaya-karwa-sakte-hain-4884",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/alcohol-mili-ashiya-ka-istemal-6090",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ultrasound-se-larka-ya-larki-ka-maloom-karna-6142",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/niaz-ka-gosht-kafir-mazdoor-ko-dena-6127",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/tasveer-aur-movie-ke-mutaliq-fatwa-6153",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/muqaddas-auraq-ke-mutaliq-sawal-jawab-6090",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/na-baligh-bacho-ka-khana",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nabaligh-bachon-ka-khana-7453",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/guod-liye-gaye-bache-se-parda-5231",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/quran-se-faal-nikalna-5222",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/naat-ke-sath-daf-bajana-5221",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/paye-ki-khaal-khana-jaiz-hai-5210-1",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/bunyadon-mein-zibah-ka-khoon-dalna-0097",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/3-mah-ka-najaiz-hamal-0095",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/nakhun-barhana-4843",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/muharram-mein-shadi-krna-4846",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/mard-ka-jootha-pani-peena-4847",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/dulhan-ke-paon-mein-anguthi-pehnana-857",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/susar-se-parda-862",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/jawan-ustad-ka-balighat-ko-parhana-6008-2",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/ghair-mahram-se-parda-60691",
-  "https://www.fatwaqa.com/ur/fatawa/halal-haram/kunde-ki-bijli-ka-hukum-6089",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/chorai-mein-dadhi-ki-miqdar",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/upar-neeche-jate-takbeer-o-tasbeeh",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/washroom-mein-thukne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/salam-karna-afzal-ya-jawab-dena",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/dua-mein-hath-uthane-ka-taika",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/gira-hua-luqma-dubara-khana",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/khana-khane-ki-sunnatain-aur-adaab",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/istemal-shuda-miswak-phenkna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/qabristan-mein-salam-ke-alfaz",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/khane-ke-baad-tissue-se-hath-saaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/sunnat-ko-sahabi-ki-taraf-mansub-karna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/bar-bar-call-par-salam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/imama-bandhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/dua-mien-hath-uthana",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/safar-ka-aghaz-kis-din-se-kiya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/zulfein-rakhne-ka-sunnat-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/meeting-ke-doran-salam-ka-jawab-dena",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/ek-musht-se-zaid-dadhi-katne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kya-srif-lafz-e-salam-se-salam-hojyega",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/allah-ke-naam-ka-locket-pehan-kar-washroom-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/muqaddas-auraq-ko-nahar-ke-pani-mein-bahana",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/ulte-hath-se-khana-peena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/moze-pehnna-sunnat-se-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/istinja-ke-baad-istibra-karne-ka-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/aurat-ke-nifas-ke-baad-bache-ke-sar-ke-bal-dobara-utarwana",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/dua-ke-waqt-kia-tasawwur-karna-chahye",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/salam-karte-waqt-sirf-salam-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/nomolood-ke-baal-kab-utare-jayen-aur-in-balon-ka-kya-karen",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/khane-ke-baad-chalees-qadam-chalna-sunnat-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kisi-ki-daarhi-sirf-chaar-ungal-ho-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/baitul-khala-jate-waqt-ulta-qadam-aur-nikalte-waqt-seedha-qadam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kisi-ko-salam-pahunchane-ka-kaha-tu-kya-salam-pahunchana-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/jis-almari-mein-quran-pak-rakha-ho-uske-upar-koi-cheez-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/class-mein-tilawat-ke-doran-ustad-sahab-aa-jayen-to-khare-hone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/salam-ke-jawab-mein-salam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/salam-karte-hue-jhukna-aur-seene-par-hath-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kya-qalmein-darhi-mein-shamil-hain",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/damat-barakatuhum-aliya-ka-matlab-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/sadgi-kise-kehte-hain-sadgi-se-mutaliq-islami-taleemat-kya-hain",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/chatai-ya-joote-par-english-huroof-likhe-hon-to-istemal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/sote-waqt-surma-lagane-ka-hukum-aur-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/eid-ke-din-naye-kapre-pehenne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/washroom-mein-nange-sar-jana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/sar-ke-ishare-se-salam-karna-aur-is-salam-ka-jawab-dena",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/salam-ke-jawab-mein-salam-karne-wale-alfaz-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/shaadi-hall-mein-echo-sound-par-allah-ke-naam-ya-naat-chalana",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kya-bhikari-ke-salam-ka-jawab-dena-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/imama-bandh-kar-sona-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/dewar-par-likhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/ghair-mahram-ko-salam-karna-aur-salam-ka-jawab-dena",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/cheenk-aane-se-pehle-cheenk-ka-jawab-dena",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/rukhsat-hote-waqt-musafaha-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/bait-ul-khala-mein-cheenk-aaye-tu-kya-kiya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/ijtema-ke-akhir-mein-kisi-ne-buland-awaz-se-salam-kiya-tu-kya-jawab-dena-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/khana-khate-waqt-salam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kisi-ka-salam-pahunchana-kab-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/qibla-ki-taraf-pao-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/jumuah-ka-khutbah-kis-andaz-mein-beth-kar-sunna-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/ghar-se-nikalte-waqt-kon-sa-paon-pehle-bahar-nikalna-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kya-zikr-o-durood-mein-mashgool-shakhs-par-bhi-salam-ka-jawab-dena-wajib-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/khatne-ki-ibtida-kab-se-hui-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kya-zikr-o-azkar-karne-wale-par-cheenk-ka-jawab-dena-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/imama-7-hath-se-kam-ho-tu-imame-ki-fazeelat-hasil-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/black-color-ka-imama-nabi-pak-se-sabit-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/cheenk-ka-jawab-takheer-se-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/blood-test-tube-ya-peshab-ki-dibya-par-mareez-ka-naam-likhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/roti-gir-jaye-tu-utha-kar-chomna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/taharat-ke-liye-kin-cheezon-ka-dhela-le-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kagaz-se-istinja-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/chalte-hue-dua-karte-waqt-aasman-ki-taraf-dekhna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/na-mehram-aurat-ke-salam-ka-jawab-dena",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/nakhun-kaat-kar-ghusl-khane-mein-phenkne-se-bimari-ka-andesha-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/mard-ka-gair-zaroori-baal-shave-karna-mondna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/darhi-ke-neeche-gardan-par-mojood-baal-katna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/qibla-rukh-paon-kar-ke-sona",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/alim-e-deen-ki-tazeem-ke-liye-khare-hone-ka-saboot-ahadees-ki-roshni-mein",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/zamzam-peene-ka-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/char-zano-baith-kar-khana-khana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/aurat-ke-liye-mang-nikalne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/khare-ho-kar-khana-khane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/jis-copy-mein-duaain-likhi-hoon-use-zameen-par-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kis-din-nakhun-katna-hadees-mein-mana-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kisi-ka-salam-kaise-pahunchaya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/dosre-kamre-mein-mojood-shakhs-par-cheenk-ka-jawab-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/khana-khate-waqt-batein-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/khade-ho-kar-pani-piya-to-kya-qay-kar-ke-nikalna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/mard-kanga-karne-ke-baad-balon-ka-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/logon-ka-salam-puhnchana-bhool-jayen-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/pajama-pehnna-sunnat-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/aurat-ki-cheenk-ka-jawab-dene-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/salam-mein-pehal-karne-ka-zyada-sawab-hai-ya-jawab-dene-ka",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/ghusl-karte-hue-qibla-ki-taraf-muh-ya-peeth-karna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kya-fajar-ki-namaz-ke-baad-so-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/nabeez-banane-aur-istemal-karne-ka-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kya-asa-istemal-karna-sunnat-hai-aur-kya-kisi-sahabi-se-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/ghair-muslim-ki-cheenk-ka-kya-jawab-diya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/khare-ho-kar-shalwar-badalne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/bache-ki-paidaish-ke-baad-us-ka-naam-kab-rakhen",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/baghair-majboori-ke-seedhe-haath-se-istinja-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/safed-libas-pehnane-ki-fazilat",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/chhenkne-wale-ne-aahista-hamd-ki-to-jawab-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/mard-o-aurat-ke-liye-mang-nikalne-ka-sunnat-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/paida-hone-wale-bache-ki-khatna-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/machine-ke-zariye-zer-e-naaf-balon-ki-safai-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/pait-ke-bal-letne-ya-sone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/ghair-muslim-ko-salam-karna-ya-is-ke-salam-ka-jawab-dena",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/darhii-beard-ko-sahih-karne-ke-liye-shave-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/juma-ke-din-ghusal-karne-ka-hukum-aur-hadees-pak-ki-sharah",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/walime-ke-bare-me-chand-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/budh-ke-din-nakhun-katna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kya-jamai-ke-waqt-shaitan-muh-me-dakhil-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/budh-ke-din-nakhun-katna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/mochain-saaf-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/majlis-mein-naam-le-kar-salam-kiya-to-jawab-kis-par-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/dining-table-par-khana-khana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/roza-e-rasool-par-hazri-ka-tarika-aur-dua",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/sar-par-topi-pehnne-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/dua-qabool-kyun-nahi-hoti",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kisi-ne-whatsapp-par-salam-kiya-to-jawab-dena-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/salam-mein-wa-maghfiratuhu-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/nalain-shareef-ka-naqsh-ya-muqaddas-naam-wala-badge-laga-kar-toilet-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/late-kar-tilawat-aur-zikr-o-azkar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/khana-khane-me-masroof-logon-ko-salam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/jamat-ka-intizar-kartay-logon-ko-salam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/mobile-me-quran-ho-to-washroom-lejana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/maghrib-ke-baad-bachon-ka-bahar-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/khane-ke-awwal-aakhir-meetha-ya-namak",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/dua-ke-baad-hath-muh-par-pherna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/imame-ke-kitne-shimle-rakhna-sunnat-hai-6878",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/qibla-ki-taraf-tangen-phelana",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/khuda-hafiz-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/daarhi-ki-had-981",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/kin-mawaqay-par-salam-karna-mana-hai-12117",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/tilawat-karne-wale-ko-salam-ka-jawab-6139",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/imama-mein-kitne-shimle-chorna-sunnat-hai-5184-1",
-  "https://www.fatwaqa.com/ur/fatawa/sunnatain-aur-adab/dono-haath-se-musafa-karna-5212",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/gheebat-mafi-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/imam-der-gheebat",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/aalim-aur-jahil-ke-gunah",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/gunahon-ko-manhoos-samajhna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/qatil-ki-tauba",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/tauba-ke-irade-se-gunah",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/fiqh-shafi-mein-music",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/sattaking-game-khelna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/ultrasound-ki-report-par-hamal-zaya-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/bache-ke-paidaishi-dant",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/toba-ke-irade-se-gunah",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/gunah-e-kabira-karne-wale-ka-jannat-mein-jana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kya-zina-ek-qarz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/shadi-ki-waja-se-darhi-choti-karna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/jhoot-bol-kar-citizenship-lena",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/shirt-par-tasweer-print-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/bhatke-hue-insan-ki-toba",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/walidain-ke-kehne-par-rishtedaron-se-taluq-torna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/ghair-mahram-mard-o-aurat-ka-dini-mehfil-mein-sath-bethna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/riya-ke-khauf-se-amal-chorna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/anguthi-se-hamal-par-asar",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/gana-sunne-se-nifaq-paida-hona",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/sarkari-maal-dhoke-se-masjid-mein-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/chori-ki-cheez-wapas-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/haram-khane-wale-ki-ibadat",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kisi-ke-paun-ko-bhari-samajhna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/jiski-gheebat-ki-usse-mafi-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/cousins-se-hath-milana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/elaniya-gunah-ki-toba",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/toriya-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/jis-gunah-se-sachi-tauba-kar-li-kya-us-par-pakar-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/imtihan-pass-karne-ke-liye-paise-dena",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/europe-ke-visa-ke-liye-dadhi-katwana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/naam-liye-baghair-burai-karna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/mard-ke-liye-choti-banane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/bad-nigahi-se-tauba-par-istiqamat-pane-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/gunah-se-bachne-ka-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kafir-ka-maal-dhoke-se-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/commission-ke-naam-par-rishwat-ki-ek-soorat",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/job-ke-liye-aurat-se-ghair-sharai-taluq-zahir-karna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/aankh-phadakne-se-badshaguni-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/school-mein-ghair-hazir-students-ki-hazri-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/paise-lekar-mareez-ko-jaldi-doctor-ke-paas-bhejna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/carrom-board-mein-harne-wale-ka-sab-ki-fees-ada-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/na-baligh-bacha-chori-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kisi-musalman-ko-yazeed-kehna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kya-sadqa-ki-raqam-ghar-mein-rakhne-se-nahoosat-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/na-baligh-bachi-ko-imama-pehnane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kabootar-bazi-ke-muqable-karne-aur-jeeti-hui-raqam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/jashn-e-azadi-ke-moqe-par-bachon-ke-liye-banaya-gaya-chhota-guitar-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/pakistani-drame-dekhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kya-jadu-se-kisi-ki-maut-ho-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/hamal-zaya-hone-par-hamla-auraton-ka-door-bhagna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/ghar-ki-deewar-par-jandar-ki-tasveer-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/bacho-ke-kapre-bachiyon-ko-pehnana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/aurat-ka-saya-parne-se-bimar-hone-ka-aqeedah-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/shohar-jhagre-ki-wajah-se-kisi-aurat-se-qata-taulqi-ka-kahe-to",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/be-jan-cheezon-ko-lanat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/be-haya-videos-share-karne-ke-baad-tauba-kaise-karen",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/gali-ke-jawab-mein-gali-dena",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kya-bachon-ki-zimmedari-ki-wajah-se-hamal-zaya-karwa-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/farzi-mazar-banana-aur-wahan-asal-mazar-wale-mamlaat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/paise-chori-karne-ke-badle-mein-koi-aur-cheez-lotana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/sahaba-karam-ke-gustakh-ke-saath-taluqat-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/wakeel-ka-jhoota-muqaddama-larna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/na-baligh-bache-ko-resham-aur-sona-pehnane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/na-mehram-aurat-ke-sar-par-hath-pherna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/birthday-cake-ki-cream-chehre-par-malne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/driving-license-banwane-ke-liye-rishwat-dena",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/gunah-na-karne-ka-allah-aur-bande-se-wada-karna-aur-phir-wo-gunah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/gunahon-se-tauba-karne-ke-baad-kaffara-ada-na-kiya-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kisi-qaum-ka-mazak-urana-ya-haqeer-samajhna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/profile-par-fahash-tasweer-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/miyan-biwi-ka-akele-mein-dance-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/ailania-gunah-ki-ailania-toba-karna-kahan-se-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kisi-insan-ke-liye-apne-dil-mein-takabbbur-ya-hasad-rakhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/makeup-artist-ka-dulhan-ki-tasveer-advertisement-ke-liye-social-media-par-dalna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/na-mehram-mard-aur-aurat-ka-gale-milna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/shaadi-waghera-ki-tasveer-ka-album-banane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/cast-badalna-nasab-badalna-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kya-har-gheebat-haram-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/khushki-ki-wajah-se-dadhi-katwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/paise-dekar-kisi-aur-ko-paper-dene-ke-liye-bhejna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/qabrustan-mein-bakriyan-charane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/aurat-ka-shadi-ke-baad-shohar-ki-zaat-cast-apne-naam-ke-sath-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/binary-trading-halal-hai-ya-haram",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/masjid-ki-mehrab-ke-samne-ghar-ho-tu-kya-musibatein-aati-hain",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/anbiya-karam-ke-mutalliq-banai-gai-filmon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/study-visa-ke-liye-jhooti-bank-statement-banwana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kon-se-gunahon-ki-saza-dunya-mein-he-milti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/aurat-ka-ungli-se-shehwat-poori-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/joota-chupai-ki-rasam-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kya-makkah-mein-naiki-ki-tarah-gunah-bhi-lakh-ke-barabar-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/zania-se-nikah-ke-2-mahine-baad-bacha-paida-hua-tu-us-ke-nasab-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kanche-khelna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/jua-ki-raqam-ghareeb-rishtedar-ko-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kisi-ki-zameen-par-qabza-karna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/jin-gunahon-par-azab-ki-waeed-hai-kya-wo-azab-mil-kar-rahega-ya-maaf-ho-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/badgumani-ka-gunah-aur-is-ka-ilaj",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/muqaddas-maqam-par-gunah-hojaye-to-us-ka-izala-kaise-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kya-gunah-karne-se-nekiyan-barbad-ho-jati-hain",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/muslim-ladki-ka-rakhi-bandhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/test-ke-liye-musht-zani-kar-ke-mani-kharij-karna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/gunah-karne-se-dil-par-siah-nukta-lag-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/walida-balon-mein-kala-color-lagane-ka-kahein-to-beti-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/internet-par-fahash-mawad-dekhne-ka-hukum-aur-bachne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/apne-aap-ko-dusri-biradri-ka-zahir-karne-ka-hukam",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/zina-ka-dunya-mein-anjam",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/khel-mein-harne-wale-par-kuch-khilane-ki-shart-lagana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/sharamgah-ko-bistar-par-ragar-kar-mani-kharij-karna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/gheebat-sunne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/gali-ka-matlab-aur-maa-baap-ko-gali-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/teacher-ke-kehne-par-jhoot-bolna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/bachon-ki-raqam-se-mithai-jama-kar-ke-jeetne-par-kisi-ek-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/school-ki-moseeqi-wali-nazmein-sunna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/gunah-ke-insani-sehat-par-kya-asrat-hote-hain",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kafir-ki-company-mein-usool-ke-khilaf-hazri-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/documents-mein-ghalat-tareekh-e-paidish-likhwana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kabootar-bazi-mein-jeete-hue-paise-se-khana-khilana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/hasad-ka-ilaj-kis-tarah-kiya-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kya-tang-hila-kar-apni-mani-kharij-karna-musht-zani-mein-dakhil-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/ghair-muslim-ki-gheebat-karne-ka-gunah-ghair-muslim-ki-gheebat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/mahe-ramzan-mein-gunah-karne-ki-saza",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/ailania-gunah-ki-ailania-toba-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kala-jadu-black-magic-dark-magic-in-islam-in-quran-karna-karwan-shari-hukum-kala-jadoo",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/looti-ke-marne-ke-baad-is-ki-qabar-ki-muntaqili",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/lottery-ke-card-aur-coupon-ki-khareed-o-farokht",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/hum-jins-parasti-homosexuality-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/transgender-ki-sharai-hesiyat",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/gheebat-ke-gunah-se-tauba-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/khud-ko-dosri-qoum-ki-taraf-mansoob-karna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/idhar-me-apni-kitab-lagane-ke-liye-paise-dena-lena",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/shabe-barat-me-patakhe-jalane-atish-bazi-karne-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/papers-me-cheating-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/musht-zani-ka-hukum-aur-is-se-bachne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/makan-mein-qibla-roo-ho-kar-istinja-karna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/4-mahine-se-kam-ka-hamal-zaya-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/medicine-company-ki-taraf-se-doctor-ko-di-jany-waly-mukhtalif-offers-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/kya-koi-aesa-gunah-hai-jis-ki-bakshish-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/najoomi-ko-hath-dikhana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/janwaro-ko-aapas-mein-larwanay-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/company-manager-ka-maal-pas-karne-ke-liye-commission-lena",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/wada-khilafi-ki-sooratain-aur-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/film-drame-ganon-ki-cds-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/mareez-ko-maut-ka-injection-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/sajda-e-tazimi-ki-shari-haisiyat",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/khudkhushi-karna-kaisa-9193",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/sajda-e-tazeemi",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/examination-staff-ko-khilana-pilana",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/allah-pak-se-wada-karna-35",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/janwaron-ko-larwana-6202",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/fahash-video-share-karna-6209-a",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/jashn-e-wiladat-mein-dhol-baje-ka-hukum-4831",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/najoomi-ko-hath-dikhana-1283",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/video-par-na-jaiz-ads-lagwana-8129",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/mobile-account-aur-free-minute",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/naat-mein-music-ka-hukum-8227",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/biwi-ko-bepardagi-se-na-rokna-8268",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/qurandazi-aur-juwa-8296",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/imtihanat-mein-naqal-karwana-5183",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/sharab-peenay-say-wuzu-toot-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/rishat-ka-tohfa",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/plot-registery-ki-mithai-ki-raqam",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/sajda-e-tahiyat-ke-mutaliq-hukum-5191",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/ainda-gunah-karne-ki-niyat-1014",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/zania-biwi-se-mutaliq-hukum-4854",
-  "https://www.fatwaqa.com/ur/fatawa/gunah/ghair-muslim-say-zina-6075",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/walidain-aulad-qata-talluqi",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/zakat-de-kar-tana-dena",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/waldain-ke-hukum-ki-had",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/thalassemia-wale-ka-khoon-dusre-mareez-ko-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/walidain-haq-ada-na-karen-to-aulad-ka-bura-sulook-karna",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/waldain-ki-bad-sulooki-par-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/waldain-ka-kharcha-aulad-par-kab-aur-kitna-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/maan-ka-ek-beti-par-sakhti-baqion-par-shafqat-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/mobile-mein-naatain-lagane-se-kisi-ki-neend-kharab-ho-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/kya-huqooq-ul-ibaad-talaf-karne-wala-bila-hisab-janant-ki-dua-kar-sakta-hai",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/biwi-aur-bachon-ke-kharche-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/biwi-par-kharch-karna-sawab-ka-kaam-hai",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/safar-mein-aik-biwi-ke-sath-2-raatain-guzari-to-doosri-ke-paas-kitni-guzaray",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/2-biwiyan-hon-to-din-ka-kuch-hissa-bhi-unko-time-dena-lazim-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/kisi-ke-samne-sargoshi-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/biwi-ko-alag-kamre-ke-sath-kitchen-bhi-dena-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/biwi-ka-ilaj-karwana-kis-ki-zimedari-hai",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/baligha-larki-ka-nafqa-kis-par-hai",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/shohar-biwi-ko-kharcha-na-de-tu-biwi-ka-baghair-ijazat-paise-lena",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/biwi-ka-shohar-ki-ijazat-ke-baghair-hafte-baad-maike-jana",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/maa-bachon-par-apni-zati-raqam-kharch-kare-tu-wapsi-ka-mutalba-kar-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/jo-shakhs-apni-cheez-istemal-karne-ke-liye-nahi-de-is-par-gussa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/nabaligh-bachon-ko-milne-wale-tohfe-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/biwi-ko-watan-mein-chor-kar-bahar-mulk-kamai-ke-liye-jana",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/jaisa-khana-shohar-khud-khaye-kya-waisa-he-biwi-ko-khilana-wajib-hai",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/walidain-bila-wajah-gussa-karte-hoon-ya-dantte-hon-tu-aulad-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/na-baligha-beti-ki-milk-mein-mojood-sona-bari-beti-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/kya-waldain-ki-wafat-ke-baad-bhi-un-ke-kuch-huqooq-hain",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/waldain-ki-larai-mein-aulad-kis-ka-sath-de",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/shohar-ki-ijazat-ke-bagair-is-ka-maal-khairat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/maa-ka-doodh-bakhswane-ki-haqeeqat",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/parosi-ke-ghar-ki-taraf-khirki-khol-kar-aziyat-dena-5749",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/biwi-ka-shohar-ki-kamai-se-sadqa-karna-6294",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/miya-biwi-ke-huqooq-5797",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/biwi-ki-kamai-istemal-krna",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/ghar-apne-name-karne-ka-mutalba-0335",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/dusron-ka-maal-na-haq-khana-6277",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/mukhanas-aulad-ki-parwarish-ke-ahkam-12081",
-  "https://www.fatwaqa.com/ur/fatawa/huqooq-ul-ibad/ijazat-ke-baghair-walida-ko-tohfa-855",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/auliya-allah-ki-shan",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/farishton-ka-ilm",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/imam-hasan-ki-shahadat",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-wisal-sahaba-khwab-mein-ziyarat",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/meraj-mein-jibreel-aage-barhne-se-kese-jalte",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hamare-amal-huzoor-ki-bargah-mein",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/ambiya-se-sawalat-e-qabar",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-jibreel-nabi-pak-ke-pas-kitni-martaba-aaye",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-umme-kulsoom-hijrat",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-durood-pak-ke-alfaz",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-isa-pahar-se-aasman-par-uthaye-gaye",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-pak-jesa-koi-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-adam-ki-toba-nabi-pak-ke-waseele-se",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-yusuf-aur-hazrat-zulekha-ka-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-hazrat-fatima-haiz-o-nifas-se-pak-thin",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-fatima-ke-inteqal-ke-waqt-unki-umar",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-jibreel-ke-par-aur-ambia-se-mulaqat",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/ahl-e-bait-se-bughz-rakhne-ka-anjam",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/imam-hassan-imam-husain-sahabi-the",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/safar-e-meraj-ki-muddat",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-khizar-aur-hazrat-ilyas-ka-har-saal-hajj-karna",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-pak-ke-dada-ka-naam",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/peer-aur-waldain-ka-martaba",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-pak-ka-munafiq-ka-janaza-parhana",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazqeel-naam-ke-nabi",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-e-pak-ne-ihram-kis-miqat-se-bandha",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/yasir-naam-ke-sahabi",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/jannat-mein-nabi-ki-azwaj",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/rabia-sahabiya-ka-naam",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/taif-mien-nabi-pak-ki-dua",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/abu-bakr-siddique-ke-beton-ki-tadad",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/yazeed-bin-abu-sufyan-aur-yazeed-bin-muawiya-mein-farq",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/anbiya-mein-se-baaz-ko-baaz-par-fazilat",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-hazrat-jibreel-nabi-pak-ke-ustad-hain",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-abu-jahal-nabi-pak-ka-chacha-tha",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/pait-ki-bimari-me-inteqal-karne-wala",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-abu-bakar-siddiq-ko-ghusal-kisne-diya",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/tamam-anbiya-nabi-pak-ke-ummati",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-murgi-aur-anda-khana-nabi-kareem-se-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-ke-imama-ke-rang-aur-lambai-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/sab-se-pehle-sahabi-kaun",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/baiat-uqba-oula-ki-wazahat",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-hajjaj-bin-yusuf-taabai-tha",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-jibrail-nabi-pak-ki-bargah-mein-kitni-baar-hazir-hue",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/imam-hussain-aur-ibn-e-umar-ke-ek-sath-khelne-ki-haqiqat-",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-imam-azam-ne-allah-pak-ka-didar-kia-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/deegar-anbiya-apni-ummat-ki-shafat-karenge",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/ameen-ul-shakireen-kis-sahabi-ka-laqab-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/sahaba-mein-zyada-ilm-wala-kon",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-pak-ka-murde-zinda-karna",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/karbala-mein-shaheed-hone-wale-hazrat-abbas",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/siddique-akbar-ko-abu-bakr-kyun-kaha-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/jannat-ke-patton-aur-hooron-ke-seenon-par-naam-e-muhammad",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-owais-qarani-sahabi-hain-ya-tabi",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-pak-ko-apne-walid-ki-wirasat-se-kya-mila",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/oont-wale-ka-haq-abu-jahal-se-dilwane-wala-waqia",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hateem-kya-hai-aur-hateem-mein-kis-ki-qabar-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-pak-ne-kisi-ka-janaza-uthaya-kya-hazrat-khadija-ka-janaza-hua-tha",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-adam-ki-haqeeqi-aulad-ki-tadad",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-fatima-aur-hazrat-ali-ka-nikah-kis-mahine-mein-hua",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-hazrat-bilal-ke-azan-na-dene-se-suraj-nahi-nikla-tha",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-hazrat-abu-bakr-siddique-ki-aulad-bhi-syed-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-ubai-bin-kaab-sahabi-e-rasool-hain",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/ghulamon-mein-sab-se-pehle-islam-qabool-karne-wale-kaun-hain",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-kareem-ki-betiyan-4-theen-ya-1",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-ameer-muawiya-ki-zawja-maysoon-bint-bahdal-ke-islam-ke-mutaliq-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/ghanti-jesi-awaz-mein-wahi-aane-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/huzoor-ki-namaz-e-janaza-kis-ne-parhai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/sahaba-ka-nabi-ke-wazu-ka-bacha-hua-pani-hasil-karne-mein-sabqat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-yahya-walida-ke-pait-mein-hazrat-isa-ki-tazeem-karte-the",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/bait-ul-muqaddas-ko-qibla-awwal-kyun-kaha-jata-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-fatima-ki-kuniyat-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/imam-hussain-ki-beti-ka-naam-sakina-tha-ya-sukaina",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-kareem-ko-kisne-ghusal-diya-tha",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-aulia-farishton-se-afzal-hain",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/khwab-mein-nabi-kareem-ki-ziyarat",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/barkat-ke-liye-ashab-e-kahaf-ke-naam-ghar-mein-latkana",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-momino-ki-jaan-se-bhi-ziyada-qareeb-hain",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-pak-ka-shukr-ada-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-huzoor-ne-ghurbat-se-panah-mangi-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/huzoor-ka-pehla-nikah-kis-ne-parhaya",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-qayamat-ke-din-ka-aksar-hissa-huzoor-ki-tareef-mein-guzre-ga",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/abu-jahal-ko-nabi-ka-chacha-kehne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-kareem-ke-kitne-chachaon-ne-islam-qabool-kiya",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-pak-ki-aulad-pak-kin-se-paida-hui",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/ahl-e-bait-mein-kon-kon-shamil-hain",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-nabi-kareem-se-hijama-karwana-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-amir-muawiya-katib-e-wahi-hain",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-nabi-kareem-ne-kisi-ke-peeche-namaz-ada-farmai-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-pak-par-kitne-waqt-ki-namaz-farz-thi",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-ali-ki-namaz-e-asr-ke-liye-suraj-wapas-aane-ka-waqia",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/rasoolullah-ki-taraf-mansoob-ek-letter-ki-haqeeqat",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/imam-hussain-aur-unke-sathiyon-ka-3-din-piyasa-rehna",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-usman-e-ghani-ne-kitni-bar-jannat-kharidi-aur-kitni-bar-jannat-ki-basharat-mili",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/khulafa-e-rashideen-ki-namaz-e-janaza-kis-ne-parhai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/mubahala-ke-waqt-sirf-ek-shehzadi-hazrat-fatima-he-kyun-gayi-thi",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/imam-hussain-ki-makkah-mukarramah-se-rawangi-aur-karbala-ka-parao",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-amir-muawiyah-aur-hazrat-umme-habiba-ka-apas-mein-rishta",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/ghazwa-badar-ke-mauqa-par-hazoor-ne-kon-si-dua-farmai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-karim-sunnaton-mein-kya-niyat-farmate-the",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/ghous-pak-ka-janaza-kis-ne-parhaya",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/huzoor-ki-shan-ka-shumar-karna-makhlooq-ke-bas-mein-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-karim-ke-bol-peshab-aur-khoon-mubarak-peene-ka-saboot",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/miraj-ki-raat-ada-ki-gai-namaz-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-imam-hasan-aur-hazrat-ameer-e-muawiyah-ki-khilafat",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-umar-bin-abdul-aziz-ki-khilafat",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/shahzada-e-rasool-hazrat-ibrahim-ki-walida-ka-naam",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/huzoor-ki-azwaj-e-mutahrat-ke-naam",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-usman-ghani-aur-hazrat-ali-ki-aulad-aur-azwaj-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-kareem-konsi-khushbu-istemal-farmaya-karte-they",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/huzoor-ka-jannat-mein-jane-ke-baad-shafat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-ali-al-murtaza-ki-aulaad-o-azwaj-ki-tafseel-aur-tadaad",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-kareem-ka-elan-e-nabuwat-se-pehle-ibadat-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/dosri-martaba-hone-wale-shaq-e-sadr-ki-tafseel",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-hazrat-esa-aur-hamare-nabi-ke-darmiyan-koi-aur-nabi-aya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-roza-rasool-kaaba-sharif-se-zyada-afzal-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/khare-ho-kar-pani-peene-ka-sharai-hukum-khare-ho-kar-pani-peena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-huzoor-ka-apni-zindagi-me-azan-dena-sabit-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-pak-ka-taoon-ko-mulke-sham-bhejne-ki-kya-hikmat-thi",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/aik-ummati-walay-nabi",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/ghouse-azam-hazrat-abdul-qadir-jilani-ko-hanafi-kehna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-nooh-ki-aulad-me-kia-tmam-insan-shamil-hain",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/umhaat-ul-momineen",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/jis-jagah-40-naik-musalman-jama-hon-wahan-allah-ka-wali-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-fatima-al-zahra-ka-janaza-kisne-parhaya",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/qabar-e-anwar-hujra-e-ayesha-me-he-kyon-bani",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-umme-salma-aur-hazrat-umme-habiba-ka-naam",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kya-hazrat-owais-qarni-ne-apne-daant-tor-diye-thay",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/syed-laqab-hai-ya-nasab",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/ghous-pak-ka-ek-sher-aur-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/ghous-pak-ke-aqwal-6306",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/huzoor-ka-name-sun-kar-durood-parhna-9649",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-ali-aur-hassan-basri-syed-hain-6423",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/naqsh-e-nalain-pak-ki-fazilat-6344",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/isha-ki-wuzu-se-fajr-ki-namaz-6144",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/nabi-kareem-isha-ke-konse-nafil-beth-kar-parhte-they-5187",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/hazrat-khadija-ki-namaz-e-janaza-4891",
-  "https://www.fatwaqa.com/ur/fatawa/fazail-o-seerat/kiya-huzoor-ki-namaz-e-janaza-ada-ki-gai-thi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/artificial-eyebrows-ya-eyelashes",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/phopha-ke-sath-safar",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/parda-rishta-rukawat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nand-ke-bete-ke-sath-umra",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nani-aur-dadi-ki-behnon-se-parda",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kafira-aurat-se-makeup-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nakhun-par-aata",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/behan-ke-nawase-ke-sath-umra",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ki-namaz-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shohar-ke-kehne-par-eyebrow-banwana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/eye-liner-laga-kar-wazu",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/wafat-ki-iddat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-mein-aurat-ke-hath-ke-gitte-zahir-hona",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-leukorrhea-se-wazu-tootega",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamla-aurat-sajde-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/biwi-ka-humbistari-se-inkar",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-sone-ke-payal-pehanna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamal-saqit-hone-se-pehle-aur-baad-aane-wala-khoon",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bohot-si-auraton-ka-ek-sutra",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kufriya-baat-kehne-se-nikah-par-asar",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamal-zahir-hone-ke-baad-khoon-haiz",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-libas",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/ihram-ki-halat-mein-aurat-ka-moze-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-ramzan-ke-aakhri-20-din-ka-itikaf",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nifas-ka-khoon-ruk-kar-dubara-aana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/roze-ke-liye-medicine-se-mahwari-rokna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/leukorrhea-se-wazu-aur-kapron-ki-napaki",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamal-ke-akhri-dino-mein-aurat-ki-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamila-aurat-ki-kursi-par-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-o-nifas-mein-dalail-ul-khairat-parhna-aur-choona",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/mahwari-mein-aadat-se-zyada-khoon-aana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-mehndi-lagana-sunnat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-simat-kar-sajda-karne-par-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/mustahaza-ka-quran-chuna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoos-ayyam-mein-surah-ikhlas-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/breathable-nail-polish-lagi-ho-tu-wazu-aur-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/waldain-ke-mamu-chacha-khala-aur-phoophi-mahram-hain",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shadi-ke-baad-aurat-ka-churiyan-pehanna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-namaz-parhne-ke-bad-azan-ka-jawab-dena",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-bewa-ki-betiyan-dusre-shohar-ki-mahram-hain",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/zania-ka-zani-ke-bete-ke-sath-shari-safar",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nifas-ki-halat-mein-ghar-se-bahar-jana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/soutele-damad-se-parda",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-dua-e-hizb-ul-bahr-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamal-ke-dauran-aane-wala-khoon",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-bahnoi-arzi-mehram-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nail-shiner-lagi-halat-mein-ghusal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-aurat-se-parda",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/behnoi-ke-sath-shari-safar",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-waja-se-aashura-ka-roza-chorne-par-sawab",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-sajda-karte-waqt-hath-kahan-rakhe",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamal-ke-doran-hifazat-ki-dua-aur-suraten",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ki-munh-ki-tikli-se-murad",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/mahram-ke-samne-dupatta-na-orna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/maa-ke-rishtedaron-se-parda",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-mein-asma-e-husna-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ki-kalai-ka-kuch-hissa-namaz-mien-khula-hona",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nifas-ka-khoon-40-din-par-na-rukna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nai-dulhan-ka-muharram-ke-10-din-mayke-mein-rehna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-band-hone-ki-umar-aur-is-ke-baad-khoon-aana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-namaz-mein-awaz-buland-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-mein-mehndi-lagana-aur-nakhun-katna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-laser-se-baal-saaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ki-azan-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shohar-ke-chachu-aur-mamu-se-parda",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-mein-aurat-ka-takhna-zahir-hone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/9-saal-se-pehle-bachi-ko-aane-wala-khoon",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-mein-bos-o-kinar-se-aurat-ko-inzal-hona",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-bagair-mehram-jahaz-mien-safar",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/naqis-tohor-ka-matlab",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoos-dino-mein-nahana-zamzam-pina-panj-surah-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/istihaza-mein-namaz-se-pehle-pad-badalna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-apna-doodh-peena",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/mehram-ke-samne-kanga-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-namaz-mein-buland-awaz-se-qirat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/geele-balon-par-toliya-rakh-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/uthne-ke-baad-leukorrhea-ki-tari-ghusal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-mein-surat-kausar-se-nazar-utarna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/mahram-ke-baghair-shohar-ke-paas-bahir-mulk-jana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/face-mask-se-parda",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-makhsoos-ayyam-mein-qaseeda-ghausia-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-khandan-ke-qabristan-jana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-hadith-e-qudsi-parhnay-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ke-baad-peele-rang-ki-ratoobat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-khushbu-lagane-se-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-raat-sote-waqt-dupatta-utarna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-aurat-se-wax-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-maike-mein-itikaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/istihaza-aane-ki-waja",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-namaz-sikhana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-ka-sar-se-latakte-baalon-ki-chauthai-miqdar-par-masah-kar-lena-kaafi-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/auraton-ke-liye-roze-se-mutaliq-aham-masala",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-naak-chidwana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-mein-muqaddas-maqamat-ki-ziyarat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-durood-sharif-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bacha-namaz-me-dupatta-kheench-de-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-shadi-ke-baad-maike-aye-tou-namaz-qasar-parhe-ya-mukammal",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/umrah-par-jate-hue-haiz-aana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shahwat-ke-sath-mani-nikalne-se-aurat-par-ghusal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-aurat-ke-khule-baal-parde-mein-hon-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ka-khoon-aadat-se-das-din-baad-bhi-jari-raha-to-namazon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamal-ki-waja-se-namaz-qaza-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-baal-nazar-ayen-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-mein-bosa-lene-se-aurat-ko-inzal-hona",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-ayatul-kursi-wala-bracelet-pehanna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/2-larkiyon-ka-aapas-mein-najaiz-dosti-rakhna-aur-batein-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shohar-naraz-ho-to-biwi-ki-ibadat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-wali-ka-wuzu-karke-sona",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/ramzan-ke-qaza-roze-me-haiz-aana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-gale-aur-kaan-mein-sone-ka-zewar-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-mein-aurat-ke-sar-ke-baal-nazar-aana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/istihaza-ka-khoon-pak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-salatul-tasbeeh-ki-imamat-karwaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-namaz-tootne-ki-soorat-mein-bina-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-baghair-mehram-pakistan-se-jeddah-safar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/durood-tunjina-ki-mannat-kya-haiz-mein-bhi-parh-sakte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-maxi-mein-namaz-parh-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-azan-se-pehle-namaz-parh-sakti-hai-fatwa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bache-ki-paidaish-ke-baad-aurat-ko-kab-nahana-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/balon-ko-khole-bagair-aurat-ka-ghusal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shohar-ki-ijazat-ke-baghair-biwi-ka-nafil-roza-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/tabarruj-kisay-kehte-hain",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/paid-se-blooding-istehaza-roke-to-kya-aurat-shari-mazoor-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-hijre-se-parda-karegi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/na-baligha-bachi-ko-parde-ka-hukum-kab-diya-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-sehan-chhat-yani-khule-aasman-ke-neeche-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-ke-dauran-aurat-ke-chand-baal-zahir-hogaye-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bacha-hone-ke-baad-40-din-tak-aurat-ka-nakhun-katna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/periods-ke-4-din-hon-lekin-ab-har-mahine-10-din-se-upar-blooding-ho",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/adopt-bache-ko-bhabi-feed-karwade-to-kya-razat-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aadat-ke-mutabiq-3-din-khoon-aane-ke-baad-phir-chate-din-dubara-aye-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-namaz-mein-kalai-kaise-rakhe",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bache-ki-paidaish-ke-baad-khoon-60-din-chalta-raha-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-mein-qurani-ayaat-ka-hisar-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamal-rokne-ke-liye-medicine-use-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-ke-faraiz-aur-wajibat-mein-sajde-ka-dobar-hona-likha-hai-iski-wajah",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamila-aurat-ka-khushbu-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/beti-ko-kis-umar-mein-namaz-o-roze-ka-hukum-den",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/ramadan-ke-qaza-rozon-ke-liye-shohar-ki-ijazat-zaroori-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-short-coat-ya-long-coat-pehenna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-agar-bajamat-jumma-parhle-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-liye-mahir-nafsiyat-ki-job-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-chadar-se-hath-bahar-nikal-kar-takbir-tahrima-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/honton-par-lip-tint-lagaya-ho-to-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-namaz-shalwar-qameez-dupatta-underwear-seena-band-pehenna-zaroori",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-safed-rang-ka-burqa-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/auraton-ka-karbala-aur-baghdad-ziyarat-ke-liye-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-se-farigh-hone-ke-baad-sharamgah-par-khushbu-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-azan-aur-khana-banate-waqt-sar-dhanpna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-haiz-ki-halat-mein-duae-manzil-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-jaye-namaz-par-bethna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/chooriyan-bechne-wale-ka-chooriyan-pehnana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/sunnatein-aur-nawafil-parhte-hue-haiz-aa-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/maghrib-ya-isha-ke-baad-haiz-shuru-hua-to-kya-yeh-din-shamil-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kameez-ki-aasteen-me-surakh-wali-lace-lagi-ho-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-namaz-mein-hath-badhate-hue-poora-hath-dusre-hath-par-rakhe-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-nikah-ya-iddat-mein-ho-to-dusre-se-nikah-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-hijre-se-parda-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/auraton-ka-mehfil-milad-mein-nare-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ya-nifas-ki-halat-mein-loh-e-qurani-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/sautele-baap-se-parda-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-balon-ko-mustaqil-sidha-karwana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/auraton-ka-upper-lips-banwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoos-ayam-mein-aurat-ke-liye-bazu-par-taweez-bandhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-baghair-mahram-92-kilometer-ki-musafat-par-imtihan-dene-jana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-auratain-nabi-kareem-ke-moye-mubarak-ki-ziyarat-kar-sakti-hain",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/dosri-rakat-ke-liye-dard-ki-wajah-se-zameen-se-uthna-mumkin-nahi-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-theli-ke-zariye-quran-pak-chona-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-makhsoos-ayam-mein-ayatul-kursi-parh-kar-dam-karsakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bache-ki-paidaish-ka-waqt-hone-se-pehle-khoon-aane-lage-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-baith-kar-ghusal-kare-ya-khare-hokar",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-hath-paon-mein-kaali-mehndi-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-awwal-waqt-namaz-nahi-parhi-haiz-shuru-ho-gaya-namaz-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/khawateen-ka-perfume-laga-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-khare-ho-kar-nahana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bacha-paida-hone-ke-baad-nifas-na-aaye-tu-namaz-aur-jima-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-o-nifas-mein-hadees-mubarak-likhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/rishta-tay-hone-ke-baad-nikah-se-pehle-hone-wale-susar-se-parda",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-makhsoos-ayyam-mein-durood-e-tanjeena-parh-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/agar-aurat-kamati-ho-to-kya-is-par-bachon-ka-kharcha-lazim-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-khule-aasman-ke-neeche-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bache-ke-rone-ki-wajah-se-farz-namaz-torna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-namaz-ke-qada-akhira-mein-baen-janib-paon-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-doran-e-safar-aurton-ko-bhi-qasar-namaz-ada-karni-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/masjid-ke-bahar-muttasil-jagah-mein-auraton-ka-namaz-parhne-jana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/jumma-pehli-azan-aurat-beauty-salon-jaiz-najaiz",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/walida-ke-mamu-se-parde-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/ghair-muslim-lady-doctor-se-hamla-aurat-ka-treatment-karwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiza-aurat-junbi-ho-jaye-to-paki-ke-liye-kitne-ghusl-kare",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiza-ka-bagair-touch-kiye-mobile-se-dekh-kar-quran-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/jumma-ko-khawateen-pehli-azan-ka-jawab-dein-ya-dusri-ka",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-hamla-aurat-ko-haiz-ki-aadat-wale-dino-ki-namazain-maaf-hoti-hain",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/asteen-choti-hone-ki-wajah-se-aurat-ki-kalai-namaz-mein-nazar-aaye-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-apne-phopha-se-parde-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-o-nifas-wali-thore-pani-mein-hath-dale-to-mustamal-nahi-hota",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-id-card-ke-liye-tasveer-banwana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/halat-e-haiz-mein-teesra-kalma-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/istihaza-wali-aurat-ka-masjid-haram-mein-jana-aur-tawaf-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-par-ghusl-farz-ho-to-kab-tak-ghusl-kar-ke-roze-ki-niyat-kare",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/muhrim-ka-munh-sote-hue-chadar-se-chhup-gaya-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/doran-e-itikaf-aurat-ka-parindon-ko-dana-dalna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/behan-ya-walida-ka-itikaf-wale-kamre-mein-mutakifah-ke-sath-sona-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-roze-ki-halat-mein-mehndi-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nafli-tawaf-shuru-kiya-to-poora-karna-lazim-hai-poora-nahi-kiya-to-kya-hukm-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-pistan-se-nikalne-wali-ratobat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-haiz-ki-halat-mein-darood-taj-ya-darood-e-tanjeena-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/roze-ki-halat-mein-aurat-ne-apni-sharmgah-ko-chhua-lekin-inzal-na-hua",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nifas-ka-khoon-aathwe-din-band-ho-jaye-to-namaz-aur-azdawaji-taluq-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ramzan-mein-nisfun-nahar-ke-baad-pak-hui-to-kya-baqi-din-roze-se-rahegi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-namaz-parh-li-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ke-dino-mein-surah-qadr-bator-e-wazifa-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/iftari-se-kuch-minute-pehle-haiz-aa-gaya-to-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-ki-sunnaton-ke-doran-napaki-ke-din-aa-gaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-kaffare-ke-60-roze-kis-tarah-rakhe",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-wali-aurat-ke-liye-eid-ka-wazifa-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-bagair-zewar-ke-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-liye-namaz-mein-shalwar-fold-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nifas-ki-halat-mein-shohar-ka-naaf-se-ghutne-tak-ka-hissa-dekhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aadat-ke-din-mukammal-hone-se-pehle-haiz-ka-khoon-ruk-jaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-din-mein-haiz-se-pak-ho-kar-roze-ki-niyat-kar-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nifas-ka-khoon-rukne-ke-baad-ghusal-kiya-phir-khoon-aa-gaya-tu",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ne-galti-se-ulta-dupatta-odh-kar-namaz-shuru-kardi-to-kya-kare",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/qatra-nikalne-ka-weham-hua-magar-paki-hasil-kiye-bagair-namaz-parh-li-tu-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-ghar-mein-akele-eid-ki-namaz-parh-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/halat-e-istihaza-mein-aurat-ka-itikaf-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-sar-se-juda-hone-wale-balon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-surakh-wali-chadar-odh-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/auraton-ka-kandho-par-chadar-latka-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-mein-aurat-ki-kalai-nazar-aa-rahi-ho-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/sharmgah-mein-goli-rakhne-se-roze-aur-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/jahaz-mein-aurat-namaz-parhe-gi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-parde-ke-sath-riksha-ya-taxi-mein-akele-safar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-ayat-sajda-sunne-se-sajda-tilawat-wajib-kuyn-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ko-hath-paon-kahan-tak-kholne-ki-ijazat-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-durood-e-tunajjina-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/eid-ki-namaz-se-pehle-aurat-ka-ishraq-o-chasht-ki-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/istihaza-wali-aurat-ko-baith-kar-namaz-parhne-se-khoon-na-aaye-to",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bhari-lehnga-pehne-hone-ki-soorat-mein-dulhan-ka-beth-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/larkiyon-ka-lambi-frock-pehenna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/dulhan-ne-mehnga-makeup-kiya-ho-aur-wazu-toot-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-balon-ki-safai-ke-liye-eraser-treatment-karwana-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ke-ayyam-ke-baad-la-ilmi-ki-wajah-se-ramzan-ke-roze-na-rakhe-to-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-ghair-mahram-ke-sath-tour-par-jana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-bhanje-ke-sath-apni-beti-ko-le-kar-umrah-par-jana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/asr-ke-waqt-mahwari-shuru-hui-tu-us-din-ki-fajr-aur-zuhr-ki-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/ungliyan-chatkhane-mein-amal-kaseer-na-ho-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-surah-ikhlas-ka-wazifa-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-shohar-ne-biwi-se-jima-kar-liya-tu-kaffarah-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-makhsoos-ayyam-mein-istikhara-ki-dua-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/napaki-ki-halat-mein-allah-ke-naam-ka-wazifa-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bhanje-ke-bete-se-khala-ka-parda-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-aurat-ke-rukhsar-par-bosa-dena",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/ladies-ka-capri-trouser-pehan-kar-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ki-agli-sharmgah-se-hawa-nikalne-ki-surat-mein-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-ko-namaz-mein-hatheliyan-ya-talwe-zahir-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ko-khwab-mein-inzal-hua-lekin-mani-bahar-na-nikli-to-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-niaz-ka-khana-banana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-dnc-ke-baad-nifas-ke-40-din-pore-karne-zaroori-hain",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/larki-ke-liye-parda-kis-umar-se-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-haroof-e-muqataat-wala-wazifah-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bewah-aurat-ka-apne-dewar-ya-jeth-se-baat-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-wali-aurat-apna-hath-pani-mein-dal-de-tu-pani-mustamal-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/jis-safhe-par-sirf-quran-likha-ho-napaki-ki-halat-mein-usay-chona",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-istighasa-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/susar-ke-bhai-aur-saas-ke-bhai-se-parde-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-liye-makhsoos-ayam-mein-surah-e-kausar-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ko-khwab-mein-ihtilam-hua-tu-ghusl-farz-hoga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-cap-shawl-orh-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nifas-ki-muddat-kitni-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ke-ayyam-mein-tasmiya-ke-sath-asmaul-husna-ka-wazifa-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-nange-sar-durood-pak-padhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/na-mehram-mard-ki-nazar-parne-se-aurat-ka-wazu-toote-ga-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-mard-ka-apni-sauteli-betiyon-se-bhi-parda-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-mahram-kon-se-mard-hain",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-dastane-aur-moze-pehen-kar-namaz-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-na-baligh-ladke-se-parda-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-o-nifas-ki-halat-mein-tawwuz-tasmiyah-aur-asma-ul-husna-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/maa-ka-10-sala-bachay-ke-sath-karachi-se-hyderabad-ka-safar-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-o-nifas-ki-halat-mein-ayat-e-karima-padhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-liye-makhsoos-ayam-main-quran-pak-ka-tarjuma-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoos-ayam-mein-aurat-ka-deeni-books-ko-hath-lagane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-makhsoos-ayam-mein-qaida-ko-chuna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-60-saal-ki-ho-jaye-tu-kya-parda-karna-zaroori-nahi-rehta",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamal-zaya-hone-ke-baad-aane-wale-khoon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-riyaz-al-jannah-ki-ziyarat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/allah-ke-naam-ka-locket-auat-ka-be-wazu-ya-napaki-ki-halat-mein-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-bhi-namaz-mein-bina-kar-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ke-dino-mein-tasbih-pakar-kar-wazifa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-hone-wali-khalwat-sahiha-hogi-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/akhyafi-behan-bhai-ka-parda-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/biwi-ke-liye-shohar-ke-chacha-se-parda-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-wali-ke-jism-se-lagne-wala-pani-mustaml-ho-ga-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nifas-ka-khoon-waqfe-waqfe-se-aane-ke-mutalliq-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/pehla-nifas-40-din-se-pehle-ruk-jaye-tu-hambistri-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-quran-pak-ko-qalam-se-chone-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/istihaza-ki-bimari-mein-har-namaz-ke-waqt-pad-badalna-hoga-ya-nahin",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nifas-ke-doran-bacha-faut-ho-jaye-to-nifas-baqi-rahega-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-masjid-ul-haram-mein-namaz-parhna-behtar-hai-ya-rehaish-gah-mein",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/sar-mein-pin-lage-hone-ki-halat-mein-masah-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-dair-se-aata-ho-to-iddat-kaise-khatam-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/khala-ka-bhanji-ke-shohar-se-parda-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-saas-mehram-hai-damad-ke-samne-saas-ki-namaz-ho-jayegi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamla-aurat-ke-pistan-se-baghair-dard-ke-nikalne-wale-saaf-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nafil-namaz-ke-doran-haiz-shuru-ho-jaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-ka-waqt-shuru-hote-he-azan-se-pehle-aurat-ka-namaz-e-zuhr-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/larki-ka-apne-dada-ke-bhai-se-parda-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bache-ki-paidaish-ke-chalis-din-baad-bhi-aurat-ko-khoon-aaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-liye-chehre-ke-parde-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/sina-band-pehne-baghair-aurat-ki-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nifas-se-farigh-hone-ke-baad-ghusl-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-haram-sharif-ke-andar-masjid-mein-namaz-parhna-afzal-hai-ya-hotel-mein",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-mein-aurat-ko-agle-maqam-se-awaz-ke-sath-hawa-kharij-ho-tu-namaz-aur-wazu-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shohar-ki-ijazat-ke-baghair-uska-maal-sadqa-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-apni-namaz-parhne-ke-liye-iqamat-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/tikoni-scarf-pehen-kar-namaz-parhna-kasia-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/ghair-mehram-ki-maujoodgi-mein-namaz-parhte-hue-muh-chupana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-shadi-shuda-aurat-ka-naak-mein-zewar-pehnna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-o-nifas-ki-halat-mein-tawuz-o-tasmiyah-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-menses-ki-halat-mein-tawaf-e-rukhsat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/chand-aurton-ka-mil-kar-baghair-mehram-safar-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-madani-channel-dekhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/roze-ki-halat-mein-haiz-aa-jaye-tu-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shohar-ke-behnoi-se-parde-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kanch-aur-plastic-ki-churiyan-pehen-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-aur-roze-se-mutaliq-ek-aham-masla",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-baal-chhote-hon-to-taqseer-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/scarf-double-kar-ke-namaz-parhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-kaan-naak-chidwana-aur-in-mein-zewar-pehnna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-bareek-kapre-pehen-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-ke-doran-aurat-ke-baal-nazar-aa-rahe-hon-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bareek-dupatta-duhra-kar-ke-namaz-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nani-ke-bhaiyon-unki-aulad-aur-nani-ke-bhanje-se-parde-ka-masala",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/char-mah-se-kam-ka-hamal-zaya-hone-ke-baad-aane-wala-khoon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/be-khayali-mein-haiz-ki-halat-mein-namaz-o-tilawat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-dalailul-khairat-parhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-sar-ke-baalon-ka-parda",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-wali-aurat-ka-paseena-kapron-par-lag-jaye-tu-kya-kapre-napak-ho-jate-hain",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/baap-beti-ka-aapas-mein-parda-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/5-mah-ka-hamal-zaya-hone-ke-baad-aane-wala-khoon-nifas-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-taweez-pehenne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-80-saal-ke-ghair-mehram-borhe-mard-se-bhi-parda-karna-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-napak-kapre-pak-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-kis-rang-ka-burqa-pehne-gi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-shohar-ka-biwi-ko-chona",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-apni-sagi-nani-ke-bhai-se-parda-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-makhsoos-ayyam-mein-jis-bistar-par-soti-ho-paki-ke-ayyam-me-us-par-sona",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiza-aurat-ka-finaye-masjid-mein-mein-jane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makeup-kharab-hone-ki-wajah-se-dulhan-ka-tayammum-kar-ke-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoos-ayyam-mein-umrah-ki-niyat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-napaki-ki-halat-mein-bache-ko-doodh-pilana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-aurat-ka-kapre-dhona-aur-pak-pani-mein-hath-dalna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-apne-shohar-ke-bhatijon-se-parda-kare-gi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-speaker-par-naat-parhna-karna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shohar-ke-mamo-se-parde-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-mard-doctor-se-kaan-ka-checkup-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-makhsoos-ayam-mein-aurat-ghusal-kar-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/40-saal-se-bari-aurat-ka-mehram-ke-baghair-group-ke-saath-umrah-par-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-haiza-ka-drood-sharif-parhne-ke-liye-wazu-ya-kulli-karna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/sali-ka-behnoi-betakallufi-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/napaki-ki-halat-mein-bache-ko-doodh-pilana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-mard-ki-chappal-pehenne-se-gunahgar-hogi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/agar-aurat-ke-nakhun-par-arq-laga-ho-tu-kya-wazu-hojae-ga",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-sona-chandi-loha-pital-se-bana-hwa-artificial-zewar-pehan-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-ko-miswak-istemaal-nahi-karni-chahiye",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamla-aurat-ka-baith-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-waqt-shuru-hote-hi-namaz-ada-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/baghair-mehram-ke-aurat-doosri-aurat-ke-sath-sharai-masafat-ka-safar-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurton-ka-eyebrow-ke-ilawa-hath-aur-chehre-ke-baal-utarne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/pehla-bacha-paida-ho-tu-namaz-kab-tak-nahi-padhte",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-moze-pehen-kar-namaz-parh-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-me-drood-e-ibrahimi-parhna-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/artificial-jewellery-se-rang-utar-jaye-to-usay-pehan-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-ko-bhi-ihtilam-hota-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shohar-ka-nifas-ki-halat-mein-biwi-se-humbistari-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-haiz-ki-halat-me-quran-pak-parhne-sunne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/teacher-ka-haiz-wali-talibat-ko-qurani-ayat-parhana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ka-khoon-das-din-se-ziyada-aaye-to-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-khushbu-lagana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/larka-aur-larki-ko-doodh-pilane-ki-muddat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/halat-e-nifas-mein-qaza-hone-wali-namaz-aur-roze-ki-qaza-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamla-aurat-ko-khoon-aaye-tu-roza-aur-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-mein-ayat-e-sajda-suni-tu-sajde-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-wajah-se-roze-reh-jaye-to-kia-un-ki-qaza-zarori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-aisay-joote-istemaal-kar-sakti-hai-jis-mein-chandi-ka-kaam-hwa-ho",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoos-ayyam-me-qasida-ghousia-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-ka-apne-susar-ke-bhaiyon-se-bhi-parda-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shohar-ke-inteqal-ke-baad-aurat-iddat-kahan-guzare-gi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamla-aurat-ka-bache-ko-doodh-pilana-kasia",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/ramzan-me-din-me-haiz-se-pak-hui-to-baqia-din-kaise-guzare",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/halat-e-haiz-me-chootne-wale-rozon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ki-sharamgah-mein-dakhil-hone-wale-pak-pani-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/17-saal-ki-umar-me-pehli-bar-haiz-aie-tu-qaza-namazon-ka-hisab-kaise-lagaye",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-khatam-hone-par-ghusal-se-pehle-humbistri-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-me-ayat-ul-kursi-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/halat-e-haiz-me-surat-ul-qadar-ka-wazifa-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurton-ka-masjid-me-namaz-parhna-kis-daleel-se-mana-hain",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-makhsoos-ayyam-me-dua-e-qunoot-parhna-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-liye-namaz-e-jumma-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/larki-aur-larka-kis-umer-me-balig-hoty-hain",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/adat-se-pehle-khoon-band-hojye-to-jima-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-konsi-khusboo-laga-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-balon-ki-choti-ya-paranda-bandhna-aur-paranda-bandh-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/doran-iddat-madani-channel-dekhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ki-halat-me-quran-ka-tarjuma-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-hath-paon-waghera-ke-baal-saaf-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/roze-ki-halat-me-aurat-ko-haiz-periods-ane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/halat-e-haiz-me-namaz-maaf-hone-ki-hikmat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-sajde-ka-tariqa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/mah-ka-hamal-zaya-ho-jaye-to-jari-khoon-haiz-ya-nifaas",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/sirf-chone-se-mani-nikal-jaye-to-kya-ghusal-farz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/safar-me-aurat-ka-namaz-ada-karne-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bache-ko-teen-saal-se-zeyad-maa-ka-doodh-pilana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoos-ayam-me-quran-ka-tarjuma-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/maa-baap-ke-chacha-mama-se-parde-ka-masla",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aadat-ke-dino-se-pehle-khoon-band-ho-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-me-aadat-ke-din-se-pehle-khoon-band-ho-jayen",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-ke-waqt-me-haiz-aa-jaye-to-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-juma-ke-din-zuhr-ki-namaz-kis-waqt-parhe",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-sajde-me-paon-ki-ungli-na-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ke-baad-ghusl-se-pehle-hambistri-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-niqab-pehen-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamla-aurat-namaz-mein-sajda-kaise-kare-gi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/halat-e-istihaza-mein-wazu-ka-tarika",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-liye-namazon-ka-mustahab-waqt-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-sajde-me-paon-ki-ungliyan-lagana-zaroori-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurton-ka-masjid-me-jamat-se-namaz-parhne-ke-liye-jana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-wali-ka-paper-main-tarjuma-e-quran-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/larki-ka-school-picnic-par-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/farz-ghusl-kiye-bagair-kaam-kaaj-kar-sakte-hain-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-liye-blade-ke-zariye-apne-ghair-zaroori-baal-utarna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurton-ke-liye-ghusl-e-juma-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurton-ka-clip-laga-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurton-ke-utre-hue-balon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kafira-daiya-se-zachgi-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-wali-aurat-ka-dupatta-le-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bachi-par-parda-karna-kis-umar-me-lazim-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-ghar-ki-chhat-par-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/digar-dhaton-ki-jewelry-istemal-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-me-reh-jane-wali-namaz-aur-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shohar-biwi-ka-ek-dusre-ki-mayyat-ko-ghusl-dena",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-ke-baad-humbistari-ka-waqt",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-farz-namaz-kab-parhe",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/iddat-me-kanch-ki-chooriyan-pehnna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/iddat-kahan-guzarna-zaroori-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/wiladat-ke-baad-haiz-na-aane-par-talaq-ki-iddat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-pas-hajj-ke-akhrajat-hon-lekin-mehram-ke-na-hon",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-buland-awaz-se-naat-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/ghair-muslim-aurat-ko-kaam-par-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-takhna-nazar-aa-raha-ho-tu-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-40km-safar-baghair-mehram-karna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/teen-talaq-ke-baad-aurat-iddat-kahan-guzare",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bewa-ki-iddat-maike-mein",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/auraton-ke-liye-asar-ka-mustahab-waqt",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-mein-ayat-e-sajdah-sunna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/auraton-ki-salat-ul-tasbih-ki-jamaat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/naak-kaan-chhedne-ki-paise-lena",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/khawateen-ka-moye-mubarak-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/iddat-mein-aurat-ka-bahar-nikalna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-liye-farz-hajj-ki-raqam",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/khula-mein-haq-mehr-se-zayad-maal-lena",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamilah-aurat--roza-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/apni-biwi-ko-qaber-mein-utarna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/tawaf-ke-baad-ke-nawafil-kahan-parhe",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoos-ayam-mein-qurani-wazaif-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/iddat-ke-dauran-aurat-ka-zewar-pehna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/eddat-me-mekay-jana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/baligh-dewar-kay-sath-mekay-jana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bacha-honay-say-pehlay-khoon-anay-per-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoos-ayyam-me-aisal-e-sawab",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-me-aurat-ka-buland-awaz-se-qirat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/larki-ka-mamu-ke-betay-ke-saath-umrah-par-jana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/naqab-pehn-kar-naat-khuwani",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/nafa-na-ho-to-us-per-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bagair-overtime-paisay-lena",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoos-ayyam-me-ayatul-kursi-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/biwi-ki-wafat-kay-bad-saas-say-parda",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamla-aurat-kitnay-din-eddat-karay",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/scarf-lapetne-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoos-ayyam-me-sajda-e-tilawat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-azan-say-pehlay-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/taqseer-me-takhir",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shohar-ki-ijazat-kay-bagair-hajj",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/biwi-kay-maal-ki-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/bila-waja-shari-khula-ka-mutalba",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/ayyam-e-makhsoosa-me-azan-ka-jawab",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/gair-mehram-ko-parhana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/artificial-palken-lagana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamla-aur-doodh-pilane-wali-aurat-ke-liye-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-mardana-libas-pehanna-1237",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/halat-e-haiz-me-nahana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shohar-ki-iqtida-me-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/masjid-ki-jamat-say-pehlay-aurat-ki-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-khaloo-ya-na-baligh-ke-sath-safar",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoose-ayam-mein-quran-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/hamla-aurat-ki-eddat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shari-uzr-me-aurat-ka-quran-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/islami-behn-qada-me-kaisay-bethen",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/andheray-me-nangay-sar-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/doran-e-khutba-aurat-zuhr-ki-namaz",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/sajda-me-aurat-ki-claian",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-skirt-pehen-kar-namaz-parh-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoos-ayyam-me-wuzu",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ko-namaz-e-janaza-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/doodh-kapron-per-lag-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-joda-bandh-kar-namaz-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/maskhsoos-ayyam-aur-roza",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/maskhsoos-ayyam-me-nikah",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/waqt-e-namaz-me-haiz",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kya-aurat-peer-ho-sakti",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-makhsoos-ayyam-mein-nakhun-katna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/peer-o-murshid-say-parda",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/eddat-e-wafat-aik-kamray-me",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/shohar-ki-ijazat-kay-bagair-tohfa-dena",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ke-liye-miswak-ya-dandasa-istemal-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/halat-e-haiz-me-sai",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/namaz-me-aurat-kay-baal",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ko-baal-munwana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-mic-par-naat-parhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/ihram-me-paon-ki-hadi-chupana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/haiz-me-ihram-ki-niyyat",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ajnabi-doctor-kay-pass",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/islami-behn-ko-hath-choomna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/behno-ka-hissa-muaf-krna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-bagair-mehram-hajj-umrah",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-ka-hajj-umrah-kay-liye-ihram",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/sar-nanga-karne-say-wuzu-tootna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/jinabat-haiz-o-nifas-islami-kutub-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makhsoos-ayyam-me-roze-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/doodh-pilane-wali-maaon-ke-liye-ramzan-ke-roze",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/aurat-sar-ka-masah-kaise-kare",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/makeup-wale-stickers-lage-hon-tu-wazu-ghusl-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/wazu-ke-baad-nail-polish-lagana-aur-artificial-jewellery-pehen-kar-namaz-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/mehram-ke-baghair-umrah-par-jana",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/kanch-ki-choriyan-pehna",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/doran-e-roza-haiz-ya-nifas-ana-3935",
-  "https://www.fatwaqa.com/ur/fatawa/auraton-ke-masail/auroton-ko-baal-chotay-karwana",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/cheenk-ka-jawab",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/ghair-muslim-ki-cheezen-khana",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/ghair-muslim-ko-comedy-show-ki-ticket-dena",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/mushrik-kafir-maghfirat",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/qadiani-se-sadaqah-lena",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/ghair-muslim-ka-thook-aur-pasina-paak-hai-ya-napak",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/masjid-ki-tameer-mein-ghair-muslim-ka-chanda",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/kafir-ke-yahan-care-assistant-ki-job-karna",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/mirzai-ke-pas-mulazmat-karna",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/non-muslim-ko-eid-gift-dena",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/ghair-muslim-ko-niyaz-khilana",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/kafir-ke-liye-dua-karna",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/kafir-ke-ache-amal-ka-sila",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/murtad-ki-qaza-namazon-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/kuffar-o-mushrikeen-ki-bakhshish-teht-e-qudrat-e-ilahi-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/qadiani-ke-retire-hone-par-usay-farewell-party-dena",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/qadiani-se-zameen-theke-par-lena",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/ghair-muslim-ustad-se-bache-ko-taleem-dilwane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/kafir-ka-qarz-ada-na-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/kya-paidaishi-qadiani-bhi-murtad-hai",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/ghair-muslim-se-uske-tehwar-par-tohfa-lena",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/kafir-ke-thook-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/ghair-muslim-mard-ya-aurat-ko-sadqa-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/ghair-muslim-ko-quran-parhane-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/ghair-muslim-ke-janaze-mein-jana-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/gair-muslim-par-quran-ki-surat-parh-kar-dam-karna",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/qadianiyo-ke-sath-mil-kar-karobar-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/murtad-ke-zabeeha-ka-hukum-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/qadiani-se-ilaj-karwana-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/koi-shakhs-kufr-bakh-kar-murtad-hogaya-to-us-waqt-ki-namaz-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/janwar-ki-aantein-aur-ojhri-ghair-muslim-ko-dena",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/wh-5226-india-darul-harb-hai-ya-dar-ul-islam",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/musalman-ka-qadiyaniyon-se-free-medicine-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/qadiani-ki-products-kharidne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/mirza-qadiyani-kon-hai",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/kafir-ke-liye-iman-par-khatima-ki-dua-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/murtad-se-gift-lene-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/christian-ke-sath-musalman-ka-dosti-karna-aur-khana-khana",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/qadiani-ke-sath-uthna-baithna-khushi-ghami-mein-shamil-hona-aur-taluqat-rakhne-ka-kya-hukum-hai",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/kafir-ke-salam-ka-jawab-dena-6147",
-  "https://www.fatwaqa.com/ur/fatawa/kafir-aur-murtad/qadyaniyon-se-mail-jol-4862",
-  "https://www.fatwaqa.com/ur/fatawa/majlis-e-tehqiqat-e-shariah/current-plus-account-ke-munafa-sood-hain",
-  "https://www.fatwaqa.com/ur/fatawa/majlis-e-tehqiqat-e-shariah/flats-ki-booking-par-pesh-ane-wale-jadeed-masail",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/account-mein-galat-transfer-aur-bank-katoti",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/wakeel-ki-kharidari-discount",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/qarz-par-kiraya-sood",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/kiraye-ki-sherwani-mein-paise",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/solar-panel-kiraye-per-dena",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/qurbani-zibah-gosht",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/bijli-bill-zakat",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/muddat-puri-hone-se-pehle-dukan-chorne-ki-soorat",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/amanat-ki-woh-soorat-jo-qarz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/no-return-no-exchange-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/sone-chandi-ki-tasbeeh-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/cheez-naqd-ke-bajaye-udhar-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/soodi-partnership-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/arhti-ka-do-tarfa-commission-lena",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/account-mein-aane-wali-raqam-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/udhar-cheez-se-profit-lena",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/ghair-muslim-mulk-ki-imdad-lena",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/5-din-late-aane-par-salary-katna",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/3-investor-1-working-partner-mudarabah",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/cashback-shart-ke-sath-account-mein-raqam-rakhna",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/qadiani-se-ghar-kiraye-par-lena",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/qarz-10-saal-baad-wapas-karna",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/non-muslim-bank-se-credit-card-lena",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/scholarship-ki-raqam-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/qarz-waqt-par-wapas-na-karne-ki-wajah-se-nuqsan-lene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/bc-jama-karwane-wale-ka-inteqal-ho-jaye-tu-raqam-wapas-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/web-development-mein-shirkat-bil-amal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/partner-ka-cheez-mehngi-bech-kar-izafi-nafa-khud-rakhna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/ek-ki-zameen-aur-baqi-kaam-dusre-par-hon-to-mazaraat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/working-partner-ke-liye-zyada-nafa-rakhne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/khareedi-gayi-cheez-ki-qeemat-ada-karne-ke-liye-rakhi-raqam-par-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/qarz-wapas-milne-ki-umeed-na-rahi-ho-tu-zakat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/match-harne-par-khana-khilana-bhi-jua-hai",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/raqam-kam-zyada-ho-aur-nafa-nuqsan-barabar-ho-tu-aisi-shirkat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/raqam-invest-karne-ke-sath-kaam-karne-ki-shart-par-mudarabat-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/bc-mein-takheer-se-raqam-jama-karwane-se-izafi-raqam-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/jhooti-report-banane-ki-naukri-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/soda-cancel-hone-par-wasool-shuda-commission-wapas-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/hotel-ya-dukan-par-musafiron-ki-gari-rokne-par-commission-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/raseed-apne-naam-par-banwana-qabza-shumar-hoga",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/taxi-ya-rickshaw-walon-ka-kiraya-tay-na-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/qarz-wapas-karne-ke-gawah-na-hon-to-ikhtilaf-kis-tarah-khatam-karein",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/pehnne-ke-liye-kapray-kiraye-par-lena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/soodi-bank-mein-mulazmat-karne-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/tauba-karte-waqt-rishwat-wali-raqam-malik-ko-wapis-na-dena-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/buy-back-ka-shari-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/mardana-bracelet-bechna-jaiz-hai-ya-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/customer-ko-product-ka-rate-zyada-batane-ki-shari-haisiyat",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/ek-ka-maal-ho-aur-dono-shareek-milkar-kaam-kare-to-kya-ye-jaiz-hai",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/janne-walon-ko-cheez-lakar-dene-par-commission-lena-kaisa-hai",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/mahina-poora-hone-par-ujrat-dena-tay-ho-to-advance-ujrat-dena-laazim-nahi",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/miraas-mein-mili-cheez-ko-qabze-se-pehle-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/investment-karne-aur-iska-commission-agent-banne-se-mutaliq-ahem-masla",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/gold-ke-badle-gold-ki-kharidari-ki-lazmi-ehtiyatain",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/maal-e-tijarat-ki-qeemat-kam-ho-gayi-tu-zakat-kis-qeemat-se-ada-ki-jaye",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/garments-ke-chalte-karobar-me-shirkat-ka-tareeqa",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/roti-banane-walon-aur-hotel-walon-ki-ek-deal-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/ek-ki-raqam-dusre-ka-kaam-aur-sara-nafa-raqam-dene-wale-ko-mile-is-shart-par-partnership-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/warranty-ki-shart-par-cheez-bechne-aur-claim-karne-ki-shari-haisiyat",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/insurance-company-mein-accountant-ki-job-karna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/promotion-ke-liye-aik-ki-qeemat-me-2-cheezain-dene-ka-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/paise-aur-dukan-dekar-aqd-e-muzarbat-ki-sharai-haisiyat",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/soda-hone-ke-baad-currency-ki-qeemat-mein-kami-ziyaadti-ka-sharai-hukum",
-  "https://www.fatwaqa.com/ur/fatawa/iqtisad/partnership-khatam-karne-ka-tarika-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/sadqa/mal-e-haram-se-syed-ko-sadqa",
-  "https://www.fatwaqa.com/ur/fatawa/sadqa/ramzan-ke-baad-fitrana-dena",
-  "https://www.fatwaqa.com/ur/fatawa/sadqa/sadqa-ek-sath-ya-thora-thora",
-  "https://www.fatwaqa.com/ur/fatawa/sadqa/ghar-walon-par-kharch-karna-sadaqah",
-  "https://www.fatwaqa.com/ur/fatawa/sadqa/sadqa-fitr-mein-gandum-ki-miqdar",
-  "https://www.fatwaqa.com/ur/fatawa/sadqa/na-baligh-par-sadqa-fitr-wajib-hona",
-  "https://www.fatwaqa.com/ur/fatawa/sadqa/bimar-shakhs-ke-roze-ka-fidya",
-  "https://www.fatwaqa.com/ur/fatawa/sadqa/sadqe-ka-gosht-khud-khana",
-  "https://www.fatwaqa.com/ur/fatawa/sadqa/bimar-shakhs-ki-taraf-se-sadqa-karna-ho-tu-raqam-sadqa-ki-jaye-ya-janwar",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/salam-pohnchana",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/sardi-garmi-se-mutalliq-hadees",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/khane-mein-shaitan-ka-shareek-hona",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/dua-mein-hath-uthana",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/biwi-ko-moharim-se-milne-se-rokna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/masjid-haram-aur-hudood-e-haram-mein-farq",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/nabi-kareem-ko-mukhra-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/bimar-ki-dua",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/parhosi-ke-darakht-se-phal-torna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/parindon-ko-dana-dalna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/husn-e-akhlaq-ki-tareef",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/namaz-ke-ilawa-dua-mangna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/kharab-fruit-ka-badboodar-pani",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/kushti-khelna-kaisa",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/amanat-rakhwaya-sona-bechna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/nabi-ka-mojza-wali-ki-karamat",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/paan-rakh-kar-wazaif-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/ek-aurat-ke-dawe-se-wasiyat",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/jahez-me-zewar-dena",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/new-muslim-naam-tabdeel-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/qari-sahab-ka-tohfa",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/rooh-ki-mot",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/washroom-mein-barhana-hokar-wazifa-parhna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/imam-hussain-ko-mazloom-kehna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/kya-ilaj-karwana-tawakkul-ke-khilaf-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/iftitah-par-aalim-ko-bulana",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/aurat-wali-banna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/hijra-jannat-mein",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/nokri-ki-waja-se-darhi-katna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/chachi-se-be-takalluf",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/allah-ke-khauf-se-ibadat-ya-mohabbat-se",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/zam-zam-maqsad-ke-liye-peena",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/shaheed-ki-zindagi-aur-rizq",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/kya-hijra-jannat-mein-nahi-jayega",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/bachon-ke-girne-wale-dant",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/kya-marz-ul-mout-se-khataen-maaf-hoti-hain",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/asar-ke-baad-khana-peena-sona-aur-parhna-likhna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/kya-aurat-apne-shohar-ki-pasli-se-banai-gai-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/pode-jandar-hain-ya-bejan",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/meke-se-chaqu-qenchi-aur-sui-lana",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/dunya-ka-waqt-rukne-ke-waqiat",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/kya-nazar-e-bad-se-insan-ki-maut-ho-sakti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/kya-yahood-par-oont-aur-khargosh-haram-the",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/badlon-mein-garaj-chamak-aur-bijli-girne-ki-waja",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/srif-apne-ya-ghar-walon-ke-liye-dua",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/roohon-ki-pehchan-aur-duniya-mein-taluq",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/subah-sham-raat-aur-din-ke-azkar-ke-oqat",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/kauwa-aur-chooha-fasiq-kyun",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/makrooh-tahreemi-aur-makrooh-tanzihi",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/nabaligh-ki-ibadat-ka-sawab",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/khatna-shuda-peda-hone-wale-bache-ka-khatna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/arafah-ka-matlab-kya-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/chand-ki-taraf-ishara-karna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/jannat-mein-hambistari",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/khala-ke-rishte-ki-ahmiyat",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/darhi-ki-had",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/jannat-ul-baqi-ki-mitti-lana",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/matlabi-dost-se-rawayya",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/amal-ke-liye-ilm-seekhna-farz-hai-ya-mutlaqan-ilm-seekhna",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/wada-khilafi-ke-ahkam",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/samiri-kon-tha",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/kya-maghrib-aur-isha-ke-darmiyan-sone-se-aurat-banjh-hoti-hai",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/ramzan-mien-inteqal-karne-ki-fazilat",
-  "https://www.fatwaqa.com/ur/fatawa/mutafariqat/ladke-aur-ladki-mein-baligh-hone-ki-alamat"
-]
-
-# END
\ No newline at end of file
@@ -0,0 +1,281 @@
+"""
+Local stand-in for fatwaqa.com, for offline scraper benchmarks and
+repeatable retry / rate-limit runs.
+
+Routes (same paths as the real site, so `--origin` is all a client needs):
+
+    /ur/fatawa/<category>?page=N     listing page, JSON-wrapped like the XHR endpoint
+    /ur/fatawa/<category>/<slug>     fatwa page with the real captureDiv layout
+    /_stats                          requests served, by status (JSON)
+
+The synthetic corpus is `--pages` fatwas spread round-robin over the
+cdn_extracter categories as `<category>/fatwa-<j>`, newest (highest j) first
+in the listings. Pages are generated on request from the URL, so a corpus of
+a million pages costs no memory for content. Other fatwa paths (e.g. a real registry) get
+a synthetic page keyed by the path, or a 404 with `--strict`. With
+`--html-cache DIR` recorded pages are served from an html_cache first.
+
+Fault injection, decided from a seeded hash of (path, attempt number) so a
+run replays the same way every time (`FixtureSite.reset()` starts the attempt
+numbers over between runs against one server):
+
+    --latency MS --jitter MS      added to every response
+    --rate-429 / --rate-5xx       fraction of requests answered 429 (Retry-After) / 503
+    --rate-timeout                fraction that hang for --hang seconds, then drop the connection
+    --fail-first N                the first N requests of every URL fail with --fail-status
+
+With any of these on, the attempt numbers take an entry per requested path
+(~120 bytes), so a faulted million-page run holds ~120 MB of them.
+
+Fatwa pages carry an ETag and honor If-None-Match, for `--mode refresh`.
+
+Usage:
+    python fixture_server.py --pages 1000000 --port 8800 --write-registry /tmp/urls.txt
+    python runner.py --origin http://127.0.0.1:8800 --registry /tmp/urls.txt --data-dir /tmp/fatwa_data
+    python cdn_extracter.py --origin http://127.0.0.1:8800 --registry /tmp/found.txt
+"""
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import zlib
+
+from fatwa_categories import CATEGORIES
+from fatwa_fixtures import synthetic_fatwa_page, synthetic_listing_page
+from url_registry import BASE_URL
+
+LISTING_BASE = BASE_URL.rstrip('/')
+PATH_PREFIX = urlsplit(BASE_URL).path          # /ur/fatawa/
+SITE_ORIGIN = BASE_URL[:-len(PATH_PREFIX)]     # https://www.fatwaqa.com
+
+class FixtureSite:
+    """What to serve for a path; shared by all handler threads."""
+
+    def __init__(self, pages=10000, categories=CATEGORIES, html_cache=None, strict=False,
+                 latency=0.0, jitter=0.0, rate_429=0.0, rate_5xx=0.0, rate_timeout=0.0,
+                 fail_first=0, fail_status=503, retry_after=1, hang=35.0, seed=0):
+        self.pages = pages
+        self.categories = list(categories)
+        self._category_index = {c: k for k, c in enumerate(self.categories)}
+        self.html_cache = html_cache
+        self.strict = strict
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.rate_timeout = rate_timeout
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        self.retry_after = retry_after
+        self.hang = hang
+        self.seed = seed
+
+        self._lock = threading.Lock()
+        self._attempts = Counter()
+        self.stats = Counter()
+
+    # =================== corpus ================================================
+
+    def category_size(self, category):
+        k = self._category_index[category]
+        return self.pages // len(self.categories) + (k < self.pages % len(self.categories))
+
+    def iter_urls(self):
+        for category in self.categories:
+            for j in range(1, self.category_size(category) + 1):
+                yield f"{BASE_URL}{category}/fatwa-{j}"
+
+    def page_index(self, category, slug):
+        """Corpus index of a synthetic fatwa, or None when the path is outside the corpus."""
+        if category not in self._category_index or not slug.startswith('fatwa-'):
+            return None
+        j = slug[len('fatwa-'):]
+        if not j.isdigit() or not 1 <= int(j) <= self.category_size(category):
+            return None
+        return (int(j) - 1) * len(self.categories) + self._category_index[category]
+
+    def fatwa_body(self, path):
+        if self.html_cache is not None:
+            body = self.html_cache.get(SITE_ORIGIN + path)
+            if body is not None:
+                return body.encode('utf-8')
+        category, _, slug = path[len(PATH_PREFIX):].partition('/')
+        index = self.page_index(category, slug)
+        if index is None:
+            if self.strict:
+                return None
+            index = zlib.crc32(path.encode('utf-8'))
+        return synthetic_fatwa_page(index).encode('utf-8')
+
+    def listing_body(self, category, page):
+        if category not in self._category_index:
+            return None
+        return synthetic_listing_page(category, page, total=self.category_size(category),
+                                      base=LISTING_BASE).encode('utf-8')
+
+    # =================== faults ================================================
+
+    def _rng(self, path):
+        with self._lock:
+            self._attempts[path] += 1
+            attempt = self._attempts[path]
+        digest = hashlib.blake2b(f"{self.seed}:{path}:{attempt}".encode('utf-8'), digest_size=8).digest()
+        return attempt, random.Random(int.from_bytes(digest, 'big'))
+
+    def fault(self, path):
+        """(delay seconds, fault) for this request; fault is None, 'timeout' or a status."""
+        if not (self.latency or self.jitter or self.rate_429 or self.rate_5xx
+                or self.rate_timeout or self.fail_first):
+            return 0.0, None
+        attempt, rng = self._rng(path)
+        delay = self.latency + rng.uniform(0, self.jitter)
+        if attempt <= self.fail_first:
+            return delay, self.fail_status
+        roll = rng.random()
+        if roll < self.rate_timeout:
+            return delay, 'timeout'
+        if roll < self.rate_timeout + self.rate_429:
+            return delay, 429
+        if roll < self.rate_timeout + self.rate_429 + self.rate_5xx:
+            return delay, 503
+        return delay, None
+
+    def count(self, outcome):
+        with self._lock:
+            self.stats[str(outcome)] += 1
+
+    def reset(self):
+        """Forget attempt numbers and stats, so the next run sees the same faults as the first."""
+        with self._lock:
+            self._attempts.clear()
+            self.stats.clear()
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    site = None
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b'', content_type='text/html; charset=utf-8', headers=()):
+        self.site.count(status)
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path == '/_stats':
+            with self.site._lock:
+                body = json.dumps(dict(self.site.stats)).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if not parts.path.startswith(PATH_PREFIX):
+            self._send(404)
+            return
+
+        delay, fault = self.site.fault(self.path)
+        if fault == 'timeout':
+            time.sleep(self.site.hang)
+            self.site.count('timeout')
+            self.close_connection = True
+            return
+        if delay:
+            time.sleep(delay)
+        if fault == 429:
+            self._send(429, headers=[('Retry-After', str(self.site.retry_after))])
+            return
+        if fault is not None:
+            self._send(fault)
+            return
+
+        rest = parts.path[len(PATH_PREFIX):].strip('/')
+        if '/' not in rest:
+            page = parse_qs(parts.query).get('page', ['1'])[0]
+            body = self.site.listing_body(rest, int(page) if page.isdigit() else 1)
+            if body is None:
+                self._send(404)
+            else:
+                self._send(200, body, 'application/json; charset=utf-8')
+            return
+
+        body = self.site.fatwa_body(parts.path)
+        if body is None:
+            self._send(404)
+            return
+        etag = f'"{zlib.crc32(body):08x}"'
+        if self.headers.get('If-None-Match') == etag:
+            self._send(304, headers=[('ETag', etag)])
+            return
+        self._send(200, body, headers=[('ETag', etag)])
+
+def start_server(site, port=0, host='127.0.0.1'):
+    """Serve `site` from a daemon thread; the origin is f"http://{host}:{server.server_port}"."""
+    handler = type('FixtureHandler', (FixtureHandler,), {'site': site})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in fatwa site")
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--pages', type=int, default=10000, help="synthetic corpus size")
+    parser.add_argument('--html-cache', help="serve recorded pages from this html_cache dir first")
+    parser.add_argument('--strict', action='store_true', help="404 for fatwa paths outside the corpus")
+    parser.add_argument('--write-registry', metavar='PATH', help="write the corpus URLs as a URL registry")
+    parser.add_argument('--latency', type=float, default=0, help="ms added to every response")
+    parser.add_argument('--jitter', type=float, default=0, help="up to this many ms more, uniformly")
+    parser.add_argument('--rate-429', type=float, default=0)
+    parser.add_argument('--rate-5xx', type=float, default=0)
+    parser.add_argument('--rate-timeout', type=float, default=0)
+    parser.add_argument('--hang', type=float, default=35, help="seconds a timeout fault hangs")
+    parser.add_argument('--fail-first', type=int, default=0)
+    parser.add_argument('--fail-status', type=int, default=503)
+    parser.add_argument('--retry-after', type=int, default=1, help="Retry-After seconds on 429")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    html_cache = None
+    if args.html_cache:
+        from html_cache import HtmlCache
+        html_cache = HtmlCache(args.html_cache)
+
+    site = FixtureSite(
+        pages=args.pages, html_cache=html_cache, strict=args.strict,
+        latency=args.latency / 1000, jitter=args.jitter / 1000,
+        rate_429=args.rate_429, rate_5xx=args.rate_5xx, rate_timeout=args.rate_timeout,
+        fail_first=args.fail_first, fail_status=args.fail_status,
+        retry_after=args.retry_after, hang=args.hang, seed=args.seed)
+
+    if args.write_registry:
+        from url_registry import UrlRegistry
+        UrlRegistry(args.write_registry).rewrite(site.iter_urls())
+        print(f"📝 Wrote {args.pages} URLs to {args.write_registry}")
+
+    server = start_server(site, args.port, args.host)
+    print(f"🧪 Serving {args.pages} synthetic fatwas on http://{args.host}:{server.server_port}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"\n📊 Served: {dict(site.stats)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""
+On-disk cache of fetched fatwa pages, so the parser can be re-run offline.
+
+Layout under `root` (default fatwa_data/html_cache/):
+
+    objects/ab/<sha256 of body>.zst|.gz    compressed page body, content-addressed
+    refs/cd/<sha256 of url>.json           {url, object, codec, etag, last_modified,
+                                            fetched_at, status, bytes}
+
+Identical bodies are stored once; a URL's ref points at its latest body.
+Bodies are compressed with zstd when the `zstandard` package is available,
+gzip otherwise; the codec is recorded per ref so both can coexist.
+Writes go through a temp file + os.replace, so the cache is safe to share
+between scraper threads and processes.
+"""
+
+from pathlib import Path
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DEFAULT_ROOT = Path('fatwa_data') / 'html_cache'
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+def _atomic_write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+class HtmlCache:
+    def __init__(self, root=DEFAULT_ROOT, codec=None):
+        self.root = Path(root)
+        self.codec = codec or ('zstd' if zstandard else 'gzip')
+        if self.codec == 'zstd' and zstandard is None:
+            raise ImportError("codec='zstd' needs the zstandard package")
+
+    # =================== paths =================================================
+
+    def _ref_path(self, url):
+        key = _sha256(url.encode('utf-8'))
+        return self.root / 'refs' / key[:2] / f"{key}.json"
+
+    def _object_path(self, digest, codec):
+        ext = 'zst' if codec == 'zstd' else 'gz'
+        return self.root / 'objects' / digest[:2] / f"{digest}.{ext}"
+
+    # =================== codec =================================================
+
+    def _compress(self, data):
+        if self.codec == 'zstd':
+            return zstandard.ZstdCompressor(level=10).compress(data)
+        return gzip.compress(data, compresslevel=6)
+
+    @staticmethod
+    def _decompress(data, codec):
+        if codec == 'zstd':
+            if zstandard is None:
+                raise ImportError("cached page is zstd-compressed; install zstandard")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    # =================== API ===================================================
+
+    def put(self, url, body, etag=None, last_modified=None, status=200, fetched_at=None):
+        raw = body.encode('utf-8')
+        digest = _sha256(raw)
+        obj = self._object_path(digest, self.codec)
+        if not obj.exists():
+            _atomic_write(obj, self._compress(raw))
+
+        meta = {
+            'url': url,
+            'object': digest,
+            'codec': self.codec,
+            'etag': etag,
+            'last_modified': last_modified,
+            'status': status,
+            'bytes': len(raw),
+            'fetched_at': fetched_at or time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        _atomic_write(self._ref_path(url), json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+        return meta
+
+    def put_response(self, url, res):
+        """Cache a `requests` response (encoding already set by the caller)."""
+        return self.put(url, res.text,
+                        etag=res.headers.get('ETag'),
+                        last_modified=res.headers.get('Last-Modified'),
+                        status=res.status_code)
+
+    def meta(self, url):
+        path = self._ref_path(url)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding='utf-8'))
+
+    def get(self, url):
+        meta = self.meta(url)
+        if meta is None:
+            return None
+        data = self._object_path(meta['object'], meta['codec']).read_bytes()
+        return self._decompress(data, meta['codec']).decode('utf-8')
+
+    def __contains__(self, url):
+        return self._ref_path(url).exists()
+
+    def iter_meta(self):
+        refs = self.root / 'refs'
+        if not refs.exists():
+            return
+        for path in sorted(refs.glob('*/*.json')):
+            yield json.loads(path.read_text(encoding='utf-8'))
+
+    def urls(self):
+        return [m['url'] for m in self.iter_meta()]
+
+    def stats(self):
+        objects = list((self.root / 'objects').glob('*/*')) if self.root.exists() else []
+        metas = list(self.iter_meta())
+        return {
+            'urls': len(metas),
+            'objects': len(objects),
+            'raw_bytes': sum(m['bytes'] for m in metas),
+            'stored_bytes': sum(p.stat().st_size for p in objects),
+        }
@@ -0,0 +1,315 @@
+"""
+Shared HTTP client for the fatwa scrapers.
+
+Every fetch goes through one pooled `requests.Session`, so connections to
+www.fatwaqa.com are kept alive between pages instead of paying a new TCP +
+TLS handshake per fatwa. On top of that the client:
+
+  - caches DNS lookups for `dns_ttl` seconds, for its own connections only
+    (0 turns the cache off)
+  - advertises gzip (and brotli, when the `brotli` package is installed)
+  - records per-request timings: connect (TCP + TLS, 0 on a reused
+    connection), TTFB (request sent -> response headers) and download
+    (headers -> last body byte)
+  - optionally paces itself through a `rate_limiter.AdaptiveRateLimiter`,
+    retrying throttled (429/503) requests once the limiter lets it
+  - can send every request to another origin (`install_origin_override`),
+    e.g. a local stand-in server, while URLs everywhere else stay canonical
+
+Usage:
+    from http_client import get_client
+    res = get_client().get(url, headers=headers, timeout=30)
+    print(res.timing)
+    get_client().print_timing_report()
+"""
+
+from collections import OrderedDict, deque
+import socket
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.poolmanager import PoolManager
+
+from rate_limiter import THROTTLE_STATUSES
+
+try:
+    import brotli  # noqa: F401  (urllib3 decodes 'br' only when this is importable)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+# =================== DNS cache ==============================================================
+
+class DnsCache:
+    """Bounded, TTL'd getaddrinfo cache for the connections of one client only.
+
+    Other libraries in the process (psycopg2, HF downloads, Streamlit) keep
+    resolving through `socket.getaddrinfo` as usual.
+    """
+
+    def __init__(self, ttl=300, maxsize=256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, host, port):
+        """Addresses for (host, port), most preferred first."""
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit and hit[0] > now:
+                self._entries.move_to_end(key)
+                return hit[1]
+        infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            self._entries[key] = (now + self.ttl, addresses)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return addresses
+
+# =================== connection timing ======================================================
+
+_local = threading.local()
+
+def _record_connect(seconds):
+    _local.connect = getattr(_local, 'connect', 0.0) + seconds
+
+class _TimedConnectionMixin:
+    dns_cache = None
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _record_connect(time.perf_counter() - start)
+
+    def _new_conn(self):
+        if self.dns_cache is None or self.proxy is not None:
+            return super()._new_conn()
+        host = self._dns_host
+        try:
+            addresses = self.dns_cache.resolve(host, self.port)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        # connect to the cached address; TLS still verifies against self.host
+        try:
+            for i, address in enumerate(addresses):
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError):
+                    if i == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+class _DnsCachePoolMixin:
+    dns_cache = None
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.dns_cache = self.dns_cache
+        return conn
+
+class TimedHTTPConnectionPool(_DnsCachePoolMixin, HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(_DnsCachePoolMixin, HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+class TimedPoolManager(PoolManager):
+    def __init__(self, *args, dns_cache=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dns_cache = dns_cache
+        self.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, *args, **kwargs):
+        pool = super()._new_pool(*args, **kwargs)
+        pool.dns_cache = self.dns_cache
+        return pool
+
+class TimedHTTPAdapter(HTTPAdapter):
+    def __init__(self, *args, dns_cache=None, **kwargs):
+        self.dns_cache = dns_cache
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = TimedPoolManager(num_pools=connections, maxsize=maxsize, block=block,
+                                            dns_cache=self.dns_cache, **pool_kwargs)
+
+# =================== origin override ========================================================
+
+_origin_override = None
+
+def install_origin_override(origin):
+    """Send all requests to `origin` (scheme://host[:port]) instead of the URL's own; None undoes it."""
+    global _origin_override
+    _origin_override = origin.rstrip('/') if origin else None
+
+def _route(url):
+    if _origin_override is None:
+        return url
+    parts = urlsplit(url)
+    return _origin_override + urlunsplit(('', '', parts.path, parts.query, parts.fragment))
+
+# =================== client =================================================================
+
+class RequestTiming:
+    __slots__ = ('url', 'status', 'connect', 'ttfb', 'download', 'bytes')
+
+    def __init__(self, url, status, connect, ttfb, download, size):
+        self.url = url
+        self.status = status
+        self.connect = connect
+        self.ttfb = ttfb
+        self.download = download
+        self.bytes = size
+
+    @property
+    def total(self):
+        return self.connect + self.ttfb + self.download
+
+    def __repr__(self):
+        return (f"RequestTiming(status={self.status}, connect={self.connect*1000:.1f}ms, "
+                f"ttfb={self.ttfb*1000:.1f}ms, download={self.download*1000:.1f}ms, bytes={self.bytes})")
+
+class HttpClient:
+    def __init__(self, pool_connections=4, pool_maxsize=16, pool_block=True,
+                 timeout=30, dns_ttl=300, headers=None, keep_timings=10000,
+                 rate_limiter=None, throttle_retries=3):
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.throttle_retries = throttle_retries
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+
+        self.dns_cache = DnsCache(dns_ttl) if dns_ttl else None
+        adapter = TimedHTTPAdapter(pool_connections=pool_connections,
+                                   pool_maxsize=pool_maxsize,
+                                   pool_block=pool_block,
+                                   dns_cache=self.dns_cache)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.timings = deque(maxlen=keep_timings)
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        """`requests.get` over the pooled session; the response carries `.timing`."""
+        kwargs.setdefault('timeout', self.timeout)
+        for attempt in range(self.throttle_retries + 1):
+            res = self._limited_get(url, **kwargs)
+            if (self.rate_limiter is None or res.status_code not in THROTTLE_STATUSES
+                    or attempt == self.throttle_retries):
+                return res
+
+    def _limited_get(self, url, **kwargs):
+        if self.rate_limiter is None:
+            return self._timed_get(url, **kwargs)
+
+        self.rate_limiter.acquire()
+        try:
+            res = self._timed_get(url, **kwargs)
+        except Exception:
+            self.rate_limiter.release(error=True)
+            raise
+        self.rate_limiter.release(status=res.status_code,
+                                  latency=res.timing.connect + res.timing.ttfb,
+                                  retry_after=res.headers.get('Retry-After'))
+        return res
+
+    def _timed_get(self, url, **kwargs):
+        _local.connect = 0.0
+
+        start = time.perf_counter()
+        res = self.session.get(_route(url), stream=True, **kwargs)
+        headers_at = time.perf_counter()
+        try:
+            body = res.content
+        finally:
+            res.close()
+        done_at = time.perf_counter()
+
+        connect = _local.connect
+        res.timing = RequestTiming(url, res.status_code, connect,
+                                   max(headers_at - start - connect, 0.0),
+                                   done_at - headers_at, len(body))
+        with self._lock:
+            self.timings.append(res.timing)
+        return res
+
+    def timing_summary(self):
+        with self._lock:
+            timings = list(self.timings)
+        if not timings:
+            return {}
+
+        def stats(values):
+            values = sorted(values)
+            return {
+                'mean_ms': sum(values) / len(values) * 1000,
+                'p95_ms': values[min(len(values) - 1, int(len(values) * 0.95))] * 1000,
+            }
+
+        return {
+            'requests': len(timings),
+            'new_connections': sum(1 for t in timings if t.connect > 0),
+            'bytes': sum(t.bytes for t in timings),
+            'connect': stats([t.connect for t in timings]),
+            'ttfb': stats([t.ttfb for t in timings]),
+            'download': stats([t.download for t in timings]),
+        }
+
+    def print_timing_report(self):
+        summary = self.timing_summary()
+        if not summary:
+            return
+        print(f"\n⏱️  HTTP timings over {summary['requests']} requests "
+              f"({summary['new_connections']} new connections, {summary['bytes']/1e6:.1f} MB)")
+        for stage in ('connect', 'ttfb', 'download'):
+            s = summary[stage]
+            print(f"   {stage:<9} mean {s['mean_ms']:7.1f} ms | p95 {s['p95_ms']:7.1f} ms")
+        if self.rate_limiter is not None:
+            self.rate_limiter.print_summary()
+
+    def close(self):
+        self.session.close()
+
+_default_client = None
+_default_lock = threading.Lock()
+
+def get_client(**kwargs):
+    """Process-wide shared client. Keyword args only apply on first call."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient(**kwargs)
+        return _default_client
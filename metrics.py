@@ -0,0 +1,272 @@
+"""
+Scrape metrics: latency histograms, counters and gauges, with no extra deps.
+
+Everything is recorded into one process-wide registry (`get_metrics()`):
+
+    fatwa_stage_seconds{stage}        histogram: fetch, extract, segment, parse, save
+    fatwa_fetched_bytes_total         counter: response body bytes
+    fatwa_http_responses_total{status}
+    fatwa_pages_total{result}         counter: ok / failed, counted when saved
+    fatwa_errors_total{error_class}   counter: network / http_status / parse / unknown
+    fatwa_queue_depth{queue}          gauge: pipeline pages queue, reorder buffer, in-flight
+
+and exported either as a Prometheus text endpoint or a JSON file rewritten
+every few seconds:
+
+    python runner.py --metrics-port 9108       # GET /metrics (text) or /metrics.json
+    python runner.py --metrics-file fatwa_data/metrics.json
+
+`print_report()` splits the time spent per stage, which is usually enough to
+see whether a crawl is network-, parse- or disk-bound.
+
+Process-pool parses (pipeline mode) record into a `MetricsRecorder` inside
+the worker and send its observations back with the record; the parent
+`merge`s them, so `extract` / `segment` show up there too, next to a `parse`
+stage timed in the worker (no pool queue wait). `parse` includes `extract`
+and `segment`, so the report only counts it once.
+"""
+
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import json
+import os
+import threading
+import time
+
+# stage -> the stage it is part of, when both are recorded
+SUBSTAGES = {'extract': 'parse', 'segment': 'parse'}
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+HELP = {
+    'fatwa_stage_seconds': ('histogram', 'Time spent per scrape stage'),
+    'fatwa_fetched_bytes_total': ('counter', 'Response body bytes fetched'),
+    'fatwa_http_responses_total': ('counter', 'HTTP responses by status'),
+    'fatwa_pages_total': ('counter', 'Scraped pages by result'),
+    'fatwa_errors_total': ('counter', 'Failed pages by error class'),
+    'fatwa_queue_depth': ('gauge', 'Items waiting in a pipeline queue'),
+}
+
+class Histogram:
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self):
+        total, out = 0, []
+        for bound, n in zip(self.buckets, self.counts):
+            total += n
+            out.append((bound, total))
+        return out
+
+    def quantile(self, q):
+        """Upper bucket bound holding the q-th observation (a coarse estimate)."""
+        target = q * self.count
+        for bound, total in self.cumulative():
+            if total >= target:
+                return bound
+        return float('inf')
+
+def _labels(labels):
+    return tuple(sorted(labels.items()))
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{v}"' for k, v in pairs) + '}'
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+
+    # =================== recording =============================================
+
+    def inc(self, name, value=1, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self.gauges[(name, _labels(labels))] = value
+
+    def observe(self, name, value, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = Histogram()
+            hist.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def merge(self, observations):
+        """Record a `MetricsRecorder`'s observations."""
+        for name, value, labels in observations:
+            self.observe(name, value, **labels)
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+            self.started = time.time()
+
+    # =================== export ================================================
+
+    def snapshot(self):
+        with self._lock:
+            elapsed = time.time() - self.started
+            pages = sum(v for (n, _), v in self.counters.items() if n == 'fatwa_pages_total')
+            return {
+                'at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'elapsed_s': elapsed,
+                'pages_per_sec': pages / elapsed if elapsed else 0.0,
+                'counters': [{'name': n, 'labels': dict(l), 'value': v} for (n, l), v in self.counters.items()],
+                'gauges': [{'name': n, 'labels': dict(l), 'value': v} for (n, l), v in self.gauges.items()],
+                'histograms': [{'name': n, 'labels': dict(l), 'count': h.count, 'sum': h.sum,
+                                'mean': h.sum / h.count if h.count else 0.0,
+                                'p50': h.quantile(0.5), 'p95': h.quantile(0.95)}
+                               for (n, l), h in self.histograms.items()],
+            }
+
+    def render_prometheus(self):
+        lines, seen = [], set()
+
+        def header(name):
+            if name not in seen:
+                seen.add(name)
+                kind, text = HELP.get(name, ('untyped', name))
+                lines.append(f"# HELP {name} {text}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            for (name, labels), value in sorted(self.counters.items()):
+                header(name)
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+            for (name, labels), value in sorted(self.gauges.items()):
+                header(name)
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+            for (name, labels), hist in sorted(self.histograms.items()):
+                header(name)
+                for bound, total in hist.cumulative():
+                    lines.append(f"{name}_bucket{_format_labels(labels, [('le', bound)])} {total}")
+                lines.append(f"{name}_bucket{_format_labels(labels, [('le', '+Inf')])} {hist.count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {hist.sum}")
+                lines.append(f"{name}_count{_format_labels(labels)} {hist.count}")
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(tmp, path)
+
+    def print_report(self):
+        snap = self.snapshot()
+        stages = [h for h in snap['histograms'] if h['name'] == 'fatwa_stage_seconds']
+        if not stages:
+            return
+        recorded = {h['labels']['stage'] for h in stages}
+        total = sum(h['sum'] for h in stages if SUBSTAGES.get(h['labels']['stage']) not in recorded) or 1.0
+        print(f"\n📊 Stage timings ({snap['pages_per_sec']:.1f} pages/s over {snap['elapsed_s']:.0f}s)")
+        for h in sorted(stages, key=lambda h: -h['sum']):
+            print(f"   {h['labels']['stage']:<8} {h['sum']/total*100:5.1f}% | {h['count']:6d} x "
+                  f"mean {h['mean']*1000:7.1f} ms | p95 <= {h['p95']*1000:g} ms")
+        errors = {c['labels']['error_class']: c['value'] for c in snap['counters']
+                  if c['name'] == 'fatwa_errors_total'}
+        if errors:
+            print(f"   errors: {errors}")
+
+class MetricsRecorder:
+    """Histogram observations kept as a list, for a worker process to return to the parent."""
+
+    def __init__(self):
+        self.observations = []
+
+    def observe(self, name, value, **labels):
+        self.observations.append((name, value, labels))
+
+    timer = MetricsRegistry.timer
+
+_default_metrics = MetricsRegistry()
+
+def get_metrics():
+    """Process-wide metrics registry."""
+    return _default_metrics
+
+# =================== exporters ==============================================================
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = _default_metrics
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith('/metrics.json'):
+            body, ctype = json.dumps(self.registry.snapshot()).encode(), 'application/json'
+        elif self.path.startswith('/metrics'):
+            body, ctype = self.registry.render_prometheus().encode(), 'text/plain; version=0.0.4'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', ctype)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def start_http_server(port, host='0.0.0.0', registry=None):
+    """Serve /metrics (Prometheus text) and /metrics.json from a daemon thread."""
+    handler = type('MetricsHandler', (_MetricsHandler,), {'registry': registry or _default_metrics})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"📊 Metrics on http://{host}:{server.server_port}/metrics")
+    return server
+
+class JsonMetricsFlusher:
+    """Rewrites a JSON snapshot every `interval` seconds, and once more on `stop()`."""
+
+    def __init__(self, path, interval=10, registry=None):
+        self.path = path
+        self.interval = interval
+        self.registry = registry or _default_metrics
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.registry.write_json(self.path)
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.registry.write_json(self.path)
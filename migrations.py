@@ -0,0 +1,156 @@
+"""
+Streaming record migrations for the corpus store (raw_fatwas.jsonl).
+
+A migration is a named, idempotent `record -> record` function registered
+with `@migration`. Running migrations streams the store in chunks of raw
+lines through a process pool (each worker decodes, applies every transform,
+re-encodes), writes the results in order to a temp file and swaps it in
+atomically, so memory stays at a few chunks whatever the corpus size and a
+crash mid-way leaves the old file untouched.
+
+Applied migrations are remembered in `<store>.migrations.json`, so a plain
+run only applies the new ones.
+
+Usage:
+    python migrations.py                   # apply pending migrations
+    python migrations.py list
+    python migrations.py run NAME [NAME..]  # (re)apply specific migrations
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import sys
+import time
+
+from corpus_store import CorpusStore, DEFAULT_PATH
+from state_store import record_hash
+from url_registry import url_fields
+
+MIGRATIONS = {}
+
+def migration(fn):
+    """Register `fn(record) -> record` under its function name."""
+    MIGRATIONS[fn.__name__] = fn
+    return fn
+
+# =================== migrations =============================================================
+
+@migration
+def add_url_fields(record):
+    """category / slug for records scraped before they were captured at scrape time."""
+    for key, value in url_fields(record['url']).items():
+        record.setdefault(key, value)
+    return record
+
+@migration
+def add_content_hash(record):
+    """content_hash for records scraped before it was stored."""
+    if record.get('question') is not None and not record.get('content_hash'):
+        record['content_hash'] = record_hash(record)
+    return record
+
+# =================== runner =================================================================
+
+def _migrate_chunk(job):
+    names, lines = job
+    transforms = [MIGRATIONS[name] for name in names]
+    out = []
+    for line in lines:
+        record = json.loads(line)
+        for transform in transforms:
+            record = transform(record)
+        out.append(json.dumps(record, ensure_ascii=False) + '\n')
+    return out
+
+def _chunks(store, chunk_size):
+    chunk = []
+    for _, line in store._iter_lines():
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def run_migrations(names, store=None, workers=None, chunk_size=1000):
+    """Apply the named migrations to every record of `store`; returns records written."""
+    store = store or CorpusStore(DEFAULT_PATH)
+    unknown = [n for n in names if n not in MIGRATIONS]
+    if unknown:
+        raise KeyError(f"unknown migrations: {', '.join(unknown)}")
+    if not names or not store.path.exists():
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+
+        def migrated_lines():
+            # keep at most 2 chunks per worker in flight, written in order
+            in_flight = deque()
+            for chunk in _chunks(store, chunk_size):
+                in_flight.append(pool.submit(_migrate_chunk, (names, chunk)))
+                if len(in_flight) >= 2 * workers:
+                    yield from in_flight.popleft().result()
+            while in_flight:
+                yield from in_flight.popleft().result()
+
+        return store.rewrite_lines(migrated_lines())
+
+# =================== bookkeeping ============================================================
+
+def _applied_path(store):
+    return store.path.with_name(store.path.name + '.migrations.json')
+
+def applied_migrations(store):
+    path = _applied_path(store)
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _mark_applied(store, names):
+    applied = applied_migrations(store)
+    now = time.strftime('%Y-%m-%d %H:%M:%S')
+    applied.update({name: now for name in names})
+    tmp = _applied_path(store).with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(applied, f, indent=2)
+    os.replace(tmp, _applied_path(store))
+
+def migrate(names=None, store=None, workers=None, chunk_size=1000):
+    """Apply `names` (default: every migration not yet applied) and record them."""
+    store = store or CorpusStore(DEFAULT_PATH)
+    if names is None:
+        done = applied_migrations(store)
+        names = [n for n in MIGRATIONS if n not in done]
+    if not names:
+        print("✅ No pending migrations.")
+        return 0
+
+    start = time.time()
+    print(f"🛠️  Migrating {store.path}: {', '.join(names)}")
+    written = run_migrations(names, store, workers, chunk_size)
+    _mark_applied(store, names)
+    print(f"✅ Migrated {written} records in {time.time() - start:.1f}s")
+    return written
+
+def main(argv):
+    command = argv[1] if len(argv) > 1 else 'pending'
+    store = CorpusStore(DEFAULT_PATH)
+    if command == 'list':
+        applied = applied_migrations(store)
+        for name, fn in MIGRATIONS.items():
+            print(f"   {'✅' if name in applied else '⏳'} {name:<20} {applied.get(name, 'pending'):<20} {fn.__doc__ or ''}")
+    elif command == 'run' and len(argv) > 2:
+        migrate(argv[2:], store)
+    elif command == 'pending':
+        migrate(None, store)
+    else:
+        print(__doc__)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
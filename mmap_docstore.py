@@ -0,0 +1,224 @@
+"""
+Read-only docstore for the FAISS index, memory-mapped instead of unpickled.
+
+`FAISS.load_local` unpickles every Document of the corpus into each process
+that opens the index. Here the documents live in flat files next to
+index.faiss, in FAISS position order:
+
+    docs.bin        document i is `<metadata JSON>\\n<page_content>` in UTF-8,
+                    as one zstd frame when docs.zdict exists
+    docs.offsets    native uint64 array of count + 1 byte offsets into docs.bin
+    docs.zdict      zstd dictionary trained on the documents (doc_compression.py)
+    docs.ids        docstore id of each position, one per line (used when the
+                    index is updated; the apps never read it)
+    manifest.json   {url: {"hash", "id"}} of the indexed fatwas, when the saver
+                    passes one (embeddings_store.py's incremental updates)
+
+A save writes all of them into a new version directory and switches to it in
+one step (versioned_dir.py), so a reader never pairs files of two saves.
+
+docs.bin and docs.offsets are mapped read-only, so opening the index costs
+the same whatever the corpus size, every Streamlit process shares the same
+page-cache pages, and a Document is only built for the hits a search returns. With faiss >= 1.9 the
+vectors in index.faiss are memory-mapped the same way (IO_FLAG_MMAP_IFC).
+Compressed, a hit costs one frame decompression (a few microseconds) and the
+mapped text shrinks to a fraction of its size.
+
+Usage:
+    from mmap_docstore import load_vectorstore
+    vectorstore = load_vectorstore("fatwa_index", embedding_model)   # no pickle, no opt-in flag
+
+    python mmap_docstore.py convert fatwa_index    # rewrite an index saved with save_local
+"""
+
+from collections.abc import Mapping
+from array import array
+from pathlib import Path
+import json
+import sys
+
+import doc_compression
+import versioned_dir
+from versioned_dir import map_file, write_file
+
+DOCS_FILE = 'docs.bin'
+OFFSETS_FILE = 'docs.offsets'
+DICT_FILE = 'docs.zdict'
+IDS_FILE = 'docs.ids'
+MANIFEST_FILE = 'manifest.json'
+
+class PositionIds(Mapping):
+    """`index_to_docstore_id` for an MmapDocstore: FAISS position i is document i."""
+
+    def __init__(self, count):
+        self.count = count
+
+    def __getitem__(self, position):
+        if not 0 <= position < self.count:
+            raise KeyError(position)
+        return int(position)
+
+    def __iter__(self):
+        return iter(range(self.count))
+
+    def __len__(self):
+        return self.count
+
+class MmapDocstore:
+    """LangChain docstore (`search(id) -> Document`) over docs.bin / docs.offsets.
+
+    `directory` is resolved to its current version once; `self.directory` is
+    where the rest of that version (index.faiss) is.
+    """
+
+    def __init__(self, directory):
+        self.directory = versioned_dir.current(directory)
+        self._blob = map_file(self.directory / DOCS_FILE)
+        self._offsets = memoryview(map_file(self.directory / OFFSETS_FILE)).cast('Q')
+        dict_path = self.directory / DICT_FILE
+        self._codec = doc_compression.DocCodec(dict_path.read_bytes()) if dict_path.exists() else None
+
+    def __len__(self):
+        return max(len(self._offsets) - 1, 0)
+
+    def raw(self, position):
+        """(metadata dict, page_content) of document `position`."""
+        entry = self._blob[self._offsets[position]:self._offsets[position + 1]]
+        if self._codec is not None:
+            entry = self._codec.decompress(entry)
+        meta, _, text = entry.partition(b'\n')
+        return json.loads(meta), text.decode('utf-8')
+
+    def search(self, search):
+        from langchain_core.documents import Document
+        position = int(search)
+        if not 0 <= position < len(self):
+            return f"ID {search} not found."
+        metadata, text = self.raw(position)
+        return Document(page_content=text, metadata=metadata)
+
+    def ids(self):
+        """Docstore id of every position, as the index was built with."""
+        return (self.directory / IDS_FILE).read_text(encoding='utf-8').splitlines()
+
+# =================== writing ================================================================
+
+def _entry(doc):
+    meta = json.dumps(doc.metadata, ensure_ascii=False, separators=(',', ':'))
+    return meta.encode('utf-8') + b'\n' + doc.page_content.encode('utf-8')
+
+def write_docstore(directory, documents, ids, compress=None):
+    """Write `documents` (in FAISS position order) and their docstore `ids`.
+
+    `directory` must not be open to readers yet: `save_vectorstore` passes a
+    fresh version directory. `compress` (default: when zstandard is
+    installed) stores each document as a zstd frame against a dictionary
+    trained on them.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    offsets = array('Q', [0])
+    entries = map(_entry, documents)
+
+    codec = None
+    if doc_compression.available() if compress is None else compress:
+        entries = list(entries)
+        codec = doc_compression.DocCodec.trained(entries)
+        entries = map(codec.compress, entries)
+
+    def write_blob(f):
+        for entry in entries:
+            f.write(entry)
+            offsets.append(offsets[-1] + len(entry))
+
+    if codec is not None:
+        write_file(directory / DICT_FILE, lambda f: f.write(codec.dictionary))
+    write_file(directory / DOCS_FILE, write_blob)
+    write_file(directory / OFFSETS_FILE, offsets.tofile)
+    write_file(directory / IDS_FILE, lambda f: f.write(''.join(f"{i}\n" for i in ids).encode('utf-8')))
+    return len(offsets) - 1
+
+def save_vectorstore(vectorstore, directory, index_name='index', manifest=None):
+    """Like `FAISS.save_local`, with the docstore written as docs.* instead of index.pkl.
+
+    Everything goes into a new version directory that becomes current in one
+    rename, so running apps keep reading the old version until they reopen.
+    A `manifest` is saved in the same version, so it always matches the index
+    next to it.
+    """
+    import faiss
+    directory = Path(directory)
+    ids = [vectorstore.index_to_docstore_id[i] for i in range(vectorstore.index.ntotal)]
+    with versioned_dir.new_version(directory) as version:
+        faiss.write_index(vectorstore.index, str(version / f"{index_name}.faiss"))
+        write_docstore(version, (vectorstore.docstore.search(i) for i in ids), ids)
+        if manifest is not None:
+            write_file(version / MANIFEST_FILE,
+                       lambda f: f.write(json.dumps(manifest, ensure_ascii=False).encode('utf-8')))
+
+    # files of the unversioned layout (save_local, or saves before versioning)
+    legacy = [f"{index_name}.faiss", f"{index_name}.pkl", DOCS_FILE, OFFSETS_FILE, DICT_FILE, IDS_FILE]
+    if manifest is not None:
+        legacy.append(MANIFEST_FILE)
+    for name in legacy:
+        (directory / name).unlink(missing_ok=True)
+
+def load_manifest(directory):
+    """The manifest saved with the current version (or next to an unversioned index); None if there is none."""
+    directory = Path(directory)
+    for path in (versioned_dir.current(directory) / MANIFEST_FILE, directory / MANIFEST_FILE):
+        if path.exists():
+            return json.loads(path.read_text(encoding='utf-8'))
+    return None
+
+# =================== loading ================================================================
+
+def _open(directory, index_name, io_flags=0):
+    """(faiss index, MmapDocstore) of the current version of a saved index."""
+    import faiss
+
+    directory = Path(directory)
+    if not (versioned_dir.current(directory) / DOCS_FILE).exists():
+        raise FileNotFoundError(f"{directory} has no {DOCS_FILE}; run `python mmap_docstore.py convert {directory}`")
+    docstore = MmapDocstore(directory)
+    index = faiss.read_index(str(docstore.directory / f"{index_name}.faiss"), io_flags)
+    if index.ntotal != len(docstore):
+        raise ValueError(f"{docstore.directory}: {index.ntotal} vectors but {len(docstore)} documents; "
+                         f"save the index again")
+    return index, docstore
+
+def load_vectorstore(directory, embeddings, index_name='index'):
+    """Open a saved index read-only, with a memory-mapped docstore."""
+    import faiss
+    from langchain_community.vectorstores import FAISS
+
+    index, docstore = _open(directory, index_name, getattr(faiss, 'IO_FLAG_MMAP_IFC', 0))
+    return FAISS(embeddings, index, docstore, PositionIds(len(docstore)))
+
+def load_for_update(directory, embeddings, index_name='index'):
+    """Open a saved index with an in-memory docstore, for add / delete and `save_vectorstore`."""
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores import FAISS
+
+    index, mapped = _open(directory, index_name)
+    ids = mapped.ids()
+    docstore = InMemoryDocstore({doc_id: mapped.search(i) for i, doc_id in enumerate(ids)})
+    return FAISS(embeddings, index, docstore, dict(enumerate(ids)))
+
+def convert(directory, index_name='index'):
+    """Rewrite an index saved by `FAISS.save_local` (index.pkl) into this layout."""
+    from langchain_community.vectorstores import FAISS
+    vectorstore = FAISS.load_local(str(directory), None, index_name, allow_dangerous_deserialization=True)
+    save_vectorstore(vectorstore, directory, index_name)
+    return vectorstore.index.ntotal
+
+def main(argv):
+    if len(argv) != 3 or argv[1] != 'convert':
+        print(__doc__)
+        return 1
+    count = convert(argv[2])
+    print(f"✅ Converted {argv[2]}: {count} documents in {DOCS_FILE} / {OFFSETS_FILE}, index.pkl removed")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
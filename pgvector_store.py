@@ -0,0 +1,325 @@
+"""
+Fatwa embeddings in Postgres, next to the rows database_saver.py loads.
+
+`fatwas` gains two columns:
+
+    embedding       vector(1024), pgvector, with an HNSW index (L2, like the FAISS index)
+    embedded_hash   content_hash of the text the embedding was computed from;
+                    differs from content_hash once a fatwa is edited, until re-embedded
+
+`python pgvector_store.py load` copies the vectors of the FAISS index folder
+(embeddings_store.py) into the rows with the same URL, through COPY into a
+staging table, then builds the HNSW index if it is missing; later runs only
+rewrite vectors whose hash changed, and the index follows.
+
+`PgVectorStore` is a LangChain VectorStore over those columns, so the apps can
+use it in place of the FAISS index (see vector_backend.py). A search is one
+round trip, with or without a filter:
+
+    store.similarity_search(query, k=5, filter={'category': 'namaz'})
+
+HNSW finds `hnsw.ef_search` candidates and the filter is applied to those, so
+a filter that keeps a small share of the corpus would return fewer than k
+hits, and not the nearest ones. Filters matching up to EXACT_SCAN_ROWS rows
+(every category of the current corpus) are answered by an exact scan of those
+rows through the category index instead; wider ones search HNSW with
+ef_search widened by the filter's share of the rows. The per-category row
+counts behind that choice are re-read every COUNTS_TTL seconds, so a store
+kept open by an app picks up a later `load`.
+
+Scores are squared L2 distances, as the FAISS IndexFlatL2 returns them, so
+relevance scores are the same on either backend. A store opened with
+`PgVectorStore.connect` reconnects once if the server dropped the connection
+(restart, idle timeout) and retries the search.
+
+Usage:
+    python pgvector_store.py load [--index-dir fatwa_index] [--dsn URL]
+    python pgvector_store.py stats
+
+Needs psycopg2 and a server with the pgvector extension (>= 0.5 for HNSW).
+"""
+
+from pathlib import Path
+import argparse
+import math
+import threading
+import time
+
+import psycopg2
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+from text_normalizer import document_text
+
+INDEX_DIR = Path('fatwa_index')
+DIMENSION = 1024
+CHUNK_SIZE = 1000
+
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 64
+EF_SEARCH = 40               # pgvector's default
+MAX_EF_SEARCH = 1000         # pgvector's limit
+# Filtered HNSW needs a wide ef_search to find the k nearest matches: on a quarter
+# of 40k rows, ef_search 830 took 74 ms for 0.80 recall and an exact scan of the
+# same 9.6k rows 116 ms for 1.0; on 1.2k rows the exact scan took 13 ms
+# (benchmarks/bench_pgvector.py). Filters up to EXACT_SCAN_ROWS rows are scanned
+# exactly; above that ef_search grows to FILTER_MARGIN * k candidates over the
+# filter's share of the rows.
+EXACT_SCAN_ROWS = 10000
+FILTER_MARGIN = 20
+
+COUNTS_TTL = 300             # seconds between re-reads of the category sizes
+
+FILTER_COLUMNS = ('category', 'url')
+
+create_columns_script = '''
+CREATE EXTENSION IF NOT EXISTS vector;
+ALTER TABLE fatwas ADD COLUMN IF NOT EXISTS embedding vector({dimension});
+ALTER TABLE fatwas ADD COLUMN IF NOT EXISTS embedded_hash CHAR(64);
+'''
+
+create_index_script = '''
+CREATE INDEX IF NOT EXISTS idx_fatwas_embedding ON fatwas
+USING hnsw (embedding vector_l2_ops) WITH (m = {m}, ef_construction = {ef_construction});
+'''
+
+create_staging_script = '''
+CREATE TEMP TABLE IF NOT EXISTS fatwa_embeddings_staging (
+    url TEXT,
+    embedded_hash CHAR(64),
+    embedding vector({dimension})
+) ON COMMIT DELETE ROWS;
+'''
+
+copy_script = "COPY fatwa_embeddings_staging (url, embedded_hash, embedding) FROM STDIN"
+
+# a NULL hash (index built before manifest.json) always overwrites
+merge_script = '''
+WITH updated AS (
+    UPDATE fatwas f SET embedding = s.embedding, embedded_hash = s.embedded_hash
+    FROM fatwa_embeddings_staging s
+    WHERE f.url = s.url
+      AND (f.embedding IS NULL OR s.embedded_hash IS NULL
+           OR f.embedded_hash IS DISTINCT FROM s.embedded_hash)
+    RETURNING 1
+)
+SELECT (SELECT count(*) FROM updated),
+       (SELECT count(*) FROM fatwa_embeddings_staging s
+        WHERE NOT EXISTS (SELECT 1 FROM fatwas f WHERE f.url = s.url));
+'''
+
+# `+ 0` keeps the planner off the HNSW index: an exact scan of the filtered rows
+SEARCH_SQL = '''
+SET hnsw.ef_search = {ef_search};
+SELECT url, category, question, answer, embedding <-> %(vector)s::vector AS distance
+FROM fatwas
+WHERE embedding IS NOT NULL {where}
+ORDER BY (embedding <-> %(vector)s::vector) {exact}
+LIMIT %(k)s;
+'''
+
+def vector_literal(vector):
+    return '[' + ','.join(map(str, vector)) + ']'
+
+# =================== loading ================================================================
+
+def ensure_schema(conn, dimension=DIMENSION):
+    with conn.cursor() as cur:
+        cur.execute(create_columns_script.format(dimension=dimension))
+    conn.commit()
+
+def build_index(conn, m=HNSW_M, ef_construction=HNSW_EF_CONSTRUCTION):
+    """Create the HNSW index unless it exists; cheaper once, after a bulk load, than row by row.
+
+    Also refreshes the table statistics: without them the planner misjudges how
+    many rows a category filter keeps and picks the category index over HNSW.
+    """
+    with conn.cursor() as cur:
+        cur.execute("SET maintenance_work_mem = '1GB'")
+        cur.execute(create_index_script.format(m=int(m), ef_construction=int(ef_construction)))
+        cur.execute('ANALYZE fatwas')
+    conn.commit()
+
+def index_rows(directory=INDEX_DIR):
+    """(url, embedded_hash, vector) for every vector of a saved FAISS index folder."""
+    import faiss
+    from mmap_docstore import MmapDocstore, load_manifest
+
+    directory = Path(directory)
+    docstore = MmapDocstore(directory)
+    index = faiss.read_index(str(docstore.directory / 'index.faiss'))
+    manifest = load_manifest(docstore.directory) or {}  # the version the vectors come from
+    for position in range(index.ntotal):
+        url = docstore.raw(position)[0]['url']
+        yield url, manifest.get(url, {}).get('hash'), index.reconstruct(position).tolist()
+
+def load_embeddings(conn, rows, chunk_size=CHUNK_SIZE, dimension=DIMENSION, progress=True):
+    """Write (url, embedded_hash, vector) rows into fatwas.embedding.
+
+    Returns {'updated', 'unchanged', 'missing', 'seconds'}; missing counts URLs
+    with no row in `fatwas` (run database_saver.py first).
+    """
+    from database_saver import copy_rows
+
+    ensure_schema(conn, dimension)
+    stats = dict.fromkeys(('updated', 'unchanged', 'missing'), 0)
+    start = time.time()
+    with conn.cursor() as cur:
+        cur.execute(create_staging_script.format(dimension=dimension))
+        chunk = []
+
+        def flush():
+            cur.copy_expert(copy_script, copy_rows((url, h, vector_literal(v)) for url, h, v in chunk))
+            cur.execute(merge_script)
+            updated, missing = cur.fetchone()
+            conn.commit()
+            stats['updated'] += updated
+            stats['missing'] += missing
+            stats['unchanged'] += len(chunk) - updated - missing
+            if progress:
+                done = sum(stats.values())
+                print(f"   📥 {done} vectors processed, {done / (time.time() - start):.0f}/s")
+
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                flush()
+                chunk = []
+        if chunk:
+            flush()
+    stats['seconds'] = time.time() - start
+    return stats
+
+# =================== searching ==============================================================
+
+class PgVectorStore(VectorStore):
+    """LangChain vector store over fatwas.embedding; one round trip per search."""
+
+    def __init__(self, embedding, conn, ef_search=EF_SEARCH, reconnect=None):
+        """`reconnect()` returns a fresh connection; without it a dropped connection stays an error."""
+        self.embedding = embedding
+        self.conn = conn
+        self.conn.autocommit = True    # no BEGIN before each search
+        self.ef_search = ef_search
+        self._reconnect = reconnect
+        self._lock = threading.Lock()
+        self._counts = None
+        self._counts_at = 0.0
+
+    @classmethod
+    def connect(cls, embedding, dsn=None, **kwargs):
+        from database_saver import connect
+        return cls(embedding, connect(dsn), reconnect=lambda: connect(dsn), **kwargs)
+
+    @classmethod
+    def from_texts(cls, texts, embedding, metadatas=None, **kwargs):
+        raise RuntimeError("PgVectorStore searches the fatwas table and does not add texts: load the rows with "
+                           "`python database_saver.py load`, then the vectors with `python pgvector_store.py load`, "
+                           "and open the store with PgVectorStore.connect()")
+
+    @property
+    def embeddings(self):
+        return self.embedding
+
+    def _select_relevance_score_fn(self):
+        return self._euclidean_relevance_score_fn
+
+    def _query(self, sql, params=None):
+        """Rows of `sql`; on a dropped connection, reconnects once and runs it again."""
+        with self._lock:
+            try:
+                with self.conn.cursor() as cur:
+                    cur.execute(sql, params)
+                    return cur.fetchall()
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                if self._reconnect is None or not self.conn.closed:
+                    raise
+            print("🔌 Postgres connection lost; reconnecting")
+            self.conn = self._reconnect()
+            self.conn.autocommit = True
+            with self.conn.cursor() as cur:
+                cur.execute(sql, params)
+                return cur.fetchall()
+
+    def counts(self):
+        """({category: embedded rows}, total), re-read after COUNTS_TTL seconds."""
+        if self._counts is None or time.monotonic() - self._counts_at > COUNTS_TTL:
+            by_category = dict(self._query(
+                'SELECT category, count(*) FROM fatwas WHERE embedding IS NOT NULL GROUP BY category'))
+            self._counts, self._counts_at = (by_category, sum(by_category.values())), time.monotonic()
+        return self._counts
+
+    def _plan(self, filter, k):
+        """(WHERE clause, params, ef_search, exact) for `filter` ({column: value or list})."""
+        clauses, params = [], {}
+        for column, value in (filter or {}).items():
+            if column not in FILTER_COLUMNS:
+                raise ValueError(f"cannot filter on {column!r}; one of {FILTER_COLUMNS}")
+            if isinstance(value, (list, tuple, set)):
+                clauses.append(f'{column} = ANY(%({column})s)')
+                params[column] = list(value)
+            else:
+                clauses.append(f'{column} = %({column})s')
+                params[column] = value
+        if not clauses:
+            return '', params, self.ef_search, False
+        if 'url' in params:
+            return ' AND ' + ' AND '.join(clauses), params, self.ef_search, True
+
+        by_category, total = self.counts()
+        values = params['category'] if isinstance(params['category'], list) else [params['category']]
+        rows = sum(by_category.get(v, 0) for v in values)
+        wanted = math.ceil(k * FILTER_MARGIN * total / max(rows, 1))
+        exact = rows <= EXACT_SCAN_ROWS or wanted > MAX_EF_SEARCH
+        return ' AND ' + ' AND '.join(clauses), params, max(self.ef_search, min(wanted, MAX_EF_SEARCH)), exact
+
+    def similarity_search_with_score_by_vector(self, embedding, k=4, filter=None, **kwargs):
+        where, params, ef_search, exact = self._plan(filter, k)
+        sql = SEARCH_SQL.format(ef_search=int(ef_search), where=where, exact='+ 0' if exact else '')
+        params.update(vector=vector_literal(embedding), k=k)
+        # squared, like IndexFlatL2, so both backends share one relevance scale
+        return [(Document(page_content=document_text({'question': question, 'answer': answer}),
+                          metadata={'category': category, 'url': url}), distance * distance)
+                for url, category, question, answer, distance in self._query(sql, params)]
+
+    def similarity_search_by_vector(self, embedding, k=4, filter=None, **kwargs):
+        return [doc for doc, _ in self.similarity_search_with_score_by_vector(embedding, k, filter)]
+
+    def similarity_search_with_score(self, query, k=4, filter=None, **kwargs):
+        return self.similarity_search_with_score_by_vector(self.embedding.embed_query(query), k, filter)
+
+    def similarity_search(self, query, k=4, filter=None, **kwargs):
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, filter)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Fatwa embeddings in Postgres (pgvector)")
+    parser.add_argument('command', choices=['load', 'stats'])
+    parser.add_argument('--index-dir', default=INDEX_DIR, help="load: FAISS index folder to copy vectors from")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--dsn', help="connection URL (default: DATABASE_URL, then DB_* in .env)")
+    args = parser.parse_args()
+
+    from database_saver import connect
+    conn = connect(args.dsn)
+    try:
+        if args.command == 'load':
+            stats = load_embeddings(conn, index_rows(args.index_dir), args.chunk_size)
+            print(f"✅ Loaded vectors from {args.index_dir} in {stats['seconds']:.1f}s: {stats['updated']} updated, "
+                  f"{stats['unchanged']} unchanged, {stats['missing']} with no row in fatwas")
+            start = time.time()
+            build_index(conn)
+            print(f"🧭 HNSW index ready in {time.time() - start:.1f}s (m={HNSW_M}, ef_construction={HNSW_EF_CONSTRUCTION})")
+        else:
+            ensure_schema(conn)
+            with conn.cursor() as cur:
+                cur.execute('''SELECT count(*), count(embedding),
+                                      count(*) FILTER (WHERE embedding IS NOT NULL
+                                                       AND embedded_hash IS DISTINCT FROM content_hash)
+                               FROM fatwas''')
+                rows, embedded, stale = cur.fetchone()
+            print(f"📚 {rows} fatwas, {embedded} with embeddings, {stale} edited since they were embedded")
+    finally:
+        conn.close()
+
+if __name__ == '__main__':
+    main()
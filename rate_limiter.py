@@ -0,0 +1,170 @@
+"""
+Adaptive rate limiter shared by the scrapers.
+
+A token bucket caps request *starts* at `rate` per second and a counter caps
+requests *in flight* at `concurrency`. Both adapt AIMD-style:
+
+  - every `window` healthy responses: rate += `increase`, concurrency += 1
+  - on 429/503, a timeout/connection error, or a latency EWMA above
+    `latency_factor` x the best EWMA seen so far: rate and concurrency are
+    multiplied by `decrease` (at most once per `cooldown` seconds, so a burst
+    of throttled in-flight requests counts as one signal)
+  - a `Retry-After` header (seconds or HTTP date) pauses all requests until
+    it expires
+
+So the crawl speeds up until the origin pushes back and then hovers just
+under that point. Changes are printed, and `print_summary()` reports the
+rate it settled on.
+
+Usage (HttpClient does this for you when given `rate_limiter=`):
+    limiter.acquire()
+    ... send request ...
+    limiter.release(status=res.status_code, latency=secs, retry_after=res.headers.get('Retry-After'))
+"""
+
+from email.utils import parsedate_to_datetime
+import threading
+import time
+
+THROTTLE_STATUSES = (429, 503)
+
+def parse_retry_after(value, now=None):
+    """Seconds to wait for a Retry-After header value, or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - (now or time.time()))
+
+class AdaptiveRateLimiter:
+    def __init__(self, rate=2.0, min_rate=0.2, max_rate=50.0,
+                 concurrency=2, min_concurrency=1, max_concurrency=32,
+                 increase=0.5, decrease=0.5, window=20,
+                 latency_factor=2.0, cooldown=2.0, max_retry_after=300, name='scraper'):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.concurrency = concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.increase = increase
+        self.decrease = decrease
+        self.window = window
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self.max_retry_after = max_retry_after
+        self.name = name
+
+        self._lock = threading.Condition()
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._healthy_streak = 0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._latency_ewma = None
+        self._best_latency = None
+
+        self.requests = 0
+        self.throttled = 0
+        self.decreases = 0
+
+    # =================== acquiring =============================================
+
+    def _refill(self, now):
+        self._tokens = min(1.0, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def _wait_time(self, now):
+        """0 if a request may start now (and reserve it), else seconds to wait."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._in_flight >= self.concurrency:
+            return 0.05
+        self._refill(now)
+        if self._tokens < 1.0:
+            return (1.0 - self._tokens) / self.rate
+        self._tokens -= 1.0
+        self._in_flight += 1
+        return 0.0
+
+    def acquire(self):
+        with self._lock:
+            while True:
+                wait = self._wait_time(time.monotonic())
+                if not wait:
+                    return
+                self._lock.wait(timeout=wait)
+
+    # =================== feedback ==============================================
+
+    def release(self, status=None, latency=None, retry_after=None, error=False):
+        with self._lock:
+            self._in_flight -= 1
+            self.requests += 1
+            now = time.monotonic()
+
+            if latency is not None and not error:
+                self._latency_ewma = latency if self._latency_ewma is None else 0.8 * self._latency_ewma + 0.2 * latency
+                if self._best_latency is None or self._latency_ewma < self._best_latency:
+                    self._best_latency = self._latency_ewma
+
+            wait = parse_retry_after(retry_after)
+            if wait:
+                self._paused_until = max(self._paused_until, now + min(wait, self.max_retry_after))
+                print(f"⏸️  [{self.name}] origin asked to retry after {wait:.0f}s; pausing")
+
+            throttled = status in THROTTLE_STATUSES
+            if throttled:
+                self.throttled += 1
+            slow = (self._best_latency and self._latency_ewma
+                    and self._latency_ewma > self.latency_factor * self._best_latency)
+
+            if throttled or error or slow:
+                reason = f"HTTP {status}" if throttled else 'error' if error else 'latency rising'
+                self._back_off(now, reason)
+            else:
+                self._healthy_streak += 1
+                if self._healthy_streak >= self.window:
+                    self._healthy_streak = 0
+                    self.rate = min(self.max_rate, self.rate + self.increase)
+                    self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+
+            self._lock.notify_all()
+
+    def _back_off(self, now, reason):
+        self._healthy_streak = 0
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.decreases += 1
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self.concurrency = max(self.min_concurrency, int(self.concurrency * self.decrease))
+        # forget the congested latency so recovery is judged against a fresh baseline
+        self._latency_ewma = self._best_latency
+        print(f"🚦 [{self.name}] {reason}: backing off to {self.rate:.2f} req/s, concurrency {self.concurrency}")
+
+    # =================== reporting =============================================
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'concurrency': self.concurrency,
+                'in_flight': self._in_flight,
+                'requests': self.requests,
+                'throttled': self.throttled,
+                'decreases': self.decreases,
+                'latency_ewma_ms': (self._latency_ewma or 0) * 1000,
+            }
+
+    def print_summary(self):
+        s = self.snapshot()
+        print(f"\n🚦 [{self.name}] settled at {s['rate']:.2f} req/s, concurrency {s['concurrency']} "
+              f"({s['requests']} requests, {s['throttled']} throttled, {s['decreases']} back-offs, "
+              f"latency ~{s['latency_ewma_ms']:.0f} ms)")
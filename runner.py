@@ -1,50 +1,188 @@
+import argparse
 import time
-from fatwa_scraper import scrape_fatwas_batch, FatwaDataManager  # <- main module
+from fatwa_scraper import (scrape_fatwas_batch, scrape_fatwas_async, reparse_from_cache,  # <- main module
+                           retry_failed_fatwas, refresh_fatwas, FatwaDataManager)
+from scrape_pipeline import scrape_fatwas_pipeline
+from http_client import get_client, install_origin_override
+from metrics import JsonMetricsFlusher, get_metrics, start_http_server
+from rate_limiter import AdaptiveRateLimiter
+from sharding import merge_shards, parse_shard, shard_dir, shard_urls
+from url_registry import get_registry
 
 # ================== CONFIG ====================
 
-# complete URL list
-from fatwa_urls import ALL_FATWA_URLS  # You can keep your URLs in a separate file
+# complete URL list: fatwa_urls.txt, maintained by cdn_extracter.py
+DATA_DIR = 'fatwa_data'
 
 # Tuning parameters
 SAVE_EVERY = 5         # save every N fatwas
-DELAY = 0.5            # delay between requests
+DELAY = 0.5            # delay between requests (RATE_LIMIT = 'fixed' only)
+RATE_LIMIT = 'adaptive'     # 'adaptive' (AIMD, honors Retry-After) or 'fixed' (DELAY / --rps)
+
+# Async mode
+MODE = 'sync'               # 'sync', 'async', 'pipeline', 'reparse' (offline, from html_cache)
+                            # or 'retry-failed' (only URLs in the failure ledger that are due)
+                            # or 'merge-shards' (fold fatwa_data/shards/* into fatwa_data)
+                            # or 'refresh' (re-scrape done URLs, conditional requests, keep changes only)
+PER_HOST_LIMIT = 8          # max in-flight requests per host
+REQUESTS_PER_SECOND = 10    # politeness budget across the whole crawl
+
+# Pipeline mode
+PARSE_WORKERS = None        # parser processes (None = all cores)
+QUEUE_SIZE = 64             # raw pages buffered between fetch and parse
+
+# Sharded runs (see sharding.py)
+SHARD = None                # (i, n): scrape only shard i of n, into fatwa_data/shards/<i>-of-<n>
+
+# Metrics (see metrics.py)
+METRICS_PORT = None         # serve Prometheus text on this port (/metrics, /metrics.json)
+METRICS_FILE = None         # or rewrite a JSON snapshot here every METRICS_INTERVAL seconds
+METRICS_INTERVAL = 10
 
 # ===============================================
 
-def get_resume_index(data_manager, urls):
-    """Reads progress.json to determine resume point."""
-    progress = data_manager.load_progress()
-    processed = progress.get('processed', 0)
+def get_pending_urls(data_manager, urls):
+    """Registers `urls` in the state db and returns the ones among them still pending."""
+    total = data_manager.state.progress()['total']
+    pending = data_manager.pending_urls(urls)
+    progress = data_manager.state.progress()
 
-    if processed >= len(urls):
-        print("✅ All URLs already scraped.")
+    if not pending:
+        print(f"✅ All {len(urls)} URLs already scraped or failed "
+              f"({progress['done']} done, {progress['failed']} failed in {data_manager.data_dir}).")
         return None  # means completed
 
-    print(f"📖 Resuming from index {processed}/{len(urls)}")
-    return processed
+    print(f"📖 Resuming: {len(pending)} of {len(urls)} URLs pending "
+          f"({progress['total'] - total} newly registered; {progress['done']}/{progress['total']} done, "
+          f"{progress['failed']} failed overall)")
+    return pending
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Fatwa scraper runner")
+    parser.add_argument('--mode', default=MODE,
+                        choices=['sync', 'async', 'pipeline', 'reparse', 'retry-failed', 'refresh', 'merge-shards'])
+    parser.add_argument('--per-host-limit', type=int, default=PER_HOST_LIMIT,
+                        help="max in-flight requests per host (fetchers in pipeline mode)")
+    parser.add_argument('--rps', type=float, default=REQUESTS_PER_SECOND,
+                        help="requests per second budget (async/pipeline modes)")
+    parser.add_argument('--rate-limit', choices=['adaptive', 'fixed'], default=RATE_LIMIT)
+    parser.add_argument('--force', action='store_true',
+                        help="retry-failed: retry every ledger URL, ignoring the backoff schedule")
+    parser.add_argument('--parse-workers', type=int, default=PARSE_WORKERS,
+                        help="parser processes (pipeline and reparse modes)")
+    parser.add_argument('--queue-size', type=int, default=QUEUE_SIZE)
+    parser.add_argument('--shard', type=parse_shard, default=SHARD, metavar='I/N',
+                        help="scrape only shard I of N (hash of the URL)")
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--registry', help="URL registry file (default: fatwa_urls.txt)")
+    parser.add_argument('--origin', help="send requests to this origin instead, e.g. a local stand-in server")
+    parser.add_argument('--metrics-port', type=int, default=METRICS_PORT)
+    parser.add_argument('--metrics-file', default=METRICS_FILE)
+    return parser.parse_args()
 
 def main():
     """Main entry point for scraper runner."""
-    data_manager = FatwaDataManager()
-    start_idx = get_resume_index(data_manager, ALL_FATWA_URLS)
+    args = parse_args()
+    install_origin_override(args.origin)
 
-    if start_idx is None:
+    if args.mode == 'merge-shards':
+        merge_shards(args.data_dir)
         return
 
-    print(f"\n🚀 Starting fatwa scraping...")
+    urls = get_registry(args.registry)
+    data_dir = args.data_dir
+    if args.shard:
+        urls = shard_urls(urls, *args.shard)
+        data_dir = shard_dir(data_dir, *args.shard)
+        print(f"🧩 Shard {args.shard[0]}/{args.shard[1]}: {len(urls)} URLs -> {data_dir}")
+
+    if args.mode == 'reparse':
+        start_time = time.time()
+        reparse_from_cache(workers=args.parse_workers, data_dir=data_dir)
+        print(f"\n✅ Completed in {time.time() - start_time:.1f} seconds.")
+        return
+
+    data_manager = FatwaDataManager(data_dir)
+    if args.mode == 'retry-failed':
+        urls = []
+    elif args.mode != 'refresh':
+        urls = get_pending_urls(data_manager, urls)
+
+    if urls is None:
+        return
+
+    print(f"\n🚀 Starting fatwa scraping ({args.mode}, {args.rate_limit} rate limit)...")
     start_time = time.time()
 
-    # Run the scraper
-    results = scrape_fatwas_batch(
-        urls=ALL_FATWA_URLS,
-        start_idx=start_idx,
-        save_every=SAVE_EVERY,
-        delay=DELAY
-    )
+    get_metrics().reset()
+    if args.metrics_port is not None:
+        start_http_server(args.metrics_port)
+    flusher = JsonMetricsFlusher(args.metrics_file, METRICS_INTERVAL) if args.metrics_file else None
+
+    try:
+        limiter, delay, rps = None, DELAY, args.rps
+        if args.rate_limit == 'adaptive':
+            limiter = AdaptiveRateLimiter(max_concurrency=args.per_host_limit)
+            delay, rps = 0, None
+            if args.mode == 'sync':
+                get_client(rate_limiter=limiter)
+
+        # Run the scraper
+        if args.mode == 'retry-failed':
+            results = retry_failed_fatwas(
+                save_every=SAVE_EVERY,
+                per_host_limit=args.per_host_limit,
+                requests_per_second=rps,
+                rate_limiter=limiter,
+                force=args.force,
+                data_dir=data_dir
+            )
+        elif args.mode == 'refresh':
+            results = refresh_fatwas(
+                urls=urls,
+                save_every=SAVE_EVERY,
+                per_host_limit=args.per_host_limit,
+                requests_per_second=rps,
+                rate_limiter=limiter,
+                data_dir=data_dir
+            )
+        elif args.mode == 'async':
+            results = scrape_fatwas_async(
+                urls=urls,
+                save_every=SAVE_EVERY,
+                per_host_limit=args.per_host_limit,
+                requests_per_second=rps,
+                rate_limiter=limiter,
+                data_dir=data_dir,
+                filter_pending=False
+            )
+        elif args.mode == 'pipeline':
+            results = scrape_fatwas_pipeline(
+                urls=urls,
+                save_every=SAVE_EVERY,
+                fetch_concurrency=args.per_host_limit,
+                parse_workers=args.parse_workers,
+                queue_size=args.queue_size,
+                requests_per_second=rps,
+                rate_limiter=limiter,
+                data_dir=data_dir,
+                filter_pending=False
+            )
+        else:
+            results = scrape_fatwas_batch(
+                urls=urls,
+                save_every=SAVE_EVERY,
+                delay=delay,
+                data_dir=data_dir,
+                filter_pending=False
+            )
+    finally:
+        if flusher:
+            flusher.stop()  # final snapshot, also after an error or Ctrl-C
+    get_metrics().print_report()
 
     elapsed = time.time() - start_time
-    print(f"\n✅ Completed in {elapsed/60:.2f} minutes. Total scraped: {len(results)}")
+    print(f"\n✅ Completed in {elapsed/60:.2f} minutes. Scraped this run: {len(results)}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
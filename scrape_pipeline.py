@@ -0,0 +1,139 @@
+"""
+Staged fetch -> parse -> persist pipeline for the fatwa scraper.
+
+    fetchers (threads, I/O)  --bounded queue-->  parsers (process pool, CPU)  -->  ordered writer
+
+- `fetch_concurrency` fetcher coroutines download raw pages over the shared
+  pooled `HttpClient` and push them onto a queue of at most `queue_size` pages.
+- Parser dispatchers hand each page to a `ProcessPoolExecutor` running
+  `fatwa_scraper.parse_fatwa_page` (captureDiv extraction + Q/A segmentation), so
+  parsing scales across cores independently of fetch concurrency. Its stage
+  timings are taken in the worker and recorded in this process.
+- Finished records are re-ordered and handed to `on_record` in URL order.
+
+Backpressure: a fetcher must take a slot from an in-flight window before it
+starts a URL, and the slot is only returned once that URL's record has been
+written. A slow parse or a stuck early URL therefore stalls fetching instead
+of growing the queue or the re-order buffer without bound. Queue, re-order
+buffer and in-flight depths are published as `fatwa_queue_depth` gauges.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
+import os
+import traceback
+
+from failure_ledger import failure_record
+from fatwa_scraper import FatwaDataManager, RequestPacer, fetch_fatwa_page, parse_fatwa_page_timed
+from http_client import HttpClient
+from metrics import get_metrics
+
+_DONE = object()
+
+async def run_pipeline(urls, on_record, fetch_concurrency=8, parse_workers=None,
+                       queue_size=64, requests_per_second=10, cache=None, rate_limiter=None):
+    parse_workers = parse_workers or os.cpu_count() or 2
+    loop = asyncio.get_running_loop()
+
+    client = HttpClient(pool_maxsize=fetch_concurrency, rate_limiter=rate_limiter)
+    fetch_pool = ThreadPoolExecutor(max_workers=fetch_concurrency)
+    parse_pool = ProcessPoolExecutor(max_workers=parse_workers)
+    pacer = RequestPacer(requests_per_second)
+
+    pages = asyncio.Queue(maxsize=queue_size)
+    window = asyncio.Semaphore(queue_size + fetch_concurrency + 2 * parse_workers)
+    todo = iter(enumerate(urls))
+    finished = {}
+    next_to_write = 0
+    metrics = get_metrics()
+    in_flight = 0
+
+    def report_depths():
+        metrics.set('fatwa_queue_depth', pages.qsize(), queue='pages')
+        metrics.set('fatwa_queue_depth', len(finished), queue='reorder')
+        metrics.set('fatwa_queue_depth', in_flight, queue='in_flight')
+
+    def write_ready():
+        nonlocal next_to_write, in_flight
+        while next_to_write in finished:
+            on_record(next_to_write + 1, finished.pop(next_to_write))
+            next_to_write += 1
+            in_flight -= 1
+            window.release()
+        report_depths()
+
+    async def fetcher():
+        nonlocal in_flight
+        while True:
+            await window.acquire()
+            item = next(todo, None)
+            if item is None:
+                window.release()
+                return
+            idx, url = item
+            in_flight += 1
+            await pacer.wait()
+            try:
+                page_html = await loop.run_in_executor(fetch_pool, fetch_fatwa_page, url, client, cache)
+                await pages.put((idx, url, page_html, None))
+            except Exception as e:
+                print(f"❌ Failed: {url} ({e})")
+                await pages.put((idx, url, None, failure_record(url, e)))
+
+    async def parser():
+        while True:
+            item = await pages.get()
+            if item is _DONE:
+                return
+            idx, url, page_html, record = item
+            if record is None:
+                try:
+                    record, observations = await loop.run_in_executor(
+                        parse_pool, parse_fatwa_page_timed, url, page_html)
+                    metrics.merge(observations)
+                except Exception as e:
+                    traceback.print_exc()
+                    record = failure_record(url, e)
+            finished[idx] = record
+            write_ready()
+
+    try:
+        parsers = [asyncio.create_task(parser()) for _ in range(parse_workers)]
+        await asyncio.gather(*(fetcher() for _ in range(fetch_concurrency)))
+        for _ in parsers:
+            await pages.put(_DONE)
+        await asyncio.gather(*parsers)
+    finally:
+        fetch_pool.shutdown(wait=True)
+        parse_pool.shutdown(wait=True)
+        client.print_timing_report()
+        client.close()
+
+def scrape_fatwas_pipeline(urls, start_idx=0, save_every=10, fetch_concurrency=8,
+                           parse_workers=None, queue_size=64, requests_per_second=10,
+                           rate_limiter=None, data_dir='fatwa_data', filter_pending=True):
+    """Pipeline counterpart of `scrape_fatwas_batch`; records are persisted in URL order."""
+    data_manager = FatwaDataManager(data_dir)
+    urls_to_scrape = data_manager.pending_urls(urls[start_idx:]) if filter_pending else list(urls[start_idx:])
+
+    print(f"🚀 Starting pipeline: {len(urls_to_scrape)} new URLs "
+          f"({fetch_concurrency} fetchers, {parse_workers or os.cpu_count()} parsers, queue {queue_size}).\n")
+
+    scraped, pending = [], []
+
+    def on_record(i, record):
+        nonlocal pending
+        scraped.append(record)
+        pending.append(record)
+        if i % save_every == 0 or i == len(urls_to_scrape):
+            data_manager.save_raw_data(pending)
+            pending = []
+            data_manager.print_progress()
+
+    if urls_to_scrape:
+        asyncio.run(run_pipeline(urls_to_scrape, on_record, fetch_concurrency,
+                                 parse_workers, queue_size, requests_per_second,
+                                 data_manager.html_cache, rate_limiter))
+
+    print(f"\n🎉 Done! Scraped {len(scraped)} fatwas this run.")
+    return scraped
@@ -0,0 +1,123 @@
+"""
+Sharded scraping: split the URL registry across machines and merge back.
+
+`shard_of(url, n)` hashes the URL (blake2b, so it is stable across machines
+and Python runs, unlike `hash()`), which means every worker can compute its
+own slice of the registry with no coordination:
+
+    machine 1:  python runner.py --shard 0/3 --mode async
+    machine 2:  python runner.py --shard 1/3 --mode async
+    machine 3:  python runner.py --shard 2/3 --mode async
+
+Each shard keeps its own store, state db and failure ledger under
+fatwa_data/shards/<i>-of-<n>/. Copy those directories back under one
+fatwa_data/shards/ and merge:
+
+    python runner.py --mode merge-shards
+
+The merge streams every store once, keeps the newest successful record per
+URL (by scraped_at, later source winning ties), rewrites the main store in
+one atomic swap and folds the shards' state and failure ledgers in. Shard
+HTML caches stay in their shard directories.
+"""
+
+from contextlib import ExitStack
+from pathlib import Path
+import argparse
+import hashlib
+import json
+
+from corpus_store import CorpusStore
+from failure_ledger import FailureLedger
+
+SHARDS_DIR = 'shards'
+
+def shard_of(url, shards):
+    digest = hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % shards
+
+def shard_urls(urls, shard, shards):
+    return [u for u in urls if shard_of(u, shards) == shard]
+
+def parse_shard(value):
+    """'I/N' -> (I, N); for argparse."""
+    try:
+        shard, shards = (int(v) for v in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected I/N, got {value!r}")
+    if not 0 <= shard < shards:
+        raise argparse.ArgumentTypeError(f"shard {shard} out of range for {shards} shards")
+    return shard, shards
+
+def shard_dir(data_dir, shard, shards):
+    return Path(data_dir) / SHARDS_DIR / f"{shard}-of-{shards}"
+
+def find_shard_dirs(data_dir):
+    return sorted(p for p in (Path(data_dir) / SHARDS_DIR).glob('*-of-*') if p.is_dir())
+
+# =================== merge ==================================================================
+
+def _pick_newest(stores):
+    """url -> (scraped_at, store index, line key) of the newest successful record."""
+    best = {}
+    for i, store in enumerate(stores):
+        for line_key, line in store._iter_lines():
+            record = json.loads(line)
+            if record.get('error') or record.get('question') is None:
+                continue
+            key = (record.get('scraped_at') or '', i, line_key)
+            current = best.get(record['url'])
+            if current is None or key[:2] >= current[:2]:
+                best[record['url']] = key
+    return best
+
+def _winning_lines(stores, best):
+    with ExitStack() as stack:
+        readers = [stack.enter_context(s._line_reader()) for s in stores]
+        for _, i, line_key in best.values():
+            yield readers[i](line_key).decode('utf-8')
+
+def merge_shards(data_dir='fatwa_data', shard_dirs=None, batch=500):
+    """Merge shard stores, failure ledgers and state into `data_dir`. Returns records written."""
+    from fatwa_scraper import FatwaDataManager
+
+    data_manager = FatwaDataManager(data_dir)
+    shard_dirs = [Path(d) for d in shard_dirs] if shard_dirs else find_shard_dirs(data_dir)
+    if not shard_dirs:
+        print(f"⚠️  No shard directories under {Path(data_dir) / SHARDS_DIR}")
+        return 0
+    print(f"🧩 Merging {len(shard_dirs)} shards into {data_manager.raw_data_file}: "
+          f"{', '.join(d.name for d in shard_dirs)}")
+
+    stores = [data_manager.store] + [CorpusStore(d / 'raw_fatwas.jsonl') for d in shard_dirs]
+    best = _pick_newest(stores)
+
+    done = []
+    def tracked(lines):
+        for line in lines:
+            done.append(json.loads(line))
+            if len(done) >= batch:
+                data_manager.state.mark_results(done)
+                done.clear()
+            yield line
+
+    written = data_manager.store.rewrite_lines(tracked(_winning_lines(stores, best)))
+    data_manager.state.mark_results(done)
+
+    # failures: a success anywhere clears the URL, otherwise keep the most-attempted entry
+    ledger = data_manager.failures
+    for d in shard_dirs:
+        for url, entry in FailureLedger(d / 'failures.json').entries.items():
+            current = ledger.entries.get(url)
+            if url not in best and (current is None or entry['attempts'] > current['attempts']):
+                ledger.entries[url] = entry
+    for url in best:
+        ledger.record_success(url)
+    ledger.save()
+    data_manager.state.mark_results([{'url': url, 'error': e.get('error') or 'failed in shard',
+                                      'error_class': e.get('error_class', 'unknown')}
+                                     for url, e in ledger.entries.items()])
+
+    print(f"🎉 Merged {written} records ({len(ledger.entries)} URLs still failing)")
+    data_manager.print_progress()
+    return written
@@ -0,0 +1,197 @@
+"""
+Per-URL scrape state in a small SQLite database (fatwa_data/state.db).
+
+One row per fatwa URL:
+
+    url            primary key
+    position       index in the URL list it was registered from (scrape order)
+    status         pending | done | failed
+    attempts       scrape attempts so far
+    content_hash   `record_hash` of the last successful record
+    error_class    last failure class (see failure_ledger)
+    first_seen_at / last_attempt_at / done_at   timestamps
+
+`status_counts` is kept up to date by triggers, so progress is an O(1)
+lookup; "what's left" is an index scan over pending rows only. Nothing needs
+to read the corpus to resume.
+"""
+
+from pathlib import Path
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS url_state (
+    url             TEXT PRIMARY KEY,
+    position        INTEGER,
+    status          TEXT NOT NULL DEFAULT 'pending',
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    content_hash    TEXT,
+    error_class     TEXT,
+    first_seen_at   TEXT,
+    last_attempt_at TEXT,
+    done_at         TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_url_state_status ON url_state(status, position);
+
+CREATE TABLE IF NOT EXISTS status_counts (
+    status TEXT PRIMARY KEY,
+    n      INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS url_state_count_ins AFTER INSERT ON url_state BEGIN
+    INSERT INTO status_counts VALUES (NEW.status, 1)
+        ON CONFLICT(status) DO UPDATE SET n = n + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS url_state_count_upd AFTER UPDATE OF status ON url_state
+WHEN OLD.status != NEW.status BEGIN
+    UPDATE status_counts SET n = n - 1 WHERE status = OLD.status;
+    INSERT INTO status_counts VALUES (NEW.status, 1)
+        ON CONFLICT(status) DO UPDATE SET n = n + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS url_state_count_del AFTER DELETE ON url_state BEGIN
+    UPDATE status_counts SET n = n - 1 WHERE status = OLD.status;
+END;
+'''
+
+def _canonical(text):
+    return ' '.join(unicodedata.normalize('NFC', text or '').split())
+
+def record_hash(record):
+    """Stable hash of a record's question + answer (NFC, whitespace-collapsed).
+
+    Scraped records carry it as `content_hash`; use `content_hash_of` to read
+    it so older records without the field still work.
+    """
+    payload = f"{_canonical(record.get('question'))}\x1f{_canonical(record.get('answer'))}"
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def content_hash_of(record):
+    return record.get('content_hash') or record_hash(record)
+
+def _now():
+    return time.strftime('%Y-%m-%d %H:%M:%S')
+
+class StateStore:
+    def __init__(self, path=Path('fatwa_data') / 'state.db'):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+
+    # =================== writes ================================================
+
+    def register(self, urls):
+        """Add URLs as pending (existing rows are untouched). Returns rows added."""
+        now = _now()
+        with self._lock, self.conn:
+            cur = self.conn.executemany(
+                'INSERT OR IGNORE INTO url_state (url, position, first_seen_at) VALUES (?, ?, ?)',
+                ((url, i, now) for i, url in enumerate(urls)))
+            return cur.rowcount
+
+    def mark_results(self, records):
+        """Record a batch of scrape results (successes and failures) in one transaction."""
+        now = _now()
+        done, failed = [], []
+        for r in records:
+            if r.get('error') or r.get('question') is None:
+                failed.append((r.get('error_class', 'unknown'), now, r['url']))
+            else:
+                done.append((content_hash_of(r), now, now, r['url']))
+
+        with self._lock, self.conn:
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO url_state (url, first_seen_at) VALUES (?, ?)',
+                ((r['url'], now) for r in records))
+            self.conn.executemany(
+                '''UPDATE url_state SET status = 'done', attempts = attempts + 1, content_hash = ?,
+                       error_class = NULL, last_attempt_at = ?, done_at = ? WHERE url = ?''', done)
+            self.conn.executemany(
+                '''UPDATE url_state SET status = 'failed', attempts = attempts + 1, error_class = ?,
+                       last_attempt_at = ? WHERE url = ? AND status != 'done' ''', failed)
+
+    def reset(self, urls, status='pending'):
+        with self._lock, self.conn:
+            self.conn.executemany('UPDATE url_state SET status = ? WHERE url = ?',
+                                  ((status, url) for url in urls))
+
+    def import_existing(self, records, failed_urls=(), chunk=1000):
+        """One-time bootstrap from an existing corpus / failure ledger, streamed in chunks."""
+        imported, batch = 0, []
+        for record in records:
+            if record.get('error'):
+                continue
+            batch.append(record)
+            if len(batch) >= chunk:
+                self.mark_results(batch)
+                imported, batch = imported + len(batch), []
+        failed = [{'url': u, 'error': 'imported from failure ledger'} for u in failed_urls]
+        self.mark_results(batch + failed)
+        return imported + len(batch) + len(failed)
+
+    # =================== reads =================================================
+
+    def is_empty(self):
+        with self._lock:
+            return self.conn.execute('SELECT 1 FROM url_state LIMIT 1').fetchone() is None
+
+    def pending(self, limit=None):
+        """Pending URLs in registration order (index scan over pending rows only)."""
+        sql = "SELECT url FROM url_state WHERE status = 'pending' ORDER BY position"
+        if limit:
+            sql += f' LIMIT {int(limit)}'
+        with self._lock:
+            return [row[0] for row in self.conn.execute(sql)]
+
+    def urls_with_status(self, status):
+        with self._lock:
+            return [row[0] for row in self.conn.execute(
+                'SELECT url FROM url_state WHERE status = ? ORDER BY position', (status,))]
+
+    def get(self, url):
+        with self._lock:
+            cur = self.conn.execute('SELECT * FROM url_state WHERE url = ?', (url,))
+            row = cur.fetchone()
+            return dict(zip([c[0] for c in cur.description], row)) if row else None
+
+    def content_hash(self, url):
+        with self._lock:
+            row = self.conn.execute('SELECT content_hash FROM url_state WHERE url = ?', (url,)).fetchone()
+            return row[0] if row else None
+
+    def content_hashes(self, urls):
+        """{url: content_hash} for the `urls` that are done."""
+        urls = list(urls)
+        out = {}
+        with self._lock:
+            for i in range(0, len(urls), 500):
+                chunk = urls[i:i + 500]
+                out.update(self.conn.execute(
+                    f"SELECT url, content_hash FROM url_state WHERE status = 'done' "
+                    f"AND url IN ({','.join('?' * len(chunk))})", chunk))
+        return out
+
+    def progress(self):
+        """O(1): counts per status from the trigger-maintained table."""
+        with self._lock:
+            counts = dict(self.conn.execute('SELECT status, n FROM status_counts'))
+        total = sum(counts.values())
+        done = counts.get('done', 0)
+        return {
+            'total': total,
+            'done': done,
+            'pending': counts.get('pending', 0),
+            'failed': counts.get('failed', 0),
+            'percentage': (done / total * 100) if total else 0,
+        }
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,81 @@
+"""
+Urdu/Arabic text normalization shared by the scraper, the embedding builder
+and the query path.
+
+Each profile precomputes one character class of everything it drops and
+runs one deletion pass, one whitespace collapse and, only when needed, NFC,
+instead of a chain of replace / regex / NFD / regex / NFC passes:
+
+    scrape  fatwa_scraper.normalize_fatwa_text: drop ZWNJ / RLM and harakat
+            U+064B-U+0652, collapse whitespace incl. NBSP (edges kept as one space)
+    embed   document_text (what embeddings_store embeds): strip the tasmiya / closing boilerplate,
+            drop U+064B-U+065F, U+0670, U+06D6-U+06ED, collapse and trim
+    query   what a search query needs to look like the embedded corpus, i.e.
+            scrape followed by embed
+
+The deletion table is a compiled regex class rather than a `str.translate`
+mapping: translate looks every non-ASCII character up in the mapping, which
+measured 2-5x slower than a class match on Urdu text
+(benchmarks/bench_normalize.py).
+
+Usage:
+    from text_normalizer import normalize
+    normalize(text, 'query')
+
+Harakat are dropped before whitespace is collapsed, so a diacritic standing
+alone between two spaces leaves one space rather than two; the old scrape
+chain collapsed first and kept both.
+"""
+
+import re
+import unicodedata
+
+ANSWER_START = 'بِسْمِ اللہِ الرَّحْمٰنِ الرَّحِیْمِ اَلْجَوَابُ بِعَوْنِ الْمَلِکِ الْوَھَّابِ'
+ANSWER_END = 'وَاللہُ اَعْلَمُ عَزَّوَجَلَّ وَرَسُوْلُہ اَعْلَم صَلَّی اللہُ تَعَالٰی عَلَیْہِ وَاٰلِہٖ وَسَلَّم'
+
+HARAKAT = range(0x064B, 0x0653)                     # fathatan .. sukun
+EXTENDED_MARKS = [*range(0x064B, 0x0660), 0x0670, *range(0x06D6, 0x06EE)]
+INVISIBLES = [0x200C, 0x200F]                       # ZWNJ, RLM
+
+# a run of whitespace that is not already a single space
+WHITESPACE_RE = re.compile(r'[^\S ]\s*| \s+')
+
+def _char_class(codepoints):
+    return re.compile('[' + ''.join(re.escape(chr(cp)) for cp in sorted(set(codepoints))) + ']+')
+
+def _nfc(text):
+    return text if unicodedata.is_normalized('NFC', text) else unicodedata.normalize('NFC', text)
+
+class Normalizer:
+    def __init__(self, delete=(), strip_phrases=(), nfc_first=False, trim=False):
+        self.delete_re = _char_class(delete) if delete else None
+        self.strip_phrases = tuple(strip_phrases)
+        self.nfc_first = nfc_first
+        self.trim = trim
+
+    def __call__(self, text):
+        if self.nfc_first:
+            text = _nfc(text)
+        for phrase in self.strip_phrases:
+            text = text.replace(phrase, '')
+        if self.delete_re is not None:
+            text = self.delete_re.sub('', text)
+        text = WHITESPACE_RE.sub(' ', text)
+        if self.trim:
+            text = text.strip()
+        return _nfc(text)
+
+PROFILES = {
+    'scrape': Normalizer(delete=[*INVISIBLES, *HARAKAT]),
+    'embed': Normalizer(delete=EXTENDED_MARKS, strip_phrases=(ANSWER_START, ANSWER_END),
+                        nfc_first=True, trim=True),
+    'query': Normalizer(delete=[*INVISIBLES, *EXTENDED_MARKS],
+                        nfc_first=True, trim=True),
+}
+
+def normalize(text, profile='scrape'):
+    return PROFILES[profile](text)
+
+def document_text(record):
+    """The text a fatwa is embedded as, and the page_content its search hits carry."""
+    return f"سوال:\n{normalize(record['question'], 'embed')}\n\nجواب:\n{normalize(record['answer'], 'embed')}"
@@ -0,0 +1,270 @@
+"""
+Registry of known fatwa URLs, stored compactly in fatwa_urls.txt.
+
+Every fatwa URL is https://www.fatwaqa.com/ur/fatawa/<category>/<slug>, so
+the file keeps the base once, each category once (as a small integer code),
+and the slugs sorted and front-coded against the previous line:
+
+    @registry 1
+    @base https://www.fatwaqa.com/ur/fatawa/
+    @cat aqaid                      <- code 0, codes follow @cat order
+    @cat namaz                      <- code 1
+    0	0	allah-ki-sifat              <- code, shared prefix length, rest of slug
+    0	11	zaat                        <- "allah-ki-sifat"[:11] + "zaat"
+    *	0	https://elsewhere/...       <- URL outside the base, stored whole
+
+`add()` appends new lines (and new @cat lines) without rewriting; `compact()`
+re-sorts and re-codes the whole file. The file is read lazily on first use,
+into a list (registry order) and a url -> index dict, so membership and
+lookup are O(1) and importing this module costs nothing.
+
+Usage:
+    from url_registry import get_registry
+    registry = get_registry()
+    url in registry; registry.index(url); registry.category(url); list(registry)
+
+    python url_registry.py import fatwa_urls.json   # build from a JSON list
+    python url_registry.py compact
+    python url_registry.py stats
+"""
+
+from pathlib import Path
+import json
+import os
+import sys
+import threading
+
+REGISTRY_PATH = Path(__file__).resolve().parent / 'fatwa_urls.txt'
+BASE_URL = 'https://www.fatwaqa.com/ur/fatawa/'
+FORMAT_VERSION = 1
+RAW = '*'
+
+def _shared_prefix(a, b):
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+def url_fields(url, base=BASE_URL):
+    """Record fields derived from a fatwa URL: its category and slug."""
+    category, slug = UrlRegistry.split_url(url, base)
+    return {'category': category, 'slug': slug if category else None}
+
+class UrlRegistry:
+    def __init__(self, path=REGISTRY_PATH, base=BASE_URL):
+        self.path = Path(path)
+        self.base = base
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._urls = []
+        self._index = {}
+        self._categories = []
+        self._codes = {}
+        self._last_slug = ''
+
+    # =================== loading ===============================================
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                if self.path.exists():
+                    self._read()
+                self._loaded = True
+
+    def _read(self):
+        prev = ''
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip('\n')
+                if not line:
+                    continue
+                if line.startswith('@'):
+                    key, _, value = line[1:].partition(' ')
+                    if key == 'base':
+                        self.base = value
+                    elif key == 'cat':
+                        self._add_category(value)
+                    elif key == 'registry' and int(value) > FORMAT_VERSION:
+                        raise ValueError(f"{self.path}: registry format {value} is newer than {FORMAT_VERSION}")
+                    continue
+
+                code, shared, rest = line.split('\t', 2)
+                slug = prev[:int(shared)] + rest
+                prev = slug
+                if code == RAW:
+                    url = slug
+                else:
+                    url = f"{self.base}{self._categories[int(code)]}/{slug}"
+                if url not in self._index:
+                    self._index[url] = len(self._urls)
+                    self._urls.append(url)
+        self._last_slug = prev
+
+    def _add_category(self, category):
+        self._codes[category] = len(self._categories)
+        self._categories.append(category)
+
+    # =================== encoding ==============================================
+
+    @staticmethod
+    def split_url(url, base=BASE_URL):
+        """(category, slug) for a URL under `base`, else (None, url)."""
+        if url.startswith(base):
+            category, sep, slug = url[len(base):].partition('/')
+            if sep and category and slug and '/' not in slug and '\t' not in slug:
+                return category, slug
+        return None, url
+
+    def split(self, url):
+        return self.split_url(url, self.base)
+
+    def _encode(self, urls, prev=''):
+        """Lines for `urls` (front-coded against `prev`) and the @cat lines they need first."""
+        new_categories, lines = [], []
+        for url in urls:
+            category, slug = self.split(url)
+            if category is None:
+                code = RAW
+            else:
+                if category not in self._codes:
+                    self._add_category(category)
+                    new_categories.append(f"@cat {category}\n")
+                code = str(self._codes[category])
+            shared = _shared_prefix(prev, slug)
+            lines.append(f"{code}\t{shared}\t{slug[shared:]}\n")
+            prev = slug
+        return new_categories, lines, prev
+
+    def _sort_key(self, url):
+        category, slug = self.split(url)
+        return (category is None, category or '', slug)
+
+    # =================== reads =================================================
+
+    def __len__(self):
+        self._ensure_loaded()
+        return len(self._urls)
+
+    def __iter__(self):
+        self._ensure_loaded()
+        return iter(list(self._urls))
+
+    def __contains__(self, url):
+        self._ensure_loaded()
+        return url in self._index
+
+    def index(self, url):
+        """Position of `url` in registry order (KeyError when unknown)."""
+        self._ensure_loaded()
+        return self._index[url]
+
+    def __getitem__(self, i):
+        self._ensure_loaded()
+        return self._urls[i]
+
+    def category(self, url):
+        return self.split(url)[0]
+
+    @property
+    def categories(self):
+        self._ensure_loaded()
+        return list(self._categories)
+
+    def urls_in_category(self, category):
+        self._ensure_loaded()
+        prefix = f"{self.base}{category}/"
+        return [u for u in self._urls if u.startswith(prefix)]
+
+    def stats(self):
+        self._ensure_loaded()
+        size = self.path.stat().st_size if self.path.exists() else 0
+        raw = sum(len(u) + 1 for u in self._urls)
+        return {'urls': len(self._urls), 'categories': len(self._categories),
+                'bytes': size, 'raw_bytes': raw}
+
+    # =================== writes ================================================
+
+    def add(self, urls):
+        """Append unknown URLs to the file. Returns the URLs actually added."""
+        self._ensure_loaded()
+        with self._lock:
+            new = []
+            for url in urls:
+                if url not in self._index:
+                    self._index[url] = len(self._urls)
+                    self._urls.append(url)
+                    new.append(url)
+            if not new:
+                return []
+
+            fresh_file = not self.path.exists()
+            new_categories, lines, self._last_slug = self._encode(new, self._last_slug)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                if fresh_file:
+                    f.write(f"@registry {FORMAT_VERSION}\n@base {self.base}\n")
+                # a category's @cat line must precede its first use
+                f.writelines(new_categories)
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            return new
+
+    def rewrite(self, urls):
+        """Replace the registry with `urls`, sorted and front-coded (atomic)."""
+        with self._lock:
+            urls = sorted(dict.fromkeys(urls), key=self._sort_key)
+            self._categories, self._codes = [], {}
+            for category in sorted({c for c, _ in map(self.split, urls) if c is not None}):
+                self._add_category(category)
+            _, lines, last_slug = self._encode(urls)
+
+            tmp = self.path.with_suffix('.tmp')
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(f"@registry {FORMAT_VERSION}\n@base {self.base}\n")
+                f.writelines(f"@cat {c}\n" for c in self._categories)
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+
+            self._urls = urls
+            self._index = {u: i for i, u in enumerate(urls)}
+            self._last_slug = last_slug
+            self._loaded = True
+
+    def compact(self):
+        """Fold appended URLs back into sorted order."""
+        self._ensure_loaded()
+        self.rewrite(self._urls)
+
+_default_registry = None
+_default_lock = threading.Lock()
+
+def get_registry(path=None):
+    """Shared registry for REGISTRY_PATH (or a fresh one for another `path`)."""
+    global _default_registry
+    if path is not None and Path(path).resolve() != REGISTRY_PATH:
+        return UrlRegistry(path)
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = UrlRegistry()
+        return _default_registry
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    registry = get_registry()
+    if command == 'import':
+        with open(sys.argv[2], 'r', encoding='utf-8') as f:
+            registry.rewrite(json.load(f))
+    elif command == 'compact':
+        registry.compact()
+    elif command != 'stats':
+        sys.exit(f"unknown command {command!r}; expected import, compact or stats")
+    s = registry.stats()
+    print(f"🔗 {s['urls']} URLs in {s['categories']} categories: "
+          f"{s['bytes']/1024:.0f} KB on disk ({s['raw_bytes']/1024:.0f} KB as plain URLs)")
@@ -0,0 +1,59 @@
+"""
+Which vector store the apps search, picked by VECTOR_BACKEND (env or .env):
+
+    faiss       the fatwa_index/ folder, memory-mapped (mmap_docstore.py); the default
+    pgvector    fatwas.embedding in Postgres (pgvector_store.py), connection
+                from DATABASE_URL or the DB_* settings, as database_saver.py
+
+Both are LangChain VectorStores returning the same Documents (page_content,
+metadata {category, url}), so `similarity_search(query, k=k)`, a
+`filter={'category': ...}` and `as_retriever()` work the same on either.
+
+`query_retriever(vectorstore, ...)` is `as_retriever` for the chat apps: it
+searches with the query normalized like the embedded corpus, while the chain,
+its prompt and its memory keep the text the user typed.
+
+Usage:
+    from vector_backend import load_vectorstore
+    vectorstore = load_vectorstore("fatwa_index", embedding_model)
+    retriever = query_retriever(vectorstore, search_kwargs={"k": 5})
+    VECTOR_BACKEND=pgvector streamlit run vectorstore_query_test.py
+"""
+
+import os
+
+from dotenv import load_dotenv
+from langchain_core.vectorstores import VectorStoreRetriever
+
+from text_normalizer import normalize
+
+BACKENDS = ('faiss', 'pgvector')
+
+class NormalizedQueryRetriever(VectorStoreRetriever):
+    """VectorStoreRetriever that searches with `normalize(query, 'query')`."""
+
+    def _get_relevant_documents(self, query, *, run_manager, **kwargs):
+        return super()._get_relevant_documents(normalize(query, 'query'), run_manager=run_manager, **kwargs)
+
+    async def _aget_relevant_documents(self, query, *, run_manager, **kwargs):
+        return await super()._aget_relevant_documents(normalize(query, 'query'), run_manager=run_manager, **kwargs)
+
+def backend_name(backend=None):
+    load_dotenv()
+    backend = backend or os.getenv('VECTOR_BACKEND', 'faiss')
+    if backend not in BACKENDS:
+        raise ValueError(f"VECTOR_BACKEND={backend!r}; expected one of {BACKENDS}")
+    return backend
+
+def load_vectorstore(index_dir, embeddings, backend=None, dsn=None):
+    """Open the `backend` store (default: VECTOR_BACKEND); `index_dir` is only read for FAISS."""
+    if backend_name(backend) == 'pgvector':
+        from pgvector_store import PgVectorStore
+        return PgVectorStore.connect(embeddings, dsn)
+    import mmap_docstore
+    return mmap_docstore.load_vectorstore(index_dir, embeddings)
+
+def query_retriever(vectorstore, **kwargs):
+    """`vectorstore.as_retriever(**kwargs)`, normalizing only the text it searches with."""
+    tags = kwargs.pop('tags', None) or vectorstore._get_retriever_tags()  # as as_retriever tags it
+    return NormalizedQueryRetriever(vectorstore=vectorstore, tags=tags, **kwargs)
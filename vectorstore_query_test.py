@@ -1,7 +1,10 @@
 import streamlit as st
-from langchain_community.vectorstores import FAISS
 from langchain_huggingface import HuggingFaceEmbeddings
 
+import vector_backend  # FAISS folder or pgvector, by VECTOR_BACKEND
+from fatwa_categories import CATEGORIES
+from text_normalizer import normalize
+
 # =====================================================
 # Page Configuration
 st.set_page_config(
@@ -14,13 +17,9 @@ st.set_page_config(
 # Load vectorstore (cached for performance)
 @st.cache_resource
 def load_vectorstore():
-    """Load the FAISS vectorstore - runs only once"""
+    """Load the vectorstore (FAISS or pgvector, see vector_backend.py) - runs only once"""
     embedding_model = HuggingFaceEmbeddings(model_name="intfloat/multilingual-e5-large")
-    vectorstore = FAISS.load_local(
-        "fatwa_index", 
-        embedding_model,
-        allow_dangerous_deserialization=True
-    )
+    vectorstore = vector_backend.load_vectorstore("fatwa_index", embedding_model)
     return vectorstore
 
 # =====================================================
@@ -48,7 +47,7 @@ else:
 
 # =====================================================
 # Search Interface
-col1, col2 = st.columns([3, 1])
+col1, col2, col3 = st.columns([3, 1, 1])
 
 with col1:
     query = st.text_input(
@@ -68,6 +67,13 @@ with col2:
         step=1
     )
 
+with col3:
+    category = st.selectbox(
+        "📁 Category:",
+        ["All", *CATEGORIES],
+        help="Only search fatwas of this category"
+    )
+
 search_button = st.button("🚀 Search", type="primary", use_container_width=True)
 
 # =====================================================
@@ -77,7 +83,11 @@ if search_button:
         st.warning("⚠️ Please enter a query")
     else:
         with st.spinner(f"Searching for top {k} relevant fatwas..."):
-            results = vectorstore.similarity_search(query, k=k)
+            # same normalization as the embedded corpus; FAISS filters its top
+            # fetch_k hits, pgvector filters inside the index scan
+            search_filter = None if category == "All" else {'category': category}
+            results = vectorstore.similarity_search(normalize(query, 'query'), k=k,
+                                                    filter=search_filter, fetch_k=k * 50)
         
         st.success(f"✅ Found {len(results)} relevant fatwas!")
         st.divider()
@@ -144,7 +154,7 @@ st.divider()
 st.markdown(
     """
     <div style='text-align: center; color: gray;'>
-    🕌 Fatwa Search System | Powered by FAISS & Streamlit
+    🕌 Fatwa Search System | Powered by FAISS / pgvector & Streamlit
     </div>
     """,
     unsafe_allow_html=True
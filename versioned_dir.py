@@ -0,0 +1,88 @@
+"""
+Directories of files that must change together, swapped in one step.
+
+A FAISS index folder (index.faiss + docs.*) or a corpus pack (records.*) is
+only consistent as a whole: a reader that pairs a new docs.bin with old
+offsets, or old frames with a new dictionary, silently gets the wrong
+documents. So writers never touch the files a reader may have open. Each
+save fills a fresh version directory and then switches the CURRENT pointer
+file to it with one atomic rename:
+
+    fatwa_index/
+        CURRENT                 "v1760680000123456789"
+        v1760680000123456789/   index.faiss, docs.bin, docs.offsets, ...
+        v1760670000987654321/   the previous version, kept for readers still opening it
+
+A reader resolves CURRENT once (`current()`) and opens every file from that
+directory. Versions older than the previous one are deleted on the next save;
+processes that still have their files mapped keep them until they close.
+A folder without CURRENT (written before versioning) is read in place.
+
+Usage:
+    with new_version(path) as version:
+        write_file(version / 'records.bin', lambda f: f.write(data))
+    directory = current(path)
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+import mmap
+import os
+import shutil
+import time
+
+CURRENT_FILE = 'CURRENT'
+VERSION_PREFIX = 'v'
+
+def current(path):
+    """Directory holding the files of `path`'s current version."""
+    path = Path(path)
+    pointer = path / CURRENT_FILE
+    if not pointer.exists():
+        return path
+    return path / pointer.read_text(encoding='utf-8').strip()
+
+def write_file(path, write):
+    with open(path, 'wb') as f:
+        write(f)
+
+def map_file(path):
+    """`path` mapped read-only (b'' when empty, which mmap cannot map)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _fsync_tree(directory):
+    for file in directory.iterdir():
+        with open(file, 'rb') as f:
+            os.fsync(f.fileno())
+
+@contextmanager
+def new_version(path):
+    """Yield an empty version directory under `path`; publish it as CURRENT on success."""
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    pointer = path / CURRENT_FILE
+    previous = current(path).name if pointer.exists() else None
+
+    version = path / f"{VERSION_PREFIX}{time.time_ns()}"
+    version.mkdir()
+    try:
+        yield version
+        _fsync_tree(version)
+    except BaseException:
+        shutil.rmtree(version, ignore_errors=True)
+        raise
+
+    tmp = pointer.with_name(CURRENT_FILE + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(version.name)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, pointer)
+
+    # older versions and leftovers of interrupted saves
+    for old in path.glob(f"{VERSION_PREFIX}[0-9]*"):
+        if old.is_dir() and old.name not in (version.name, previous):
+            shutil.rmtree(old, ignore_errors=True)